@@ -221,6 +221,27 @@ class APISettings(BaseSettings):
         ),
     )
 
+    # Enterprise payload cache
+    enterprise_payload_cache_enabled: bool = Field(
+        default=True,
+        description="Cache compressed enterprise download bundles on disk, "
+        "keyed by artifact and content hash. "
+        "Configurable via SKILLMEAT_ENTERPRISE_PAYLOAD_CACHE_ENABLED env var.",
+    )
+
+    enterprise_payload_cache_dir: Optional[Path] = Field(
+        default=None,
+        description="Directory for cached enterprise payloads "
+        "(default: ~/.skillmeat/cache/enterprise-payloads)",
+    )
+
+    enterprise_payload_cache_max_mb: int = Field(
+        default=512,
+        ge=1,
+        description="Size bound of the enterprise payload cache in MiB; "
+        "least recently used bundles are evicted beyond it",
+    )
+
     # Rate limiting
     rate_limit_enabled: bool = Field(
         default=False,
@@ -233,6 +254,35 @@ class APISettings(BaseSettings):
         description="Maximum requests per minute",
     )
 
+    # Sampling profiler (admin diagnostics)
+    profiler_enabled: bool = Field(
+        default=False,
+        description="Enable the authenticated /admin/profile sampling profiler route. "
+        "When disabled, the route returns 404. "
+        "Configurable via SKILLMEAT_PROFILER_ENABLED env var.",
+    )
+
+    profiler_max_seconds: int = Field(
+        default=30,
+        ge=1,
+        le=300,
+        description="Maximum duration of a single profiling run in seconds",
+    )
+
+    profiler_cooldown_seconds: int = Field(
+        default=60,
+        ge=0,
+        description="Minimum seconds between the start of two profiling runs",
+    )
+
+    # Per-request SQL statement counts (always exported as Prometheus metrics)
+    db_query_headers: bool = Field(
+        default=False,
+        description="Return X-DB-Query-Count and X-DB-Time-Ms headers on every "
+        "response. Always on in development. "
+        "Configurable via SKILLMEAT_DB_QUERY_HEADERS env var.",
+    )
+
     # Discovery feature flags
     enable_auto_discovery: bool = Field(
         default=True,
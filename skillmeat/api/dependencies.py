@@ -81,6 +81,7 @@ class AppState:
         self.metadata_cache: Optional[Any] = None  # MetadataCache, lazily initialized
         self.cache_manager: Optional[Any] = None  # CacheManager, lazily initialized
         self.refresh_job: Optional[Any] = None  # RefreshJob, lazily initialized
+        self.mcp_log_monitor: Optional[Any] = None  # MCPLogMonitor, lazily initialized
         self.path_resolver: Optional[ProjectPathResolver] = None
 
     def initialize(self, settings: APISettings) -> None:
@@ -156,6 +157,13 @@ class AppState:
             except Exception as e:
                 logger.warning(f"Error stopping refresh job: {e}")
 
+        # Stop MCP log monitor thread if running
+        if self.mcp_log_monitor is not None:
+            try:
+                self.mcp_log_monitor.stop()
+            except Exception as e:
+                logger.warning(f"Error stopping MCP log monitor: {e}")
+
         self.config_manager = None
         self.collection_manager = None
         self.artifact_manager = None
@@ -165,6 +173,7 @@ class AppState:
         self.metadata_cache = None
         self.cache_manager = None
         self.refresh_job = None
+        self.mcp_log_monitor = None
         self.path_resolver = None
         logger.info("Application state shutdown complete")
 
@@ -6,7 +6,7 @@ for all API requests.
 
 import time
 import logging
-from typing import Callable
+from typing import Callable, Optional
 
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -14,12 +14,20 @@ from starlette.types import ASGIApp
 
 from skillmeat.observability.context import LogContext, user_id_var
 from skillmeat.observability.metrics import (
+    api_db_duration,
+    api_db_queries,
     api_requests_total,
     api_request_duration,
     api_request_size,
     api_response_size,
     api_errors_total,
 )
+from skillmeat.observability.query_stats import (
+    QUERY_COUNT_HEADER,
+    QUERY_TIME_HEADER,
+    QueryStats,
+    track_queries,
+)
 from skillmeat.observability.tracing import trace_operation
 
 logger = logging.getLogger(__name__)
@@ -31,17 +39,21 @@ class ObservabilityMiddleware(BaseHTTPMiddleware):
     Automatically adds:
     - Request and trace ID propagation
     - Distributed tracing spans for requests
-    - Prometheus metrics collection
+    - Prometheus metrics collection, including SQL statements and database
+      time per request
     - Structured logging with context
     """
 
-    def __init__(self, app: ASGIApp):
+    def __init__(self, app: ASGIApp, expose_query_headers: bool = False):
         """Initialize middleware.
 
         Args:
             app: ASGI application
+            expose_query_headers: Return each request's SQL statement count
+                and database time as response headers (debug aid)
         """
         super().__init__(app)
+        self.expose_query_headers = expose_query_headers
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """Process request with observability.
@@ -90,6 +102,7 @@ class ObservabilityMiddleware(BaseHTTPMiddleware):
         response = None
         status_code = 500  # Default to error
         error_type = None
+        query_stats: Optional[QueryStats] = None
 
         try:
             with trace_operation(
@@ -101,8 +114,9 @@ class ObservabilityMiddleware(BaseHTTPMiddleware):
                 user_agent=request.headers.get("user-agent"),
                 request_size=request_size,
             ) as span:
-                # Process request
-                response = await call_next(request)
+                # Process request, counting the SQL statements it issues
+                with track_queries() as query_stats:
+                    response = await call_next(request)
                 status_code = response.status_code
 
                 # Add response info to span
@@ -170,6 +184,14 @@ class ObservabilityMiddleware(BaseHTTPMiddleware):
                     method=method, endpoint=normalized_path
                 ).observe(request_size)
 
+            if query_stats is not None:
+                api_db_queries.labels(method=method, endpoint=normalized_path).observe(
+                    query_stats.count
+                )
+                api_db_duration.labels(method=method, endpoint=normalized_path).observe(
+                    query_stats.duration
+                )
+
             # Log request completion
             logger.info(
                 f"Request completed: {method} {path} - {status_code}",
@@ -179,6 +201,10 @@ class ObservabilityMiddleware(BaseHTTPMiddleware):
                     "normalized_path": normalized_path,
                     "status_code": status_code,
                     "duration_ms": round(duration * 1000, 2),
+                    "db_queries": query_stats.count if query_stats else 0,
+                    "db_time_ms": (
+                        round(query_stats.duration_ms, 2) if query_stats else 0.0
+                    ),
                     "request_size": request_size,
                     "trace_id": trace_id,
                     "request_id": request_id,
@@ -190,6 +216,9 @@ class ObservabilityMiddleware(BaseHTTPMiddleware):
         if response:
             response.headers["X-Request-ID"] = request_id
             response.headers["X-Trace-ID"] = trace_id
+            if self.expose_query_headers and query_stats is not None:
+                response.headers[QUERY_COUNT_HEADER] = str(query_stats.count)
+                response.headers[QUERY_TIME_HEADER] = f"{query_stats.duration_ms:.2f}"
 
         return response
 
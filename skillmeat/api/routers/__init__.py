@@ -22,6 +22,7 @@ from . import (
     deployment_profiles,
     deployment_sets,
     deployments,
+    drift_scans,
     groups,
     health,
     icon_packs,
@@ -33,6 +34,7 @@ from . import (
     mcp,
     memory_items,
     merge,
+    profiling,
     project_templates,
     projects,
     ratings,
@@ -63,6 +65,7 @@ __all__ = [
     "deployment_profiles",
     "deployment_sets",
     "deployments",
+    "drift_scans",
     "groups",
     "health",
     "icon_packs",
@@ -74,6 +77,7 @@ __all__ = [
     "mcp",
     "memory_items",
     "merge",
+    "profiling",
     "project_templates",
     "projects",
     "ratings",
@@ -347,13 +347,37 @@ def _build_deployment_events(
     return result
 
 
-def _compute_statistics(events: List[ArtifactHistoryEventResponse]) -> Dict[str, Any]:
+def _lineage_depths(
+    events: List[ArtifactHistoryEventResponse],
+    version_dtos: List[ArtifactVersionDTO],
+) -> List[int]:
+    """Return the lineage depth (generations from the root) of each event.
+
+    ``version_lineage`` only keeps the most recent ``LINEAGE_WINDOW`` hashes,
+    so depths come from the ancestry index of the version matching the
+    event's content hash.  Events without an indexed version (legacy rows)
+    fall back to the length of their lineage list.
+    """
+    indexed = {
+        dto.content_hash: dto.lineage_depth
+        for dto in version_dtos
+        if dto.lineage_depth is not None
+    }
+    depths = []
+    for event in events:
+        if event.content_sha in indexed:
+            depths.append(indexed[event.content_sha])
+        elif event.version_lineage and isinstance(event.version_lineage, list):
+            depths.append(len(event.version_lineage) - 1)
+    return depths
+
+
+def _compute_statistics(
+    events: List[ArtifactHistoryEventResponse],
+    version_dtos: Optional[List[ArtifactVersionDTO]] = None,
+) -> Dict[str, Any]:
     """Compute aggregate provenance statistics for history timelines."""
-    lineage_depths = [
-        len(event.version_lineage)
-        for event in events
-        if event.version_lineage and isinstance(event.version_lineage, list)
-    ]
+    lineage_depths = _lineage_depths(events, version_dtos or [])
 
     return {
         "total_events": len(events),
@@ -482,7 +506,7 @@ async def get_artifact_history(
         timeline.sort(key=lambda event: (event.timestamp, event.id), reverse=True)
         timeline = timeline[:limit]
 
-        statistics = _compute_statistics(timeline)
+        statistics = _compute_statistics(timeline, version_dtos)
 
         return ArtifactHistoryResponse(
             artifact_name=artifact_name,
@@ -3,6 +3,7 @@
 Provides REST API for managing artifacts within collections.
 """
 
+import asyncio
 import base64
 import difflib
 import hashlib
@@ -56,6 +57,7 @@ from skillmeat.core.interfaces.repositories import (
     ICollectionRepository,
 )
 from skillmeat.api.middleware.auth import TokenDep
+from skillmeat.api.project_registry import get_project_registry
 from skillmeat.api.schemas.auth import AuthContext
 from skillmeat.api.schemas.artifacts import (
     ArtifactCollectionInfo,
@@ -132,6 +134,7 @@ from skillmeat.core.artifact import ArtifactType, LinkedArtifactReference
 from skillmeat.core.cache import MetadataCache
 from skillmeat.core.deployment import Deployment, DeploymentManager
 from skillmeat.core.discovery import ArtifactDiscoveryService
+from skillmeat.core.discovery_cache import get_default_discovery_cache
 from skillmeat.core.github_metadata import GitHubMetadataExtractor
 from skillmeat.core.importer import (
     ArtifactImporter,
@@ -152,6 +155,7 @@ from skillmeat.api.services.artifact_cache_service import (
 )
 from skillmeat.api.schemas.deployments import DeploymentSummary
 from skillmeat.cache.composite_repository import CompositeMembershipRepository
+from skillmeat.cache.deployment_index import DeploymentIndex
 from skillmeat.cache.models import (
     Artifact as DbArtifact,
     get_session,
@@ -696,11 +700,59 @@ async def build_deployment_statistics(
     return result
 
 
+def _get_deployment_index() -> Optional[DeploymentIndex]:
+    """Return the app-wide deployment index, creating it on first use."""
+    app_state = get_app_state()
+    index = getattr(app_state, "deployment_index", None)
+    if index is None and app_state.cache_manager is not None:
+        index = DeploymentIndex(app_state.cache_manager.repository)
+        app_state.deployment_index = index
+    return index
+
+
+async def _find_artifact_deployments(
+    artifact_name: str,
+    artifact_type: ArtifactType,
+    deployment_index: Optional[DeploymentIndex],
+) -> List[Deployment]:
+    """Find one artifact's deployments across the project registry's projects.
+
+    With an index, only projects whose deployment files changed since the last
+    call are re-read.  Returned deployments carry a ``project_path`` attribute.
+    """
+    registry = await get_project_registry()
+    project_paths = [entry.path for entry in await registry.get_projects()]
+
+    def lookup() -> List[Deployment]:
+        if deployment_index is not None:
+            deployment_index.refresh(project_paths)
+            return deployment_index.find(artifact_name, artifact_type.value)
+
+        found: List[Deployment] = []
+        for project_path in project_paths:
+            try:
+                project_deployments = DeploymentTracker.read_deployments(project_path)
+            except Exception as e:
+                logger.warning(f"Error reading deployments for {project_path}: {e}")
+                continue
+            for deployment in project_deployments:
+                if (
+                    deployment.artifact_name == artifact_name
+                    and deployment.artifact_type == artifact_type.value
+                ):
+                    deployment.project_path = project_path  # type: ignore
+                    found.append(deployment)
+        return found
+
+    return await asyncio.to_thread(lookup)
+
+
 async def build_version_graph(
     artifact_name: str,
     artifact_type: ArtifactType,
     collection_name: Optional[str] = None,
     collection_mgr=None,
+    deployment_index: Optional[DeploymentIndex] = None,
 ) -> VersionGraphResponse:
     """Build version graph for an artifact showing deployment hierarchy.
 
@@ -712,12 +764,12 @@ async def build_version_graph(
         artifact_type: Type of the artifact
         collection_name: Optional collection filter
         collection_mgr: Collection manager for accessing collection data
+        deployment_index: Cache-DB deployment index (reads tracker files
+            directly if None)
 
     Returns:
         VersionGraphResponse with complete hierarchy and statistics
     """
-    from skillmeat.api.routers.projects import discover_projects
-
     # Find the artifact in collection (root node)
     root_node: Optional[VersionGraphNodeResponse] = None
     collection_sha: Optional[str] = None
@@ -779,75 +831,73 @@ async def build_version_graph(
                 )
                 continue
 
-    # Discover all project deployments
-    project_paths = discover_projects()
+    # Look up this artifact's deployments across the registry's projects
+    deployments = await _find_artifact_deployments(
+        artifact_name, artifact_type, deployment_index
+    )
     total_deployments = 0
     modified_count = 0
     unmodified_count = 0
 
     children: List[VersionGraphNodeResponse] = []
+    projects_with_node = set()
 
-    for project_path in project_paths:
-        try:
-            # Load deployments for this project
-            deployments = DeploymentTracker.read_deployments(project_path)
+    for deployment in deployments:
+        project_path = deployment.project_path
+        if project_path in projects_with_node:
+            continue  # Only one deployment per project
 
-            # Find our artifact
-            for deployment in deployments:
-                if (
-                    deployment.artifact_name == artifact_name
-                    and deployment.artifact_type == artifact_type.value
-                ):
-                    total_deployments += 1
+        try:
+            total_deployments += 1
 
-                    # Compute current SHA
-                    artifact_full_path = (
-                        project_path / ".claude" / deployment.artifact_path
-                    )
+            # Compute current SHA
+            artifact_full_path = (
+                project_path / ".claude" / deployment.artifact_path
+            )
 
-                    if not artifact_full_path.exists():
-                        continue
+            if not artifact_full_path.exists():
+                continue
 
-                    current_sha = compute_content_hash(artifact_full_path)
-                    is_modified = current_sha != deployment.collection_sha
+            current_sha = compute_content_hash(artifact_full_path)
+            is_modified = current_sha != deployment.collection_sha
 
-                    if is_modified:
-                        modified_count += 1
-                    else:
-                        unmodified_count += 1
+            if is_modified:
+                modified_count += 1
+            else:
+                unmodified_count += 1
 
-                    # Create child node
-                    child_version_info = ArtifactVersionInfo(
-                        artifact_name=artifact_name,
-                        artifact_type=artifact_type.value,
-                        location=str(project_path),
-                        location_type="project",
-                        content_sha=current_sha,
-                        parent_sha=collection_sha,  # Parent is collection
-                        is_modified=is_modified,
-                        created_at=deployment.deployed_at,
-                        metadata={
-                            "project_name": project_path.name,
-                            "deployed_at": deployment.deployed_at.isoformat(),
-                            "modification_detected_at": (
-                                deployment.modification_detected_at.isoformat()
-                                if deployment.modification_detected_at
-                                else None
-                            ),
-                        },
-                    )
+            # Create child node
+            child_version_info = ArtifactVersionInfo(
+                artifact_name=artifact_name,
+                artifact_type=artifact_type.value,
+                location=str(project_path),
+                location_type="project",
+                content_sha=current_sha,
+                parent_sha=collection_sha,  # Parent is collection
+                is_modified=is_modified,
+                created_at=deployment.deployed_at,
+                metadata={
+                    "project_name": project_path.name,
+                    "deployed_at": deployment.deployed_at.isoformat(),
+                    "modification_detected_at": (
+                        deployment.modification_detected_at.isoformat()
+                        if deployment.modification_detected_at
+                        else None
+                    ),
+                },
+            )
 
-                    child_node = VersionGraphNodeResponse(
-                        id=f"project:{project_path}",
-                        artifact_name=artifact_name,
-                        artifact_type=artifact_type.value,
-                        version_info=child_version_info,
-                        children=[],  # Projects don't have children
-                        metadata={"project_name": project_path.name},
-                    )
+            child_node = VersionGraphNodeResponse(
+                id=f"project:{project_path}",
+                artifact_name=artifact_name,
+                artifact_type=artifact_type.value,
+                version_info=child_version_info,
+                children=[],  # Projects don't have children
+                metadata={"project_name": project_path.name},
+            )
 
-                    children.append(child_node)
-                    break  # Only one deployment per project
+            children.append(child_node)
+            projects_with_node.add(project_path)
 
         except Exception as e:
             logger.warning(f"Error processing project {project_path}: {e}")
@@ -1189,7 +1239,9 @@ async def discover_artifacts(
             # Graceful fallback - return all as importable
 
         # Create discovery service
-        discovery_service = ArtifactDiscoveryService(scan_path)
+        discovery_service = ArtifactDiscoveryService(
+            scan_path, cache=get_default_discovery_cache()
+        )
 
         # Perform discovery scan with manifest filtering
         logger.info(f"Starting artifact discovery scan in: {scan_path}")
@@ -1326,7 +1378,9 @@ async def discover_project_artifacts(
                 # Graceful fallback - return all as importable
 
         # Create discovery service with project scan mode
-        discovery_service = ArtifactDiscoveryService(project_path, scan_mode="project")
+        discovery_service = ArtifactDiscoveryService(
+            project_path, scan_mode="project", cache=get_default_discovery_cache()
+        )
 
         # Perform discovery scan with manifest filtering
         logger.info(f"Starting artifact discovery scan in project: {project_path}")
@@ -4622,6 +4676,7 @@ async def get_version_graph(
             artifact_type=artifact_type,
             collection_name=collection,
             collection_mgr=collection_mgr,
+            deployment_index=_get_deployment_index(),
         )
 
         # Check if we found the artifact anywhere
@@ -8,6 +8,7 @@ Endpoints:
     GET  /bom/snapshot              -- Current point-in-time BOM snapshot
     POST /bom/generate              -- On-demand BOM generation (with optional auto-sign)
     POST /bom/verify                -- Verify BOM signature on a snapshot
+    POST /bom/verify/batch          -- Verify signatures on many snapshots at once
     GET  /attestations              -- Cursor-paginated list of attestation records
     POST /attestations              -- Create a manual attestation record
     GET  /attestations/{id}         -- Retrieve a single attestation record
@@ -657,6 +658,42 @@ class BomVerifyResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class BomBatchVerifyRequest(BaseModel):
+    """Request body for batch BOM signature verification."""
+
+    snapshot_ids: Optional[List[int]] = Field(
+        default=None,
+        max_length=500,
+        description=(
+            "Primary keys of the snapshots to verify.  When omitted the most "
+            "recent ``limit`` snapshots for the caller's owner scope are used."
+        ),
+    )
+    limit: int = Field(
+        default=100,
+        ge=1,
+        le=500,
+        description="Number of recent snapshots to verify when snapshot_ids is omitted.",
+    )
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class BomBatchVerifyResponse(BaseModel):
+    """Result of batch BOM signature verification."""
+
+    results: List[BomVerifyResponse] = Field(
+        description="Per-snapshot results, in request order (or newest first)."
+    )
+    valid_count: int = Field(description="Snapshots whose signature verified.")
+    invalid_count: int = Field(
+        description="Snapshots that are unsigned, missing, or failed verification."
+    )
+    elapsed_ms: float = Field(description="Time spent verifying signatures.")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 # ---------------------------------------------------------------------------
 # POST /attestations  (TASK-7.5)
 # ---------------------------------------------------------------------------
@@ -940,3 +977,110 @@ async def verify_bom(
         key_id=result.key_id,
         snapshot_id=snapshot.id,
     )
+
+
+# ---------------------------------------------------------------------------
+# POST /bom/verify/batch
+# ---------------------------------------------------------------------------
+
+
+@router.post(
+    "/bom/verify/batch",
+    response_model=BomBatchVerifyResponse,
+    tags=["bom"],
+    summary="Verify BOM signatures in bulk",
+    description=(
+        "Verify the stored Ed25519 signatures of many BOM snapshots in one call. "
+        "The public key is loaded once and signatures are checked in parallel. "
+        "Unsigned or unknown snapshots are reported as invalid rather than "
+        "failing the request."
+    ),
+    responses={
+        200: {"description": "Per-snapshot verification results"},
+    },
+)
+async def verify_bom_batch(
+    request: BomBatchVerifyRequest,
+    db: DbSessionDep,
+    auth_context: AuthContext = Depends(get_auth_context),
+) -> BomBatchVerifyResponse:
+    """Verify the stored signatures of many BOM snapshots.
+
+    Steps:
+    1. Resolve the snapshots (by ``snapshot_ids`` or latest ``limit`` for caller).
+    2. Decode each stored signature; unsigned or malformed ones are invalid.
+    3. Call ``verify_signatures()`` once for every decodable signature.
+    4. Return per-snapshot :class:`BomVerifyResponse` items plus totals.
+    """
+    from skillmeat.core.bom.signing import verify_signatures
+
+    owner_type = "user"
+    if auth_context.tenant_id:
+        owner_type = "enterprise"
+
+    if request.snapshot_ids is not None:
+        rows = (
+            db.query(BomSnapshot)
+            .filter(BomSnapshot.id.in_(request.snapshot_ids))
+            .all()
+        )
+        by_id = {row.id: row for row in rows}
+        snapshots = [(sid, by_id.get(sid)) for sid in request.snapshot_ids]
+    else:
+        rows = (
+            db.query(BomSnapshot)
+            .filter(BomSnapshot.owner_type == owner_type)
+            .order_by(BomSnapshot.created_at.desc())
+            .limit(request.limit)
+            .all()
+        )
+        snapshots = [(row.id, row) for row in rows]
+
+    results: List[Optional[BomVerifyResponse]] = []
+    pending: List[int] = []
+    items = []
+    for snapshot_id, snapshot in snapshots:
+        if snapshot is None:
+            details = f"BOM snapshot '{snapshot_id}' not found."
+        elif not snapshot.signature:
+            details = "Snapshot has no signature."
+        else:
+            try:
+                items.append((snapshot.bom_json.encode(), bytes.fromhex(snapshot.signature)))
+            except ValueError:
+                details = "Signature is not valid hex-encoded data."
+            else:
+                pending.append(len(results))
+                results.append(None)
+                continue
+        results.append(
+            BomVerifyResponse(valid=False, details=details, snapshot_id=snapshot_id)
+        )
+
+    try:
+        batch = verify_signatures(items)
+    except Exception as exc:
+        logger.exception("Unexpected error during batch BOM signature verification: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Verification failed with an unexpected error: {exc}",
+        )
+
+    for position, result in zip(pending, batch.results):
+        results[position] = BomVerifyResponse(
+            valid=result.valid,
+            details="Signature is valid."
+            if result.valid
+            else result.error or "Signature verification failed.",
+            key_id=result.key_id,
+            snapshot_id=snapshots[position][0],
+        )
+
+    final = [r for r in results if r is not None]
+    valid_count = sum(1 for r in final if r.valid)
+    return BomBatchVerifyResponse(
+        results=final,
+        valid_count=valid_count,
+        invalid_count=len(final) - valid_count,
+        elapsed_ms=batch.elapsed_ms,
+    )
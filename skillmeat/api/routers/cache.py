@@ -311,7 +311,7 @@ async def list_cached_projects(
             if status_filter == "stale":
                 # Get stale project IDs
                 stale_ids = {
-                    p.id for p in all_projects if cache_manager.is_cache_stale(p.id)
+                    p.id for p in all_projects if cache_manager.is_project_stale(p)
                 }
                 filtered_projects = [p for p in all_projects if p.id in stale_ids]
             else:
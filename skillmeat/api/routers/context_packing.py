@@ -92,6 +92,7 @@ async def preview_context_pack(
             module_id=request.module_id,
             budget_tokens=request.budget_tokens,
             filters=request.filters,
+            selection_mode=request.selection_mode,
         )
         return ContextPackPreviewResponse(**result)
     except ValueError as e:
@@ -151,6 +152,7 @@ async def generate_context_pack(
             module_id=request.module_id,
             budget_tokens=request.budget_tokens,
             filters=request.filters,
+            selection_mode=request.selection_mode,
         )
         return ContextPackGenerateResponse(**result)
     except ValueError as e:
@@ -0,0 +1,200 @@
+"""Fleet drift scan API endpoints.
+
+Starts, resumes, cancels and pages fleet-wide drift scans run by
+:class:`~skillmeat.core.fleet_drift.FleetDriftScanner`.  A scan runs as a
+background task after the start request returns; clients poll the scan for
+progress and read the stored drift matrix page by page.
+"""
+
+import logging
+from typing import Annotated, List, Optional
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+
+from skillmeat.api.dependencies import SyncManagerDep
+from skillmeat.api.schemas.drift import (
+    DriftMatrixEntryResponse,
+    DriftMatrixPageResponse,
+    FleetDriftScanListResponse,
+    FleetDriftScanRequest,
+    FleetDriftScanResponse,
+    FleetDriftType,
+)
+from skillmeat.cache.drift_matrix import RESUMABLE_STATUSES
+from skillmeat.cache.repository import CacheRepository
+from skillmeat.core.fleet_drift import FleetDriftScanner
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/drift-scans",
+    tags=["drift"],
+)
+
+
+# =============================================================================
+# Dependency Injection
+# =============================================================================
+
+
+def get_fleet_drift_scanner(sync_manager: SyncManagerDep) -> FleetDriftScanner:
+    """Build a FleetDriftScanner over the default cache database."""
+    return FleetDriftScanner(sync_manager, CacheRepository())
+
+
+FleetDriftScannerDep = Annotated[FleetDriftScanner, Depends(get_fleet_drift_scanner)]
+
+
+def _run_scan(scanner: FleetDriftScanner, scan_id: str) -> None:
+    """Background task body; failures are recorded on the scan row."""
+    try:
+        scanner.run(scan_id)
+    except Exception:
+        logger.exception(f"Background fleet drift scan {scan_id} failed")
+
+
+def _require_scan(scanner: FleetDriftScanner, scan_id: str) -> dict:
+    scan = scanner.store.get_scan(scan_id)
+    if scan is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Drift scan not found: {scan_id}",
+        )
+    return scan
+
+
+# =============================================================================
+# Endpoints
+# =============================================================================
+
+
+@router.post(
+    "",
+    response_model=FleetDriftScanResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Start a fleet drift scan",
+    description=(
+        "Create a drift scan across every registered project and run it in "
+        "the background. Poll the scan for progress and page its matrix with "
+        "the entries endpoint."
+    ),
+)
+async def start_scan(
+    scanner: FleetDriftScannerDep,
+    background_tasks: BackgroundTasks,
+    request: Optional[FleetDriftScanRequest] = None,
+) -> FleetDriftScanResponse:
+    """Create a scan and schedule it."""
+    collection_name = request.collection_name if request else None
+    scan_id = scanner.store.create_scan(collection_name)
+    background_tasks.add_task(_run_scan, scanner, scan_id)
+    return FleetDriftScanResponse(**_require_scan(scanner, scan_id))
+
+
+@router.get(
+    "",
+    response_model=FleetDriftScanListResponse,
+    summary="List fleet drift scans",
+)
+async def list_scans(
+    scanner: FleetDriftScannerDep,
+    limit: int = Query(20, ge=1, le=100, description="Maximum scans to return"),
+) -> FleetDriftScanListResponse:
+    """Return the most recent scans, newest first."""
+    return FleetDriftScanListResponse(
+        items=[FleetDriftScanResponse(**s) for s in scanner.store.list_scans(limit)]
+    )
+
+
+@router.get(
+    "/{scan_id}",
+    response_model=FleetDriftScanResponse,
+    summary="Get fleet drift scan status",
+)
+async def get_scan(
+    scan_id: str, scanner: FleetDriftScannerDep
+) -> FleetDriftScanResponse:
+    """Return a scan's status and progress counters."""
+    return FleetDriftScanResponse(**_require_scan(scanner, scan_id))
+
+
+@router.post(
+    "/{scan_id}/cancel",
+    response_model=FleetDriftScanResponse,
+    summary="Cancel a fleet drift scan",
+    description="Ask a pending or running scan to stop after its in-flight projects.",
+)
+async def cancel_scan(
+    scan_id: str, scanner: FleetDriftScannerDep
+) -> FleetDriftScanResponse:
+    """Request cancellation of a pending or running scan."""
+    scan = _require_scan(scanner, scan_id)
+    if not scanner.cancel(scan_id):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Drift scan {scan_id} is not running (status: {scan['status']})",
+        )
+    return FleetDriftScanResponse(**_require_scan(scanner, scan_id))
+
+
+@router.post(
+    "/{scan_id}/resume",
+    response_model=FleetDriftScanResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Resume a fleet drift scan",
+    description=(
+        "Run a cancelled, failed or interrupted scan again in the background. "
+        "Projects that already have results are skipped; a completed scan is "
+        "re-run only to retry failed projects."
+    ),
+)
+async def resume_scan(
+    scan_id: str,
+    scanner: FleetDriftScannerDep,
+    background_tasks: BackgroundTasks,
+) -> FleetDriftScanResponse:
+    """Schedule a resumed run of an existing scan."""
+    scan = _require_scan(scanner, scan_id)
+    if scan["status"] not in RESUMABLE_STATUSES and not scan["failed_projects"]:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Drift scan {scan_id} has nothing to resume",
+        )
+    background_tasks.add_task(_run_scan, scanner, scan_id)
+    return FleetDriftScanResponse(**scan)
+
+
+@router.get(
+    "/{scan_id}/entries",
+    response_model=DriftMatrixPageResponse,
+    summary="Page a fleet drift scan's matrix",
+    description=(
+        "Return stored matrix entries ordered by project path, artifact type "
+        "and name. Filter by drift type (repeatable) or project."
+    ),
+)
+async def list_entries(
+    scan_id: str,
+    scanner: FleetDriftScannerDep,
+    drift_type: Optional[List[FleetDriftType]] = Query(
+        None, description="Drift types to include (repeatable)"
+    ),
+    project_id: Optional[str] = Query(None, description="Project filter"),
+    offset: int = Query(0, ge=0, description="Entries to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum entries"),
+) -> DriftMatrixPageResponse:
+    """Return one page of a scan's drift matrix."""
+    _require_scan(scanner, scan_id)
+    entries, total = scanner.store.list_entries(
+        scan_id,
+        offset=offset,
+        limit=limit,
+        drift_types=drift_type,
+        project_id=project_id,
+    )
+    return DriftMatrixPageResponse(
+        items=[DriftMatrixEntryResponse(**entry) for entry in entries],
+        total=total,
+        offset=offset,
+        limit=limit,
+    )
@@ -10,31 +10,45 @@ Routes
 ------
 GET /api/v1/artifacts/{artifact_id}/download
     Download a full artifact payload (JSON or gzip-compressed).
+GET /api/v1/artifacts/{artifact_id}/hash
+    Conditional content-hash check (``ETag`` / ``If-None-Match``).
+POST /api/v1/artifacts/delta
+    Streamed per-file delta for several artifacts in one round trip.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import Annotated
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import Response
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import FileResponse, Response, StreamingResponse
 
+from skillmeat.api.config import get_settings
 from skillmeat.api.dependencies import (
     DbSessionDep,
     get_auth_context,
     require_auth,
 )
 from skillmeat.api.middleware.enterprise_auth import verify_enterprise_pat
-from skillmeat.api.schemas.enterprise import ArtifactDownloadResponse
+from skillmeat.api.schemas.enterprise import (
+    ArtifactDeltaRequest,
+    ArtifactDownloadResponse,
+    ArtifactHashResponse,
+)
 from skillmeat.cache.enterprise_repositories import EnterpriseArtifactRepository
 from skillmeat.api.schemas.auth import AuthContext
+from skillmeat.core.enterprise_delta import DELTA_MEDIA_TYPE, etag_for, etag_matches
 from skillmeat.core.services.enterprise_content import (
     ArtifactFilesystemError,
     ArtifactNotFoundError,
     ArtifactVersionNotFoundError,
     EnterpriseContentService,
 )
+from skillmeat.core.services.enterprise_payload_cache import (
+    DEFAULT_PAYLOAD_CACHE_DIR,
+    PayloadCache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +66,26 @@ router = APIRouter(
 # Dependency: per-request EnterpriseContentService
 # ---------------------------------------------------------------------------
 
+_payload_cache: Optional[PayloadCache] = None
+
+
+def _get_payload_cache() -> Optional[PayloadCache]:
+    """Return the process-wide compressed payload cache (None if disabled).
+
+    A single instance is shared across requests so concurrent downloads of
+    the same artifact version share one build.
+    """
+    global _payload_cache
+    if _payload_cache is None:
+        settings = get_settings()
+        if not settings.enterprise_payload_cache_enabled:
+            return None
+        _payload_cache = PayloadCache(
+            root=settings.enterprise_payload_cache_dir or DEFAULT_PAYLOAD_CACHE_DIR,
+            max_bytes=settings.enterprise_payload_cache_max_mb * 1024 * 1024,
+        )
+    return _payload_cache
+
 
 def _get_content_service(session: DbSessionDep) -> EnterpriseContentService:
     """Build an ``EnterpriseContentService`` for the current request.
@@ -77,7 +111,11 @@ def _get_content_service(session: DbSessionDep) -> EnterpriseContentService:
         Service instance ready for use within the current request.
     """
     repo = EnterpriseArtifactRepository(session)
-    return EnterpriseContentService(session=session, artifact_repo=repo)
+    return EnterpriseContentService(
+        session=session,
+        artifact_repo=repo,
+        payload_cache=_get_payload_cache(),
+    )
 
 
 ContentServiceDep = Annotated[EnterpriseContentService, Depends(_get_content_service)]
@@ -94,10 +132,14 @@ ContentServiceDep = Annotated[EnterpriseContentService, Depends(_get_content_ser
         "Return the complete file bundle for an enterprise artifact identified by "
         "UUID or name.  Use ``compress=true`` to receive a gzip-compressed payload "
         "instead of JSON.  Use ``version`` to pin to a specific version tag or "
-        "content hash."
+        "content hash.  Send the last seen hash in ``If-None-Match`` to get "
+        "``304 Not Modified`` instead of the payload when it is still current.  "
+        "Compressed payloads are served from a server-side cache and support "
+        "``Range`` requests."
     ),
     response_model=ArtifactDownloadResponse,
     responses={
+        304: {"description": "The client's hash is current; no body."},
         200: {
             "description": (
                 "Artifact payload as JSON (default) or ``application/gzip`` bytes "
@@ -128,6 +170,7 @@ def download_artifact(
         ),
     ),
     auth_context: AuthContext = Depends(get_auth_context),
+    if_none_match: Optional[str] = Header(default=None),
 ) -> ArtifactDownloadResponse | Response:
     """Download an enterprise artifact bundle.
 
@@ -143,8 +186,12 @@ def download_artifact(
         When ``None`` the latest version is returned.
     compress:
         When ``True``, return gzip-compressed bytes with
-        ``Content-Type: application/gzip``.  When ``False`` (default),
-        return a JSON response matching ``ArtifactDownloadResponse``.
+        ``Content-Type: application/gzip``, streamed from the payload cache
+        when the version is cacheable.  When ``False`` (default), return a
+        JSON response matching ``ArtifactDownloadResponse``.
+    if_none_match:
+        ``If-None-Match`` request header.  When it names the resolved
+        content hash, files are not read and ``304`` is returned.
 
     Returns
     -------
@@ -160,7 +207,18 @@ def download_artifact(
         If the artifact's files cannot be read from the filesystem.
     """
     try:
-        result = svc.build_payload(artifact_id, version=version, compress=compress)
+        if if_none_match:
+            current = svc.get_content_hash(artifact_id, version=version)["content_hash"]
+            if etag_matches(if_none_match, current):
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED,
+                    headers={"ETag": etag_for(current)},
+                )
+        cached = (
+            svc.build_payload_file(artifact_id, version=version) if compress else None
+        )
+        if cached is None:
+            result = svc.build_payload(artifact_id, version=version, compress=compress)
     except ArtifactVersionNotFoundError as exc:
         logger.info(
             "Enterprise download: version not found — artifact=%s version=%s",
@@ -196,6 +254,15 @@ def download_artifact(
             detail="Internal server error while assembling artifact bundle.",
         ) from exc
 
+    if cached is not None:
+        # FileResponse streams the file and answers Range requests.
+        return FileResponse(
+            cached.path,
+            media_type="application/gzip",
+            filename=f"{artifact_id}.json.gz",
+            headers={"ETag": etag_for(cached.content_hash)},
+        )
+
     if compress:
         # build_payload returns bytes when compress=True.
         return Response(
@@ -209,4 +276,142 @@ def download_artifact(
         )
 
     # Uncompressed path: result is a plain dict; validate through the schema.
-    return ArtifactDownloadResponse(**result)  # type: ignore[arg-type]
+    payload = ArtifactDownloadResponse(**result)  # type: ignore[arg-type]
+    if not payload.content_hash:
+        return payload
+    return Response(
+        content=payload.model_dump_json(),
+        media_type="application/json",
+        headers={"ETag": etag_for(payload.content_hash)},
+    )
+
+
+@router.get(
+    "/{artifact_id}/hash",
+    summary="Check enterprise artifact content hash",
+    description=(
+        "Return the content hash of an enterprise artifact without reading its "
+        "files.  The hash is also sent as a strong ``ETag``; when the request's "
+        "``If-None-Match`` names it the response is ``304 Not Modified`` with "
+        "no body."
+    ),
+    response_model=ArtifactHashResponse,
+    responses={
+        304: {"description": "The client's hash is current."},
+        404: {"description": "Artifact or version not found for the current tenant."},
+    },
+)
+def get_artifact_hash(
+    artifact_id: str,
+    svc: ContentServiceDep,
+    version: str | None = Query(
+        default=None,
+        description="Optional version tag or 64-char content hash.",
+    ),
+    if_none_match: Optional[str] = Header(default=None),
+) -> ArtifactHashResponse | Response:
+    """Return an artifact's content hash, honouring ``If-None-Match``.
+
+    Parameters
+    ----------
+    artifact_id:
+        UUID string or human-readable artifact name.
+    svc:
+        ``EnterpriseContentService`` injected per-request.
+    version:
+        Optional version specifier.  ``None`` resolves the latest version.
+    if_none_match:
+        ``If-None-Match`` request header, if any.
+
+    Returns
+    -------
+    ArtifactHashResponse | Response
+        The hash payload, or an empty ``304`` response.
+
+    Raises
+    ------
+    HTTPException(404)
+        If the artifact or requested version does not exist.
+    """
+    try:
+        result = svc.get_content_hash(artifact_id, version=version)
+    except ArtifactVersionNotFoundError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Version '{exc.version}' not found for artifact '{exc.artifact_id}'",
+        ) from exc
+    except ArtifactNotFoundError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Artifact not found: {exc.artifact_id!r}",
+        ) from exc
+
+    content_hash = result["content_hash"]
+    headers = {"ETag": etag_for(content_hash)} if content_hash else {}
+    if etag_matches(if_none_match, content_hash):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    payload = ArtifactHashResponse(**result)
+    return Response(
+        content=payload.model_dump_json(),
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+@router.post(
+    "/delta",
+    summary="Stream per-file deltas for enterprise artifacts",
+    description=(
+        "Compare each artifact's current files with the client's manifest and "
+        "stream only new or changed files, plus the paths the client should "
+        "remove, as a gzip-compressed tar archive.  Artifacts whose "
+        "``content_hash`` matches the client's are reported unchanged without "
+        "reading their files.  See ``skillmeat.core.enterprise_delta`` for the "
+        "archive layout."
+    ),
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "Delta archive.",
+            "content": {DELTA_MEDIA_TYPE: {}},
+        },
+        500: {"description": "Filesystem error prevented delta assembly."},
+    },
+)
+def artifact_delta(
+    body: ArtifactDeltaRequest,
+    svc: ContentServiceDep,
+) -> StreamingResponse:
+    """Stream a delta archive for the requested artifacts.
+
+    Artifacts that do not exist are reported in their archive header with
+    ``status="not_found"`` rather than failing the whole request.
+
+    Parameters
+    ----------
+    body:
+        Client state per artifact (stored hash and file manifest).
+    svc:
+        ``EnterpriseContentService`` injected per-request.
+
+    Returns
+    -------
+    StreamingResponse
+        ``application/x-gtar`` stream.
+
+    Raises
+    ------
+    HTTPException(500)
+        If artifact files cannot be read while planning the delta.
+    """
+    try:
+        chunks = svc.build_delta([item.model_dump() for item in body.artifacts])
+    except ArtifactFilesystemError as exc:
+        logger.exception("Enterprise delta: filesystem error — %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Artifact files could not be read from the filesystem.",
+        ) from exc
+
+    return StreamingResponse(chunks, media_type=DELTA_MEDIA_TYPE)
@@ -99,6 +99,8 @@ from skillmeat.api.schemas.marketplace import (
     ReimportResponse,
     ScanRequest,
     ScanResultDTO,
+    SourceFacetsResponse,
+    SourceFacetValue,
     SourceListResponse,
     SourceResponse,
     UpdateAutoTagRequest,
@@ -133,6 +135,7 @@ from skillmeat.core.marketplace.import_coordinator import (
     ConflictStrategy,
     ImportCoordinator,
 )
+from skillmeat.core.marketplace.minhash import catalog_signature
 from skillmeat.core.marketplace.source_manager import SourceManager
 from skillmeat.core.path_tags import PathSegmentExtractor, PathTagConfig
 from skillmeat.core.validation import validate_artifact_name
@@ -1845,6 +1848,8 @@ async def _perform_scan(
                         deep_search_text=search_metadata.get("deep_search_text"),
                         deep_indexed_at=deep_indexed_at,
                         deep_index_files=deep_index_files_json,
+                        # Near-duplicate detection over the indexed text
+                        minhash_signature=catalog_signature(search_metadata),
                         # Embedded artifacts for skill composite wiring (SCA-P2-03)
                         metadata_json=catalog_metadata_json,
                     )
@@ -2428,6 +2433,72 @@ async def list_sources(
         ) from e
 
 
+@router.get(
+    "/facets",
+    response_model=SourceFacetsResponse,
+    summary="Get source facet counts",
+    description="""
+    Return artifact-type, tag and trust-level counts across all sources.
+
+    Counts are precomputed and maintained as sources are created, updated,
+    scanned and as catalog entries are excluded or restored, so this endpoint
+    does not aggregate over the catalog. Pass `verify=true` to compare the
+    stored counts against live aggregates; any mismatches are reported and
+    the counts rebuilt before responding.
+    """,
+)
+async def get_source_facets(
+    verify: bool = Query(
+        False, description="Compare precomputed counts against live aggregates"
+    ),
+    auth_context: AuthContext = Depends(get_auth_context),
+) -> SourceFacetsResponse:
+    """Return precomputed facet counts for the source listing.
+
+    Args:
+        verify: Check counts against live aggregates and repair on mismatch
+
+    Returns:
+        Facet counts per artifact type, tag and trust level
+
+    Raises:
+        HTTPException 500: If database operation fails
+    """
+    from skillmeat.cache.marketplace_facets import (
+        FACET_ARTIFACT_TYPE,
+        FACET_TAG,
+        FACET_TRUST_LEVEL,
+        facet_values,
+    )
+
+    try:
+        facets, mismatches = SourceManager().get_facet_counts(verify=verify)
+    except Exception as e:
+        logger.error(f"Failed to compute source facets: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to compute marketplace source facets",
+        ) from e
+
+    def _values(facet: str) -> List[SourceFacetValue]:
+        return [
+            SourceFacetValue(
+                value=value,
+                source_count=count.source_count,
+                artifact_count=count.artifact_count,
+            )
+            for value, count in (facet_values(facets, facet) or {}).items()
+        ]
+
+    return SourceFacetsResponse(
+        artifact_types=_values(FACET_ARTIFACT_TYPE),
+        tags=_values(FACET_TAG),
+        trust_levels=_values(FACET_TRUST_LEVEL),
+        verified=verify,
+        mismatches=mismatches,
+    )
+
+
 @router.get(
     "/{source_id}",
     response_model=SourceResponse,
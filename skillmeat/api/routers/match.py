@@ -6,7 +6,7 @@ the confidence scoring system with semantic + keyword matching.
 
 import logging
 from datetime import datetime, timezone
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
@@ -20,6 +20,8 @@ from skillmeat.api.schemas.match import (
     MatchResponse,
     ScoreBreakdown,
 )
+from skillmeat.cache.match_cache import MatchResultCache
+from skillmeat.cache.repository import CacheRepository
 from skillmeat.core.artifact import ArtifactMetadata
 from skillmeat.core.interfaces.dtos import ArtifactDTO
 from skillmeat.core.scoring.service import ScoringService
@@ -33,6 +35,24 @@ router = APIRouter(
     tags=["match"],
 )
 
+_match_cache: Optional[MatchResultCache] = None
+
+
+def _get_match_cache() -> Optional[MatchResultCache]:
+    """Return the process-wide match result cache (None if it cannot open).
+
+    A single instance is shared across requests so its in-process LRU serves
+    repeated queries without touching the cache DB.
+    """
+    global _match_cache
+    if _match_cache is None:
+        try:
+            _match_cache = MatchResultCache(CacheRepository())
+        except Exception as e:
+            logger.warning(f"Match result cache unavailable: {e}")
+            return None
+    return _match_cache
+
 
 @router.get(
     "/",
@@ -144,6 +164,7 @@ async def match_artifacts(
             scoring_service = ScoringService(
                 enable_semantic=True,  # Try semantic, fall back if unavailable
                 fallback_to_keyword=True,
+                result_cache=_get_match_cache(),
             )
 
             # Score artifacts
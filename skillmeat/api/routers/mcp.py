@@ -5,13 +5,14 @@ them to Claude Desktop.
 """
 
 import logging
-from typing import Optional
+from typing import Annotated, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from skillmeat.api.dependencies import (
     CollectionManagerDep,
     ConfigManagerDep,
+    get_app_state,
     require_local_edition,
     verify_api_key,
     get_auth_context,
@@ -32,6 +33,11 @@ from skillmeat.api.schemas.mcp import (
 )
 from skillmeat.core.mcp.deployment import MCPDeploymentManager
 from skillmeat.core.mcp.health import MCPHealthChecker, HealthStatus
+from skillmeat.core.mcp.log_monitor import (
+    DEFAULT_STATE_PATH,
+    MCPLogMonitor,
+    default_log_files,
+)
 from skillmeat.core.mcp.metadata import MCPServerMetadata, MCPServerStatus
 from skillmeat.api.schemas.auth import AuthContext
 
@@ -47,6 +53,35 @@ router = APIRouter(
 )
 
 
+# Seconds between background refreshes of the MCP log monitor.
+LOG_MONITOR_INTERVAL = 5.0
+
+
+def get_log_monitor(
+    state: Annotated[object, Depends(get_app_state)],
+) -> MCPLogMonitor:
+    """Get the process-wide MCP log monitor, starting it on first use.
+
+    The monitor tails Claude Desktop's MCP logs in a background thread, so
+    health requests read its in-memory aggregates instead of the log files.
+
+    Args:
+        state: Application state
+
+    Returns:
+        MCPLogMonitor instance
+    """
+    if not hasattr(state, "mcp_log_monitor") or state.mcp_log_monitor is None:
+        monitor = MCPLogMonitor(default_log_files, state_path=DEFAULT_STATE_PATH)
+        monitor.start(interval=LOG_MONITOR_INTERVAL)
+        state.mcp_log_monitor = monitor
+
+    return state.mcp_log_monitor
+
+
+LogMonitorDep = Annotated[MCPLogMonitor, Depends(get_log_monitor)]
+
+
 def metadata_to_response(server: MCPServerMetadata) -> MCPServerResponse:
     """Convert MCPServerMetadata to API response schema.
 
@@ -795,6 +830,7 @@ async def get_server_health(
     name: str,
     config_mgr: ConfigManagerDep,
     token: TokenDep,
+    log_monitor: LogMonitorDep,
     use_cache: bool = Query(
         default=True,
         description="Use cached results (30 second TTL)",
@@ -812,6 +848,7 @@ async def get_server_health(
         name: Server name
         config_mgr: Config manager dependency
         token: Authentication token
+        log_monitor: Shared MCP log monitor
         use_cache: Whether to use cached results
 
     Returns:
@@ -828,7 +865,9 @@ async def get_server_health(
 
         # Create health checker
         deployment_mgr = MCPDeploymentManager(github_token=github_token)
-        health_checker = MCPHealthChecker(deployment_manager=deployment_mgr)
+        health_checker = MCPHealthChecker(
+            deployment_manager=deployment_mgr, log_monitor=log_monitor
+        )
 
         # Check server health
         result = health_checker.check_server_health(name, use_cache=use_cache)
@@ -868,6 +907,7 @@ async def get_server_health(
 async def get_all_servers_health(
     config_mgr: ConfigManagerDep,
     token: TokenDep,
+    log_monitor: LogMonitorDep,
     use_cache: bool = Query(
         default=True,
         description="Use cached results (30 second TTL)",
@@ -882,6 +922,7 @@ async def get_all_servers_health(
     Args:
         config_mgr: Config manager dependency
         token: Authentication token
+        log_monitor: Shared MCP log monitor
         use_cache: Whether to use cached results
 
     Returns:
@@ -898,7 +939,9 @@ async def get_all_servers_health(
 
         # Create health checker
         deployment_mgr = MCPDeploymentManager(github_token=github_token)
-        health_checker = MCPHealthChecker(deployment_manager=deployment_mgr)
+        health_checker = MCPHealthChecker(
+            deployment_manager=deployment_mgr, log_monitor=log_monitor
+        )
 
         # Check all servers
         results = health_checker.check_all_servers(use_cache=use_cache)
@@ -0,0 +1,192 @@
+"""Sampling profiler admin endpoint router.
+
+Provides an opt-in, authenticated route that samples every thread of the
+running API process for a bounded number of seconds and returns the result
+as collapsed stacks or speedscope JSON.  Disabled unless
+``SKILLMEAT_PROFILER_ENABLED=true``; at most one run may be active per
+process, and runs are spaced by ``SKILLMEAT_PROFILER_COOLDOWN_SECONDS``.
+"""
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
+
+from skillmeat.api.dependencies import SettingsDep, require_auth
+from skillmeat.api.schemas.auth import AuthContext, Scope
+from skillmeat.observability.profiler import (
+    SamplingProfiler,
+    render_collapsed,
+    render_speedscope,
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/admin/profile",
+    tags=["admin"],
+)
+
+
+class _ProfilerGate:
+    """Allows one profiling run at a time, spaced by a cooldown."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._running = False
+        self._last_started: Optional[float] = None
+
+    def try_acquire(self, cooldown_seconds: float) -> Optional[int]:
+        """Claim the profiler.
+
+        Returns:
+            None when acquired, otherwise seconds until a retry may succeed
+            (0 when a run is already in progress).
+        """
+        with self._lock:
+            if self._running:
+                return 0
+            now = time.monotonic()
+            if self._last_started is not None:
+                remaining = self._last_started + cooldown_seconds - now
+                if remaining > 0:
+                    return max(1, math.ceil(remaining))
+            self._running = True
+            self._last_started = now
+            return None
+
+    def release(self) -> None:
+        """Mark the active run as finished."""
+        with self._lock:
+            self._running = False
+
+    def reset(self) -> None:
+        """Forget run history (used by tests)."""
+        with self._lock:
+            self._running = False
+            self._last_started = None
+
+
+_gate = _ProfilerGate()
+
+
+@router.post(
+    "",
+    status_code=status.HTTP_200_OK,
+    summary="Sample the running server",
+    description="""
+    Run a low-overhead sampling profiler across all threads of this API
+    process for `seconds` seconds and return the aggregated stacks.
+
+    Samples are tagged with the request and trace IDs of the request each
+    thread was serving. With multiple workers, only the worker process that
+    handles this request is profiled.
+
+    Requires the `admin:*` scope and `SKILLMEAT_PROFILER_ENABLED=true`.
+    Returns HTTP 409 while another run is active and HTTP 429 during the
+    cooldown between runs.
+    """,
+    responses={
+        200: {
+            "content": {
+                "text/plain": {},
+                "application/json": {},
+            },
+            "description": "Collapsed stacks (text) or speedscope profile (JSON)",
+        },
+        404: {"description": "Profiler disabled"},
+        409: {"description": "A profiling run is already in progress"},
+        429: {"description": "Profiler cooldown active"},
+    },
+)
+async def run_profile(
+    settings: SettingsDep,
+    auth_context: AuthContext = Depends(
+        require_auth(scopes=[Scope.admin_wildcard.value])
+    ),
+    seconds: float = Query(
+        default=5.0, gt=0, description="Sampling duration in seconds"
+    ),
+    interval_ms: float = Query(
+        default=5.0, ge=1.0, le=100.0, description="Sampling interval in milliseconds"
+    ),
+    output_format: Literal["collapsed", "speedscope"] = Query(
+        default="collapsed", alias="format", description="Output format"
+    ),
+    include_idle: bool = Query(
+        default=False, description="Include threads blocked in idle waits"
+    ),
+) -> Response:
+    """Run the sampling profiler and return the result.
+
+    Args:
+        settings: API settings dependency
+        auth_context: Authenticated admin context
+        seconds: Sampling duration in seconds
+        interval_ms: Sampling interval in milliseconds
+        output_format: ``collapsed`` or ``speedscope``
+        include_idle: Include idle thread stacks
+
+    Returns:
+        Plain-text collapsed stacks or speedscope JSON
+
+    Raises:
+        HTTPException: 404 if disabled, 400 if ``seconds`` exceeds the
+            configured maximum, 409/429 when rate limited
+    """
+    if not settings.profiler_enabled:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profiler is disabled. Set SKILLMEAT_PROFILER_ENABLED=true to enable.",
+        )
+    if seconds > settings.profiler_max_seconds:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"seconds must be <= {settings.profiler_max_seconds}",
+        )
+
+    retry_after = _gate.try_acquire(settings.profiler_cooldown_seconds)
+    if retry_after == 0:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A profiling run is already in progress",
+        )
+    if retry_after is not None:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Profiler cooldown active",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+    logger.info(
+        "Starting sampling profiler",
+        extra={
+            "user_id": str(auth_context.user_id),
+            "seconds": seconds,
+            "interval_ms": interval_ms,
+            "format": output_format,
+        },
+    )
+    try:
+        profiler = SamplingProfiler(
+            interval=interval_ms / 1000.0, include_idle=include_idle
+        )
+        profile = await asyncio.to_thread(profiler.run, seconds)
+    finally:
+        _gate.release()
+
+    headers = {
+        "X-Profile-Samples": str(profile.sample_count),
+        "X-Profile-Duration": f"{profile.duration:.3f}",
+    }
+    if output_format == "speedscope":
+        return JSONResponse(
+            content=render_speedscope(profile, name="skillmeat-api"),
+            headers=headers,
+        )
+    return PlainTextResponse(content=render_collapsed(profile), headers=headers)
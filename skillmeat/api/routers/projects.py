@@ -447,7 +447,9 @@ async def list_projects(
         # Try to get from persistent cache first (unless force_refresh or cache unavailable)
         if not force_refresh and cache_manager is not None:
             try:
-                cached_projects = cache_manager.get_projects(include_stale=False)
+                cached_projects = cache_manager.get_projects(
+                    include_stale=False, with_artifacts=False
+                )
 
                 if cached_projects:
                     # We have cached data - use it
@@ -460,7 +462,7 @@ async def list_projects(
                     for cached_project in cached_projects:
                         try:
                             # Check if this project is stale
-                            is_stale = cache_manager.is_cache_stale(cached_project.id)
+                            is_stale = cache_manager.is_project_stale(cached_project)
                             cache_last_fetched = cached_project.last_fetched
 
                             # Read deployment metadata from disk to keep counts/dates accurate
@@ -8,7 +8,7 @@ import base64
 import json
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from fastapi import APIRouter, Depends, Body, HTTPException, Query, status
 
@@ -25,7 +25,7 @@ from skillmeat.api.dependencies import (
     get_auth_context,
     require_auth,
 )
-from skillmeat.core.interfaces.dtos import UserCollectionDTO
+from skillmeat.core.interfaces.dtos import CollectionArtifactDTO, UserCollectionDTO
 from skillmeat.core.interfaces.repositories import (
     IDbCollectionArtifactRepository,
     IDbUserCollectionRepository,
@@ -53,12 +53,14 @@ from skillmeat.api.schemas.user_collections import (
     UserCollectionUpdateRequest,
     UserCollectionWithGroupsResponse,
 )
-from skillmeat.api.services import get_artifact_metadata
+from skillmeat.api.services import get_artifact_metadata_batch
 from skillmeat.api.services.artifact_cache_service import (
     invalidate_collection_artifacts,
     parse_deployments,
 )
-from skillmeat.api.services.artifact_metadata_service import _get_artifact_collections
+from skillmeat.api.services.artifact_metadata_service import (
+    _get_artifact_collections_batch,
+)
 from skillmeat.cache import get_collection_count_cache
 from skillmeat.core.artifact import ArtifactType as CoreArtifactType
 from skillmeat.core.refresher import CollectionRefresher, RefreshMode, validate_fields
@@ -134,6 +136,7 @@ def decode_cursor(cursor: str) -> str:
 def collection_to_response(
     collection_dto: UserCollectionDTO,
     collection_repo: IDbUserCollectionRepository,
+    counts: Optional[Tuple[int, int]] = None,
 ) -> UserCollectionResponse:
     """Convert a UserCollectionDTO to an API response model.
 
@@ -143,6 +146,8 @@ def collection_to_response(
     Args:
         collection_dto: DTO representation of the collection.
         collection_repo: Repository used to query live group and artifact counts.
+        counts: ``(group_count, artifact_count)`` already fetched in bulk via
+            ``get_group_and_artifact_counts``; skips the per-collection queries.
 
     Returns:
         UserCollectionResponse Pydantic model ready for serialisation.
@@ -152,8 +157,11 @@ def collection_to_response(
         accepted ORM models and a raw SQLAlchemy session.  All CRUD endpoints
         were updated to the repository-based call pattern in TASK-4.1/TASK-4.2.
     """
-    group_count = len(collection_repo.get_groups(collection_dto.id))
-    artifact_count = collection_repo.get_artifact_count(collection_dto.id)
+    if counts is not None:
+        group_count, artifact_count = counts
+    else:
+        group_count = len(collection_repo.get_groups(collection_dto.id))
+        artifact_count = collection_repo.get_artifact_count(collection_dto.id)
 
     def _parse_dt(value: Optional[str]) -> datetime:
         """Parse ISO-8601 string to datetime; fall back to utcnow on failure."""
@@ -1341,9 +1349,13 @@ async def list_user_collections(
         end_idx = start_idx + limit
         page_dtos = all_dtos[start_idx:end_idx]
 
-        # Convert to response format
+        # Convert to response format, with counts for the whole page in one go
+        counts = collection_repo.get_group_and_artifact_counts(
+            [dto.id for dto in page_dtos]
+        )
         items: List[UserCollectionResponse] = [
-            collection_to_response(dto, collection_repo) for dto in page_dtos
+            collection_to_response(dto, collection_repo, counts.get(dto.id))
+            for dto in page_dtos
         ]
 
         # Build pagination info
@@ -1814,16 +1826,23 @@ async def list_collection_artifacts(
         }
 
         # Acquire a session for legacy helpers that still require one
-        # (_get_artifact_collections, get_artifact_metadata).  These have not
-        # yet been migrated to repository DI; a single shared session per
+        # (_get_artifact_collections_batch, get_artifact_metadata_batch).  These
+        # have not yet been migrated to repository DI; a single shared session per
         # request is safe here because the helpers are read-only.
         from skillmeat.cache.models import get_session as _get_session_for_lookup
 
         _lookup_session = _get_session_for_lookup()
 
+        # Batch fetch collection memberships for the page (avoids N+1 queries).
+        collections_map = _get_artifact_collections_batch(
+            _lookup_session, list(uuid_to_artifact_id.values())
+        )
+
         # Fetch artifact metadata for each association
         # Priority: 1. DB cache (if synced_at is set), 2. File system, 3. Marketplace
-        items: List[ArtifactSummary] = []
+        page_summaries: List[
+            Tuple[CollectionArtifactDTO, str, Optional[ArtifactSummary]]
+        ] = []
         for assoc in page_associations:
             # Resolve artifact_id (format: "type:name") from pre-built lookup
             resolved_artifact_id = uuid_to_artifact_id.get(assoc.artifact_uuid, "")
@@ -1880,9 +1899,7 @@ async def list_collection_artifacts(
                     tools=assoc.tools or None,
                     origin=assoc.origin,
                     origin_source=assoc.origin_source,
-                    collections=_get_artifact_collections(
-                        _lookup_session, resolved_artifact_id
-                    ),
+                    collections=collections_map.get(resolved_artifact_id, []),
                     deployments=parse_deployments(
                         json.dumps(assoc.deployments) if assoc.deployments else None
                     ),
@@ -1942,8 +1959,8 @@ async def list_collection_artifacts(
                             ),
                             origin=getattr(file_artifact, "origin", None),
                             origin_source=getattr(file_artifact, "origin_source", None),
-                            collections=_get_artifact_collections(
-                                _lookup_session, resolved_artifact_id
+                            collections=collections_map.get(
+                                resolved_artifact_id, []
                             ),
                             deployments=parse_deployments(
                                 json.dumps(assoc.deployments)
@@ -1958,11 +1975,21 @@ async def list_collection_artifacts(
                         f"File-based lookup failed for {resolved_artifact_id}: {e}"
                     )
 
-            # 3. Last resort: Fallback to marketplace/database service
+            page_summaries.append((assoc, resolved_artifact_id, artifact_summary))
+
+        # 3. Last resort: Fallback to marketplace/database service, batched
+        # for every artifact the cache and filesystem could not resolve.
+        fallback_ids = [
+            artifact_id
+            for _, artifact_id, artifact_summary in page_summaries
+            if artifact_summary is None
+        ]
+        fallback_summaries = get_artifact_metadata_batch(_lookup_session, fallback_ids)
+
+        items: List[ArtifactSummary] = []
+        for assoc, resolved_artifact_id, artifact_summary in page_summaries:
             if artifact_summary is None:
-                artifact_summary = get_artifact_metadata(
-                    _lookup_session, resolved_artifact_id
-                )
+                artifact_summary = fallback_summaries[resolved_artifact_id]
                 logger.debug(f"Marketplace fallback for {resolved_artifact_id}")
 
             # Add deployments from cache to all artifact summaries.
@@ -2577,11 +2604,13 @@ async def list_collection_entities(
 
         # Fetch artifact metadata for each association using fallback service
         # This ensures consistent metadata including description, tags, and collections
-        items: List[ArtifactSummary] = []
-        for assoc in page_associations:
-            ent_artifact_id = ent_uuid_to_id.get(assoc.artifact_uuid, "")
-            artifact_summary = get_artifact_metadata(session, ent_artifact_id)
-            items.append(artifact_summary)
+        page_entity_ids = [
+            ent_uuid_to_id.get(assoc.artifact_uuid, "") for assoc in page_associations
+        ]
+        summaries = get_artifact_metadata_batch(session, page_entity_ids)
+        items: List[ArtifactSummary] = [
+            summaries[ent_artifact_id] for ent_artifact_id in page_entity_ids
+        ]
 
         # Build pagination info
         has_next = end_idx < len(all_associations)
@@ -11,7 +11,7 @@ packs are token-budget-aware compilations of memory items into structured
 markdown suitable for agent prompt injection.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -128,11 +128,15 @@ class ContextPackPreviewRequest(BaseModel):
         budget_tokens: Maximum token budget for the pack (100-100000).
         filters: Optional additional filters dict. Supported keys:
             type (str), min_confidence (float).
+        selection_mode: Budget selection strategy. ``greedy`` takes items in
+            confidence/recency order; ``knapsack`` maximizes total confidence
+            within the budget.
     """
 
     module_id: Optional[str] = None
     budget_tokens: int = Field(default=4000, ge=100, le=100000)
     filters: Optional[Dict[str, Any]] = None
+    selection_mode: Literal["greedy", "knapsack"] = "greedy"
 
 
 class ContextPackPreviewResponse(BaseModel):
@@ -164,11 +168,15 @@ class ContextPackGenerateRequest(BaseModel):
         budget_tokens: Maximum token budget for the pack (100-100000).
         filters: Optional additional filters dict. Supported keys:
             type (str), min_confidence (float).
+        selection_mode: Budget selection strategy. ``greedy`` takes items in
+            confidence/recency order; ``knapsack`` maximizes total confidence
+            within the budget.
     """
 
     module_id: Optional[str] = None
     budget_tokens: int = Field(default=4000, ge=100, le=100000)
     filters: Optional[Dict[str, Any]] = None
+    selection_mode: Literal["greedy", "knapsack"] = "greedy"
 
 
 class ContextPackGenerateResponse(BaseModel):
@@ -242,3 +242,88 @@ class DriftSummaryResponse(BaseModel):
                 "checked_at": "2025-12-17T15:30:00Z",
             }
         }
+
+
+# ====================
+# Fleet Drift Scans
+# ====================
+
+FleetDriftType = Literal["synced", "modified", "outdated", "conflict", "removed"]
+
+
+class FleetDriftScanRequest(BaseModel):
+    """Request to start a fleet-wide drift scan."""
+
+    collection_name: Optional[str] = Field(
+        default=None,
+        description=(
+            "Collection to compare every project against. When omitted, each "
+            "project uses the collection its first deployment came from."
+        ),
+        examples=["default"],
+    )
+
+
+class FleetDriftScanResponse(BaseModel):
+    """Status and progress of a fleet-wide drift scan."""
+
+    id: str = Field(description="Scan identifier", examples=["3f2a9c1e"])
+    collection_name: Optional[str] = Field(
+        default=None,
+        description="Collection compared against (None = per-deployment)",
+    )
+    status: Literal["pending", "running", "completed", "cancelled", "failed"] = Field(
+        description="Scan status", examples=["running"]
+    )
+    total_projects: int = Field(description="Projects considered by the scan")
+    scanned_projects: int = Field(description="Projects with stored results")
+    failed_projects: int = Field(description="Projects that failed in the last run")
+    drifted_artifacts: int = Field(description="Stored entries with drift")
+    created_at: Optional[datetime] = Field(default=None)
+    started_at: Optional[datetime] = Field(default=None)
+    finished_at: Optional[datetime] = Field(default=None)
+    error_message: Optional[str] = Field(default=None)
+
+
+class FleetDriftScanListResponse(BaseModel):
+    """Most recent fleet drift scans, newest first."""
+
+    items: List[FleetDriftScanResponse] = Field(default_factory=list)
+
+
+class DriftMatrixEntryResponse(BaseModel):
+    """Drift state of one deployed artifact in one project.
+
+    The matrix covers deployed artifacts only: collection artifacts a project
+    has not deployed ('added' in single-project drift checks) are not stored.
+    """
+
+    project_id: str = Field(description="Cache project identifier")
+    project_path: str = Field(description="Project path at scan time")
+    artifact_name: str = Field(description="Artifact name", examples=["pdf"])
+    artifact_type: str = Field(description="Artifact type", examples=["skill"])
+    profile_id: str = Field(description="Deployment profile", examples=["claude_code"])
+    drift_type: FleetDriftType = Field(description="Drift type", examples=["outdated"])
+    recommendation: Optional[str] = Field(
+        default=None,
+        description="Recommended sync action (None when synced)",
+        examples=["pull_from_collection"],
+    )
+    deployed_sha: Optional[str] = Field(default=None, description="Deployed hash")
+    collection_sha: Optional[str] = Field(
+        default=None, description="Current collection hash (None if removed)"
+    )
+    project_sha: Optional[str] = Field(
+        default=None,
+        description="Current project hash, when known without re-hashing",
+    )
+    scanned_at: Optional[datetime] = Field(default=None)
+
+
+class DriftMatrixPageResponse(BaseModel):
+    """One page of a scan's drift matrix."""
+
+    items: List[DriftMatrixEntryResponse] = Field(default_factory=list)
+    total: int = Field(description="Entries matching the filters")
+    offset: int = Field(description="Entries skipped")
+    limit: int = Field(description="Maximum entries per page")
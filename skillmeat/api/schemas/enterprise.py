@@ -1,9 +1,10 @@
 """Pydantic schemas for enterprise API endpoints.
 
-Defines request and response models for enterprise artifact download operations.
+Defines request and response models for enterprise artifact download and sync
+operations.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -95,3 +96,62 @@ class ArtifactDownloadResponse(BaseModel):
     files: List[ArtifactFileEntry] = Field(
         description="Ordered list of files comprising the artifact bundle"
     )
+
+
+class ArtifactHashResponse(BaseModel):
+    """Response for ``GET /api/v1/artifacts/{artifact_id}/hash``.
+
+    Attributes
+    ----------
+    artifact_id:
+        UUID string identifying the artifact in the enterprise DB.
+    version:
+        Resolved version tag, or ``"unknown"`` when no versions exist.
+    content_hash:
+        SHA-256 hex digest of the artifact at the resolved version.
+    """
+
+    artifact_id: str = Field(description="UUID identifying the artifact")
+    version: Optional[str] = Field(default=None, description="Resolved version tag")
+    content_hash: str = Field(
+        description="SHA-256 hex digest of the artifact at the resolved version"
+    )
+
+
+class ArtifactDeltaItem(BaseModel):
+    """Client state for one artifact in a delta sync request.
+
+    Attributes
+    ----------
+    artifact_id:
+        UUID string or artifact name.
+    content_hash:
+        Content hash the client last synced, or empty when never synced.
+    files:
+        Mapping of relative POSIX path to SHA-256 hex digest for the files the
+        client currently holds.
+    """
+
+    artifact_id: str = Field(description="Artifact UUID or name")
+    content_hash: str = Field(
+        default="", description="Content hash recorded by the client's last sync"
+    )
+    files: Dict[str, str] = Field(
+        default_factory=dict,
+        description="Client file manifest: relative path -> SHA-256 hex digest",
+    )
+
+
+class ArtifactDeltaRequest(BaseModel):
+    """Request body for ``POST /api/v1/artifacts/delta``.
+
+    Attributes
+    ----------
+    artifacts:
+        Artifacts to sync in one round trip, in the order their entries
+        appear in the response archive.
+    """
+
+    artifacts: List[ArtifactDeltaItem] = Field(
+        min_length=1, description="Artifacts to sync"
+    )
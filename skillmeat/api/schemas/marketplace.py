@@ -1283,6 +1283,58 @@ class SourceListResponse(BaseModel):
         }
 
 
+class SourceFacetValue(BaseModel):
+    """Number of sources and catalog artifacts behind one facet value."""
+
+    value: str = Field(description="Facet value (lower-cased)", examples=["skill"])
+    source_count: int = Field(description="Sources carrying this value", ge=0)
+    artifact_count: int = Field(
+        description="Non-excluded catalog entries in those sources", ge=0
+    )
+
+
+class SourceFacetsResponse(BaseModel):
+    """Precomputed facet counts for the marketplace source listing.
+
+    Values are sorted by descending ``source_count``.
+    """
+
+    artifact_types: List[SourceFacetValue] = Field(
+        description="Counts per catalog artifact type",
+    )
+    tags: List[SourceFacetValue] = Field(description="Counts per source tag")
+    trust_levels: List[SourceFacetValue] = Field(
+        description="Counts per source trust level",
+    )
+    verified: bool = Field(
+        description="Whether counts were checked against live aggregates",
+    )
+    mismatches: List[str] = Field(
+        default_factory=list,
+        description=(
+            "Facet values whose precomputed counts differed from live "
+            "aggregates (repaired before responding); only set when verified"
+        ),
+    )
+
+    class Config:
+        """Pydantic model configuration."""
+
+        json_schema_extra = {
+            "example": {
+                "artifact_types": [
+                    {"value": "skill", "source_count": 12, "artifact_count": 148}
+                ],
+                "tags": [{"value": "python", "source_count": 4, "artifact_count": 37}],
+                "trust_levels": [
+                    {"value": "basic", "source_count": 10, "artifact_count": 120}
+                ],
+                "verified": False,
+                "mismatches": [],
+            }
+        }
+
+
 # ============================================================================
 # Catalog Entry DTOs
 # ============================================================================
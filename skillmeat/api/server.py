@@ -46,6 +46,7 @@ from .routers import (
     deployment_profiles,
     deployment_sets,
     deployments,
+    drift_scans,
     groups,
     health,
     icon_packs,
@@ -57,6 +58,7 @@ from .routers import (
     mcp,
     memory_items,
     merge,
+    profiling,
     project_templates,
     projects,
     ratings,
@@ -354,7 +356,10 @@ def create_app(settings: APISettings = None) -> FastAPI:
     )
 
     # Add observability middleware (should be added early to track all requests)
-    app.add_middleware(ObservabilityMiddleware)
+    app.add_middleware(
+        ObservabilityMiddleware,
+        expose_query_headers=settings.is_development or settings.db_query_headers,
+    )
     logger.info("Observability middleware enabled")
 
     app.add_middleware(
@@ -503,6 +508,10 @@ def create_app(settings: APISettings = None) -> FastAPI:
     # Health check router (no API prefix, for load balancers) — public
     app.include_router(health.router)
 
+    # Sampling profiler (opt-in via SKILLMEAT_PROFILER_ENABLED) — admin only,
+    # mounted unprefixed next to health
+    app.include_router(profiling.router, dependencies=_auth_deps)
+
     # API routers under API prefix
     app.include_router(
         user_collections.router,
@@ -602,6 +611,12 @@ def create_app(settings: APISettings = None) -> FastAPI:
         tags=["deployments"],
         dependencies=_auth_deps,
     )
+    app.include_router(
+        drift_scans.router,
+        prefix=settings.api_prefix,
+        tags=["drift"],
+        dependencies=_auth_deps,
+    )
     app.include_router(
         groups.router,
         prefix=settings.api_prefix,
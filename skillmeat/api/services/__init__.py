@@ -10,7 +10,10 @@ from skillmeat.api.services.artifact_cache_service import (
     log_cache_metrics,
     refresh_single_artifact_cache,
 )
-from skillmeat.api.services.artifact_metadata_service import get_artifact_metadata
+from skillmeat.api.services.artifact_metadata_service import (
+    get_artifact_metadata,
+    get_artifact_metadata_batch,
+)
 from skillmeat.api.services.collection_service import CollectionService
 
 __all__ = [
@@ -19,6 +22,7 @@ __all__ = [
     "delete_artifact_cache",
     "find_stale_artifacts",
     "get_artifact_metadata",
+    "get_artifact_metadata_batch",
     "get_staleness_stats",
     "invalidate_artifact_cache",
     "invalidate_collection_artifacts",
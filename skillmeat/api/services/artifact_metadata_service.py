@@ -10,13 +10,16 @@ The service also retrieves associated metadata (description, author, tags)
 and collection memberships to support consistent frontend Entity rendering.
 """
 
+import json
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from skillmeat.api.schemas.artifacts import ArtifactCollectionInfo
 from skillmeat.api.schemas.user_collections import ArtifactSummary
+from skillmeat.cache.loading import ARTIFACT_LOOKUP, load_profile
 from skillmeat.cache.models import (
     Artifact,
     Collection,
@@ -149,6 +152,62 @@ def _get_artifact_collections(
     return collections
 
 
+def _get_artifact_collections_batch(
+    session: Session, artifact_ids: List[str]
+) -> Dict[str, List[ArtifactCollectionInfo]]:
+    """Get collection memberships for several artifacts at once.
+
+    Batch form of :func:`_get_artifact_collections` for list endpoints: one
+    query resolves the memberships and one grouped query counts each
+    collection's artifacts, however many artifacts are requested.
+
+    Args:
+        session: Database session
+        artifact_ids: Artifact identifiers to look up
+
+    Returns:
+        Dict mapping each requested artifact_id to its collections (empty
+        list when the artifact belongs to none)
+    """
+    result: Dict[str, List[ArtifactCollectionInfo]] = {
+        artifact_id: [] for artifact_id in artifact_ids
+    }
+    if not artifact_ids:
+        return result
+
+    memberships = (
+        session.query(Artifact.id, Collection.id, Collection.name)
+        .join(CollectionArtifact, Artifact.uuid == CollectionArtifact.artifact_uuid)
+        .join(Collection, CollectionArtifact.collection_id == Collection.id)
+        .filter(Artifact.id.in_(artifact_ids))
+        .all()
+    )
+    if not memberships:
+        return result
+
+    collection_ids = {collection_id for _, collection_id, _ in memberships}
+    counts = dict(
+        session.query(
+            CollectionArtifact.collection_id,
+            func.count(CollectionArtifact.artifact_uuid),
+        )
+        .filter(CollectionArtifact.collection_id.in_(collection_ids))
+        .group_by(CollectionArtifact.collection_id)
+        .all()
+    )
+
+    for artifact_id, collection_id, collection_name in memberships:
+        result[artifact_id].append(
+            ArtifactCollectionInfo(
+                id=collection_id,
+                name=collection_name,
+                artifact_count=counts.get(collection_id, 0),
+            )
+        )
+
+    return result
+
+
 def _extract_artifact_tags(artifact: Artifact) -> Optional[List[str]]:
     """Extract tags from an artifact.
 
@@ -186,6 +245,131 @@ def _extract_artifact_description(artifact: Artifact) -> Optional[str]:
     return None
 
 
+def _summary_from_artifact(
+    artifact_id: str,
+    artifact: Artifact,
+    collections: List[ArtifactCollectionInfo],
+) -> ArtifactSummary:
+    """Build an ArtifactSummary from a cached Artifact row.
+
+    Args:
+        artifact_id: Artifact identifier in 'type:name' format
+        artifact: Artifact ORM instance with metadata and tags loaded
+        collections: Collection memberships for the artifact
+
+    Returns:
+        ArtifactSummary populated from the cache table
+    """
+    # Extract description from artifact or its metadata
+    description = _extract_artifact_description(artifact)
+
+    # Extract tags from relationship
+    tags = _extract_artifact_tags(artifact)
+
+    # Extract author and tools from metadata if available
+    author = None
+    tools = None
+    if artifact.artifact_metadata:
+        # Check if metadata_json contains author and tools fields
+        if artifact.artifact_metadata.metadata_json:
+            try:
+                metadata_dict = json.loads(artifact.artifact_metadata.metadata_json)
+                author = metadata_dict.get("author")
+                tools = metadata_dict.get("tools")
+            except (json.JSONDecodeError, TypeError):
+                pass
+
+    return ArtifactSummary(
+        id=artifact_id,
+        name=artifact.name,
+        type=artifact.type,
+        version=artifact.deployed_version or artifact.upstream_version,
+        source=artifact.source or artifact_id,
+        description=description,
+        author=author,
+        tags=tags,
+        tools=tools,
+        collections=collections if collections else None,
+    )
+
+
+def _summary_from_catalog_entry(
+    artifact_id: str,
+    entry: MarketplaceCatalogEntry,
+    collections: List[ArtifactCollectionInfo],
+) -> ArtifactSummary:
+    """Build an ArtifactSummary from a marketplace catalog entry.
+
+    Args:
+        artifact_id: Artifact identifier the entry was found for
+        entry: MarketplaceCatalogEntry ORM instance
+        collections: Collection memberships for the artifact
+
+    Returns:
+        ArtifactSummary populated from the catalog entry
+    """
+    # Marketplace entries may have description in detected_metadata, which
+    # the catalog model does not always define.
+    description = None
+    tags = None
+    author = None
+    tools = None
+    detected_metadata = getattr(entry, "detected_metadata", None)
+    if detected_metadata:
+        try:
+            metadata_dict = (
+                json.loads(detected_metadata)
+                if isinstance(detected_metadata, str)
+                else detected_metadata
+            )
+            description = metadata_dict.get("description")
+            author = metadata_dict.get("author")
+            tags = metadata_dict.get("tags")
+            tools = metadata_dict.get("tools")
+        except (json.JSONDecodeError, TypeError):
+            pass
+
+    return ArtifactSummary(
+        id=artifact_id,
+        name=entry.name,
+        type=entry.artifact_type,
+        version=entry.detected_version,
+        source=entry.upstream_url,
+        description=description,
+        author=author,
+        tags=tags,
+        tools=tools,
+        collections=collections if collections else None,
+    )
+
+
+def _fallback_summary(
+    artifact_id: str, collections: List[ArtifactCollectionInfo]
+) -> ArtifactSummary:
+    """Build a minimal ArtifactSummary from the artifact_id alone.
+
+    Args:
+        artifact_id: Artifact identifier in 'type:name' format
+        collections: Collection memberships for the artifact
+
+    Returns:
+        ArtifactSummary with name and type parsed from the identifier
+    """
+    parsed_type, parsed_name = _parse_artifact_id(artifact_id)
+    return ArtifactSummary(
+        id=artifact_id,
+        name=parsed_name,
+        type=parsed_type,
+        version=None,
+        source=artifact_id,
+        description=None,
+        author=None,
+        tags=None,
+        tools=None,
+        collections=collections if collections else None,
+    )
+
+
 def get_artifact_metadata(session: Session, artifact_id: str) -> ArtifactSummary:
     """Get artifact metadata with fallback sequence.
 
@@ -217,92 +401,100 @@ def get_artifact_metadata(session: Session, artifact_id: str) -> ArtifactSummary
     artifact = _lookup_in_cache(session, artifact_id)
     if artifact:
         logger.debug(f"Cache hit for artifact_id={artifact_id}")
-
-        # Extract description from artifact or its metadata
-        description = _extract_artifact_description(artifact)
-
-        # Extract tags from relationship
-        tags = _extract_artifact_tags(artifact)
-
-        # Extract author and tools from metadata if available
-        author = None
-        tools = None
-        if artifact.artifact_metadata:
-            # Check if metadata_json contains author and tools fields
-            if artifact.artifact_metadata.metadata_json:
-                import json
-
-                try:
-                    metadata_dict = json.loads(artifact.artifact_metadata.metadata_json)
-                    author = metadata_dict.get("author")
-                    tools = metadata_dict.get("tools")
-                except (json.JSONDecodeError, TypeError):
-                    pass
-
-        return ArtifactSummary(
-            id=artifact_id,
-            name=artifact.name,
-            type=artifact.type,
-            version=artifact.deployed_version or artifact.upstream_version,
-            source=artifact.source or artifact_id,
-            description=description,
-            author=author,
-            tags=tags,
-            tools=tools,
-            collections=collections if collections else None,
-        )
+        return _summary_from_artifact(artifact_id, artifact, collections)
 
     # Step 2: Try marketplace catalog
     entry = _lookup_in_marketplace(session, artifact_id)
     if entry:
         logger.debug(f"Marketplace hit for artifact_id={artifact_id}")
+        return _summary_from_catalog_entry(artifact_id, entry, collections)
 
-        # Marketplace entries may have description in detected_metadata
-        description = None
-        tags = None
-        author = None
-        tools = None
-        if entry.detected_metadata:
-            import json
+    # Step 3: Fallback to minimal metadata
+    logger.debug(f"Fallback metadata for artifact_id={artifact_id}")
+    return _fallback_summary(artifact_id, collections)
 
-            try:
-                metadata_dict = (
-                    json.loads(entry.detected_metadata)
-                    if isinstance(entry.detected_metadata, str)
-                    else entry.detected_metadata
-                )
-                description = metadata_dict.get("description")
-                author = metadata_dict.get("author")
-                tags = metadata_dict.get("tags")
-                tools = metadata_dict.get("tools")
-            except (json.JSONDecodeError, TypeError):
-                pass
 
-        return ArtifactSummary(
-            id=artifact_id,
-            name=entry.name,
-            type=entry.artifact_type,
-            version=entry.detected_version,
-            source=entry.upstream_url,
-            description=description,
-            author=author,
-            tags=tags,
-            tools=tools,
-            collections=collections if collections else None,
+def get_artifact_metadata_batch(
+    session: Session, artifact_ids: List[str]
+) -> Dict[str, ArtifactSummary]:
+    """Get artifact metadata for several artifacts at once.
+
+    Batch form of :func:`get_artifact_metadata` for list endpoints.  The
+    collection memberships and the cache-table lookup each take a fixed
+    number of queries however many artifacts are requested; only artifacts
+    missing from the cache table fall through to a per-artifact marketplace
+    lookup.
+
+    Args:
+        session: Database session
+        artifact_ids: Artifact identifiers to look up
+
+    Returns:
+        Dict mapping each requested artifact_id to its ArtifactSummary
+    """
+    if not artifact_ids:
+        return {}
+
+    collections_map = _get_artifact_collections_batch(session, artifact_ids)
+
+    # Step 1: Cache table, keyed like _lookup_in_cache (type and name, or the
+    # raw ID for identifiers without a type prefix).
+    parsed = {
+        artifact_id: _parse_artifact_id(artifact_id) for artifact_id in artifact_ids
+    }
+    names = {
+        name for artifact_type, name in parsed.values() if artifact_type != "unknown"
+    }
+    raw_ids = [
+        artifact_id
+        for artifact_id, (artifact_type, _) in parsed.items()
+        if artifact_type == "unknown"
+    ]
+
+    cached: Dict[tuple[str, str], Artifact] = {}
+    if names:
+        rows = (
+            session.query(Artifact)
+            .options(*load_profile(ARTIFACT_LOOKUP))
+            .filter(Artifact.name.in_(names))
+            .all()
+        )
+        for artifact in rows:
+            cached.setdefault((artifact.type, artifact.name), artifact)
+    by_id: Dict[str, Artifact] = {}
+    if raw_ids:
+        rows = (
+            session.query(Artifact)
+            .options(*load_profile(ARTIFACT_LOOKUP))
+            .filter(Artifact.id.in_(raw_ids))
+            .all()
         )
+        by_id = {artifact.id: artifact for artifact in rows}
+
+    summaries: Dict[str, ArtifactSummary] = {}
+    for artifact_id in artifact_ids:
+        collections = collections_map.get(artifact_id, [])
+        artifact_type, artifact_name = parsed[artifact_id]
+        artifact = (
+            by_id.get(artifact_id)
+            if artifact_type == "unknown"
+            else cached.get((artifact_type, artifact_name))
+        )
+        if artifact:
+            summaries[artifact_id] = _summary_from_artifact(
+                artifact_id, artifact, collections
+            )
+            continue
 
-    # Step 3: Fallback to minimal metadata
-    logger.debug(f"Fallback metadata for artifact_id={artifact_id}")
-    parsed_type, parsed_name = _parse_artifact_id(artifact_id)
-    return ArtifactSummary(
-        id=artifact_id,
-        name=parsed_name,
-        type=parsed_type,
-        version=None,
-        source=artifact_id,
-        description=None,
-        author=None,
-        tags=None,
-        tools=None,
-        collections=collections if collections else None,
-    )
+        # Step 2: Marketplace catalog (substring match, looked up per artifact)
+        entry = _lookup_in_marketplace(session, artifact_id)
+        if entry:
+            summaries[artifact_id] = _summary_from_catalog_entry(
+                artifact_id, entry, collections
+            )
+            continue
+
+        # Step 3: Fallback to minimal metadata
+        summaries[artifact_id] = _fallback_summary(artifact_id, collections)
+
+    return summaries
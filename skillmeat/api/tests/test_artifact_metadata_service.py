@@ -668,3 +668,150 @@ def test_get_artifact_metadata_marketplace_with_metadata(mock_session):
     assert result.description == "Marketplace description"
     assert result.author == "Marketplace Author"
     assert result.tags == ["tag1", "tag2"]
+
+
+# =============================================================================
+# Tests: get_artifact_metadata_batch
+# =============================================================================
+
+
+@pytest.fixture
+def db_session(tmp_path):
+    """Session on a seeded cache database covering every lookup step."""
+    import json
+    import uuid
+
+    from sqlalchemy.orm import sessionmaker
+
+    from skillmeat.cache.models import (
+        ArtifactMetadata,
+        ArtifactTag,
+        MarketplaceSource,
+        Project,
+        Tag,
+        create_db_engine,
+        create_tables,
+    )
+
+    db_path = tmp_path / "cache.db"
+    create_tables(db_path)
+    engine = create_db_engine(db_path)
+    session = sessionmaker(bind=engine)()
+
+    session.add(Project(id="proj-1", name="proj", path="/tmp/proj", status="active"))
+    uuids = {name: uuid.uuid4().hex for name in ("alpha", "beta")}
+    for name, artifact_uuid in uuids.items():
+        session.add(
+            Artifact(
+                id=f"skill:{name}",
+                uuid=artifact_uuid,
+                project_id="proj-1",
+                name=name,
+                type="skill",
+                upstream_version="v1.0.0",
+            )
+        )
+    session.flush()
+    session.add(
+        ArtifactMetadata(
+            artifact_id="skill:alpha",
+            description="Alpha description",
+            metadata_json=json.dumps({"author": "Alpha Author", "tools": ["Read"]}),
+        )
+    )
+    session.add(Tag(id="tag-1", name="python", slug="python"))
+    session.flush()
+    session.add(ArtifactTag(artifact_uuid=uuids["alpha"], tag_id="tag-1"))
+    for collection_id in ("col-1", "col-2"):
+        session.add(Collection(id=collection_id, name=f"Collection {collection_id}"))
+    session.flush()
+    session.add(CollectionArtifact(collection_id="col-1", artifact_uuid=uuids["alpha"]))
+    session.add(CollectionArtifact(collection_id="col-2", artifact_uuid=uuids["alpha"]))
+    session.add(CollectionArtifact(collection_id="col-2", artifact_uuid=uuids["beta"]))
+    session.add(
+        MarketplaceSource(
+            id="src-1",
+            repo_url="https://github.com/user/repo",
+            owner="user",
+            repo_name="repo",
+        )
+    )
+    session.flush()
+    session.add(
+        MarketplaceCatalogEntry(
+            id="entry-1",
+            source_id="src-1",
+            artifact_type="skill",
+            name="gamma",
+            path="skills/gamma",
+            upstream_url="https://github.com/user/repo/skills/gamma",
+            detected_at=datetime.utcnow(),
+            confidence_score=90,
+            import_id="skill:gamma",
+        )
+    )
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def test_get_artifact_metadata_batch_matches_single_lookups(db_session):
+    """Batch results equal one get_artifact_metadata call per artifact."""
+    from skillmeat.api.services.artifact_metadata_service import (
+        get_artifact_metadata_batch,
+    )
+
+    artifact_ids = ["skill:alpha", "skill:beta", "skill:gamma", "skill:missing"]
+
+    batch = get_artifact_metadata_batch(db_session, artifact_ids)
+
+    assert list(batch) == artifact_ids
+    for artifact_id in artifact_ids:
+        expected = get_artifact_metadata(db_session, artifact_id)
+        actual = batch[artifact_id]
+        if expected.collections:
+            expected.collections.sort(key=lambda c: c.id)
+            actual.collections.sort(key=lambda c: c.id)
+        assert actual == expected, artifact_id
+    assert batch["skill:alpha"].author == "Alpha Author"
+    assert batch["skill:gamma"].name == "gamma"
+    assert batch["skill:missing"].source == "skill:missing"
+
+
+def test_get_artifact_metadata_batch_query_count_is_constant(db_session):
+    """Cached artifacts cost the same number of queries however many there are."""
+    from sqlalchemy import event
+
+    from skillmeat.api.services.artifact_metadata_service import (
+        get_artifact_metadata_batch,
+    )
+
+    statements = []
+
+    def _count(*args):
+        statements.append(args[2])
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        get_artifact_metadata_batch(db_session, ["skill:alpha"])
+        one = len(statements)
+        statements.clear()
+        get_artifact_metadata_batch(db_session, ["skill:alpha", "skill:beta"])
+        two = len(statements)
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert two == one
+
+
+def test_get_artifact_metadata_batch_empty(mock_session):
+    from skillmeat.api.services.artifact_metadata_service import (
+        get_artifact_metadata_batch,
+    )
+
+    assert get_artifact_metadata_batch(mock_session, []) == {}
+    mock_session.query.assert_not_called()
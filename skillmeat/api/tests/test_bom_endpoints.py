@@ -598,6 +598,57 @@ class TestVerifyBom:
         assert response.json()["snapshot_id"] == 77
 
 
+class TestVerifyBomBatch:
+    """Tests for POST /api/v1/bom/verify/batch."""
+
+    _SIG_HEX = "a1b2c3d4" * 16
+
+    def test_200_reports_each_snapshot(self, user_client: TestClient) -> None:
+        """Signed snapshots are verified together; unsigned ones are invalid."""
+        snapshots = [
+            _make_snapshot(snap_id=1, signature=self._SIG_HEX),
+            _make_snapshot(snap_id=2, signature=None),
+            _make_snapshot(snap_id=3, signature=self._SIG_HEX),
+        ]
+        user_client._mock_db.query.return_value = _MockQuery(snapshots)
+
+        batch = SimpleNamespace(
+            results=[
+                SimpleNamespace(valid=True, error=None, key_id="k"),
+                SimpleNamespace(valid=False, error="bad signature", key_id="k"),
+            ],
+            elapsed_ms=1.5,
+        )
+        with patch(
+            "skillmeat.core.bom.signing.verify_signatures", return_value=batch
+        ) as verify:
+            response = user_client.post("/api/v1/bom/verify/batch", json={})
+
+        assert response.status_code == 200
+        assert len(verify.call_args.args[0]) == 2
+        data = response.json()
+        assert [r["snapshot_id"] for r in data["results"]] == [1, 2, 3]
+        assert [r["valid"] for r in data["results"]] == [True, False, False]
+        assert data["results"][1]["details"] == "Snapshot has no signature."
+        assert data["results"][2]["details"] == "bad signature"
+        assert data["valid_count"] == 1
+        assert data["invalid_count"] == 2
+
+    def test_unknown_snapshot_ids_are_reported(self, user_client: TestClient) -> None:
+        """Requested ids that do not exist come back as invalid entries."""
+        user_client._mock_db.query.return_value = _MockQuery([])
+
+        response = user_client.post(
+            "/api/v1/bom/verify/batch", json={"snapshot_ids": [41]}
+        )
+
+        assert response.status_code == 200
+        result = response.json()["results"][0]
+        assert result["snapshot_id"] == 41
+        assert result["valid"] is False
+        assert "not found" in result["details"]
+
+
 # =============================================================================
 # GET /api/v1/attestations
 # =============================================================================
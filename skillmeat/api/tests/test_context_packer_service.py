@@ -816,3 +816,163 @@ class TestGetCandidatesWithModule:
         calls = mock_memory_service.list_items.call_args_list
         for call in calls:
             assert call.kwargs.get("min_confidence") == 0.85
+
+
+# =============================================================================
+# Token Counting, Knapsack Selection & Memoization Tests
+# =============================================================================
+
+
+class TestTokenCounting:
+    """Tests for cached, tokenizer-backed token counting."""
+
+    def test_count_tokens_caches_by_content(self, service):
+        """A repeated content string should be tokenized only once."""
+        from skillmeat.core.services.tokenizers import Tokenizer, token_count_cache
+
+        class CountingTokenizer(Tokenizer):
+            calls = 0
+
+            @property
+            def name(self) -> str:
+                return "counting-test"
+
+            def count(self, text: str) -> int:
+                CountingTokenizer.calls += 1
+                return len(text.split())
+
+        token_count_cache.clear()
+        service.tokenizer = CountingTokenizer()
+
+        assert service.count_tokens("alpha beta gamma") == 3
+        assert service.count_tokens("alpha beta gamma") == 3
+        assert service.count_tokens("alpha beta") == 2
+        assert CountingTokenizer.calls == 2
+
+    def test_default_tokenizer_matches_estimate(self, service):
+        """The default heuristic tokenizer should agree with estimate_tokens."""
+        text = "x" * 123
+        assert service.count_tokens(text) == ContextPackerService.estimate_tokens(text)
+
+    def test_unknown_tokenizer_spec_raises(self):
+        """get_tokenizer should reject unknown tokenizer names."""
+        from skillmeat.core.services.tokenizers import get_tokenizer
+
+        with pytest.raises(ValueError, match="Unknown tokenizer"):
+            get_tokenizer("sentencepiece")
+
+
+class TestKnapsackSelection:
+    """Tests for selection_mode='knapsack'."""
+
+    def test_knapsack_skips_large_item_to_fit_more_value(
+        self, service, mock_memory_service
+    ):
+        """Knapsack should trade one large item for several that fit together."""
+        items = [
+            _make_memory_item(id="big", content="b" * 80, confidence=0.95),
+            _make_memory_item(id="s1", content="s" * 40, confidence=0.9),
+            _make_memory_item(id="s2", content="t" * 40, confidence=0.9),
+        ]
+        mock_memory_service.list_items.side_effect = [
+            _mock_list_items_return(items),
+            _mock_list_items_return([]),
+        ] * 2
+
+        greedy = service.preview_pack("proj-1", budget_tokens=25)
+        knapsack = service.preview_pack(
+            "proj-1", budget_tokens=25, selection_mode="knapsack"
+        )
+
+        assert [i["id"] for i in greedy["items"]] == ["big"]
+        assert [i["id"] for i in knapsack["items"]] == ["s1", "s2"]
+        assert knapsack["total_tokens"] <= 25
+
+    def test_knapsack_continues_past_items_that_do_not_fit(
+        self, service, mock_memory_service
+    ):
+        """Unlike greedy, knapsack should keep filling after an oversized item."""
+        items = [
+            _make_memory_item(id="a", content="a" * 40, confidence=0.9),
+            _make_memory_item(id="huge", content="h" * 4000, confidence=0.85),
+            _make_memory_item(id="b", content="b" * 40, confidence=0.8),
+        ]
+        mock_memory_service.list_items.side_effect = [
+            _mock_list_items_return(items),
+            _mock_list_items_return([]),
+        ]
+
+        result = service.preview_pack(
+            "proj-1", budget_tokens=100, selection_mode="knapsack"
+        )
+
+        assert [i["id"] for i in result["items"]] == ["a", "b"]
+
+    def test_knapsack_respects_budget_when_weights_are_scaled(self):
+        """Coarse DP units must never push the selection over budget."""
+        from skillmeat.core.services.context_packer_service import _knapsack_select
+
+        weights = [37 + (i % 13) for i in range(2000)]
+        values = [((i * 7) % 10) / 10 for i in range(2000)]
+        chosen = _knapsack_select(weights, values, 5000)
+
+        assert chosen == sorted(chosen)
+        assert sum(weights[i] for i in chosen) <= 5000
+        assert sum(weights[i] for i in chosen) > 4900
+
+    def test_invalid_selection_mode_raises(self, service):
+        """Unknown selection modes should raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid selection_mode"):
+            service.preview_pack("proj-1", selection_mode="random")
+
+
+class TestGeneratePackMemoization:
+    """Tests for memoized generate_pack results."""
+
+    def test_repeated_generate_hits_memo(self, service, mock_memory_service):
+        """Unchanged candidates should return the memoized pack."""
+        from skillmeat.core.services.context_packer_service import _pack_memo
+
+        _pack_memo.clear()
+        items = [_make_memory_item(id="m1", content="Memoized decision text")]
+        mock_memory_service.list_items.side_effect = [
+            _mock_list_items_return(items),
+            _mock_list_items_return([]),
+        ] * 2
+
+        with patch.object(
+            ContextPackerService,
+            "_generate_markdown",
+            wraps=ContextPackerService._generate_markdown,
+        ) as markdown_spy:
+            first = service.generate_pack("proj-1", module_id=None, budget_tokens=4000)
+            second = service.generate_pack("proj-1", module_id=None, budget_tokens=4000)
+
+        assert markdown_spy.call_count == 1
+        assert second == first
+        second["items"][0]["content"] = "mutated"
+        assert first["items"][0]["content"] == "Memoized decision text"
+
+    def test_changed_item_version_invalidates_memo(self, service, mock_memory_service):
+        """A changed updated_at stamp should force regeneration."""
+        from skillmeat.core.services.context_packer_service import _pack_memo
+
+        _pack_memo.clear()
+        original = _make_memory_item(id="m2", content="Original memory content")
+        edited = dict(
+            original,
+            content="Edited memory content",
+            updated_at="2025-02-01T00:00:00Z",
+        )
+        mock_memory_service.list_items.side_effect = [
+            _mock_list_items_return([original]),
+            _mock_list_items_return([]),
+            _mock_list_items_return([edited]),
+            _mock_list_items_return([]),
+        ]
+
+        first = service.generate_pack("proj-1", budget_tokens=4000)
+        second = service.generate_pack("proj-1", budget_tokens=4000)
+
+        assert "Original memory content" in first["markdown"]
+        assert "Edited memory content" in second["markdown"]
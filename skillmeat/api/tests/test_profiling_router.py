@@ -0,0 +1,86 @@
+"""Tests for the sampling profiler admin endpoint (/admin/profile)."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from skillmeat.api.auth.local_provider import LocalAuthProvider
+from skillmeat.api.config import APISettings, get_settings
+from skillmeat.api.dependencies import set_auth_provider
+from skillmeat.api.routers import profiling
+
+
+@pytest.fixture(autouse=True)
+def _reset_state():
+    """Reset the profiler gate and auth provider between tests."""
+    import skillmeat.api.dependencies as _deps
+
+    profiling._gate.reset()
+    set_auth_provider(LocalAuthProvider())
+    yield
+    profiling._gate.reset()
+    _deps._auth_provider = None
+
+
+def _make_client(**overrides) -> TestClient:
+    settings = APISettings(env="testing", **overrides)
+    app = FastAPI()
+    app.include_router(profiling.router)
+    app.dependency_overrides[get_settings] = lambda: settings
+    return TestClient(app)
+
+
+def test_disabled_by_default_returns_404():
+    client = _make_client()
+    response = client.post("/admin/profile", params={"seconds": 0.05})
+    assert response.status_code == 404
+
+
+def test_collapsed_profile():
+    client = _make_client(profiler_enabled=True, profiler_cooldown_seconds=0)
+    response = client.post(
+        "/admin/profile", params={"seconds": 0.1, "interval_ms": 1}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert int(response.headers["X-Profile-Samples"]) > 0
+
+
+def test_speedscope_profile():
+    client = _make_client(profiler_enabled=True, profiler_cooldown_seconds=0)
+    response = client.post(
+        "/admin/profile",
+        params={"seconds": 0.05, "format": "speedscope", "include_idle": True},
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["$schema"].startswith("https://www.speedscope.app/")
+    assert body["profiles"]
+
+
+def test_seconds_above_limit_rejected():
+    client = _make_client(profiler_enabled=True, profiler_max_seconds=1)
+    response = client.post("/admin/profile", params={"seconds": 2})
+    assert response.status_code == 400
+
+
+def test_cooldown_returns_429_with_retry_after():
+    client = _make_client(profiler_enabled=True, profiler_cooldown_seconds=60)
+    first = client.post("/admin/profile", params={"seconds": 0.01})
+    assert first.status_code == 200
+
+    second = client.post("/admin/profile", params={"seconds": 0.01})
+    assert second.status_code == 429
+    assert 1 <= int(second.headers["Retry-After"]) <= 60
+
+
+def test_concurrent_run_returns_409():
+    client = _make_client(profiler_enabled=True, profiler_cooldown_seconds=0)
+    assert profiling._gate.try_acquire(0) is None
+    try:
+        response = client.post("/admin/profile", params={"seconds": 0.01})
+    finally:
+        profiling._gate.release()
+    assert response.status_code == 409
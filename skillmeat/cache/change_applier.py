@@ -0,0 +1,272 @@
+"""Targeted cache mutations for file watcher change events.
+
+The FileWatcher used to react to every artifact or deployment-record change by
+marking the whole project ``stale``, forcing a full refresh on the next read.
+This module turns individual change events into narrow mutations instead:
+
+- A ``.skillmeat-deployed.toml`` change re-reads the project's deployment
+  records and updates the cached artifact rows whose tracking data changed.
+- An artifact file change re-hashes only the affected deployed artifact and
+  updates that single row's ``local_modified`` flag.
+
+When a change cannot be applied precisely (unknown artifact, row missing from
+the cache, artifact added/removed/redeployed) the applier reports failure and the caller
+falls back to marking the project stale, preserving the previous behaviour.
+
+Example:
+    >>> applier = CacheChangeApplier(cache_repository=repo)
+    >>> change = CacheChange(
+    ...     kind=CHANGE_ARTIFACT_FILE,
+    ...     path="/work/app/.claude/skills/my-skill/SKILL.md",
+    ...     project_id="proj-123",
+    ...     profile_root=".claude",
+    ... )
+    >>> applier.apply("proj-123", [change])
+    True
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from skillmeat.cache.models import Artifact
+from skillmeat.cache.repository import CacheRepository
+from skillmeat.core.deployment import Deployment
+
+logger = logging.getLogger(__name__)
+
+# Change kinds recorded by the FileWatcher
+CHANGE_DEPLOYMENT_RECORD = "deployment_record"
+CHANGE_ARTIFACT_FILE = "artifact_file"
+
+# Extensions stripped when matching deployment names to cached rows
+# (mirrors skillmeat.storage.deployment._normalize_artifact_name)
+_ARTIFACT_EXTENSIONS = (".md", ".txt", ".json", ".yaml", ".yml")
+
+
+def _normalize_name(name: str) -> str:
+    """Strip a known artifact extension from ``name``."""
+    for ext in _ARTIFACT_EXTENSIONS:
+        if name.endswith(ext):
+            return name[: -len(ext)]
+    return name
+
+
+@dataclass(frozen=True)
+class CacheChange:
+    """A single file change that may be applied to the cache in place.
+
+    Attributes:
+        kind: ``CHANGE_DEPLOYMENT_RECORD`` or ``CHANGE_ARTIFACT_FILE``
+        path: Absolute path of the changed file
+        project_id: Cached project the file belongs to
+        profile_root: Profile root directory name (e.g. ``.claude``)
+    """
+
+    kind: str
+    path: str
+    project_id: str
+    profile_root: str
+
+    @property
+    def profile_dir(self) -> Optional[Path]:
+        """Return the profile root directory containing ``path``, if any."""
+        for parent in Path(self.path).parents:
+            if parent.name == self.profile_root:
+                return parent
+        return None
+
+
+class CacheChangeApplier:
+    """Applies watcher change events as targeted artifact-row updates.
+
+    Attributes:
+        cache_repository: CacheRepository used for row lookups and updates
+    """
+
+    def __init__(self, cache_repository: CacheRepository):
+        """Initialize change applier.
+
+        Args:
+            cache_repository: CacheRepository instance to mutate
+        """
+        self.cache_repository = cache_repository
+
+    def apply(self, project_id: str, changes: Sequence[CacheChange]) -> bool:
+        """Apply a batch of coalesced changes for one project.
+
+        The project's artifact rows and each touched deployment record are
+        read at most once per batch, regardless of how many events arrived.
+        A deployment record change reads the records of every profile root,
+        because the project's cached rows span all of them.
+
+        Args:
+            project_id: Project the changes belong to
+            changes: Changes recorded during the debounce window
+
+        Returns:
+            True if every change was applied in place, False if the caller
+            should fall back to invalidating the whole project
+        """
+        if not changes:
+            return True
+
+        rows = self._index_rows(self.cache_repository.list_artifacts_by_project(project_id))
+        deployments: Dict[Path, List[Deployment]] = {}
+        project_deployments: Optional[List[Deployment]] = None
+
+        for change in changes:
+            profile_dir = change.profile_dir
+            if profile_dir is None:
+                logger.debug("No profile root for change, cannot apply: %s", change.path)
+                return False
+
+            if change.kind == CHANGE_DEPLOYMENT_RECORD:
+                if project_deployments is None:
+                    project_deployments = self._read_project_deployments(
+                        profile_dir.parent
+                    )
+                applied = self._apply_deployment_record(rows, project_deployments)
+            elif change.kind == CHANGE_ARTIFACT_FILE:
+                if profile_dir not in deployments:
+                    deployments[profile_dir] = self._read_deployments(profile_dir)
+                applied = self._apply_artifact_file(
+                    change, profile_dir, rows, deployments[profile_dir]
+                )
+            else:
+                applied = False
+
+            if not applied:
+                logger.debug(
+                    "Change could not be applied in place (%s): %s",
+                    change.kind,
+                    change.path,
+                )
+                return False
+
+        logger.info(
+            "Applied %d change(s) in place for project: %s", len(changes), project_id
+        )
+        return True
+
+    # =========================================================================
+    # Change Handlers
+    # =========================================================================
+
+    def _apply_deployment_record(
+        self,
+        rows: Dict[Tuple[str, str], Artifact],
+        deployments: List[Deployment],
+    ) -> bool:
+        """Sync cached rows with the project's re-read deployment records.
+
+        ``deployments`` must cover every profile root of the project, since
+        the cached rows do.  Any artifact added to or removed from the
+        records requires a full refresh.  Each row's ``local_modified`` flag
+        and ``content_hash`` are written when they differ; a changed hash
+        means the artifact was redeployed, so its version fields are stale
+        and a full refresh is requested after the write.
+        """
+        deployed: Dict[Tuple[str, str], Deployment] = {}
+        for dep in deployments:
+            key = (dep.artifact_type, _normalize_name(dep.artifact_name))
+            other = deployed.get(key)
+            if other is not None and other.content_hash != dep.content_hash:
+                # Deployed at different versions in different profiles
+                return False
+            if other is None or dep.local_modifications:
+                deployed[key] = dep
+
+        if not rows or set(deployed) != set(rows):
+            return False
+
+        redeployed = False
+        for key, dep in deployed.items():
+            row = rows[key]
+            updates = {}
+            if bool(row.local_modified) != bool(dep.local_modifications):
+                updates["local_modified"] = bool(dep.local_modifications)
+            if row.content_hash != dep.content_hash:
+                updates["content_hash"] = dep.content_hash
+                redeployed = True
+            if updates:
+                self.cache_repository.update_artifact(row.id, **updates)
+                for field_name, value in updates.items():
+                    setattr(row, field_name, value)
+        return not redeployed
+
+    def _apply_artifact_file(
+        self,
+        change: CacheChange,
+        profile_dir: Path,
+        rows: Dict[Tuple[str, str], Artifact],
+        deployments: List[Deployment],
+    ) -> bool:
+        """Re-hash one deployed artifact and update its row's drift flag."""
+        from skillmeat.cache.deployment_stats_cache import get_deployment_stats_cache
+        from skillmeat.utils.filesystem import compute_content_hash
+
+        dep = self._deployment_for_path(change.path, profile_dir, deployments)
+        if dep is None:
+            return False
+
+        row = rows.get((dep.artifact_type, _normalize_name(dep.artifact_name)))
+        artifact_path = profile_dir / dep.artifact_path
+        if row is None or not artifact_path.exists():
+            return False
+
+        local_modified = compute_content_hash(artifact_path) != dep.content_hash
+        if bool(row.local_modified) != local_modified:
+            self.cache_repository.update_artifact(row.id, local_modified=local_modified)
+            row.local_modified = local_modified
+
+        get_deployment_stats_cache().invalidate_artifact(
+            dep.artifact_name, dep.artifact_type
+        )
+        return True
+
+    # =========================================================================
+    # Helpers
+    # =========================================================================
+
+    @staticmethod
+    def _index_rows(artifacts: List[Artifact]) -> Dict[Tuple[str, str], Artifact]:
+        """Index cached rows by (type, normalized name)."""
+        return {(a.type, _normalize_name(a.name)): a for a in artifacts}
+
+    @staticmethod
+    def _read_deployments(profile_dir: Path) -> List[Deployment]:
+        """Read only the deployment record for a single profile root."""
+        from skillmeat.storage.deployment import DeploymentTracker
+
+        return DeploymentTracker.read_deployments(
+            profile_dir.parent, profile_root_dir=profile_dir.name
+        )
+
+    @staticmethod
+    def _read_project_deployments(project_dir: Path) -> List[Deployment]:
+        """Read the deployment records of every profile root in a project."""
+        from skillmeat.storage.deployment import DeploymentTracker
+
+        return DeploymentTracker.read_deployments(project_dir)
+
+    @staticmethod
+    def _deployment_for_path(
+        path: str, profile_dir: Path, deployments: List[Deployment]
+    ) -> Optional[Deployment]:
+        """Find the deployment whose artifact path contains ``path``."""
+        try:
+            relative = Path(path).relative_to(profile_dir)
+        except ValueError:
+            return None
+
+        relative_parts = relative.parts
+        for dep in deployments:
+            dep_parts = Path(dep.artifact_path).parts
+            if dep_parts and relative_parts[: len(dep_parts)] == dep_parts:
+                return dep
+        return None
+
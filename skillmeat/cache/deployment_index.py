@@ -0,0 +1,211 @@
+"""DeploymentIndex — per-artifact index of project deployments in the cache DB.
+
+Version graphs need every deployment of one artifact across all projects.
+Reading each project's ``.skillmeat-deployed.toml`` on every request is what
+made them slow, so this module keeps the parsed records in the
+``deployment_index_projects`` / ``deployment_index_entries`` tables.
+
+:meth:`DeploymentIndex.refresh` takes the current project list (normally from
+:class:`~skillmeat.core.project_registry.ProjectRegistry`), stats each
+project's deployment files and re-reads only the projects whose files
+changed.  :meth:`DeploymentIndex.find` then answers per-artifact lookups
+with a single indexed query.
+
+Typical usage::
+
+    from skillmeat.cache.deployment_index import DeploymentIndex
+    from skillmeat.cache.repository import CacheRepository
+
+    index = DeploymentIndex(CacheRepository())
+    index.refresh(project_paths)
+    deployments = index.find("pdf-processor", "skill")
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from skillmeat.cache.models import DeploymentIndexEntry, DeploymentIndexProject
+from skillmeat.cache.repository import CacheRepository
+from skillmeat.core.deployment import Deployment
+from skillmeat.storage.deployment import DeploymentTracker
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DeploymentIndexRefresh:
+    """Outcome of one :meth:`DeploymentIndex.refresh` call."""
+
+    checked: int = 0
+    refreshed: int = 0
+    removed: int = 0
+    failed: int = 0
+
+
+class DeploymentIndex:
+    """Cache-DB index of deployment records keyed by artifact.
+
+    Args:
+        repository: Cache repository providing sessions and transactions.
+    """
+
+    def __init__(self, repository: CacheRepository):
+        self.repository = repository
+        self._refresh_lock = threading.Lock()
+
+    @staticmethod
+    def tracker_signature(project_path: Path) -> str:
+        """Return a cheap signature of a project's deployment tracker files.
+
+        Built from ``stat()`` only (profile directory, mtime and size of each
+        ``.skillmeat-deployed.toml``), so computing it never parses TOML.
+        """
+        parts = []
+        pattern = f".*/{DeploymentTracker.DEPLOYMENT_FILE}"
+        for deployment_file in sorted(project_path.glob(pattern)):
+            try:
+                stat = deployment_file.stat()
+            except OSError:
+                continue
+            parts.append(
+                f"{deployment_file.parent.name}:{stat.st_mtime_ns}:{stat.st_size}"
+            )
+        return ";".join(parts)
+
+    def refresh(
+        self, project_paths: Iterable[Path], prune: bool = True
+    ) -> DeploymentIndexRefresh:
+        """Bring the index up to date with the given projects.
+
+        Only projects whose tracker signature differs from the stored one are
+        re-read.  A project that fails to read keeps its previous entries.
+
+        Args:
+            project_paths: Projects to index (e.g. from the project registry)
+            prune: Drop indexed projects that are not in ``project_paths``
+
+        Returns:
+            DeploymentIndexRefresh with per-call counters
+        """
+        result = DeploymentIndexRefresh()
+        with self._refresh_lock:
+            with self.repository.transaction() as session:
+                stored: Dict[str, str] = dict(
+                    session.query(
+                        DeploymentIndexProject.project_path,
+                        DeploymentIndexProject.tracker_signature,
+                    ).all()
+                )
+
+            seen = set()
+            changed: Dict[str, List[Deployment]] = {}
+            signatures: Dict[str, str] = {}
+            for project_path in project_paths:
+                resolved = Path(project_path).resolve()
+                key = str(resolved)
+                if key in seen:
+                    continue
+                seen.add(key)
+                result.checked += 1
+
+                signature = self.tracker_signature(resolved)
+                if stored.get(key) == signature:
+                    continue
+                try:
+                    changed[key] = DeploymentTracker.read_deployments(resolved)
+                except Exception as e:
+                    result.failed += 1
+                    logger.warning(f"Could not index deployments for {key}: {e}")
+                    continue
+                signatures[key] = signature
+
+            removed = set(stored) - seen if prune else set()
+            if changed or removed:
+                self._write(changed, signatures, removed)
+            result.refreshed = len(changed)
+            result.removed = len(removed)
+
+        if result.refreshed or result.removed:
+            logger.debug(
+                f"Deployment index refreshed: {result.refreshed} changed, "
+                f"{result.removed} removed of {result.checked} projects"
+            )
+        return result
+
+    def find(self, artifact_name: str, artifact_type: str) -> List[Deployment]:
+        """Return every indexed deployment of one artifact.
+
+        Each returned Deployment carries a ``project_path`` attribute, matching
+        what version graph builders attach when reading tracker files.
+        """
+        with self.repository.transaction() as session:
+            rows = (
+                session.query(
+                    DeploymentIndexEntry.project_path,
+                    DeploymentIndexEntry.deployment_json,
+                )
+                .filter(
+                    DeploymentIndexEntry.artifact_type == artifact_type,
+                    DeploymentIndexEntry.artifact_name == artifact_name,
+                )
+                .order_by(DeploymentIndexEntry.project_path, DeploymentIndexEntry.id)
+                .all()
+            )
+
+        deployments = []
+        for project_path, deployment_json in rows:
+            deployment = Deployment.from_dict(json.loads(deployment_json))
+            deployment.project_path = Path(project_path)  # type: ignore
+            deployments.append(deployment)
+        return deployments
+
+    def clear(self) -> None:
+        """Drop every indexed project and entry."""
+        with self._refresh_lock, self.repository.transaction() as session:
+            session.query(DeploymentIndexEntry).delete(synchronize_session=False)
+            session.query(DeploymentIndexProject).delete(synchronize_session=False)
+
+    def _write(
+        self,
+        changed: Dict[str, List[Deployment]],
+        signatures: Dict[str, str],
+        removed: Iterable[str],
+    ) -> None:
+        now = datetime.utcnow()
+        stale = list(changed) + list(removed)
+        with self.repository.transaction() as session:
+            session.query(DeploymentIndexEntry).filter(
+                DeploymentIndexEntry.project_path.in_(stale)
+            ).delete(synchronize_session=False)
+            session.query(DeploymentIndexProject).filter(
+                DeploymentIndexProject.project_path.in_(stale)
+            ).delete(synchronize_session=False)
+
+            session.add_all(
+                DeploymentIndexProject(
+                    project_path=key,
+                    tracker_signature=signatures[key],
+                    deployment_count=len(deployments),
+                    indexed_at=now,
+                )
+                for key, deployments in changed.items()
+            )
+            # Entries reference their project row; insert the projects first
+            session.flush()
+            for key, deployments in changed.items():
+                session.add_all(
+                    DeploymentIndexEntry(
+                        project_path=key,
+                        artifact_type=deployment.artifact_type,
+                        artifact_name=deployment.artifact_name,
+                        deployment_json=json.dumps(deployment.to_dict()),
+                    )
+                    for deployment in deployments
+                )
@@ -0,0 +1,268 @@
+"""DriftMatrixStore — persistence for fleet drift scans.
+
+Wraps the ``drift_scans`` / ``drift_scan_entries`` tables written by
+:class:`~skillmeat.core.fleet_drift.FleetDriftScanner`.  Each project's entries
+are stored in a single transaction together with the scan's progress
+counters, so a scan interrupted at any point can be resumed by skipping the
+projects that already have entries.
+
+Typical usage::
+
+    from skillmeat.cache.drift_matrix import DriftMatrixStore
+    from skillmeat.cache.repository import CacheRepository
+
+    store = DriftMatrixStore(CacheRepository())
+    entries, total = store.list_entries(scan_id, offset=0, limit=50,
+                                        drift_types=["conflict", "outdated"])
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from skillmeat.cache.models import DriftScan, DriftScanEntry, Project
+from skillmeat.cache.repository import CacheNotFoundError, CacheRepository
+
+logger = logging.getLogger(__name__)
+
+# Statuses from which a scan may be (re)started
+RESUMABLE_STATUSES = frozenset({"pending", "running", "cancelled", "failed"})
+
+
+class DriftMatrixStore:
+    """Read/write layer for fleet drift scans and their matrix entries.
+
+    Args:
+        repository: Cache repository providing sessions and transactions.
+    """
+
+    def __init__(self, repository: CacheRepository):
+        self.repository = repository
+
+    # =========================================================================
+    # Scans
+    # =========================================================================
+
+    def create_scan(self, collection_name: Optional[str] = None) -> str:
+        """Create a pending scan and return its identifier."""
+        with self.repository.transaction() as session:
+            scan = DriftScan(collection_name=collection_name, status="pending")
+            session.add(scan)
+            session.flush()
+            scan_id = scan.id
+        logger.debug(f"Created drift scan {scan_id}")
+        return scan_id
+
+    def get_scan(self, scan_id: str) -> Optional[Dict[str, Any]]:
+        """Return a scan as a dict, or None if it does not exist."""
+        with self.repository.transaction() as session:
+            scan = session.get(DriftScan, scan_id)
+            return scan.to_dict() if scan is not None else None
+
+    def list_scans(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Return the most recent scans, newest first."""
+        with self.repository.transaction() as session:
+            scans = (
+                session.query(DriftScan)
+                .order_by(DriftScan.created_at.desc())
+                .limit(limit)
+                .all()
+            )
+            return [scan.to_dict() for scan in scans]
+
+    def mark_running(self, scan_id: str, total_projects: int) -> None:
+        """Mark a scan as running and recount its progress from stored entries.
+
+        Projects without deployments store no entries and are rescanned on
+        resume, so the counters are rebuilt rather than carried over.
+
+        Raises:
+            CacheNotFoundError: If the scan does not exist
+        """
+        with self.repository.transaction() as session:
+            scan = self._require_scan(session, scan_id)
+            entries = session.query(DriftScanEntry).filter(
+                DriftScanEntry.scan_id == scan_id
+            )
+            scan.scanned_projects = (
+                entries.with_entities(DriftScanEntry.project_id).distinct().count()
+            )
+            scan.drifted_artifacts = entries.filter(
+                DriftScanEntry.drift_type != "synced"
+            ).count()
+            scan.status = "running"
+            scan.total_projects = total_projects
+            scan.failed_projects = 0
+            scan.started_at = datetime.utcnow()
+            scan.finished_at = None
+            scan.error_message = None
+
+    def finish_scan(
+        self,
+        scan_id: str,
+        status: str,
+        failed_projects: int = 0,
+        error_message: Optional[str] = None,
+    ) -> None:
+        """Record the final status of a run."""
+        with self.repository.transaction() as session:
+            scan = self._require_scan(session, scan_id)
+            scan.status = status
+            scan.failed_projects = failed_projects
+            scan.finished_at = datetime.utcnow()
+            scan.error_message = error_message
+
+    def request_cancel(self, scan_id: str) -> bool:
+        """Ask a pending or running scan to stop.
+
+        The running scanner observes the request between projects.
+
+        Returns:
+            True if the scan was pending or running, False otherwise.
+        """
+        with self.repository.transaction() as session:
+            scan = session.get(DriftScan, scan_id)
+            if scan is None or scan.status not in ("pending", "running"):
+                return False
+            scan.status = "cancelled"
+            scan.finished_at = datetime.utcnow()
+            return True
+
+    def get_status(self, scan_id: str) -> Optional[str]:
+        """Return the current status of a scan."""
+        with self.repository.transaction() as session:
+            row = (
+                session.query(DriftScan.status)
+                .filter(DriftScan.id == scan_id)
+                .one_or_none()
+            )
+            return row[0] if row is not None else None
+
+    # =========================================================================
+    # Projects and entries
+    # =========================================================================
+
+    def list_projects(self) -> List[Tuple[str, str]]:
+        """Return ``(project_id, path)`` for every registered project."""
+        with self.repository.transaction() as session:
+            rows = session.query(Project.id, Project.path).order_by(Project.path).all()
+            return [(row[0], row[1]) for row in rows]
+
+    def completed_project_ids(self, scan_id: str) -> Set[str]:
+        """Return the projects that already have entries for a scan."""
+        with self.repository.transaction() as session:
+            rows = (
+                session.query(DriftScanEntry.project_id)
+                .filter(DriftScanEntry.scan_id == scan_id)
+                .distinct()
+                .all()
+            )
+            return {row[0] for row in rows}
+
+    def record_project(
+        self,
+        scan_id: str,
+        project_id: str,
+        project_path: str,
+        entries: Sequence[Dict[str, Any]],
+    ) -> None:
+        """Store one project's matrix entries and advance the scan counters.
+
+        Args:
+            scan_id: Owning scan
+            project_id: Cache project identifier
+            project_path: Project path at scan time
+            entries: Dicts with DriftScanEntry column values (artifact_name,
+                artifact_type, profile_id, drift_type, recommendation,
+                deployed_sha, collection_sha, project_sha)
+        """
+        now = datetime.utcnow()
+        with self.repository.transaction() as session:
+            scan = self._require_scan(session, scan_id)
+            # Replace any partial rows left by an earlier interrupted write
+            session.query(DriftScanEntry).filter(
+                DriftScanEntry.scan_id == scan_id,
+                DriftScanEntry.project_id == project_id,
+            ).delete(synchronize_session=False)
+            session.add_all(
+                DriftScanEntry(
+                    scan_id=scan_id,
+                    project_id=project_id,
+                    project_path=project_path,
+                    scanned_at=now,
+                    **entry,
+                )
+                for entry in entries
+            )
+            scan.scanned_projects += 1
+            scan.drifted_artifacts += sum(
+                1 for entry in entries if entry["drift_type"] != "synced"
+            )
+
+    def list_entries(
+        self,
+        scan_id: str,
+        offset: int = 0,
+        limit: int = 100,
+        drift_types: Optional[Sequence[str]] = None,
+        project_id: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Page through a scan's drift matrix.
+
+        Entries are ordered by project path, artifact type and name so pages
+        are stable across calls.
+
+        Args:
+            scan_id: Scan to read
+            offset: Number of entries to skip
+            limit: Maximum number of entries to return
+            drift_types: Optional drift types to include (e.g. ``["conflict"]``)
+            project_id: Optional project filter
+
+        Returns:
+            Tuple of (entry dicts, total matching entries)
+        """
+        with self.repository.transaction() as session:
+            query = session.query(DriftScanEntry).filter(
+                DriftScanEntry.scan_id == scan_id
+            )
+            if drift_types:
+                query = query.filter(DriftScanEntry.drift_type.in_(list(drift_types)))
+            if project_id is not None:
+                query = query.filter(DriftScanEntry.project_id == project_id)
+
+            total = query.count()
+            rows = (
+                query.order_by(
+                    DriftScanEntry.project_path,
+                    DriftScanEntry.artifact_type,
+                    DriftScanEntry.artifact_name,
+                    DriftScanEntry.profile_id,
+                )
+                .offset(offset)
+                .limit(limit)
+                .all()
+            )
+            return [row.to_dict() for row in rows], total
+
+    def delete_scan(self, scan_id: str) -> bool:
+        """Delete a scan and its entries."""
+        with self.repository.transaction() as session:
+            session.query(DriftScanEntry).filter(
+                DriftScanEntry.scan_id == scan_id
+            ).delete(synchronize_session=False)
+            deleted = (
+                session.query(DriftScan)
+                .filter(DriftScan.id == scan_id)
+                .delete(synchronize_session=False)
+            )
+            return deleted > 0
+
+    @staticmethod
+    def _require_scan(session: Any, scan_id: str) -> DriftScan:
+        scan = session.get(DriftScan, scan_id)
+        if scan is None:
+            raise CacheNotFoundError(f"Drift scan not found: {scan_id}")
+        return scan
@@ -2336,6 +2336,34 @@ class EnterpriseUserCollectionAdapter(IDbUserCollectionRepository):
         """Enterprise does not have the same group association model; returns empty list."""
         return []
 
+    def get_group_and_artifact_counts(
+        self,
+        collection_ids: "list[str]",
+        ctx: Optional[object] = None,
+    ) -> "dict[str, tuple[int, int]]":
+        """Return ``(0, artifact_count)`` per collection from one grouped count."""
+        from sqlalchemy import func
+        from skillmeat.cache.models_enterprise import EnterpriseCollectionArtifact
+
+        uids = {}
+        for collection_id in collection_ids:
+            try:
+                uids[uuid.UUID(collection_id)] = collection_id
+            except (ValueError, AttributeError):
+                continue
+
+        counts: "dict[str, tuple[int, int]]" = {cid: (0, 0) for cid in collection_ids}
+        if not uids:
+            return counts
+        rows = self._repo.session.execute(
+            select(EnterpriseCollectionArtifact.collection_id, func.count())
+            .where(EnterpriseCollectionArtifact.collection_id.in_(list(uids)))
+            .group_by(EnterpriseCollectionArtifact.collection_id)
+        )
+        for uid, count in rows:
+            counts[uids[uid]] = (0, count or 0)
+        return counts
+
     def list_with_artifact_stats(
         self,
         *,
@@ -0,0 +1,148 @@
+"""Named relationship-loading profiles for cache repository queries.
+
+Many relationships in :mod:`skillmeat.cache.models` are declared with
+``lazy="selectin"``, so every query for a parent row also fetches its
+children - and, through the children's own ``selectin`` relationships, their
+children in turn.  Listing tags, for example, loads every tagged artifact
+together with its metadata, versions and categories.
+
+Repositories instead apply a named *profile* to each query: an explicit set
+of loader options naming exactly the relationships the caller's DTO or
+response needs.  Every relationship a profile does not name is left unloaded
+(``lazyload("*")``), including relationships of the rows it does load.
+
+Strict loading turns those unloaded relationships into ``raiseload`` so an
+access that would issue one query per row fails immediately instead of
+silently degrading to N+1.  It is enabled with the
+``SKILLMEAT_ORM_STRICT_LOADING`` environment variable (the test suite sets
+it) or :func:`enable_strict_loading`.
+
+Usage:
+    >>> from skillmeat.cache.loading import TAG_SUMMARY, load_profile
+    >>> session.query(Tag).options(*load_profile(TAG_SUMMARY)).all()
+"""
+
+import os
+from typing import Callable, Dict, Optional, Tuple
+
+from sqlalchemy.orm import joinedload, lazyload, raiseload, selectinload
+from sqlalchemy.orm.interfaces import ORMOption
+
+from skillmeat.cache.models import Artifact, MarketplaceSource
+
+#: Environment variable that enables strict loading when set to a true value.
+STRICT_LOADING_ENV = "SKILLMEAT_ORM_STRICT_LOADING"
+
+# Profile names
+COLLECTION_SUMMARY = "collection_summary"
+TAG_SUMMARY = "tag_summary"
+MARKETPLACE_SOURCE_SUMMARY = "marketplace_source_summary"
+MARKETPLACE_SOURCE_DETAIL = "marketplace_source_detail"
+ARTIFACT_SUMMARY = "artifact_summary"
+ARTIFACT_REFERENCE = "artifact_reference"
+ARTIFACT_LOOKUP = "artifact_lookup"
+PROJECT_SUMMARY = "project_summary"
+
+_strict_override: Optional[bool] = None
+
+
+def enable_strict_loading(enabled: Optional[bool] = True) -> None:
+    """Turn strict loading on or off for the current process.
+
+    Overrides :data:`STRICT_LOADING_ENV` until called again.
+
+    Args:
+        enabled: Whether relationships outside a profile should raise, or
+            None to defer to the environment variable again
+    """
+    global _strict_override
+    _strict_override = enabled
+
+
+def strict_loading_enabled() -> bool:
+    """Return whether relationships outside a profile raise on access."""
+    if _strict_override is not None:
+        return _strict_override
+    return os.environ.get(STRICT_LOADING_ENV, "").strip().lower() in {
+        "1",
+        "true",
+        "yes",
+        "on",
+    }
+
+
+def _unloaded() -> ORMOption:
+    """Loader option for every relationship a profile does not name."""
+    return raiseload("*") if strict_loading_enabled() else lazyload("*")
+
+
+def _columns_only() -> Tuple[ORMOption, ...]:
+    return (_unloaded(),)
+
+
+def _marketplace_source_detail() -> Tuple[ORMOption, ...]:
+    # Callers iterate ``source.entries`` after the session is closed.
+    return (
+        selectinload(MarketplaceSource.entries).options(_unloaded()),
+        _unloaded(),
+    )
+
+
+def _artifact_summary() -> Tuple[ORMOption, ...]:
+    # What ``Artifact.to_dict`` reads: metadata and category names.
+    return (
+        selectinload(Artifact.artifact_metadata).options(_unloaded()),
+        selectinload(Artifact.categories).options(_unloaded()),
+        _unloaded(),
+    )
+
+
+def _artifact_reference() -> Tuple[ORMOption, ...]:
+    # Identity fields plus the owning project's path.
+    return (
+        joinedload(Artifact.project).options(_unloaded()),
+        _unloaded(),
+    )
+
+
+def _artifact_lookup() -> Tuple[ORMOption, ...]:
+    # What the artifact metadata service reads: metadata and tag names.
+    return (
+        selectinload(Artifact.artifact_metadata).options(_unloaded()),
+        selectinload(Artifact.tags).options(_unloaded()),
+        _unloaded(),
+    )
+
+
+_PROFILES: Dict[str, Callable[[], Tuple[ORMOption, ...]]] = {
+    COLLECTION_SUMMARY: _columns_only,
+    TAG_SUMMARY: _columns_only,
+    MARKETPLACE_SOURCE_SUMMARY: _columns_only,
+    MARKETPLACE_SOURCE_DETAIL: _marketplace_source_detail,
+    ARTIFACT_SUMMARY: _artifact_summary,
+    ARTIFACT_REFERENCE: _artifact_reference,
+    ARTIFACT_LOOKUP: _artifact_lookup,
+    PROJECT_SUMMARY: _columns_only,
+}
+
+
+def load_profile(name: str) -> Tuple[ORMOption, ...]:
+    """Return the loader options for a named profile.
+
+    Options are built on each call so a change to strict loading applies to
+    the next query.
+
+    Args:
+        name: One of the profile name constants in this module
+
+    Returns:
+        Loader options to pass to ``Query.options()``
+
+    Raises:
+        KeyError: If ``name`` is not a known profile
+    """
+    try:
+        builder = _PROFILES[name]
+    except KeyError:
+        raise KeyError(f"Unknown loading profile: {name!r}") from None
+    return builder()
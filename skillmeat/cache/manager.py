@@ -228,11 +228,16 @@ class CacheManager:
     # Read Operations (Projects)
     # =========================================================================
 
-    def get_projects(self, include_stale: bool = True) -> List[Project]:
+    def get_projects(
+        self, include_stale: bool = True, with_artifacts: bool = True
+    ) -> List[Project]:
         """Get all cached projects.
 
         Args:
             include_stale: If False, exclude stale projects based on TTL
+            with_artifacts: If False, load project columns only and leave
+                ``Project.artifacts`` unloaded (for callers that list
+                projects without reading their artifacts)
 
         Returns:
             List of Project objects
@@ -246,20 +251,20 @@ class CacheManager:
         """
         try:
             with self._lock:
+                all_projects = self.repository.list_projects(
+                    with_artifacts=with_artifacts
+                )
                 if include_stale:
-                    projects = self.repository.list_projects()
+                    projects = all_projects
                     logger.debug(f"Retrieved {len(projects)} projects (all)")
                 else:
-                    # Get all projects and filter out stale ones
-                    all_projects = self.repository.list_projects()
-                    stale_ids = {
-                        p.id
-                        for p in self.repository.get_stale_projects(self.ttl_minutes)
-                    }
-                    projects = [p for p in all_projects if p.id not in stale_ids]
+                    # Filter out stale projects from the rows already loaded
+                    projects = [
+                        p for p in all_projects if not self.is_project_stale(p)
+                    ]
                     logger.debug(
                         f"Retrieved {len(projects)} projects (fresh only, "
-                        f"excluded {len(stale_ids)} stale)"
+                        f"excluded {len(all_projects) - len(projects)} stale)"
                     )
                 return projects
         except Exception as e:
@@ -1227,11 +1232,7 @@ class CacheManager:
                         logger.warning(f"Project not found: {project_id}")
                         return True  # Treat missing as stale
 
-                    if project.last_fetched is None:
-                        return True
-
-                    threshold = datetime.utcnow() - timedelta(minutes=self.ttl_minutes)
-                    return project.last_fetched < threshold
+                    return self.is_project_stale(project)
                 else:
                     # Check if any project is stale
                     stale_projects = self.repository.get_stale_projects(
@@ -1242,6 +1243,24 @@ class CacheManager:
             logger.error(f"Failed to check cache staleness: {e}", exc_info=True)
             return True  # Treat errors as stale to trigger refresh
 
+    def is_project_stale(self, project: Project) -> bool:
+        """Check an already loaded project against the TTL without a query.
+
+        Use this instead of :meth:`is_cache_stale` when iterating projects
+        returned by :meth:`get_projects`, so listing N projects does not issue
+        N extra lookups.
+
+        Args:
+            project: Project row (only ``last_fetched`` is read)
+
+        Returns:
+            True if the project was never fetched or is older than the TTL
+        """
+        if project.last_fetched is None:
+            return True
+        threshold = datetime.utcnow() - timedelta(minutes=self.ttl_minutes)
+        return project.last_fetched < threshold
+
     # =========================================================================
     # Marketplace Operations
     # =========================================================================
@@ -0,0 +1,325 @@
+"""Materialized marketplace facet counts.
+
+The marketplace source listing shows how many sources (and catalog entries)
+carry each artifact type, tag and trust level.  Rather than aggregating over
+every source and catalog entry per request, the totals live in
+``marketplace_facet_counts`` and are kept current incrementally:
+
+* ``marketplace_source_facets`` records the contribution last applied for
+  each source as ``(facet, value, artifact_count)`` triples.
+* :func:`refresh_source_facets` recomputes one source's contribution (one
+  grouped query over that source's entries) and applies the difference to
+  the totals.  Repository write paths call it inside their own session, so
+  facet counts commit atomically with the change that caused them.
+
+Catalog entries are counted the way ``SourceManager.compute_counts_by_type``
+counts them (excluded entries are skipped), so an ``artifact_type`` facet's
+``source_count`` is the number of sources ``filter_by_artifact_type`` returns.
+Facet values are lower-cased, matching the case-insensitive filters.
+
+Typical usage::
+
+    from skillmeat.cache.marketplace_facets import read_facets
+
+    facets = read_facets(session)
+    facets["artifact_type"]["skill"]  # FacetCount(source_count=3, artifact_count=42)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from skillmeat.cache.models import (
+    MarketplaceCatalogEntry,
+    MarketplaceFacetCount,
+    MarketplaceSource,
+    MarketplaceSourceFacets,
+)
+
+logger = logging.getLogger(__name__)
+
+FACET_ARTIFACT_TYPE = "artifact_type"
+FACET_TAG = "tag"
+FACET_TRUST_LEVEL = "trust_level"
+FACETS = (FACET_ARTIFACT_TYPE, FACET_TAG, FACET_TRUST_LEVEL)
+
+
+# (facet, value) -> artifact count contributed by one source
+Contribution = Dict[Tuple[str, str], int]
+
+
+@dataclass(frozen=True)
+class FacetCount:
+    """Count for one facet value."""
+
+    source_count: int
+    artifact_count: int
+
+
+FacetTable = Dict[str, Dict[str, FacetCount]]
+
+
+# =============================================================================
+# Contributions
+# =============================================================================
+
+
+def _counted_entries(query):
+    return query.filter(
+        MarketplaceCatalogEntry.status != "excluded",
+        MarketplaceCatalogEntry.excluded_at.is_(None),
+    )
+
+
+def _build_contribution(
+    source: MarketplaceSource, type_counts: Dict[str, int]
+) -> Contribution:
+    contribution: Contribution = {}
+    total = 0
+    for artifact_type, count in type_counts.items():
+        if count > 0:
+            contribution[(FACET_ARTIFACT_TYPE, artifact_type.lower())] = count
+            total += count
+    if source.trust_level:
+        contribution[(FACET_TRUST_LEVEL, source.trust_level.lower())] = total
+    for tag in {t.lower() for t in source.get_tags_list() or []}:
+        contribution[(FACET_TAG, tag)] = total
+    return contribution
+
+
+def source_contribution(session: Session, source_id: str) -> Optional[Contribution]:
+    """Compute the facet contribution of one source from the live tables.
+
+    Returns ``None`` when the source does not exist.
+    """
+    source = session.query(MarketplaceSource).filter_by(id=source_id).first()
+    if source is None:
+        return None
+    rows = _counted_entries(
+        session.query(
+            MarketplaceCatalogEntry.artifact_type,
+            func.count(MarketplaceCatalogEntry.id),
+        ).filter(MarketplaceCatalogEntry.source_id == source_id)
+    ).group_by(MarketplaceCatalogEntry.artifact_type)
+    return _build_contribution(source, {t: n for t, n in rows})
+
+
+def _encode(contribution: Contribution) -> str:
+    return json.dumps(sorted([f, v, n] for (f, v), n in contribution.items()))
+
+
+def _decode(facets_json: str) -> Contribution:
+    return {(f, v): n for f, v, n in json.loads(facets_json)}
+
+
+# =============================================================================
+# Incremental maintenance
+# =============================================================================
+
+
+def refresh_source_facets(session: Session, source_id: str) -> None:
+    """Re-apply one source's facet contribution to the totals.
+
+    Call after any change to the source's tags or trust level, its catalog
+    entries, or entry exclusion state (including deleting the source).  Does
+    not commit; the caller's transaction covers the facet update.
+    """
+    # Cache sessions do not autoflush; make pending source and entry changes
+    # visible to the queries below.
+    session.flush()
+    contribution = source_contribution(session, source_id)
+    stored = session.get(MarketplaceSourceFacets, source_id)
+    if contribution is None and stored is None:
+        return
+    new = contribution or {}
+    old = _decode(stored.facets_json) if stored is not None else {}
+    if new == old and stored is not None and contribution is not None:
+        return
+
+    now = datetime.utcnow()
+    _apply_delta(session, old, new, now)
+
+    if contribution is not None:
+        if stored is None:
+            session.add(
+                MarketplaceSourceFacets(
+                    source_id=source_id, facets_json=_encode(new), updated_at=now
+                )
+            )
+        else:
+            stored.facets_json = _encode(new)
+            stored.updated_at = now
+    elif stored is not None:
+        session.delete(stored)
+    session.flush()
+
+
+def _apply_delta(
+    session: Session, old: Contribution, new: Contribution, now: datetime
+) -> None:
+    for key in set(old) | set(new):
+        source_delta = int(key in new) - int(key in old)
+        artifact_delta = new.get(key, 0) - old.get(key, 0)
+        if source_delta == 0 and artifact_delta == 0:
+            continue
+
+        row = session.get(MarketplaceFacetCount, key)
+        if row is None:
+            row = MarketplaceFacetCount(
+                facet=key[0], value=key[1], source_count=0, artifact_count=0
+            )
+            session.add(row)
+        row.source_count += source_delta
+        row.artifact_count += artifact_delta
+        row.updated_at = now
+        if row.source_count <= 0:
+            if row in session.new:
+                session.expunge(row)
+            else:
+                session.delete(row)
+
+
+def rebuild_facets(session: Session) -> int:
+    """Recompute every source's contribution and the totals from scratch.
+
+    Returns:
+        Number of sources indexed
+    """
+    contributions = _live_contributions(session)
+    session.query(MarketplaceFacetCount).delete(synchronize_session=False)
+    session.query(MarketplaceSourceFacets).delete(synchronize_session=False)
+
+    now = datetime.utcnow()
+    session.add_all(
+        MarketplaceSourceFacets(
+            source_id=source_id, facets_json=_encode(contribution), updated_at=now
+        )
+        for source_id, contribution in contributions.items()
+    )
+    session.add_all(
+        MarketplaceFacetCount(
+            facet=facet,
+            value=value,
+            source_count=count.source_count,
+            artifact_count=count.artifact_count,
+            updated_at=now,
+        )
+        for facet, values in _totals(contributions.values()).items()
+        for value, count in values.items()
+    )
+    logger.info(f"Rebuilt marketplace facets for {len(contributions)} sources")
+    return len(contributions)
+
+
+def _live_contributions(session: Session) -> Dict[str, Contribution]:
+    type_counts: Dict[str, Dict[str, int]] = {}
+    rows = _counted_entries(
+        session.query(
+            MarketplaceCatalogEntry.source_id,
+            MarketplaceCatalogEntry.artifact_type,
+            func.count(MarketplaceCatalogEntry.id),
+        )
+    ).group_by(MarketplaceCatalogEntry.source_id, MarketplaceCatalogEntry.artifact_type)
+    for source_id, artifact_type, count in rows:
+        type_counts.setdefault(source_id, {})[artifact_type] = count
+
+    return {
+        source.id: _build_contribution(source, type_counts.get(source.id, {}))
+        for source in session.query(MarketplaceSource).all()
+    }
+
+
+def _totals(contributions: Iterable[Contribution]) -> FacetTable:
+    sources: Dict[Tuple[str, str], int] = {}
+    artifacts: Dict[Tuple[str, str], int] = {}
+    for contribution in contributions:
+        for key, count in contribution.items():
+            sources[key] = sources.get(key, 0) + 1
+            artifacts[key] = artifacts.get(key, 0) + count
+
+    table: FacetTable = {facet: {} for facet in FACETS}
+    for (facet, value), source_count in sources.items():
+        table.setdefault(facet, {})[value] = FacetCount(
+            source_count=source_count, artifact_count=artifacts[(facet, value)]
+        )
+    return table
+
+
+# =============================================================================
+# Reads
+# =============================================================================
+
+
+def ensure_facets(session: Session) -> bool:
+    """Rebuild the facet tables if they do not cover the current sources.
+
+    Catches databases that predate the facet tables and sources written by
+    paths that bypass the repository hooks.  Cheap: two ``COUNT(*)`` queries
+    when nothing needs rebuilding.
+
+    Returns:
+        True if a rebuild was performed
+    """
+    indexed = session.query(func.count(MarketplaceSourceFacets.source_id)).scalar()
+    sources = session.query(func.count(MarketplaceSource.id)).scalar()
+    if indexed == sources:
+        return False
+    logger.info(f"Marketplace facets cover {indexed} of {sources} sources; rebuilding")
+    rebuild_facets(session)
+    return True
+
+
+def read_facets(session: Session) -> FacetTable:
+    """Return the precomputed facet counts, keyed by facet then value."""
+    table: FacetTable = {facet: {} for facet in FACETS}
+    for row in session.query(MarketplaceFacetCount).all():
+        table.setdefault(row.facet, {})[row.value] = FacetCount(
+            source_count=row.source_count, artifact_count=row.artifact_count
+        )
+    return table
+
+
+def live_facets(session: Session) -> FacetTable:
+    """Aggregate facet counts directly from sources and catalog entries."""
+    return _totals(_live_contributions(session).values())
+
+
+def diff_facets(expected: FacetTable, actual: FacetTable) -> List[str]:
+    """Describe every facet value whose counts differ between two tables."""
+    mismatches = []
+    for facet in sorted(set(expected) | set(actual)):
+        left = expected.get(facet, {})
+        right = actual.get(facet, {})
+        for value in sorted(set(left) | set(right)):
+            if left.get(value) != right.get(value):
+                mismatches.append(
+                    f"{facet}={value}: live {left.get(value)}, "
+                    f"precomputed {right.get(value)}"
+                )
+    return mismatches
+
+
+def verify_facets(session: Session) -> List[str]:
+    """Compare precomputed counts with live aggregates.
+
+    Returns:
+        Mismatch descriptions (empty when the tables agree)
+    """
+    return diff_facets(live_facets(session), read_facets(session))
+
+
+def facet_values(table: FacetTable, facet: str) -> Optional[Dict[str, FacetCount]]:
+    """Return one facet's values sorted by descending source count."""
+    values = table.get(facet)
+    if values is None:
+        return None
+    return dict(
+        sorted(values.items(), key=lambda item: (-item[1].source_count, item[0]))
+    )
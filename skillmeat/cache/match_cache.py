@@ -0,0 +1,257 @@
+"""MatchResultCache — cache-DB store for finished match scoring results.
+
+``ScoringService.score_artifacts`` rescores every artifact on each call.  When
+neither the query nor the collection changed, the result is the same, so this
+module keeps finished results in the ``match_result_cache`` table keyed by:
+
+* the normalized query (lower-cased, whitespace collapsed),
+* the collection content version — a digest of every scored artifact's name
+  and metadata, so any artifact change produces a new key,
+* the scorer configuration (semantic on/off, embedding model, weights), and
+* the project context fingerprint, for callers that apply context boosts.
+
+Rows are evicted least-recently-used once the table exceeds ``max_entries``.
+Storing a result for a new content version of a collection (same artifact
+names, different content) drops the rows for its older versions.  A small
+in-process LRU sits in front of the table so repeated queries in a
+long-running process (the API server, agents polling ``/match``) skip the
+database entirely.
+
+Typical usage::
+
+    from skillmeat.cache.match_cache import MatchResultCache
+    from skillmeat.cache.repository import CacheRepository
+
+    cache = MatchResultCache(CacheRepository())
+    service = ScoringService(result_cache=cache)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, is_dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from skillmeat.cache.models import MatchResultCacheEntry
+from skillmeat.cache.repository import CacheRepository
+
+logger = logging.getLogger(__name__)
+
+# Maximum rows kept in match_result_cache before LRU eviction.
+DEFAULT_MAX_ENTRIES = 1000
+
+# Results kept in the in-process LRU in front of the table.
+DEFAULT_MEMORY_ENTRIES = 128
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Return *query* lower-cased with whitespace collapsed."""
+    return _WHITESPACE_RE.sub(" ", query).strip().lower()
+
+
+def _digest(payload: Any) -> str:
+    data = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def collection_fingerprint(artifacts: Iterable[Tuple[str, Any]]) -> Tuple[str, str]:
+    """Return ``(scope, version)`` digests for a list of scored artifacts.
+
+    ``scope`` covers only artifact names and identifies the collection;
+    ``version`` also covers each artifact's metadata and changes whenever any
+    artifact's content does.
+
+    Args:
+        artifacts: ``(name, metadata)`` pairs as passed to
+            ``ScoringService.score_artifacts``.  Metadata objects with a
+            ``to_dict()`` method are serialized through it.
+
+    Returns:
+        Tuple of hex digests ``(scope, version)``.
+    """
+    items = []
+    for name, metadata in artifacts:
+        if hasattr(metadata, "to_dict"):
+            metadata = metadata.to_dict()
+        items.append((name, metadata))
+    items.sort(key=lambda item: item[0])
+    return _digest([name for name, _ in items]), _digest(items)
+
+
+def context_fingerprint(context: Any) -> Optional[str]:
+    """Return a digest of a project context (e.g. ``ProjectContext``), or None."""
+    if context is None:
+        return None
+    if is_dataclass(context):
+        context = asdict(context)
+    if isinstance(context, dict):
+        context = {
+            key: sorted(value) if isinstance(value, (set, frozenset)) else value
+            for key, value in context.items()
+        }
+    return _digest(context)
+
+
+class MatchResultCache:
+    """LRU cache of match scoring results in the cache DB.
+
+    Args:
+        repository: Cache repository providing sessions and transactions.
+        max_entries: Row limit for ``match_result_cache``.
+        memory_entries: Size of the in-process LRU (0 disables it).
+    """
+
+    def __init__(
+        self,
+        repository: CacheRepository,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+    ):
+        self.repository = repository
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def build_key(
+        query: str,
+        collection_version: str,
+        config: Dict[str, Any],
+        context: Optional[str] = None,
+    ) -> str:
+        """Return the cache key for one scoring request.
+
+        Args:
+            query: Normalized query (see :func:`normalize_query`).
+            collection_version: Version digest from :func:`collection_fingerprint`.
+            config: JSON-serializable scorer configuration.
+            context: Project context fingerprint, if any.
+
+        Returns:
+            Hex SHA-256 digest.
+        """
+        return _digest([query, collection_version, config, context])
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached payload for *key*, or None on a miss."""
+        with self._lock:
+            payload = self._memory.get(key)
+            if payload is not None:
+                self._memory.move_to_end(key)
+                return payload
+
+        with self.repository.transaction() as session:
+            row = session.get(MatchResultCacheEntry, key)
+            if row is None:
+                return None
+            row.hit_count += 1
+            row.last_accessed_at = datetime.utcnow()
+            payload = json.loads(row.result_json)
+
+        self._remember(key, payload)
+        return payload
+
+    def put(
+        self,
+        key: str,
+        query: str,
+        collection: Tuple[str, str],
+        payload: Dict[str, Any],
+    ) -> None:
+        """Store *payload* under *key*.
+
+        Rows for other content versions of the same collection scope are
+        removed, then the table is trimmed to ``max_entries``.
+
+        Args:
+            key: Key from :meth:`build_key`.
+            query: Normalized query (kept for inspection).
+            collection: ``(scope, version)`` from :func:`collection_fingerprint`.
+            payload: JSON-serializable result.
+        """
+        scope, version = collection
+        now = datetime.utcnow()
+        with self.repository.transaction() as session:
+            stale = (
+                session.query(MatchResultCacheEntry)
+                .filter(
+                    MatchResultCacheEntry.collection_scope == scope,
+                    MatchResultCacheEntry.collection_version != version,
+                )
+                .delete(synchronize_session=False)
+            )
+            session.merge(
+                MatchResultCacheEntry(
+                    cache_key=key,
+                    query=query,
+                    collection_scope=scope,
+                    collection_version=version,
+                    result_json=json.dumps(payload),
+                    hit_count=0,
+                    created_at=now,
+                    last_accessed_at=now,
+                )
+            )
+            session.flush()
+            evicted = self._evict(session)
+
+        if stale:
+            with self._lock:
+                self._memory.clear()
+        self._remember(key, payload)
+        if stale or evicted:
+            logger.debug(
+                f"Match cache: dropped {stale} stale and evicted {evicted} entries"
+            )
+
+    def invalidate(self) -> int:
+        """Remove every cached result.
+
+        Returns:
+            Number of rows deleted.
+        """
+        with self._lock:
+            self._memory.clear()
+        with self.repository.transaction() as session:
+            return session.query(MatchResultCacheEntry).delete(
+                synchronize_session=False
+            )
+
+    def _evict(self, session) -> int:
+        """Delete the least recently used rows beyond ``max_entries``."""
+        total = session.query(MatchResultCacheEntry).count()
+        excess = total - self.max_entries
+        if excess <= 0:
+            return 0
+        oldest = [
+            key
+            for (key,) in session.query(MatchResultCacheEntry.cache_key)
+            .order_by(MatchResultCacheEntry.last_accessed_at.asc())
+            .limit(excess)
+            .all()
+        ]
+        session.query(MatchResultCacheEntry).filter(
+            MatchResultCacheEntry.cache_key.in_(oldest)
+        ).delete(synchronize_session=False)
+        with self._lock:
+            for key in oldest:
+                self._memory.pop(key, None)
+        return len(oldest)
+
+    def _remember(self, key: str, payload: Dict[str, Any]) -> None:
+        if self.memory_entries <= 0:
+            return
+        with self._lock:
+            self._memory[key] = payload
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
@@ -0,0 +1,170 @@
+"""Add fleet drift scan tables
+
+Revision ID: 20260313_0001_add_fleet_drift_tables
+Revises: 20260312_0001_add_bom_signature_fields
+Create Date: 2026-03-13 00:01:00.000000+00:00
+
+Background
+----------
+Fleet drift scanning (``skillmeat.core.fleet_drift``) checks every registered
+project against the collection in one run and stores the results as a drift
+matrix that the UI can page through.  Scans are resumable: a scan row tracks
+progress and projects that already have entries are skipped on resume.
+
+Tables Created
+--------------
+1. ``drift_scans`` — One row per fleet scan with status and progress counters.
+2. ``drift_scan_entries`` — One row per (scan, project, deployed artifact)
+   carrying the drift type and the deployed/collection/project hashes.
+
+Dialect Strategy
+----------------
+Plain ``op.create_table()`` / ``op.create_index()`` calls; the ``IN``
+check constraints are ANSI SQL and work on SQLite and PostgreSQL.
+
+Idempotency
+-----------
+Tables that already exist (e.g. created via ``Base.metadata.create_all``)
+are skipped.
+
+Downgrade
+---------
+Drops ``drift_scan_entries`` then ``drift_scans``.
+
+Schema reference
+----------------
+skillmeat/cache/models.py  (DriftScan, DriftScanEntry)
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# ---------------------------------------------------------------------------
+# Revision identifiers
+# ---------------------------------------------------------------------------
+
+revision: str = "20260313_0001_add_fleet_drift_tables"
+down_revision: Union[str, None] = "20260312_0001_add_bom_signature_fields"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+log = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Upgrade
+# ---------------------------------------------------------------------------
+
+
+def upgrade() -> None:
+    """Create the drift_scans and drift_scan_entries tables."""
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    # ------------------------------------------------------------------
+    # 1. drift_scans
+    # ------------------------------------------------------------------
+    if "drift_scans" in existing:
+        log.info("add_fleet_drift_tables: drift_scans already exists; skipping.")
+    else:
+        op.create_table(
+            "drift_scans",
+            sa.Column("id", sa.String(), primary_key=True),
+            sa.Column("collection_name", sa.String(), nullable=True),
+            sa.Column(
+                "status", sa.String(), nullable=False, server_default="pending"
+            ),
+            sa.Column("total_projects", sa.Integer(), nullable=False),
+            sa.Column("scanned_projects", sa.Integer(), nullable=False),
+            sa.Column("failed_projects", sa.Integer(), nullable=False),
+            sa.Column("drifted_artifacts", sa.Integer(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("started_at", sa.DateTime(), nullable=True),
+            sa.Column("finished_at", sa.DateTime(), nullable=True),
+            sa.Column("error_message", sa.Text(), nullable=True),
+            sa.CheckConstraint(
+                "status IN ('pending', 'running', 'completed', 'cancelled', 'failed')",
+                name="check_drift_scan_status",
+            ),
+        )
+        op.create_index(
+            "idx_drift_scans_created_at", "drift_scans", ["created_at"]
+        )
+
+    # ------------------------------------------------------------------
+    # 2. drift_scan_entries
+    # ------------------------------------------------------------------
+    if "drift_scan_entries" in existing:
+        log.info(
+            "add_fleet_drift_tables: drift_scan_entries already exists; skipping."
+        )
+    else:
+        op.create_table(
+            "drift_scan_entries",
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column(
+                "scan_id",
+                sa.String(),
+                sa.ForeignKey("drift_scans.id", ondelete="CASCADE"),
+                nullable=False,
+            ),
+            sa.Column("project_id", sa.String(), nullable=False),
+            sa.Column("project_path", sa.String(), nullable=False),
+            sa.Column("artifact_name", sa.String(), nullable=False),
+            sa.Column("artifact_type", sa.String(), nullable=False),
+            sa.Column("profile_id", sa.String(), nullable=False),
+            sa.Column("drift_type", sa.String(), nullable=False),
+            sa.Column("recommendation", sa.String(), nullable=True),
+            sa.Column("deployed_sha", sa.String(), nullable=True),
+            sa.Column("collection_sha", sa.String(), nullable=True),
+            sa.Column("project_sha", sa.String(), nullable=True),
+            sa.Column("scanned_at", sa.DateTime(), nullable=False),
+            sa.CheckConstraint(
+                "drift_type IN ('synced', 'modified', 'outdated', 'conflict', 'removed')",
+                name="check_drift_scan_entry_type",
+            ),
+            sa.UniqueConstraint(
+                "scan_id",
+                "project_id",
+                "artifact_type",
+                "artifact_name",
+                "profile_id",
+                name="uq_drift_scan_entry",
+            ),
+        )
+        op.create_index(
+            "idx_drift_scan_entries_scan_project",
+            "drift_scan_entries",
+            ["scan_id", "project_id"],
+        )
+        op.create_index(
+            "idx_drift_scan_entries_scan_type",
+            "drift_scan_entries",
+            ["scan_id", "drift_type"],
+        )
+
+    log.info("add_fleet_drift_tables: upgrade complete.")
+
+
+# ---------------------------------------------------------------------------
+# Downgrade
+# ---------------------------------------------------------------------------
+
+
+def downgrade() -> None:
+    """Drop the fleet drift tables (entries first, then scans)."""
+    op.drop_index(
+        "idx_drift_scan_entries_scan_type", table_name="drift_scan_entries"
+    )
+    op.drop_index(
+        "idx_drift_scan_entries_scan_project", table_name="drift_scan_entries"
+    )
+    op.drop_table("drift_scan_entries")
+
+    op.drop_index("idx_drift_scans_created_at", table_name="drift_scans")
+    op.drop_table("drift_scans")
+    log.info("add_fleet_drift_tables: downgrade complete.")
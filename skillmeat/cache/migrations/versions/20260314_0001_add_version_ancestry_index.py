@@ -0,0 +1,196 @@
+"""Add ancestry index columns to artifact_versions
+
+Revision ID: 20260314_0001_add_version_ancestry_index
+Revises: 20260313_0001_add_fleet_drift_tables
+Create Date: 2026-03-14 00:01:00.000000+00:00
+
+Background
+----------
+``artifact_versions.version_lineage`` stored the full ancestor list as a JSON
+array on every row, so each new version copied (and grew) its parent's list
+and lineage queries decoded whole chains.  Lineage queries now use a
+binary-lifting ancestry index (``skillmeat.core.version_lineage``): each row
+stores its depth and ``2**k``-th ancestor hashes, and ``version_lineage`` is
+kept only as a bounded display window.
+
+Changes
+-------
+1. Add ``lineage_depth`` (Integer, nullable) to ``artifact_versions``.
+2. Add ``ancestor_skips`` (Text, nullable, JSON array) to ``artifact_versions``.
+3. Backfill both columns from ``(content_hash, parent_hash)``.
+
+Dialect Strategy
+----------------
+* ``op.add_column`` for nullable columns works on SQLite and PostgreSQL.
+* The backfill reads all ``(id, content_hash, parent_hash)`` triples once and
+  issues plain parameterised ``UPDATE`` statements.
+
+Idempotency
+-----------
+Columns that already exist are not re-added.  Only rows whose
+``lineage_depth`` is still NULL are backfilled.
+
+Downgrade
+---------
+Drops both columns using ``batch_alter_table`` (required for SQLite).
+
+Schema reference
+----------------
+skillmeat/cache/models.py  (ArtifactVersion)
+skillmeat/core/version_lineage.py  (compute_ancestry, build_ancestry_index)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import text
+
+from skillmeat.cache.migrations.dialect_helpers import is_sqlite
+
+# ---------------------------------------------------------------------------
+# Revision identifiers
+# ---------------------------------------------------------------------------
+
+revision: str = "20260314_0001_add_version_ancestry_index"
+down_revision: Union[str, None] = "20260313_0001_add_fleet_drift_tables"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+log = logging.getLogger(__name__)
+
+_TABLE = "artifact_versions"
+_COLUMNS = (
+    ("lineage_depth", sa.Integer()),
+    ("ancestor_skips", sa.Text()),
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _column_exists(bind: sa.engine.Connection, column: str) -> bool:
+    """Return True if ``column`` already exists on ``artifact_versions``."""
+    if is_sqlite():
+        result = bind.execute(text(f"PRAGMA table_info({_TABLE})"))
+        return any(row[1] == column for row in result.fetchall())
+    else:
+        result = bind.execute(
+            text(
+                """
+                SELECT 1
+                FROM information_schema.columns
+                WHERE table_name = :tbl
+                  AND column_name = :col
+                """
+            ),
+            {"tbl": _TABLE, "col": column},
+        )
+        return result.fetchone() is not None
+
+
+def _build_index(
+    parents: Dict[str, Optional[str]],
+) -> Dict[str, Tuple[int, List[str]]]:
+    """Compute (depth, skip pointers) for every hash in ``parents``.
+
+    Kept self-contained (rather than importing ``skillmeat.core``) so the
+    migration does not change behaviour if application code moves on.
+    """
+    index: Dict[str, Tuple[int, List[str]]] = {}
+    for start in parents:
+        chain: List[str] = []
+        seen = set()
+        current: Optional[str] = start
+        while current is not None and current in parents and current not in index:
+            if current in seen:
+                break
+            seen.add(current)
+            chain.append(current)
+            current = parents[current]
+
+        for content_hash in reversed(chain):
+            parent_hash = parents[content_hash]
+            parent_entry = index.get(parent_hash) if parent_hash else None
+            if parent_hash is None:
+                index[content_hash] = (0, [])
+            elif parent_entry is None:
+                index[content_hash] = (1, [parent_hash])
+            else:
+                skips = [parent_hash]
+                entry: Optional[Tuple[int, List[str]]] = parent_entry
+                k = 0
+                while entry is not None and k < len(entry[1]):
+                    skips.append(entry[1][k])
+                    entry = index.get(entry[1][k])
+                    k += 1
+                index[content_hash] = (parent_entry[0] + 1, skips)
+    return index
+
+
+# ---------------------------------------------------------------------------
+# Upgrade
+# ---------------------------------------------------------------------------
+
+
+def upgrade() -> None:
+    """Add and backfill the ancestry index columns."""
+    bind = op.get_bind()
+
+    for column, column_type in _COLUMNS:
+        if _column_exists(bind, column):
+            log.info(
+                "add_version_ancestry_index: column %r already exists; skipping.",
+                column,
+            )
+            continue
+        op.add_column(_TABLE, sa.Column(column, column_type, nullable=True))
+
+    rows = bind.execute(
+        text(
+            f"SELECT id, content_hash, parent_hash, lineage_depth FROM {_TABLE}"
+        )
+    ).fetchall()
+    parents = {row[1]: row[2] for row in rows}
+    index = _build_index(parents)
+
+    updated = 0
+    for row_id, content_hash, _parent_hash, lineage_depth in rows:
+        if lineage_depth is not None or content_hash not in index:
+            continue
+        depth, skips = index[content_hash]
+        bind.execute(
+            text(
+                f"UPDATE {_TABLE} SET lineage_depth = :depth, "
+                "ancestor_skips = :skips WHERE id = :id"
+            ),
+            {
+                "depth": depth,
+                # Roots store NULL, matching ArtifactVersion.set_ancestor_skips
+                "skips": json.dumps(skips) if skips else None,
+                "id": row_id,
+            },
+        )
+        updated += 1
+
+    log.info("add_version_ancestry_index: backfilled %d row(s).", updated)
+    log.info("add_version_ancestry_index: upgrade complete.")
+
+
+# ---------------------------------------------------------------------------
+# Downgrade
+# ---------------------------------------------------------------------------
+
+
+def downgrade() -> None:
+    """Drop the ancestry index columns from artifact_versions."""
+    with op.batch_alter_table(_TABLE) as batch_op:
+        batch_op.drop_column("ancestor_skips")
+        batch_op.drop_column("lineage_depth")
+    log.info("add_version_ancestry_index: downgrade complete.")
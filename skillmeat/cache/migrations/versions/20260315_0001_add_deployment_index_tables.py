@@ -0,0 +1,140 @@
+"""Add deployment index tables
+
+Revision ID: 20260315_0001_add_deployment_index_tables
+Revises: 20260314_0001_add_version_ancestry_index
+Create Date: 2026-03-15 00:01:00.000000+00:00
+
+Background
+----------
+Version graphs list every deployment of one artifact across all projects.
+They used to re-discover projects and re-read every deployment tracker file
+per request.  ``skillmeat.cache.deployment_index`` now keeps the parsed
+records in the cache DB and re-reads a project only when its tracker files
+change.
+
+Tables Created
+--------------
+1. ``deployment_index_projects`` — One row per indexed project with the
+   stat-based signature of its deployment tracker files.
+2. ``deployment_index_entries`` — One row per deployment record, indexed by
+   (artifact_type, artifact_name) and carrying the record as JSON.
+
+Dialect Strategy
+----------------
+Plain ``op.create_table()`` / ``op.create_index()`` calls; works on SQLite
+and PostgreSQL.
+
+Idempotency
+-----------
+Tables that already exist (e.g. created via ``Base.metadata.create_all``)
+are skipped.
+
+Downgrade
+---------
+Drops ``deployment_index_entries`` then ``deployment_index_projects``.
+
+Schema reference
+----------------
+skillmeat/cache/models.py  (DeploymentIndexProject, DeploymentIndexEntry)
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# ---------------------------------------------------------------------------
+# Revision identifiers
+# ---------------------------------------------------------------------------
+
+revision: str = "20260315_0001_add_deployment_index_tables"
+down_revision: Union[str, None] = "20260314_0001_add_version_ancestry_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+log = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Upgrade
+# ---------------------------------------------------------------------------
+
+
+def upgrade() -> None:
+    """Create the deployment index tables."""
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    # ------------------------------------------------------------------
+    # 1. deployment_index_projects
+    # ------------------------------------------------------------------
+    if "deployment_index_projects" in existing:
+        log.info(
+            "add_deployment_index_tables: deployment_index_projects already "
+            "exists; skipping."
+        )
+    else:
+        op.create_table(
+            "deployment_index_projects",
+            sa.Column("project_path", sa.String(), primary_key=True),
+            sa.Column("tracker_signature", sa.Text(), nullable=False),
+            sa.Column("deployment_count", sa.Integer(), nullable=False),
+            sa.Column("indexed_at", sa.DateTime(), nullable=False),
+        )
+
+    # ------------------------------------------------------------------
+    # 2. deployment_index_entries
+    # ------------------------------------------------------------------
+    if "deployment_index_entries" in existing:
+        log.info(
+            "add_deployment_index_tables: deployment_index_entries already "
+            "exists; skipping."
+        )
+    else:
+        op.create_table(
+            "deployment_index_entries",
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column(
+                "project_path",
+                sa.String(),
+                sa.ForeignKey(
+                    "deployment_index_projects.project_path", ondelete="CASCADE"
+                ),
+                nullable=False,
+            ),
+            sa.Column("artifact_type", sa.String(), nullable=False),
+            sa.Column("artifact_name", sa.String(), nullable=False),
+            sa.Column("deployment_json", sa.Text(), nullable=False),
+        )
+        op.create_index(
+            "idx_deployment_index_artifact",
+            "deployment_index_entries",
+            ["artifact_type", "artifact_name"],
+        )
+        op.create_index(
+            "idx_deployment_index_project",
+            "deployment_index_entries",
+            ["project_path"],
+        )
+
+    log.info("add_deployment_index_tables: upgrade complete.")
+
+
+# ---------------------------------------------------------------------------
+# Downgrade
+# ---------------------------------------------------------------------------
+
+
+def downgrade() -> None:
+    """Drop the deployment index tables (entries first, then projects)."""
+    op.drop_index(
+        "idx_deployment_index_project", table_name="deployment_index_entries"
+    )
+    op.drop_index(
+        "idx_deployment_index_artifact", table_name="deployment_index_entries"
+    )
+    op.drop_table("deployment_index_entries")
+    op.drop_table("deployment_index_projects")
+    log.info("add_deployment_index_tables: downgrade complete.")
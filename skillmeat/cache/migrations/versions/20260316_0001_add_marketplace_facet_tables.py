@@ -0,0 +1,120 @@
+"""Add marketplace facet tables
+
+Revision ID: 20260316_0001_add_marketplace_facet_tables
+Revises: 20260315_0001_add_deployment_index_tables
+Create Date: 2026-03-16 00:01:00.000000+00:00
+
+Background
+----------
+The marketplace source listing shows artifact-type, tag and trust-level
+facet counts on every page load.  They used to be aggregated from every
+source and catalog entry per request.  ``skillmeat.cache.marketplace_facets``
+now keeps the totals in the cache DB and updates them incrementally whenever
+a source, its scan results or an entry's exclusion state changes.
+
+Tables Created
+--------------
+1. ``marketplace_facet_counts`` — One row per (facet, value) with the number
+   of sources and counted catalog entries behind it.
+2. ``marketplace_source_facets`` — The contribution last applied for each
+   source, used to compute deltas.
+
+Backfill
+--------
+None.  The facet service rebuilds both tables on first read when the number
+of recorded source contributions does not match ``marketplace_sources``.
+
+Dialect Strategy
+----------------
+Plain ``op.create_table()`` calls; works on SQLite and PostgreSQL.
+
+Idempotency
+-----------
+Tables that already exist (e.g. created via ``Base.metadata.create_all``)
+are skipped.
+
+Downgrade
+---------
+Drops both tables.
+
+Schema reference
+----------------
+skillmeat/cache/models.py  (MarketplaceFacetCount, MarketplaceSourceFacets)
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# ---------------------------------------------------------------------------
+# Revision identifiers
+# ---------------------------------------------------------------------------
+
+revision: str = "20260316_0001_add_marketplace_facet_tables"
+down_revision: Union[str, None] = "20260315_0001_add_deployment_index_tables"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+log = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Upgrade
+# ---------------------------------------------------------------------------
+
+
+def upgrade() -> None:
+    """Create the marketplace facet tables."""
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    # ------------------------------------------------------------------
+    # 1. marketplace_facet_counts
+    # ------------------------------------------------------------------
+    if "marketplace_facet_counts" in existing:
+        log.info(
+            "add_marketplace_facet_tables: marketplace_facet_counts already "
+            "exists; skipping."
+        )
+    else:
+        op.create_table(
+            "marketplace_facet_counts",
+            sa.Column("facet", sa.String(), primary_key=True),
+            sa.Column("value", sa.String(), primary_key=True),
+            sa.Column("source_count", sa.Integer(), nullable=False),
+            sa.Column("artifact_count", sa.Integer(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+        )
+
+    # ------------------------------------------------------------------
+    # 2. marketplace_source_facets
+    # ------------------------------------------------------------------
+    if "marketplace_source_facets" in existing:
+        log.info(
+            "add_marketplace_facet_tables: marketplace_source_facets already "
+            "exists; skipping."
+        )
+    else:
+        op.create_table(
+            "marketplace_source_facets",
+            sa.Column("source_id", sa.String(), primary_key=True),
+            sa.Column("facets_json", sa.Text(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+        )
+
+    log.info("add_marketplace_facet_tables: upgrade complete.")
+
+
+# ---------------------------------------------------------------------------
+# Downgrade
+# ---------------------------------------------------------------------------
+
+
+def downgrade() -> None:
+    """Drop the marketplace facet tables."""
+    op.drop_table("marketplace_source_facets")
+    op.drop_table("marketplace_facet_counts")
+    log.info("add_marketplace_facet_tables: downgrade complete.")
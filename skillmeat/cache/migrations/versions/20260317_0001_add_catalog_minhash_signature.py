@@ -0,0 +1,104 @@
+"""Add minhash_signature column to marketplace_catalog_entries
+
+Revision ID: 20260317_0001_add_catalog_minhash_signature
+Revises: 20260316_0001_add_marketplace_facet_tables
+Create Date: 2026-03-17 00:01:00.000000+00:00
+
+Background
+----------
+Deduplication only caught exact content-hash matches, so forks with a
+changed line or reformatted frontmatter were catalogued as distinct
+artifacts.  ``skillmeat.core.marketplace.minhash`` computes a MinHash
+signature per catalog entry; LSH banding over the stored signatures finds
+near-duplicate clusters without comparing every pair of entries.
+
+Changes
+-------
+1. Add column ``minhash_signature`` (Text, nullable) to
+   ``marketplace_catalog_entries``.
+
+Backfill
+--------
+None.  Signatures are written on the next scan of each source, or by
+``MarketplaceCatalogRepository.compute_missing_signatures()``.
+
+Dialect Strategy
+----------------
+Plain ``op.add_column`` for a nullable column works on SQLite and PostgreSQL.
+
+Idempotency
+-----------
+Skipped when the column already exists (e.g. created via
+``Base.metadata.create_all``).
+
+Downgrade
+---------
+Drops the column using ``batch_alter_table`` (required for SQLite).
+
+Schema reference
+----------------
+skillmeat/cache/models.py  (MarketplaceCatalogEntry.minhash_signature)
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# ---------------------------------------------------------------------------
+# Revision identifiers
+# ---------------------------------------------------------------------------
+
+revision: str = "20260317_0001_add_catalog_minhash_signature"
+down_revision: Union[str, None] = "20260316_0001_add_marketplace_facet_tables"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+log = logging.getLogger(__name__)
+
+_TABLE = "marketplace_catalog_entries"
+_COLUMN = "minhash_signature"
+
+
+# ---------------------------------------------------------------------------
+# Upgrade
+# ---------------------------------------------------------------------------
+
+
+def upgrade() -> None:
+    """Add minhash_signature column to marketplace_catalog_entries."""
+    columns = {c["name"] for c in sa.inspect(op.get_bind()).get_columns(_TABLE)}
+    if _COLUMN in columns:
+        log.info(
+            "add_catalog_minhash_signature: column %r already exists on %r; "
+            "skipping.",
+            _COLUMN,
+            _TABLE,
+        )
+        return
+
+    op.add_column(
+        _TABLE,
+        sa.Column(
+            _COLUMN,
+            sa.Text(),
+            nullable=True,
+            comment="Base64 MinHash signature of the entry's indexed text",
+        ),
+    )
+    log.info("add_catalog_minhash_signature: upgrade complete.")
+
+
+# ---------------------------------------------------------------------------
+# Downgrade
+# ---------------------------------------------------------------------------
+
+
+def downgrade() -> None:
+    """Drop minhash_signature from marketplace_catalog_entries."""
+    with op.batch_alter_table(_TABLE) as batch_op:
+        batch_op.drop_column(_COLUMN)
+    log.info("add_catalog_minhash_signature: downgrade complete.")
@@ -0,0 +1,103 @@
+"""Add match_result_cache table
+
+Revision ID: 20260318_0001_add_match_result_cache
+Revises: 20260317_0001_add_catalog_minhash_signature
+Create Date: 2026-03-18 00:01:00.000000+00:00
+
+Background
+----------
+``skillmeat match`` and ``GET /match`` rescored every artifact on each call,
+even when neither the query nor the collection had changed.
+``skillmeat.cache.match_cache`` stores finished scoring results keyed by the
+normalized query, the collection's content version, the scorer
+configuration and the project context, with LRU eviction.
+
+Tables Created
+--------------
+1. ``match_result_cache`` — One row per cached scoring result.
+
+Backfill
+--------
+None.  The cache fills as queries are run.
+
+Dialect Strategy
+----------------
+Plain ``op.create_table()`` / ``op.create_index()`` calls; works on SQLite
+and PostgreSQL.
+
+Idempotency
+-----------
+Skipped when the table already exists (e.g. created via
+``Base.metadata.create_all``).
+
+Downgrade
+---------
+Drops the table and its indexes.
+
+Schema reference
+----------------
+skillmeat/cache/models.py  (MatchResultCacheEntry)
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# ---------------------------------------------------------------------------
+# Revision identifiers
+# ---------------------------------------------------------------------------
+
+revision: str = "20260318_0001_add_match_result_cache"
+down_revision: Union[str, None] = "20260317_0001_add_catalog_minhash_signature"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+log = logging.getLogger(__name__)
+
+_TABLE = "match_result_cache"
+
+
+# ---------------------------------------------------------------------------
+# Upgrade
+# ---------------------------------------------------------------------------
+
+
+def upgrade() -> None:
+    """Create the match_result_cache table."""
+    if _TABLE in set(sa.inspect(op.get_bind()).get_table_names()):
+        log.info("add_match_result_cache: %s already exists; skipping.", _TABLE)
+        return
+
+    op.create_table(
+        _TABLE,
+        sa.Column("cache_key", sa.String(), primary_key=True),
+        sa.Column("query", sa.Text(), nullable=False),
+        sa.Column("collection_scope", sa.String(), nullable=False),
+        sa.Column("collection_version", sa.String(), nullable=False),
+        sa.Column("result_json", sa.Text(), nullable=False),
+        sa.Column("hit_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("last_accessed_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index(
+        "idx_match_result_cache_accessed", _TABLE, ["last_accessed_at"]
+    )
+    op.create_index("idx_match_result_cache_scope", _TABLE, ["collection_scope"])
+    log.info("add_match_result_cache: upgrade complete.")
+
+
+# ---------------------------------------------------------------------------
+# Downgrade
+# ---------------------------------------------------------------------------
+
+
+def downgrade() -> None:
+    """Drop the match_result_cache table."""
+    op.drop_index("idx_match_result_cache_scope", table_name=_TABLE)
+    op.drop_index("idx_match_result_cache_accessed", table_name=_TABLE)
+    op.drop_table(_TABLE)
+    log.info("add_match_result_cache: downgrade complete.")
@@ -682,7 +682,11 @@ class ArtifactVersion(Base):
         content_hash: SHA-256 hash of artifact content (UNIQUE)
         parent_hash: Content hash of parent version (NULL for root)
         change_origin: Origin of this version ('deployment', 'sync', 'local_modification')
-        version_lineage: JSON array of ancestor content hashes
+        version_lineage: JSON array of recent ancestor content hashes (bounded
+            display window; legacy rows may hold the full history)
+        lineage_depth: Generations from the root version (0 = root)
+        ancestor_skips: JSON array of skip-pointer ancestors; element ``k`` is
+            the content hash of the ``2**k``-th ancestor
         created_at: Timestamp when version was created
         metadata_json: Additional JSON metadata
         artifact: Related Artifact object
@@ -715,6 +719,12 @@ class ArtifactVersion(Base):
         Text, nullable=True
     )  # JSON array
 
+    # Ancestry index (see skillmeat.core.version_lineage)
+    lineage_depth: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    ancestor_skips: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True
+    )  # JSON array
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime, nullable=False, default=datetime.utcnow
@@ -797,6 +807,32 @@ class ArtifactVersion(Base):
         else:
             self.version_lineage = json.dumps(hashes)
 
+    def get_ancestor_skips(self) -> List[str]:
+        """Parse ancestor_skips JSON to list.
+
+        Returns:
+            Skip-pointer ancestor hashes (index ``k`` = ``2**k``-th ancestor),
+            or empty list for roots and unindexed rows
+        """
+        if not self.ancestor_skips:
+            return []
+
+        try:
+            skips = json.loads(self.ancestor_skips)
+            if isinstance(skips, list):
+                return skips
+            return []
+        except (json.JSONDecodeError, TypeError):
+            return []
+
+    def set_ancestor_skips(self, hashes: List[str]) -> None:
+        """Serialize skip-pointer ancestor hashes to ancestor_skips JSON.
+
+        Args:
+            hashes: Skip-pointer ancestor hashes
+        """
+        self.ancestor_skips = json.dumps(hashes) if hashes else None
+
     def get_metadata_dict(self) -> Optional[Dict[str, Any]]:
         """Parse and return metadata as dictionary.
 
@@ -2144,6 +2180,13 @@ class MarketplaceCatalogEntry(Base):
         comment="JSON array of files included in deep index",
     )
 
+    # Near-duplicate detection (skillmeat.core.marketplace.minhash)
+    minhash_signature: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True,
+        comment="Base64 MinHash signature of the entry's indexed text",
+    )
+
     # PostgreSQL full-text search vector (managed by DB trigger on PostgreSQL)
     # Uses dialect-adaptive TSVectorType: native TSVECTOR on PostgreSQL, Text on SQLite.
     # On SQLite the column exists in the model but is never populated or queried.
@@ -5656,3 +5699,352 @@ class ScopeValidator(Base):
             "description": self.description,
             "created_at": self.created_at.isoformat() if self.created_at else None,
         }
+
+
+# =============================================================================
+# Fleet Drift Models
+# =============================================================================
+
+
+class DriftScan(Base):
+    """One fleet-wide drift scan across all registered projects.
+
+    A scan row tracks progress so that an interrupted or cancelled run can be
+    resumed: projects that already have entries for the scan are skipped.
+
+    Attributes:
+        id: Unique scan identifier (hex UUID)
+        collection_name: Collection compared against (None = per-deployment)
+        status: 'pending', 'running', 'completed', 'cancelled', or 'failed'
+        total_projects: Number of projects considered by the scan
+        scanned_projects: Number of projects whose results are stored
+        failed_projects: Number of projects that raised during the last run
+        drifted_artifacts: Number of stored entries with drift
+        created_at: Timestamp when the scan was created
+        started_at: Timestamp when the scan last started or resumed
+        finished_at: Timestamp when the scan last stopped
+        error_message: Error message if status is 'failed'
+    """
+
+    __tablename__ = "drift_scans"
+
+    id: Mapped[str] = mapped_column(
+        String, primary_key=True, default=lambda: uuid.uuid4().hex
+    )
+    collection_name: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    status: Mapped[str] = mapped_column(
+        String, nullable=False, default="pending", server_default="pending"
+    )
+
+    # Progress counters
+    total_projects: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    scanned_projects: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed_projects: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    drifted_artifacts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow
+    )
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('pending', 'running', 'completed', 'cancelled', 'failed')",
+            name="check_drift_scan_status",
+        ),
+        Index("idx_drift_scans_created_at", "created_at"),
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of DriftScan."""
+        return (
+            f"<DriftScan(id={self.id!r}, status={self.status!r}, "
+            f"scanned={self.scanned_projects}/{self.total_projects})>"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert DriftScan to dictionary for JSON serialization."""
+        return {
+            "id": self.id,
+            "collection_name": self.collection_name,
+            "status": self.status,
+            "total_projects": self.total_projects,
+            "scanned_projects": self.scanned_projects,
+            "failed_projects": self.failed_projects,
+            "drifted_artifacts": self.drifted_artifacts,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "error_message": self.error_message,
+        }
+
+
+class DriftScanEntry(Base):
+    """One cell of the fleet drift matrix: a deployed artifact in a project.
+
+    Every deployment seen by a scan gets an entry, including ``synced`` ones,
+    so the matrix can be paged by project, artifact, or drift type.
+
+    Attributes:
+        id: Auto-increment primary key
+        scan_id: Owning DriftScan (CASCADE delete)
+        project_id: Cache project identifier
+        project_path: Absolute project path at scan time
+        artifact_name: Deployed artifact name
+        artifact_type: Deployed artifact type
+        profile_id: Deployment profile the artifact was deployed to
+        drift_type: 'synced', 'modified', 'outdated', 'conflict', or 'removed'
+        recommendation: Suggested sync action (None when synced)
+        deployed_sha: Content hash recorded at deploy time
+        collection_sha: Current collection hash (None when removed)
+        project_sha: Current project hash when known
+        scanned_at: Timestamp when the project was scanned
+    """
+
+    __tablename__ = "drift_scan_entries"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    scan_id: Mapped[str] = mapped_column(
+        String,
+        ForeignKey("drift_scans.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    project_id: Mapped[str] = mapped_column(String, nullable=False)
+    project_path: Mapped[str] = mapped_column(String, nullable=False)
+    artifact_name: Mapped[str] = mapped_column(String, nullable=False)
+    artifact_type: Mapped[str] = mapped_column(String, nullable=False)
+    profile_id: Mapped[str] = mapped_column(
+        String, nullable=False, default="claude_code"
+    )
+    drift_type: Mapped[str] = mapped_column(String, nullable=False)
+    recommendation: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    deployed_sha: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    collection_sha: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    project_sha: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    scanned_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow
+    )
+
+    __table_args__ = (
+        CheckConstraint(
+            "drift_type IN ('synced', 'modified', 'outdated', 'conflict', 'removed')",
+            name="check_drift_scan_entry_type",
+        ),
+        UniqueConstraint(
+            "scan_id",
+            "project_id",
+            "artifact_type",
+            "artifact_name",
+            "profile_id",
+            name="uq_drift_scan_entry",
+        ),
+        Index("idx_drift_scan_entries_scan_project", "scan_id", "project_id"),
+        Index("idx_drift_scan_entries_scan_type", "scan_id", "drift_type"),
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of DriftScanEntry."""
+        return (
+            f"<DriftScanEntry(scan_id={self.scan_id!r}, "
+            f"project_id={self.project_id!r}, "
+            f"artifact={self.artifact_type}:{self.artifact_name}, "
+            f"drift_type={self.drift_type!r})>"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert DriftScanEntry to dictionary for JSON serialization."""
+        return {
+            "scan_id": self.scan_id,
+            "project_id": self.project_id,
+            "project_path": self.project_path,
+            "artifact_name": self.artifact_name,
+            "artifact_type": self.artifact_type,
+            "profile_id": self.profile_id,
+            "drift_type": self.drift_type,
+            "recommendation": self.recommendation,
+            "deployed_sha": self.deployed_sha,
+            "collection_sha": self.collection_sha,
+            "project_sha": self.project_sha,
+            "scanned_at": self.scanned_at.isoformat() if self.scanned_at else None,
+        }
+
+
+class DeploymentIndexProject(Base):
+    """A project whose deployment tracker files are held in the deployment index.
+
+    The tracker signature (path, mtime and size of every deployment file) is
+    compared on refresh so only projects whose deployment files changed are
+    re-read.
+
+    Attributes:
+        project_path: Absolute project path (primary key)
+        tracker_signature: Signature of the project's deployment files
+        deployment_count: Number of deployments indexed for the project
+        indexed_at: Timestamp when the project was last re-read
+    """
+
+    __tablename__ = "deployment_index_projects"
+
+    project_path: Mapped[str] = mapped_column(String, primary_key=True)
+    tracker_signature: Mapped[str] = mapped_column(Text, nullable=False)
+    deployment_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    indexed_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of DeploymentIndexProject."""
+        return (
+            f"<DeploymentIndexProject(project_path={self.project_path!r}, "
+            f"deployments={self.deployment_count})>"
+        )
+
+
+class DeploymentIndexEntry(Base):
+    """One deployment record from a project's deployment tracker file.
+
+    The full record is kept as JSON (``Deployment.to_dict()``) so callers get
+    back the same ``Deployment`` objects the tracker file would produce.
+
+    Attributes:
+        id: Auto-increment primary key
+        project_path: Owning DeploymentIndexProject (CASCADE delete)
+        artifact_type: Deployed artifact type
+        artifact_name: Deployed artifact name
+        deployment_json: JSON-serialized deployment record
+    """
+
+    __tablename__ = "deployment_index_entries"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    project_path: Mapped[str] = mapped_column(
+        String,
+        ForeignKey("deployment_index_projects.project_path", ondelete="CASCADE"),
+        nullable=False,
+    )
+    artifact_type: Mapped[str] = mapped_column(String, nullable=False)
+    artifact_name: Mapped[str] = mapped_column(String, nullable=False)
+    deployment_json: Mapped[str] = mapped_column(Text, nullable=False)
+
+    __table_args__ = (
+        Index("idx_deployment_index_artifact", "artifact_type", "artifact_name"),
+        Index("idx_deployment_index_project", "project_path"),
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of DeploymentIndexEntry."""
+        return (
+            f"<DeploymentIndexEntry(project_path={self.project_path!r}, "
+            f"artifact={self.artifact_type}:{self.artifact_name})>"
+        )
+
+
+class MarketplaceFacetCount(Base):
+    """Precomputed marketplace facet count (one row per facet value).
+
+    Maintained incrementally by ``skillmeat.cache.marketplace_facets`` so the
+    source listing can show type, tag and trust-level counts without
+    aggregating over every source and catalog entry.
+
+    Attributes:
+        facet: Facet name ("artifact_type", "tag" or "trust_level")
+        value: Facet value (e.g. "skill", "python", "verified")
+        source_count: Number of sources carrying this value
+        artifact_count: Number of counted catalog entries behind those sources
+        updated_at: Timestamp of the last change to this row
+    """
+
+    __tablename__ = "marketplace_facet_counts"
+
+    facet: Mapped[str] = mapped_column(String, primary_key=True)
+    value: Mapped[str] = mapped_column(String, primary_key=True)
+    source_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    artifact_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of MarketplaceFacetCount."""
+        return (
+            f"<MarketplaceFacetCount({self.facet}={self.value!r}, "
+            f"sources={self.source_count}, artifacts={self.artifact_count})>"
+        )
+
+
+class MarketplaceSourceFacets(Base):
+    """The facet contribution last applied for one marketplace source.
+
+    Kept so that a change to a source (or its catalog entries) can be applied
+    to ``marketplace_facet_counts`` as a delta.  Deliberately has no foreign
+    key: the row must outlive the source so its contribution can be removed
+    after the source is deleted.
+
+    Attributes:
+        source_id: Marketplace source ID (primary key)
+        facets_json: JSON list of ``[facet, value, artifact_count]`` triples
+        updated_at: Timestamp of the last refresh
+    """
+
+    __tablename__ = "marketplace_source_facets"
+
+    source_id: Mapped[str] = mapped_column(String, primary_key=True)
+    facets_json: Mapped[str] = mapped_column(Text, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of MarketplaceSourceFacets."""
+        return f"<MarketplaceSourceFacets(source_id={self.source_id!r})>"
+
+
+class MatchResultCacheEntry(Base):
+    """Cached result of one ``ScoringService.score_artifacts`` call.
+
+    Keyed by a digest of the normalized query, the scored collection's
+    content version, the scorer configuration and the project context.
+    ``skillmeat.cache.match_cache`` evicts least recently used rows once the
+    table exceeds its size limit, and drops rows for an older content version
+    of the same collection when a newer one is stored.
+
+    Attributes:
+        cache_key: SHA-256 digest of the key components (primary key)
+        query: Normalized query text
+        collection_scope: Digest of the scored artifact names
+        collection_version: Digest of the scored artifacts' content
+        result_json: JSON-serialized scoring result
+        hit_count: Number of times the row was served
+        created_at: Timestamp when the result was stored
+        last_accessed_at: Timestamp of the last store or hit (LRU order)
+    """
+
+    __tablename__ = "match_result_cache"
+
+    cache_key: Mapped[str] = mapped_column(String, primary_key=True)
+    query: Mapped[str] = mapped_column(Text, nullable=False)
+    collection_scope: Mapped[str] = mapped_column(String, nullable=False)
+    collection_version: Mapped[str] = mapped_column(String, nullable=False)
+    result_json: Mapped[str] = mapped_column(Text, nullable=False)
+    hit_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow
+    )
+    last_accessed_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow
+    )
+
+    __table_args__ = (
+        Index("idx_match_result_cache_accessed", "last_accessed_at"),
+        Index("idx_match_result_cache_scope", "collection_scope"),
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of MatchResultCacheEntry."""
+        return (
+            f"<MatchResultCacheEntry(query={self.query!r}, "
+            f"hits={self.hit_count})>"
+        )
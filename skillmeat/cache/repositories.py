@@ -72,6 +72,23 @@ from sqlalchemy import and_, func, or_, select, text, update
 from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.orm import Session, joinedload
 
+from skillmeat.cache.loading import (
+    ARTIFACT_REFERENCE,
+    ARTIFACT_SUMMARY,
+    COLLECTION_SUMMARY,
+    MARKETPLACE_SOURCE_DETAIL,
+    MARKETPLACE_SOURCE_SUMMARY,
+    TAG_SUMMARY,
+    load_profile,
+)
+from skillmeat.cache.marketplace_facets import (
+    FacetTable,
+    ensure_facets,
+    read_facets,
+    rebuild_facets,
+    refresh_source_facets,
+    verify_facets,
+)
 from skillmeat.cache.models import (
     Artifact,
     ArtifactTag,
@@ -636,6 +653,7 @@ class ScanUpdateContext:
                 existing.description = new_entry.description
                 existing.search_tags = new_entry.search_tags
                 existing.search_text = new_entry.search_text
+                existing.minhash_signature = new_entry.minhash_signature
 
                 # Preserve: status, import_date, import_id, excluded_at, excluded_reason
                 preserved_count += 1
@@ -664,6 +682,7 @@ class ScanUpdateContext:
                 existing.description = new_entry.description
                 existing.search_tags = new_entry.search_tags
                 existing.search_text = new_entry.search_text
+                existing.minhash_signature = new_entry.minhash_signature
 
                 updated_count += 1
                 logger.debug(f"Updated entry: {existing.id} ({existing.name})")
@@ -1132,6 +1151,9 @@ class MarketplaceTransactionHandler:
             context = ScanUpdateContext(session, source_id)
             yield context
 
+            # Fold the new catalog into the precomputed facet counts
+            refresh_source_facets(session, source_id)
+
             # Commit on success
             session.commit()
             logger.info(f"Scan update transaction committed for source {source_id}")
@@ -1319,7 +1341,12 @@ class MarketplaceSourceRepository(BaseRepository[MarketplaceSource]):
         """
         session = self._get_session()
         try:
-            return session.query(MarketplaceSource).filter_by(id=source_id).first()
+            return (
+                session.query(MarketplaceSource)
+                .options(*load_profile(MARKETPLACE_SOURCE_DETAIL))
+                .filter_by(id=source_id)
+                .first()
+            )
         finally:
             session.close()
 
@@ -1340,7 +1367,12 @@ class MarketplaceSourceRepository(BaseRepository[MarketplaceSource]):
         """
         session = self._get_session()
         try:
-            return session.query(MarketplaceSource).filter_by(repo_url=repo_url).first()
+            return (
+                session.query(MarketplaceSource)
+                .options(*load_profile(MARKETPLACE_SOURCE_SUMMARY))
+                .filter_by(repo_url=repo_url)
+                .first()
+            )
         finally:
             session.close()
 
@@ -1356,7 +1388,11 @@ class MarketplaceSourceRepository(BaseRepository[MarketplaceSource]):
         """
         session = self._get_session()
         try:
-            return session.query(MarketplaceSource).all()
+            return (
+                session.query(MarketplaceSource)
+                .options(*load_profile(MARKETPLACE_SOURCE_SUMMARY))
+                .all()
+            )
         finally:
             session.close()
 
@@ -1409,6 +1445,7 @@ class MarketplaceSourceRepository(BaseRepository[MarketplaceSource]):
         session = self._get_session()
         try:
             session.add(source)
+            refresh_source_facets(session, source.id)
             session.commit()
             session.refresh(source)
             logger.info(f"Created marketplace source: {source.id} ({source.repo_url})")
@@ -1470,6 +1507,7 @@ class MarketplaceSourceRepository(BaseRepository[MarketplaceSource]):
 
             # Merge changes and get the merged instance
             merged = session.merge(source)
+            refresh_source_facets(session, merged.id)
             session.commit()
             session.refresh(merged)
             logger.info(f"Updated marketplace source: {source.id}")
@@ -1499,6 +1537,7 @@ class MarketplaceSourceRepository(BaseRepository[MarketplaceSource]):
                 return False
 
             session.delete(source)
+            refresh_source_facets(session, source_id)
             session.commit()
             logger.info(f"Deleted marketplace source: {source_id}")
             return True
@@ -1592,6 +1631,9 @@ class MarketplaceSourceRepository(BaseRepository[MarketplaceSource]):
             if counts_by_type is not None:
                 source.set_counts_by_type_dict(counts_by_type)
 
+            if tags is not None:
+                refresh_source_facets(session, source_id)
+
             session.commit()
             session.refresh(source)
             logger.info(f"Updated fields on marketplace source: {source_id}")
@@ -1630,7 +1672,9 @@ class MarketplaceSourceRepository(BaseRepository[MarketplaceSource]):
         """
         session = self._get_session()
         try:
-            query = session.query(MarketplaceSource)
+            query = session.query(MarketplaceSource).options(
+                *load_profile(MARKETPLACE_SOURCE_SUMMARY)
+            )
 
             # Apply cursor filter if provided
             if cursor:
@@ -1681,6 +1725,7 @@ class MarketplaceSourceRepository(BaseRepository[MarketplaceSource]):
         try:
             sources = (
                 session.query(MarketplaceSource)
+                .options(*load_profile(MARKETPLACE_SOURCE_SUMMARY))
                 .filter_by(scan_status=status)
                 .order_by(MarketplaceSource.updated_at.desc())
                 .all()
@@ -1718,6 +1763,7 @@ class MarketplaceSourceRepository(BaseRepository[MarketplaceSource]):
             # 3. Last scan resulted in error
             sources = (
                 session.query(MarketplaceSource)
+                .options(*load_profile(MARKETPLACE_SOURCE_SUMMARY))
                 .filter(
                     or_(
                         MarketplaceSource.last_sync_at.is_(None),
@@ -1775,6 +1821,7 @@ class MarketplaceSourceRepository(BaseRepository[MarketplaceSource]):
                 # Update existing source (preserve ID)
                 source.id = existing.id
                 merged = session.merge(source)
+                refresh_source_facets(session, merged.id)
                 session.commit()
                 session.refresh(merged)
                 logger.info(
@@ -1784,6 +1831,7 @@ class MarketplaceSourceRepository(BaseRepository[MarketplaceSource]):
             else:
                 # Create new source
                 session.add(source)
+                refresh_source_facets(session, source.id)
                 session.commit()
                 session.refresh(source)
                 logger.info(
@@ -1796,6 +1844,50 @@ class MarketplaceSourceRepository(BaseRepository[MarketplaceSource]):
         finally:
             session.close()
 
+    def get_facet_counts(self) -> FacetTable:
+        """Return precomputed facet counts across all sources.
+
+        Rebuilds the facet tables first if they do not cover every source
+        (e.g. a database created before they existed).
+
+        Returns:
+            Mapping of facet -> value -> :class:`FacetCount`
+
+        Example:
+            >>> facets = repo.get_facet_counts()
+            >>> facets["trust_level"]["verified"].source_count
+            3
+        """
+        session = self._get_session()
+        try:
+            if ensure_facets(session):
+                session.commit()
+            return read_facets(session)
+        finally:
+            session.close()
+
+    def verify_facet_counts(self, repair: bool = True) -> List[str]:
+        """Compare precomputed facet counts with live aggregates.
+
+        Args:
+            repair: Rebuild the facet tables when a mismatch is found
+
+        Returns:
+            Mismatch descriptions (empty when the counts agree)
+        """
+        session = self._get_session()
+        try:
+            mismatches = verify_facets(session)
+            if mismatches and repair:
+                rebuild_facets(session)
+                session.commit()
+            return mismatches
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
 
 # =============================================================================
 # MarketplaceCatalog Repository
@@ -1955,6 +2047,8 @@ class MarketplaceCatalogRepository(BaseRepository[MarketplaceCatalogEntry]):
         session = self._get_session()
         try:
             session.bulk_save_objects(entries)
+            for source_id in {entry.source_id for entry in entries}:
+                refresh_source_facets(session, source_id)
             session.commit()
             logger.info(f"Bulk created {len(entries)} catalog entries")
             return entries
@@ -1989,6 +2083,7 @@ class MarketplaceCatalogRepository(BaseRepository[MarketplaceCatalogEntry]):
             entry.status = status
             if status == "imported":
                 entry.import_date = datetime.utcnow()
+            refresh_source_facets(session, entry.source_id)
 
             session.commit()
             logger.info(f"Updated catalog entry status: {entry_id} -> {status}")
@@ -2412,6 +2507,13 @@ class MarketplaceCatalogRepository(BaseRepository[MarketplaceCatalogEntry]):
                 .filter(MarketplaceCatalogEntry.id.in_(entry_ids))
                 .update(update_values, synchronize_session=False)
             )
+            source_ids = (
+                session.query(MarketplaceCatalogEntry.source_id)
+                .filter(MarketplaceCatalogEntry.id.in_(entry_ids))
+                .distinct()
+            )
+            for (source_id,) in source_ids.all():
+                refresh_source_facets(session, source_id)
 
             session.commit()
             logger.info(f"Bulk updated {result} catalog entries to status '{status}'")
@@ -2443,6 +2545,7 @@ class MarketplaceCatalogRepository(BaseRepository[MarketplaceCatalogEntry]):
                 .filter_by(source_id=source_id)
                 .delete(synchronize_session=False)
             )
+            refresh_source_facets(session, source_id)
 
             session.commit()
             logger.info(f"Deleted {result} catalog entries for source {source_id}")
@@ -2453,6 +2556,121 @@ class MarketplaceCatalogRepository(BaseRepository[MarketplaceCatalogEntry]):
         finally:
             session.close()
 
+    # =========================================================================
+    # Near-Duplicate Detection (MinHash / LSH)
+    # =========================================================================
+
+    def find_near_duplicate_clusters(
+        self,
+        threshold: float = 0.8,
+        source_id: Optional[str] = None,
+    ) -> List[List[MarketplaceCatalogEntry]]:
+        """Group non-excluded catalog entries into near-duplicate clusters.
+
+        Loads only ``(id, minhash_signature)`` pairs, buckets them with LSH
+        banding and verifies candidates against ``threshold``, so entries are
+        never compared pairwise.  Entries without a signature are skipped.
+
+        Args:
+            threshold: Minimum estimated Jaccard similarity (0-1)
+            source_id: Restrict to one source (default: whole catalog)
+
+        Returns:
+            Clusters of 2+ entries, largest first
+
+        Example:
+            >>> for cluster in repo.find_near_duplicate_clusters(threshold=0.85):
+            ...     print([entry.path for entry in cluster])
+        """
+        from skillmeat.core.marketplace.minhash import LSHIndex, decode_signature
+
+        session = self._get_session()
+        try:
+            query = session.query(
+                MarketplaceCatalogEntry.id, MarketplaceCatalogEntry.minhash_signature
+            ).filter(
+                MarketplaceCatalogEntry.minhash_signature.isnot(None),
+                MarketplaceCatalogEntry.status.notin_(("excluded", "removed")),
+                MarketplaceCatalogEntry.excluded_at.is_(None),
+            )
+            if source_id is not None:
+                query = query.filter(MarketplaceCatalogEntry.source_id == source_id)
+
+            index = LSHIndex()
+            for entry_id, encoded in query.yield_per(1000):
+                signature = decode_signature(encoded)
+                if len(signature) == index.num_perm:
+                    index.add(entry_id, signature)
+
+            clusters = index.clusters(threshold)
+            if not clusters:
+                return []
+
+            clustered_ids = [entry_id for cluster in clusters for entry_id in cluster]
+            entries = {
+                entry.id: entry
+                for entry in session.query(MarketplaceCatalogEntry)
+                .filter(MarketplaceCatalogEntry.id.in_(clustered_ids))
+                .all()
+            }
+            logger.info(
+                f"Found {len(clusters)} near-duplicate clusters among "
+                f"{len(index)} catalog entries (threshold={threshold})"
+            )
+            return [[entries[entry_id] for entry_id in cluster] for cluster in clusters]
+        finally:
+            session.close()
+
+    def compute_missing_signatures(self, batch_size: int = 500) -> int:
+        """Compute MinHash signatures for entries indexed before they existed.
+
+        Args:
+            batch_size: Entries updated per commit
+
+        Returns:
+            Number of entries that received a signature
+        """
+        from skillmeat.core.marketplace.minhash import catalog_signature
+
+        session = self._get_session()
+        try:
+            updated = 0
+            last_id = ""
+            while True:
+                batch = (
+                    session.query(MarketplaceCatalogEntry)
+                    .filter(
+                        MarketplaceCatalogEntry.minhash_signature.is_(None),
+                        MarketplaceCatalogEntry.id > last_id,
+                    )
+                    .order_by(MarketplaceCatalogEntry.id)
+                    .limit(batch_size)
+                    .all()
+                )
+                if not batch:
+                    break
+                for entry in batch:
+                    signature = catalog_signature(
+                        {
+                            "deep_search_text": entry.deep_search_text,
+                            "title": entry.title,
+                            "description": entry.description,
+                            "search_text": entry.search_text,
+                        }
+                    )
+                    if signature is not None:
+                        entry.minhash_signature = signature
+                        updated += 1
+                last_id = batch[-1].id
+                session.commit()
+            logger.info(f"Computed MinHash signatures for {updated} catalog entries")
+            return updated
+        except Exception as e:
+            session.rollback()
+            raise RepositoryError(f"Signature backfill failed: {e}") from e
+        finally:
+            session.close()
+
     # =========================================================================
     # REPO-003: Complex Filtering and Joins
     # =========================================================================
@@ -3705,6 +3923,7 @@ class MarketplaceCatalogRepository(BaseRepository[MarketplaceCatalogEntry]):
                 entry.excluded_at = None
                 entry.excluded_reason = None
                 entry.status = "new" if entry.import_date is None else "imported"
+            refresh_source_facets(session, source_id)
 
             session.commit()
             session.refresh(entry)
@@ -4144,7 +4363,12 @@ class TagRepository(BaseRepository[Tag]):
         """
         session = self._get_session()
         try:
-            tag = session.query(Tag).filter_by(id=tag_id).first()
+            tag = (
+                session.query(Tag)
+                .options(*load_profile(TAG_SUMMARY))
+                .filter_by(id=tag_id)
+                .first()
+            )
             return tag
         finally:
             session.close()
@@ -4165,7 +4389,12 @@ class TagRepository(BaseRepository[Tag]):
         """
         session = self._get_session()
         try:
-            tag = session.query(Tag).filter_by(slug=slug).first()
+            tag = (
+                session.query(Tag)
+                .options(*load_profile(TAG_SUMMARY))
+                .filter_by(slug=slug)
+                .first()
+            )
             return tag
         finally:
             session.close()
@@ -4294,7 +4523,11 @@ class TagRepository(BaseRepository[Tag]):
         """
         session = self._get_session()
         try:
-            query = session.query(Tag).order_by(Tag.created_at.desc(), Tag.id)
+            query = (
+                session.query(Tag)
+                .options(*load_profile(TAG_SUMMARY))
+                .order_by(Tag.created_at.desc(), Tag.id)
+            )
 
             # Apply cursor if provided
             if after_cursor:
@@ -4347,6 +4580,7 @@ class TagRepository(BaseRepository[Tag]):
         try:
             tags = (
                 session.query(Tag)
+                .options(*load_profile(TAG_SUMMARY))
                 .filter(Tag.name.ilike(f"%{pattern}%"))
                 .order_by(Tag.name)
                 .limit(limit)
@@ -4481,6 +4715,7 @@ class TagRepository(BaseRepository[Tag]):
         try:
             tags = (
                 session.query(Tag)
+                .options(*load_profile(TAG_SUMMARY))
                 .join(ArtifactTag, Tag.id == ArtifactTag.tag_id)
                 .filter(ArtifactTag.artifact_uuid == artifact_uuid)
                 .order_by(Tag.name)
@@ -4518,6 +4753,7 @@ class TagRepository(BaseRepository[Tag]):
         try:
             query = (
                 session.query(Artifact)
+                .options(*load_profile(ARTIFACT_SUMMARY))
                 .join(ArtifactTag, Artifact.uuid == ArtifactTag.artifact_uuid)
                 .filter(ArtifactTag.tag_id == tag_id)
                 .order_by(ArtifactTag.created_at.desc(), Artifact.uuid)
@@ -4609,6 +4845,7 @@ class TagRepository(BaseRepository[Tag]):
                     Tag,
                     func.count(ArtifactTag.artifact_uuid).label("count"),
                 )
+                .options(*load_profile(TAG_SUMMARY))
                 .outerjoin(ArtifactTag, Tag.id == ArtifactTag.tag_id)
                 .group_by(Tag.id)
                 .order_by(func.count(ArtifactTag.artifact_uuid).desc(), Tag.name)
@@ -4665,6 +4902,7 @@ class TagRepository(BaseRepository[Tag]):
                     Tag,
                     func.count(DeploymentSetTag.deployment_set_id).label("count"),
                 )
+                .options(*load_profile(TAG_SUMMARY))
                 .outerjoin(DeploymentSetTag, Tag.id == DeploymentSetTag.tag_id)
                 .group_by(Tag.id)
                 .order_by(
@@ -5859,7 +6097,9 @@ class DbUserCollectionRepository(
         """
         session = self._get_session()
         try:
-            query = session.query(Collection)
+            query = session.query(Collection).options(
+                *load_profile(COLLECTION_SUMMARY)
+            )
             if created_by is not None:
                 query = query.filter(Collection.created_by == created_by)
             if collection_type is not None:
@@ -5896,7 +6136,12 @@ class DbUserCollectionRepository(
         """
         session = self._get_session()
         try:
-            row = session.query(Collection).filter_by(id=collection_id).first()
+            row = (
+                session.query(Collection)
+                .options(*load_profile(COLLECTION_SUMMARY))
+                .filter_by(id=collection_id)
+                .first()
+            )
             if row is None:
                 return None
             count = (
@@ -5925,7 +6170,12 @@ class DbUserCollectionRepository(
         """
         session = self._get_session()
         try:
-            row = session.query(Collection).filter(Collection.name == name).first()
+            row = (
+                session.query(Collection)
+                .options(*load_profile(COLLECTION_SUMMARY))
+                .filter(Collection.name == name)
+                .first()
+            )
             if row is None:
                 return None
             count = (
@@ -6229,12 +6479,18 @@ class DbUserCollectionRepository(
                 .subquery()
             )
 
-            query = session.query(
-                Collection,
-                func.coalesce(count_subq.c.artifact_count, 0).label("artifact_count"),
-            ).outerjoin(
-                count_subq,
-                Collection.id == count_subq.c.collection_id,
+            query = (
+                session.query(
+                    Collection,
+                    func.coalesce(count_subq.c.artifact_count, 0).label(
+                        "artifact_count"
+                    ),
+                )
+                .options(*load_profile(COLLECTION_SUMMARY))
+                .outerjoin(
+                    count_subq,
+                    Collection.id == count_subq.c.collection_id,
+                )
             )
 
             if created_by is not None:
@@ -6439,6 +6695,50 @@ class DbUserCollectionRepository(
         finally:
             session.close()
 
+    def get_group_and_artifact_counts(
+        self,
+        collection_ids: List[str],
+        ctx: Optional[RequestContext] = None,
+    ) -> Dict[str, tuple[int, int]]:
+        """Return group and artifact counts for several collections at once.
+
+        Issues one grouped count per table regardless of how many ids are
+        passed.
+
+        Args:
+            collection_ids: Collection hex-UUID primary keys.
+            ctx: Optional per-request metadata.
+
+        Returns:
+            Mapping of each requested id to ``(group_count, artifact_count)``;
+            unknown collections map to ``(0, 0)``.
+        """
+        if not collection_ids:
+            return {}
+        session = self._get_session()
+        try:
+            group_counts = dict(
+                session.query(Group.collection_id, func.count(Group.id))
+                .filter(Group.collection_id.in_(collection_ids))
+                .group_by(Group.collection_id)
+                .all()
+            )
+            artifact_counts = dict(
+                session.query(
+                    CollectionArtifact.collection_id,
+                    func.count(CollectionArtifact.artifact_uuid),
+                )
+                .filter(CollectionArtifact.collection_id.in_(collection_ids))
+                .group_by(CollectionArtifact.collection_id)
+                .all()
+            )
+            return {
+                cid: (group_counts.get(cid, 0), artifact_counts.get(cid, 0))
+                for cid in collection_ids
+            }
+        finally:
+            session.close()
+
     # ------------------------------------------------------------------
     # Sentinel project bootstrap
     # ------------------------------------------------------------------
@@ -7792,6 +8092,7 @@ def _artifact_version_to_dto(version: ArtifactVersion) -> ArtifactVersionDTO:
         parent_hash=version.parent_hash,
         version_lineage=version.version_lineage,
         metadata_json=version.metadata_json,
+        lineage_depth=version.lineage_depth,
     )
 
 
@@ -7831,7 +8132,12 @@ class DbArtifactHistoryRepository(IDbArtifactHistoryRepository):
         """
         session = self._get_session()
         try:
-            row = session.query(Artifact).filter(Artifact.uuid == uuid).first()
+            row = (
+                session.query(Artifact)
+                .options(*load_profile(ARTIFACT_REFERENCE))
+                .filter(Artifact.uuid == uuid)
+                .first()
+            )
             return _cache_artifact_to_summary_dto(row) if row is not None else None
         finally:
             session.close()
@@ -7852,6 +8158,7 @@ class DbArtifactHistoryRepository(IDbArtifactHistoryRepository):
         try:
             rows = (
                 session.query(Artifact)
+                .options(*load_profile(ARTIFACT_REFERENCE))
                 .filter(Artifact.name == name, Artifact.type == artifact_type)
                 .all()
             )
@@ -47,6 +47,7 @@ from sqlalchemy import and_, or_
 from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.orm import Session, joinedload
 
+from skillmeat.cache.loading import PROJECT_SUMMARY, load_profile
 from skillmeat.cache.models import (
     Artifact,
     ArtifactMetadata,
@@ -333,12 +334,17 @@ class CacheRepository:
         finally:
             session.close()
 
-    def list_projects(self, skip: int = 0, limit: int = 100) -> List[Project]:
+    def list_projects(
+        self, skip: int = 0, limit: int = 100, with_artifacts: bool = True
+    ) -> List[Project]:
         """List projects with pagination.
 
         Args:
             skip: Number of records to skip (for pagination)
             limit: Maximum number of records to return
+            with_artifacts: Eager-load ``Project.artifacts`` (and their own
+                relationships).  Pass False when only project columns are
+                read; the cost then no longer grows with the artifact count.
 
         Returns:
             List of Project objects
@@ -352,9 +358,14 @@ class CacheRepository:
         """
         session = self._get_session()
         try:
+            options = (
+                (joinedload(Project.artifacts),)
+                if with_artifacts
+                else load_profile(PROJECT_SUMMARY)
+            )
             projects = (
                 session.query(Project)
-                .options(joinedload(Project.artifacts))
+                .options(*options)
                 .offset(skip)
                 .limit(limit)
                 .all()
@@ -434,11 +445,15 @@ class CacheRepository:
         finally:
             session.close()
 
-    def get_stale_projects(self, ttl_minutes: int = 360) -> List[Project]:
+    def get_stale_projects(
+        self, ttl_minutes: int = 360, with_artifacts: bool = True
+    ) -> List[Project]:
         """Get projects that haven't been refreshed within TTL.
 
         Args:
             ttl_minutes: Time-to-live in minutes (default 6 hours)
+            with_artifacts: Eager-load ``Project.artifacts``; see
+                :meth:`list_projects`
 
         Returns:
             List of stale Project objects
@@ -452,9 +467,14 @@ class CacheRepository:
         session = self._get_session()
         try:
             threshold = datetime.utcnow() - timedelta(minutes=ttl_minutes)
+            options = (
+                (joinedload(Project.artifacts),)
+                if with_artifacts
+                else load_profile(PROJECT_SUMMARY)
+            )
             projects = (
                 session.query(Project)
-                .options(joinedload(Project.artifacts))
+                .options(*options)
                 .filter(
                     or_(
                         Project.last_fetched == None,
@@ -11,8 +11,9 @@ The watcher monitors:
 
 Features:
 - Cross-platform support (Windows, macOS, Linux)
-- Debouncing to avoid cascading invalidations
-- Targeted invalidation based on file path
+- Debouncing on a single long-lived coalescing thread
+- In-place artifact row updates for deployment/artifact file changes, with
+  project-level invalidation as the fallback
 - Graceful error handling and resource cleanup
 - Thread-safe operation
 
@@ -21,6 +22,8 @@ Architecture:
     ├── CacheFileEventHandler (watchdog event handler)
     ├── Observer threads (one per watch path)
     ├── Debounce queue (collects rapid changes)
+    ├── Coalescer thread (drains the queue after a quiet period)
+    ├── CacheChangeApplier (targeted artifact row updates)
     └── CacheRepository (for invalidation operations)
 
 Example:
@@ -65,6 +68,12 @@ from watchdog.events import (
 )
 from watchdog.observers import Observer
 
+from skillmeat.cache.change_applier import (
+    CHANGE_ARTIFACT_FILE,
+    CHANGE_DEPLOYMENT_RECORD,
+    CacheChange,
+    CacheChangeApplier,
+)
 from skillmeat.cache.repository import CacheRepository
 from skillmeat.core.path_resolver import DEFAULT_PROFILE_ROOTS
 
@@ -238,8 +247,10 @@ class FileWatcher:
         debounce_ms: Debounce window in milliseconds
         observers: Dict mapping paths to Observer instances
         running: Flag indicating if watcher is active
-        invalidation_queue: Set of paths pending invalidation
-        debounce_timer: Timer for debounce processing
+        invalidation_queue: Set of project keys pending invalidation
+        pending_changes: Targeted changes per queued key (None = full
+            invalidation required)
+        change_applier: CacheChangeApplier for in-place row updates
         queue_lock: Lock for thread-safe queue operations
 
     Example:
@@ -301,10 +312,17 @@ class FileWatcher:
         self.observers: Dict[str, Observer] = {}
         self.running = False
 
-        # Debounce queue
+        # Debounce queue, drained by a single coalescer thread started lazily
+        # on the first queued change (avoids a Timer thread per event).
         self.invalidation_queue: Set[str] = set()
-        self.debounce_timer: Optional[threading.Timer] = None
+        self.pending_changes: Dict[str, Optional[Dict[str, CacheChange]]] = {}
         self.queue_lock = threading.Lock()
+        self._queue_condition = threading.Condition(self.queue_lock)
+        self._flush_deadline: Optional[float] = None
+        self._coalescer_thread: Optional[threading.Thread] = None
+        self._coalescer_stop = False
+
+        self.change_applier = CacheChangeApplier(cache_repository)
 
         logger.info(
             f"Initialized FileWatcher with {len(self.watch_paths)} paths, "
@@ -455,11 +473,8 @@ class FileWatcher:
 
         logger.info("Stopping FileWatcher...")
 
-        # Cancel pending debounce timer
-        with self.queue_lock:
-            if self.debounce_timer is not None:
-                self.debounce_timer.cancel()
-                self.debounce_timer = None
+        # Stop the coalescer, dropping any changes still inside the window
+        self._stop_coalescer()
 
         # Stop all observers
         for path, observer in self.observers.items():
@@ -610,6 +625,7 @@ class FileWatcher:
             logger.info(
                 f"Deployment tracking file changed, invalidated stats cache: {path}"
             )
+            self.on_deployment_record_modified(path, profile_root=profile_root)
         elif filename.upper() in [
             "SKILL.md",
             "COMMAND.md",
@@ -650,7 +666,8 @@ class FileWatcher:
     ) -> None:
         """Handle deployment directory modification.
 
-        Identifies affected artifact and invalidates its cache.
+        Queues an in-place update of the affected artifact row; the project
+        is only invalidated if the row cannot be updated precisely.
 
         Args:
             path: Path to modified file in deployment directory
@@ -658,30 +675,85 @@ class FileWatcher:
         Example:
             >>> watcher.on_deployment_modified("./.claude/skills/my-skill/SKILL.md")
         """
-        project_id = self._path_to_project_id(path)
+        project_id, path_profile_root = self._path_to_project_context(path)
+        profile_root = profile_root or path_profile_root
         if project_id:
             logger.info(
-                "Deployment modified, invalidating project: %s (profile=%s)",
+                "Deployment modified, updating project: %s (profile=%s)",
                 project_id,
                 profile_root or "unknown",
             )
-            self._queue_invalidation(project_id, profile_root=profile_root)
+            change = None
+            if profile_root:
+                change = CacheChange(
+                    kind=CHANGE_ARTIFACT_FILE,
+                    path=path,
+                    project_id=project_id,
+                    profile_root=profile_root,
+                )
+            self._queue_invalidation(
+                project_id, profile_root=profile_root, change=change
+            )
+
+    def on_deployment_record_modified(
+        self, path: str, profile_root: Optional[str] = None
+    ) -> None:
+        """Handle deployment tracking file (.skillmeat-deployed.toml) changes.
+
+        Queues a re-read of this profile's deployment record only, updating
+        the cached artifact rows whose tracking data changed.
+
+        Args:
+            path: Path to the modified deployment tracking file
+
+        Example:
+            >>> watcher.on_deployment_record_modified(
+            ...     "./.claude/.skillmeat-deployed.toml"
+            ... )
+        """
+        project_id, path_profile_root = self._path_to_project_context(path)
+        profile_root = profile_root or path_profile_root
+        if project_id and profile_root:
+            logger.info(
+                "Deployment record modified, updating project: %s (profile=%s)",
+                project_id,
+                profile_root,
+            )
+            self._queue_invalidation(
+                project_id,
+                profile_root=profile_root,
+                change=CacheChange(
+                    kind=CHANGE_DEPLOYMENT_RECORD,
+                    path=path,
+                    project_id=project_id,
+                    profile_root=profile_root,
+                ),
+            )
 
     def _queue_invalidation(
-        self, project_id: Optional[str] = None, profile_root: Optional[str] = None
+        self,
+        project_id: Optional[str] = None,
+        profile_root: Optional[str] = None,
+        change: Optional[CacheChange] = None,
     ) -> None:
         """Queue an invalidation request with debouncing.
 
         Collects invalidation requests within the debounce window and
-        processes them together to avoid cascading updates.
+        processes them together to avoid cascading updates. Each call pushes
+        the flush deadline back; the coalescer thread drains the queue once
+        no new request has arrived for ``debounce_ms``.
 
         Args:
             project_id: Project ID to invalidate, or None for global
+            profile_root: Profile root the change belongs to
+            change: Targeted change to apply in place. If None (or if any
+                request for the same key has no change), the whole project
+                is invalidated.
 
         Example:
             >>> watcher._queue_invalidation("proj-123")
         """
-        with self.queue_lock:
+        with self._queue_condition:
             # Add to queue (use special key for global invalidation)
             if project_id:
                 key = (
@@ -691,30 +763,77 @@ class FileWatcher:
                 )
             else:
                 key = "__GLOBAL__"
+
+            if change is None:
+                self.pending_changes[key] = None
+            elif key not in self.invalidation_queue or self.pending_changes.get(key):
+                self.pending_changes.setdefault(key, {})[change.path] = change
             self.invalidation_queue.add(key)
 
-            # Cancel existing timer
-            if self.debounce_timer is not None:
-                self.debounce_timer.cancel()
+            # Push back the flush deadline and wake the coalescer
+            self._flush_deadline = time.monotonic() + self.debounce_ms / 1000.0
+            self._ensure_coalescer()
+            self._queue_condition.notify()
 
-            # Start new timer
-            self.debounce_timer = threading.Timer(
-                self.debounce_ms / 1000.0, self._process_invalidation_queue
-            )
-            self.debounce_timer.start()
+    def _ensure_coalescer(self) -> None:
+        """Start the coalescer thread if it is not running (queue_lock held)."""
+        if self._coalescer_thread is not None and self._coalescer_thread.is_alive():
+            return
+        self._coalescer_stop = False
+        self._coalescer_thread = threading.Thread(
+            target=self._run_coalescer,
+            name="skillmeat-cache-coalescer",
+            daemon=True,
+        )
+        self._coalescer_thread.start()
+
+    def _stop_coalescer(self) -> None:
+        """Stop the coalescer thread and discard unflushed requests."""
+        with self._queue_condition:
+            self._coalescer_stop = True
+            self._flush_deadline = None
+            self.invalidation_queue.clear()
+            self.pending_changes.clear()
+            self._queue_condition.notify()
+            thread = self._coalescer_thread
+            self._coalescer_thread = None
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5.0)
+
+    def _run_coalescer(self) -> None:
+        """Coalescer loop: flush the queue after each quiet period."""
+        while True:
+            with self._queue_condition:
+                while self._flush_deadline is None and not self._coalescer_stop:
+                    self._queue_condition.wait()
+                if self._coalescer_stop:
+                    return
+                remaining = self._flush_deadline - time.monotonic()
+                if remaining > 0:
+                    self._queue_condition.wait(remaining)
+                    continue
+                self._flush_deadline = None
+
+            try:
+                self._process_invalidation_queue()
+            except Exception as e:
+                logger.error(f"Error processing invalidation queue: {e}")
 
     def _process_invalidation_queue(self) -> None:
         """Process queued invalidations after debounce period.
 
-        Executes all queued invalidation requests through the repository.
+        Applies targeted changes in place where possible and falls back to
+        project invalidation through the repository otherwise.
         """
         with self.queue_lock:
             if not self.invalidation_queue:
                 return
 
             queue = self.invalidation_queue.copy()
+            changes = self.pending_changes
             self.invalidation_queue.clear()
-            self.debounce_timer = None
+            self.pending_changes = {}
 
         logger.info(f"Processing {len(queue)} invalidation requests")
 
@@ -724,8 +843,13 @@ class FileWatcher:
                     # Global invalidation - mark all projects as stale
                     self._invalidate_all_projects()
                 else:
-                    # Project-specific invalidation
+                    # Project-specific update, falling back to invalidation
                     project_id, _, profile_root = key.partition("::")
+                    key_changes = changes.get(key)
+                    if key_changes and self._apply_changes(
+                        project_id, list(key_changes.values())
+                    ):
+                        continue
                     self._invalidate_project(
                         project_id,
                         profile_root=profile_root or None,
@@ -733,6 +857,25 @@ class FileWatcher:
             except Exception as e:
                 logger.error(f"Error invalidating {key}: {e}")
 
+    def _apply_changes(self, project_id: str, changes: List[CacheChange]) -> bool:
+        """Apply targeted changes for a project.
+
+        Args:
+            project_id: Project the changes belong to
+            changes: Coalesced changes for the project
+
+        Returns:
+            True if all changes were applied in place
+        """
+        try:
+            return self.change_applier.apply(project_id, changes)
+        except Exception as e:
+            logger.warning(
+                f"Failed to apply changes in place for {project_id}, "
+                f"invalidating instead: {e}"
+            )
+            return False
+
     def _invalidate_project(
         self, project_id: str, profile_root: Optional[str] = None
     ) -> None:
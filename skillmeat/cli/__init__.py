@@ -41,6 +41,7 @@ from skillmeat.sources.github import GitHubSource
 from skillmeat.sources.local import LocalSource
 from skillmeat.utils.validator import ArtifactValidator
 from skillmeat.defaults import SmartDefaults
+from skillmeat.cli.lazy_group import LazyCommand, LazyGroup
 
 # Console for output
 console = Console(force_terminal=True, legacy_windows=False)
@@ -56,8 +57,41 @@ config_mgr = ConfigManager()
 # Main Entry Point
 # ====================
 
+# Command groups defined in their own modules, imported only when invoked.
+# Commands defined in this file are registered eagerly.
+LAZY_SUBCOMMANDS = {
+    "attest": LazyCommand(
+        "skillmeat.cli.commands.attest:attest_group",
+        "Attestation management commands.",
+    ),
+    "auth": LazyCommand(
+        "skillmeat.cli.commands.auth:auth_cli",
+        "Authentication commands for SkillMeat.",
+    ),
+    "bom": LazyCommand(
+        "skillmeat.cli.commands.bom:bom_group",
+        "SkillBOM management commands.",
+    ),
+    "drift-scan": LazyCommand(
+        "skillmeat.cli.commands.drift_scan:drift_scan_group",
+        "Scan every registered project for drift.",
+    ),
+    "enterprise": LazyCommand(
+        "skillmeat.cli.enterprise_commands:enterprise_cli",
+        "Enterprise edition commands (requires SKILLMEAT_EDITION=enterprise).",
+    ),
+    "history": LazyCommand(
+        "skillmeat.cli.commands.history:history_group",
+        "Show artifact activity history.",
+    ),
+    "workflow": LazyCommand(
+        "skillmeat.cli.workflow:workflow_cli",
+        "Manage and execute SkillMeat workflows.",
+    ),
+}
+
 
-@click.group()
+@click.group(cls=LazyGroup, lazy_subcommands=LAZY_SUBCOMMANDS)
 @click.version_option(version=__version__, prog_name="skillmeat")
 @click.option(
     "--smart-defaults",
@@ -2298,14 +2332,23 @@ def mcp_health(
         from skillmeat.config import ConfigManager
         from skillmeat.core.mcp.deployment import MCPDeploymentManager
         from skillmeat.core.mcp.health import HealthStatus, MCPHealthChecker
+        from skillmeat.core.mcp.log_monitor import (
+            DEFAULT_STATE_PATH,
+            MCPLogMonitor,
+            default_log_files,
+        )
 
         # Get configuration
         config = ConfigManager()
         github_token = config.get("settings.github-token")
 
-        # Create health checker
+        # Create health checker; the monitor resumes from the log offsets
+        # saved by the previous run, so only new log lines are read.
         deployment_mgr = MCPDeploymentManager(github_token=github_token)
-        health_checker = MCPHealthChecker(deployment_manager=deployment_mgr)
+        health_checker = MCPHealthChecker(
+            deployment_manager=deployment_mgr,
+            log_monitor=MCPLogMonitor(default_log_files, state_path=DEFAULT_STATE_PATH),
+        )
 
         def display_health_results(results: dict):
             """Display health check results in table format."""
@@ -5662,6 +5705,11 @@ def _display_match_results(scores, artifacts, query, scoring_result, verbose):
     is_flag=True,
     help="Show score breakdown",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Rescore instead of reusing a cached result for the same query",
+)
 def match(
     query: str,
     limit: int,
@@ -5669,6 +5717,7 @@ def match(
     collection: Optional[str],
     output_json: bool,
     verbose: bool,
+    no_cache: bool,
 ):
     """Match artifacts against a query using confidence scoring.
 
@@ -5716,11 +5765,23 @@ def match(
         # ScoringService expects: List[Tuple[str, ArtifactMetadata]]
         artifacts_for_scoring = [(a.name, a.metadata) for a in artifacts]
 
+        # Reuse results of identical queries against an unchanged collection
+        result_cache = None
+        if not no_cache:
+            try:
+                from skillmeat.cache.match_cache import MatchResultCache
+                from skillmeat.cache.repository import CacheRepository
+
+                result_cache = MatchResultCache(CacheRepository())
+            except Exception as e:
+                logger.debug(f"Match result cache unavailable: {e}")
+
         # Create scoring service (will use keyword-only if no API key)
         scoring_service = ScoringService(
             enable_semantic=True,  # Try semantic, fall back to keyword
             semantic_timeout=5.0,
             fallback_to_keyword=True,
+            result_cache=result_cache,
         )
 
         # Score artifacts
@@ -6556,13 +6617,13 @@ def sync_pull_cmd(
                     results.append(syncer.check(name, target_dir=_target_dir))
                     _prog.advance(_task)
         else:
+            # One delta request covers every artifact.
             with _Progress(console=_console, transient=True) as _prog:
                 _task = _prog.add_task(
                     "[cyan]Syncing enterprise artifacts…", total=len(artifact_list_ent)
                 )
-                for name in artifact_list_ent:
-                    results.append(syncer.sync(name, target_dir=_target_dir))
-                    _prog.advance(_task)
+                results = syncer.sync_many(artifact_list_ent, target_dir=_target_dir)
+                _prog.advance(_task, len(artifact_list_ent))
 
         if _fmt == "json":
             import json as _json
@@ -10550,32 +10611,39 @@ def revoke_key(key_id, type, force):
 
 
 @sign.command(name="verify")
-@click.argument("bundle_path", type=click.Path(exists=True))
+@click.argument("bundle_paths", nargs=-1, required=True, type=click.Path(exists=True))
 @click.option(
     "--require-signature",
     is_flag=True,
     help="Fail if bundle is unsigned",
 )
-def verify_bundle(bundle_path, require_signature):
+def verify_bundle(bundle_paths, require_signature):
     """Verify bundle signature.
 
     Verifies the cryptographic signature of a bundle to ensure it hasn't
-    been tampered with and was signed by a trusted key.
+    been tampered with and was signed by a trusted key. Several bundles can
+    be verified at once; signer keys are then loaded once and signatures are
+    checked in parallel.
 
     Examples:
         skillmeat sign verify my-bundle.skillmeat-pack
         skillmeat sign verify bundle.skillmeat-pack --require-signature
+        skillmeat sign verify dist/*.skillmeat-pack
     """
     try:
         from skillmeat.core.signing import BundleVerifier, KeyManager
 
-        bundle_path = Path(bundle_path)
-
-        console.print(f"[cyan]Verifying bundle signature...[/cyan]")
-
         key_manager = KeyManager()
         verifier = BundleVerifier(key_manager)
 
+        if len(bundle_paths) > 1:
+            _verify_bundle_batch(verifier, bundle_paths, require_signature)
+            return
+
+        bundle_path = Path(bundle_paths[0])
+
+        console.print(f"[cyan]Verifying bundle signature...[/cyan]")
+
         # Verify bundle
         result = verifier.verify_bundle_file(bundle_path, require_signature)
 
@@ -10617,6 +10685,38 @@ def verify_bundle(bundle_path, require_signature):
         sys.exit(1)
 
 
+def _verify_bundle_batch(verifier, bundle_paths, require_signature):
+    """Verify several bundles and print one row per bundle plus timing."""
+    console.print(f"[cyan]Verifying {len(bundle_paths)} bundle signatures...[/cyan]")
+
+    batch = verifier.verify_bundle_files(bundle_paths, require_signature)
+
+    table = Table(title="Bundle Signatures")
+    table.add_column("Bundle", style="cyan")
+    table.add_column("Status")
+    table.add_column("Signer")
+    for path, result in zip(bundle_paths, batch.results):
+        style = "green" if result.valid else "red"
+        signer = (
+            f"{result.signature_data.signer_name} <{result.signature_data.signer_email}>"
+            if result.signature_data
+            else "-"
+        )
+        table.add_row(
+            Path(path).name, f"[{style}]{result.status.value}[/{style}]", signer
+        )
+
+    console.print()
+    console.print(table)
+    console.print(
+        f"\n{batch.valid_count}/{len(batch.results)} valid "
+        f"in {batch.elapsed_ms:.1f}ms"
+    )
+
+    if not batch.all_valid:
+        sys.exit(1)
+
+
 # ====================
 # Marketplace Commands
 # ====================
@@ -14935,65 +15035,6 @@ def _uninstall_shell_completion(shell: str) -> Optional[str]:
     return None
 
 
-# ====================
-# Workflow Command Group
-# ====================
-
-from skillmeat.cli.workflow import workflow_cli  # noqa: E402
-
-main.add_command(workflow_cli, name="workflow")
-
-
-# ====================
-# Enterprise Command Group
-# ====================
-
-
-from skillmeat.cli.enterprise_commands import enterprise_cli  # noqa: E402
-
-main.add_command(enterprise_cli, name="enterprise")
-
-
-# ====================
-# Auth Command Group
-# ====================
-
-
-from skillmeat.cli.commands.auth import auth_cli  # noqa: E402
-
-main.add_command(auth_cli, name="auth")
-
-
-# ====================
-# BOM Command Group
-# ====================
-
-
-from skillmeat.cli.commands.bom import bom_group  # noqa: E402
-
-main.add_command(bom_group, name="bom")
-
-
-# ====================
-# History Command Group
-# ====================
-
-
-from skillmeat.cli.commands.history import history_group  # noqa: E402
-
-main.add_command(history_group, name="history")
-
-
-# ====================
-# Attest Command Group
-# ====================
-
-
-from skillmeat.cli.commands.attest import attest_group  # noqa: E402
-
-main.add_command(attest_group, name="attest")
-
-
 # ====================
 # Entry Point
 # ====================
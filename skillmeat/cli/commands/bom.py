@@ -445,11 +445,22 @@ def _run_keygen(key_dir: Path) -> None:
     show_default=True,
     help="Output format.",
 )
+@click.option(
+    "--incremental",
+    "incremental",
+    is_flag=True,
+    default=False,
+    help=(
+        "Also write <FILE>.delta holding only the entries that changed since "
+        "the existing output file."
+    ),
+)
 def generate_cmd(
     project_path: str,
     output_file: Optional[str],
     auto_sign: bool,
     output_format: str,
+    incremental: bool,
 ) -> None:
     """Generate a SkillBOM and write it to context.lock.
 
@@ -461,6 +472,12 @@ def generate_cmd(
     default Ed25519 key and a <FILE>.sig signature file is written
     alongside the output.
 
+    Artifact content hashes are cached in ~/.skillmeat/cache/bom-hashes.json
+    and reused while the artifact files are unchanged on disk.  With
+    --incremental the previous output file is used as the base and a
+    <FILE>.delta file is written listing only added, changed and removed
+    entries.
+
     \b
     Examples:
       skillmeat bom generate
@@ -468,6 +485,7 @@ def generate_cmd(
       skillmeat bom generate --output /tmp/snapshot.json
       skillmeat bom generate --auto-sign
       skillmeat bom generate --format json
+      skillmeat bom generate --incremental
     """
     resolved_project = Path(project_path).resolve()
 
@@ -487,7 +505,12 @@ def generate_cmd(
     # Build BOM using the cache DB for the project.
     try:
         from skillmeat.cache.models import get_session  # noqa: PLC0415
-        from skillmeat.core.bom.generator import BomGenerator, BomSerializer  # noqa: PLC0415
+        from skillmeat.core.bom.generator import (  # noqa: PLC0415
+            BomGenerator,
+            BomSerializer,
+            diff_boms,
+        )
+        from skillmeat.core.bom.hash_cache import BomHashCache  # noqa: PLC0415
     except ImportError as exc:
         click.echo(f"Error: could not import BOM modules: {exc}", err=True)
         sys.exit(1)
@@ -498,8 +521,23 @@ def generate_cmd(
         click.echo(f"Error: could not open cache database: {exc}", err=True)
         sys.exit(1)
 
+    # The previous BOM must be read before it is overwritten below.
+    previous_bom: Optional[dict] = None
+    if incremental:
+        try:
+            previous_bom = json.loads(out_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            previous_bom = {"artifacts": []}
+        except (OSError, ValueError) as exc:
+            click.echo(f"Error: could not read previous BOM {out_path}: {exc}", err=True)
+            sys.exit(1)
+
     try:
-        generator = BomGenerator(session=session, project_path=resolved_project)
+        generator = BomGenerator(
+            session=session,
+            project_path=resolved_project,
+            hash_cache=BomHashCache(BomHashCache.default_path()),
+        )
         bom_dict = generator.generate()
     except Exception as exc:  # noqa: BLE001
         click.echo(f"Error: BOM generation failed: {exc}", err=True)
@@ -507,6 +545,17 @@ def generate_cmd(
 
     serializer = BomSerializer()
 
+    delta_path: Optional[Path] = None
+    delta_dict: Optional[dict] = None
+    if previous_bom is not None:
+        delta_dict = diff_boms(previous_bom, bom_dict)
+        delta_path = out_path.with_suffix(out_path.suffix + ".delta")
+        try:
+            serializer.write_file(delta_dict, delta_path)
+        except OSError as exc:
+            click.echo(f"Error: could not write BOM delta to {delta_path}: {exc}", err=True)
+            sys.exit(1)
+
     # Write BOM atomically.
     try:
         serializer.write_file(bom_dict, out_path)
@@ -551,6 +600,10 @@ def generate_cmd(
             "signed": sig_path is not None,
             "signature_file": str(sig_path) if sig_path else None,
         }
+        if delta_dict is not None:
+            output_data["delta_file"] = str(delta_path)
+            output_data["changed_count"] = len(delta_dict["artifacts"])
+            output_data["removed_count"] = len(delta_dict["removed"])
         console.print(json.dumps(output_data, indent=2))
     else:
         table = Table.grid(padding=(0, 2))
@@ -565,6 +618,13 @@ def generate_cmd(
             table.add_row("SHA-256:", bom_hash[:16] + "...")
         if sig_path is not None:
             table.add_row("Signature:", str(sig_path))
+        if delta_dict is not None:
+            table.add_row("Delta:", str(delta_path))
+            table.add_row(
+                "Changes:",
+                f"{len(delta_dict['artifacts'])} changed, "
+                f"{len(delta_dict['removed'])} removed",
+            )
 
         console.print(
             Panel(
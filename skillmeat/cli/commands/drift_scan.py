@@ -0,0 +1,254 @@
+"""Click command group for fleet-wide drift scans.
+
+Provides the ``skillmeat drift-scan`` subcommand tree:
+
+    skillmeat drift-scan start [--collection NAME] [--resume SCAN_ID] [--workers N]
+    skillmeat drift-scan status [SCAN_ID] [--format table|json]
+    skillmeat drift-scan cancel SCAN_ID
+    skillmeat drift-scan show SCAN_ID [--drift-type TYPE]... [--project ID]
+                              [--offset N] [--limit N] [--format table|json]
+
+Scans run in the foreground through
+:class:`~skillmeat.core.fleet_drift.FleetDriftScanner` and store their drift
+matrix in the local cache DB.  Interrupting ``start`` with Ctrl+C cancels the
+scan after its in-flight projects; ``start --resume`` picks it up again.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+from typing import Optional, Tuple
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+console = Console(force_terminal=True, legacy_windows=False)
+
+_DRIFT_TYPES = ("synced", "modified", "outdated", "conflict", "removed")
+
+_DRIFT_COLOURS = {
+    "synced": "green",
+    "modified": "yellow",
+    "outdated": "cyan",
+    "conflict": "red",
+    "removed": "magenta",
+}
+
+
+def _get_scanner(max_workers: Optional[int] = None):
+    """Build a FleetDriftScanner over the default collection and cache DB."""
+    from skillmeat.cache.repository import CacheRepository
+    from skillmeat.core.collection import CollectionManager
+    from skillmeat.core.fleet_drift import FleetDriftScanner
+    from skillmeat.core.sync import SyncManager
+
+    sync_mgr = SyncManager(collection_manager=CollectionManager())
+    return FleetDriftScanner(sync_mgr, CacheRepository(), max_workers=max_workers)
+
+
+def _print_scans(scans) -> None:
+    table = Table(show_header=True, header_style="bold cyan")
+    table.add_column("Scan ID", style="dim", no_wrap=True)
+    table.add_column("Status")
+    table.add_column("Collection")
+    table.add_column("Projects", justify="right")
+    table.add_column("Failed", justify="right")
+    table.add_column("Drifted", justify="right")
+    table.add_column("Created", style="dim")
+    for scan in scans:
+        table.add_row(
+            scan["id"],
+            scan["status"],
+            scan["collection_name"] or "—",
+            f"{scan['scanned_projects']}/{scan['total_projects']}",
+            str(scan["failed_projects"]),
+            str(scan["drifted_artifacts"]),
+            (scan["created_at"] or "")[:19],
+        )
+    console.print(table)
+
+
+# ---------------------------------------------------------------------------
+# drift-scan group
+# ---------------------------------------------------------------------------
+
+
+@click.group("drift-scan")
+def drift_scan_group() -> None:
+    """Scan every registered project for drift.
+
+    \b
+    Examples:
+      skillmeat drift-scan start
+      skillmeat drift-scan status
+      skillmeat drift-scan show SCAN_ID --drift-type conflict --limit 50
+    """
+
+
+@drift_scan_group.command("start")
+@click.option("--collection", "-c", default=None, help="Collection to compare against.")
+@click.option(
+    "--resume",
+    "resume_id",
+    default=None,
+    metavar="SCAN_ID",
+    help="Resume an existing scan.",
+)
+@click.option(
+    "--workers", type=click.IntRange(1, 64), default=None, help="Worker threads."
+)
+def start_cmd(
+    collection: Optional[str], resume_id: Optional[str], workers: Optional[int]
+) -> None:
+    """Run a new or resumed scan in the foreground."""
+    from skillmeat.cache.repository import CacheNotFoundError
+
+    scanner = _get_scanner(workers)
+    scan_id = resume_id or scanner.store.create_scan(collection)
+    cancel_event = threading.Event()
+
+    console.print(f"[bold]Fleet drift scan[/bold] {scan_id}")
+    try:
+        summary = scanner.run(scan_id, cancel_event=cancel_event)
+    except KeyboardInterrupt:
+        cancel_event.set()
+        scanner.cancel(scan_id)
+        console.print(
+            f"[yellow]Cancelled.[/yellow] Resume with "
+            f"[bold]skillmeat drift-scan start --resume {scan_id}[/bold]"
+        )
+        sys.exit(130)
+    except CacheNotFoundError as exc:
+        console.print(f"[red]Error:[/red] {exc}")
+        sys.exit(1)
+
+    console.print(
+        f"Status: {summary.status}  Projects: "
+        f"{summary.scanned_projects}/{summary.total_projects}  "
+        f"Failed: {summary.failed_projects}  Drifted: {summary.drifted_artifacts}"
+    )
+    sys.exit(0 if summary.status == "completed" and not summary.failed_projects else 1)
+
+
+@drift_scan_group.command("status")
+@click.argument("scan_id", required=False)
+@click.option(
+    "--limit", "-n", default=10, show_default=True, type=click.IntRange(1, 100)
+)
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    default="table",
+    show_default=True,
+    type=click.Choice(["table", "json"], case_sensitive=False),
+)
+def status_cmd(scan_id: Optional[str], limit: int, output_format: str) -> None:
+    """Show one scan, or the most recent scans."""
+    scanner = _get_scanner()
+    if scan_id:
+        scan = scanner.store.get_scan(scan_id)
+        if scan is None:
+            console.print(f"[red]Error:[/red] Drift scan not found: {scan_id}")
+            sys.exit(1)
+        scans = [scan]
+    else:
+        scans = scanner.store.list_scans(limit)
+
+    if output_format.lower() == "json":
+        click.echo(json.dumps(scans if not scan_id else scans[0], indent=2))
+    elif not scans:
+        console.print("[dim]No drift scans yet.[/dim]")
+    else:
+        _print_scans(scans)
+
+
+@drift_scan_group.command("cancel")
+@click.argument("scan_id")
+def cancel_cmd(scan_id: str) -> None:
+    """Ask a pending or running scan to stop."""
+    if not _get_scanner().cancel(scan_id):
+        console.print(f"[red]Error:[/red] Drift scan {scan_id} is not running.")
+        sys.exit(1)
+    console.print(f"Cancellation requested for {scan_id}.")
+
+
+@drift_scan_group.command("show")
+@click.argument("scan_id")
+@click.option(
+    "--drift-type",
+    "-t",
+    "drift_types",
+    multiple=True,
+    type=click.Choice(list(_DRIFT_TYPES), case_sensitive=False),
+    help="Only show these drift types (repeatable).",
+)
+@click.option("--project", "project_id", default=None, help="Only show one project.")
+@click.option("--offset", default=0, show_default=True, type=click.IntRange(0))
+@click.option(
+    "--limit", "-n", default=50, show_default=True, type=click.IntRange(1, 1000)
+)
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    default="table",
+    show_default=True,
+    type=click.Choice(["table", "json"], case_sensitive=False),
+)
+def show_cmd(
+    scan_id: str,
+    drift_types: Tuple[str, ...],
+    project_id: Optional[str],
+    offset: int,
+    limit: int,
+    output_format: str,
+) -> None:
+    """Page through a scan's drift matrix."""
+    scanner = _get_scanner()
+    if scanner.store.get_scan(scan_id) is None:
+        console.print(f"[red]Error:[/red] Drift scan not found: {scan_id}")
+        sys.exit(1)
+
+    entries, total = scanner.store.list_entries(
+        scan_id,
+        offset=offset,
+        limit=limit,
+        drift_types=[t.lower() for t in drift_types] or None,
+        project_id=project_id,
+    )
+
+    if output_format.lower() == "json":
+        click.echo(
+            json.dumps(
+                {"items": entries, "total": total, "offset": offset, "limit": limit},
+                indent=2,
+            )
+        )
+        return
+
+    table = Table(show_header=True, header_style="bold cyan")
+    table.add_column("Project")
+    table.add_column("Artifact", style="bold")
+    table.add_column("Type", style="blue")
+    table.add_column("Profile", style="dim")
+    table.add_column("Drift")
+    table.add_column("Recommendation", style="dim")
+    for entry in entries:
+        colour = _DRIFT_COLOURS.get(entry["drift_type"], "white")
+        table.add_row(
+            entry["project_path"],
+            entry["artifact_name"],
+            entry["artifact_type"],
+            entry["profile_id"],
+            f"[{colour}]{entry['drift_type']}[/{colour}]",
+            (entry["recommendation"] or "—").replace("_", " "),
+        )
+    console.print(table)
+    shown_to = offset + len(entries)
+    console.print(
+        f"[dim]Entries {offset + 1 if entries else 0}-{shown_to} of {total}[/dim]"
+    )
@@ -0,0 +1,105 @@
+"""Lazy-loading click group for SkillMeat CLI.
+
+Command groups that live in their own modules (``skillmeat.cli.commands.*``,
+``workflow``, ``enterprise_commands``) are registered with the top-level
+``main`` group by import path instead of by object.  The module behind a
+command is imported only when that command is invoked, so ``skillmeat --help``
+and unrelated commands do not pay for its dependencies (e.g. ``bom`` pulls in
+the ORM models and signing libraries).
+
+Only those separate-module groups are lazy.  The commands defined directly
+in ``skillmeat/cli/__init__.py`` are still registered eagerly, and that
+module's top-level imports are most of what ``import skillmeat.cli`` costs.
+
+Each lazy command carries a static short help string so the ``--help``
+listing can be rendered without importing anything.  A lazy entry replaces
+an eagerly registered command of the same name once loaded, matching the
+previous ``main.add_command()`` registration order.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Dict, List, NamedTuple, Optional, Set
+
+import click
+
+
+class LazyCommand(NamedTuple):
+    """Registry entry for a command imported on first use.
+
+    Attributes:
+        import_path: ``"package.module:attribute"`` of the click command.
+        short_help: Text shown in the parent group's ``--help`` listing.
+    """
+
+    import_path: str
+    short_help: str = ""
+
+
+class LazyGroup(click.Group):
+    """Click group that resolves some subcommands from a static import map.
+
+    Args:
+        lazy_subcommands: Mapping of command name to :class:`LazyCommand`.
+        *args, **kwargs: Passed through to :class:`click.Group`.
+
+    Example:
+        >>> @click.group(
+        ...     cls=LazyGroup,
+        ...     lazy_subcommands={
+        ...         "bom": LazyCommand("skillmeat.cli.commands.bom:bom_group", "SkillBOM commands."),
+        ...     },
+        ... )
+        ... def main():
+        ...     pass
+    """
+
+    def __init__(
+        self,
+        *args,
+        lazy_subcommands: Optional[Dict[str, LazyCommand]] = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands: Dict[str, LazyCommand] = dict(lazy_subcommands or {})
+        self._loaded: Set[str] = set()
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self.lazy_subcommands and cmd_name not in self._loaded:
+            self.add_command(self._load(cmd_name), name=cmd_name)
+            self._loaded.add(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """List subcommands without importing the lazy ones."""
+        names = self.list_commands(ctx)
+        if not names:
+            return
+
+        limit = formatter.width - 6 - max(len(name) for name in names)
+        rows = []
+        for name in names:
+            if name in self.lazy_subcommands and name not in self._loaded:
+                rows.append((name, self.lazy_subcommands[name].short_help))
+                continue
+            cmd = self.commands[name]
+            if not cmd.hidden:
+                rows.append((name, cmd.get_short_help_str(limit)))
+
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        module_name, _, attribute = self.lazy_subcommands[cmd_name].import_path.partition(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(
+                f"Lazy command '{cmd_name}' resolved to {type(command).__name__}, "
+                "not a click command"
+            )
+        return command
@@ -9,19 +9,32 @@ Exports:
     BomGenerator: Core service that queries artifacts and assembles the BOM dict.
     BaseArtifactAdapter: Abstract base class for per-type artifact adapters.
     SkillAdapter: Reference adapter implementation for skill-type artifacts.
+    BomHashCache: Stat-validated cache of artifact content hashes.
+    diff_boms: Builds an incremental BOM delta from two full BOMs.
+    apply_incremental_bom: Rebuilds a full BOM from a base BOM and a delta.
     OwnershipResolver: Resolves effective owner_type/owner_id from auth context.
     AttestationScopeResolver: Enforces owner-scoped visibility for attestation records.
 """
 
 from __future__ import annotations
 
-from skillmeat.core.bom.generator import BaseArtifactAdapter, BomGenerator, SkillAdapter
+from skillmeat.core.bom.generator import (
+    BaseArtifactAdapter,
+    BomGenerator,
+    SkillAdapter,
+    apply_incremental_bom,
+    diff_boms,
+)
+from skillmeat.core.bom.hash_cache import BomHashCache
 from skillmeat.core.bom.scope import AttestationScopeResolver, OwnershipResolver
 
 __all__ = [
     "BomGenerator",
     "BaseArtifactAdapter",
     "SkillAdapter",
+    "BomHashCache",
+    "diff_boms",
+    "apply_incremental_bom",
     "OwnershipResolver",
     "AttestationScopeResolver",
 ]
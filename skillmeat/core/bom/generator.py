@@ -12,8 +12,10 @@ This module implements the core BOM (Bill of Materials) generation pipeline:
     when no filesystem path is resolvable (e.g. content stored in DB column).
 
 3.  ``BomGenerator`` — orchestrator that:
-    - Queries deployed artifacts from the SQLAlchemy session (1.x-style
-      ``session.query()`` matching local-repo conventions).
+    - Streams deployed artifacts from the SQLAlchemy session (1.x-style
+      ``session.query()`` with ``yield_per`` batches).
+    - Hashes each batch's filesystem paths in a thread pool, reusing hashes
+      from a stat-validated ``BomHashCache`` when the files are unchanged.
     - Resolves the correct adapter for each artifact type via an internal
       registry.
     - Collects BOM entries and assembles the final BOM dict.
@@ -32,6 +34,12 @@ Design decisions
   ``Artifact.source`` or ``project_path``) but fall back to hashing the DB
   ``content`` column bytes, and ultimately emit an empty-string hash when
   neither is available, logging a warning.
+* **Parallelism stays off the session** — worker threads only hash files;
+  adapters (which may lazy-load relationships or query the session) always
+  run on the calling thread.
+* **Incremental BOMs** — ``generate_incremental()`` returns only the entries
+  added or changed since a previous BOM (plus removals); applying it with
+  ``apply_incremental_bom()`` reproduces the full BOM exactly.
 """
 
 from __future__ import annotations
@@ -44,9 +52,11 @@ import os
 import tempfile
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
@@ -56,6 +66,7 @@ from skillmeat.cache.models import (
     DeploymentSet,
     MemoryItem,
 )
+from skillmeat.core.bom.hash_cache import BomHashCache
 from skillmeat.core.hashing import compute_artifact_hash
 
 logger = logging.getLogger(__name__)
@@ -175,6 +186,33 @@ def _hash_bytes(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
+# Hashes precomputed by ``BomGenerator`` for the batch being adapted, keyed by
+# ``str(fs_path)``.  Unset outside ``BomGenerator.generate()``.
+_PRECOMPUTED_HASHES: ContextVar[Optional[Dict[str, str]]] = ContextVar(
+    "bom_precomputed_hashes", default=None
+)
+
+
+def _hash_fs_path(fs_path: Path) -> str:
+    """Return ``compute_artifact_hash(fs_path)``, using a precomputed value if any.
+
+    Args:
+        fs_path: Existing file or directory.
+
+    Returns:
+        64-character lowercase hex string.
+
+    Raises:
+        FileNotFoundError, ValueError, OSError: As ``compute_artifact_hash``.
+    """
+    precomputed = _PRECOMPUTED_HASHES.get()
+    if precomputed is not None:
+        content_hash = precomputed.get(str(fs_path))
+        if content_hash is not None:
+            return content_hash
+    return compute_artifact_hash(str(fs_path))
+
+
 def _resolve_artifact_fs_path(
     artifact: Artifact,
     project_path: Optional[Path],
@@ -270,7 +308,7 @@ class SkillAdapter(BaseArtifactAdapter):
         fs_path = _resolve_artifact_fs_path(artifact, project_path)
         if fs_path is not None:
             try:
-                return compute_artifact_hash(str(fs_path))
+                return _hash_fs_path(fs_path)
             except (FileNotFoundError, ValueError, OSError) as exc:
                 logger.debug(
                     "Filesystem hash failed for skill %r (%s); falling back to DB content.",
@@ -428,7 +466,7 @@ def _compute_directory_or_db_hash(
     fs_path = _resolve_artifact_fs_path(artifact, project_path)
     if fs_path is not None:
         try:
-            return compute_artifact_hash(str(fs_path))
+            return _hash_fs_path(fs_path)
         except (FileNotFoundError, ValueError, OSError) as exc:
             logger.debug(
                 "Filesystem hash failed for %r %r (%s); falling back to DB content.",
@@ -989,7 +1027,7 @@ def _compute_file_hash(
     fs_path = _resolve_artifact_fs_path(artifact, project_path)
     if fs_path is not None and fs_path.is_file():
         try:
-            return _hash_bytes(fs_path.read_bytes())
+            return _hash_fs_path(fs_path)
         except OSError as exc:
             logger.debug(
                 "File read failed for %r %r (%s); falling back to DB content.",
@@ -1000,7 +1038,7 @@ def _compute_file_hash(
     elif fs_path is not None and fs_path.is_dir():
         # If path resolves to a directory fall back to Merkle tree.
         try:
-            return compute_artifact_hash(str(fs_path))
+            return _hash_fs_path(fs_path)
         except (FileNotFoundError, ValueError, OSError) as exc:
             logger.debug(
                 "Directory hash failed for %r %r (%s); falling back to DB content.",
@@ -1719,6 +1757,10 @@ class BomGenerator:
         session: SQLAlchemy session bound to the local SQLite cache.
         project_path: Optional project root; forwarded to adapters for
                       filesystem path resolution.
+        hash_cache: Stat-validated hash cache to reuse across runs.  Defaults
+                    to an in-memory cache scoped to this generator.
+        max_workers: Threads used to hash filesystem paths (1 = serial).
+        batch_size: Artifacts fetched per ``yield_per`` batch.
 
     Example::
 
@@ -1728,15 +1770,23 @@ class BomGenerator:
         result = bom.generate()
     """
 
+    DEFAULT_BATCH_SIZE = 200
+
     def __init__(
         self,
         session: Session,
         project_path: Optional[str | Path] = None,
+        hash_cache: Optional[BomHashCache] = None,
+        max_workers: Optional[int] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
     ) -> None:
         self._session = session
         self._project_path: Optional[Path] = (
             Path(project_path) if project_path is not None else None
         )
+        self._hash_cache = hash_cache if hash_cache is not None else BomHashCache()
+        self._max_workers = max(1, max_workers or min(8, os.cpu_count() or 1))
+        self._batch_size = max(1, batch_size)
         # Internal adapter registry: type_string -> adapter instance.
         self._adapters: Dict[str, BaseArtifactAdapter] = {}
         self._register_builtin_adapters()
@@ -1798,24 +1848,111 @@ class BomGenerator:
     # BOM generation
     # ------------------------------------------------------------------
 
-    def _query_artifacts(self) -> List[Artifact]:
-        """Query all artifacts from the DB session (SQLAlchemy 1.x style).
+    def _query_artifacts(self, project_id: Optional[str] = None) -> Iterable[Artifact]:
+        """Stream artifacts from the DB session (SQLAlchemy 1.x style).
 
         Uses the local-repo ``session.query()`` convention mandated by the
-        cache CLAUDE.md invariants.
+        cache CLAUDE.md invariants, fetching rows in ``yield_per`` batches so
+        large caches are never materialised as one list.
+
+        Args:
+            project_id: Optional project identifier to filter artifacts.
 
         Returns:
-            List of all ``Artifact`` ORM rows accessible via the session.
+            Iterable of ``Artifact`` ORM rows in ``(type, name)`` order.
         """
-        return self._session.query(Artifact).all()
+        query = self._session.query(Artifact)
+        if project_id is not None:
+            query = query.filter(Artifact.project_id == project_id)
+        return query.order_by(Artifact.type, Artifact.name, Artifact.id).yield_per(
+            self._batch_size
+        )
+
+    def _precompute_hashes(
+        self,
+        artifacts: List[Artifact],
+        pool: Optional[ThreadPoolExecutor],
+    ) -> Dict[str, str]:
+        """Hash the filesystem paths of a batch, in parallel when a pool is given.
+
+        Paths are resolved on the calling thread; workers only touch the
+        filesystem.  Paths that fail to hash are left out so the adapter's own
+        fallback chain handles them.
+        """
+        paths: Dict[str, Path] = {}
+        for artifact in artifacts:
+            fs_path = _resolve_artifact_fs_path(artifact, self._project_path)
+            if fs_path is not None:
+                paths.setdefault(str(fs_path), fs_path)
+
+        def hash_one(fs_path: Path) -> Optional[str]:
+            try:
+                return self._hash_cache.hash_path(fs_path)
+            except (FileNotFoundError, ValueError, OSError):
+                return None
+
+        keys = list(paths)
+        if pool is None:
+            results = [hash_one(paths[key]) for key in keys]
+        else:
+            results = list(pool.map(hash_one, (paths[key] for key in keys)))
+        return {key: value for key, value in zip(keys, results) if value is not None}
+
+    def _adapt_batch(
+        self,
+        artifacts: List[Artifact],
+        pool: Optional[ThreadPoolExecutor],
+        entries: List[Dict[str, Any]],
+        skipped_types: List[str],
+    ) -> None:
+        """Adapt one batch of artifacts into *entries* (calling thread only)."""
+        token = _PRECOMPUTED_HASHES.set(self._precompute_hashes(artifacts, pool))
+        try:
+            for artifact in artifacts:
+                adapter = self.get_adapter(artifact.type)
+                if adapter is None:
+                    if artifact.type not in skipped_types:
+                        logger.warning(
+                            "No BOM adapter registered for artifact type %r; "
+                            "skipping artifact %r (id=%r).",
+                            artifact.type,
+                            artifact.name,
+                            artifact.id,
+                        )
+                        skipped_types.append(artifact.type)
+                    else:
+                        logger.debug(
+                            "Skipping artifact %r (type=%r): no adapter.",
+                            artifact.name,
+                            artifact.type,
+                        )
+                    continue
+
+                try:
+                    entries.append(adapter.adapt(artifact, self._project_path))
+                except Exception as exc:  # pragma: no cover
+                    logger.error(
+                        "Adapter %r raised an exception for artifact %r (id=%r): %s",
+                        adapter.get_artifact_type(),
+                        artifact.name,
+                        artifact.id,
+                        exc,
+                        exc_info=True,
+                    )
+                    # Skip the artifact rather than crashing the whole BOM.
+                    continue
+        finally:
+            _PRECOMPUTED_HASHES.reset(token)
 
     def generate(self, project_id: Optional[str] = None) -> Dict[str, Any]:
         """Generate and return the BOM dict.
 
-        Queries artifacts from the database, adapts each one using the
-        registered adapter for its type, and returns the assembled BOM.
-        Artifacts whose type has no registered adapter are skipped with a
-        warning so that partial BOMs remain useful.
+        Streams artifacts from the database in batches, hashes each batch's
+        filesystem paths (in a thread pool, reusing still-valid cached
+        hashes), adapts each artifact using the registered adapter for its
+        type, and returns the assembled BOM.  Artifacts whose type has no
+        registered adapter are skipped with a warning so that partial BOMs
+        remain useful.
 
         The artifact list is sorted deterministically by ``(type, name)``
         before being included in the output.
@@ -1835,56 +1972,41 @@ class BomGenerator:
             self._project_path,
         )
 
-        # Query artifacts — filter by project when an id is provided.
-        try:
-            query = self._session.query(Artifact)
-            if project_id is not None:
-                query = query.filter(Artifact.project_id == project_id)
-            artifacts: List[Artifact] = query.all()
-        except Exception as exc:  # pragma: no cover
-            logger.error("Failed to query artifacts from DB: %s", exc)
-            raise
-
-        logger.debug("Queried %d artifact(s) from DB.", len(artifacts))
-
-        # Adapt each artifact.
         entries: List[Dict[str, Any]] = []
         skipped_types: List[str] = []
+        artifact_total = 0
+        hits_before = self._hash_cache.hits
 
-        for artifact in artifacts:
-            adapter = self.get_adapter(artifact.type)
-            if adapter is None:
-                if artifact.type not in skipped_types:
-                    logger.warning(
-                        "No BOM adapter registered for artifact type %r; "
-                        "skipping artifact %r (id=%r).",
-                        artifact.type,
-                        artifact.name,
-                        artifact.id,
-                    )
-                    skipped_types.append(artifact.type)
-                else:
-                    logger.debug(
-                        "Skipping artifact %r (type=%r): no adapter.",
-                        artifact.name,
-                        artifact.type,
-                    )
-                continue
-
+        pool = (
+            ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="bom-hash"
+            )
+            if self._max_workers > 1
+            else None
+        )
+        try:
+            batch: List[Artifact] = []
             try:
-                entry = adapter.adapt(artifact, self._project_path)
-                entries.append(entry)
+                for artifact in self._query_artifacts(project_id):
+                    batch.append(artifact)
+                    if len(batch) >= self._batch_size:
+                        artifact_total += len(batch)
+                        self._adapt_batch(batch, pool, entries, skipped_types)
+                        batch = []
             except Exception as exc:  # pragma: no cover
-                logger.error(
-                    "Adapter %r raised an exception for artifact %r (id=%r): %s",
-                    adapter.get_artifact_type(),
-                    artifact.name,
-                    artifact.id,
-                    exc,
-                    exc_info=True,
-                )
-                # Skip the artifact rather than crashing the whole BOM.
-                continue
+                logger.error("Failed to query artifacts from DB: %s", exc)
+                raise
+            if batch:
+                artifact_total += len(batch)
+                self._adapt_batch(batch, pool, entries, skipped_types)
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True)
+
+        try:
+            self._hash_cache.save()
+        except OSError as exc:
+            logger.warning("Could not persist BOM hash cache: %s", exc)
 
         # Sort deterministically: primary key = type, secondary key = name.
         entries.sort(key=lambda e: (e.get("type", ""), e.get("name", "")))
@@ -1892,10 +2014,12 @@ class BomGenerator:
         elapsed_ms = (time.monotonic() - start_ts) * 1000.0
         logger.info(
             "BomGenerator.generate() completed: %d entries in %.1f ms "
-            "(%d artifact(s) skipped due to missing adapters).",
+            "(%d artifact(s) skipped due to missing adapters, "
+            "%d cached hash(es) reused).",
             len(entries),
             elapsed_ms,
-            len(artifacts) - len(entries),
+            artifact_total - len(entries),
+            self._hash_cache.hits - hits_before,
         )
 
         return {
@@ -1909,3 +2033,99 @@ class BomGenerator:
                 "elapsed_ms": round(elapsed_ms, 3),
             },
         }
+
+    def generate_incremental(
+        self,
+        previous_bom: Dict[str, Any],
+        project_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Generate a BOM delta against *previous_bom* (e.g. the last context.lock).
+
+        Args:
+            previous_bom: BOM dict previously returned by ``generate()``.
+            project_id: Optional project identifier to filter artifacts.
+
+        Returns:
+            Delta dict as returned by :func:`diff_boms`.
+        """
+        return diff_boms(previous_bom, self.generate(project_id=project_id))
+
+
+# ---------------------------------------------------------------------------
+# Incremental BOMs
+# ---------------------------------------------------------------------------
+
+
+def _entry_key(entry: Dict[str, Any]) -> Tuple[str, str]:
+    return (entry.get("type", ""), entry.get("name", ""))
+
+
+def diff_boms(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the entries of *current* that differ from *previous*.
+
+    The delta keeps the BOM envelope of *current* but its ``artifacts`` list
+    holds only added or changed entries; ``removed`` lists the
+    ``{"type", "name"}`` keys that disappeared.  Both lists are sorted by
+    ``(type, name)`` so the delta is deterministic.
+
+    Args:
+        previous: Earlier BOM dict.
+        current: Newer BOM dict.
+
+    Returns:
+        Delta dict with ``incremental: True``.
+    """
+    before = {_entry_key(e): e for e in previous.get("artifacts", [])}
+    after = {_entry_key(e): e for e in current.get("artifacts", [])}
+
+    changed = [after[key] for key in sorted(after) if before.get(key) != after[key]]
+    removed = [
+        {"type": key[0], "name": key[1]} for key in sorted(before) if key not in after
+    ]
+
+    delta = {key: value for key, value in current.items() if key != "artifacts"}
+    delta.update(
+        {
+            "incremental": True,
+            "base_generated_at": previous.get("generated_at"),
+            "artifacts": changed,
+            "removed": removed,
+        }
+    )
+    delta["metadata"] = dict(current.get("metadata", {}))
+    delta["metadata"].update(
+        {"changed_count": len(changed), "removed_count": len(removed)}
+    )
+    return delta
+
+
+def apply_incremental_bom(
+    previous: Dict[str, Any], delta: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Rebuild the full BOM from *previous* and a delta from :func:`diff_boms`.
+
+    Args:
+        previous: The BOM the delta was computed against.
+        delta: Delta dict.
+
+    Returns:
+        Full BOM dict equal to the one the delta was computed from.
+    """
+    merged = {_entry_key(e): e for e in previous.get("artifacts", [])}
+    for key in delta.get("removed", []):
+        merged.pop((key["type"], key["name"]), None)
+    for entry in delta.get("artifacts", []):
+        merged[_entry_key(entry)] = entry
+
+    bom = {
+        key: value
+        for key, value in delta.items()
+        if key not in ("incremental", "base_generated_at", "removed")
+    }
+    bom["artifacts"] = [merged[key] for key in sorted(merged)]
+    bom["metadata"] = {
+        key: value
+        for key, value in delta.get("metadata", {}).items()
+        if key not in ("changed_count", "removed_count")
+    }
+    return bom
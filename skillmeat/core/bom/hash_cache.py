@@ -0,0 +1,170 @@
+"""Stat-validated content-hash cache for BOM generation.
+
+Hashing every artifact directory is the dominant cost of
+``BomGenerator.generate()``.  ``BomHashCache`` remembers the hash computed for
+each filesystem path together with a *stat fingerprint* — a digest of every
+file's relative path, size and ``mtime_ns`` under that path.  On the next run
+the fingerprint is recomputed (``stat()`` only, no file reads) and the stored
+hash is reused when it matches.
+
+Entries whose newest file was modified within ``RACY_WINDOW_SECONDS`` of the
+fingerprint are not stored: a same-size write in the same mtime tick would
+otherwise go unnoticed (the "racy git" problem).
+
+The cache is in-memory by default.  Pass a ``path`` to persist it as JSON
+between runs (the CLI uses :meth:`BomHashCache.default_path`).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from skillmeat.core.hashing import _is_excluded, compute_artifact_hash
+
+logger = logging.getLogger(__name__)
+
+_CACHE_FORMAT_VERSION = 1
+
+# Files modified this recently are not trusted to have a stable fingerprint.
+RACY_WINDOW_SECONDS = 2.0
+
+
+def stat_fingerprint(path: Path) -> Tuple[str, int]:
+    """Return ``(fingerprint, newest_mtime_ns)`` for a file or directory.
+
+    Directory walks skip the same excluded names as
+    :func:`~skillmeat.core.hashing.compute_artifact_hash`, so tool caches such
+    as ``__pycache__`` do not invalidate entries.
+
+    Raises:
+        FileNotFoundError: If *path* does not exist.
+    """
+    h = hashlib.sha256()
+    newest = 0
+    if path.is_file():
+        st = path.stat()
+        h.update(f"\x00{st.st_size}\x00{st.st_mtime_ns}\n".encode())
+        return h.hexdigest(), st.st_mtime_ns
+    if not path.is_dir():
+        raise FileNotFoundError(f"Artifact path does not exist: {path}")
+
+    records = []
+    for dirpath, dirnames, filenames in os.walk(path, followlinks=True):
+        dirnames[:] = [d for d in dirnames if not _is_excluded(d)]
+        for filename in filenames:
+            if _is_excluded(filename):
+                continue
+            full_path = Path(dirpath) / filename
+            try:
+                st = full_path.stat()
+            except OSError:
+                continue
+            relative = full_path.relative_to(path).as_posix()
+            records.append(f"{relative}\x00{st.st_size}\x00{st.st_mtime_ns}\n")
+            newest = max(newest, st.st_mtime_ns)
+    for record in sorted(records):
+        h.update(record.encode())
+    return h.hexdigest(), newest
+
+
+class BomHashCache:
+    """Thread-safe map of path -> (stat fingerprint, content hash).
+
+    Args:
+        path: Optional JSON file to load from and :meth:`save` to.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Tuple[str, str]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        if path is not None:
+            self._load()
+
+    @staticmethod
+    def default_path() -> Path:
+        """Return the per-user cache file (``~/.skillmeat/cache/bom-hashes.json``)."""
+        return Path.home() / ".skillmeat" / "cache" / "bom-hashes.json"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def hash_path(self, path: Path) -> str:
+        """Return the content hash of *path*, reusing a stored hash if still valid.
+
+        Produces exactly what :func:`~skillmeat.core.hashing.compute_artifact_hash`
+        returns for the same path.
+
+        Raises:
+            FileNotFoundError: If *path* does not exist.
+            ValueError: If *path* is neither a file nor a directory.
+        """
+        key = str(path.resolve())
+        fingerprint, newest_ns = stat_fingerprint(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == fingerprint:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        content_hash = compute_artifact_hash(str(path))
+
+        if time.time_ns() - newest_ns > RACY_WINDOW_SECONDS * 1e9:
+            with self._lock:
+                self._entries[key] = (fingerprint, content_hash)
+                self._dirty = True
+        return content_hash
+
+    def save(self) -> None:
+        """Atomically write the cache to :attr:`path` if it changed."""
+        if self.path is None or not self._dirty:
+            return
+        with self._lock:
+            payload = {
+                "version": _CACHE_FORMAT_VERSION,
+                "entries": {k: list(v) for k, v in sorted(self._entries.items())},
+            }
+            self._dirty = False
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=".bom_hashes_", suffix=".json"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(payload, fh)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _load(self) -> None:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable BOM hash cache %s: %s", self.path, exc)
+            return
+        if payload.get("version") != _CACHE_FORMAT_VERSION:
+            return
+        self._entries = {
+            key: (value[0], value[1])
+            for key, value in payload.get("entries", {}).items()
+            if isinstance(value, list) and len(value) == 2
+        }
@@ -12,10 +12,13 @@ import hashlib
 import json
 import os
 import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from cryptography.exceptions import InvalidSignature
 from cryptography.hazmat.primitives import serialization
@@ -72,6 +75,21 @@ class VerificationResult:
     error: Optional[str]  # None if valid, error message if invalid
 
 
+@dataclass
+class BatchVerificationResult:
+    """Result of verifying many signatures with one key."""
+
+    results: List[VerificationResult]  # one per item, in input order
+    valid_count: int
+    invalid_count: int
+    elapsed_ms: float
+
+    @property
+    def all_valid(self) -> bool:
+        """True when every item in the batch verified."""
+        return self.invalid_count == 0
+
+
 @dataclass
 class ChainValidationResult:
     """Result of validating a chain of signed BOM snapshots."""
@@ -114,6 +132,55 @@ def _raw_public_bytes(public_key: Ed25519PublicKey) -> bytes:
     )
 
 
+# Parsed public keys keyed by key ID, plus the PEM digest -> key ID mapping
+# used to find them.  Parsing PEM is far more expensive than an Ed25519
+# verify, so chains and batches parse each distinct key once per process.
+_PUBLIC_KEY_CACHE: Dict[str, Ed25519PublicKey] = {}
+_PEM_KEY_IDS: Dict[str, str] = {}
+# Public key file contents keyed by (path, mtime_ns, size).
+_KEY_FILE_CACHE: Dict[Tuple[str, int, int], bytes] = {}
+_KEY_CACHE_LOCK = threading.Lock()
+_KEY_CACHE_MAX = 64
+
+# Batches smaller than this are verified on the calling thread.
+_PARALLEL_VERIFY_THRESHOLD = 16
+
+
+def _load_public_key(public_key: bytes) -> Tuple[Ed25519PublicKey, str]:
+    """Return ``(key, key_id)`` for PEM bytes, parsing each key only once.
+
+    Raises:
+        VerificationError: If the PEM holds a non-Ed25519 key.
+        ValueError: If *public_key* cannot be parsed as a PEM public key.
+    """
+    pem_digest = hashlib.sha256(public_key).hexdigest()
+    with _KEY_CACHE_LOCK:
+        key_id = _PEM_KEY_IDS.get(pem_digest)
+        if key_id is not None:
+            return _PUBLIC_KEY_CACHE[key_id], key_id
+
+    loaded = serialization.load_pem_public_key(public_key)
+    if not isinstance(loaded, Ed25519PublicKey):
+        raise VerificationError("Key is not an Ed25519 public key")
+    key_id = _compute_key_id(_raw_public_bytes(loaded))
+
+    with _KEY_CACHE_LOCK:
+        if len(_PEM_KEY_IDS) >= _KEY_CACHE_MAX:
+            _PEM_KEY_IDS.clear()
+            _PUBLIC_KEY_CACHE.clear()
+        _PEM_KEY_IDS[pem_digest] = key_id
+        _PUBLIC_KEY_CACHE[key_id] = loaded
+    return loaded, key_id
+
+
+def clear_key_cache() -> None:
+    """Drop all cached public keys and key file contents."""
+    with _KEY_CACHE_LOCK:
+        _PUBLIC_KEY_CACHE.clear()
+        _PEM_KEY_IDS.clear()
+        _KEY_FILE_CACHE.clear()
+
+
 def _set_private_permissions(path: Path) -> None:
     """Set restrictive permissions on a private key file (0o600)."""
     try:
@@ -235,9 +302,20 @@ def load_verify_key(key_path: Optional[Path] = None) -> bytes:
             "Generate one with generate_signing_keypair()."
         )
     try:
-        return path.read_bytes()
+        st = path.stat()
+        cache_key = (str(path), st.st_mtime_ns, st.st_size)
+        with _KEY_CACHE_LOCK:
+            cached = _KEY_FILE_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        content = path.read_bytes()
     except OSError as exc:
         raise VerificationError(f"Cannot read public key from {path}: {exc}") from exc
+    with _KEY_CACHE_LOCK:
+        if len(_KEY_FILE_CACHE) >= _KEY_CACHE_MAX:
+            _KEY_FILE_CACHE.clear()
+        _KEY_FILE_CACHE[cache_key] = content
+    return content
 
 
 # ---------------------------------------------------------------------------
@@ -332,15 +410,14 @@ def verify_signature(
             )
 
     try:
-        loaded_pub = serialization.load_pem_public_key(public_key)
-        if not isinstance(loaded_pub, Ed25519PublicKey):
-            return VerificationResult(
-                valid=False,
-                algorithm="ed25519",
-                key_id=None,
-                error="Key is not an Ed25519 public key",
-            )
-        key_obj = loaded_pub
+        key_obj, key_id = _load_public_key(public_key)
+    except VerificationError as exc:
+        return VerificationResult(
+            valid=False,
+            algorithm="ed25519",
+            key_id=None,
+            error=str(exc),
+        )
     except (ValueError, TypeError, Exception) as exc:
         return VerificationResult(
             valid=False,
@@ -349,9 +426,16 @@ def verify_signature(
             error=f"Failed to deserialize public key: {exc}",
         )
 
-    raw_pub = _raw_public_bytes(key_obj)
-    key_id = _compute_key_id(raw_pub)
+    return _verify_with_key(key_obj, key_id, bom_content, signature)
+
 
+def _verify_with_key(
+    key_obj: Ed25519PublicKey,
+    key_id: str,
+    bom_content: bytes,
+    signature: bytes,
+) -> VerificationResult:
+    """Verify one signature with an already-parsed key."""
     try:
         key_obj.verify(signature, bom_content)
         return VerificationResult(
@@ -376,6 +460,80 @@ def verify_signature(
         )
 
 
+def verify_signatures(
+    items: Sequence[Tuple[bytes, bytes]],
+    public_key: Optional[bytes] = None,
+    key_path: Optional[Path] = None,
+    max_workers: Optional[int] = None,
+) -> BatchVerificationResult:
+    """Verify many ``(content, signature)`` pairs against one public key.
+
+    The key is loaded and parsed once for the whole batch; large batches are
+    fanned out across a thread pool.  Results keep the input order.
+
+    Args:
+        items: ``(content, signature)`` byte pairs.
+        public_key: PEM-encoded Ed25519 public key bytes.  Takes precedence
+            over *key_path* when supplied.
+        key_path: Path to a PEM-encoded Ed25519 public key file.
+        max_workers: Thread count for large batches.  Defaults to
+            ``min(8, os.cpu_count())``.
+
+    Returns:
+        :class:`BatchVerificationResult` with one result per item.
+    """
+    start = time.perf_counter()
+    results: List[VerificationResult]
+
+    failure: Optional[VerificationResult] = None
+    key_obj: Optional[Ed25519PublicKey] = None
+    key_id = ""
+    if items:
+        try:
+            if public_key is None:
+                public_key = load_verify_key(key_path)
+            key_obj, key_id = _load_public_key(public_key)
+        except KeyNotFoundError as exc:
+            failure = VerificationResult(
+                valid=False, algorithm="ed25519", key_id=None, error=str(exc)
+            )
+        except VerificationError as exc:
+            failure = VerificationResult(
+                valid=False, algorithm="ed25519", key_id=None, error=str(exc)
+            )
+        except (ValueError, TypeError, Exception) as exc:
+            failure = VerificationResult(
+                valid=False,
+                algorithm="ed25519",
+                key_id=None,
+                error=f"Failed to deserialize public key: {exc}",
+            )
+
+    if failure is not None or key_obj is None:
+        results = [failure] * len(items) if failure is not None else []
+    else:
+
+        def verify_one(item: Tuple[bytes, bytes]) -> VerificationResult:
+            return _verify_with_key(key_obj, key_id, item[0], item[1])
+
+        workers = max_workers or min(8, os.cpu_count() or 1)
+        if len(items) < _PARALLEL_VERIFY_THRESHOLD or workers <= 1:
+            results = [verify_one(item) for item in items]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="bom-verify"
+            ) as pool:
+                results = list(pool.map(verify_one, items))
+
+    valid_count = sum(1 for result in results if result.valid)
+    return BatchVerificationResult(
+        results=results,
+        valid_count=valid_count,
+        invalid_count=len(results) - valid_count,
+        elapsed_ms=round((time.perf_counter() - start) * 1000.0, 3),
+    )
+
+
 # ---------------------------------------------------------------------------
 # File Operations
 # ---------------------------------------------------------------------------
@@ -523,6 +681,25 @@ def validate_signature_chain(
     verified_count = 0
     unsigned_count = 0
 
+    # Encode each payload once and verify every well-formed signature in a
+    # single batch (one key load, parallel verification for long chains).
+    payloads: List[Optional[bytes]] = []
+    signed: Dict[int, Tuple[bytes, bytes]] = {}
+    for idx, snapshot in enumerate(snapshots):
+        payload = snapshot.get("bom_json")
+        if isinstance(payload, str):
+            payload = payload.encode()
+        payloads.append(payload)
+        if snapshot.get("signature") and payload is not None:
+            try:
+                signed[idx] = (payload, bytes.fromhex(snapshot["signature"]))
+            except ValueError:
+                pass  # reported as invalid hex below
+    batch = verify_signatures(
+        list(signed.values()), public_key=public_key, key_path=key_path
+    )
+    verified = dict(zip(signed, batch.results))
+
     for idx, snapshot in enumerate(snapshots):
         bom_json: Optional[str] = snapshot.get("bom_json")
         signature_hex: Optional[str] = snapshot.get("signature")
@@ -537,18 +714,13 @@ def validate_signature_chain(
                 if first_break_at is None:
                     first_break_at = idx
             else:
-                bom_bytes = bom_json.encode() if isinstance(bom_json, str) else bom_json
-                try:
-                    sig_bytes = bytes.fromhex(signature_hex)
-                except ValueError:
+                if idx not in verified:
                     err = f"[{idx}] signature is not valid hex"
                     errors.append(err)
                     if first_break_at is None:
                         first_break_at = idx
                 else:
-                    result = verify_signature(
-                        bom_bytes, sig_bytes, public_key=public_key, key_path=key_path
-                    )
+                    result = verified[idx]
                     if result.valid:
                         verified_count += 1
                     else:
@@ -581,8 +753,7 @@ def validate_signature_chain(
 
         # --- content_hash self-consistency ---
         if content_hash is not None and bom_json is not None:
-            bom_bytes = bom_json.encode() if isinstance(bom_json, str) else bom_json
-            computed = hashlib.sha256(bom_bytes).hexdigest()
+            computed = hashlib.sha256(payloads[idx]).hexdigest()
             if computed != content_hash:
                 err = (
                     f"[{idx}] content_hash mismatch: declared {content_hash!r}, "
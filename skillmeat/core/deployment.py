@@ -22,6 +22,7 @@ from skillmeat.core.path_resolver import (
     resolve_deployment_path,
     resolve_profile_root,
 )
+from skillmeat.observability.hotpath import hot_path, hotpath_phase
 from skillmeat.observability.timing import PerfTimer
 from skillmeat.utils.filesystem import FilesystemManager, compute_content_hash
 
@@ -999,6 +1000,7 @@ class DeploymentManager:
                 profile_id=profile_id,
             )
 
+    @hot_path("deployment.compute_statuses_batch")
     def compute_deployment_statuses_batch(
         self,
         project_path: Optional[Path] = None,
@@ -1066,9 +1068,10 @@ class DeploymentManager:
         ):
             # -- Step 1: load deployments once (reuse if caller already has them) --
             if deployments is None:
-                deployments = DeploymentTracker.read_deployments(
-                    project_path, profile_root_dir=None
-                )
+                with hotpath_phase("io"):
+                    deployments = DeploymentTracker.read_deployments(
+                        project_path, profile_root_dir=None
+                    )
 
             if profile_id:
                 deployments = [
@@ -33,13 +33,15 @@ Timestamp Tracking:
     - New/modified artifacts get current timestamp; unchanged preserve original
 """
 
+import copy
 import json
 import logging
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from pydantic import BaseModel, Field
 
@@ -54,6 +56,11 @@ from skillmeat.core.artifact_detection import (
     extract_manifest_file,
     get_artifact_type_from_container,
 )
+from skillmeat.core.discovery_cache import (
+    CachedDiscovery,
+    DiscoveryCache,
+    fingerprint_artifact,
+)
 from skillmeat.core.discovery_metrics import (
     discovery_artifacts_found,
     discovery_errors_total,
@@ -71,6 +78,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Default size of the per-directory worker pool used to process artifacts.
+# Work is dominated by filesystem I/O (stat, frontmatter reads, hashing),
+# which releases the GIL, so threads overlap latency on slow/network mounts.
+DEFAULT_DISCOVERY_WORKERS = 8
+
 # Deprecation warning messages for legacy artifact patterns
 DEPRECATION_WARNINGS = {
     "directory_command": (
@@ -579,6 +591,13 @@ class ArtifactDiscoveryService:
 
     Performance Target:
         <2 seconds for 50+ artifacts
+
+    Concurrency and Caching:
+        Entries of each type directory are listed with a single scandir and
+        processed in a bounded thread pool (``max_workers``).  When a
+        ``DiscoveryCache`` is supplied, detection, validation, metadata and
+        content hash are reused for artifacts whose stat fingerprint is
+        unchanged since the previous scan.
     """
 
     supported_types: List[str] = [t.value for t in ArtifactType.primary_types()]
@@ -589,6 +608,8 @@ class ArtifactDiscoveryService:
         scan_mode: str = "auto",
         profile_root_dir: Optional[str] = None,
         profile_root_dirs: Optional[List[str]] = None,
+        max_workers: int = DEFAULT_DISCOVERY_WORKERS,
+        cache: Optional[DiscoveryCache] = None,
     ):
         """Initialize the discovery service.
 
@@ -597,9 +618,14 @@ class ArtifactDiscoveryService:
             scan_mode: Scan mode - "project" (profile roots), "collection" (artifacts/), or "auto" (detect)
             profile_root_dir: Optional explicit profile root (e.g., ".codex")
             profile_root_dirs: Optional profile root priority list
+            max_workers: Threads used to process artifacts of a type directory
+                (1 = sequential)
+            cache: Optional persisted discovery cache for fast repeat scans
         """
         self.base_path = base_path
         self.scan_mode = scan_mode
+        self.max_workers = max(1, max_workers)
+        self.cache = cache
         roots = profile_root_dirs or (
             [profile_root_dir]
             if profile_root_dir
@@ -652,6 +678,8 @@ class ArtifactDiscoveryService:
         artifact_name: str,
         artifact_type: str,
         manifest: Optional["Collection"] = None,
+        content_hash: Optional[str] = None,
+        lock_entries: Optional[Dict[Any, Any]] = None,
     ) -> datetime:
         """Get discovery timestamp for artifact.
 
@@ -664,6 +692,8 @@ class ArtifactDiscoveryService:
             artifact_name: Artifact name
             artifact_type: Artifact type
             manifest: Optional Collection manifest for timestamp lookup
+            content_hash: Precomputed content hash (computed if None)
+            lock_entries: Preloaded lockfile entries (read if None)
 
         Returns:
             ISO 8601 timestamp - current if new/modified, preserved if unchanged
@@ -671,19 +701,21 @@ class ArtifactDiscoveryService:
         now = datetime.now(timezone.utc)
 
         # Compute current content hash
-        try:
-            current_hash = compute_content_hash(artifact_path)
-        except Exception as e:
-            logger.debug(f"Failed to compute hash for {artifact_path}: {e}")
-            # If we can't compute hash, treat as new
-            return now
+        current_hash = content_hash
+        if current_hash is None:
+            try:
+                current_hash = compute_content_hash(artifact_path)
+            except Exception as e:
+                logger.debug(f"Failed to compute hash for {artifact_path}: {e}")
+                # If we can't compute hash, treat as new
+                return now
 
         # Check lockfile for existing hash
         try:
-            from skillmeat.storage.lockfile import LockManager
+            if lock_entries is None:
+                from skillmeat.storage.lockfile import LockManager
 
-            lock_mgr = LockManager()
-            lock_entries = lock_mgr.read(self.base_path)
+                lock_entries = LockManager().read(self.base_path)
             lock_key = (artifact_name, artifact_type)
 
             if lock_key in lock_entries:
@@ -908,6 +940,12 @@ class ArtifactDiscoveryService:
             logger.error(error_msg, exc_info=True)
             errors.append(error_msg)
 
+        # Persist path-derived results; drop entries for artifacts that are gone
+        if self.cache is not None:
+            self.cache.save(
+                prune_root=str(self.artifacts_base), prune_before=start_time
+            )
+
         # Check existence and populate collection_match for all artifacts
         # Strategy: Return ALL artifacts but track which are importable (new)
         importable_count = 0
@@ -1234,117 +1272,218 @@ class ArtifactDiscoveryService:
 
         discovered: List[DiscoveredArtifact] = []
 
+        # One scandir per type directory; hidden entries are skipped
+        artifact_paths: List[Path] = []
         try:
             with os.scandir(type_dir) as entries:
                 for entry in entries:
-                    # Skip hidden files/directories
-                    if entry.name.startswith("."):
-                        continue
+                    if not entry.name.startswith("."):
+                        artifact_paths.append(Path(entry.path))
+        except PermissionError as e:
+            error_msg = f"Permission denied scanning {type_dir}: {e}"
+            logger.warning(error_msg)
+            errors.append(error_msg)
 
-                    artifact_path = Path(entry.path)
+        # Lockfile is read once per directory instead of once per artifact
+        lock_entries = self._read_lock_entries()
 
-                    # Try to detect and process artifact
-                    try:
-                        detected_type = self._detect_artifact_type(artifact_path)
+        def process(artifact_path: Path):
+            return self._process_artifact_entry(
+                artifact_path,
+                manifest,
+                collection_membership_index,
+                lock_entries,
+            )
 
-                        # If detection failed or type mismatch, skip
-                        if detected_type is None:
-                            logger.debug(
-                                f"Could not detect artifact type: {artifact_path}"
-                            )
-                            continue
+        # Process entries concurrently; results keep directory order
+        workers = min(self.max_workers, len(artifact_paths))
+        if workers > 1:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="discovery"
+            ) as executor:
+                results = list(executor.map(process, artifact_paths))
+        else:
+            results = [process(path) for path in artifact_paths]
 
-                        # Validate artifact structure
-                        if not self._validate_artifact(artifact_path, detected_type):
-                            error_msg = f"Invalid artifact structure: {artifact_path}"
-                            logger.warning(error_msg)
-                            errors.append(error_msg)
-                            continue
+        for artifact, entry_errors in results:
+            errors.extend(entry_errors)
+            if artifact is not None:
+                discovered.append(artifact)
 
-                        # Check for deprecated patterns (logs warning but continues)
-                        self._check_deprecation(artifact_path, detected_type)
+        # Scan for nested artifacts (only for types that support nesting)
+        nested: List[DiscoveredArtifact] = self._discover_nested_artifacts(
+            type_dir, artifact_type, errors
+        )
+        discovered.extend(nested)
 
-                        # Extract metadata
-                        metadata = self._extract_artifact_metadata(
-                            artifact_path, detected_type
-                        )
+        return discovered
 
-                        # Get artifact name
-                        artifact_name = metadata.get("name", artifact_path.stem)
+    def _read_lock_entries(self) -> Optional[Dict[Any, Any]]:
+        """Read lockfile entries for the scanned project.
 
-                        # Get timestamp (preserves existing if unchanged)
-                        discovered_at = self._get_artifact_timestamp(
-                            artifact_path, artifact_name, detected_type, manifest
-                        )
+        Returns:
+            Lock entries keyed by (name, type), or None if unavailable (callers
+            then fall back to reading the lockfile themselves)
+        """
+        try:
+            from skillmeat.storage.lockfile import LockManager
 
-                        # Compute content hash for deduplication
-                        content_hash = None
-                        try:
-                            content_hash = compute_content_hash(artifact_path)
-                        except Exception as hash_err:
-                            logger.debug(
-                                f"Failed to compute content hash for {artifact_path}: {hash_err}"
-                            )
+            return LockManager().read(self.base_path)
+        except Exception as e:
+            logger.debug(f"Could not read lockfile for {self.base_path}: {e}")
+            return None
 
-                        # Determine collection membership status
-                        collection_status = None
-                        collection_match = None
-                        if collection_membership_index is not None:
-                            collection_status = self._check_collection_membership(
-                                artifact_name,
-                                detected_type,
-                                metadata.get("source"),
-                                collection_membership_index,
-                            )
-                            # Compute hash-based match with confidence score
-                            collection_match = self._compute_collection_match(
-                                content_hash,
-                                artifact_name,
-                                detected_type,
-                                collection_membership_index,
-                            )
+    def _inspect_artifact(self, artifact_path: Path) -> CachedDiscovery:
+        """Detect, validate, parse and hash one artifact, using the cache.
 
-                        # Create DiscoveredArtifact
-                        artifact = DiscoveredArtifact(
-                            type=detected_type,
-                            name=artifact_name,
-                            source=metadata.get("source"),
-                            version=metadata.get("version"),
-                            scope=metadata.get("scope"),
-                            tags=metadata.get("tags", []),
-                            description=metadata.get("description"),
-                            path=str(artifact_path),
-                            discovered_at=discovered_at,
-                            collection_status=collection_status,
-                            content_hash=content_hash,
-                            collection_match=collection_match,
-                        )
+        Args:
+            artifact_path: Path to potential artifact
 
-                        discovered.append(artifact)
-                        logger.debug(
-                            f"Discovered {detected_type}: {artifact.name} "
-                            f"(in_collection={collection_status.in_collection if collection_status else 'N/A'}, "
-                            f"hash_match={collection_match.type if collection_match else 'N/A'}, "
-                            f"confidence={collection_match.confidence if collection_match else 'N/A'})"
-                        )
+        Returns:
+            Path-derived discovery results (from the cache when unchanged)
+        """
+        fingerprint = None
+        if self.cache is not None:
+            # Fingerprint before reading so edits during the scan invalidate
+            try:
+                fingerprint = fingerprint_artifact(artifact_path)
+            except OSError as e:
+                logger.debug(f"Could not fingerprint {artifact_path}: {e}")
+            if fingerprint is not None:
+                cached = self.cache.get(str(artifact_path), fingerprint)
+                if cached is not None:
+                    return cached
+
+        detected_type = self._detect_artifact_type(artifact_path)
+        valid = detected_type is not None and self._validate_artifact(
+            artifact_path, detected_type
+        )
+        metadata: Dict[str, Any] = {}
+        content_hash = None
+        if valid:
+            metadata = self._extract_artifact_metadata(artifact_path, detected_type)
+            try:
+                content_hash = compute_content_hash(artifact_path)
+            except Exception as hash_err:
+                logger.debug(
+                    f"Failed to compute content hash for {artifact_path}: {hash_err}"
+                )
 
-                    except Exception as e:
-                        error_msg = f"Error processing {artifact_path}: {e}"
-                        logger.warning(error_msg)
-                        errors.append(error_msg)
+        result = CachedDiscovery(
+            fingerprint=fingerprint or "",
+            artifact_type=detected_type,
+            valid=valid,
+            metadata=metadata,
+            content_hash=content_hash,
+        )
+        if self.cache is not None and fingerprint is not None:
+            self.cache.put(str(artifact_path), result)
+        return result
 
-        except PermissionError as e:
-            error_msg = f"Permission denied scanning {type_dir}: {e}"
-            logger.warning(error_msg)
-            errors.append(error_msg)
+    def _process_artifact_entry(
+        self,
+        artifact_path: Path,
+        manifest: Optional["Collection"] = None,
+        collection_membership_index: Optional[Dict[str, Any]] = None,
+        lock_entries: Optional[Dict[Any, Any]] = None,
+    ) -> Tuple[Optional[DiscoveredArtifact], List[str]]:
+        """Build the DiscoveredArtifact for one type-directory entry.
 
-        # Scan for nested artifacts (only for types that support nesting)
-        nested: List[DiscoveredArtifact] = self._discover_nested_artifacts(
-            type_dir, artifact_type, errors
-        )
-        discovered.extend(nested)
+        Runs in a discovery worker thread, so errors are returned rather than
+        appended to a shared list.
 
-        return discovered
+        Args:
+            artifact_path: Path to potential artifact
+            manifest: Optional Collection manifest for timestamp preservation
+            collection_membership_index: Optional pre-built membership index
+            lock_entries: Preloaded lockfile entries
+
+        Returns:
+            Tuple of (artifact or None if skipped, errors for this entry)
+        """
+        errors: List[str] = []
+        try:
+            inspected = self._inspect_artifact(artifact_path)
+            detected_type = inspected.artifact_type
+
+            # If detection failed or type mismatch, skip
+            if detected_type is None:
+                logger.debug(f"Could not detect artifact type: {artifact_path}")
+                return None, errors
+
+            # Validate artifact structure
+            if not inspected.valid:
+                error_msg = f"Invalid artifact structure: {artifact_path}"
+                logger.warning(error_msg)
+                errors.append(error_msg)
+                return None, errors
+
+            # Check for deprecated patterns (logs warning but continues)
+            self._check_deprecation(artifact_path, detected_type)
+
+            metadata = copy.deepcopy(inspected.metadata)
+            content_hash = inspected.content_hash
+
+            # Get artifact name
+            artifact_name = metadata.get("name", artifact_path.stem)
+
+            # Get timestamp (preserves existing if unchanged)
+            discovered_at = self._get_artifact_timestamp(
+                artifact_path,
+                artifact_name,
+                detected_type,
+                manifest,
+                content_hash=content_hash,
+                lock_entries=lock_entries,
+            )
+
+            # Determine collection membership status
+            collection_status = None
+            collection_match = None
+            if collection_membership_index is not None:
+                collection_status = self._check_collection_membership(
+                    artifact_name,
+                    detected_type,
+                    metadata.get("source"),
+                    collection_membership_index,
+                )
+                # Compute hash-based match with confidence score
+                collection_match = self._compute_collection_match(
+                    content_hash,
+                    artifact_name,
+                    detected_type,
+                    collection_membership_index,
+                )
+
+            # Create DiscoveredArtifact
+            artifact = DiscoveredArtifact(
+                type=detected_type,
+                name=artifact_name,
+                source=metadata.get("source"),
+                version=metadata.get("version"),
+                scope=metadata.get("scope"),
+                tags=metadata.get("tags", []),
+                description=metadata.get("description"),
+                path=str(artifact_path),
+                discovered_at=discovered_at,
+                collection_status=collection_status,
+                content_hash=content_hash,
+                collection_match=collection_match,
+            )
+
+            logger.debug(
+                f"Discovered {detected_type}: {artifact.name} "
+                f"(in_collection={collection_status.in_collection if collection_status else 'N/A'}, "
+                f"hash_match={collection_match.type if collection_match else 'N/A'}, "
+                f"confidence={collection_match.confidence if collection_match else 'N/A'})"
+            )
+            return artifact, errors
+
+        except Exception as e:
+            error_msg = f"Error processing {artifact_path}: {e}"
+            logger.warning(error_msg)
+            errors.append(error_msg)
+            return None, errors
 
     def _scan_hooks_directory(
         self,
@@ -0,0 +1,292 @@
+"""Persisted per-artifact cache for discovery scans.
+
+Discovery detects, validates, parses and hashes every artifact it finds.
+None of that changes unless the artifact's files change, so the results are
+stored per artifact path together with a stat fingerprint of the artifact
+tree (directory and file mtimes and sizes, gathered in one scandir walk).
+A repeat scan only stats each tree; artifacts whose fingerprint matches skip
+detection, frontmatter parsing and content hashing entirely.
+
+Only path-derived results are cached.  Anything that depends on the caller
+(manifest timestamps, collection membership, skip preferences) is still
+computed on every scan.
+
+Usage:
+    >>> cache = DiscoveryCache()
+    >>> fingerprint = fingerprint_artifact(path)
+    >>> entry = cache.get(str(path), fingerprint)
+    >>> if entry is None:
+    ...     entry = CachedDiscovery(fingerprint, "skill", True, metadata, digest)
+    ...     cache.put(str(path), entry)
+    >>> cache.save()
+"""
+
+import hashlib
+import json
+import logging
+import os
+import stat
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+#: Default location of the persisted discovery cache.
+DEFAULT_DISCOVERY_CACHE_PATH = Path.home() / ".skillmeat" / "cache" / "discovery.json"
+
+#: Upper bound on cached artifacts; least recently used entries are dropped.
+DEFAULT_MAX_ENTRIES = 20000
+
+#: A hit only marks the cache dirty once the entry's stored ``used`` time is
+#: this old, so an unchanged repeat scan does not rewrite the file just to
+#: refresh LRU timestamps.
+USED_PERSIST_INTERVAL = 24 * 60 * 60
+
+# Bump when the entry layout or fingerprint scheme changes.
+_CACHE_VERSION = 1
+
+
+@dataclass
+class CachedDiscovery:
+    """Path-derived discovery results for one artifact.
+
+    Attributes:
+        fingerprint: Stat fingerprint the results were computed against
+        artifact_type: Detected artifact type, or None if not an artifact
+        valid: Whether the artifact passed structure validation
+        metadata: Normalized frontmatter metadata
+        content_hash: Content hash, or None if hashing failed
+        used: Last time (epoch seconds) the entry was read or written
+    """
+
+    fingerprint: str
+    artifact_type: Optional[str]
+    valid: bool
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    content_hash: Optional[str] = None
+    used: float = 0.0
+
+
+def fingerprint_artifact(path: Path) -> str:
+    """Compute a stat fingerprint of an artifact file or directory tree.
+
+    Covers the mode, size and ``st_mtime_ns`` of the artifact itself and of
+    every file and directory below it, so adding, removing, renaming or
+    editing any file changes the result.  Symlinked directories are not
+    followed.
+
+    Args:
+        path: Artifact file or directory
+
+    Returns:
+        Hex digest identifying the current state of the tree
+
+    Raises:
+        OSError: If the tree cannot be listed or stat'ed
+    """
+    digest = hashlib.sha1()
+
+    def add(rel: str, st: os.stat_result) -> None:
+        digest.update(
+            f"{rel}\0{st.st_mode}\0{st.st_size}\0{st.st_mtime_ns}\n".encode(
+                "utf-8", "surrogateescape"
+            )
+        )
+
+    root_stat = os.stat(path)
+    add("", root_stat)
+    if not stat.S_ISDIR(root_stat.st_mode):
+        return digest.hexdigest()
+
+    stack = [(os.fspath(path), "")]
+    while stack:
+        dir_path, rel_dir = stack.pop()
+        with os.scandir(dir_path) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        for entry in entries:
+            rel = f"{rel_dir}/{entry.name}"
+            try:
+                st = entry.stat()
+            except OSError:
+                # Broken symlink: fingerprint the link itself
+                st = entry.stat(follow_symlinks=False)
+            add(rel, st)
+            if entry.is_dir(follow_symlinks=False):
+                stack.append((entry.path, rel))
+
+    return digest.hexdigest()
+
+
+class DiscoveryCache:
+    """JSON-backed map of artifact path to :class:`CachedDiscovery`.
+
+    Thread-safe: discovery workers call :meth:`get` and :meth:`put`
+    concurrently.  The file is loaded on first use and written atomically by
+    :meth:`save`; a missing, corrupt or outdated file is treated as empty.
+
+    Reads refresh ``used`` in memory only; the new timestamps reach disk with
+    the next write, or once the stored value is older than
+    :data:`USED_PERSIST_INTERVAL`.
+
+    Attributes:
+        path: Location of the JSON file
+        max_entries: Maximum number of cached artifacts
+    """
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_DISCOVERY_CACHE_PATH,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: Location of the JSON file
+            max_entries: Maximum number of cached artifacts
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, CachedDiscovery]] = None
+        self._persisted_used: Dict[str, float] = {}
+        self._dirty = False
+
+    def get(self, artifact_path: str, fingerprint: str) -> Optional[CachedDiscovery]:
+        """Return the entry for ``artifact_path`` if its fingerprint matches.
+
+        Args:
+            artifact_path: Absolute artifact path
+            fingerprint: Current result of :func:`fingerprint_artifact`
+
+        Returns:
+            Cached entry, or None on a miss or stale entry
+        """
+        with self._lock:
+            entry = self._load().get(artifact_path)
+            if entry is None or entry.fingerprint != fingerprint:
+                return None
+            entry.used = time.time()
+            stored = self._persisted_used.get(artifact_path, 0.0)
+            if entry.used - stored >= USED_PERSIST_INTERVAL:
+                self._dirty = True
+            return entry
+
+    def put(self, artifact_path: str, entry: CachedDiscovery) -> None:
+        """Store results for ``artifact_path``.
+
+        Args:
+            artifact_path: Absolute artifact path
+            entry: Results to cache
+        """
+        entry.used = time.time()
+        with self._lock:
+            self._load()[artifact_path] = entry
+            self._dirty = True
+
+    def save(
+        self, prune_root: Optional[str] = None, prune_before: Optional[float] = None
+    ) -> None:
+        """Write the cache to disk if it changed.
+
+        Args:
+            prune_root: If set together with ``prune_before``, drop entries
+                under this directory that were not used since ``prune_before``
+                (artifacts that disappeared since the last scan)
+            prune_before: Epoch seconds the current scan started
+        """
+        with self._lock:
+            entries = self._load()
+            if prune_root is not None and prune_before is not None:
+                prefix = prune_root.rstrip(os.sep) + os.sep
+                for key in [
+                    key
+                    for key, entry in entries.items()
+                    if key.startswith(prefix) and entry.used < prune_before
+                ]:
+                    del entries[key]
+                    self._dirty = True
+
+            if len(entries) > self.max_entries:
+                by_age = sorted(entries, key=lambda key: entries[key].used)
+                for key in by_age[: len(entries) - self.max_entries]:
+                    del entries[key]
+                self._dirty = True
+
+            if not self._dirty:
+                return
+
+            data = {
+                "version": _CACHE_VERSION,
+                "entries": {key: asdict(entry) for key, entry in entries.items()},
+            }
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(
+                    dir=self.path.parent, prefix=".discovery-", suffix=".tmp"
+                )
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump(data, f, default=str)
+                    os.replace(tmp_name, self.path)
+                except BaseException:
+                    try:
+                        os.unlink(tmp_name)
+                    except OSError:
+                        pass
+                    raise
+                self._persisted_used = {
+                    key: entry.used for key, entry in entries.items()
+                }
+                self._dirty = False
+            except OSError as e:
+                logger.debug(f"Could not save discovery cache {self.path}: {e}")
+
+    def clear(self) -> None:
+        """Drop all entries (the file is rewritten on the next save)."""
+        with self._lock:
+            self._entries = {}
+            self._persisted_used = {}
+            self._dirty = True
+
+    def _load(self) -> Dict[str, CachedDiscovery]:
+        """Return the in-memory entries, loading the file on first use."""
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return self._entries
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable discovery cache {self.path}: {e}")
+            return self._entries
+
+        if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+            return self._entries
+
+        for key, raw in (data.get("entries") or {}).items():
+            try:
+                self._entries[key] = CachedDiscovery(**raw)
+            except TypeError:
+                continue
+            self._persisted_used[key] = self._entries[key].used
+        return self._entries
+
+
+_default_cache: Optional[DiscoveryCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_discovery_cache() -> DiscoveryCache:
+    """Return the process-wide cache stored at the default location."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = DiscoveryCache()
+        return _default_cache
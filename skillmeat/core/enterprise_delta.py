@@ -0,0 +1,193 @@
+"""Wire format for enterprise delta sync.
+
+Shared by the enterprise content service (which writes delta archives) and
+:class:`~skillmeat.core.enterprise_sync.EnterpriseSyncer` (which reads them).
+
+Protocol
+--------
+Hash checks are conditional: ``GET /api/v1/artifacts/{id}/hash`` carries the
+artifact's ``content_hash`` as a strong ``ETag`` and answers ``304 Not
+Modified`` when the client's ``If-None-Match`` already names it.
+
+Syncs are per-file deltas: ``POST /api/v1/artifacts/delta`` takes, for each
+artifact, the client's stored ``content_hash`` and a ``{path: sha256}``
+manifest of the files it has on disk.  The response is a streamed
+gzip-compressed tar archive (no base64) holding, for each requested artifact
+in request order::
+
+    <index>/header.json        JSON header (see below)
+    <index>/files/<path>       raw bytes of each new or changed file
+
+The header lists the files that follow (``files``) and the manifest paths the
+client should delete (``removed``)::
+
+    {
+        "artifact_id": "my-skill",       # as requested
+        "status": "updated",             # "updated" | "unchanged" | "not_found"
+        "content_hash": "<sha256>",
+        "version": "v1.2.0",
+        "files": ["SKILL.md"],
+        "removed": ["old.md"],
+        "error": null
+    }
+
+Usage::
+
+    chunks = write_delta_archive([(header, [("SKILL.md", b"...")])])
+    for member in read_delta_archive(fileobj):
+        ...
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import tarfile
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+__all__ = [
+    "DELTA_MEDIA_TYPE",
+    "DeltaMember",
+    "STATUS_NOT_FOUND",
+    "STATUS_UNCHANGED",
+    "STATUS_UPDATED",
+    "etag_for",
+    "etag_matches",
+    "file_digest",
+    "read_delta_archive",
+    "write_delta_archive",
+]
+
+DELTA_MEDIA_TYPE = "application/x-gtar"
+
+STATUS_UPDATED = "updated"
+STATUS_UNCHANGED = "unchanged"
+STATUS_NOT_FOUND = "not_found"
+
+_HEADER_NAME = "header.json"
+_FILES_DIR = "files"
+
+
+class DeltaMember(NamedTuple):
+    """One member of a delta archive.
+
+    Attributes:
+        index: Position of the artifact in the request.
+        header: Parsed header dict for header members, else ``None``.
+        path: Artifact-relative POSIX path for file members, else ``None``.
+        data: File bytes (empty for header members).
+    """
+
+    index: int
+    header: Optional[Dict[str, Any]]
+    path: Optional[str]
+    data: bytes
+
+
+def file_digest(data: bytes) -> str:
+    """Return the SHA-256 hex digest used in delta manifests."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def etag_for(content_hash: str) -> str:
+    """Return the strong ``ETag`` value for *content_hash*."""
+    return f'"{content_hash}"'
+
+
+def etag_matches(if_none_match: Optional[str], content_hash: str) -> bool:
+    """Return True when an ``If-None-Match`` header names *content_hash*."""
+    if not if_none_match or not content_hash:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag.strip('"') == content_hash:
+            return True
+    return False
+
+
+class _ChunkBuffer:
+    """Write-only file object that collects output for a streaming generator."""
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _add_member(tar: tarfile.TarFile, name: str, data: bytes) -> None:
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mode = 0o644
+    tar.addfile(info, io.BytesIO(data))
+
+
+def write_delta_archive(
+    entries: Iterable[Tuple[Dict[str, Any], Iterable[Tuple[str, bytes]]]],
+) -> Iterator[bytes]:
+    """Stream a delta archive.
+
+    Args:
+        entries: ``(header, files)`` per requested artifact, in request order.
+            *files* yields ``(path, data)`` pairs and is consumed lazily, so
+            file content is read while the archive streams.
+
+    Yields:
+        Chunks of the gzip-compressed tar stream.
+    """
+    buffer = _ChunkBuffer()
+    with tarfile.open(fileobj=buffer, mode="w|gz") as tar:
+        for index, (header, files) in enumerate(entries):
+            _add_member(tar, f"{index}/{_HEADER_NAME}", json.dumps(header).encode("utf-8"))
+            for path, data in files:
+                _add_member(tar, f"{index}/{_FILES_DIR}/{path}", data)
+                chunk = buffer.drain()
+                if chunk:
+                    yield chunk
+            chunk = buffer.drain()
+            if chunk:
+                yield chunk
+    chunk = buffer.drain()
+    if chunk:
+        yield chunk
+
+
+def read_delta_archive(fileobj) -> Iterator[DeltaMember]:
+    """Read a delta archive from a (non-seekable) binary stream.
+
+    Args:
+        fileobj: Object with a ``read(size)`` method, e.g. ``response.raw``.
+
+    Yields:
+        :class:`DeltaMember` for each header and file, in archive order.
+
+    Raises:
+        ValueError: If a member name does not follow the delta layout.
+        tarfile.TarError: If the stream is not a valid archive.
+    """
+    with tarfile.open(fileobj=fileobj, mode="r|gz") as tar:
+        for info in tar:
+            if not info.isfile():
+                continue
+            index_str, _, rest = info.name.partition("/")
+            if not index_str.isdigit():
+                raise ValueError(f"Unexpected delta archive member: {info.name!r}")
+            extracted = tar.extractfile(info)
+            data = extracted.read() if extracted is not None else b""
+            if rest == _HEADER_NAME:
+                yield DeltaMember(int(index_str), json.loads(data), None, b"")
+            elif rest.startswith(f"{_FILES_DIR}/"):
+                yield DeltaMember(int(index_str), None, rest[len(_FILES_DIR) + 1 :], data)
+            else:
+                raise ValueError(f"Unexpected delta archive member: {info.name!r}")
@@ -1,7 +1,15 @@
 """Enterprise API-based sync for SkillMeat.
 
-Polls the enterprise API for the latest artifact content hash and applies
-file changes when the hash differs from the locally recorded value.
+Checks the enterprise API for the latest artifact content hash and applies
+only the files that changed since the last sync.
+
+- :meth:`EnterpriseSyncer.check` is a conditional request: the stored hash is
+  sent as ``If-None-Match`` and an up-to-date artifact costs a bodiless
+  ``304`` response.
+- :meth:`EnterpriseSyncer.sync_many` sends each artifact's stored hash and a
+  ``{path: sha256}`` manifest of its files on disk in one request, and
+  applies the streamed delta archive that comes back (new or changed files
+  plus paths to remove).  See :mod:`skillmeat.core.enterprise_delta`.
 
 Usage::
 
@@ -12,20 +20,22 @@ Usage::
     # Check only (no file writes):
     result = syncer.check("my-skill")
 
-    # Full sync (writes files if hash changed):
+    # Full sync (writes changed files only):
     result = syncer.sync("my-skill", target_dir=Path(".claude"))
+
+    # Several artifacts in one round trip:
+    results = syncer.sync_many(["my-skill", "my-agent"], target_dir=Path(".claude"))
 """
 
 from __future__ import annotations
 
-import base64
 import logging
 import sys
 import tempfile
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 if sys.version_info >= (3, 11):
     import tomllib
@@ -34,6 +44,13 @@ else:
 
 import tomli_w
 
+from skillmeat.core.enterprise_delta import (
+    STATUS_NOT_FOUND,
+    STATUS_UNCHANGED,
+    etag_for,
+    file_digest,
+    read_delta_archive,
+)
 from skillmeat.core.enterprise_http import enterprise_request
 
 __all__ = [
@@ -94,6 +111,7 @@ def _read_sync_state(target_dir: Path) -> Dict[str, Any]:
         [artifacts.my-skill]
         content_hash = "abc123..."
         synced_at = "2026-01-01T00:00:00+00:00"
+        files = ["SKILL.md", "src/helper.py"]
     """
     path = _sync_toml_path(target_dir)
     if not path.exists():
@@ -141,107 +159,124 @@ def _get_stored_hash(target_dir: Path, artifact_name: str) -> str:
     return artifacts.get(artifact_name, {}).get("content_hash", "")
 
 
-def _update_stored_hash(
-    target_dir: Path, artifact_name: str, new_hash: str
-) -> None:
-    """Persist *new_hash* for *artifact_name* in the enterprise sync state."""
+def _update_stored_hashes(target_dir: Path, updates: Dict[str, Dict[str, Any]]) -> None:
+    """Persist new hashes and file lists for several artifacts in one write.
+
+    Args:
+        target_dir: Directory holding the sync state file.
+        updates: Mapping of artifact name to ``{"content_hash", "files"}``.
+    """
     state = _read_sync_state(target_dir)
     artifacts = state.setdefault("artifacts", {})
-    artifacts[artifact_name] = {
-        "content_hash": new_hash,
-        "synced_at": datetime.now(timezone.utc).isoformat(),
-    }
+    synced_at = datetime.now(timezone.utc).isoformat()
+    for artifact_name, update in updates.items():
+        artifacts[artifact_name] = {
+            "content_hash": update["content_hash"],
+            "synced_at": synced_at,
+            "files": sorted(update["files"]),
+        }
     _write_sync_state(target_dir, state)
 
 
 # ---------------------------------------------------------------------------
-# File materialisation helpers
+# File helpers
 # ---------------------------------------------------------------------------
 
 
-def _materialize_files(
-    files: List[Dict[str, Any]],
-    target_dir: Path,
-    artifact_name: str,
-) -> int:
-    """Write *files* from an API payload into *target_dir*.
-
-    Each entry in *files* is a ``FileEntry`` dict as produced by the
-    enterprise content service::
-
-        {
-            "path": "relative/posix/path",
-            "content": "<utf-8 text or base64 string>",
-            "size": <int>,
-            "encoding": "utf-8" | "base64",
-        }
+def _safe_destination(target_dir: Path, rel_path: str) -> Optional[Path]:
+    """Return ``target_dir / rel_path`` or None if it escapes *target_dir*."""
+    if not rel_path:
+        return None
+    dest = target_dir / rel_path
+    try:
+        dest.resolve().relative_to(target_dir.resolve())
+    except ValueError:
+        return None
+    return dest
 
-    Files are written atomically (temp file + rename) to avoid partial writes.
-    The ``path`` is treated as relative to *target_dir*.
 
-    Args:
-        files: List of file-entry dicts from the API payload.
-        target_dir: Root directory into which files will be written.
-        artifact_name: Used only for log messages.
+def _local_manifest(target_dir: Path, paths: Sequence[str]) -> Dict[str, str]:
+    """Hash the previously synced files that still exist under *target_dir*.
 
-    Returns:
-        Number of files successfully written.
+    Files edited locally hash differently and are therefore re-sent by the
+    server; deleted files are omitted and re-sent as new.
     """
-    written = 0
-    for entry in files:
-        rel_path: str = entry.get("path", "")
-        if not rel_path:
-            logger.warning(
-                "enterprise_sync: skipping file entry with empty path for %s",
-                artifact_name,
-            )
+    manifest: Dict[str, str] = {}
+    for rel_path in paths:
+        dest = _safe_destination(target_dir, rel_path)
+        if dest is None or not dest.is_file():
             continue
+        try:
+            manifest[rel_path] = file_digest(dest.read_bytes())
+        except OSError as exc:
+            logger.debug("enterprise_sync: cannot hash %s: %s", dest, exc)
+    return manifest
 
-        dest = target_dir / rel_path
-        dest.parent.mkdir(parents=True, exist_ok=True)
 
-        encoding = entry.get("encoding", "utf-8")
-        raw_content = entry.get("content", "")
+def _write_file(target_dir: Path, rel_path: str, data: bytes, artifact_name: str) -> bool:
+    """Atomically write one delta file (temp file + rename).
 
-        # Decode content.
-        if encoding == "base64":
-            file_bytes = base64.b64decode(raw_content)
-        else:
-            file_bytes = raw_content.encode("utf-8")
+    Returns:
+        True when the file was written.
+    """
+    dest = _safe_destination(target_dir, rel_path)
+    if dest is None:
+        logger.warning(
+            "enterprise_sync: skipping unsafe path %r for %s", rel_path, artifact_name
+        )
+        return False
 
-        # Atomic write: temp file in same directory then rename.
-        tmp = None
-        try:
-            with tempfile.NamedTemporaryFile(
-                mode="wb",
-                dir=dest.parent,
-                prefix=".tmp-ent-sync-",
-                delete=False,
-            ) as tmp_fh:
-                tmp = Path(tmp_fh.name)
-                tmp_fh.write(file_bytes)
-            tmp.replace(dest)
-            written += 1
-            logger.debug(
-                "enterprise_sync: wrote %s for %s (%d bytes)",
-                rel_path,
-                artifact_name,
-                len(file_bytes),
-            )
-        except Exception as exc:  # noqa: BLE001
-            logger.error(
-                "enterprise_sync: failed to write %s for %s: %s",
-                rel_path,
-                artifact_name,
-                exc,
-            )
-            if tmp is not None and tmp.exists():
-                try:
-                    tmp.unlink()
-                except OSError:
-                    pass
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode="wb",
+            dir=dest.parent,
+            prefix=".tmp-ent-sync-",
+            delete=False,
+        ) as tmp_fh:
+            tmp = Path(tmp_fh.name)
+            tmp_fh.write(data)
+        tmp.replace(dest)
+        logger.debug(
+            "enterprise_sync: wrote %s for %s (%d bytes)",
+            rel_path,
+            artifact_name,
+            len(data),
+        )
+        return True
+    except Exception as exc:  # noqa: BLE001
+        logger.error(
+            "enterprise_sync: failed to write %s for %s: %s",
+            rel_path,
+            artifact_name,
+            exc,
+        )
+        if tmp is not None and tmp.exists():
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+        return False
 
-    return written
+
+def _remove_file(target_dir: Path, rel_path: str, artifact_name: str) -> None:
+    """Delete a file the server no longer ships for *artifact_name*."""
+    dest = _safe_destination(target_dir, rel_path)
+    if dest is None:
+        return
+    try:
+        dest.unlink()
+        logger.debug("enterprise_sync: removed %s for %s", rel_path, artifact_name)
+    except FileNotFoundError:
+        pass
+    except OSError as exc:
+        logger.error(
+            "enterprise_sync: failed to remove %s for %s: %s",
+            rel_path,
+            artifact_name,
+            exc,
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -250,14 +285,13 @@ def _materialize_files(
 
 
 class EnterpriseSyncer:
-    """Poll the enterprise API for artifact updates and apply changes locally.
+    """Check the enterprise API for artifact updates and apply deltas locally.
 
-    This syncer is bandwidth-efficient: it fetches the full payload from the
-    download endpoint and compares the returned ``content_hash`` against the
-    locally stored value.  Files are only written when the hashes differ.
+    Hash checks are conditional (``If-None-Match`` / ``304``) and syncs
+    transfer only new or changed files, as raw bytes in a streamed archive.
 
-    The sync state (hash + timestamp per artifact) is persisted in
-    ``<target_dir>/.skillmeat-enterprise-sync.toml``.
+    The sync state (hash, timestamp and synced file list per artifact) is
+    persisted in ``<target_dir>/.skillmeat-enterprise-sync.toml``.
     """
 
     # Default target directory (the .claude directory in the current project).
@@ -270,9 +304,9 @@ class EnterpriseSyncer:
     ) -> EnterpriseSyncResult:
         """Check whether the local artifact is up-to-date with the API.
 
-        Calls the download endpoint and compares the returned
-        ``content_hash`` with the locally stored hash.  **No files are
-        written.**
+        Calls ``GET /api/v1/artifacts/{artifact_name}/hash`` with the stored
+        hash in ``If-None-Match``; a ``304`` response means up-to-date.
+        **No files are written.**
 
         Args:
             artifact_name: Artifact name or ID to check.
@@ -296,7 +330,7 @@ class EnterpriseSyncer:
         )
 
         try:
-            payload = self._fetch_payload(artifact_name)
+            new_hash = self._fetch_hash(artifact_name, old_hash)
         except Exception as exc:  # noqa: BLE001
             return EnterpriseSyncResult(
                 artifact_name=artifact_name,
@@ -304,7 +338,6 @@ class EnterpriseSyncer:
                 error=str(exc),
             )
 
-        new_hash = payload.get("content_hash", "")
         up_to_date = bool(old_hash) and old_hash == new_hash
 
         return EnterpriseSyncResult(
@@ -321,132 +354,199 @@ class EnterpriseSyncer:
         artifact_name: str,
         target_dir: Optional[Path] = None,
     ) -> EnterpriseSyncResult:
-        """Sync a local artifact with the enterprise API.
+        """Sync a single artifact; see :meth:`sync_many`."""
+        return self.sync_many([artifact_name], target_dir=target_dir)[0]
 
-        Fetches the full payload from
-        ``GET /api/v1/artifacts/{artifact_name}/download``, compares the
-        ``content_hash`` with the locally stored value, and re-materialises
-        files when the hashes differ.  If the hashes match no files are
-        written (bandwidth efficient).
+    def sync_many(
+        self,
+        artifact_names: Sequence[str],
+        target_dir: Optional[Path] = None,
+    ) -> List[EnterpriseSyncResult]:
+        """Sync several artifacts with the enterprise API in one round trip.
 
-        After a successful update the new hash and timestamp are persisted in
-        ``<target_dir>/.skillmeat-enterprise-sync.toml``.
+        Sends each artifact's stored hash and on-disk file manifest to
+        ``POST /api/v1/artifacts/delta`` and applies the streamed delta:
+        new or changed files are written atomically and files the server no
+        longer ships are removed.  Artifacts whose hash is unchanged are not
+        touched.
+
+        The new hashes and file lists are persisted in
+        ``<target_dir>/.skillmeat-enterprise-sync.toml`` only after the whole
+        archive was applied, so an interrupted sync is retried next time.
 
         Args:
-            artifact_name: Artifact name or ID to sync.
+            artifact_names: Artifact names or IDs to sync.
             target_dir: Directory into which artifact files are written and
                 where the sync state file is stored.  Defaults to
                 :attr:`DEFAULT_TARGET_DIR`.
 
         Returns:
-            :class:`EnterpriseSyncResult` describing what happened.
+            One :class:`EnterpriseSyncResult` per name, in the same order.
         """
         if target_dir is None:
             target_dir = self.DEFAULT_TARGET_DIR
 
         target_dir = Path(target_dir)
-        old_hash = _get_stored_hash(target_dir, artifact_name)
+        state = _read_sync_state(target_dir).get("artifacts", {})
+        requests_body = []
+        manifests: List[Dict[str, str]] = []
+        results: List[EnterpriseSyncResult] = []
+        for name in artifact_names:
+            entry = state.get(name, {})
+            manifest = _local_manifest(target_dir, entry.get("files", []))
+            manifests.append(manifest)
+            requests_body.append(
+                {
+                    "artifact_id": name,
+                    "content_hash": entry.get("content_hash", ""),
+                    "files": manifest,
+                }
+            )
+            results.append(
+                EnterpriseSyncResult(
+                    artifact_name=name, old_hash=entry.get("content_hash", "")
+                )
+            )
 
         logger.debug(
-            "enterprise_sync.sync: artifact=%s target_dir=%s stored_hash=%s",
-            artifact_name,
+            "enterprise_sync.sync: artifacts=%s target_dir=%s",
+            list(artifact_names),
             target_dir,
-            old_hash or "<none>",
         )
 
-        # Fetch payload from the API.
-        try:
-            payload = self._fetch_payload(artifact_name)
-        except Exception as exc:  # noqa: BLE001
-            return EnterpriseSyncResult(
-                artifact_name=artifact_name,
-                old_hash=old_hash,
-                error=str(exc),
-            )
-
-        new_hash = payload.get("content_hash", "")
+        if not results:
+            return results
 
-        # No change — skip file writes.
-        if old_hash and old_hash == new_hash:
-            logger.debug(
-                "enterprise_sync.sync: %s is up-to-date (hash=%s)",
-                artifact_name,
-                new_hash,
-            )
-            return EnterpriseSyncResult(
-                artifact_name=artifact_name,
-                up_to_date=True,
-                updated=False,
-                files_updated=0,
-                new_hash=new_hash,
-                old_hash=old_hash,
-            )
-
-        # Hash differs (or no prior record) — materialise files.
-        files: List[Dict[str, Any]] = payload.get("files", [])
-        files_written = _materialize_files(files, target_dir, artifact_name)
-
-        # Persist the new hash regardless of how many files were written so
-        # that a subsequent check reflects the current API state.
         try:
-            _update_stored_hash(target_dir, artifact_name, new_hash)
+            updates = self._apply_delta(requests_body, manifests, results, target_dir)
         except Exception as exc:  # noqa: BLE001
-            logger.error(
-                "enterprise_sync.sync: failed to persist hash for %s: %s",
-                artifact_name,
-                exc,
-            )
-            # Non-fatal — files were written; return a partial success.
-            return EnterpriseSyncResult(
-                artifact_name=artifact_name,
-                up_to_date=False,
-                updated=True,
-                files_updated=files_written,
-                new_hash=new_hash,
-                old_hash=old_hash,
-                error=f"Files written but hash persistence failed: {exc}",
-            )
-
-        logger.info(
-            "enterprise_sync.sync: updated %s — %d file(s) written"
-            " (old_hash=%s new_hash=%s)",
-            artifact_name,
-            files_written,
-            old_hash or "<none>",
-            new_hash,
-        )
+            for result in results:
+                result.up_to_date = False
+                result.updated = result.files_updated > 0
+                result.error = str(exc)
+            return results
 
-        return EnterpriseSyncResult(
-            artifact_name=artifact_name,
-            up_to_date=False,
-            updated=True,
-            files_updated=files_written,
-            new_hash=new_hash,
-            old_hash=old_hash,
-        )
+        if updates:
+            try:
+                _update_stored_hashes(target_dir, updates)
+            except Exception as exc:  # noqa: BLE001
+                logger.error(
+                    "enterprise_sync.sync: failed to persist hashes for %s: %s",
+                    sorted(updates),
+                    exc,
+                )
+                # Non-fatal — files were written; report a partial success.
+                for result in results:
+                    if result.artifact_name in updates:
+                        result.error = (
+                            f"Files written but hash persistence failed: {exc}"
+                        )
+
+        for result in results:
+            if result.updated:
+                logger.info(
+                    "enterprise_sync.sync: updated %s — %d file(s) written"
+                    " (old_hash=%s new_hash=%s)",
+                    result.artifact_name,
+                    result.files_updated,
+                    result.old_hash or "<none>",
+                    result.new_hash,
+                )
+        return results
 
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _fetch_payload(artifact_name: str) -> Dict[str, Any]:
-        """Call the enterprise download endpoint and return the JSON payload.
+    def _fetch_hash(artifact_name: str, known_hash: str) -> str:
+        """Return the artifact's current content hash via a conditional GET.
 
         Args:
-            artifact_name: Artifact name or ID to fetch.
+            artifact_name: Artifact name or ID.
+            known_hash: Locally stored hash sent as ``If-None-Match``.
 
         Returns:
-            Parsed JSON dict from the API response.
+            The current hash (*known_hash* itself on ``304``).
 
         Raises:
-            requests.HTTPError: When the API returns a non-2xx status.
+            requests.HTTPError: When the API returns an error status.
             requests.RequestException: For network-level failures.
             skillmeat.core.enterprise_config.EnterpriseConfigError: When
                 ``SKILLMEAT_API_URL`` or the PAT is not configured.
         """
-        path = f"/api/v1/artifacts/{artifact_name}/download"
+        path = f"/api/v1/artifacts/{artifact_name}/hash"
+        headers = {"If-None-Match": etag_for(known_hash)} if known_hash else {}
         logger.debug("enterprise_sync: GET %s", path)
-        resp = enterprise_request("GET", path, timeout=30)
+        resp = enterprise_request("GET", path, headers=headers, timeout=30)
+        if resp.status_code == 304:
+            return known_hash
         resp.raise_for_status()
-        return resp.json()
+        return resp.json().get("content_hash", "")
+
+    @staticmethod
+    def _apply_delta(
+        requests_body: List[Dict[str, Any]],
+        manifests: List[Dict[str, str]],
+        results: List[EnterpriseSyncResult],
+        target_dir: Path,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Request the delta archive and apply it to *target_dir*.
+
+        Fills in *results* as archive members arrive.
+
+        Returns:
+            State updates (new hash and file list) per updated artifact.
+
+        Raises:
+            requests.HTTPError: When the API returns an error status.
+            requests.RequestException: For network-level failures.
+            tarfile.TarError: When the archive is truncated or corrupt.
+        """
+        logger.debug("enterprise_sync: POST /api/v1/artifacts/delta")
+        resp = enterprise_request(
+            "POST",
+            "/api/v1/artifacts/delta",
+            json={"artifacts": requests_body},
+            stream=True,
+            timeout=30,
+        )
+        try:
+            resp.raise_for_status()
+            # Let urllib3 undo any transport compression added by the server.
+            resp.raw.decode_content = True
+
+            updates: Dict[str, Dict[str, Any]] = {}
+            failed: set = set()
+            for member in read_delta_archive(resp.raw):
+                result = results[member.index]
+                name = result.artifact_name
+                if member.header is not None:
+                    header = member.header
+                    result.new_hash = header.get("content_hash", "")
+                    if header["status"] == STATUS_NOT_FOUND:
+                        result.error = header.get("error") or "Artifact not found"
+                        continue
+                    if header["status"] == STATUS_UNCHANGED:
+                        result.up_to_date = True
+                        continue
+                    result.updated = True
+                    removed = set(header.get("removed", []))
+                    for rel_path in sorted(removed):
+                        _remove_file(target_dir, rel_path, name)
+                    files = set(manifests[member.index]) - removed
+                    files.update(header.get("files", []))
+                    updates[name] = {"content_hash": result.new_hash, "files": files}
+                elif _write_file(target_dir, member.path or "", member.data, name):
+                    result.files_updated += 1
+                else:
+                    failed.add(member.index)
+
+            # Keep the old hash for partially applied artifacts so the next
+            # sync requests their delta again.
+            for index in failed:
+                results[index].error = "One or more files could not be written"
+                updates.pop(results[index].artifact_name, None)
+            return updates
+        finally:
+            resp.close()
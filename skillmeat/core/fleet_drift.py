@@ -0,0 +1,401 @@
+"""Fleet-wide drift scanning across all registered projects.
+
+:meth:`SyncManager.check_drift <skillmeat.core.sync.SyncManager.check_drift>`
+inspects one project at a time and re-hashes the collection copy of every
+deployed artifact, so checking a fleet costs one full-tree hash per
+(project, artifact) pair.  :class:`FleetDriftScanner` instead:
+
+* hashes each collection artifact at most once per run, shared by all
+  projects through :class:`CollectionHashIndex`
+* determines local modifications with
+  :meth:`DeploymentManager.compute_deployment_statuses_batch
+  <skillmeat.core.deployment.DeploymentManager.compute_deployment_statuses_batch>`,
+  reusing its file-count fast path and per-path hash cache
+* scans projects concurrently in a thread pool, writing each project's
+  results to the cache DB (see :class:`~skillmeat.cache.drift_matrix.DriftMatrixStore`)
+  from the coordinating thread
+
+Scans are resumable (projects with stored entries are skipped) and
+cancellable, either through a ``threading.Event`` or by calling
+:meth:`FleetDriftScanner.cancel` from another process or thread.
+
+Unlike ``check_drift``, a fleet scan is read-only: it does not record
+modification timestamps or create local-modification version records.
+
+The matrix covers deployed artifacts only.  ``check_drift`` also reports
+every collection artifact a project has *not* deployed as ``added`` drift;
+across a fleet that is one row per (project, undeployed artifact), which for
+a large collection dwarfs the deployed entries and says nothing about the
+projects themselves.  Use ``check_drift`` on a single project to list them.
+
+Scans are started, cancelled and paged through ``/api/v1/drift-scans`` and
+``skillmeat drift-scan``.
+
+Example:
+    >>> scanner = FleetDriftScanner(sync_manager, CacheRepository())
+    >>> summary = scanner.scan(collection_name="default")
+    >>> entries, total = scanner.store.list_entries(
+    ...     summary.scan_id, drift_types=["conflict"], limit=50
+    ... )
+"""
+
+import logging
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from skillmeat.cache.drift_matrix import RESUMABLE_STATUSES, DriftMatrixStore
+from skillmeat.cache.repository import CacheNotFoundError, CacheRepository
+from skillmeat.core.sync import SyncManager
+from skillmeat.storage.deployment import DeploymentTracker
+
+logger = logging.getLogger(__name__)
+
+# Recommendation per drift type (mirrors SyncManager.check_drift)
+_RECOMMENDATIONS = {
+    "synced": None,
+    "modified": "push_to_collection",
+    "outdated": "pull_from_collection",
+    "conflict": "review_manually",
+    "removed": "remove_from_project",
+}
+
+
+@dataclass
+class FleetDriftSummary:
+    """Outcome of one :meth:`FleetDriftScanner.run` call.
+
+    Attributes:
+        scan_id: Identifier of the scan
+        status: Final status ('completed', 'cancelled', or 'failed')
+        total_projects: Registered projects considered by the scan
+        scanned_projects: Projects with stored results (including earlier runs)
+        failed_projects: Projects that raised during this run
+        drifted_artifacts: Stored entries with drift
+        collection_hashes: Collection artifacts hashed during this run
+    """
+
+    scan_id: str
+    status: str
+    total_projects: int
+    scanned_projects: int
+    failed_projects: int
+    drifted_artifacts: int
+    collection_hashes: int = 0
+
+
+class CollectionHashIndex:
+    """Thread-safe, per-run cache of collection artifact hashes.
+
+    Collection listings are loaded once per collection name and every
+    artifact is hashed at most once, even when many worker threads ask for it
+    at the same time: the first caller computes the hash and the others wait
+    on its future.
+
+    Args:
+        sync_manager: SyncManager used to list and hash collection artifacts.
+    """
+
+    def __init__(self, sync_manager: SyncManager):
+        self._sync = sync_manager
+        self._lock = threading.Lock()
+        self._listings: Dict[str, Dict[Tuple[str, str], Path]] = {}
+        self._hashes: Dict[Tuple[str, str, str], Future] = {}
+
+    @property
+    def hash_count(self) -> int:
+        """Number of collection artifacts hashed so far."""
+        with self._lock:
+            return len(self._hashes)
+
+    def get_hash(
+        self, collection_name: str, artifact_name: str, artifact_type: str
+    ) -> Optional[str]:
+        """Return the current collection hash, or None if the artifact is gone."""
+        path = self._listing(collection_name).get((artifact_type, artifact_name))
+        if path is None:
+            return None
+
+        key = (collection_name, artifact_type, artifact_name)
+        with self._lock:
+            future = self._hashes.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._hashes[key] = future
+
+        if owner:
+            try:
+                future.set_result(self._sync._compute_content_hash(path))
+            except Exception as exc:
+                future.set_exception(exc)
+        return future.result()
+
+    def _listing(self, collection_name: str) -> Dict[Tuple[str, str], Path]:
+        with self._lock:
+            listing = self._listings.get(collection_name)
+            if listing is None:
+                listing = {
+                    (artifact["type"], artifact["name"]): artifact["path"]
+                    for artifact in self._sync._get_collection_artifacts(
+                        collection_name
+                    )
+                }
+                self._listings[collection_name] = listing
+            return listing
+
+
+class FleetDriftScanner:
+    """Scans every registered project for drift and stores a drift matrix.
+
+    Args:
+        sync_manager: SyncManager with a collection manager configured.
+        cache_repository: Cache repository holding projects and scan results.
+        deployment_manager: DeploymentManager used for the batched local
+            modification check (created from the sync manager's collection
+            manager if omitted).
+        max_workers: Worker threads for concurrent project scans (defaults to
+            ``min(8, cpu_count)``).
+    """
+
+    def __init__(
+        self,
+        sync_manager: SyncManager,
+        cache_repository: CacheRepository,
+        deployment_manager=None,
+        max_workers: Optional[int] = None,
+    ):
+        if deployment_manager is None:
+            from skillmeat.core.deployment import DeploymentManager
+
+            deployment_manager = DeploymentManager(
+                collection_mgr=sync_manager.collection_mgr
+            )
+        self.sync_mgr = sync_manager
+        self.deployment_mgr = deployment_manager
+        self.store = DriftMatrixStore(cache_repository)
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+
+    def scan(
+        self,
+        collection_name: Optional[str] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> FleetDriftSummary:
+        """Create a new scan and run it to completion or cancellation.
+
+        Args:
+            collection_name: Collection to compare against.  When None, each
+                project uses the collection its first deployment came from.
+            cancel_event: Optional event that stops the scan when set.
+
+        Returns:
+            FleetDriftSummary for the run
+        """
+        scan_id = self.store.create_scan(collection_name)
+        return self.run(scan_id, cancel_event=cancel_event)
+
+    def cancel(self, scan_id: str) -> bool:
+        """Request cancellation of a pending or running scan.
+
+        Returns:
+            True if the request was recorded, False if the scan had already
+            stopped or does not exist.
+        """
+        return self.store.request_cancel(scan_id)
+
+    def run(
+        self, scan_id: str, cancel_event: Optional[threading.Event] = None
+    ) -> FleetDriftSummary:
+        """Run or resume a scan.
+
+        Projects that already have entries for ``scan_id`` are skipped, so
+        calling ``run`` again after a cancellation, crash, or failed projects
+        only scans the remaining projects.
+
+        Args:
+            scan_id: Scan created by :meth:`scan` or ``store.create_scan``
+            cancel_event: Optional event that stops the scan when set.
+
+        Returns:
+            FleetDriftSummary for the run
+
+        Raises:
+            CacheNotFoundError: If the scan does not exist
+        """
+        scan = self.store.get_scan(scan_id)
+        if scan is None:
+            raise CacheNotFoundError(f"Drift scan not found: {scan_id}")
+        # A completed scan is only re-run to retry projects that failed
+        if scan["status"] not in RESUMABLE_STATUSES and not scan["failed_projects"]:
+            return self._summary(scan_id, failed=scan["failed_projects"])
+
+        projects = self.store.list_projects()
+        done = self.store.completed_project_ids(scan_id)
+        pending = [(pid, path) for pid, path in projects if pid not in done]
+        self.store.mark_running(scan_id, total_projects=len(projects))
+        logger.info(
+            f"Fleet drift scan {scan_id}: {len(pending)} of {len(projects)} "
+            f"projects to scan"
+        )
+
+        index = CollectionHashIndex(self.sync_mgr)
+        failed = 0
+        try:
+            failed, cancelled = self._run_pool(
+                scan_id, scan["collection_name"], pending, index, cancel_event
+            )
+        except Exception as exc:
+            logger.exception(f"Fleet drift scan {scan_id} failed")
+            self.store.finish_scan(
+                scan_id, "failed", failed_projects=failed, error_message=str(exc)
+            )
+            raise
+
+        status = "cancelled" if cancelled else "completed"
+        self.store.finish_scan(scan_id, status, failed_projects=failed)
+        return self._summary(scan_id, failed=failed, hashes=index.hash_count)
+
+    # =========================================================================
+    # Internals
+    # =========================================================================
+
+    def _run_pool(
+        self,
+        scan_id: str,
+        collection_name: Optional[str],
+        pending: List[Tuple[str, str]],
+        index: CollectionHashIndex,
+        cancel_event: Optional[threading.Event],
+    ) -> Tuple[int, bool]:
+        """Scan pending projects with a bounded number of in-flight tasks."""
+        failed = 0
+        queue = iter(pending)
+        in_flight: Dict[Future, Tuple[str, str]] = {}
+
+        def cancelled() -> bool:
+            if cancel_event is not None and cancel_event.is_set():
+                return True
+            return self.store.get_status(scan_id) == "cancelled"
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="fleet-drift"
+        ) as executor:
+            stop = False
+            while True:
+                if not stop and cancelled():
+                    stop = True
+                    for future in in_flight:
+                        future.cancel()
+                    in_flight = {
+                        f: p for f, p in in_flight.items() if not f.cancelled()
+                    }
+
+                while not stop and len(in_flight) < self.max_workers * 2:
+                    project = next(queue, None)
+                    if project is None:
+                        break
+                    future = executor.submit(
+                        self._scan_project, Path(project[1]), collection_name, index
+                    )
+                    in_flight[future] = project
+                if not in_flight:
+                    break
+
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    project_id, project_path = in_flight.pop(future)
+                    try:
+                        entries = future.result()
+                    except Exception as exc:
+                        failed += 1
+                        logger.warning(
+                            f"Fleet drift scan {scan_id}: project {project_id} "
+                            f"failed: {exc}"
+                        )
+                        continue
+                    self.store.record_project(
+                        scan_id, project_id, project_path, entries
+                    )
+
+        return failed, stop
+
+    def _scan_project(
+        self,
+        project_path: Path,
+        collection_name: Optional[str],
+        index: CollectionHashIndex,
+    ) -> List[Dict[str, Any]]:
+        """Compute matrix entries for one project (runs on a worker thread)."""
+        if not project_path.exists():
+            raise ValueError(f"Project path does not exist: {project_path}")
+
+        deployments = DeploymentTracker.read_deployments(project_path)
+        if not deployments:
+            return []
+
+        statuses = self.deployment_mgr.compute_deployment_statuses_batch(
+            project_path, deployments=deployments
+        )
+        collection = collection_name or deployments[0].from_collection or "default"
+
+        # Key format must match compute_deployment_statuses_batch
+        base_key_counts: Dict[str, int] = {}
+        for deployed in deployments:
+            base_key = f"{deployed.artifact_name}::{deployed.artifact_type}"
+            base_key_counts[base_key] = base_key_counts.get(base_key, 0) + 1
+
+        entries: List[Dict[str, Any]] = []
+        for deployed in deployments:
+            profile_id = deployed.deployment_profile_id or "claude_code"
+            key = f"{deployed.artifact_name}::{deployed.artifact_type}"
+            if base_key_counts[key] > 1:
+                key = f"{key}::{profile_id}"
+
+            project_changed = statuses.get(key) == "modified"
+            collection_sha = index.get_hash(
+                collection, deployed.artifact_name, deployed.artifact_type
+            )
+
+            if collection_sha is None:
+                drift_type = "removed"
+            else:
+                collection_changed = collection_sha != deployed.content_hash
+                if collection_changed and project_changed:
+                    drift_type = "conflict"
+                elif collection_changed:
+                    drift_type = "outdated"
+                elif project_changed:
+                    drift_type = "modified"
+                else:
+                    drift_type = "synced"
+
+            entries.append(
+                {
+                    "artifact_name": deployed.artifact_name,
+                    "artifact_type": deployed.artifact_type,
+                    "profile_id": profile_id,
+                    "drift_type": drift_type,
+                    "recommendation": _RECOMMENDATIONS[drift_type],
+                    "deployed_sha": deployed.content_hash,
+                    "collection_sha": collection_sha,
+                    # The batch check may skip hashing (file-count mismatch),
+                    # so the local hash is only known when unchanged.
+                    "project_sha": None if project_changed else deployed.content_hash,
+                }
+            )
+        return entries
+
+    def _summary(self, scan_id: str, failed: int, hashes: int = 0) -> FleetDriftSummary:
+        scan = self.store.get_scan(scan_id) or {}
+        return FleetDriftSummary(
+            scan_id=scan_id,
+            status=scan.get("status", "failed"),
+            total_projects=scan.get("total_projects", 0),
+            scanned_projects=scan.get("scanned_projects", 0),
+            failed_projects=failed,
+            drifted_artifacts=scan.get("drifted_artifacts", 0),
+            collection_hashes=hashes,
+        )
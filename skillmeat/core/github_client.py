@@ -46,6 +46,7 @@ from github.GithubObject import NotSet
 from github.Repository import Repository
 
 from skillmeat.config import ConfigManager
+from skillmeat.observability.hotpath import hot_path
 
 logger = logging.getLogger(__name__)
 
@@ -334,6 +335,7 @@ class GitHubClient:
     # Public API Methods
     # =========================================================================
 
+    @hot_path("github.get_repo")
     def get_repo(self, owner_repo: str) -> Repository:
         """Get a GitHub Repository object.
 
@@ -361,6 +363,7 @@ class GitHubClient:
             self._handle_exception(e, context=f"get_repo({owner}/{repo})")
             raise  # This line won't be reached but satisfies type checker
 
+    @hot_path("github.get_repo_metadata")
     def get_repo_metadata(self, owner_repo: str) -> Dict[str, Any]:
         """Get repository metadata including stars, topics, and description.
 
@@ -402,6 +405,7 @@ class GitHubClient:
             "updated_at": repo.updated_at,
         }
 
+    @hot_path("github.get_file_content")
     def get_file_content(
         self, owner_repo: str, path: str, ref: Optional[str] = None
     ) -> bytes:
@@ -450,6 +454,7 @@ class GitHubClient:
             self._handle_exception(e, context=f"get_file_content({owner_repo}, {path})")
             raise
 
+    @hot_path("github.get_file_with_metadata")
     def get_file_with_metadata(
         self, owner_repo: str, path: str, ref: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -585,6 +590,7 @@ class GitHubClient:
 
         return None
 
+    @hot_path("github.get_repo_tree")
     def get_repo_tree(
         self, owner_repo: str, ref: Optional[str] = None, recursive: bool = True
     ) -> List[Dict[str, Any]]:
@@ -719,6 +725,7 @@ class GitHubClient:
             self._handle_exception(e, context=f"get_repo_tree({owner_repo})")
             raise
 
+    @hot_path("github.resolve_version")
     def resolve_version(self, owner_repo: str, version: str) -> str:
         """Resolve a version specifier to a commit SHA.
 
@@ -791,6 +798,7 @@ class GitHubClient:
             )
             raise
 
+    @hot_path("github.validate_token")
     def validate_token(self) -> Dict[str, Any]:
         """Validate the current token and return auth info.
 
@@ -852,6 +860,7 @@ class GitHubClient:
                 "rate_limit": rate_limit,
             }
 
+    @hot_path("github.get_rate_limit")
     def get_rate_limit(self) -> Dict[str, Any]:
         """Get current rate limit information.
 
@@ -20,6 +20,8 @@ import time
 from pathlib import Path
 from typing import List
 
+from skillmeat.observability.hotpath import hot_path
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -170,6 +172,7 @@ def _merkle_hash(entries: List[tuple[str, str]]) -> str:
     return h.hexdigest()
 
 
+@hot_path("hashing.compute_artifact_hash")
 def compute_artifact_hash(artifact_path: str) -> str:
     """Compute a deterministic SHA-256 content hash for an artifact.
 
@@ -1328,6 +1328,8 @@ class ArtifactVersionDTO:
             ``None`` when no lineage was recorded.
         created_at: ISO-8601 timestamp when the version was created.
         metadata_json: Raw JSON metadata string, or ``None``.
+        lineage_depth: Generations from the root version, from the ancestry
+            index; ``None`` for legacy rows that are not yet indexed.
     """
 
     id: str
@@ -1338,6 +1340,7 @@ class ArtifactVersionDTO:
     parent_hash: str | None = None
     version_lineage: str | None = None
     metadata_json: str | None = None
+    lineage_depth: int | None = None
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> Self:
@@ -1359,6 +1362,7 @@ class ArtifactVersionDTO:
             parent_hash=data.get("parent_hash"),
             version_lineage=data.get("version_lineage"),
             metadata_json=data.get("metadata_json") or data.get("metadata"),
+            lineage_depth=data.get("lineage_depth"),
         )
 
 
@@ -3935,6 +3935,27 @@ class IDbUserCollectionRepository(abc.ABC):
         """
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def get_group_and_artifact_counts(
+        self,
+        collection_ids: list[str],
+        ctx: RequestContext | None = None,
+    ) -> dict[str, tuple[int, int]]:
+        """Return group and artifact counts for several collections at once.
+
+        Batch form of :meth:`get_groups` / :meth:`get_artifact_count` for list
+        endpoints, so the number of queries does not grow with the page size.
+
+        Args:
+            collection_ids: Collection hex-UUID primary keys.
+            ctx: Optional per-request metadata.
+
+        Returns:
+            Mapping of each requested id to ``(group_count, artifact_count)``;
+            unknown collections map to ``(0, 0)``.
+        """
+        raise NotImplementedError
+
     # ------------------------------------------------------------------
     # Sentinel project bootstrap
     # ------------------------------------------------------------------
@@ -14,6 +14,7 @@ from .deduplication_engine import (
     DeduplicationEngine,
     EXCLUDED_DUPLICATE_CROSS_SOURCE,
     EXCLUDED_DUPLICATE_WITHIN_SOURCE,
+    EXCLUDED_NEAR_DUPLICATE,
     EXCLUDED_USER_MANUAL,
     mark_as_excluded,
     mark_for_restore,
@@ -67,6 +68,13 @@ from .observability import (
     track_operation,
     ValidationError,
 )
+from .minhash import (
+    LSHIndex,
+    MinHasher,
+    decode_signature,
+    encode_signature,
+    estimate_similarity,
+)
 from .source_manager import (
     MAX_TAG_LENGTH,
     MAX_TAGS_PER_SOURCE,
@@ -87,9 +95,16 @@ __all__ = [
     "DeduplicationEngine",
     "EXCLUDED_DUPLICATE_WITHIN_SOURCE",
     "EXCLUDED_DUPLICATE_CROSS_SOURCE",
+    "EXCLUDED_NEAR_DUPLICATE",
     "EXCLUDED_USER_MANUAL",
     "mark_as_excluded",
     "mark_for_restore",
+    # Near-duplicate detection
+    "LSHIndex",
+    "MinHasher",
+    "decode_signature",
+    "encode_signature",
+    "estimate_similarity",
     # GitHub scanning
     "GitHubScanner",
     "ScanConfig",
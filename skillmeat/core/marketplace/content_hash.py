@@ -9,6 +9,8 @@ import hashlib
 import logging
 from typing import Dict, Optional, Union
 
+from skillmeat.observability.hotpath import hot_path
+
 # Maximum file size for hashing (10MB) - files larger than this will be skipped
 MAX_HASH_FILE_SIZE = 10 * 1024 * 1024
 
@@ -59,6 +61,7 @@ def compute_file_hash(
     return hashlib.sha256(content).hexdigest()
 
 
+@hot_path("marketplace.compute_artifact_hash")
 def compute_artifact_hash(files: Dict[str, str]) -> str:
     """Compute deterministic SHA256 hash for multi-file artifact.
 
@@ -2,7 +2,8 @@
 
 Provides content-based deduplication to identify and group duplicate artifacts
 across different sources or paths. Uses SHA256 content hashing for reliable
-duplicate detection.
+duplicate detection, and MinHash/LSH (see ``minhash``) for near-duplicates
+such as forks with a tweaked line or reformatted frontmatter.
 """
 
 import logging
@@ -10,6 +11,15 @@ from datetime import datetime, timezone
 from typing import Any, Optional
 
 from .content_hash import compute_artifact_hash, ContentHashCache
+from .minhash import (
+    DEFAULT_THRESHOLD,
+    LSHIndex,
+    MinHasher,
+    Signature,
+    decode_signature,
+    encode_signature,
+    estimate_similarity,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +28,7 @@ logger = logging.getLogger(__name__)
 EXCLUDED_DUPLICATE_WITHIN_SOURCE = "duplicate_within_source"
 EXCLUDED_DUPLICATE_CROSS_SOURCE = "duplicate_cross_source"
 EXCLUDED_USER_MANUAL = "user_excluded"
+EXCLUDED_NEAR_DUPLICATE = "near_duplicate"
 
 
 def mark_as_excluded(
@@ -42,9 +53,10 @@ def mark_as_excluded(
         reason: Exclusion reason string. Use constants:
             - EXCLUDED_DUPLICATE_WITHIN_SOURCE
             - EXCLUDED_DUPLICATE_CROSS_SOURCE
+            - EXCLUDED_NEAR_DUPLICATE
             - EXCLUDED_USER_MANUAL
         duplicate_of: Path of the artifact this is a duplicate of.
-            Only applicable for within-source duplicates.
+            Only applicable for within-source and near duplicates.
 
     Returns:
         Modified artifact dict with exclusion fields set:
@@ -99,7 +111,8 @@ def mark_for_restore(artifact: dict[str, Any]) -> dict[str, Any]:
 
     Returns:
         Modified artifact dict with exclusion fields removed:
-        - Clears: excluded, excluded_reason, excluded_at, duplicate_of
+        - Clears: excluded, excluded_reason, excluded_at, duplicate_of,
+          metadata.near_duplicate_similarity
         - Sets: status = "new" (reset to unimported state)
         - Preserves: metadata.content_hash (for future deduplication)
 
@@ -134,6 +147,7 @@ def mark_for_restore(artifact: dict[str, Any]) -> dict[str, Any]:
     artifact.pop("excluded_reason", None)
     artifact.pop("excluded_at", None)
     artifact.pop("duplicate_of", None)
+    artifact.get("metadata", {}).pop("near_duplicate_similarity", None)
 
     # Clear top-level content_hash (keep only in metadata)
     artifact.pop("content_hash", None)
@@ -170,15 +184,23 @@ class DeduplicationEngine:
         'skills/canvas'
     """
 
-    def __init__(self, hash_cache: Optional[ContentHashCache] = None) -> None:
+    def __init__(
+        self,
+        hash_cache: Optional[ContentHashCache] = None,
+        minhasher: Optional[MinHasher] = None,
+    ) -> None:
         """Initialize deduplication engine.
 
         Args:
             hash_cache: Optional ContentHashCache for caching hash computations.
                 If not provided, a new cache with default size (1000 entries)
                 will be created.
+            minhasher: Optional MinHasher for near-duplicate signatures.
+                Defaults to the default-parameter hasher used for stored
+                catalog signatures.
         """
         self._hash_cache = hash_cache or ContentHashCache()
+        self._minhasher = minhasher or MinHasher()
 
     def compute_hash(self, artifact_files: dict[str, str]) -> str:
         """Compute content hash for artifact files.
@@ -587,6 +609,122 @@ class DeduplicationEngine:
 
         return unique_artifacts, cross_source_duplicates
 
+    def compute_signature(self, artifact: dict[str, Any]) -> Optional[Signature]:
+        """Return an artifact's MinHash signature, computing it if needed.
+
+        Reuses ``metadata.minhash_signature`` when present; otherwise hashes
+        the artifact's ``files`` and stores the encoded signature there.
+
+        Args:
+            artifact: Artifact dictionary with ``files`` or a stored signature.
+
+        Returns:
+            Signature tuple, or None if the artifact has no text content.
+        """
+        metadata = artifact.setdefault("metadata", {})
+        encoded = metadata.get("minhash_signature")
+        if encoded:
+            signature = decode_signature(encoded)
+            if len(signature) == self._minhasher.num_perm:
+                return signature
+
+        signature = self._minhasher.signature_from_files(artifact.get("files") or {})
+        if signature is not None:
+            metadata["minhash_signature"] = encode_signature(signature)
+        return signature
+
+    def find_near_duplicates(
+        self,
+        artifacts: list[dict[str, Any]],
+        threshold: float = DEFAULT_THRESHOLD,
+    ) -> list[list[dict[str, Any]]]:
+        """Find clusters of artifacts with near-identical content.
+
+        Signatures are bucketed with LSH banding, so only artifacts sharing a
+        bucket are compared.  Exact duplicates also cluster (similarity 1.0).
+
+        Args:
+            artifacts: List of artifact dictionaries (see find_duplicates).
+            threshold: Minimum estimated Jaccard similarity of word shingles.
+
+        Returns:
+            Clusters of 2+ artifacts, largest first.
+
+        Example:
+            >>> engine = DeduplicationEngine()
+            >>> body = "Format Python files with black and isort before commit. " * 5
+            >>> artifacts = [
+            ...     {"path": "a", "files": {"SKILL.md": "name: fmt\n" + body}},
+            ...     {"path": "b", "files": {"SKILL.md": "name: 'fmt'\n" + body}},
+            ... ]
+            >>> [[a["path"] for a in c] for c in engine.find_near_duplicates(artifacts)]
+            [['a', 'b']]
+        """
+        index = LSHIndex(num_perm=self._minhasher.num_perm)
+        for position, artifact in enumerate(artifacts):
+            signature = self.compute_signature(artifact)
+            if signature is not None:
+                index.add(position, signature)
+
+        clusters = [
+            [artifacts[position] for position in cluster]
+            for cluster in index.clusters(threshold)
+        ]
+        if clusters:
+            logger.info(
+                f"Found {len(clusters)} near-duplicate cluster(s) among "
+                f"{len(artifacts)} artifacts (threshold={threshold})"
+            )
+        return clusters
+
+    def deduplicate_near_duplicates(
+        self,
+        artifacts: list[dict[str, Any]],
+        threshold: float = DEFAULT_THRESHOLD,
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Keep the best artifact of each near-duplicate cluster.
+
+        Runs after exact deduplication.  Others in each cluster are marked
+        with ``mark_as_excluded`` (reason ``EXCLUDED_NEAR_DUPLICATE``,
+        ``duplicate_of`` = kept path) and their estimated similarity to the
+        kept artifact is recorded in ``metadata.near_duplicate_similarity``.
+        ``mark_for_restore`` clears both.
+
+        Args:
+            artifacts: List of artifact dictionaries.
+            threshold: Minimum estimated Jaccard similarity.
+
+        Returns:
+            Tuple of (kept_artifacts, excluded_artifacts).
+        """
+        excluded_ids: set[int] = set()
+        excluded_artifacts: list[dict[str, Any]] = []
+
+        for cluster in self.find_near_duplicates(artifacts, threshold):
+            best = self.get_best_artifact(cluster)
+            best_signature = self.compute_signature(best)
+            for artifact in cluster:
+                if artifact is best:
+                    continue
+                similarity = estimate_similarity(
+                    best_signature, self.compute_signature(artifact)
+                )
+                mark_as_excluded(
+                    artifact,
+                    reason=EXCLUDED_NEAR_DUPLICATE,
+                    duplicate_of=best.get("path", "unknown"),
+                )
+                artifact["metadata"]["near_duplicate_similarity"] = round(similarity, 3)
+                excluded_ids.add(id(artifact))
+                excluded_artifacts.append(artifact)
+
+        kept_artifacts = [a for a in artifacts if id(a) not in excluded_ids]
+        logger.info(
+            f"Near-duplicate dedup: {len(artifacts)} artifacts, "
+            f"kept {len(kept_artifacts)}, excluded {len(excluded_artifacts)}"
+        )
+        return kept_artifacts, excluded_artifacts
+
 
 if __name__ == "__main__":
     # Self-test examples
@@ -106,6 +106,7 @@ from skillmeat.core.artifact_detection import (
     infer_artifact_type,
     normalize_container_name,
 )
+from skillmeat.observability.hotpath import hot_path
 
 logger = logging.getLogger(__name__)
 
@@ -1249,6 +1250,7 @@ class HeuristicDetector:
 
         return False
 
+    @hot_path("marketplace.heuristic_analyze_paths")
     def analyze_paths(
         self,
         paths: List[str],
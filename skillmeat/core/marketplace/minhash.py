@@ -0,0 +1,308 @@
+"""MinHash signatures and LSH banding for near-duplicate detection.
+
+Exact content hashes (see ``content_hash``) miss forks that change one line
+or reformat frontmatter.  This module estimates Jaccard similarity between
+artifacts' word shingle sets instead:
+
+- ``MinHasher`` turns text into a fixed-size signature of ``num_perm``
+  32-bit values using one-permutation hashing: each shingle hash falls into
+  one of ``num_perm`` bins and each bin keeps its minimum, with empty bins
+  copied from a pseudo-randomly probed non-empty bin (optimal densification,
+  which keeps estimates unbiased for short texts).  This costs
+  one pass over the shingles instead of one pass per permutation.  The
+  fraction of equal positions between two signatures estimates the Jaccard
+  similarity of the underlying shingle sets.
+- ``LSHIndex`` splits signatures into ``bands`` of ``rows`` values and
+  buckets them per band.  Two signatures share a bucket with probability
+  ``1 - (1 - s**rows)**bands``, so candidates are found by bucket lookup
+  rather than by comparing every pair; candidates are then verified against
+  the similarity threshold.
+
+With the defaults (128 permutations, 16 bands of 8 rows) pairs at 0.8
+similarity collide with probability ~0.94, and pairs below 0.5 rarely do.
+
+Tokenisation lower-cases text and keeps only word characters, so whitespace,
+quoting and punctuation changes (typical of reformatted YAML frontmatter)
+do not affect signatures.
+
+Signatures are stored per catalog entry as compact base64 strings
+(``encode_signature``/``decode_signature``).
+"""
+
+import base64
+import hashlib
+import logging
+import random
+import re
+import struct
+from collections import defaultdict
+from typing import Any, Hashable, Iterable, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_NUM_PERM = 128
+DEFAULT_BANDS = 16
+DEFAULT_SHINGLE_SIZE = 3
+DEFAULT_THRESHOLD = 0.8
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+# Precomputed densification probes per bin, as a multiple of num_perm.
+_PROBE_ROUNDS = 4
+_TOKEN_RE = re.compile(r"\w+")
+
+Signature = tuple[int, ...]
+
+
+def shingles(text: str, size: int = DEFAULT_SHINGLE_SIZE) -> set[int]:
+    """Return the set of hashed word ``size``-grams in ``text``.
+
+    Texts shorter than ``size`` words yield a single shingle of all words;
+    texts without word characters yield an empty set.
+    """
+    tokens = _TOKEN_RE.findall(text.lower())
+    if not tokens:
+        return set()
+    if len(tokens) <= size:
+        grams: Iterable[str] = [" ".join(tokens)]
+    else:
+        grams = (" ".join(tokens[i : i + size]) for i in range(len(tokens) - size + 1))
+    return {
+        int.from_bytes(hashlib.blake2b(g.encode(), digest_size=8).digest(), "little")
+        for g in grams
+    }
+
+
+class MinHasher:
+    """Compute MinHash signatures over word shingles.
+
+    Signatures from hashers with different ``num_perm``, ``shingle_size`` or
+    ``seed`` are not comparable; the defaults are used for stored signatures.
+
+    Args:
+        num_perm: Signature length (number of bins).
+        shingle_size: Words per shingle.
+        seed: Seed for the hash permutation coefficients.
+
+    Example:
+        >>> hasher = MinHasher()
+        >>> a = hasher.signature("Format Python files with black before committing")
+        >>> b = hasher.signature("Format python files with Black before committing!")
+        >>> estimate_similarity(a, b)
+        1.0
+    """
+
+    def __init__(
+        self,
+        num_perm: int = DEFAULT_NUM_PERM,
+        shingle_size: int = DEFAULT_SHINGLE_SIZE,
+        seed: int = 1,
+    ) -> None:
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self._a = rng.randrange(1, _MERSENNE_PRIME)
+        self._b = rng.randrange(0, _MERSENNE_PRIME)
+        # Fixed per-bin probe sequences make densification deterministic, so
+        # two texts with the same non-empty bins borrow identically.
+        self._probes = [
+            [rng.randrange(num_perm) for _ in range(_PROBE_ROUNDS * num_perm)]
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, text: str) -> Optional[Signature]:
+        """Return the signature of ``text``, or None if it has no words."""
+        hashes = shingles(text, self.shingle_size)
+        if not hashes:
+            return None
+
+        n = self.num_perm
+        bins: list[Optional[int]] = [None] * n
+        for h in hashes:
+            h = (self._a * h + self._b) % _MERSENNE_PRIME
+            index, value = h % n, (h // n) & _MAX_HASH
+            current = bins[index]
+            if current is None or value < current:
+                bins[index] = value
+
+        if None not in bins:
+            return tuple(bins)  # type: ignore[arg-type]
+
+        signature = list(bins)
+        for index in range(n):
+            if bins[index] is not None:
+                continue
+            source = next((p for p in self._probes[index] if bins[p] is not None), None)
+            if source is None:  # pragma: no cover - needs ~n * 4 unlucky probes
+                source = next(
+                    (index + d) % n for d in range(n) if bins[(index + d) % n] is not None
+                )
+            signature[index] = bins[source]
+        return tuple(signature)  # type: ignore[arg-type]
+
+    def signature_from_files(self, files: Mapping[str, str]) -> Optional[Signature]:
+        """Return the signature of an artifact's files (in filename order)."""
+        return self.signature("\n".join(files[name] for name in sorted(files)))
+
+
+def estimate_similarity(a: Signature, b: Signature) -> float:
+    """Estimate Jaccard similarity from two equal-length signatures."""
+    if len(a) != len(b):
+        raise ValueError(f"Signature lengths differ: {len(a)} != {len(b)}")
+    return sum(1 for x, y in zip(a, b) if x == y) / len(a)
+
+
+def encode_signature(signature: Signature) -> str:
+    """Pack a signature into a base64 string for storage."""
+    return base64.b64encode(struct.pack(f"<{len(signature)}I", *signature)).decode()
+
+
+def decode_signature(encoded: str) -> Signature:
+    """Unpack a signature produced by :func:`encode_signature`."""
+    raw = base64.b64decode(encoded)
+    return struct.unpack(f"<{len(raw) // 4}I", raw)
+
+
+def catalog_signature_text(entry: Mapping[str, Any]) -> str:
+    """Return the text a catalog entry's signature is computed from.
+
+    Uses deep-indexed file content when available, otherwise the frontmatter
+    title, description and search text.
+    """
+    deep = entry.get("deep_search_text")
+    if deep:
+        return deep
+    parts = (entry.get("title"), entry.get("description"), entry.get("search_text"))
+    return "\n".join(p for p in parts if p)
+
+
+_default_hasher: Optional[MinHasher] = None
+
+
+def catalog_signature(entry: Mapping[str, Any]) -> Optional[str]:
+    """Return the encoded default signature for a catalog entry's text.
+
+    Returns None when the entry has no indexed text.
+    """
+    global _default_hasher
+    if _default_hasher is None:
+        _default_hasher = MinHasher()
+    signature = _default_hasher.signature(catalog_signature_text(entry))
+    return encode_signature(signature) if signature is not None else None
+
+
+class LSHIndex:
+    """Banded locality-sensitive hash index over MinHash signatures.
+
+    Args:
+        num_perm: Signature length; must be divisible by ``bands``.
+        bands: Number of bands.  More bands find lower-similarity candidates.
+
+    Example:
+        >>> index = LSHIndex()
+        >>> index.add("a", sig_a)
+        >>> index.add("b", sig_b)
+        >>> index.clusters(threshold=0.8)
+        [['a', 'b']]
+    """
+
+    def __init__(
+        self, num_perm: int = DEFAULT_NUM_PERM, bands: int = DEFAULT_BANDS
+    ) -> None:
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets: list[dict[Signature, list[Hashable]]] = [
+            defaultdict(list) for _ in range(bands)
+        ]
+        self._signatures: dict[Hashable, Signature] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _band_keys(self, signature: Signature) -> Iterable[tuple[int, Signature]]:
+        if len(signature) != self.num_perm:
+            raise ValueError(
+                f"Expected signature of length {self.num_perm}, got {len(signature)}"
+            )
+        for band in range(self.bands):
+            yield band, signature[band * self.rows : (band + 1) * self.rows]
+
+    def add(self, key: Hashable, signature: Signature) -> None:
+        """Index ``signature`` under ``key`` (keys must be unique)."""
+        if key in self._signatures:
+            raise KeyError(f"Key already indexed: {key!r}")
+        self._signatures[key] = signature
+        for band, band_key in self._band_keys(signature):
+            self._buckets[band][band_key].append(key)
+
+    def candidates(self, signature: Signature) -> set[Hashable]:
+        """Return keys sharing at least one band bucket with ``signature``."""
+        found: set[Hashable] = set()
+        for band, band_key in self._band_keys(signature):
+            found.update(self._buckets[band].get(band_key, ()))
+        return found
+
+    def query(
+        self, signature: Signature, threshold: float = DEFAULT_THRESHOLD
+    ) -> list[tuple[Hashable, float]]:
+        """Return ``(key, similarity)`` for verified matches, most similar first."""
+        matches = [
+            (key, estimate_similarity(signature, self._signatures[key]))
+            for key in self.candidates(signature)
+        ]
+        matches = [m for m in matches if m[1] >= threshold]
+        matches.sort(key=lambda m: (-m[1], str(m[0])))
+        return matches
+
+    def clusters(self, threshold: float = DEFAULT_THRESHOLD) -> list[list[Hashable]]:
+        """Group indexed keys into clusters of near-duplicates.
+
+        Candidate pairs come from shared buckets and are joined (union-find)
+        when their estimated similarity reaches ``threshold``.  Clustering is
+        transitive, so members of large clusters may be less similar to each
+        other than to an intermediate member.
+
+        Returns:
+            Clusters with 2+ keys, largest first; keys sorted within each.
+        """
+        parent: dict[Hashable, Hashable] = {}
+
+        def find(key: Hashable) -> Hashable:
+            root = key
+            while parent.get(root, root) != root:
+                root = parent[root]
+            while key != root:
+                parent[key], key = root, parent.get(key, key)
+            return root
+
+        checked: set[tuple[Hashable, Hashable]] = set()
+        for buckets in self._buckets:
+            for members in buckets.values():
+                if len(members) < 2:
+                    continue
+                for i, left in enumerate(members):
+                    for right in members[i + 1 :]:
+                        if find(left) == find(right) or (left, right) in checked:
+                            continue
+                        checked.add((left, right))
+                        similarity = estimate_similarity(
+                            self._signatures[left], self._signatures[right]
+                        )
+                        if similarity >= threshold:
+                            root = find(left)
+                            parent.setdefault(root, root)
+                            parent[find(right)] = root
+
+        groups: dict[Hashable, list[Hashable]] = defaultdict(list)
+        for key in parent:
+            groups[find(key)].append(key)
+        clusters = [sorted(g, key=str) for g in groups.values() if len(g) > 1]
+        clusters.sort(key=lambda g: (-len(g), str(g[0])))
+        logger.debug(
+            f"LSH clustering: {len(self)} signatures, {len(checked)} candidate "
+            f"pairs verified, {len(clusters)} clusters"
+        )
+        return clusters
@@ -30,8 +30,9 @@ from __future__ import annotations
 import logging
 import re
 from collections import Counter
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
+from skillmeat.cache.marketplace_facets import FacetTable
 from skillmeat.cache.models import MarketplaceSource
 from skillmeat.cache.repositories import (
     MarketplaceSourceRepository,
@@ -452,6 +453,29 @@ class SourceManager:
             self.logger.error(f"Failed to update source counts: {e}")
             raise RepositoryError(f"Failed to update counts: {e}") from e
 
+    def get_facet_counts(self, verify: bool = False) -> Tuple[FacetTable, List[str]]:
+        """Return precomputed artifact-type, tag and trust-level facet counts.
+
+        Counts are maintained incrementally by the repository write paths, so
+        this does not aggregate over sources or catalog entries.
+
+        Args:
+            verify: Compare against live aggregates first; on mismatch the
+                facet tables are rebuilt and the mismatches returned.
+
+        Returns:
+            Tuple of (facet table, mismatch descriptions)
+        """
+        mismatches: List[str] = []
+        if verify:
+            mismatches = self.repo.verify_facet_counts(repair=True)
+            if mismatches:
+                self.logger.warning(
+                    f"Marketplace facet counts drifted from live aggregates "
+                    f"({len(mismatches)} values); rebuilt"
+                )
+        return self.repo.get_facet_counts(), mismatches
+
     # =========================================================================
     # Filtering Operations
     # =========================================================================
@@ -7,6 +7,7 @@ servers in SkillMeat collections.
 from .metadata import MCPServerMetadata, MCPServerStatus
 from .deployment import MCPDeploymentManager, DeploymentResult
 from .health import MCPHealthChecker, HealthCheckResult, HealthStatus
+from .log_monitor import MCPLogMonitor
 
 __all__ = [
     "MCPServerMetadata",
@@ -16,4 +17,5 @@ __all__ = [
     "MCPHealthChecker",
     "HealthCheckResult",
     "HealthStatus",
+    "MCPLogMonitor",
 ]
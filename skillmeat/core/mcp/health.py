@@ -1,12 +1,10 @@
 """MCP Server Health Checking for SkillMeat.
 
 This module provides health monitoring for deployed MCP servers by analyzing
-Claude Desktop logs and settings.json configuration.
+Claude Desktop logs and settings.json configuration.  Log parsing is
+incremental: see :mod:`skillmeat.core.mcp.log_monitor`.
 """
 
-import json
-import platform
-import re
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -17,6 +15,19 @@ from typing import Dict, List, Optional, Tuple
 from rich.console import Console
 
 from skillmeat.core.mcp.deployment import MCPDeploymentManager
+from skillmeat.core.mcp.log_monitor import (
+    ERROR_PATTERNS,
+    ERROR_RE,
+    SUCCESS_PATTERNS,
+    SUCCESS_RE,
+    WARNING_PATTERNS,
+    WARNING_RE,
+    MCPLogMonitor,
+    claude_log_directory,
+    find_log_files,
+    match_server,
+    parse_line,
+)
 
 console = Console()
 
@@ -100,54 +111,44 @@ class MCPHealthChecker:
 
     This class provides health monitoring by:
     1. Validating settings.json configuration
-    2. Parsing Claude Desktop logs for server status
+    2. Tailing Claude Desktop logs for server status (only appended bytes
+       are read after the first check)
     3. Detecting error and warning patterns
     4. Caching results to minimize I/O
 
     Attributes:
         deployment_manager: MCPDeploymentManager instance
         cache_ttl: Cache time-to-live in seconds (default: 30)
+        log_monitor: MCPLogMonitor holding per-server log aggregates
         _cache: Internal cache for log parsing results
         _cache_timestamp: Timestamp of last cache update
     """
 
     # Log patterns for different event types
-    SUCCESS_PATTERNS = [
-        r"MCP server ['\"](.+?)['\"] initialized successfully",
-        r"Connected to MCP server ['\"](.+?)['\"]",
-        r"MCP server ['\"](.+?)['\"] started",
-        r"Successfully connected to ['\"](.+?)['\"]",
-    ]
-
-    ERROR_PATTERNS = [
-        r"Failed to start MCP server ['\"](.+?)['\"]",
-        r"MCP server ['\"](.+?)['\"] crashed",
-        r"Error in MCP server ['\"](.+?)['\"]",
-        r"MCP server ['\"](.+?)['\"] not found",
-        r"Failed to connect to ['\"](.+?)['\"]",
-        r"MCP server ['\"](.+?)['\"] exited with code",
-    ]
-
-    WARNING_PATTERNS = [
-        r"MCP server ['\"](.+?)['\"] slow to respond",
-        r"Restarting MCP server ['\"](.+?)['\"]",
-        r"MCP server ['\"](.+?)['\"] timeout",
-        r"Retrying connection to ['\"](.+?)['\"]",
-    ]
+    SUCCESS_PATTERNS = SUCCESS_PATTERNS
+    ERROR_PATTERNS = ERROR_PATTERNS
+    WARNING_PATTERNS = WARNING_PATTERNS
 
     def __init__(
         self,
         deployment_manager: Optional[MCPDeploymentManager] = None,
         cache_ttl: int = 30,
+        log_monitor: Optional[MCPLogMonitor] = None,
     ):
         """Initialize health checker.
 
         Args:
             deployment_manager: Optional MCPDeploymentManager instance
             cache_ttl: Cache time-to-live in seconds
+            log_monitor: Optional shared MCPLogMonitor (e.g. one persisting
+                its offsets or refreshing in the background); defaults to
+                an in-memory monitor over :meth:`find_log_files`
         """
         self.deployment_manager = deployment_manager or MCPDeploymentManager()
         self.cache_ttl = cache_ttl
+        self.log_monitor = log_monitor or MCPLogMonitor(
+            lambda: self.find_log_files()
+        )
         self._cache: Dict[str, HealthCheckResult] = {}
         self._cache_timestamp: float = 0
 
@@ -160,21 +161,7 @@ class MCPHealthChecker:
         Raises:
             RuntimeError: If platform is not supported
         """
-        system = platform.system()
-
-        if system == "Darwin":  # macOS
-            return Path.home() / "Library" / "Logs" / "Claude"
-        elif system == "Windows":
-            import os
-
-            appdata = os.environ.get("APPDATA")
-            if not appdata:
-                raise RuntimeError("APPDATA environment variable not found")
-            return Path(appdata) / "Claude" / "logs"
-        elif system == "Linux":
-            return Path.home() / ".config" / "Claude" / "logs"
-        else:
-            raise RuntimeError(f"Unsupported platform: {system}")
+        return claude_log_directory()
 
     def find_log_files(self) -> List[Path]:
         """Find Claude Desktop log files.
@@ -187,28 +174,7 @@ class MCPHealthChecker:
             List of log file paths (most recent first)
         """
         try:
-            log_dir = self.get_log_directory()
-            if not log_dir.exists():
-                return []
-
-            # Find all MCP-related log files
-            log_files = []
-
-            # Check for main log file
-            main_log = log_dir / "mcp.log"
-            if main_log.exists():
-                log_files.append(main_log)
-
-            # Check for rotated logs
-            for i in range(1, 10):  # Check up to mcp.log.9
-                rotated_log = log_dir / f"mcp.log.{i}"
-                if rotated_log.exists():
-                    log_files.append(rotated_log)
-                else:
-                    break
-
-            return log_files
-
+            return find_log_files(self.get_log_directory())
         except Exception as e:
             console.print(f"[yellow]Warning: Failed to find log files: {e}[/yellow]")
             return []
@@ -226,44 +192,17 @@ class MCPHealthChecker:
         Returns:
             LogEntry if successfully parsed, None otherwise
         """
-        # Try to parse timestamp and level
-        # Format: [YYYY-MM-DD HH:MM:SS] LEVEL: message
-        # or: [YYYY-MM-DDTHH:MM:SSZ] LEVEL: message
-        timestamp_pattern = (
-            r"\[(\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}[Z]?)\]\s*([A-Z]+):\s*(.+)"
-        )
-        match = re.match(timestamp_pattern, line)
-
-        if not match:
-            # Try simpler format without level
-            simple_pattern = r"\[(\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}[Z]?)\]\s*(.+)"
-            match = re.match(simple_pattern, line)
-            if match:
-                timestamp_str, message = match.groups()
-                level = "INFO"
-            else:
-                # Cannot parse, return None
-                return None
-        else:
-            timestamp_str, level, message = match.groups()
-
-        # Parse timestamp
-        try:
-            # Remove 'Z' suffix if present and replace T with space
-            timestamp_str = timestamp_str.replace("Z", "").replace("T", " ")
-            timestamp = datetime.fromisoformat(timestamp_str)
-        except ValueError:
-            timestamp = None
+        parsed = parse_line(line)
+        if parsed is None:
+            return None
+        timestamp, level, message = parsed
 
         # Extract server name if present
-        server_name = None
-        for pattern in (
-            self.SUCCESS_PATTERNS + self.ERROR_PATTERNS + self.WARNING_PATTERNS
-        ):
-            server_match = re.search(pattern, message)
-            if server_match:
-                server_name = server_match.group(1)
-                break
+        server_name = (
+            match_server(SUCCESS_RE.search(message))
+            or match_server(ERROR_RE.search(message))
+            or match_server(WARNING_RE.search(message))
+        )
 
         return LogEntry(
             timestamp=timestamp,
@@ -315,6 +254,9 @@ class MCPHealthChecker:
     def parse_claude_logs(self) -> Dict[str, Dict]:
         """Parse Claude Desktop logs for all MCP server status.
 
+        Only log bytes appended since the previous call are read; earlier
+        lines are already folded into the monitor's aggregates.
+
         Returns:
             Dictionary mapping server names to status information:
             {
@@ -326,81 +268,10 @@ class MCPHealthChecker:
                 }
             }
         """
-        log_files = self.find_log_files()
-        if not log_files:
-            return {}
-
-        server_status = {}
-
-        # Read logs (most recent first)
-        for log_file in log_files:
-            try:
-                with open(log_file, "r", encoding="utf-8", errors="ignore") as f:
-                    lines = f.readlines()
-
-                # Process in reverse order (most recent first)
-                for line in reversed(lines):
-                    entry = self.parse_log_line(line.strip())
-                    if not entry or not entry.server_name:
-                        continue
-
-                    server_name = entry.server_name
-
-                    # Initialize server status if not present
-                    if server_name not in server_status:
-                        server_status[server_name] = {
-                            "last_seen": entry.timestamp,
-                            "errors": [],
-                            "warnings": [],
-                            "success_count": 0,
-                        }
-
-                    # Update last_seen to most recent timestamp
-                    if entry.timestamp:
-                        if not server_status[server_name]["last_seen"]:
-                            server_status[server_name]["last_seen"] = entry.timestamp
-                        else:
-                            server_status[server_name]["last_seen"] = max(
-                                server_status[server_name]["last_seen"],
-                                entry.timestamp,
-                            )
-
-                    # Check for error patterns
-                    is_error = False
-                    for pattern in self.ERROR_PATTERNS:
-                        if re.search(pattern, entry.message):
-                            # Only store first 10 errors
-                            if len(server_status[server_name]["errors"]) < 10:
-                                server_status[server_name]["errors"].append(
-                                    entry.message
-                                )
-                            is_error = True
-                            break
-
-                    # Check for warning patterns (if not error)
-                    if not is_error:
-                        for pattern in self.WARNING_PATTERNS:
-                            if re.search(pattern, entry.message):
-                                # Only store first 10 warnings
-                                if len(server_status[server_name]["warnings"]) < 10:
-                                    server_status[server_name]["warnings"].append(
-                                        entry.message
-                                    )
-                                break
-
-                    # Check for success patterns
-                    for pattern in self.SUCCESS_PATTERNS:
-                        if re.search(pattern, entry.message):
-                            server_status[server_name]["success_count"] += 1
-                            break
-
-            except Exception as e:
-                console.print(
-                    f"[yellow]Warning: Failed to parse {log_file}: {e}[/yellow]"
-                )
-                continue
-
-        return server_status
+        # A monitor refreshing in the background is already current.
+        if self.log_monitor.running:
+            return self.log_monitor.snapshot()
+        return self.log_monitor.refresh()
 
     def check_server_health(
         self, server_name: str, use_cache: bool = True
@@ -0,0 +1,528 @@
+"""Incremental Claude Desktop MCP log monitor.
+
+``MCPHealthChecker`` used to read every MCP log file in full on each health
+check.  :class:`MCPLogMonitor` instead tails the files: it remembers, per
+file, the byte offset it has consumed (keyed by device and inode, so a file
+renamed by log rotation keeps its position) and on each refresh reads only
+the bytes appended since.  Per-server aggregates (last seen, most recent
+errors and warnings, success count) are updated from the new lines and kept
+in memory; with a ``state_path`` they are persisted together with the
+offsets, so a later process resumes where the previous one stopped.
+
+Rotation and truncation handling:
+
+- ``mcp.log`` renamed to ``mcp.log.1``: same inode, reading continues at the
+  stored offset under the new name; the new ``mcp.log`` is read from 0.
+- A file shorter than its stored offset, or whose first bytes changed
+  (inode reuse), is read again from the start.
+- Files no longer present are forgotten; their contribution to the
+  aggregates is kept.
+
+A trailing line without a newline is treated as provisional: it is reflected
+in :meth:`MCPLogMonitor.snapshot` but the offset stays before it, so it is
+counted once it is complete.
+
+Usage::
+
+    monitor = MCPLogMonitor(default_log_files, state_path=DEFAULT_STATE_PATH)
+    status = monitor.refresh()      # reads only new bytes
+    monitor.start(interval=5.0)     # or keep it current in the background
+"""
+
+import hashlib
+import json
+import logging
+import os
+import platform
+import re
+import tempfile
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Log patterns for different event types.  Each captures the server name.
+SUCCESS_PATTERNS = [
+    r"MCP server ['\"](.+?)['\"] initialized successfully",
+    r"Connected to MCP server ['\"](.+?)['\"]",
+    r"MCP server ['\"](.+?)['\"] started",
+    r"Successfully connected to ['\"](.+?)['\"]",
+]
+
+ERROR_PATTERNS = [
+    r"Failed to start MCP server ['\"](.+?)['\"]",
+    r"MCP server ['\"](.+?)['\"] crashed",
+    r"Error in MCP server ['\"](.+?)['\"]",
+    r"MCP server ['\"](.+?)['\"] not found",
+    r"Failed to connect to ['\"](.+?)['\"]",
+    r"MCP server ['\"](.+?)['\"] exited with code",
+]
+
+WARNING_PATTERNS = [
+    r"MCP server ['\"](.+?)['\"] slow to respond",
+    r"Restarting MCP server ['\"](.+?)['\"]",
+    r"MCP server ['\"](.+?)['\"] timeout",
+    r"Retrying connection to ['\"](.+?)['\"]",
+]
+
+
+def _alternation(patterns: List[str]) -> "re.Pattern[str]":
+    """Compile *patterns* into one regex; each branch has one capture group."""
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+
+
+SUCCESS_RE = _alternation(SUCCESS_PATTERNS)
+ERROR_RE = _alternation(ERROR_PATTERNS)
+WARNING_RE = _alternation(WARNING_PATTERNS)
+
+# [YYYY-MM-DD HH:MM:SS] LEVEL: message  (or ISO "T"/"Z" timestamps)
+LEVEL_LINE_RE = re.compile(
+    r"\[(\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}[Z]?)\]\s*([A-Z]+):\s*(.+)"
+)
+# [YYYY-MM-DD HH:MM:SS] message
+SIMPLE_LINE_RE = re.compile(r"\[(\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}[Z]?)\]\s*(.+)")
+
+# Recent errors/warnings kept per server.
+DEFAULT_MAX_MESSAGES = 10
+
+# Offsets and aggregates shared by the CLI and API server.
+DEFAULT_STATE_PATH = Path.home() / ".skillmeat" / "cache" / "mcp-log-monitor.json"
+
+# Bytes at the start of a file used to detect inode reuse.
+_HEAD_BYTES = 64
+
+_STATE_VERSION = 1
+
+
+def match_server(match: Optional["re.Match[str]"]) -> Optional[str]:
+    """Return the server name captured by a match of an alternation regex."""
+    if match is None or match.lastindex is None:
+        return None
+    return match.group(match.lastindex)
+
+
+def parse_line(line: str) -> Optional[Tuple[Optional[datetime], str, str]]:
+    """Split a log line into ``(timestamp, level, message)``.
+
+    Args:
+        line: Raw log line without trailing newline
+
+    Returns:
+        Tuple of parsed parts, or None if the line has no timestamp prefix
+    """
+    match = LEVEL_LINE_RE.match(line)
+    if match:
+        timestamp_str, level, message = match.groups()
+    else:
+        match = SIMPLE_LINE_RE.match(line)
+        if not match:
+            return None
+        timestamp_str, message = match.groups()
+        level = "INFO"
+
+    try:
+        timestamp: Optional[datetime] = datetime.fromisoformat(
+            timestamp_str.replace("Z", "").replace("T", " ")
+        )
+    except ValueError:
+        timestamp = None
+    return timestamp, level, message
+
+
+def claude_log_directory() -> Path:
+    """Get platform-specific Claude Desktop log directory.
+
+    Returns:
+        Path to log directory
+
+    Raises:
+        RuntimeError: If platform is not supported
+    """
+    system = platform.system()
+
+    if system == "Darwin":  # macOS
+        return Path.home() / "Library" / "Logs" / "Claude"
+    elif system == "Windows":
+        appdata = os.environ.get("APPDATA")
+        if not appdata:
+            raise RuntimeError("APPDATA environment variable not found")
+        return Path(appdata) / "Claude" / "logs"
+    elif system == "Linux":
+        return Path.home() / ".config" / "Claude" / "logs"
+    else:
+        raise RuntimeError(f"Unsupported platform: {system}")
+
+
+def find_log_files(log_dir: Path) -> List[Path]:
+    """Find MCP log files in *log_dir*.
+
+    Looks for ``mcp.log`` and its rotated siblings ``mcp.log.1`` …
+    ``mcp.log.9`` (stopping at the first gap).
+
+    Args:
+        log_dir: Claude Desktop log directory
+
+    Returns:
+        List of log file paths (most recent first)
+    """
+    if not log_dir.exists():
+        return []
+
+    log_files = []
+    main_log = log_dir / "mcp.log"
+    if main_log.exists():
+        log_files.append(main_log)
+
+    for i in range(1, 10):
+        rotated_log = log_dir / f"mcp.log.{i}"
+        if rotated_log.exists():
+            log_files.append(rotated_log)
+        else:
+            break
+
+    return log_files
+
+
+def default_log_files() -> List[Path]:
+    """Return the MCP log files in the Claude Desktop log directory.
+
+    Returns:
+        List of log file paths (most recent first); empty on unsupported
+        platforms
+    """
+    try:
+        return find_log_files(claude_log_directory())
+    except RuntimeError:
+        return []
+
+
+@dataclass
+class ServerLogStats:
+    """Rolling log aggregates for one MCP server.
+
+    Attributes:
+        last_seen: Newest timestamp seen for the server
+        errors: Most recent error messages (oldest first)
+        warnings: Most recent warning messages (oldest first)
+        success_count: Number of success events seen
+    """
+
+    max_messages: int = DEFAULT_MAX_MESSAGES
+    last_seen: Optional[datetime] = None
+    errors: Deque[str] = field(default_factory=deque)
+    warnings: Deque[str] = field(default_factory=deque)
+    success_count: int = 0
+
+    def __post_init__(self) -> None:
+        self.errors = deque(self.errors, maxlen=self.max_messages)
+        self.warnings = deque(self.warnings, maxlen=self.max_messages)
+
+    def copy(self) -> "ServerLogStats":
+        return ServerLogStats(
+            self.max_messages,
+            self.last_seen,
+            deque(self.errors),
+            deque(self.warnings),
+            self.success_count,
+        )
+
+    def to_status(self) -> Dict:
+        """Return the ``parse_claude_logs`` entry (messages newest first)."""
+        return {
+            "last_seen": self.last_seen,
+            "errors": list(reversed(self.errors)),
+            "warnings": list(reversed(self.warnings)),
+            "success_count": self.success_count,
+        }
+
+    def to_dict(self) -> Dict:
+        return {
+            "last_seen": self.last_seen.isoformat() if self.last_seen else None,
+            "errors": list(self.errors),
+            "warnings": list(self.warnings),
+            "success_count": self.success_count,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict, max_messages: int) -> "ServerLogStats":
+        last_seen = data.get("last_seen")
+        return cls(
+            max_messages,
+            datetime.fromisoformat(last_seen) if last_seen else None,
+            deque(data.get("errors", [])),
+            deque(data.get("warnings", [])),
+            int(data.get("success_count", 0)),
+        )
+
+
+@dataclass
+class _FileCursor:
+    """Read position in one log file."""
+
+    path: str
+    offset: int = 0
+    head: str = ""  # digest of the first bytes read, to detect inode reuse
+    pending: str = ""  # trailing line without newline (not persisted)
+
+
+def _apply_line(servers: Dict[str, ServerLogStats], line: str, max_messages: int) -> None:
+    """Fold one log line into *servers*."""
+    # Every pattern quotes the server name; skip lines that cannot match.
+    if "'" not in line and '"' not in line:
+        return
+    parsed = parse_line(line)
+    if parsed is None:
+        return
+    timestamp, _, message = parsed
+
+    success = SUCCESS_RE.search(message)
+    error = ERROR_RE.search(message)
+    warning = None if error else WARNING_RE.search(message)
+    server_name = match_server(success) or match_server(error) or match_server(warning)
+    if not server_name:
+        return
+
+    stats = servers.get(server_name)
+    if stats is None:
+        stats = servers[server_name] = ServerLogStats(max_messages)
+    if timestamp and (stats.last_seen is None or timestamp > stats.last_seen):
+        stats.last_seen = timestamp
+    if error:
+        stats.errors.append(message)
+    elif warning:
+        stats.warnings.append(message)
+    if success:
+        stats.success_count += 1
+
+
+class MCPLogMonitor:
+    """Tails MCP log files and keeps per-server health aggregates.
+
+    Thread-safe; one instance can be shared by request handlers and its own
+    background refresh thread.
+
+    Attributes:
+        state_path: JSON file persisting offsets and aggregates, or None
+        max_messages: Recent errors/warnings kept per server
+    """
+
+    def __init__(
+        self,
+        log_files: Callable[[], List[Path]],
+        state_path: Optional[Path] = None,
+        max_messages: int = DEFAULT_MAX_MESSAGES,
+    ):
+        """Initialize monitor.
+
+        Args:
+            log_files: Callable returning the current log files, most
+                recent first (e.g. ``MCPHealthChecker.find_log_files``)
+            state_path: Optional file to persist offsets and aggregates in
+            max_messages: Recent errors/warnings kept per server
+        """
+        self._log_files = log_files
+        self.state_path = state_path
+        self.max_messages = max_messages
+        self._lock = threading.RLock()
+        self._cursors: Dict[str, _FileCursor] = {}
+        self._servers: Dict[str, ServerLogStats] = {}
+        self._loaded = False
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        """Whether the background refresh thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def refresh(self) -> Dict[str, Dict]:
+        """Read newly appended log lines and return the updated status.
+
+        Returns:
+            Mapping of server name to ``last_seen``, ``errors``, ``warnings``
+            (newest first) and ``success_count``, as returned by
+            ``MCPHealthChecker.parse_claude_logs``
+        """
+        with self._lock:
+            self._load_state()
+            changed = False
+            seen = set()
+            # Oldest file first so aggregates are updated in log order.
+            for path in reversed(self._log_files()):
+                result = self._read_file(Path(path))
+                if result is None:
+                    continue
+                key, advanced = result
+                seen.add(key)
+                changed = changed or advanced
+
+            for key in set(self._cursors) - seen:
+                del self._cursors[key]
+                changed = True
+
+            if changed:
+                self._save_state()
+            return self.snapshot()
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Return the current status without reading any files."""
+        with self._lock:
+            servers = self._servers
+            pending = [cursor.pending for cursor in self._cursors.values() if cursor.pending]
+            if pending:
+                servers = {name: stats.copy() for name, stats in servers.items()}
+                for line in pending:
+                    _apply_line(servers, line, self.max_messages)
+            return {name: stats.to_status() for name, stats in servers.items()}
+
+    def reset(self) -> None:
+        """Forget all offsets and aggregates (files are re-read next refresh)."""
+        with self._lock:
+            self._cursors.clear()
+            self._servers.clear()
+            self._loaded = True
+            if self.state_path is not None:
+                self._save_state()
+
+    def start(self, interval: float = 5.0) -> None:
+        """Refresh in a daemon thread every *interval* seconds.
+
+        Args:
+            interval: Seconds between refreshes
+        """
+        with self._lock:
+            if self.running:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(interval,),
+                name="mcp-log-monitor",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Stop the background thread started by :meth:`start`."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        self._thread = None
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _run(self, interval: float) -> None:
+        while True:
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning(f"MCP log monitor refresh failed: {e}")
+            if self._stop.wait(interval):
+                return
+
+    def _read_file(self, path: Path) -> Optional[Tuple[str, bool]]:
+        """Consume new complete lines of *path*.
+
+        Returns:
+            ``(cursor key, whether the offset moved)``, or None if the file
+            cannot be read
+        """
+        try:
+            stat = path.stat()
+            if not path.is_file():
+                return None
+            key = f"{stat.st_dev}:{stat.st_ino}"
+            cursor = self._cursors.get(key)
+            if cursor is None:
+                cursor = self._cursors[key] = _FileCursor(str(path))
+            cursor.path = str(path)
+            previous = start = cursor.offset
+
+            if stat.st_size == start:
+                cursor.pending = ""
+                return key, False
+
+            with open(path, "rb") as fh:
+                if start and (
+                    stat.st_size < start
+                    or _digest(fh.read(min(_HEAD_BYTES, start))) != cursor.head
+                ):
+                    # Truncated or replaced: read again from the start.
+                    start = cursor.offset = 0
+                fh.seek(start)
+                data = fh.read()
+
+                complete, newline, tail = data.rpartition(b"\n")
+                cursor.pending = tail.decode("utf-8", errors="ignore").strip()
+                if newline:
+                    for raw in complete.split(b"\n"):
+                        _apply_line(
+                            self._servers,
+                            raw.decode("utf-8", errors="ignore").strip(),
+                            self.max_messages,
+                        )
+                    cursor.offset = start + len(complete) + 1
+                    if start < _HEAD_BYTES:
+                        fh.seek(0)
+                        cursor.head = _digest(fh.read(min(_HEAD_BYTES, cursor.offset)))
+        except OSError as e:
+            logger.warning(f"Failed to read MCP log {path}: {e}")
+            return None
+
+        return key, cursor.offset != previous
+
+    def _load_state(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.state_path is None or not self.state_path.exists():
+            return
+        try:
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+            if state.get("version") != _STATE_VERSION:
+                return
+            self._cursors = {
+                key: _FileCursor(entry["path"], int(entry["offset"]), entry["head"])
+                for key, entry in state.get("files", {}).items()
+            }
+            self._servers = {
+                name: ServerLogStats.from_dict(entry, self.max_messages)
+                for name, entry in state.get("servers", {}).items()
+            }
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable MCP log monitor state: {e}")
+            self._cursors = {}
+            self._servers = {}
+
+    def _save_state(self) -> None:
+        if self.state_path is None:
+            return
+        state = {
+            "version": _STATE_VERSION,
+            "files": {
+                key: {"path": cursor.path, "offset": cursor.offset, "head": cursor.head}
+                for key, cursor in self._cursors.items()
+            },
+            "servers": {name: stats.to_dict() for name, stats in self._servers.items()},
+        }
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self.state_path.parent, prefix=".mcp-log-monitor-", suffix=".tmp"
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(state, fh)
+            os.replace(tmp_name, self.state_path)
+        except OSError as e:
+            logger.warning(f"Failed to save MCP log monitor state: {e}")
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha1(data).hexdigest()
@@ -25,6 +25,7 @@ from .score_aggregator import AggregatedScore, ScoreAggregator, ScoreSource
 from .score_decay import DecayedScore, ScoreDecay
 from .semantic_scorer import SemanticScorer
 from .service import ScoringService
+from .vector_store import VectorStore
 
 __all__ = [
     # Models
@@ -48,6 +49,7 @@ __all__ = [
     "EmbeddingProvider",
     "AnthropicEmbedder",
     "SentenceTransformerEmbedder",
+    "VectorStore",
     # Backward-compat alias
     "HaikuEmbedder",
     # Service
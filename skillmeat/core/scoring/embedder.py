@@ -58,6 +58,7 @@ class SentenceTransformerEmbedder(EmbeddingProvider):
     Attributes:
         MODEL_NAME:          HuggingFace model identifier.
         EMBEDDING_DIMENSION: Dimensionality of output vectors (384).
+        BATCH_SIZE:          Texts per forward pass in :meth:`get_embeddings`.
 
     Example:
         >>> embedder = SentenceTransformerEmbedder()
@@ -69,6 +70,7 @@ class SentenceTransformerEmbedder(EmbeddingProvider):
 
     MODEL_NAME: str = "all-MiniLM-L6-v2"
     EMBEDDING_DIMENSION: int = 384
+    BATCH_SIZE: int = 64
 
     def __init__(self) -> None:
         """Initialize the embedder.
@@ -109,6 +111,14 @@ class SentenceTransformerEmbedder(EmbeddingProvider):
         """
         return self.EMBEDDING_DIMENSION
 
+    def get_model_id(self) -> str:
+        """Return the sentence-transformers model name.
+
+        Returns:
+            ``all-MiniLM-L6-v2``.
+        """
+        return self.MODEL_NAME
+
     async def get_embedding(self, text: str) -> Optional[List[float]]:
         """Generate a 384-dimensional embedding for *text*.
 
@@ -152,6 +162,50 @@ class SentenceTransformerEmbedder(EmbeddingProvider):
             logger.error("SentenceTransformerEmbedder: encoding failed: %s", exc)
             return None
 
+    async def get_embeddings(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """Generate embeddings for *texts* with batched ``encode`` calls.
+
+        All non-empty texts are encoded in a single executor call, which runs
+        the model over ``BATCH_SIZE`` texts per forward pass instead of one.
+
+        Args:
+            texts: Input texts.  Empty or whitespace-only entries yield
+                   ``None``.
+
+        Returns:
+            Embeddings aligned with *texts*; all ``None`` when the provider is
+            unavailable or encoding fails.
+
+        Example:
+            >>> embedder = SentenceTransformerEmbedder()
+            >>> vectors = await embedder.get_embeddings(["search PDFs", "lint code"])
+        """
+        results: List[Optional[List[float]]] = [None] * len(texts)
+        positions = [i for i, text in enumerate(texts) if text and text.strip()]
+        if not positions:
+            return results
+
+        if not self.is_available():
+            logger.warning(
+                "SentenceTransformerEmbedder: sentence_transformers not installed; "
+                "install with: pip install sentence-transformers"
+            )
+            return results
+
+        batch = [texts[i].strip() for i in positions]
+        try:
+            loop = asyncio.get_event_loop()
+            vectors = await loop.run_in_executor(
+                self._executor, self._encode_batch_sync, batch
+            )
+        except Exception as exc:
+            logger.error("SentenceTransformerEmbedder: batch encoding failed: %s", exc)
+            return results
+
+        for i, vector in zip(positions, vectors):
+            results[i] = vector
+        return results
+
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
@@ -185,3 +239,18 @@ class SentenceTransformerEmbedder(EmbeddingProvider):
         # encode() returns a numpy array; convert to plain Python list of float.
         vector = self._model.encode(text, convert_to_numpy=True)
         return [float(v) for v in vector]
+
+    def _encode_batch_sync(self, texts: List[str]) -> List[List[float]]:
+        """Synchronous batched encode call — runs inside the thread executor.
+
+        Args:
+            texts: Pre-validated, stripped input texts.
+
+        Returns:
+            One embedding per input text.
+        """
+        self._load_model()
+        matrix = self._model.encode(
+            texts, batch_size=self.BATCH_SIZE, convert_to_numpy=True
+        )
+        return [[float(v) for v in row] for row in matrix]
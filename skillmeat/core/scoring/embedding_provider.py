@@ -14,6 +14,10 @@ Example:
     ...     print(f"Embedding dimension: {len(embedding)}")
     ... else:
     ...     print("Provider unavailable, using fallback")
+
+Providers that can embed many texts at once (e.g. local models with a batched
+``encode``) override ``get_embeddings``; the default implementation embeds
+one text at a time.
 """
 
 from abc import ABC, abstractmethod
@@ -50,6 +54,38 @@ class EmbeddingProvider(ABC):
         """
         pass
 
+    async def get_embeddings(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """Generate embedding vectors for several texts.
+
+        The default implementation calls :meth:`get_embedding` once per text;
+        providers that support batching should override it.
+
+        Args:
+            texts: Input texts to embed.
+
+        Returns:
+            Embeddings aligned with *texts*; an entry is None where embedding
+            generation failed or the text was empty.
+
+        Example:
+            >>> provider = SomeEmbeddingProvider()
+            >>> vectors = await provider.get_embeddings(["process PDF", "lint code"])
+            >>> len(vectors)
+            2
+        """
+        return [await self.get_embedding(text) for text in texts]
+
+    def get_model_id(self) -> str:
+        """Return an identifier for the model producing the embeddings.
+
+        Persistent embedding stores are partitioned by this value, so it must
+        change whenever the vectors would.  Defaults to the class name.
+
+        Returns:
+            Model identifier string.
+        """
+        return type(self).__name__
+
     @abstractmethod
     def is_available(self) -> bool:
         """Check if provider is available and configured.
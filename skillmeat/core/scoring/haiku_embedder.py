@@ -184,6 +184,29 @@ class AnthropicEmbedder(EmbeddingProvider):
 
         return None
 
+    async def get_embeddings(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """Generate embeddings for several texts.
+
+        Always returns ``None`` for every text (see :meth:`get_embedding`),
+        without logging once per text.
+
+        Args:
+            texts: Input texts to embed
+
+        Returns:
+            A list of ``None`` aligned with *texts*.
+        """
+        if texts and not self.is_available():
+            logger.warning(
+                "AnthropicEmbedder not available: "
+                "Anthropic does not expose an embedding API as of 2026-02"
+            )
+        return [None] * len(texts)
+
+    def get_model_id(self) -> str:
+        """Return the configured model name."""
+        return self.model
+
     def _get_cached_embedding(self, text: str) -> Optional[List[float]]:
         """Retrieve cached embedding if valid.
 
@@ -12,13 +12,18 @@ Example:
     ...     print(f"{artifact.title}: {score:.1f}")
 """
 
+import copy
 import re
 from collections import Counter
-from typing import List, Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
 
 from skillmeat.core.artifact import ArtifactMetadata
 from skillmeat.core.similarity import ScoreBreakdown
-from skillmeat.core.scoring.text_similarity import bigram_similarity, bm25_description_similarity
+from skillmeat.core.scoring.text_similarity import (
+    BM25Index,
+    bigram_similarity,
+    bm25_description_similarity,
+)
 from skillmeat.models import ArtifactFingerprint
 
 # Optional OpenTelemetry integration — works whether or not otel is installed.
@@ -53,6 +58,9 @@ class MatchAnalyzer:
     Attributes:
         field_weights: Dict mapping field names to score weights
         min_threshold: Minimum score for relevance filtering
+        description_index: Optional corpus-level BM25 index used by
+            ``compare()`` for description similarity (see
+            ``with_description_corpus``)
     """
 
     def __init__(
@@ -71,6 +79,7 @@ class MatchAnalyzer:
         """
         self.field_weights = field_weights or FIELD_WEIGHTS
         self.min_threshold = min_threshold
+        self.description_index: Optional[BM25Index] = None
 
         # Validate weights sum to ~1.0
         weight_sum = sum(self.field_weights.values())
@@ -219,7 +228,8 @@ class MatchAnalyzer:
             - Tag Jaccard similarity (30 %)
             - Artifact-type match (15 %)
             - Title bigram similarity via ``bigram_similarity`` (25 %)
-            - Description BM25 content similarity via ``bm25_description_similarity`` (25 %)
+            - Description BM25 content similarity via ``bm25_description_similarity``,
+              or via ``description_index`` when set (25 %)
             - Description length sanity check (5 %)
 
         Args:
@@ -284,6 +294,35 @@ class MatchAnalyzer:
 
         return result
 
+    def with_description_corpus(self, descriptions: Iterable[str]) -> "MatchAnalyzer":
+        """Return a copy of this analyzer that scores descriptions against a corpus.
+
+        Builds a ``BM25Index`` over ``descriptions`` (typically every
+        candidate in the collection or catalog being searched).  When
+        ``compare()`` is then called repeatedly with the same first artifact,
+        description similarity for all candidates comes from one sparse pass
+        over the index, with IDF taken from the real corpus instead of the
+        two-document proxy used by ``bm25_description_similarity``.
+
+        The analyzer itself is left untouched, so a shared instance stays safe
+        to use concurrently.
+
+        Args:
+            descriptions: Candidate description texts.
+
+        Returns:
+            Shallow copy of this analyzer with ``description_index`` set.
+
+        Example:
+            >>> scoped = analyzer.with_description_corpus(
+            ...     fp.description or "" for fp in candidates
+            ... )
+            >>> breakdowns = [scoped.compare(target, fp) for fp in candidates]
+        """
+        scoped = copy.copy(self)
+        scoped.description_index = BM25Index(descriptions)
+        return scoped
+
     # ------------------------------------------------------------------
     # Private helpers for compare()
     # ------------------------------------------------------------------
@@ -479,9 +518,7 @@ class MatchAnalyzer:
         desc_a = artifact_a.description or ""
         desc_b = artifact_b.description or ""
         if desc_a and desc_b:
-            sim_a_to_b = bm25_description_similarity(desc_a, desc_b)
-            sim_b_to_a = bm25_description_similarity(desc_b, desc_a)
-            score += ((sim_a_to_b + sim_b_to_a) / 2.0) * 0.25
+            score += self._description_similarity(desc_a, desc_b) * 0.25
 
         # Description length sanity check (5 %) — penalises very disparate sizes.
         len_a = len(desc_a)
@@ -492,6 +529,28 @@ class MatchAnalyzer:
 
         return min(1.0, max(0.0, score))
 
+    def _description_similarity(self, desc_a: str, desc_b: str) -> float:
+        """Return symmetric BM25 description similarity in [0, 1].
+
+        Uses ``description_index`` when *desc_b* is part of its corpus;
+        otherwise averages both directions of the pairwise
+        ``bm25_description_similarity``.
+
+        Args:
+            desc_a: Description of the first (query) artifact.
+            desc_b: Description of the second (candidate) artifact.
+
+        Returns:
+            Description similarity score from 0.0 to 1.0.
+        """
+        if self.description_index is not None:
+            similarity = self.description_index.similarity(desc_a, desc_b)
+            if similarity is not None:
+                return similarity
+        sim_a_to_b = bm25_description_similarity(desc_a, desc_b)
+        sim_b_to_a = bm25_description_similarity(desc_b, desc_a)
+        return (sim_a_to_b + sim_b_to_a) / 2.0
+
     def _tokenize(self, text: str) -> List[str]:
         """Tokenize text into normalized terms.
 
@@ -33,6 +33,7 @@ from typing import List, Optional, Tuple
 
 from skillmeat.core.artifact import ArtifactMetadata
 from skillmeat.core.scoring.embedding_provider import EmbeddingProvider
+from skillmeat.core.scoring.vector_store import VectorStore
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +52,8 @@ class SemanticScorer:
         provider: EmbeddingProvider instance for generating embeddings
         min_score: Minimum similarity threshold (0-100, default: 0)
         max_score: Maximum similarity score (0-100, default: 100)
+        vector_store: Optional persistent store for artifact embeddings; an
+            in-memory store is used when None
 
     Example:
         >>> from skillmeat.core.scoring.embedder import SentenceTransformerEmbedder
@@ -70,6 +73,7 @@ class SemanticScorer:
         provider: EmbeddingProvider,
         min_score: float = 0.0,
         max_score: float = 100.0,
+        vector_store: Optional[VectorStore] = None,
     ):
         """Initialize semantic scorer.
 
@@ -77,6 +81,8 @@ class SemanticScorer:
             provider: EmbeddingProvider instance for generating embeddings
             min_score: Minimum similarity threshold (default: 0)
             max_score: Maximum similarity score (default: 100)
+            vector_store: Store for artifact embeddings keyed by content hash
+                (default: in-memory, per scorer)
 
         Example:
             >>> from skillmeat.core.scoring.embedder import SentenceTransformerEmbedder
@@ -86,6 +92,8 @@ class SemanticScorer:
         self.provider = provider
         self.min_score = min_score
         self.max_score = max_score
+        self.vector_store = vector_store
+        self._memory_store: Optional[VectorStore] = None
 
     def is_available(self) -> bool:
         """Check if semantic scoring is available.
@@ -107,8 +115,9 @@ class SemanticScorer:
     ) -> Optional[float]:
         """Compute semantic similarity between query and artifact.
 
-        This method generates embeddings for both the query and the artifact
-        description, then computes cosine similarity between them.
+        This method generates an embedding for the query, looks up (or
+        generates and stores) the artifact's embedding, then computes cosine
+        similarity between them.
 
         Args:
             query: User search query
@@ -126,47 +135,19 @@ class SemanticScorer:
             >>> if score and score > 90:
             ...     print("High semantic similarity!")
         """
-        if not self.is_available():
-            logger.debug("Semantic scorer unavailable, returning None")
-            return None
-
-        if not query or not query.strip():
-            logger.warning("Empty query provided")
-            return None
-
-        # Get artifact text to embed
-        artifact_text = self._get_artifact_text(artifact)
-        if not artifact_text:
-            logger.warning(f"No description for artifact: {artifact.title}")
-            return self.min_score
-
-        # Generate embeddings
-        query_embedding = await self.provider.get_embedding(query.strip())
-        if query_embedding is None:
-            logger.debug("Failed to generate query embedding")
-            return None
-
-        artifact_embedding = await self.provider.get_embedding(artifact_text)
-        if artifact_embedding is None:
-            logger.debug("Failed to generate artifact embedding")
-            return None
-
-        # Compute cosine similarity
-        similarity = self._cosine_similarity(query_embedding, artifact_embedding)
-
-        # Scale to 0-100 range
-        score = similarity * 100.0
-
-        # Clamp to min/max range
-        score = max(self.min_score, min(self.max_score, score))
-
-        return round(score, 2)
+        results = await self.score_all(query, [artifact])
+        return results[0][1]
 
     async def score_all(
         self, query: str, artifacts: List[ArtifactMetadata]
     ) -> List[Tuple[ArtifactMetadata, Optional[float]]]:
         """Score all artifacts semantically.
 
+        The query is embedded once.  Artifact embeddings are looked up in the
+        vector store by content hash; only texts without a stored embedding
+        are sent to the provider, in a single ``get_embeddings`` batch.  All
+        similarities are then computed together by the store.
+
         Args:
             query: User search query
             artifacts: List of artifact metadata objects
@@ -180,13 +161,76 @@ class SemanticScorer:
             ...     if score is not None:
             ...         print(f"{artifact.title}: {score:.1f}%")
         """
-        results = []
-        for artifact in artifacts:
-            score = await self.score_artifact(query, artifact)
-            results.append((artifact, score))
+        unscored: List[Tuple[ArtifactMetadata, Optional[float]]] = [
+            (artifact, None) for artifact in artifacts
+        ]
+        if not self.is_available():
+            logger.debug("Semantic scorer unavailable, returning None")
+            return unscored
+
+        if not query or not query.strip():
+            logger.warning("Empty query provided")
+            return unscored
+
+        texts = [self._get_artifact_text(artifact) for artifact in artifacts]
+        for artifact, text in zip(artifacts, texts):
+            if not text:
+                logger.warning(f"No description for artifact: {artifact.title}")
+
+        # Generate query embedding
+        query_embedding = await self.provider.get_embedding(query.strip())
+        if query_embedding is None:
+            logger.debug("Failed to generate query embedding")
+            return unscored
+
+        store = self._get_store(len(query_embedding))
+        unique_texts = list(dict.fromkeys(text for text in texts if text))
+        rows = store.lookup(unique_texts)
+        missing = [text for text, row in zip(unique_texts, rows) if row is None]
+        if missing:
+            vectors = await self.provider.get_embeddings(missing)
+            store.add(missing, vectors)
+            rows = store.lookup(unique_texts)
+            failed = sum(1 for vector in vectors if vector is None)
+            if failed:
+                logger.debug(f"Failed to generate {failed} artifact embeddings")
+
+        similarities = dict(
+            zip(unique_texts, store.similarities(query_embedding, rows))
+        )
+
+        results: List[Tuple[ArtifactMetadata, Optional[float]]] = []
+        for artifact, text in zip(artifacts, texts):
+            if not text:
+                results.append((artifact, self.min_score))
+                continue
+            similarity = similarities[text]
+            if similarity is None:
+                results.append((artifact, None))
+                continue
+            # Scale to 0-100 range and clamp to min/max range
+            score = max(self.min_score, min(self.max_score, similarity * 100.0))
+            results.append((artifact, round(score, 2)))
 
         return results
 
+    def _get_store(self, dimension: int) -> VectorStore:
+        """Return the vector store to use for *dimension*-sized embeddings.
+
+        Falls back to an in-memory store when no store was configured or the
+        configured one was built for a different dimension.
+        """
+        if self.vector_store is not None and self.vector_store.dimension == dimension:
+            return self.vector_store
+        if self.vector_store is not None:
+            logger.warning(
+                f"Vector store dimension {self.vector_store.dimension} does not "
+                f"match embedding dimension {dimension}; using in-memory store"
+            )
+        if self._memory_store is None or self._memory_store.dimension != dimension:
+            self._memory_store = VectorStore(self.provider.get_model_id(), dimension)
+        return self._memory_store
+
     def _get_artifact_text(self, artifact: ArtifactMetadata) -> str:
         """Extract text from artifact for embedding.
 
@@ -22,7 +22,9 @@ Example:
 import asyncio
 import logging
 import time
-from typing import List, Tuple
+from dataclasses import asdict
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from skillmeat.core.artifact import ArtifactMetadata
 from skillmeat.core.scoring.exceptions import (
@@ -35,8 +37,12 @@ from skillmeat.core.scoring.match_analyzer import MatchAnalyzer
 from skillmeat.core.scoring.models import ArtifactScore, ScoringResult
 from skillmeat.core.scoring.semantic_scorer import SemanticScorer
 from skillmeat.core.scoring.utils import with_timeout
+from skillmeat.core.scoring.vector_store import DEFAULT_VECTOR_STORE_DIR, VectorStore
 from skillmeat.observability.tracing import trace_operation
 
+if TYPE_CHECKING:
+    from skillmeat.cache.match_cache import MatchResultCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -49,6 +55,7 @@ class ScoringService:
     - Graceful degradation to keyword-only when embeddings fail
     - Timeout handling with configurable thresholds
     - Detailed metadata about degradation for UI feedback
+    - Optional reuse of earlier results through a ``MatchResultCache``
 
     The service prefers semantic scoring but will transparently fall back
     to keyword-based scoring if:
@@ -89,6 +96,8 @@ class ScoringService:
         enable_semantic: bool = True,
         semantic_timeout: float = 5.0,
         fallback_to_keyword: bool = True,
+        vector_store: Optional[VectorStore] = None,
+        result_cache: Optional["MatchResultCache"] = None,
     ):
         """Initialize scoring service.
 
@@ -97,6 +106,11 @@ class ScoringService:
             enable_semantic: Whether to attempt semantic scoring (default: True)
             semantic_timeout: Timeout for semantic scoring in seconds (default: 5.0)
             fallback_to_keyword: Whether to fall back to keyword on failure (default: True)
+            vector_store: Store for artifact embeddings.  Defaults to a
+                persistent store under ``~/.skillmeat/vectors`` when the default
+                embedder is used, and to an in-memory store otherwise.
+            result_cache: Cache of finished results keyed by query, collection
+                content and scorer configuration (default: no caching)
 
         Example:
             >>> # With custom embedder
@@ -112,16 +126,26 @@ class ScoringService:
         # Initialize embedder if not provided
         if embedder is None and enable_semantic:
             embedder = SentenceTransformerEmbedder()
+            if vector_store is None:
+                # Files are only created once the first embedding is stored.
+                vector_store = VectorStore(
+                    embedder.get_model_id(),
+                    embedder.get_embedding_dimension(),
+                    root=DEFAULT_VECTOR_STORE_DIR,
+                )
 
         # Initialize scorers
         self.semantic_scorer = (
-            SemanticScorer(embedder) if embedder and enable_semantic else None
+            SemanticScorer(embedder, vector_store=vector_store)
+            if embedder and enable_semantic
+            else None
         )
         self.keyword_scorer = MatchAnalyzer()
 
         self.enable_semantic = enable_semantic
         self.semantic_timeout = semantic_timeout
         self.fallback_to_keyword = fallback_to_keyword
+        self.result_cache = result_cache
 
     @property
     def semantic_available(self) -> bool:
@@ -187,10 +211,23 @@ class ScoringService:
             start_time = time.perf_counter()
             timeout_seconds = timeout if timeout is not None else self.semantic_timeout
 
+            cache_request = self._cache_request(query, artifacts)
+            if cache_request is not None:
+                cached = self._cache_get(cache_request[0])
+                if cached is not None:
+                    cached.duration_ms = (time.perf_counter() - start_time) * 1000
+                    span.set_attribute("scoring.cache_hit", True)
+                    span.set_attribute("scoring.used_semantic", cached.used_semantic)
+                    span.set_attribute("scoring.degraded", cached.degraded)
+                    return cached
+
             # Default to keyword scoring
             used_semantic = False
             degraded = False
             degradation_reason = None
+            # Timeouts and embedding errors are transient; results degraded by
+            # them are not cached.
+            cacheable = True
 
             # Try semantic scoring if enabled
             if self.enable_semantic and self.semantic_available:
@@ -210,6 +247,7 @@ class ScoringService:
                     else:
                         # Timeout occurred, use fallback
                         degraded = True
+                        cacheable = False
                         degradation_reason = (
                             f"Semantic scoring timed out after {timeout_seconds}s"
                         )
@@ -221,6 +259,7 @@ class ScoringService:
                         raise
 
                     degraded = True
+                    cacheable = False
                     degradation_reason = f"Embedding service unavailable: {str(e)}"
                     logger.warning(degradation_reason)
                     scores = self._score_keyword(query, artifacts)
@@ -231,6 +270,7 @@ class ScoringService:
                         raise
 
                     degraded = True
+                    cacheable = False
                     degradation_reason = str(e)
                     logger.warning(degradation_reason)
                     scores = self._score_keyword(query, artifacts)
@@ -243,6 +283,7 @@ class ScoringService:
                         raise
 
                     degraded = True
+                    cacheable = False
                     degradation_reason = f"Semantic scoring error: {str(e)}"
                     scores = self._score_keyword(query, artifacts)
 
@@ -267,7 +308,7 @@ class ScoringService:
             if degraded and degradation_reason:
                 span.add_event("scoring.degraded", {"reason": degradation_reason})
 
-            return ScoringResult(
+            result = ScoringResult(
                 scores=scores,
                 used_semantic=used_semantic,
                 degraded=degraded,
@@ -275,6 +316,100 @@ class ScoringService:
                 duration_ms=duration_ms,
                 query=query,
             )
+            if cache_request is not None and cacheable:
+                self._cache_put(cache_request, result)
+            return result
+
+    # ------------------------------------------------------------------
+    # Result cache
+    # ------------------------------------------------------------------
+
+    def _cache_config(self) -> Dict[str, Any]:
+        """Return the scorer configuration that results depend on."""
+        semantic = self.enable_semantic and self.semantic_available
+        model_id = None
+        if semantic and self.semantic_scorer is not None:
+            model_id = self.semantic_scorer.provider.get_model_id()
+        return {
+            "semantic": semantic,
+            "model": model_id,
+            "fallback": self.fallback_to_keyword,
+            "field_weights": self.keyword_scorer.field_weights,
+            "schema": ArtifactScore.__dataclass_fields__["schema_version"].default,
+        }
+
+    def _cache_request(
+        self, query: str, artifacts: List[Tuple[str, ArtifactMetadata]]
+    ) -> Optional[Tuple[str, str, Tuple[str, str]]]:
+        """Return ``(key, normalized_query, (scope, version))`` or None.
+
+        ScoringService applies no project context boost, so the context part
+        of the key is always empty here.
+        """
+        if self.result_cache is None:
+            return None
+        from skillmeat.cache.match_cache import (
+            collection_fingerprint,
+            normalize_query,
+        )
+
+        try:
+            normalized = normalize_query(query)
+            collection = collection_fingerprint(artifacts)
+            key = self.result_cache.build_key(
+                normalized, collection[1], self._cache_config()
+            )
+        except Exception as e:
+            logger.warning(f"Match result cache key could not be built: {e}")
+            return None
+        return key, normalized, collection
+
+    def _cache_get(self, key: str) -> Optional[ScoringResult]:
+        """Return the cached result for *key*, or None (cache errors are ignored)."""
+        try:
+            payload = self.result_cache.get(key)
+        except Exception as e:
+            logger.warning(f"Match result cache lookup failed: {e}")
+            return None
+        if payload is None:
+            return None
+        scores = []
+        for score in payload["scores"]:
+            if score.get("last_updated"):
+                last_updated = datetime.fromisoformat(score["last_updated"])
+                score = {**score, "last_updated": last_updated}
+            scores.append(ArtifactScore(**score))
+        return ScoringResult(
+            scores=scores,
+            used_semantic=payload["used_semantic"],
+            degraded=payload["degraded"],
+            degradation_reason=payload["degradation_reason"],
+            duration_ms=0.0,
+            query=payload["query"],
+        )
+
+    def _cache_put(
+        self, request: Tuple[str, str, Tuple[str, str]], result: ScoringResult
+    ) -> None:
+        """Store *result* in the cache (cache errors are logged, not raised)."""
+        key, normalized, collection = request
+        scores = []
+        for score in result.scores:
+            data = asdict(score)
+            if data["last_updated"] is not None:
+                data["last_updated"] = data["last_updated"].isoformat()
+            scores.append(data)
+        payload = {
+            "scores": scores,
+            "used_semantic": result.used_semantic,
+            "degraded": result.degraded,
+            "degradation_reason": result.degradation_reason,
+            "query": result.query,
+        }
+        try:
+            self.result_cache.put(key, normalized, collection, payload)
+        except Exception as e:
+            logger.warning(f"Match result cache store failed: {e}")
 
     async def _score_semantic(
         self, query: str, artifacts: List[Tuple[str, ArtifactMetadata]]
@@ -294,11 +429,13 @@ class ScoringService:
         if self.semantic_scorer is None:
             raise EmbeddingServiceUnavailable("Semantic scorer not initialized")
 
-        results = []
-        for name, metadata in artifacts:
-            # Score artifact semantically
-            match_score = await self.semantic_scorer.score_artifact(query, metadata)
+        # Embed and score all artifacts in one batch
+        scored = await self.semantic_scorer.score_all(
+            query, [metadata for _, metadata in artifacts]
+        )
 
+        results = []
+        for (name, _), (_, match_score) in zip(artifacts, scored):
             if match_score is None:
                 # Semantic scoring failed for this artifact
                 raise EmbeddingServiceUnavailable(
@@ -9,7 +9,12 @@ used by the similarity scoring pipeline:
   stop-word filtering, inspired by BM25 term-frequency weighting, for
   comparing longer description strings where content matters more than length.
 
-Neither function requires external dependencies beyond the Python standard
+For scoring one description against many, ``BM25Index`` builds the
+vocabulary, term frequencies and IDF once over a whole corpus (a collection
+or catalog) and scores a query against every document in a single pass over
+the query terms' postings.
+
+None of these require external dependencies beyond the Python standard
 library.
 """
 
@@ -17,7 +22,7 @@ from __future__ import annotations
 
 import math
 from collections import Counter
-from typing import FrozenSet
+from typing import FrozenSet, Iterable, Optional
 
 # ---------------------------------------------------------------------------
 # Stop-word list (domain-aware)
@@ -316,3 +321,207 @@ def bm25_description_similarity(desc_a: str, desc_b: str) -> float:
         return 0.0
 
     return min(1.0, raw_score / max_score)
+
+
+# ---------------------------------------------------------------------------
+# Corpus-level BM25 index
+# ---------------------------------------------------------------------------
+
+
+def _saturate(tf: int, norm_len: float) -> float:
+    """BM25 term-frequency saturation for *tf* at length norm *norm_len*."""
+    return (tf * (_BM25_K1 + 1)) / (tf + _BM25_K1 * norm_len)
+
+
+class BM25Index:
+    """BM25 index over a corpus of descriptions with shared statistics.
+
+    The corpus is tokenised once with the same rules as
+    ``bm25_description_similarity``.  The term-document matrix is stored
+    column-wise as postings: for every vocabulary term, the indices of the
+    documents containing it and the term's precomputed BM25 weight in each.
+    Scoring a query therefore touches only the postings of the query's terms
+    — a sparse matrix-vector product — instead of re-tokenising and
+    re-scoring every candidate pair.
+
+    IDF is the smoothed BM25 IDF over the real corpus,
+    ``log(1 + (N - df + 0.5) / (df + 0.5))``, and document length
+    normalisation uses the corpus average length.  Directional scores are
+    normalised by the query's self-score, as in
+    ``bm25_description_similarity``, and clamped to ``[0.0, 1.0]``.
+
+    Parameters
+    ----------
+    documents:
+        Corpus texts.  Duplicate texts are indexed (and counted towards
+        document frequencies) once per occurrence; lookups by text resolve to
+        the first occurrence.
+
+    Examples
+    --------
+    >>> index = BM25Index(["render charts from csv data", "lint python code"])
+    >>> scores = index.similarities("render csv charts")
+    >>> scores[0] > scores[1]
+    True
+    >>> index.similarity("lint python code", "lint python code")
+    1.0
+    """
+
+    def __init__(self, documents: Iterable[str]) -> None:
+        self._vocab: dict[str, int] = {}
+        self._doc_ids: dict[str, int] = {}
+        self._doc_tokens: list[tuple[str, ...]] = []
+        postings: list[list[tuple[int, int]]] = []
+
+        for doc_id, text in enumerate(documents):
+            tokens = tuple(_tokenize(text or ""))
+            self._doc_tokens.append(tokens)
+            self._doc_ids.setdefault(text or "", doc_id)
+            for term, tf in Counter(tokens).items():
+                term_id = self._vocab.get(term)
+                if term_id is None:
+                    term_id = self._vocab[term] = len(postings)
+                    postings.append([])
+                postings[term_id].append((doc_id, tf))
+
+        n_docs = len(self._doc_tokens)
+        total_len = sum(len(tokens) for tokens in self._doc_tokens)
+        self._avg_len = total_len / n_docs if total_len else 1.0
+        self._idf = [
+            math.log(1.0 + (n_docs - len(p) + 0.5) / (len(p) + 0.5)) for p in postings
+        ]
+
+        # Column-wise sparse matrix: per term, document ids and BM25 weights.
+        self._post_docs: list[list[int]] = []
+        self._post_weights: list[list[float]] = []
+        self._self_scores = [0.0] * n_docs
+        for term_id, term_postings in enumerate(postings):
+            idf = self._idf[term_id]
+            docs: list[int] = []
+            weights: list[float] = []
+            for doc_id, tf in term_postings:
+                docs.append(doc_id)
+                weights.append(idf * _saturate(tf, self._norm_len(doc_id)))
+                self._self_scores[doc_id] += idf * _saturate(tf, 1.0)
+            self._post_docs.append(docs)
+            self._post_weights.append(weights)
+
+        self._cached_query: Optional[str] = None
+        self._cached_scores: list[float] = []
+
+    def __len__(self) -> int:
+        return len(self._doc_tokens)
+
+    def _norm_len(self, doc_id: int) -> float:
+        return 1 - _BM25_B + _BM25_B * (len(self._doc_tokens[doc_id]) / self._avg_len)
+
+    def _term_idf(self, term: str) -> float:
+        term_id = self._vocab.get(term)
+        if term_id is not None:
+            return self._idf[term_id]
+        # Unseen term: df = 0 in the current corpus.
+        n_docs = len(self._doc_tokens)
+        return math.log(1.0 + (n_docs + 0.5) / 0.5)
+
+    def scores(self, query: str) -> list[float]:
+        """Return directional similarity of every document to *query*.
+
+        Equivalent to ``bm25_description_similarity(query, doc)`` for each
+        document, but using corpus IDF and average length.
+
+        Parameters
+        ----------
+        query:
+            Query text; it does not have to be part of the corpus.
+
+        Returns
+        -------
+        list[float]
+            Scores in ``[0.0, 1.0]``, aligned with the indexed documents.
+        """
+        return self._score(query, symmetric=False)
+
+    def similarities(self, query: str) -> list[float]:
+        """Return symmetric similarity between *query* and every document.
+
+        Averages ``query → document`` and ``document → query`` scores.  Both
+        directions only involve terms shared with the query, so both are
+        accumulated from the same postings pass.
+
+        Parameters
+        ----------
+        query:
+            Query text; it does not have to be part of the corpus.
+
+        Returns
+        -------
+        list[float]
+            Scores in ``[0.0, 1.0]``, aligned with the indexed documents.
+            Documents identical to the query after tokenisation score
+            ``1.0``.
+        """
+        return self._score(query, symmetric=True)
+
+    def similarity(self, query: str, document: str) -> Optional[float]:
+        """Return the symmetric similarity between *query* and an indexed text.
+
+        Scores for the most recent query are cached, so looking up every
+        candidate for the same query costs one postings pass in total.
+
+        Returns
+        -------
+        float or None
+            Similarity in ``[0.0, 1.0]``, or ``None`` when *document* is not
+            in the index.
+        """
+        doc_id = self._doc_ids.get(document or "")
+        if doc_id is None:
+            return None
+        if query != self._cached_query:
+            self._cached_scores = self.similarities(query)
+            self._cached_query = query
+        return self._cached_scores[doc_id]
+
+    def _score(self, query: str, symmetric: bool) -> list[float]:
+        n_docs = len(self._doc_tokens)
+        forward = [0.0] * n_docs
+        reverse = [0.0] * n_docs
+        tokens = _tokenize(query or "")
+        if not tokens or not n_docs:
+            return forward
+
+        query_tf = Counter(tokens)
+        query_norm = 1 - _BM25_B + _BM25_B * (len(tokens) / self._avg_len)
+        query_self = 0.0
+        for term, tf in query_tf.items():
+            idf = self._term_idf(term)
+            query_self += idf * _saturate(tf, 1.0)
+            term_id = self._vocab.get(term)
+            if term_id is None:
+                continue
+            docs = self._post_docs[term_id]
+            for doc_id, weight in zip(docs, self._post_weights[term_id]):
+                forward[doc_id] += weight
+            if symmetric:
+                query_weight = idf * _saturate(tf, query_norm)
+                for doc_id in docs:
+                    reverse[doc_id] += query_weight
+
+        if query_self <= 0.0:
+            return [0.0] * n_docs
+        for doc_id in range(n_docs):
+            if not forward[doc_id]:
+                continue
+            score = min(1.0, forward[doc_id] / query_self)
+            if symmetric:
+                self_score = self._self_scores[doc_id]
+                back = min(1.0, reverse[doc_id] / self_score) if self_score else 0.0
+                score = (score + back) / 2.0
+            forward[doc_id] = score
+
+        if symmetric:
+            query_tokens = tuple(tokens)
+            for doc_id, doc_tokens in enumerate(self._doc_tokens):
+                if forward[doc_id] and doc_tokens == query_tokens:
+                    forward[doc_id] = 1.0
+        return forward
@@ -0,0 +1,378 @@
+"""Float32 vector store for artifact embeddings.
+
+Embeddings are keyed by the SHA-256 of the embedded text, so an artifact is
+only re-embedded when its text changes, and the store is partitioned by
+model ID and dimension so vectors from different models never mix.
+
+A persistent store keeps two append-only files per model::
+
+    <root>/<model-id>-<dim>/vectors.f32   # row-major little-endian float32
+    <root>/<model-id>-<dim>/keys.bin      # 32-byte SHA-256 digest per row
+
+``vectors.f32`` is memory-mapped for reads, so scoring a query touches the
+stored rows directly instead of deserialising them.  Rows are L2-normalised
+on insert, which turns cosine similarity into a dot product; with numpy
+available (it is whenever ``sentence-transformers`` is installed) scoring all
+requested rows is a single matrix-vector product.  Without numpy the same
+rows are scored through a ``memoryview`` over the mapped file.
+
+Several stores (in one process or many) may share a directory: appends are
+serialised with an exclusive lock on ``<root>/<model-id>-<dim>/.lock``, new
+rows are numbered from the file length at write time, and every operation
+first picks up rows other writers appended since the last one.
+
+Without a ``root`` the store keeps its rows in memory for the lifetime of the
+instance.
+
+Usage:
+    >>> store = VectorStore("all-MiniLM-L6-v2", 384, root=Path("~/.skillmeat/vectors"))
+    >>> rows = store.lookup(texts)
+    >>> missing = [t for t, row in zip(texts, rows) if row is None]
+    >>> store.add(missing, await provider.get_embeddings(missing))
+    >>> scores = store.similarities(query_vector, store.lookup(texts))
+"""
+
+import hashlib
+import logging
+import math
+import mmap
+import operator
+import re
+import sys
+import threading
+from array import array
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as _np
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    _np = None  # type: ignore[assignment]
+
+try:
+    import fcntl as _fcntl
+except ImportError:  # pragma: no cover - Windows
+    _fcntl = None  # type: ignore[assignment]
+
+DEFAULT_VECTOR_STORE_DIR = Path.home() / ".skillmeat" / "vectors"
+
+_KEY_SIZE = 32  # SHA-256 digest
+_FLOAT_SIZE = 4
+_SAFE_NAME_RE = re.compile(r"[^A-Za-z0-9._-]+")
+
+# One lock per store directory, shared by every instance in this process.
+# It covers platforms without fcntl and keeps threads of one process from
+# queueing on the same file lock.
+_path_locks: Dict[Path, threading.Lock] = {}
+_path_locks_guard = threading.Lock()
+
+
+def content_key(text: str) -> bytes:
+    """Return the store key (SHA-256 digest) for *text*."""
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+class VectorStore:
+    """Append-only float32 embedding store keyed by content hash.
+
+    Attributes:
+        model_id: Identifier of the model that produced the vectors.
+        dimension: Length of every stored vector.
+        path: Directory holding the store files, or ``None`` when in memory.
+
+    Example:
+        >>> store = VectorStore("test-model", 3)
+        >>> store.add(["pdf tool"], [[1.0, 0.0, 0.0]])
+        [0]
+        >>> store.similarities([1.0, 0.0, 0.0], store.lookup(["pdf tool"]))
+        [1.0]
+    """
+
+    def __init__(
+        self, model_id: str, dimension: int, root: Optional[Path] = None
+    ) -> None:
+        """Initialize the store.  Files are only opened on first use.
+
+        Args:
+            model_id: Identifier of the embedding model.
+            dimension: Embedding dimensionality.
+            root: Directory under which per-model stores are kept; ``None``
+                keeps vectors in memory.
+        """
+        if dimension <= 0:
+            raise ValueError(f"dimension must be positive, got {dimension}")
+        self.model_id = model_id
+        self.dimension = dimension
+        self.path: Optional[Path] = None
+        if root is not None:
+            safe_name = _SAFE_NAME_RE.sub("_", model_id).strip("_") or "model"
+            self.path = Path(root).expanduser() / f"{safe_name}-{dimension}"
+
+        self._lock = threading.Lock()
+        self._rows: Dict[bytes, int] = {}
+        self._count = 0  # rows in the matrix; keys may repeat across writers
+        self._memory = bytearray()
+        self._mmap: Optional[mmap.mmap] = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._sync()
+            return len(self._rows)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def lookup(self, texts: Sequence[str]) -> List[Optional[int]]:
+        """Return the row of each text's stored vector, or ``None`` if absent.
+
+        Args:
+            texts: Texts whose embeddings are wanted.
+
+        Returns:
+            Row indices aligned with *texts*.
+        """
+        with self._lock:
+            self._sync()
+            return [self._rows.get(content_key(text)) for text in texts]
+
+    def add(
+        self, texts: Sequence[str], vectors: Sequence[Optional[Sequence[float]]]
+    ) -> List[Optional[int]]:
+        """Store embeddings for *texts* and return their rows.
+
+        Texts that are already stored keep their existing row; ``None``
+        vectors (failed embeddings) are skipped.
+
+        Args:
+            texts: Embedded texts.
+            vectors: Embeddings aligned with *texts*.
+
+        Returns:
+            Row indices aligned with *texts* (``None`` where skipped).
+
+        Raises:
+            ValueError: If a vector has the wrong dimension.
+        """
+        if len(texts) != len(vectors):
+            raise ValueError(
+                f"texts and vectors differ in length: {len(texts)} != {len(vectors)}"
+            )
+
+        with self._lock, self._file_lock(create=True):
+            self._refresh()
+            result: List[Optional[int]] = []
+            new_keys = bytearray()
+            new_vectors = array("f")
+            for text, vector in zip(texts, vectors):
+                if vector is None:
+                    result.append(None)
+                    continue
+                if len(vector) != self.dimension:
+                    raise ValueError(
+                        f"Expected {self.dimension}-dimensional vector, "
+                        f"got {len(vector)}"
+                    )
+                key = content_key(text)
+                row = self._rows.get(key)
+                if row is None:
+                    row = self._rows[key] = self._count
+                    self._count += 1
+                    new_keys += key
+                    new_vectors.extend(_normalise(vector))
+                result.append(row)
+
+            if new_keys:
+                if sys.byteorder != "little":  # pragma: no cover
+                    new_vectors.byteswap()
+                self._append(bytes(new_keys), new_vectors.tobytes())
+            return result
+
+    def similarities(
+        self, query: Sequence[float], rows: Sequence[Optional[int]]
+    ) -> List[Optional[float]]:
+        """Return the cosine similarity of *query* to each stored row.
+
+        Negative similarities are clamped to ``0.0``, matching
+        ``SemanticScorer._cosine_similarity``.
+
+        Args:
+            query: Query embedding.
+            rows: Row indices from :meth:`lookup` / :meth:`add`.
+
+        Returns:
+            Similarities in ``[0.0, 1.0]`` aligned with *rows*; ``None`` where
+            the row is ``None``.
+
+        Raises:
+            ValueError: If the query has the wrong dimension.
+        """
+        if len(query) != self.dimension:
+            raise ValueError(
+                f"Vector dimension mismatch: {len(query)} != {self.dimension}"
+            )
+        q = _normalise(query)
+        present = [row for row in rows if row is not None]
+
+        with self._lock:
+            self._sync()
+            buffer = self._buffer()
+            if present:
+                scores = iter(self._dot_rows(buffer, q, present))
+            else:
+                scores = iter(())
+            return [
+                None if row is None else max(0.0, min(1.0, next(scores)))
+                for row in rows
+            ]
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _dot_rows(self, buffer, query: List[float], rows: List[int]) -> List[float]:
+        """Dot *query* with the given rows of the row-major matrix in *buffer*."""
+        dim = self.dimension
+        count = self._count
+        if _np is not None:
+            matrix = _np.frombuffer(buffer, dtype="<f4", count=count * dim)
+            matrix = matrix.reshape(count, dim)
+            product = matrix[_np.asarray(rows)] @ _np.asarray(query, dtype="<f4")
+            del matrix
+            return [float(v) for v in product]
+
+        if sys.byteorder == "little":
+            with memoryview(buffer) as raw, raw[: count * dim * _FLOAT_SIZE].cast(
+                "f"
+            ) as view:
+                return [
+                    sum(map(operator.mul, view[row * dim : (row + 1) * dim], query))
+                    for row in rows
+                ]
+        values = array("f", bytes(buffer[: count * dim * _FLOAT_SIZE]))  # pragma: no cover
+        values.byteswap()  # pragma: no cover
+        return [  # pragma: no cover
+            sum(map(operator.mul, values[row * dim : (row + 1) * dim], query))
+            for row in rows
+        ]
+
+    def _buffer(self):
+        if self.path is None:
+            return self._memory
+        return self._mmap if self._mmap is not None else b""
+
+    def _files(self):
+        assert self.path is not None
+        return self.path / "vectors.f32", self.path / "keys.bin"
+
+    @contextmanager
+    def _file_lock(self, create: bool = False) -> Iterator[bool]:
+        """Hold the store's exclusive lock; yields ``False`` if it has no files.
+
+        The lock file lives in the store directory, which is only created when
+        *create* is set (i.e. before the first append).
+        """
+        if self.path is None:
+            yield True
+            return
+        if create:
+            self.path.mkdir(parents=True, exist_ok=True)
+        elif not self.path.is_dir():
+            yield False
+            return
+
+        with _path_locks_guard:
+            path_lock = _path_locks.setdefault(self.path, threading.Lock())
+        with path_lock, (self.path / ".lock").open("a+b") as fh:
+            if _fcntl is not None:
+                _fcntl.flock(fh.fileno(), _fcntl.LOCK_EX)
+            try:
+                yield True
+            finally:
+                if _fcntl is not None:
+                    _fcntl.flock(fh.fileno(), _fcntl.LOCK_UN)
+
+    def _sync(self) -> None:
+        """Pick up rows appended to the files since the last operation."""
+        with self._file_lock() as present:
+            if present:
+                self._refresh()
+
+    def _refresh(self) -> None:
+        """Read keys past ``self._count``.  Caller holds :meth:`_file_lock`."""
+        if self.path is None:
+            return
+        vectors_file, keys_file = self._files()
+        if not keys_file.exists() or not vectors_file.exists():
+            return
+
+        row_size = self.dimension * _FLOAT_SIZE
+        keys_size = keys_file.stat().st_size
+        vectors_size = vectors_file.stat().st_size
+        count = min(keys_size // _KEY_SIZE, vectors_size // row_size)
+        # Appends run under the file lock, so a length mismatch seen while
+        # holding it was left by an interrupted append; drop the unmatched
+        # tail so rows and keys stay aligned.
+        if keys_size != count * _KEY_SIZE:
+            with keys_file.open("r+b") as fh:
+                fh.truncate(count * _KEY_SIZE)
+        if vectors_size != count * row_size:
+            with vectors_file.open("r+b") as fh:
+                fh.truncate(count * row_size)
+            logger.warning(
+                f"VectorStore: truncated {vectors_file} to {count} complete rows"
+            )
+        if count <= self._count:
+            return
+
+        with keys_file.open("rb") as fh:
+            fh.seek(self._count * _KEY_SIZE)
+            keys = fh.read((count - self._count) * _KEY_SIZE)
+        for offset, row in enumerate(range(self._count, count)):
+            key = keys[offset * _KEY_SIZE : (offset + 1) * _KEY_SIZE]
+            self._rows.setdefault(key, row)
+        logger.debug(
+            f"VectorStore: loaded {count - self._count} vectors from {self.path}"
+        )
+        self._count = count
+        self._remap()
+
+    def _append(self, keys: bytes, vectors: bytes) -> None:
+        """Append rows.  Caller holds :meth:`_file_lock`."""
+        if self.path is None:
+            self._memory += vectors
+            return
+
+        vectors_file, keys_file = self._files()
+        # Vectors first: a crash between the writes leaves extra vector bytes,
+        # which _refresh() trims, never keys without vectors.
+        with vectors_file.open("ab") as fh:
+            fh.write(vectors)
+        with keys_file.open("ab") as fh:
+            fh.write(keys)
+        self._remap()
+
+    def _remap(self) -> None:
+        vectors_file, _ = self._files()
+        old = self._mmap
+        self._mmap = None
+        if old is not None:
+            try:
+                old.close()
+            except BufferError:  # pragma: no cover - views still exported
+                pass
+        if not vectors_file.exists() or vectors_file.stat().st_size == 0:
+            return
+        with vectors_file.open("rb") as fh:
+            self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _normalise(vector: Sequence[float]) -> List[float]:
+    """Return *vector* scaled to unit length (zero vectors are unchanged)."""
+    norm = math.sqrt(sum(v * v for v in vector))
+    if norm == 0.0:
+        return [float(v) for v in vector]
+    return [float(v) / norm for v in vector]
@@ -6,7 +6,9 @@ module-based filtering via selectors, and markdown generation grouped by
 memory type with confidence annotations.
 
 Key Features:
-    - Token estimation for budget-aware packing
+    - Token counting via a pluggable local tokenizer, cached per item content
+    - Greedy (confidence order) or knapsack (value-per-token) budget selection
+    - Memoized pack generation keyed by the candidate items' version stamps
     - Preview mode (read-only selection without markdown generation)
     - Full generation mode with grouped markdown output
     - Module selector application (type, confidence, file pattern filtering)
@@ -29,13 +31,24 @@ Usage:
 from __future__ import annotations
 
 import fnmatch
+import json
 import logging
+import math
+import threading
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from skillmeat.cache.models import Artifact, get_session
 from skillmeat.core.services.context_module_service import ContextModuleService
 from skillmeat.core.services.memory_service import MemoryService
+from skillmeat.core.services.tokenizers import (
+    HeuristicTokenizer,
+    Tokenizer,
+    content_digest,
+    get_tokenizer,
+    token_count_cache,
+)
 from skillmeat.observability.tracing import trace_operation
 
 # Configure logging
@@ -44,6 +57,22 @@ logger = logging.getLogger(__name__)
 # Statuses considered includable in context packs
 _INCLUDABLE_STATUSES = frozenset({"active", "stable"})
 
+# Budget selection strategies
+SELECTION_GREEDY = "greedy"
+SELECTION_KNAPSACK = "knapsack"
+_VALID_SELECTION_MODES = frozenset({SELECTION_GREEDY, SELECTION_KNAPSACK})
+
+# Upper bound on knapsack DP table cells (items x budget units). Larger
+# problems round token weights up to coarser units, which keeps the
+# selection within budget at a small loss of optimality.
+_KNAPSACK_MAX_CELLS = 250_000
+
+# Tiny per-item value so zero-confidence items still fill spare budget
+_KNAPSACK_COVERAGE_EPSILON = 1e-6
+
+# Maximum number of memoized generate_pack results (process-wide)
+_PACK_MEMO_MAX_ENTRIES = 256
+
 # Display order for memory type sections in generated markdown
 _TYPE_DISPLAY_ORDER = [
     "context_entity",
@@ -80,18 +109,28 @@ class ContextPackerService:
     Attributes:
         memory_service: MemoryService for memory item access
         module_service: ContextModuleService for module and selector access
+        tokenizer: Tokenizer used for item token counts
     """
 
-    def __init__(self, db_path: str):
+    tokenizer: Tokenizer = HeuristicTokenizer()
+
+    def __init__(self, db_path: str, tokenizer: Optional[Tokenizer] = None):
         """Initialize ContextPackerService.
 
         Args:
             db_path: Path to the SQLite database file.
+            tokenizer: Tokenizer for item token counts. Defaults to the one
+                selected by ``SKILLMEAT_CONTEXT_TOKENIZER`` (heuristic if unset).
         """
         self.memory_service = MemoryService(db_path=db_path)
         self.module_service = ContextModuleService(db_path=db_path)
+        self.tokenizer = tokenizer or get_tokenizer()
         self._db_path = db_path
-        logger.info("ContextPackerService initialized (db_path=%s)", db_path)
+        logger.info(
+            "ContextPackerService initialized (db_path=%s, tokenizer=%s)",
+            db_path,
+            self.tokenizer.name,
+        )
 
     # =========================================================================
     # Token Estimation
@@ -115,6 +154,21 @@ class ContextPackerService:
             return 0
         return max(1, len(text) // 4)
 
+    def count_tokens(self, text: str, digest: Optional[str] = None) -> int:
+        """Count tokens with the configured tokenizer, using the shared cache.
+
+        Counts are cached process-wide keyed by (tokenizer, content digest),
+        so repeated packs over the same memory items never re-tokenize.
+
+        Args:
+            text: The text to count tokens for.
+            digest: Precomputed ``content_digest(text)``, if already known.
+
+        Returns:
+            Token count (0 for empty text).
+        """
+        return token_count_cache.count(self.tokenizer, text, digest)
+
     # =========================================================================
     # Pack Composition
     # =========================================================================
@@ -125,11 +179,12 @@ class ContextPackerService:
         module_id: Optional[str] = None,
         budget_tokens: int = 4000,
         filters: Optional[Dict[str, Any]] = None,
+        selection_mode: str = SELECTION_GREEDY,
     ) -> Dict[str, Any]:
         """Preview what a context pack would contain without generating markdown.
 
         Performs read-only selection of memory items based on module selectors,
-        additional filters, and token budget constraints. Items are selected
+        additional filters, and token budget constraints. Candidates are ranked
         by confidence (descending) then recency (descending).
 
         Args:
@@ -141,11 +196,19 @@ class ContextPackerService:
             filters: Optional additional filters dict. Supported keys:
                 - ``type`` (str): Filter to a single memory type.
                 - ``min_confidence`` (float): Minimum confidence threshold.
+            selection_mode: ``"greedy"`` (default) takes items in rank order
+                until the first one that does not fit. ``"knapsack"``
+                maximizes total confidence of included items within the
+                budget, preferring high value-per-token items.
 
         Returns:
             Dict with keys: items (list of item preview dicts), total_tokens,
             budget_tokens, utilization, items_included, items_available.
+
+        Raises:
+            ValueError: If selection_mode is not a known strategy.
         """
+        _validate_selection_mode(selection_mode)
         with trace_operation(
             "context_pack.preview",
             project_id=project_id,
@@ -153,64 +216,41 @@ class ContextPackerService:
         ) as span:
             if module_id:
                 span.set_attribute("module_id", module_id)
+            span.set_attribute("selection_mode", selection_mode)
 
             candidates = self._get_candidates(project_id, module_id, filters)
-            items_available = len(candidates)
-            span.set_attribute("items_available", items_available)
-
-            # Select items within budget
-            selected: List[Dict[str, Any]] = []
-            total_tokens = 0
-
-            for item in candidates:
-                tokens = self.estimate_tokens(item["content"])
-                if total_tokens + tokens > budget_tokens:
-                    break
-                selected.append(
-                    {
-                        "id": item["id"],
-                        "type": item["type"],
-                        "content": item["content"],
-                        "confidence": item["confidence"],
-                        "tokens": tokens,
-                    }
-                )
-                total_tokens += tokens
+            span.set_attribute("items_available", len(candidates))
 
-            utilization = total_tokens / budget_tokens if budget_tokens > 0 else 0.0
+            result = self._select_within_budget(
+                candidates, budget_tokens, selection_mode
+            )
 
-            span.set_attribute("items_included", len(selected))
-            span.set_attribute("total_tokens", total_tokens)
-            span.set_attribute("utilization", round(utilization, 3))
+            span.set_attribute("items_included", result["items_included"])
+            span.set_attribute("total_tokens", result["total_tokens"])
+            span.set_attribute("utilization", round(result["utilization"], 3))
 
             logger.info(
                 "Preview pack: %d/%d items, %d/%d tokens (%.1f%% utilization) "
                 "for project=%s",
-                len(selected),
-                items_available,
-                total_tokens,
+                result["items_included"],
+                result["items_available"],
+                result["total_tokens"],
                 budget_tokens,
-                utilization * 100,
+                result["utilization"] * 100,
                 project_id,
                 extra={
                     "project_id": project_id,
                     "module_id": module_id,
-                    "items_included": len(selected),
-                    "items_available": items_available,
-                    "total_tokens": total_tokens,
+                    "items_included": result["items_included"],
+                    "items_available": result["items_available"],
+                    "total_tokens": result["total_tokens"],
                     "budget_tokens": budget_tokens,
-                    "utilization": utilization,
+                    "utilization": result["utilization"],
+                    "selection_mode": selection_mode,
                 },
             )
 
-            return {
-                "items": selected,
-                "total_tokens": total_tokens,
-                "budget_tokens": budget_tokens,
-                "utilization": utilization,
-                "items_included": len(selected),
-                "items_available": items_available,
-            }
+            return result
 
     def generate_pack(
         self,
@@ -218,12 +258,19 @@ class ContextPackerService:
         module_id: Optional[str] = None,
         budget_tokens: int = 4000,
         filters: Optional[Dict[str, Any]] = None,
+        selection_mode: str = SELECTION_GREEDY,
     ) -> Dict[str, Any]:
         """Generate a full context pack with structured markdown output.
 
         Performs the same selection as preview_pack, then additionally
         generates markdown grouped by memory type with confidence annotations.
 
+        Results are memoized process-wide. The memo key covers the request
+        parameters, the tokenizer, and a version stamp of every candidate
+        (id, updated_at, type, confidence, content digest), so a repeated call
+        for the same module returns the cached pack until any candidate
+        changes. Cache hits keep the original ``generated_at``.
+
         Args:
             project_id: Project to build the context pack for.
             module_id: Optional module whose selectors define the filter
@@ -233,12 +280,17 @@ class ContextPackerService:
             filters: Optional additional filters dict. Supported keys:
                 - ``type`` (str): Filter to a single memory type.
                 - ``min_confidence`` (float): Minimum confidence threshold.
+            selection_mode: ``"greedy"`` or ``"knapsack"`` (see preview_pack).
 
         Returns:
             Dict with all preview_pack keys plus:
                 - ``markdown`` (str): Formatted markdown context pack.
                 - ``generated_at`` (str): ISO 8601 timestamp of generation.
+
+        Raises:
+            ValueError: If selection_mode is not a known strategy.
         """
+        _validate_selection_mode(selection_mode)
         with trace_operation(
             "context_pack.generate",
             project_id=project_id,
@@ -246,9 +298,35 @@ class ContextPackerService:
         ) as span:
             if module_id:
                 span.set_attribute("module_id", module_id)
+            span.set_attribute("selection_mode", selection_mode)
+
+            candidates = self._get_candidates(project_id, module_id, filters)
+            digests = [content_digest(item.get("content") or "") for item in candidates]
+            memo_key = _pack_memo_key(
+                db_path=getattr(self, "_db_path", None),
+                project_id=project_id,
+                module_id=module_id,
+                budget_tokens=budget_tokens,
+                filters=filters,
+                selection_mode=selection_mode,
+                tokenizer_name=self.tokenizer.name,
+                candidates=candidates,
+                digests=digests,
+            )
+
+            cached = _pack_memo.get(memo_key)
+            span.set_attribute("memo_hit", cached is not None)
+            if cached is not None:
+                logger.debug(
+                    "Generated pack memo hit for project=%s module=%s",
+                    project_id,
+                    module_id,
+                )
+                return _copy_pack(cached)
 
-            # Get the preview data (selection + stats)
-            result = self.preview_pack(project_id, module_id, budget_tokens, filters)
+            result = self._select_within_budget(
+                candidates, budget_tokens, selection_mode, digests
+            )
 
             # Generate markdown from the selected items
             markdown = self._generate_markdown(result["items"])
@@ -256,6 +334,7 @@ class ContextPackerService:
 
             result["markdown"] = markdown
             result["generated_at"] = generated_at
+            _pack_memo.put(memo_key, _copy_pack(result))
 
             span.set_attribute("markdown_length", len(markdown))
             span.set_attribute("items_included", result["items_included"])
@@ -274,11 +353,80 @@ class ContextPackerService:
                     "items_included": result["items_included"],
                     "total_tokens": result["total_tokens"],
                     "markdown_length": len(markdown),
+                    "selection_mode": selection_mode,
                 },
             )
 
             return result
 
+    def _select_within_budget(
+        self,
+        candidates: List[Dict[str, Any]],
+        budget_tokens: int,
+        selection_mode: str,
+        digests: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Select ranked candidates that fit the token budget.
+
+        Args:
+            candidates: Candidate items in rank order.
+            budget_tokens: Maximum total tokens.
+            selection_mode: ``"greedy"`` or ``"knapsack"``.
+            digests: Optional precomputed content digests aligned with
+                ``candidates``.
+
+        Returns:
+            Preview dict (items, total_tokens, budget_tokens, utilization,
+            items_included, items_available). Selected items keep rank order.
+        """
+        token_counts = [
+            self.count_tokens(
+                item.get("content") or "", digests[i] if digests else None
+            )
+            for i, item in enumerate(candidates)
+        ]
+
+        if selection_mode == SELECTION_KNAPSACK:
+            chosen = _knapsack_select(
+                token_counts,
+                [float(item.get("confidence") or 0.0) for item in candidates],
+                budget_tokens,
+            )
+        else:
+            chosen = []
+            running = 0
+            for index, tokens in enumerate(token_counts):
+                if running + tokens > budget_tokens:
+                    break
+                chosen.append(index)
+                running += tokens
+
+        selected: List[Dict[str, Any]] = []
+        total_tokens = 0
+        for index in chosen:
+            item = candidates[index]
+            selected.append(
+                {
+                    "id": item["id"],
+                    "type": item["type"],
+                    "content": item["content"],
+                    "confidence": item["confidence"],
+                    "tokens": token_counts[index],
+                }
+            )
+            total_tokens += token_counts[index]
+
+        utilization = total_tokens / budget_tokens if budget_tokens > 0 else 0.0
+
+        return {
+            "items": selected,
+            "total_tokens": total_tokens,
+            "budget_tokens": budget_tokens,
+            "utilization": utilization,
+            "items_included": len(selected),
+            "items_available": len(candidates),
+        }
+
     # =========================================================================
     # Module Selector Application
     # =========================================================================
@@ -665,3 +813,146 @@ def _merge_candidate_groups(
 
     # Ranking inside merged set keeps higher-confidence/newer items earlier.
     return sorted(merged, key=_sort_key_confidence_desc_created_desc)
+
+
+def _validate_selection_mode(selection_mode: str) -> None:
+    if selection_mode not in _VALID_SELECTION_MODES:
+        raise ValueError(
+            f"Invalid selection_mode '{selection_mode}'. "
+            f"Must be one of: {sorted(_VALID_SELECTION_MODES)}"
+        )
+
+
+def _knapsack_select(
+    weights: List[int], values: List[float], capacity: int
+) -> List[int]:
+    """Solve 0/1 knapsack over item token counts; return chosen indices in order.
+
+    Maximizes the summed value (confidence) of included items subject to the
+    summed weight (tokens) staying within ``capacity``. When the DP table
+    would exceed ``_KNAPSACK_MAX_CELLS``, weights are rounded *up* to coarser
+    units so the result never overshoots the budget; a final greedy pass
+    then uses any slack left by the rounding.
+
+    Args:
+        weights: Token count per item.
+        values: Confidence per item.
+        capacity: Token budget.
+
+    Returns:
+        Sorted list of selected item indices.
+    """
+    count = len(weights)
+    if count == 0 or capacity <= 0:
+        return []
+
+    fitting = [i for i in range(count) if weights[i] <= capacity]
+    if not fitting:
+        return []
+
+    scale = max(1, math.ceil(len(fitting) * capacity / _KNAPSACK_MAX_CELLS))
+    units = capacity // scale
+    scaled = {i: -(-weights[i] // scale) for i in fitting}
+
+    best = [0.0] * (units + 1)
+    taken: List[Tuple[int, bytearray]] = []
+    for i in fitting:
+        weight = scaled[i]
+        if weight > units:
+            continue
+        value = max(values[i], 0.0) + _KNAPSACK_COVERAGE_EPSILON
+        take = bytearray(units + 1)
+        for cap in range(units, weight - 1, -1):
+            candidate = best[cap - weight] + value
+            if candidate > best[cap]:
+                best[cap] = candidate
+                take[cap] = 1
+        taken.append((i, take))
+
+    chosen: set[int] = set()
+    cap = units
+    for i, take in reversed(taken):
+        if take[cap]:
+            chosen.add(i)
+            cap -= scaled[i]
+
+    # Use slack left over from weight rounding, in rank order.
+    used = sum(weights[i] for i in chosen)
+    for i in fitting:
+        if i not in chosen and used + weights[i] <= capacity:
+            chosen.add(i)
+            used += weights[i]
+
+    return sorted(chosen)
+
+
+class _PackMemo:
+    """Thread-safe LRU of generated packs keyed by request + version stamps."""
+
+    def __init__(self, max_entries: int = _PACK_MEMO_MAX_ENTRIES):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: tuple, value: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_pack_memo = _PackMemo()
+
+
+def _pack_memo_key(
+    *,
+    db_path: Optional[str],
+    project_id: str,
+    module_id: Optional[str],
+    budget_tokens: int,
+    filters: Optional[Dict[str, Any]],
+    selection_mode: str,
+    tokenizer_name: str,
+    candidates: List[Dict[str, Any]],
+    digests: List[str],
+) -> tuple:
+    """Build the generate_pack memo key from request params and item versions."""
+    version_stamps = tuple(
+        (
+            str(item.get("id")),
+            str(item.get("updated_at") or ""),
+            str(item.get("type")),
+            item.get("confidence"),
+            digest,
+        )
+        for item, digest in zip(candidates, digests)
+    )
+    return (
+        str(db_path),
+        project_id,
+        module_id,
+        budget_tokens,
+        json.dumps(filters or {}, sort_keys=True, default=str),
+        selection_mode,
+        tokenizer_name,
+        version_stamps,
+    )
+
+
+def _copy_pack(pack: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a pack dict so callers cannot mutate memoized state."""
+    copied = dict(pack)
+    copied["items"] = [dict(item) for item in pack["items"]]
+    return copied
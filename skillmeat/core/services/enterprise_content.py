@@ -20,6 +20,9 @@ Design notes
     workflows/<name>/       directory artifact (Workflow)
 
 - Compression: ``gzip`` stdlib only — no third-party deps.
+- Caching: with a :class:`~skillmeat.core.services.enterprise_payload_cache.PayloadCache`
+  the compressed bundle of each ``(artifact, content_hash)`` is built once and
+  served from disk afterwards; cache hits do not touch the artifact's files.
 - Version resolution order (``version`` parameter):
 
     1. ``content_hash`` exact match across all versions of the artifact.
@@ -42,6 +45,20 @@ Usage::
 
     # gzip-compressed bytes ready for a streaming HTTP response
     compressed = service.build_payload("canvas-design", compress=True)
+
+    # With a PayloadCache, the compressed bundle as a file on disk
+    service = EnterpriseContentService(
+        session=db_session,
+        artifact_repo=EnterpriseArtifactRepository(db_session),
+        payload_cache=PayloadCache(),
+    )
+    entry = service.build_payload_file("canvas-design")
+
+    # Streamed per-file delta against a client manifest
+    chunks = service.build_delta(
+        [{"artifact_id": "canvas-design", "content_hash": old_hash,
+          "files": {"SKILL.md": "<sha256>"}}]
+    )
 """
 
 from __future__ import annotations
@@ -52,12 +69,20 @@ import logging
 import os
 import uuid
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from sqlalchemy.orm import Session
 
 from skillmeat.cache.enterprise_repositories import EnterpriseArtifactRepository
 from skillmeat.cache.models_enterprise import EnterpriseArtifactVersion
+from skillmeat.core.enterprise_delta import (
+    STATUS_NOT_FOUND,
+    STATUS_UNCHANGED,
+    STATUS_UPDATED,
+    file_digest,
+    write_delta_archive,
+)
+from skillmeat.core.services.enterprise_payload_cache import CachedPayload, PayloadCache
 from sqlalchemy import select
 
 logger = logging.getLogger(__name__)
@@ -357,6 +382,37 @@ def _read_single_file(path: Path) -> List[FileEntry]:
     ]
 
 
+def _list_files(fs_path: Path) -> List[Tuple[str, Path]]:
+    """Return ``(relative_posix_path, absolute_path)`` for an artifact's files.
+
+    Applies the same exclusions and ordering as :func:`_read_file_tree`
+    without reading any content.  A single-file artifact yields one entry
+    named after the file.  A missing path yields an empty list.
+    """
+    if fs_path.is_file():
+        return [(fs_path.name, fs_path)]
+    if not fs_path.is_dir():
+        return []
+
+    files: List[Tuple[str, Path]] = []
+    for dirpath, dirnames, filenames in os.walk(fs_path, followlinks=True):
+        dirnames[:] = sorted(d for d in dirnames if not _is_excluded(d))
+        for filename in sorted(filenames):
+            if _is_excluded(filename):
+                continue
+            full_path = Path(dirpath) / filename
+            if full_path.is_file():
+                files.append((full_path.relative_to(fs_path).as_posix(), full_path))
+    return sorted(files)
+
+
+def _read_bytes(path: Path) -> bytes:
+    try:
+        return path.read_bytes()
+    except OSError as exc:
+        raise ArtifactFilesystemError(path, exc) from exc
+
+
 # ---------------------------------------------------------------------------
 # EnterpriseContentService
 # ---------------------------------------------------------------------------
@@ -380,6 +436,9 @@ class EnterpriseContentService:
     collection_root:
         Filesystem root of the user's default collection.  Defaults to
         ``~/.skillmeat/collections/default`` when ``None``.
+    payload_cache:
+        Optional process-wide :class:`PayloadCache`.  When set, compressed
+        bundles are cached on disk by artifact and content hash.
 
     Examples
     --------
@@ -402,9 +461,11 @@ class EnterpriseContentService:
         session: Session,
         artifact_repo: EnterpriseArtifactRepository,
         collection_root: Optional[Path] = None,
+        payload_cache: Optional[PayloadCache] = None,
     ) -> None:
         self._session = session
         self._repo = artifact_repo
+        self._payload_cache = payload_cache
         if collection_root is not None:
             self._collection_root = collection_root
         else:
@@ -441,6 +502,10 @@ class EnterpriseContentService:
             return ``bytes``.  When ``False`` (default), return the raw
             ``dict``.
 
+        When a payload cache is configured and the version has a content
+        hash, the compressed bundle is served from (or stored in) the cache
+        instead of being rebuilt from the artifact's files.
+
         Returns
         -------
         ArtifactPayload or bytes
@@ -462,49 +527,174 @@ class EnterpriseContentService:
         artifact = self._resolve_artifact(artifact_id)
         version_row = self._resolve_version(artifact, version)
 
-        # Build the version string included in the payload.
-        resolved_version: str = (
-            version_row.version_tag if version_row is not None else "unknown"
-        )
-        resolved_hash: str = (
-            version_row.content_hash if version_row is not None else ""
-        )
+        entry = self._cached_payload(artifact, version_row)
+        if entry is not None:
+            data = entry.path.read_bytes()
+            return data if compress else json.loads(gzip.decompress(data))
 
-        # Resolve the filesystem path and collect files.
-        fs_path = _resolve_artifact_fs_path(
-            name=artifact.name,
-            artifact_type=artifact.artifact_type,
-            collection_root=self._collection_root,
-            custom_fields=artifact.custom_fields,
-        )
-        files = self._collect_files(fs_path, artifact.artifact_type)
+        payload = self._assemble_payload(artifact, version_row)
+        if compress:
+            return self._compress(payload)
+        return payload
+
+    def build_payload_file(
+        self,
+        artifact_id: str,
+        version: Optional[str] = None,
+    ) -> Optional[CachedPayload]:
+        """Return the cached compressed bundle for an artifact version.
+
+        Builds and stores the bundle on a cache miss.  The returned file
+        holds exactly what ``build_payload(..., compress=True)`` returns, so
+        it can be served directly (including ``Range`` requests).
 
-        payload: ArtifactPayload = {
+        Parameters
+        ----------
+        artifact_id:
+            UUID string or artifact name.
+        version:
+            Optional version specifier (see :meth:`build_payload`).
+
+        Returns
+        -------
+        CachedPayload or None
+            ``None`` when no cache is configured or the resolved version has
+            no content hash; callers then fall back to :meth:`build_payload`.
+
+        Raises
+        ------
+        ArtifactNotFoundError
+            If the artifact does not exist for the current tenant.
+        ArtifactVersionNotFoundError
+            If *version* was specified but no matching version exists.
+        ArtifactFilesystemError
+            If the bundle has to be built and the files cannot be read.
+        """
+        artifact = self._resolve_artifact(artifact_id)
+        version_row = self._resolve_version(artifact, version)
+        return self._cached_payload(artifact, version_row)
+
+    def get_content_hash(
+        self,
+        artifact_id: str,
+        version: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """Resolve an artifact version's content hash without reading files.
+
+        Parameters
+        ----------
+        artifact_id:
+            UUID string or artifact name.
+        version:
+            Optional version specifier (see :meth:`build_payload`).
+
+        Returns
+        -------
+        dict
+            ``artifact_id`` (UUID string), ``version`` and ``content_hash``.
+
+        Raises
+        ------
+        ArtifactNotFoundError
+            If the artifact does not exist for the current tenant.
+        ArtifactVersionNotFoundError
+            If *version* was specified but no matching version exists.
+        """
+        artifact = self._resolve_artifact(artifact_id)
+        version_row = self._resolve_version(artifact, version)
+        return {
             "artifact_id": str(artifact.id),
-            "version": resolved_version,
-            "content_hash": resolved_hash,
-            "metadata": {
-                "name": artifact.name,
-                "type": artifact.artifact_type,
-                "source": artifact.source_url,
-                "description": artifact.description,
-                "tags": artifact.tags,
-                "scope": artifact.scope,
-            },
-            "files": files,
+            "version": version_row.version_tag if version_row is not None else "unknown",
+            "content_hash": version_row.content_hash if version_row is not None else "",
         }
 
+    def build_delta(self, items: List[Dict[str, Any]]) -> Iterator[bytes]:
+        """Build a streamed per-file delta archive for several artifacts.
+
+        Artifacts and versions are resolved, and file hashes compared, before
+        this method returns, so all DB access happens up front.  Content of
+        new or changed files is read while the returned iterator is consumed.
+        The archive layout is described in :mod:`skillmeat.core.enterprise_delta`.
+
+        Parameters
+        ----------
+        items:
+            One dict per artifact with keys ``artifact_id`` (UUID or name),
+            ``content_hash`` (the client's stored hash, may be empty) and
+            ``files`` (the client's ``{path: sha256}`` manifest).
+
+        Returns
+        -------
+        Iterator[bytes]
+            Chunks of the gzip-compressed tar archive.
+
+        Raises
+        ------
+        ArtifactFilesystemError
+            If an artifact's files cannot be read while planning the delta.
+        """
+        entries = []
+        for item in items:
+            artifact_id = item["artifact_id"]
+            header: Dict[str, Any] = {
+                "artifact_id": artifact_id,
+                "status": STATUS_UNCHANGED,
+                "content_hash": "",
+                "version": None,
+                "files": [],
+                "removed": [],
+                "error": None,
+            }
+            try:
+                artifact = self._resolve_artifact(artifact_id)
+                version_row = self._resolve_version(artifact, None)
+            except ArtifactNotFoundError as exc:
+                header.update(status=STATUS_NOT_FOUND, error=str(exc))
+                entries.append((header, []))
+                continue
+
+            header["version"] = (
+                version_row.version_tag if version_row is not None else "unknown"
+            )
+            header["content_hash"] = (
+                version_row.content_hash if version_row is not None else ""
+            )
+            if header["content_hash"] and header["content_hash"] == item.get(
+                "content_hash"
+            ):
+                entries.append((header, []))
+                continue
+
+            fs_path = _resolve_artifact_fs_path(
+                name=artifact.name,
+                artifact_type=artifact.artifact_type,
+                collection_root=self._collection_root,
+                custom_fields=artifact.custom_fields,
+            )
+            known: Dict[str, str] = item.get("files") or {}
+            changed: List[Tuple[str, Path]] = []
+            present = set()
+            for relative, path in _list_files(fs_path):
+                present.add(relative)
+                if known.get(relative) != file_digest(_read_bytes(path)):
+                    changed.append((relative, path))
+
+            header.update(
+                status=STATUS_UPDATED,
+                files=[relative for relative, _ in changed],
+                removed=sorted(set(known) - present),
+            )
+            entries.append(
+                (header, ((relative, _read_bytes(path)) for relative, path in changed))
+            )
+
         logger.info(
-            "Built enterprise content payload: artifact=%s version=%s files=%d compress=%s",
-            artifact.id,
-            resolved_version,
-            len(files),
-            compress,
+            "Built enterprise delta: artifacts=%d updated=%d files=%d",
+            len(entries),
+            sum(1 for header, _ in entries if header["status"] == STATUS_UPDATED),
+            sum(len(header["files"]) for header, _ in entries),
         )
-
-        if compress:
-            return self._compress(payload)
-        return payload
+        return write_delta_archive(entries)
 
     def get_version_list(
         self, artifact_id: str
@@ -646,6 +836,80 @@ class EnterpriseContentService:
             )
         return row
 
+    @staticmethod
+    def _payload_metadata(artifact) -> Dict[str, Any]:
+        """Return the ``metadata`` block of a payload for *artifact*."""
+        return {
+            "name": artifact.name,
+            "type": artifact.artifact_type,
+            "source": artifact.source_url,
+            "description": artifact.description,
+            "tags": artifact.tags,
+            "scope": artifact.scope,
+        }
+
+    def _assemble_payload(
+        self,
+        artifact,  # EnterpriseArtifact
+        version_row: Optional["EnterpriseArtifactVersion"],
+    ) -> ArtifactPayload:
+        """Read the artifact's files and build the uncompressed payload dict."""
+        # Build the version string included in the payload.
+        resolved_version: str = (
+            version_row.version_tag if version_row is not None else "unknown"
+        )
+        resolved_hash: str = (
+            version_row.content_hash if version_row is not None else ""
+        )
+
+        # Resolve the filesystem path and collect files.
+        fs_path = _resolve_artifact_fs_path(
+            name=artifact.name,
+            artifact_type=artifact.artifact_type,
+            collection_root=self._collection_root,
+            custom_fields=artifact.custom_fields,
+        )
+        files = self._collect_files(fs_path, artifact.artifact_type)
+
+        logger.info(
+            "Built enterprise content payload: artifact=%s version=%s files=%d",
+            artifact.id,
+            resolved_version,
+            len(files),
+        )
+        return {
+            "artifact_id": str(artifact.id),
+            "version": resolved_version,
+            "content_hash": resolved_hash,
+            "metadata": self._payload_metadata(artifact),
+            "files": files,
+        }
+
+    def _cached_payload(
+        self,
+        artifact,  # EnterpriseArtifact
+        version_row: Optional["EnterpriseArtifactVersion"],
+    ) -> Optional[CachedPayload]:
+        """Return the cached compressed payload, building it on a miss.
+
+        Returns ``None`` when caching does not apply (no cache configured or
+        no content hash to key on).
+        """
+        if self._payload_cache is None or version_row is None:
+            return None
+        content_hash = version_row.content_hash
+        if not content_hash:
+            return None
+
+        key = PayloadCache.build_key(
+            str(artifact.id), content_hash, self._payload_metadata(artifact)
+        )
+        return self._payload_cache.get_or_build(
+            key,
+            content_hash,
+            lambda: self._compress(self._assemble_payload(artifact, version_row)),
+        )
+
     def _collect_files(
         self, fs_path: Path, artifact_type: str
     ) -> List[FileEntry]:
@@ -0,0 +1,307 @@
+"""On-disk cache of compressed enterprise artifact payloads.
+
+``EnterpriseContentService.build_payload`` walks an artifact's file tree,
+reads every file and gzip-compresses the JSON bundle.  A version identified
+by its ``content_hash`` never changes, so the compressed bundle for
+``(artifact, content_hash)`` can be built once and then served straight from
+disk to every client that syncs it.
+
+Design notes
+------------
+- Entries are immutable.  The key is a SHA-256 over the artifact UUID, the
+  resolved content hash and a digest of the DB metadata embedded in the
+  bundle (name, description, tags, ...), because that metadata can be edited
+  without producing a new version.
+- One file per entry: ``<root>/<key>.json.gz``.  Files are written to a
+  temporary name and moved into place with ``os.replace``, so readers (and
+  other worker processes) never see a partial entry.
+- Size-bounded LRU: a hit touches the file's mtime; after each store the
+  least recently used files are removed until the directory fits within
+  ``max_bytes``.  The entry just stored is never evicted.
+- Single-flight: concurrent misses for the same key in one process wait for
+  a single build instead of each reading and compressing the tree.
+- Versions without a content hash are not cacheable; callers build them
+  directly.
+
+Usage::
+
+    cache = PayloadCache(Path("~/.skillmeat/cache/enterprise-payloads"))
+    entry = cache.get_or_build(key, content_hash, lambda: compressed_bytes)
+    entry.path  # serve with a file response (supports Range requests)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+#: Default directory for cached payloads.
+DEFAULT_PAYLOAD_CACHE_DIR = Path.home() / ".skillmeat" / "cache" / "enterprise-payloads"
+
+#: Default size bound for the cache directory (512 MiB).
+DEFAULT_PAYLOAD_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+_SUFFIX = ".json.gz"
+
+
+class CachedPayload(NamedTuple):
+    """A compressed payload stored in the cache.
+
+    Attributes
+    ----------
+    path:
+        File holding the gzip-compressed JSON bundle.
+    content_hash:
+        Content hash of the cached artifact version.
+    size:
+        Size of *path* in bytes.
+    """
+
+    path: Path
+    content_hash: str
+    size: int
+
+
+class _Flight:
+    """An in-progress build that other callers can wait on."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[CachedPayload] = None
+        self.error: Optional[BaseException] = None
+
+
+class PayloadCache:
+    """Size-bounded LRU directory of precompressed payloads.
+
+    Parameters
+    ----------
+    root:
+        Directory holding the cache files.  Created on first store.
+    max_bytes:
+        Upper bound on the total size of cached files.
+
+    Examples
+    --------
+    >>> cache = PayloadCache(tmp_dir, max_bytes=1024 * 1024)
+    >>> key = PayloadCache.build_key(artifact_uuid, content_hash, metadata)
+    >>> entry = cache.get_or_build(key, content_hash, build)
+    """
+
+    def __init__(
+        self,
+        root: Path = DEFAULT_PAYLOAD_CACHE_DIR,
+        max_bytes: int = DEFAULT_PAYLOAD_CACHE_MAX_BYTES,
+    ) -> None:
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+        self.root = Path(root).expanduser()
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def build_key(artifact_id: str, content_hash: str, metadata: Dict[str, Any]) -> str:
+        """Return the cache key for one artifact version.
+
+        Parameters
+        ----------
+        artifact_id:
+            Artifact UUID string.
+        content_hash:
+            Resolved version content hash.
+        metadata:
+            JSON-serialisable metadata embedded in the payload.
+
+        Returns
+        -------
+        str
+            Hex SHA-256 digest.
+        """
+        data = json.dumps(
+            [artifact_id, content_hash, metadata],
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, content_hash: str) -> Optional[CachedPayload]:
+        """Return the cached entry for *key* and mark it recently used.
+
+        Parameters
+        ----------
+        key:
+            Key from :meth:`build_key`.
+        content_hash:
+            Content hash recorded on the returned entry.
+
+        Returns
+        -------
+        CachedPayload or None
+            ``None`` on a miss.
+        """
+        path = self._path(key)
+        try:
+            size = path.stat().st_size
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except OSError as exc:
+            logger.warning("Payload cache: cannot read %s — %s", path, exc)
+            return None
+        return CachedPayload(path, content_hash, size)
+
+    def get_or_build(
+        self,
+        key: str,
+        content_hash: str,
+        build: Callable[[], bytes],
+    ) -> CachedPayload:
+        """Return the entry for *key*, building and storing it on a miss.
+
+        Only one *build* runs per key at a time within this process; other
+        callers block until it finishes and share its result (or exception).
+
+        Parameters
+        ----------
+        key:
+            Key from :meth:`build_key`.
+        content_hash:
+            Content hash of the artifact version being cached.
+        build:
+            Zero-argument callable returning the compressed payload bytes.
+
+        Returns
+        -------
+        CachedPayload
+            The stored entry.
+
+        Raises
+        ------
+        Exception
+            Whatever *build* raised; nothing is cached in that case.
+        """
+        entry = self.get(key, content_hash)
+        if entry is not None:
+            return entry
+
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            assert flight.result is not None
+            return flight.result
+
+        try:
+            # A previous leader may have stored the entry between our miss
+            # and registering this flight.
+            entry = self.get(key, content_hash)
+            if entry is None:
+                entry = self._store(key, content_hash, build())
+            flight.result = entry
+            return entry
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def clear(self) -> int:
+        """Remove every cached payload.
+
+        Returns
+        -------
+        int
+            Number of files removed.
+        """
+        removed = 0
+        for path in self._entries():
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                continue
+        return removed
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}{_SUFFIX}"
+
+    def _entries(self):
+        if not self.root.is_dir():
+            return []
+        return [p for p in self.root.iterdir() if p.name.endswith(_SUFFIX)]
+
+    def _store(self, key: str, content_hash: str, data: bytes) -> CachedPayload:
+        """Atomically write *data* for *key*, then enforce the size bound."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        fd, tmp_name = tempfile.mkstemp(dir=self.root, prefix=".tmp-", suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
+        evicted = self._evict(keep=path)
+        logger.debug(
+            "Payload cache: stored %s (%d bytes), evicted %d", path.name, len(data), evicted
+        )
+        return CachedPayload(path, content_hash, len(data))
+
+    def _evict(self, keep: Path) -> int:
+        """Remove least recently used files until the cache fits ``max_bytes``."""
+        entries = []
+        total = 0
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            total += stat.st_size
+            if path != keep:
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        evicted = 0
+        for _, size, path in sorted(entries, key=lambda item: item[0]):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as exc:
+                logger.warning("Payload cache: cannot evict %s — %s", path, exc)
+                continue
+            total -= size
+            evicted += 1
+        return evicted
@@ -29,13 +29,32 @@ Quality signals for scoring (confidence 0.55-0.92):
 
 from __future__ import annotations
 
+import contextlib
+import io
 import json
 import logging
 import os
 import re
+import shutil
 import subprocess
+import tempfile
 import time
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from skillmeat.cache.memory_repositories import _compute_content_hash
 
@@ -120,6 +139,22 @@ _ANCHOR_MUTATION_TOOLS = frozenset({"Edit", "Write"})
 _ANCHOR_READ_TOOLS = frozenset({"Read", "Grep", "Glob"})
 _ANCHOR_ALL_TOOLS = _ANCHOR_MUTATION_TOOLS | _ANCHOR_READ_TOOLS
 
+# Message types that never carry extractable content
+_SKIP_MESSAGE_TYPES: frozenset[str] = frozenset(
+    {"progress", "file-history-snapshot", "system", "result"}
+)
+
+# Streaming extraction: messages per processing chunk, and the in-memory
+# threshold before non-seekable input streams spill to a temporary file.
+_STREAM_CHUNK_SIZE = 2000
+_STREAM_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+# A transcript file path or an open binary/text stream.
+TranscriptSource = Union[str, "os.PathLike[str]", IO[bytes], IO[str]]
+
+# (start_index, messages, previous_message, next_message) for one chunk.
+_MessageChunk = Tuple[int, List[Dict[str, Any]], Optional[Dict], Optional[Dict]]
+
 # System reminder markers to filter
 _SYSTEM_MARKERS: frozenset[str] = frozenset(
     {
@@ -314,135 +349,31 @@ class MemoryExtractorService:
                         message_index=message_index,
                         commit_sha=resolved_commit_sha,
                     )
-
-                    effective_session_id = (
-                        provenance_meta.get("session_id")
-                        or session_id
-                        or ""
-                    )
-                    effective_git_branch = provenance_meta.get("git_branch") or ""
-                    effective_git_commit = (
-                        provenance_meta.get("git_commit")
-                        or resolved_commit_sha
-                        or ""
-                    )
-                    effective_agent_type = provenance_meta.get("agent_type")
-                    effective_model = provenance_meta.get("model")
-
-                    # Split each content block into candidate lines
-                    block_lines = [
-                        ln.strip(" -*\t") for ln in content_text.splitlines()
-                    ]
-                    block_lines = [ln for ln in block_lines if len(ln.strip()) >= 24]
-
-                    for line in block_lines:
-                        # Skip noise patterns early (before scoring)
-                        if self._is_noise(line):
-                            continue
-
-                        mem_type = self._classify_type(line)
-                        confidence = self._score(line, mem_type, profile)
-                        if confidence < min_confidence:
-                            continue
-
-                        normalized = line.strip().lower()
-                        if normalized in seen_content:
-                            continue
-                        seen_content.add(normalized)
-
-                        content_hash = _compute_content_hash(line.strip())
-                        duplicate = self.memory_repo.get_by_content_hash(content_hash)
-
-                        # Build provenance: base fields + JSONL message metadata
-                        provenance = {
-                            "source": "memory_extraction",
-                            "format": "jsonl",
-                            "run_id": run_id,
-                            "session_id": effective_session_id,
-                            "commit_sha": effective_git_commit,
-                            "workflow_stage": "extraction",
-                            "classification_method": "heuristic",
-                            "git_branch": effective_git_branch,
-                            "git_commit": effective_git_commit,
-                            "agent_type": effective_agent_type,
-                            "model": effective_model,
-                            "source_type": "extraction",
-                        }
-                        provenance.update(provenance_meta)
-                        provenance.pop("message_index", None)
-                        provenance["session_id"] = effective_session_id
-                        provenance["git_branch"] = effective_git_branch
-                        provenance["git_commit"] = effective_git_commit
-                        provenance["source_type"] = "extraction"
-
-                        candidates.append(
-                            {
-                                "type": mem_type,
-                                "content": line.strip(),
-                                "confidence": round(confidence, 3),
-                                "status": "candidate",
-                                "duplicate_of": duplicate.id if duplicate else None,
-                                "provenance": provenance,
-                                "anchors": anchors,
-                                "git_branch": effective_git_branch,
-                                "git_commit": effective_git_commit,
-                                "session_id": effective_session_id,
-                                "agent_type": effective_agent_type,
-                                "model": effective_model,
-                                "source_type": "extraction",
-                            }
-                        )
-                        logger.debug(
-                            "Built extraction candidate with %d anchors (message_index=%s)",
-                            len(anchors),
-                            message_index,
-                        )
+                    for candidate in self._build_block_candidates(
+                        content_text,
+                        provenance_meta,
+                        anchors,
+                        profile=profile,
+                        min_confidence=min_confidence,
+                        run_id=run_id,
+                        session_id=session_id,
+                        resolved_commit_sha=resolved_commit_sha,
+                    ):
+                        if self._admit_candidate(candidate, seen_content):
+                            candidates.append(candidate)
             else:
                 # Fallback: plain-text line extraction (backward compat)
                 for line in self._iter_candidate_lines(text_corpus):
-                    # Skip noise patterns early (before scoring)
-                    if self._is_noise(line):
-                        continue
-
-                    mem_type = self._classify_type(line)
-                    confidence = self._score(line, mem_type, profile)
-                    if confidence < min_confidence:
-                        continue
-
-                    normalized = line.strip().lower()
-                    if normalized in seen_content:
-                        continue
-                    seen_content.add(normalized)
-
-                    content_hash = _compute_content_hash(line.strip())
-                    duplicate = self.memory_repo.get_by_content_hash(content_hash)
-                    candidates.append(
-                        {
-                            "type": mem_type,
-                            "content": line.strip(),
-                            "confidence": round(confidence, 3),
-                            "status": "candidate",
-                            "duplicate_of": duplicate.id if duplicate else None,
-                            "provenance": {
-                                "source": "memory_extraction",
-                                "format": "plain_text",
-                                "run_id": run_id,
-                                "session_id": session_id or "",
-                                "commit_sha": resolved_commit_sha,
-                                "workflow_stage": "extraction",
-                                "classification_method": "heuristic",
-                                "git_commit": resolved_commit_sha,
-                                "source_type": "extraction",
-                            },
-                            "anchors": [],
-                            "git_branch": "",
-                            "git_commit": resolved_commit_sha,
-                            "session_id": session_id or "",
-                            "agent_type": None,
-                            "model": None,
-                            "source_type": "extraction",
-                        }
+                    candidate = self._build_plain_text_candidate(
+                        line,
+                        profile=profile,
+                        min_confidence=min_confidence,
+                        run_id=run_id,
+                        session_id=session_id,
+                        resolved_commit_sha=resolved_commit_sha,
                     )
+                    if candidate and self._admit_candidate(candidate, seen_content):
+                        candidates.append(candidate)
 
             # Apply LLM classification if classifier is available
             if self._classifier and candidates:
@@ -560,6 +491,390 @@ class MemoryExtractorService:
                 started=started,
             )
 
+    def extract_stream(
+        self,
+        project_id: str,
+        source: TranscriptSource,
+        profile: str = "balanced",
+        min_confidence: float = 0.6,
+        run_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        commit_sha: Optional[str] = None,
+        workers: Optional[int] = None,
+        chunk_size: int = _STREAM_CHUNK_SIZE,
+    ) -> Iterator[Dict[str, Any]]:
+        """Incrementally extract candidates from a transcript file or byte stream.
+
+        Streaming counterpart of :meth:`preview` for large session logs. JSONL
+        lines are decoded one at a time and processed in chunks of
+        ``chunk_size`` messages; each chunk carries its neighbouring messages
+        so that anchor windows spanning a chunk boundary match the
+        whole-corpus result. Memory use is bounded by the chunk size plus the
+        set of already-emitted normalized lines used for de-duplication.
+
+        Candidates are yielded in transcript order. The emitted set is identical
+        to :meth:`preview` for the same input; use :meth:`preview_stream` to get
+        the same confidence-sorted list.
+
+        Args:
+            project_id: Project ID for provenance tracking and duplicate detection.
+            source: Path to a transcript file, or a binary/text stream.
+                Non-seekable streams are spooled to a temporary file so the
+                commit-detection and plain-text fallback passes can rewind.
+            profile: Extraction profile ("strict", "balanced", "aggressive").
+            min_confidence: Minimum confidence score to include candidate.
+            run_id: Optional run ID for provenance tracking.
+            session_id: Optional session ID for provenance.
+            commit_sha: Optional commit SHA for provenance.
+            workers: Number of worker processes used to score chunks. ``None``
+                or ``1`` processes chunks in the calling thread.
+            chunk_size: Number of messages per processing chunk.
+
+        Yields:
+            Candidate dicts with the same shape as :meth:`preview` results.
+
+        Raises:
+            ValueError: If profile is invalid or chunk_size is not positive.
+
+        Example:
+            >>> svc = MemoryExtractorService(db_path=None)
+            >>> for candidate in svc.extract_stream("proj-1", "session.jsonl"):
+            ...     print(candidate["type"], candidate["content"])
+        """
+        self._validate_profile(profile)
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        return self._extract_stream(
+            source,
+            profile=profile,
+            min_confidence=min_confidence,
+            run_id=run_id,
+            session_id=session_id,
+            commit_sha=commit_sha,
+            workers=workers,
+            chunk_size=chunk_size,
+        )
+
+    def preview_stream(
+        self,
+        project_id: str,
+        source: TranscriptSource,
+        profile: str = "balanced",
+        min_confidence: float = 0.6,
+        run_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        commit_sha: Optional[str] = None,
+        workers: Optional[int] = None,
+        chunk_size: int = _STREAM_CHUNK_SIZE,
+    ) -> List[Dict[str, Any]]:
+        """Streaming equivalent of :meth:`preview` for transcript files and streams.
+
+        Collects :meth:`extract_stream` output and applies the same
+        confidence-descending ordering as :meth:`preview`.
+
+        Returns:
+            List of candidate dicts sorted by confidence descending.
+        """
+        candidates = list(
+            self.extract_stream(
+                project_id=project_id,
+                source=source,
+                profile=profile,
+                min_confidence=min_confidence,
+                run_id=run_id,
+                session_id=session_id,
+                commit_sha=commit_sha,
+                workers=workers,
+                chunk_size=chunk_size,
+            )
+        )
+        candidates.sort(key=lambda c: (-c["confidence"], c["content"]))
+        return candidates
+
+    def _extract_stream(
+        self,
+        source: TranscriptSource,
+        *,
+        profile: str,
+        min_confidence: float,
+        run_id: Optional[str],
+        session_id: Optional[str],
+        commit_sha: Optional[str],
+        workers: Optional[int],
+        chunk_size: int,
+    ) -> Iterator[Dict[str, Any]]:
+        started = time.perf_counter()
+        status_label = "success"
+        options = {
+            "profile": profile,
+            "min_confidence": min_confidence,
+            "run_id": run_id,
+            "session_id": session_id,
+        }
+        seen_content: set[str] = set()
+        try:
+            with _open_transcript(source) as stream:
+                start_offset = stream.tell()
+                if _peek_first_significant_byte(stream) == b'"':
+                    # JSON-string-wrapped JSONL cannot be decoded incrementally;
+                    # unwrap it in memory and reuse the whole-corpus parser.
+                    stream.seek(start_offset)
+                    text_corpus = stream.read().decode("utf-8", errors="replace")
+                    yield from self._extract_from_corpus(
+                        text_corpus, commit_sha, options, seen_content
+                    )
+                    return
+                stream.seek(start_offset)
+
+                resolved_commit_sha = commit_sha or self._detect_git_commit()
+                if not resolved_commit_sha:
+                    resolved_commit_sha = self._find_commit_in_messages(
+                        _iter_jsonl_stream(stream)
+                    )
+                    stream.seek(start_offset)
+                options["resolved_commit_sha"] = resolved_commit_sha
+
+                stats = {"messages": 0, "has_input": False}
+                message_iter = _iter_jsonl_stream(stream, stats)
+                chunks = _iter_message_chunks(message_iter, chunk_size)
+                for chunk_candidates in self._map_chunks(chunks, options, workers):
+                    yield from self._finalize_stream_batch(
+                        chunk_candidates, seen_content
+                    )
+
+                if stats["messages"] == 0 and stats["has_input"]:
+                    logger.info(
+                        "No JSONL messages found in stream; falling back to "
+                        "plain-text extraction"
+                    )
+                    stream.seek(start_offset)
+                    batch: List[Dict[str, Any]] = []
+                    for line in _iter_stream_lines(stream):
+                        for candidate_line in self._iter_candidate_lines(line):
+                            candidate = self._build_plain_text_candidate(
+                                candidate_line, **options
+                            )
+                            if candidate:
+                                batch.append(candidate)
+                        if len(batch) >= chunk_size:
+                            yield from self._finalize_stream_batch(batch, seen_content)
+                            batch = []
+                    yield from self._finalize_stream_batch(batch, seen_content)
+        except Exception:
+            status_label = "error"
+            raise
+        finally:
+            self._record_operation_metrics(
+                operation="extract_stream",
+                status=status_label,
+                started=started,
+            )
+
+    def _extract_from_corpus(
+        self,
+        text_corpus: str,
+        commit_sha: Optional[str],
+        options: Dict[str, Any],
+        seen_content: set[str],
+    ) -> Iterator[Dict[str, Any]]:
+        """Extract candidates from an in-memory corpus in transcript order."""
+        messages = self._parse_jsonl_messages(text_corpus)
+        options = dict(
+            options, resolved_commit_sha=commit_sha or self._detect_git_commit(messages)
+        )
+        if messages:
+            chunk_candidates = _extract_chunk_candidates(0, messages, None, None, options)
+        else:
+            chunk_candidates = []
+            for line in self._iter_candidate_lines(text_corpus):
+                candidate = self._build_plain_text_candidate(line, **options)
+                if candidate:
+                    chunk_candidates.append(candidate)
+        yield from self._finalize_stream_batch(chunk_candidates, seen_content)
+
+    @staticmethod
+    def _map_chunks(
+        chunks: Iterator[_MessageChunk],
+        options: Dict[str, Any],
+        workers: Optional[int],
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Score message chunks in order, optionally across worker processes."""
+        if not workers or workers <= 1:
+            for chunk in chunks:
+                yield _extract_chunk_candidates(*chunk, options)
+            return
+
+        # Bound in-flight chunks so a fast reader cannot buffer the whole file.
+        max_in_flight = workers * 2
+        pending: Deque[Future] = deque()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk in chunks:
+                pending.append(
+                    executor.submit(_extract_chunk_candidates, *chunk, options)
+                )
+                if len(pending) >= max_in_flight:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def _finalize_stream_batch(
+        self, batch: List[Dict[str, Any]], seen_content: set[str]
+    ) -> Iterator[Dict[str, Any]]:
+        """De-duplicate a batch of scored candidates and apply LLM classification."""
+        admitted = [c for c in batch if self._admit_candidate(c, seen_content)]
+        if self._classifier and admitted:
+            self._apply_llm_classification(admitted)
+        yield from admitted
+
+    @classmethod
+    def _build_block_candidates(
+        cls,
+        content_text: str,
+        provenance_meta: Dict[str, Any],
+        anchors: List[Dict[str, Any]],
+        *,
+        profile: str,
+        min_confidence: float,
+        run_id: Optional[str],
+        session_id: Optional[str],
+        resolved_commit_sha: Optional[str],
+    ) -> List[Dict[str, Any]]:
+        """Score the lines of one JSONL content block into candidate dicts.
+
+        Pure function of its inputs (no database access) so it can run in a
+        worker process. ``duplicate_of`` is left as ``None``; it is resolved by
+        :meth:`_admit_candidate` after cross-block de-duplication.
+        """
+        effective_session_id = provenance_meta.get("session_id") or session_id or ""
+        effective_git_branch = provenance_meta.get("git_branch") or ""
+        effective_git_commit = (
+            provenance_meta.get("git_commit") or resolved_commit_sha or ""
+        )
+        effective_agent_type = provenance_meta.get("agent_type")
+        effective_model = provenance_meta.get("model")
+
+        # Split each content block into candidate lines
+        block_lines = [ln.strip(" -*\t") for ln in content_text.splitlines()]
+        block_lines = [ln for ln in block_lines if len(ln.strip()) >= 24]
+
+        candidates: List[Dict[str, Any]] = []
+        for line in block_lines:
+            # Skip noise patterns early (before scoring)
+            if cls._is_noise(line):
+                continue
+
+            mem_type = cls._classify_type(line)
+            confidence = cls._score(line, mem_type, profile)
+            if confidence < min_confidence:
+                continue
+
+            # Build provenance: base fields + JSONL message metadata
+            provenance = {
+                "source": "memory_extraction",
+                "format": "jsonl",
+                "run_id": run_id,
+                "session_id": effective_session_id,
+                "commit_sha": effective_git_commit,
+                "workflow_stage": "extraction",
+                "classification_method": "heuristic",
+                "git_branch": effective_git_branch,
+                "git_commit": effective_git_commit,
+                "agent_type": effective_agent_type,
+                "model": effective_model,
+                "source_type": "extraction",
+            }
+            provenance.update(provenance_meta)
+            provenance.pop("message_index", None)
+            provenance["session_id"] = effective_session_id
+            provenance["git_branch"] = effective_git_branch
+            provenance["git_commit"] = effective_git_commit
+            provenance["source_type"] = "extraction"
+
+            candidates.append(
+                {
+                    "type": mem_type,
+                    "content": line.strip(),
+                    "confidence": round(confidence, 3),
+                    "status": "candidate",
+                    "duplicate_of": None,
+                    "provenance": provenance,
+                    "anchors": anchors,
+                    "git_branch": effective_git_branch,
+                    "git_commit": effective_git_commit,
+                    "session_id": effective_session_id,
+                    "agent_type": effective_agent_type,
+                    "model": effective_model,
+                    "source_type": "extraction",
+                }
+            )
+            logger.debug(
+                "Built extraction candidate with %d anchors (message_index=%s)",
+                len(anchors),
+                provenance_meta.get("message_index"),
+            )
+        return candidates
+
+    @classmethod
+    def _build_plain_text_candidate(
+        cls,
+        line: str,
+        *,
+        profile: str,
+        min_confidence: float,
+        run_id: Optional[str],
+        session_id: Optional[str],
+        resolved_commit_sha: Optional[str],
+    ) -> Optional[Dict[str, Any]]:
+        """Score one plain-text line into a candidate dict, or None if filtered."""
+        # Skip noise patterns early (before scoring)
+        if cls._is_noise(line):
+            return None
+
+        mem_type = cls._classify_type(line)
+        confidence = cls._score(line, mem_type, profile)
+        if confidence < min_confidence:
+            return None
+
+        return {
+            "type": mem_type,
+            "content": line.strip(),
+            "confidence": round(confidence, 3),
+            "status": "candidate",
+            "duplicate_of": None,
+            "provenance": {
+                "source": "memory_extraction",
+                "format": "plain_text",
+                "run_id": run_id,
+                "session_id": session_id or "",
+                "commit_sha": resolved_commit_sha,
+                "workflow_stage": "extraction",
+                "classification_method": "heuristic",
+                "git_commit": resolved_commit_sha,
+                "source_type": "extraction",
+            },
+            "anchors": [],
+            "git_branch": "",
+            "git_commit": resolved_commit_sha,
+            "session_id": session_id or "",
+            "agent_type": None,
+            "model": None,
+            "source_type": "extraction",
+        }
+
+    def _admit_candidate(
+        self, candidate: Dict[str, Any], seen_content: set[str]
+    ) -> bool:
+        """Drop repeated content and resolve ``duplicate_of`` for a new candidate."""
+        normalized = candidate["content"].lower()
+        if normalized in seen_content:
+            return False
+        seen_content.add(normalized)
+
+        content_hash = _compute_content_hash(candidate["content"])
+        duplicate = self.memory_repo.get_by_content_hash(content_hash)
+        candidate["duplicate_of"] = duplicate.id if duplicate else None
+        return True
+
     @staticmethod
     def _iter_candidate_lines(text_corpus: str) -> List[str]:
         lines = [line.strip(" -*\t") for line in text_corpus.splitlines()]
@@ -745,136 +1060,151 @@ class MemoryExtractorService:
             >>> blocks[0][1]["git_branch"]
             'main'
         """
-        # Message types to skip (noise)
-        skip_types = {"progress", "file-history-snapshot", "system", "result"}
-
         results: List[tuple[str, Dict]] = []
-
         for message_index, message in enumerate(messages):
-            msg_type = message.get("type")
-            msg_role = message.get("role")
+            block = MemoryExtractorService._extract_content_block(
+                message, message_index
+            )
+            if block is not None:
+                results.append(block)
 
-            # Skip noise message types
-            if msg_type in skip_types:
-                logger.debug(f"Skipping message with type={msg_type}")
-                continue
+        logger.debug(
+            f"Extracted {len(results)} content blocks from {len(messages)} messages"
+        )
+        return results
 
-            # Skip meta messages and tool results
-            if message.get("isMeta") in (True, "true"):
-                logger.debug("Skipping meta message")
-                continue
-            if message.get("toolUseResult") is True:
-                logger.debug("Skipping tool use result message")
-                continue
+    @staticmethod
+    def _extract_content_block(
+        message: Dict[str, Any], message_index: int
+    ) -> Optional[tuple[str, Dict]]:
+        """Extract the filtered content block and provenance for one message.
 
-            # Determine if this is a user or assistant message
-            # Claude Code JSONL uses type="user", plain JSONL uses type="human"
-            is_user = msg_type in ("human", "user") or msg_role == "user"
-            is_assistant = msg_type == "assistant" or msg_role == "assistant"
+        Applies the per-message filtering rules documented on
+        :meth:`_extract_content_blocks`.
 
-            if not (is_user or is_assistant):
-                logger.debug(f"Skipping message with type={msg_type}, role={msg_role}")
-                continue
+        Returns:
+            ``(content_text, provenance_metadata)`` or None if the message is
+            noise or carries no usable text.
+        """
+        msg_type = message.get("type")
+        msg_role = message.get("role")
 
-            # Extract content - check nested message structure first (Claude Code JSONL),
-            # then fall back to top-level content (plain JSONL)
-            inner_msg = message.get("message")
-            if isinstance(inner_msg, dict):
-                content = inner_msg.get("content")
-                # Also get role from inner message if not at top level
-                if not msg_role:
-                    msg_role = inner_msg.get("role")
-            else:
-                content = message.get("content")
-            if content is None:
-                continue
+        # Skip noise message types
+        if msg_type in _SKIP_MESSAGE_TYPES:
+            logger.debug(f"Skipping message with type={msg_type}")
+            return None
 
-            # Extract text blocks
-            text_blocks: List[str] = []
-            if isinstance(content, str):
-                text_blocks.append(content)
-            elif isinstance(content, list):
-                # Extract only text-type blocks, skip tool_use/tool_result
-                for block in content:
-                    if isinstance(block, dict) and block.get("type") == "text":
-                        text_blocks.append(block.get("text", ""))
-            else:
-                logger.debug(f"Unexpected content type: {type(content)}")
-                continue
+        # Skip meta messages and tool results
+        if message.get("isMeta") in (True, "true"):
+            logger.debug("Skipping meta message")
+            return None
+        if message.get("toolUseResult") is True:
+            logger.debug("Skipping tool use result message")
+            return None
 
-            # Join text blocks and filter by length
-            content_text = "\n".join(text_blocks).strip()
-            if len(content_text) < 20:
-                logger.debug(f"Skipping short content: {len(content_text)} chars")
-                continue
+        # Determine if this is a user or assistant message
+        # Claude Code JSONL uses type="user", plain JSONL uses type="human"
+        is_user = msg_type in ("human", "user") or msg_role == "user"
+        is_assistant = msg_type == "assistant" or msg_role == "assistant"
 
-            # Build provenance metadata
-            metadata = message.get("metadata")
-            if not isinstance(metadata, dict):
-                metadata = {}
+        if not (is_user or is_assistant):
+            logger.debug(f"Skipping message with type={msg_type}, role={msg_role}")
+            return None
 
-            inner_metadata = (
-                inner_msg.get("metadata")
-                if isinstance(inner_msg, dict) and isinstance(inner_msg.get("metadata"), dict)
-                else {}
-            )
+        # Extract content - check nested message structure first (Claude Code JSONL),
+        # then fall back to top-level content (plain JSONL)
+        inner_msg = message.get("message")
+        if isinstance(inner_msg, dict):
+            content = inner_msg.get("content")
+            # Also get role from inner message if not at top level
+            if not msg_role:
+                msg_role = inner_msg.get("role")
+        else:
+            content = message.get("content")
+        if content is None:
+            return None
 
-            model = (
-                message.get("model")
-                or (inner_msg.get("model") if isinstance(inner_msg, dict) else None)
-                or metadata.get("model")
-                or inner_metadata.get("model")
-            )
+        # Extract text blocks
+        text_blocks: List[str] = []
+        if isinstance(content, str):
+            text_blocks.append(content)
+        elif isinstance(content, list):
+            # Extract only text-type blocks, skip tool_use/tool_result
+            for block in content:
+                if isinstance(block, dict) and block.get("type") == "text":
+                    text_blocks.append(block.get("text", ""))
+        else:
+            logger.debug(f"Unexpected content type: {type(content)}")
+            return None
 
-            agent_type = (
-                message.get("agent_type")
-                or message.get("agentType")
-                or metadata.get("agent_type")
-                or metadata.get("agentType")
-                or inner_metadata.get("agent_type")
-                or inner_metadata.get("agentType")
-            )
+        # Join text blocks and filter by length
+        content_text = "\n".join(text_blocks).strip()
+        if len(content_text) < 20:
+            logger.debug(f"Skipping short content: {len(content_text)} chars")
+            return None
 
-            git_commit = (
-                message.get("git_commit")
-                or message.get("gitCommit")
-                or metadata.get("git_commit")
-                or metadata.get("gitCommit")
-                or metadata.get("commit_sha")
-                or metadata.get("commitSha")
-                or inner_metadata.get("git_commit")
-                or inner_metadata.get("gitCommit")
-                or inner_metadata.get("commit_sha")
-                or inner_metadata.get("commitSha")
-            )
+        # Build provenance metadata
+        metadata = message.get("metadata")
+        if not isinstance(metadata, dict):
+            metadata = {}
 
-            provenance = {
-                "message_uuid": message.get("uuid", ""),
-                "message_role": msg_type or msg_role or "unknown",
-                "timestamp": message.get("timestamp", ""),
-                "session_id": message.get("sessionId", "")
-                or message.get("session_id", "")
-                or metadata.get("session_id", "")
-                or metadata.get("sessionId", ""),
-                "git_branch": message.get("gitBranch", "")
-                or message.get("git_branch", "")
-                or metadata.get("git_branch", "")
-                or metadata.get("gitBranch", ""),
-                "message_index": message_index,
-            }
-            if isinstance(model, str) and model.strip():
-                provenance["model"] = model.strip()
-            if isinstance(agent_type, str) and agent_type.strip():
-                provenance["agent_type"] = agent_type.strip()
-            if isinstance(git_commit, str) and git_commit.strip():
-                provenance["git_commit"] = git_commit.strip()
+        inner_metadata = (
+            inner_msg.get("metadata")
+            if isinstance(inner_msg, dict) and isinstance(inner_msg.get("metadata"), dict)
+            else {}
+        )
 
-            results.append((content_text, provenance))
+        model = (
+            message.get("model")
+            or (inner_msg.get("model") if isinstance(inner_msg, dict) else None)
+            or metadata.get("model")
+            or inner_metadata.get("model")
+        )
 
-        logger.debug(
-            f"Extracted {len(results)} content blocks from {len(messages)} messages"
+        agent_type = (
+            message.get("agent_type")
+            or message.get("agentType")
+            or metadata.get("agent_type")
+            or metadata.get("agentType")
+            or inner_metadata.get("agent_type")
+            or inner_metadata.get("agentType")
         )
-        return results
+
+        git_commit = (
+            message.get("git_commit")
+            or message.get("gitCommit")
+            or metadata.get("git_commit")
+            or metadata.get("gitCommit")
+            or metadata.get("commit_sha")
+            or metadata.get("commitSha")
+            or inner_metadata.get("git_commit")
+            or inner_metadata.get("gitCommit")
+            or inner_metadata.get("commit_sha")
+            or inner_metadata.get("commitSha")
+        )
+
+        provenance = {
+            "message_uuid": message.get("uuid", ""),
+            "message_role": msg_type or msg_role or "unknown",
+            "timestamp": message.get("timestamp", ""),
+            "session_id": message.get("sessionId", "")
+            or message.get("session_id", "")
+            or metadata.get("session_id", "")
+            or metadata.get("sessionId", ""),
+            "git_branch": message.get("gitBranch", "")
+            or message.get("git_branch", "")
+            or metadata.get("git_branch", "")
+            or metadata.get("gitBranch", ""),
+            "message_index": message_index,
+        }
+        if isinstance(model, str) and model.strip():
+            provenance["model"] = model.strip()
+        if isinstance(agent_type, str) and agent_type.strip():
+            provenance["agent_type"] = agent_type.strip()
+        if isinstance(git_commit, str) and git_commit.strip():
+            provenance["git_commit"] = git_commit.strip()
+
+        return content_text, provenance
 
     @staticmethod
     def _tool_call_priority(tool_name: str) -> int:
@@ -961,50 +1291,57 @@ class MemoryExtractorService:
         by_message: Dict[int, List[Dict[str, Any]]] = {}
 
         for index, message in enumerate(messages):
-            inner_msg = message.get("message")
-            if isinstance(inner_msg, dict):
-                content = inner_msg.get("content")
-            else:
-                content = message.get("content")
+            refs = self._extract_tool_refs(message)
+            if refs:
+                by_message[index] = refs
 
-            if not isinstance(content, list):
-                continue
+        return by_message
 
-            refs: List[Dict[str, Any]] = []
-            for block in content:
-                if not isinstance(block, dict) or block.get("type") != "tool_use":
-                    continue
-                tool_name = block.get("name")
-                if tool_name not in _ANCHOR_ALL_TOOLS:
-                    continue
-                tool_input = block.get("input") or {}
-                if not isinstance(tool_input, dict):
-                    continue
+    @classmethod
+    def _extract_tool_refs(cls, message: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Extract anchor-eligible tool call path references from one message."""
+        inner_msg = message.get("message")
+        if isinstance(inner_msg, dict):
+            content = inner_msg.get("content")
+        else:
+            content = message.get("content")
+
+        if not isinstance(content, list):
+            return []
 
-                path, line_start, line_end = self._extract_path_from_tool_input(
-                    tool_name, tool_input
-                )
-                if not path:
-                    continue
+        refs: List[Dict[str, Any]] = []
+        for block in content:
+            if not isinstance(block, dict) or block.get("type") != "tool_use":
+                continue
+            tool_name = block.get("name")
+            if tool_name not in _ANCHOR_ALL_TOOLS:
+                continue
+            tool_input = block.get("input") or {}
+            if not isinstance(tool_input, dict):
+                continue
 
-                ref: Dict[str, Any] = {
-                    "path": path,
-                    "tool_name": tool_name,
-                    "priority": self._tool_call_priority(tool_name),
-                }
-                if line_start is not None:
-                    ref["line_start"] = line_start
-                if line_end is not None:
-                    ref["line_end"] = line_end
-                refs.append(ref)
+            path, line_start, line_end = cls._extract_path_from_tool_input(
+                tool_name, tool_input
+            )
+            if not path:
+                continue
 
-            if refs:
-                by_message[index] = refs
+            ref: Dict[str, Any] = {
+                "path": path,
+                "tool_name": tool_name,
+                "priority": cls._tool_call_priority(tool_name),
+            }
+            if line_start is not None:
+                ref["line_start"] = line_start
+            if line_end is not None:
+                ref["line_end"] = line_end
+            refs.append(ref)
 
-        return by_message
+        return refs
 
+    @classmethod
     def _build_anchors_for_message_window(
-        self,
+        cls,
         *,
         tool_refs_by_message: Dict[int, List[Dict[str, Any]]],
         message_index: Optional[int],
@@ -1050,7 +1387,7 @@ class MemoryExtractorService:
         for ref in ordered[:20]:
             anchor: Dict[str, Any] = {
                 "path": ref["path"],
-                "type": self.classify_anchor_type(ref["path"]),
+                "type": cls.classify_anchor_type(ref["path"]),
             }
             if "line_start" in ref:
                 anchor["line_start"] = ref["line_start"]
@@ -1082,6 +1419,13 @@ class MemoryExtractorService:
         if not messages:
             return None
 
+        return MemoryExtractorService._find_commit_in_messages(messages)
+
+    @staticmethod
+    def _find_commit_in_messages(
+        messages: Iterable[Dict[str, Any]],
+    ) -> Optional[str]:
+        """Return the first commit SHA recorded on a message or its metadata."""
         candidate_fields = ("git_commit", "gitCommit", "commit_sha", "commitSha", "commit")
         for message in messages:
             for field in candidate_fields:
@@ -1375,3 +1719,173 @@ class MemoryExtractorService:
             memory_operations_total.labels(operation=operation, status=status).inc()
         if memory_operation_duration is not None:
             memory_operation_duration.labels(operation=operation).observe(duration)
+
+
+# =============================================================================
+# Streaming helpers
+# =============================================================================
+
+
+@contextlib.contextmanager
+def _open_transcript(source: TranscriptSource) -> Iterator[IO[bytes]]:
+    """Open a transcript source as a seekable binary stream.
+
+    Paths are opened directly. Seekable binary streams are used as-is (and
+    left open for the caller). Text streams and non-seekable streams are
+    spooled to a temporary file so extraction can make multiple passes.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(Path(source), "rb") as handle:
+            yield handle
+        return
+
+    if isinstance(source, io.TextIOBase):
+        spool = tempfile.SpooledTemporaryFile(max_size=_STREAM_SPOOL_MAX_BYTES)
+        for chunk in iter(lambda: source.read(64 * 1024), ""):
+            spool.write(chunk.encode("utf-8"))
+        spool.seek(0)
+        with spool:
+            yield spool
+        return
+
+    seekable = False
+    try:
+        seekable = source.seekable()
+    except (AttributeError, ValueError):
+        pass
+    if seekable:
+        yield source
+        return
+
+    spool = tempfile.SpooledTemporaryFile(max_size=_STREAM_SPOOL_MAX_BYTES)
+    shutil.copyfileobj(source, spool)
+    spool.seek(0)
+    with spool:
+        yield spool
+
+
+def _peek_first_significant_byte(stream: IO[bytes]) -> bytes:
+    """Return the first non-whitespace byte of the stream (consumes input)."""
+    while True:
+        chunk = stream.read(4096)
+        if not chunk:
+            return b""
+        stripped = chunk.lstrip()
+        if stripped:
+            return stripped[:1]
+
+
+def _iter_stream_lines(stream: IO[bytes]) -> Iterator[str]:
+    """Yield decoded lines from a binary stream one physical line at a time."""
+    for raw_line in stream:
+        yield raw_line.decode("utf-8", errors="replace")
+
+
+def _iter_jsonl_stream(
+    stream: IO[bytes], stats: Optional[Dict[str, Any]] = None
+) -> Iterator[Dict[str, Any]]:
+    """Incrementally parse JSONL dict messages from a binary stream.
+
+    Mirrors :meth:`MemoryExtractorService._parse_jsonl_messages` line
+    handling: blank lines are skipped and lines that fail to parse, or parse
+    to non-dict values, are dropped with debug logging. When ``stats`` is
+    given it is updated with the message count and whether any non-blank
+    input was seen (used to decide on the plain-text fallback).
+    """
+    line_num = 0
+    for physical_line in _iter_stream_lines(stream):
+        for line in physical_line.splitlines():
+            line_num += 1
+            line = line.strip()
+            if not line:
+                continue
+            if stats is not None:
+                stats["has_input"] = True
+
+            try:
+                parsed = json.loads(line)
+            except json.JSONDecodeError as e:
+                logger.debug(f"Line {line_num} failed JSON parsing: {e}, skipping")
+                continue
+            if not isinstance(parsed, dict):
+                logger.debug(
+                    f"Line {line_num} parsed to non-dict type ({type(parsed).__name__}), skipping"
+                )
+                continue
+            if stats is not None:
+                stats["messages"] += 1
+            yield parsed
+
+
+def _iter_message_chunks(
+    messages: Iterable[Dict[str, Any]], chunk_size: int
+) -> Iterator[_MessageChunk]:
+    """Group messages into chunks carrying one message of context on each side.
+
+    The neighbouring messages are needed because anchors for a message are
+    built from tool calls in the window ``[index - 1, index + 1]``.
+    """
+    start_index = 0
+    previous: Optional[Dict[str, Any]] = None
+    chunk: List[Dict[str, Any]] = []
+    for message in messages:
+        if len(chunk) == chunk_size:
+            yield start_index, chunk, previous, message
+            previous = chunk[-1]
+            start_index += len(chunk)
+            chunk = []
+        chunk.append(message)
+    if chunk:
+        yield start_index, chunk, previous, None
+
+
+def _extract_chunk_candidates(
+    start_index: int,
+    messages: List[Dict[str, Any]],
+    previous: Optional[Dict[str, Any]],
+    following: Optional[Dict[str, Any]],
+    options: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    """Score one message chunk into candidates in transcript order.
+
+    Module-level (and free of database access) so it can be shipped to a
+    worker process. Cross-chunk de-duplication and ``duplicate_of`` lookup
+    happen afterwards in the calling process.
+    """
+    service = MemoryExtractorService
+    tool_refs_by_message: Dict[int, List[Dict[str, Any]]] = {}
+    window: List[Tuple[int, Optional[Dict[str, Any]]]] = [(start_index - 1, previous)]
+    window.extend((start_index + offset, msg) for offset, msg in enumerate(messages))
+    window.append((start_index + len(messages), following))
+    for index, message in window:
+        if message is None:
+            continue
+        refs = service._extract_tool_refs(message)
+        if refs:
+            tool_refs_by_message[index] = refs
+
+    resolved_commit_sha = options.get("resolved_commit_sha")
+    candidates: List[Dict[str, Any]] = []
+    for offset, message in enumerate(messages):
+        block = service._extract_content_block(message, start_index + offset)
+        if block is None:
+            continue
+        content_text, provenance_meta = block
+        anchors = service._build_anchors_for_message_window(
+            tool_refs_by_message=tool_refs_by_message,
+            message_index=start_index + offset,
+            commit_sha=resolved_commit_sha,
+        )
+        candidates.extend(
+            service._build_block_candidates(
+                content_text,
+                provenance_meta,
+                anchors,
+                profile=options["profile"],
+                min_confidence=options["min_confidence"],
+                run_id=options.get("run_id"),
+                session_id=options.get("session_id"),
+                resolved_commit_sha=resolved_commit_sha,
+            )
+        )
+    return candidates
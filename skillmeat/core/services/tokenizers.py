@@ -0,0 +1,194 @@
+"""Pluggable local tokenizers and a shared token-count cache.
+
+Context packing needs token counts for every candidate memory item on every
+preview/generate call. This module provides:
+
+    - ``Tokenizer``: abstract interface for local (offline) token counting
+    - ``HeuristicTokenizer``: dependency-free chars/4 approximation (default)
+    - ``TiktokenTokenizer``: exact BPE counts via the optional ``tiktoken``
+      package
+    - ``TokenCountCache``: bounded, thread-safe LRU of token counts keyed by
+      (tokenizer name, content digest), shared process-wide so per-request
+      service instances reuse earlier work
+
+Usage:
+    >>> from skillmeat.core.services.tokenizers import get_tokenizer, token_count_cache
+    >>> tokenizer = get_tokenizer("heuristic")
+    >>> token_count_cache.count(tokenizer, "Use pytest for testing")
+    5
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Environment variable selecting the default tokenizer ("heuristic" or
+# "tiktoken[:<encoding>]").
+TOKENIZER_ENV_VAR = "SKILLMEAT_CONTEXT_TOKENIZER"
+
+# Default maximum number of cached token counts
+_DEFAULT_CACHE_MAX_ENTRIES = 50_000
+
+
+class Tokenizer(ABC):
+    """Abstract interface for local token counting.
+
+    Implementations must be deterministic for a given ``name`` so cached
+    counts can be shared between instances.
+    """
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Stable identifier used as part of cache keys."""
+
+    @abstractmethod
+    def count(self, text: str) -> int:
+        """Return the number of tokens in ``text`` (0 for empty text)."""
+
+
+class HeuristicTokenizer(Tokenizer):
+    """Character-based approximation (chars / 4), minimum 1 for non-empty text."""
+
+    @property
+    def name(self) -> str:
+        return "heuristic"
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        return max(1, len(text) // 4)
+
+
+class TiktokenTokenizer(Tokenizer):
+    """Exact BPE token counts using the optional ``tiktoken`` package.
+
+    Args:
+        encoding_name: tiktoken encoding to load (default ``cl100k_base``).
+
+    Raises:
+        ImportError: If ``tiktoken`` is not installed.
+    """
+
+    def __init__(self, encoding_name: str = "cl100k_base"):
+        try:
+            import tiktoken
+        except ImportError as e:
+            raise ImportError(
+                "tiktoken is required for TiktokenTokenizer. "
+                "Install it with: pip install tiktoken"
+            ) from e
+        self._encoding_name = encoding_name
+        self._encoding = tiktoken.get_encoding(encoding_name)
+
+    @property
+    def name(self) -> str:
+        return f"tiktoken:{self._encoding_name}"
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+
+def get_tokenizer(spec: Optional[str] = None) -> Tokenizer:
+    """Resolve a tokenizer from a spec string or the environment.
+
+    Args:
+        spec: ``"heuristic"``, ``"tiktoken"`` or ``"tiktoken:<encoding>"``.
+            Defaults to ``$SKILLMEAT_CONTEXT_TOKENIZER``, then ``"heuristic"``.
+
+    Returns:
+        Tokenizer instance. Falls back to ``HeuristicTokenizer`` (with a
+        warning) when tiktoken is requested but not installed.
+
+    Raises:
+        ValueError: If the spec names an unknown tokenizer.
+    """
+    spec = (spec or os.environ.get(TOKENIZER_ENV_VAR) or "heuristic").strip()
+    kind, _, option = spec.partition(":")
+    kind = kind.lower()
+
+    if kind == "heuristic":
+        return HeuristicTokenizer()
+    if kind == "tiktoken":
+        try:
+            return TiktokenTokenizer(option or "cl100k_base")
+        except ImportError as e:
+            logger.warning("%s; falling back to heuristic token counts", e)
+            return HeuristicTokenizer()
+    raise ValueError(
+        f"Unknown tokenizer '{spec}'. Must be 'heuristic' or 'tiktoken[:<encoding>]'"
+    )
+
+
+def content_digest(text: str) -> str:
+    """Return a compact, stable digest of ``text`` for cache keys."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class TokenCountCache:
+    """Thread-safe LRU cache of token counts keyed by content digest.
+
+    Args:
+        max_entries: Maximum number of cached counts before LRU eviction.
+    """
+
+    def __init__(self, max_entries: int = _DEFAULT_CACHE_MAX_ENTRIES):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def count(
+        self, tokenizer: Tokenizer, text: str, digest: Optional[str] = None
+    ) -> int:
+        """Return the cached token count for ``text``, computing it on a miss.
+
+        Args:
+            tokenizer: Tokenizer used to count on a cache miss.
+            text: Text to count.
+            digest: Precomputed :func:`content_digest` of ``text``, if known.
+        """
+        if not text:
+            return 0
+        key = (tokenizer.name, digest or content_digest(text))
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+
+        tokens = tokenizer.count(text)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = tokens
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return tokens
+
+    def clear(self) -> None:
+        """Drop all cached counts and reset hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# Process-wide cache shared by all ContextPackerService instances
+token_count_cache = TokenCountCache()
@@ -13,7 +13,12 @@ Key Features:
 
 from .key_manager import KeyManager, SigningKey, PublicKey, KeyPair
 from .signer import BundleSigner, SignatureData
-from .verifier import BundleVerifier, VerificationResult, VerificationStatus
+from .verifier import (
+    BatchVerificationResult,
+    BundleVerifier,
+    VerificationResult,
+    VerificationStatus,
+)
 from .storage import KeyStorage, get_key_storage_backend
 
 __all__ = [
@@ -24,6 +29,7 @@ __all__ = [
     "BundleSigner",
     "SignatureData",
     "BundleVerifier",
+    "BatchVerificationResult",
     "VerificationResult",
     "VerificationStatus",
     "KeyStorage",
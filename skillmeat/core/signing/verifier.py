@@ -4,18 +4,23 @@ This module provides cryptographic verification of bundle signatures using
 Ed25519 digital signatures.
 """
 
+import base64
 import json
 import logging
-from dataclasses import dataclass
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from cryptography.exceptions import InvalidSignature
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import ed25519
 from pydantic import BaseModel, Field
 
-from .key_manager import KeyManager
+from .key_manager import KeyManager, PublicKey
 from .signer import SignatureData
 
 logger = logging.getLogger(__name__)
@@ -66,6 +71,26 @@ class VerificationResult(BaseModel):
             return f"✗ Verification error: {self.message}"
 
 
+class BatchVerificationResult(BaseModel):
+    """Results of verifying many bundles in one call."""
+
+    results: List[VerificationResult] = Field(
+        ..., description="Per-bundle results, in input order"
+    )
+    valid_count: int = Field(..., description="Bundles whose verification passed")
+    invalid_count: int = Field(..., description="Bundles whose verification failed")
+    elapsed_ms: float = Field(..., description="Wall-clock time for the whole batch")
+
+    @property
+    def all_valid(self) -> bool:
+        """True when every bundle in the batch verified."""
+        return self.invalid_count == 0
+
+
+# Batches smaller than this are verified on the calling thread.
+PARALLEL_VERIFY_THRESHOLD = 16
+
+
 @dataclass
 class BundleVerifier:
     """Verifies bundle signatures.
@@ -74,9 +99,103 @@ class BundleVerifier:
     - Verifying Ed25519 signatures
     - Checking signer key trust
     - Validating bundle integrity
+
+    Public keys are looked up in the trust store and parsed once per
+    fingerprint for the lifetime of the verifier, so verifying many bundles
+    signed by the same key does not hit key storage for each bundle.
     """
 
     key_manager: KeyManager
+    _key_cache: Dict[str, Optional[PublicKey]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _parsed_keys: Dict[str, object] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _key_cache_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def clear_key_cache(self) -> None:
+        """Forget cached trust-store lookups (e.g. after importing a key)."""
+        with self._key_cache_lock:
+            self._key_cache.clear()
+            self._parsed_keys.clear()
+
+    def _lookup_public_key(self, fingerprint: str) -> Optional[PublicKey]:
+        """Return the trust-store entry for *fingerprint*, cached per verifier."""
+        with self._key_cache_lock:
+            if fingerprint in self._key_cache:
+                return self._key_cache[fingerprint]
+
+        public_key_obj = self.key_manager.load_public_key_by_fingerprint(fingerprint)
+        with self._key_cache_lock:
+            self._key_cache[fingerprint] = public_key_obj
+        return public_key_obj
+
+    def _parse_public_key(self, public_key_obj: PublicKey):
+        """Return the parsed PEM key for a trust-store entry, cached per verifier.
+
+        Raises:
+            ValueError: If the PEM cannot be parsed (not cached)
+        """
+        with self._key_cache_lock:
+            parsed = self._parsed_keys.get(public_key_obj.fingerprint)
+        if parsed is not None:
+            return parsed
+
+        parsed = serialization.load_pem_public_key(
+            public_key_obj.public_key_pem.encode()
+        )
+        with self._key_cache_lock:
+            self._parsed_keys[public_key_obj.fingerprint] = parsed
+        return parsed
+
+    def verify_bundles(
+        self,
+        bundles: Sequence[Tuple[str, Dict]],
+        require_signature: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> BatchVerificationResult:
+        """Verify many bundle signatures.
+
+        Keys are resolved once per signer and each manifest is canonicalized
+        once; large batches are verified across a thread pool.
+
+        Args:
+            bundles: ``(bundle_hash, manifest_data)`` pairs
+            require_signature: If True, unsigned bundles fail
+            max_workers: Thread count for large batches (default: CPU count, max 8)
+
+        Returns:
+            BatchVerificationResult with per-bundle results in input order
+        """
+        start = time.perf_counter()
+
+        def verify_one(item: Tuple[str, Dict]) -> VerificationResult:
+            return self.verify_bundle(item[0], item[1], require_signature)
+
+        workers = max_workers or min(8, os.cpu_count() or 1)
+        if len(bundles) < PARALLEL_VERIFY_THRESHOLD or workers <= 1:
+            results = [verify_one(item) for item in bundles]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="bundle-verify"
+            ) as pool:
+                results = list(pool.map(verify_one, bundles))
+
+        valid_count = sum(1 for result in results if result.valid)
+        elapsed_ms = round((time.perf_counter() - start) * 1000.0, 3)
+        logger.info(
+            f"Verified {len(results)} bundle signatures in {elapsed_ms:.1f}ms "
+            f"({valid_count} valid)"
+        )
+        return BatchVerificationResult(
+            results=results,
+            valid_count=valid_count,
+            invalid_count=len(results) - valid_count,
+            elapsed_ms=elapsed_ms,
+        )
 
     def verify_bundle(
         self, bundle_hash: str, manifest_data: Dict, require_signature: bool = False
@@ -119,10 +238,8 @@ class BundleVerifier:
                 signer_trusted=False,
             )
 
-        # Load signer's public key
-        public_key_obj = self.key_manager.load_public_key_by_fingerprint(
-            signature_data.key_fingerprint
-        )
+        # Load signer's public key (cached per fingerprint)
+        public_key_obj = self._lookup_public_key(signature_data.key_fingerprint)
 
         if not public_key_obj:
             return VerificationResult(
@@ -145,9 +262,7 @@ class BundleVerifier:
 
         # Load public key for verification
         try:
-            public_key = serialization.load_pem_public_key(
-                public_key_obj.public_key_pem.encode()
-            )
+            public_key = self._parse_public_key(public_key_obj)
 
             if not isinstance(public_key, ed25519.Ed25519PublicKey):
                 return VerificationResult(
@@ -171,8 +286,6 @@ class BundleVerifier:
 
         # Decode signature
         try:
-            import base64
-
             signature_bytes = base64.b64decode(signature_data.signature)
         except Exception as e:
             return VerificationResult(
@@ -262,22 +375,14 @@ class BundleVerifier:
         Returns:
             Canonicalized manifest
         """
-        # Deep copy to avoid modifying original
-        import copy
-
-        canonical = copy.deepcopy(manifest_data)
-
-        # Remove signature field if present
-        if "signature" in canonical:
-            del canonical["signature"]
-
-        # Remove non-canonical fields
-        non_canonical_fields = ["created_at", "bundle_path"]
-        for field in non_canonical_fields:
-            if field in canonical:
-                del canonical[field]
-
-        return canonical
+        # Only top-level keys are dropped and the result is only serialized,
+        # so a shallow copy is enough (no deep copy per verification)
+        non_canonical_fields = {"signature", "created_at", "bundle_path"}
+        return {
+            key: value
+            for key, value in manifest_data.items()
+            if key not in non_canonical_fields
+        }
 
     def verify_bundle_file(self, bundle_path, require_signature: bool = False):
         """Verify signature of a bundle file.
@@ -308,3 +413,29 @@ class BundleVerifier:
         )
 
         return result
+
+    def verify_bundle_files(
+        self, bundle_paths, require_signature: bool = False
+    ) -> BatchVerificationResult:
+        """Verify signatures of several bundle files.
+
+        Args:
+            bundle_paths: Paths to bundle files
+            require_signature: If True, unsigned bundles fail
+
+        Returns:
+            BatchVerificationResult with per-bundle results in input order
+
+        Raises:
+            ValueError: If a bundle is invalid
+        """
+        from pathlib import Path
+
+        from skillmeat.core.sharing.builder import inspect_bundle
+
+        bundles = []
+        for bundle_path in bundle_paths:
+            bundle = inspect_bundle(Path(bundle_path))
+            bundles.append((bundle.bundle_hash, bundle.to_dict()))
+
+        return self.verify_bundles(bundles, require_signature)
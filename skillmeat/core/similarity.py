@@ -47,6 +47,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional, TYPE_CHECKING
 
+from skillmeat.observability.hotpath import hot_path, hotpath_phase
+
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
 
@@ -214,6 +216,7 @@ class SimilarityService:
     # Public API
     # ------------------------------------------------------------------
 
+    @hot_path("similarity.find_similar")
     def find_similar(
         self,
         artifact_id: str,
@@ -396,9 +399,10 @@ class SimilarityService:
         from skillmeat.cache.models import Artifact
 
         # 1. Fetch target artifact by UUID.
-        target_row: Optional[Artifact] = (
-            session.query(Artifact).filter(Artifact.uuid == artifact_id).first()
-        )
+        with hotpath_phase("db"):
+            target_row: Optional[Artifact] = (
+                session.query(Artifact).filter(Artifact.uuid == artifact_id).first()
+            )
         if target_row is None:
             logger.debug(
                 "SimilarityService.find_similar: artifact uuid=%s not found.",
@@ -437,12 +441,13 @@ class SimilarityService:
                     target_fp.total_size = ca.artifact_total_size
 
         # 3. Fetch candidate rows (exclude the target itself).
-        candidates = self._fetch_candidates(session, artifact_id, source)
+        with hotpath_phase("db"):
+            candidates = self._fetch_candidates(session, artifact_id, source)
         if not candidates:
             return []
 
-        # 4. Score each candidate and collect results.
-        results: List[SimilarityResult] = []
+        # 4. Build candidate fingerprints.
+        candidate_fps = []
         for row in candidates:
             candidate_fp = self._fingerprint_from_row(row)
 
@@ -454,11 +459,12 @@ class SimilarityService:
             ):
                 from skillmeat.cache.models import CollectionArtifact
 
-                ca = (
-                    session.query(CollectionArtifact)
-                    .filter(CollectionArtifact.artifact_uuid == str(row_uuid))
-                    .first()
-                )
+                with hotpath_phase("db"):
+                    ca = (
+                        session.query(CollectionArtifact)
+                        .filter(CollectionArtifact.artifact_uuid == str(row_uuid))
+                        .first()
+                    )
                 if ca:
                     if not candidate_fp.description and ca.description:
                         candidate_fp.description = ca.description
@@ -470,14 +476,23 @@ class SimilarityService:
                         candidate_fp.file_count = ca.artifact_file_count
                     if not candidate_fp.total_size and ca.artifact_total_size:
                         candidate_fp.total_size = ca.artifact_total_size
+            candidate_fps.append(candidate_fp)
 
-            # 4a. Keyword/content/structure/metadata scores via MatchAnalyzer.compare().
-            breakdown = self._analyzer.compare(target_fp, candidate_fp)
+        # 5. Score each candidate and collect results.  Description BM25 uses
+        # statistics shared across the whole candidate corpus, so the target
+        # is scored against every candidate in one pass.
+        analyzer = self._analyzer.with_description_corpus(
+            fp.description or "" for fp in candidate_fps
+        )
+        results: List[SimilarityResult] = []
+        for row, candidate_fp in zip(candidates, candidate_fps):
+            # 5a. Keyword/content/structure/metadata scores via MatchAnalyzer.compare().
+            breakdown = analyzer.compare(target_fp, candidate_fp)
 
-            # 4b. Optional semantic score with 800 ms timeout.
+            # 5b. Optional semantic score with 800 ms timeout.
             semantic_score = self._score_semantic_with_timeout(target_fp, candidate_fp)
 
-            # 4c. Rebuild breakdown with semantic score (ScoreBreakdown is frozen).
+            # 5c. Rebuild breakdown with semantic score (ScoreBreakdown is frozen).
             breakdown = ScoreBreakdown(
                 keyword_score=breakdown.keyword_score,
                 content_score=breakdown.content_score,
@@ -486,10 +501,10 @@ class SimilarityService:
                 semantic_score=semantic_score,
             )
 
-            # 4d. Compute weighted composite score.
+            # 5d. Compute weighted composite score.
             composite = self._compute_composite_score(breakdown)
 
-            # 4e. Apply min_score filter.
+            # 5e. Apply min_score filter.
             if composite < min_score:
                 continue
 
@@ -502,7 +517,7 @@ class SimilarityService:
                 )
             )
 
-        # 5. Sort descending by composite_score and return top N.
+        # 6. Sort descending by composite_score and return top N.
         results.sort(key=lambda r: r.composite_score, reverse=True)
         return results[:limit]
 
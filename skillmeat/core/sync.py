@@ -17,6 +17,7 @@ if sys.version_info >= (3, 11):
 else:
     import tomli as tomllib
 
+from skillmeat.observability.hotpath import hot_path
 from skillmeat.utils.logging import redact_path
 from skillmeat.models import (
     DeploymentRecord,
@@ -99,6 +100,7 @@ class SyncManager:
         }
         return drift_to_origin.get(drift_type)
 
+    @hot_path("sync.check_drift")
     def check_drift(
         self,
         project_path: Path,
@@ -2261,6 +2263,7 @@ class SyncManager:
         """
         try:
             from skillmeat.cache.models import get_session, ArtifactVersion
+            from skillmeat.core.version_lineage import LINEAGE_WINDOW, index_version
 
             session = get_session()
             try:
@@ -2278,6 +2281,7 @@ class SyncManager:
 
                 # Build version lineage from parent
                 lineage = []
+                parent = None
                 if parent_content_hash:
                     # Get parent version for lineage
                     parent = (
@@ -2290,7 +2294,9 @@ class SyncManager:
                         # Parent exists in version table - extend its lineage
                         try:
                             parent_lineage = json.loads(parent.version_lineage)
-                            lineage = parent_lineage + [new_content_hash]
+                            lineage = (parent_lineage + [new_content_hash])[
+                                -LINEAGE_WINDOW:
+                            ]
                         except json.JSONDecodeError:
                             logger.warning(
                                 f"Failed to parse parent lineage, starting new lineage"
@@ -2320,6 +2326,7 @@ class SyncManager:
                     version_lineage=json.dumps(lineage),
                 )
 
+                index_version(session, version, parent=parent)
                 session.add(version)
                 session.commit()
 
@@ -2370,6 +2377,7 @@ class SyncManager:
         """
         try:
             from skillmeat.cache.models import get_session, ArtifactVersion
+            from skillmeat.core.version_lineage import LINEAGE_WINDOW, index_version
 
             session = get_session()
             try:
@@ -2387,6 +2395,7 @@ class SyncManager:
 
                 # Build version lineage from parent
                 lineage = []
+                parent = None
                 if parent_content_hash:
                     # Get parent version for lineage
                     parent = (
@@ -2399,7 +2408,9 @@ class SyncManager:
                         # Parent exists in version table - extend its lineage
                         try:
                             parent_lineage = json.loads(parent.version_lineage)
-                            lineage = parent_lineage + [new_content_hash]
+                            lineage = (parent_lineage + [new_content_hash])[
+                                -LINEAGE_WINDOW:
+                            ]
                         except json.JSONDecodeError:
                             logger.warning(
                                 f"Failed to parse parent lineage, starting new lineage"
@@ -2426,6 +2437,7 @@ class SyncManager:
                     version_lineage=json.dumps(lineage),
                 )
 
+                index_version(session, version, parent=parent)
                 session.add(version)
                 session.commit()
 
@@ -0,0 +1,212 @@
+"""Tests for hash reuse and incremental output in BOM generation.
+
+Tests cover:
+- BomHashCache: reuses hashes while stat fingerprints match, rehashes on change
+- BomHashCache: persists to JSON and skips entries inside the racy window
+- BomGenerator: parallel and serial generation produce identical entries
+- diff_boms / apply_incremental_bom: deltas round-trip to the full BOM
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from typing import Any, List
+from unittest.mock import MagicMock, patch
+
+from skillmeat.core.bom import hash_cache as hash_cache_module
+from skillmeat.core.bom.generator import BomGenerator, apply_incremental_bom, diff_boms
+from skillmeat.core.bom.hash_cache import BomHashCache
+from skillmeat.core.hashing import compute_artifact_hash
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _age(path: Path, seconds: float = 60.0) -> None:
+    """Push mtimes of *path* (and its files) outside the racy window."""
+    past = time.time() - seconds
+    targets = [path, *path.rglob("*")] if path.is_dir() else [path]
+    for target in targets:
+        os.utime(target, (past, past))
+
+
+def _make_skill(root: Path, name: str, body: str = "# skill\n") -> Path:
+    skill_dir = root / ".claude" / "skills" / name
+    skill_dir.mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text(body)
+    _age(skill_dir)
+    return skill_dir
+
+
+def _make_artifact(name: str) -> Any:
+    art = MagicMock()
+    art.id = f"skill:{name}"
+    art.name = name
+    art.type = "skill"
+    art.source = None
+    art.deployed_version = None
+    art.upstream_version = None
+    art.content = None
+    art.content_hash = None
+    art.project_id = "proj-1"
+    art.created_at = None
+    art.updated_at = None
+    art.artifact_metadata = None
+    art.uuid = f"uuid-{name}"
+    return art
+
+
+def _make_session(artifacts: List[Any]) -> MagicMock:
+    session = MagicMock()
+    query_mock = MagicMock()
+    query_mock.filter.return_value = query_mock
+    query_mock.order_by.return_value = query_mock
+    query_mock.yield_per.return_value = artifacts
+    session.query.return_value = query_mock
+    return session
+
+
+# ---------------------------------------------------------------------------
+# BomHashCache
+# ---------------------------------------------------------------------------
+
+
+class TestBomHashCache:
+    def test_reuses_hash_until_files_change(self, tmp_path: Path) -> None:
+        skill_dir = _make_skill(tmp_path, "alpha")
+        cache = BomHashCache()
+
+        first = cache.hash_path(skill_dir)
+        assert first == compute_artifact_hash(str(skill_dir))
+        assert (cache.hits, cache.misses) == (0, 1)
+
+        with patch.object(hash_cache_module, "compute_artifact_hash") as compute:
+            assert cache.hash_path(skill_dir) == first
+            compute.assert_not_called()
+        assert cache.hits == 1
+
+        (skill_dir / "SKILL.md").write_text("# changed skill\n")
+        _age(skill_dir, seconds=30.0)
+        second = cache.hash_path(skill_dir)
+        assert second != first
+        assert second == compute_artifact_hash(str(skill_dir))
+
+    def test_recently_modified_paths_are_not_stored(self, tmp_path: Path) -> None:
+        skill_dir = tmp_path / "fresh"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text("# fresh\n")
+
+        cache = BomHashCache()
+        cache.hash_path(skill_dir)
+        cache.hash_path(skill_dir)
+
+        assert cache.hits == 0
+        assert len(cache) == 0
+
+    def test_save_and_reload(self, tmp_path: Path) -> None:
+        skill_dir = _make_skill(tmp_path, "alpha")
+        cache_file = tmp_path / "cache" / "bom-hashes.json"
+
+        cache = BomHashCache(cache_file)
+        expected = cache.hash_path(skill_dir)
+        cache.save()
+        assert cache_file.exists()
+
+        reloaded = BomHashCache(cache_file)
+        assert reloaded.hash_path(skill_dir) == expected
+        assert reloaded.hits == 1
+
+    def test_unreadable_cache_file_is_ignored(self, tmp_path: Path) -> None:
+        cache_file = tmp_path / "bom-hashes.json"
+        cache_file.write_text("{not json")
+
+        assert len(BomHashCache(cache_file)) == 0
+
+
+# ---------------------------------------------------------------------------
+# BomGenerator
+# ---------------------------------------------------------------------------
+
+
+class TestParallelGeneration:
+    def test_parallel_matches_serial(self, tmp_path: Path) -> None:
+        names = [f"skill-{i:02d}" for i in range(12)]
+        for name in names:
+            _make_skill(tmp_path, name, body=f"# {name}\n")
+        artifacts = [_make_artifact(name) for name in reversed(names)]
+
+        serial = BomGenerator(
+            _make_session(artifacts), project_path=tmp_path, max_workers=1
+        ).generate()
+        parallel = BomGenerator(
+            _make_session(artifacts),
+            project_path=tmp_path,
+            max_workers=4,
+            batch_size=5,
+        ).generate()
+
+        assert serial["artifacts"] == parallel["artifacts"]
+        assert [e["name"] for e in parallel["artifacts"]] == names
+        assert all(len(e["content_hash"]) == 64 for e in parallel["artifacts"])
+
+    def test_shared_cache_avoids_rehashing(self, tmp_path: Path) -> None:
+        _make_skill(tmp_path, "alpha")
+        artifacts = [_make_artifact("alpha")]
+        cache = BomHashCache()
+
+        BomGenerator(_make_session(artifacts), project_path=tmp_path, hash_cache=cache).generate()
+        BomGenerator(_make_session(artifacts), project_path=tmp_path, hash_cache=cache).generate()
+
+        assert (cache.hits, cache.misses) == (1, 1)
+
+
+# ---------------------------------------------------------------------------
+# Incremental BOMs
+# ---------------------------------------------------------------------------
+
+
+def _bom(*entries: Any) -> dict:
+    artifacts = [{"type": t, "name": n, "content_hash": h} for t, n, h in entries]
+    return {
+        "schema_version": "1.0.0",
+        "generated_at": "2026-01-01T00:00:00+00:00",
+        "artifact_count": len(artifacts),
+        "artifacts": artifacts,
+        "metadata": {"generator": "skillmeat-bom"},
+    }
+
+
+class TestIncrementalBom:
+    def test_delta_lists_changed_and_removed_entries(self) -> None:
+        previous = _bom(("skill", "a", "1"), ("skill", "b", "2"), ("skill", "c", "3"))
+        current = _bom(("agent", "z", "9"), ("skill", "a", "1"), ("skill", "b", "20"))
+
+        delta = diff_boms(previous, current)
+
+        assert delta["incremental"] is True
+        assert delta["base_generated_at"] == previous["generated_at"]
+        assert [(e["type"], e["name"]) for e in delta["artifacts"]] == [
+            ("agent", "z"),
+            ("skill", "b"),
+        ]
+        assert delta["removed"] == [{"type": "skill", "name": "c"}]
+        assert delta["metadata"]["changed_count"] == 2
+        assert delta["metadata"]["removed_count"] == 1
+
+    def test_apply_rebuilds_current_bom(self) -> None:
+        previous = _bom(("skill", "a", "1"), ("skill", "c", "3"))
+        current = _bom(("agent", "z", "9"), ("skill", "a", "10"))
+
+        assert apply_incremental_bom(previous, diff_boms(previous, current)) == current
+
+    def test_identical_boms_produce_empty_delta(self) -> None:
+        bom = _bom(("skill", "a", "1"))
+
+        delta = diff_boms(bom, bom)
+
+        assert delta["artifacts"] == []
+        assert delta["removed"] == []
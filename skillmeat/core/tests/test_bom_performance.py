@@ -58,11 +58,13 @@ def _make_artifact(idx: int) -> Any:
 
 
 def _make_session(artifacts: List[Any]) -> MagicMock:
-    """Return a MagicMock session whose query().all() returns *artifacts*."""
+    """Return a MagicMock session whose artifact query yields *artifacts*."""
     session = MagicMock()
     query_mock = MagicMock()
     query_mock.all.return_value = artifacts
     query_mock.filter.return_value = query_mock
+    query_mock.order_by.return_value = query_mock
+    query_mock.yield_per.return_value = artifacts
     session.query.return_value = query_mock
     return session
 
@@ -11,7 +11,9 @@ import pytest
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 
+from skillmeat.core.bom import signing as signing_module
 from skillmeat.core.bom.signing import (
+    BatchVerificationResult,
     ChainValidationResult,
     KeyGenerationError,
     KeyNotFoundError,
@@ -30,6 +32,7 @@ from skillmeat.core.bom.signing import (
     verify_bom,
     verify_file,
     verify_signature,
+    verify_signatures,
 )
 
 
@@ -343,6 +346,60 @@ class TestVerifySignature:
         assert verify_result.valid is False
 
 
+class TestVerifySignatures:
+    def test_results_follow_input_order(
+        self, generated_keys: tuple, bom_content: bytes
+    ) -> None:
+        pub, priv = generated_keys
+        good = sign_bom(bom_content, private_key=priv).signature
+        items = [(bom_content, good), (b"tampered", good), (bom_content, good)]
+
+        batch = verify_signatures(items, public_key=pub)
+
+        assert isinstance(batch, BatchVerificationResult)
+        assert [r.valid for r in batch.results] == [True, False, True]
+        assert (batch.valid_count, batch.invalid_count) == (2, 1)
+        assert batch.all_valid is False
+        assert batch.elapsed_ms >= 0
+
+    def test_large_batch_parses_key_once(
+        self, generated_keys: tuple, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        pub, priv = generated_keys
+        items = [
+            (payload, sign_bom(payload, private_key=priv).signature)
+            for payload in (f'{{"v": {i}}}'.encode() for i in range(40))
+        ]
+        signing_module.clear_key_cache()
+        calls = []
+        real_load = serialization.load_pem_public_key
+        monkeypatch.setattr(
+            signing_module.serialization,
+            "load_pem_public_key",
+            lambda data: calls.append(data) or real_load(data),
+        )
+
+        batch = verify_signatures(items, public_key=pub, max_workers=4)
+
+        assert batch.all_valid
+        assert len(batch.results) == 40
+        assert len(calls) == 1
+
+    def test_missing_key_fails_every_item(self, tmp_path: Path, bom_content: bytes) -> None:
+        batch = verify_signatures(
+            [(bom_content, b"x" * 64)] * 3, key_path=tmp_path / "missing.pub"
+        )
+
+        assert batch.valid_count == 0
+        assert batch.invalid_count == 3
+        assert all("not found" in (r.error or "") for r in batch.results)
+
+    def test_empty_batch(self) -> None:
+        batch = verify_signatures([])
+        assert batch.results == []
+        assert batch.all_valid
+
+
 # ---------------------------------------------------------------------------
 # File Signing
 # ---------------------------------------------------------------------------
@@ -582,6 +639,27 @@ class TestValidateSignatureChain:
         assert result.valid is False
         assert any("not valid hex" in e for e in result.errors)
 
+    def test_long_chain_verified_in_batch(self, tmp_path: Path) -> None:
+        key_dir = tmp_path / "keys"
+        pub_pem, priv_pem = generate_signing_keypair(key_dir=key_dir)
+
+        snaps = [_make_snapshot('{"v": 0}', sign_with=priv_pem)]
+        for i in range(1, 30):
+            snaps.append(
+                _make_snapshot(
+                    f'{{"v": {i}}}',
+                    parent_hash=snaps[-1]["content_hash"],
+                    sign_with=priv_pem,
+                )
+            )
+        raw_sig = bytes.fromhex(snaps[20]["signature"])
+        snaps[20]["signature"] = bytes(b ^ 0xFF for b in raw_sig).hex()
+
+        result = validate_signature_chain(snaps, public_key=pub_pem)
+        assert result.verified_count == 29
+        assert result.first_break_at == 20
+        assert result.errors[0].startswith("[20] signature invalid")
+
     def test_chain_verified_count_excludes_unsigned(self, tmp_path: Path) -> None:
         key_dir = tmp_path / "keys"
         pub_pem, priv_pem = generate_signing_keypair(key_dir=key_dir)
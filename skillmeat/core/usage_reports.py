@@ -7,7 +7,7 @@ patterns, enabling cleanup suggestions, usage analysis, and trend reporting.
 import csv
 import json
 import logging
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -128,14 +128,15 @@ class UsageReportManager:
             result["usage_trend"] = self._calculate_usage_trend(result["artifact_name"])
             return result
 
-        # Multiple artifacts - add computed fields to each
+        # Multiple artifacts - add computed fields to each (one rollup query)
+        usage_trends = self._calculate_usage_trends(
+            [artifact["artifact_name"] for artifact in summary]
+        )
         for artifact in summary:
             artifact["days_since_last_use"] = self._calculate_days_since(
                 artifact["last_used"]
             )
-            artifact["usage_trend"] = self._calculate_usage_trend(
-                artifact["artifact_name"]
-            )
+            artifact["usage_trend"] = usage_trends[artifact["artifact_name"]]
 
         return {"artifacts": summary, "total_count": len(summary)}
 
@@ -454,30 +455,11 @@ class UsageReportManager:
             days = int(time_period[:-1])  # Extract number from "30d"
             cutoff = datetime.now() - timedelta(days=days)
 
-        # Build base query
-        query = """
-            SELECT
-                DATE(timestamp) as date,
-                event_type,
-                COUNT(*) as count
-            FROM events
-            WHERE 1=1
-        """
-        params = []
-
-        if artifact_name:
-            query += " AND artifact_name = ?"
-            params.append(artifact_name)
-
-        if cutoff:
-            query += " AND timestamp >= ?"
-            params.append(cutoff)
-
-        query += " GROUP BY DATE(timestamp), event_type ORDER BY date ASC"
-
-        # Execute query
-        cursor = self.db.connection.execute(query, params)
-        rows = cursor.fetchall()
+        # Read the daily rollups (survive event retention, no raw event scan)
+        daily_counts: Dict[str, Dict[str, int]] = {}
+        for row in self.db.get_daily_counts(since=cutoff, artifact_name=artifact_name):
+            by_type = daily_counts.setdefault(row["day"], {})
+            by_type[row["event_type"]] = by_type.get(row["event_type"], 0) + row["count"]
 
         # Organize results by event type
         trends = {
@@ -490,20 +472,17 @@ class UsageReportManager:
             "total_events_by_day": {},
         }
 
-        for row in rows:
-            date_str = row[0]
-            event_type = row[1]
-            count = row[2]
-
-            # Add to event type trend
-            trend_key = f"{event_type}_trend"
-            if trend_key in trends:
-                trends[trend_key].append({"date": date_str, "count": count})
+        for date_str, by_type in daily_counts.items():
+            for event_type, count in sorted(by_type.items()):
+                # Add to event type trend
+                trend_key = f"{event_type}_trend"
+                if trend_key in trends:
+                    trends[trend_key].append({"date": date_str, "count": count})
 
-            # Add to total
-            if date_str not in trends["total_events_by_day"]:
-                trends["total_events_by_day"][date_str] = 0
-            trends["total_events_by_day"][date_str] += count
+                # Add to total
+                if date_str not in trends["total_events_by_day"]:
+                    trends["total_events_by_day"][date_str] = 0
+                trends["total_events_by_day"][date_str] += count
 
         return trends
 
@@ -684,30 +663,60 @@ class UsageReportManager:
         Returns:
             "increasing", "decreasing", or "stable"
         """
-        if not self._analytics_enabled or self.db is None:
-            return "stable"
+        return self._calculate_usage_trends([artifact_name], days)[artifact_name]
 
-        # Get events for last N days, grouped by week
-        cutoff = datetime.now() - timedelta(days=days)
+    def _calculate_usage_trends(
+        self, artifact_names: List[str], days: int = 30
+    ) -> Dict[str, str]:
+        """Calculate usage trends for several artifacts from the daily rollups.
 
-        query = """
-            SELECT
-                (julianday(timestamp) - julianday(?)) / 7 as week_num,
-                COUNT(*) as count
-            FROM events
-            WHERE artifact_name = ? AND timestamp >= ?
-            GROUP BY week_num
-            ORDER BY week_num ASC
+        Args:
+            artifact_names: Names of artifacts
+            days: Number of days to analyze (default: 30)
+
+        Returns:
+            Dict mapping artifact name to "increasing", "decreasing", or "stable"
         """
+        trends = {name: "stable" for name in artifact_names}
+        if not self._analytics_enabled or self.db is None or not artifact_names:
+            return trends
+
+        # Get counts for last N days, grouped by week
+        cutoff = datetime.now() - timedelta(days=days)
+        rows = self.db.get_daily_counts(
+            since=cutoff,
+            artifact_name=artifact_names[0] if len(artifact_names) == 1 else None,
+        )
+
+        weekly: Dict[str, Dict[int, int]] = {}
+        for row in rows:
+            name = row["artifact_name"]
+            if name not in trends:
+                continue
+            week_num = (date.fromisoformat(row["day"]) - cutoff.date()).days // 7
+            buckets = weekly.setdefault(name, {})
+            buckets[week_num] = buckets.get(week_num, 0) + row["count"]
+
+        for name, buckets in weekly.items():
+            trends[name] = self._classify_trend(
+                [buckets[week_num] for week_num in sorted(buckets)]
+            )
+        return trends
+
+    @staticmethod
+    def _classify_trend(counts: List[int]) -> str:
+        """Classify a series of weekly counts as a usage trend.
 
-        cursor = self.db.connection.execute(query, (cutoff, artifact_name, cutoff))
-        rows = cursor.fetchall()
+        Args:
+            counts: Event counts per week, oldest first (empty weeks omitted)
 
-        if len(rows) < 2:
+        Returns:
+            "increasing", "decreasing", or "stable"
+        """
+        if len(counts) < 2:
             return "stable"
 
         # Simple linear trend: compare first half vs second half
-        counts = [row[1] for row in rows]
         mid = len(counts) // 2
         first_half_avg = sum(counts[:mid]) / mid if mid > 0 else 0
         second_half_avg = (
@@ -8,7 +8,7 @@ import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional
 
 from skillmeat.core.artifact import ArtifactType
 from skillmeat.core.collection import CollectionManager
@@ -17,6 +17,9 @@ from skillmeat.storage.deployment import DeploymentTracker
 from skillmeat.utils.filesystem import compute_content_hash
 from skillmeat.utils.logging import redact_path
 
+if TYPE_CHECKING:
+    from skillmeat.cache.deployment_index import DeploymentIndex
+
 
 @dataclass
 class ArtifactVersion:
@@ -219,22 +222,32 @@ class VersionGraphBuilder:
     - Modification status for each deployment
     - Orphaned deployments (no matching collection version)
 
-    Implements caching with 5-minute TTL for performance.
+    Implements caching with 5-minute TTL for performance.  Projects come from
+    the shared :class:`~skillmeat.core.project_registry.ProjectRegistry` and
+    deployments from the cache-DB :class:`DeploymentIndex`, which re-reads
+    only projects whose deployment files changed since the last build.
     """
 
     # Cache duration in seconds
     CACHE_TTL = 300  # 5 minutes
 
-    def __init__(self, collection_mgr: Optional[CollectionManager] = None):
+    def __init__(
+        self,
+        collection_mgr: Optional[CollectionManager] = None,
+        deployment_index: Optional["DeploymentIndex"] = None,
+    ):
         """Initialize version graph builder.
 
         Args:
             collection_mgr: CollectionManager instance (creates default if None)
+            deployment_index: Deployment index to query (opens the default
+                cache DB on first use if None)
         """
         if collection_mgr is None:
             collection_mgr = CollectionManager()
 
         self.collection_mgr = collection_mgr
+        self._deployment_index = deployment_index
         self._cache: Dict[str, tuple[VersionGraph, datetime]] = {}
         self.logger = logging.getLogger(__name__)
 
@@ -437,8 +450,10 @@ class VersionGraphBuilder:
     ) -> List[Deployment]:
         """Find all deployments of an artifact across all projects.
 
-        Scans all discovered projects for deployment records matching the
-        specified artifact.
+        Refreshes the deployment index for the registry's projects (only
+        changed deployment files are re-read) and looks the artifact up in
+        it.  Falls back to reading every project's deployment file if the
+        cache DB is unavailable.
 
         Args:
             artifact_name: Artifact name
@@ -447,11 +462,24 @@ class VersionGraphBuilder:
         Returns:
             List of Deployment objects with project_path attached
         """
-        deployments = []
-
-        # Discover all projects with .claude directories
         project_paths = self._discover_projects()
 
+        index = self._get_deployment_index()
+        if index is not None:
+            try:
+                index.refresh(project_paths)
+                deployments = index.find(artifact_name, artifact_type.value)
+                self.logger.debug(
+                    f"Found {len(deployments)} indexed deployments of "
+                    f"{artifact_type.value}/{artifact_name}"
+                )
+                return deployments
+            except Exception as e:
+                self.logger.warning(
+                    f"Deployment index unavailable, reading projects directly: {e}"
+                )
+
+        deployments = []
         for project_path in project_paths:
             try:
                 # Read deployments from project
@@ -541,60 +569,33 @@ class VersionGraphBuilder:
 
         return node
 
-    def _discover_projects(self) -> List[Path]:
-        """Discover all projects with .claude directories.
+    def _get_deployment_index(self) -> Optional["DeploymentIndex"]:
+        """Return the deployment index, opening the default cache DB lazily."""
+        if self._deployment_index is None:
+            try:
+                from skillmeat.cache.deployment_index import DeploymentIndex
+                from skillmeat.cache.repository import CacheRepository
+
+                self._deployment_index = DeploymentIndex(CacheRepository())
+            except Exception as e:
+                self.logger.warning(f"Could not open deployment index: {e}")
+                return None
+        return self._deployment_index
 
-        This is a simple implementation that checks:
-        1. Common project locations (~/projects, ~/dev, ~/work)
-        2. Current working directory and siblings
+    def _discover_projects(self) -> List[Path]:
+        """Return the projects known to the shared project registry.
 
-        Future enhancement: Use configuration for project discovery paths.
+        The registry caches its filesystem scan, so repeated graph builds do
+        not walk the search paths again.
 
         Returns:
             List of absolute paths to project directories
         """
-        projects: Set[Path] = set()
-
-        # Check common project locations
-        home = Path.home()
-        common_locations = [
-            home / "projects",
-            home / "dev",
-            home / "work",
-            home / "code",
-            home / "workspace",
-        ]
-
-        for location in common_locations:
-            if location.exists() and location.is_dir():
-                # Scan for .claude directories (1 level deep)
-                try:
-                    for child in location.iterdir():
-                        if child.is_dir():
-                            claude_dir = child / ".claude"
-                            if claude_dir.exists() and claude_dir.is_dir():
-                                projects.add(child)
-                except PermissionError:
-                    # Skip directories we can't read
-                    continue
-
-        # Check current working directory
-        cwd = Path.cwd()
-        if (cwd / ".claude").exists():
-            projects.add(cwd)
-
-        # Check CWD parent's children (sibling projects)
-        try:
-            if cwd.parent.exists():
-                for sibling in cwd.parent.iterdir():
-                    if sibling.is_dir() and (sibling / ".claude").exists():
-                        projects.add(sibling)
-        except PermissionError:
-            pass
-
-        result = sorted(projects)  # Sort for consistency
-        self.logger.debug(f"Discovered {len(result)} projects with .claude directories")
+        from skillmeat.core.project_registry import ProjectRegistry
 
+        registry = ProjectRegistry.get_instance_sync()
+        result = sorted(registry.get_project_paths_sync())
+        self.logger.debug(f"Registry returned {len(result)} projects")
         return result
 
     def clear_cache(self) -> None:
@@ -1,10 +1,21 @@
 """Version lineage utilities for tracking artifact version history.
 
-The version lineage is a list of content hashes representing the ancestry
-of a version, ordered from oldest to newest (root to current).
+Ancestry is indexed with skip pointers (binary lifting) stored on each
+``ArtifactVersion``:
+
+- ``lineage_depth`` — generations from the root version (0 = root)
+- ``ancestor_skips`` — element ``k`` is the content hash of the ``2**k``-th
+  ancestor, so a version stores O(log depth) hashes
+
+Ancestor, common-ancestor and depth queries therefore load O(log n) rows by
+the unique ``content_hash`` index instead of parsing full ancestry lists.
+``version_lineage`` is kept as a bounded window of recent hashes (see
+:data:`LINEAGE_WINDOW`) for display; rows recorded before the index existed
+are backfilled by migration ``20260314_0001_add_version_ancestry_index`` and
+are still handled by walking ``parent_hash`` if unindexed.
 
 This module provides utilities for:
-- Building version lineage by extending parent lineage
+- Building version lineage and the ancestry index for new versions
 - Finding common ancestors for three-way merge
 - Querying version chains and history
 - Checking version existence
@@ -14,12 +25,325 @@ and are used by deployment and sync operations to maintain version history.
 """
 
 import json
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
 from skillmeat.cache.models import ArtifactVersion
 
+# Number of recent hashes kept in ArtifactVersion.version_lineage
+LINEAGE_WINDOW = 32
+
+
+# =============================================================================
+# Ancestry index
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class _AncestryNode:
+    """Indexed view of one version: its hash, depth, and skip pointers."""
+
+    content_hash: str
+    depth: int
+    skips: Tuple[str, ...]
+
+
+class _NodeLoader:
+    """Loads ancestry nodes by content hash, memoized for one query.
+
+    Rows without an index (recorded before ``lineage_depth`` existed and not
+    yet backfilled) are resolved by walking ``parent_hash``; their only skip
+    pointer is the parent.  Hashes with no row are treated as roots unless the
+    caller knows their depth.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+        self._nodes: Dict[str, Optional[_AncestryNode]] = {}
+        self._versions: Dict[str, ArtifactVersion] = {}
+
+    def get(self, content_hash: str) -> Optional[_AncestryNode]:
+        if content_hash in self._nodes:
+            return self._nodes[content_hash]
+        version = (
+            self.session.query(ArtifactVersion)
+            .filter_by(content_hash=content_hash)
+            .first()
+        )
+        node = None
+        if version is not None:
+            self._versions[content_hash] = version
+            node = self._from_version(version)
+        self._nodes[content_hash] = node
+        return node
+
+    def seed(self, content_hash: str, version: ArtifactVersion) -> None:
+        """Register the row the caller already loaded for ``content_hash``."""
+        self._versions[content_hash] = version
+        self._nodes[content_hash] = self._from_version(version)
+
+    def version(self, content_hash: str) -> Optional[ArtifactVersion]:
+        """Return the row loaded for ``content_hash`` by :meth:`get`."""
+        return self._versions.get(content_hash)
+
+    def is_indexed(self, content_hash: str) -> bool:
+        """True if the row for ``content_hash`` carries an ancestry index."""
+        version = self._versions.get(content_hash)
+        return version is not None and version.lineage_depth is not None
+
+    def get_or_placeholder(self, content_hash: str, depth: int) -> _AncestryNode:
+        """Return the node, or a skip-less placeholder when no row exists."""
+        node = self.get(content_hash)
+        if node is None:
+            node = _AncestryNode(content_hash, max(depth, 0), ())
+        return node
+
+    def _from_version(self, version: ArtifactVersion) -> _AncestryNode:
+        if version.lineage_depth is not None:
+            return self._indexed(version)
+
+        # Unindexed legacy row: depth = 1 + parent's depth.  Walk up the
+        # unindexed chain iteratively, then assign depths top-down, so long
+        # legacy chains cannot exhaust the recursion limit.
+        chain = [version]
+        seen = {version.content_hash}
+        base_depth: Optional[int] = None  # depth of the parent of chain[-1]
+        while chain[-1].parent_hash:
+            parent_hash = chain[-1].parent_hash
+            if parent_hash in seen:
+                break  # Corrupt cycle: treat the top of the chain as a root
+            if parent_hash in self._nodes:
+                parent_node = self._nodes[parent_hash]
+                base_depth = parent_node.depth if parent_node is not None else 0
+                break
+            parent = (
+                self.session.query(ArtifactVersion)
+                .filter_by(content_hash=parent_hash)
+                .first()
+            )
+            if parent is None:
+                # Parent never recorded: it is the root of this lineage
+                self._nodes[parent_hash] = None
+                base_depth = 0
+                break
+            self._versions[parent_hash] = parent
+            if parent.lineage_depth is not None:
+                parent_node = self._indexed(parent)
+                self._nodes[parent_hash] = parent_node
+                base_depth = parent_node.depth
+                break
+            chain.append(parent)
+            seen.add(parent_hash)
+
+        node: Optional[_AncestryNode] = None
+        for legacy in reversed(chain):
+            if node is None and base_depth is None:
+                node = _AncestryNode(legacy.content_hash, 0, ())
+            else:
+                depth = (node.depth if node is not None else base_depth) + 1
+                node = _AncestryNode(legacy.content_hash, depth, (legacy.parent_hash,))
+            self._nodes[legacy.content_hash] = node
+        return node
+
+    @staticmethod
+    def _indexed(version: ArtifactVersion) -> _AncestryNode:
+        return _AncestryNode(
+            version.content_hash,
+            version.lineage_depth,
+            tuple(version.get_ancestor_skips()),
+        )
+
+
+def _lift(
+    loader: _NodeLoader, node: _AncestryNode, target_depth: int
+) -> Optional[_AncestryNode]:
+    """Return the ancestor of ``node`` at ``target_depth`` (O(log n) jumps)."""
+    while node.depth > target_depth:
+        if not node.skips:
+            return None
+        distance = node.depth - target_depth
+        k = min(distance.bit_length() - 1, len(node.skips) - 1)
+        node = loader.get_or_placeholder(node.skips[k], node.depth - (1 << k))
+    return node
+
+
+def compute_ancestry(
+    session: Session,
+    parent_hash: Optional[str],
+    parent: Optional[ArtifactVersion] = None,
+) -> Tuple[int, List[str]]:
+    """Compute the ancestry index entry for a new child of ``parent_hash``.
+
+    Args:
+        session: Database session
+        parent_hash: Content hash of the parent version (None for root)
+        parent: Parent row if the caller already loaded it (saves a query)
+
+    Returns:
+        Tuple of (lineage depth, skip-pointer ancestor hashes)
+
+    Example:
+        >>> compute_ancestry(session, None)
+        (0, [])
+        >>> depth, skips = compute_ancestry(session, "abc123")
+        >>> skips[0]
+        'abc123'
+    """
+    if parent_hash is None:
+        return 0, []
+
+    loader = _NodeLoader(session)
+    if parent is not None:
+        loader.seed(parent_hash, parent)
+    parent_node = loader.get(parent_hash)
+    if parent_node is None:
+        # Parent never recorded (legacy data): it is the root of this lineage
+        return 1, [parent_hash]
+
+    skips = [parent_hash]
+    node: Optional[_AncestryNode] = parent_node
+    k = 0
+    while node is not None and k < len(node.skips):
+        # The 2**(k+1)-th ancestor is the 2**k-th ancestor of the 2**k-th one
+        skips.append(node.skips[k])
+        node = loader.get(node.skips[k])
+        k += 1
+    return parent_node.depth + 1, skips
+
+
+def index_version(
+    session: Session,
+    version: ArtifactVersion,
+    parent: Optional[ArtifactVersion] = None,
+) -> None:
+    """Populate ``lineage_depth`` and ``ancestor_skips`` on a new version.
+
+    Args:
+        session: Database session
+        version: Version whose ``parent_hash`` is already set
+        parent: Parent row if the caller already loaded it
+    """
+    depth, skips = compute_ancestry(session, version.parent_hash, parent=parent)
+    version.lineage_depth = depth
+    version.set_ancestor_skips(skips)
+
+
+def build_ancestry_index(
+    parents: Dict[str, Optional[str]],
+) -> Dict[str, Tuple[int, List[str]]]:
+    """Compute ancestry index entries for a whole set of versions in memory.
+
+    Used to backfill existing rows.  Parents that are not in ``parents`` are
+    treated as unrecorded roots, matching :func:`compute_ancestry`.
+
+    Args:
+        parents: Mapping of content hash to parent hash (None for roots)
+
+    Returns:
+        Mapping of content hash to (lineage depth, skip-pointer hashes)
+    """
+    index: Dict[str, Tuple[int, List[str]]] = {}
+
+    for start in parents:
+        # Walk up to the first indexed ancestor (or root), then fill downwards
+        chain: List[str] = []
+        seen = set()
+        current: Optional[str] = start
+        while current is not None and current in parents and current not in index:
+            if current in seen:
+                # Corrupt cycle: cut it by treating this version as a root
+                index[current] = (0, [])
+                break
+            seen.add(current)
+            chain.append(current)
+            current = parents[current]
+
+        for content_hash in reversed(chain):
+            parent_hash = parents[content_hash]
+            if parent_hash is None:
+                index[content_hash] = (0, [])
+                continue
+            parent_entry = index.get(parent_hash)
+            if parent_entry is None:
+                index[content_hash] = (1, [parent_hash])
+                continue
+            skips = [parent_hash]
+            entry: Optional[Tuple[int, List[str]]] = parent_entry
+            k = 0
+            while entry is not None and k < len(entry[1]):
+                skips.append(entry[1][k])
+                entry = index.get(entry[1][k])
+                k += 1
+            index[content_hash] = (parent_entry[0] + 1, skips)
+
+    return index
+
+
+def backfill_ancestry_index(session: Session, batch_size: int = 500) -> int:
+    """Index every ``ArtifactVersion`` that has no ``lineage_depth`` yet.
+
+    Args:
+        session: Database session (caller commits)
+        batch_size: Rows updated per flush
+
+    Returns:
+        Number of versions indexed
+    """
+    rows = session.query(
+        ArtifactVersion.content_hash,
+        ArtifactVersion.parent_hash,
+        ArtifactVersion.lineage_depth,
+    ).all()
+    pending = {row[0] for row in rows if row[2] is None}
+    if not pending:
+        return 0
+
+    index = build_ancestry_index({row[0]: row[1] for row in rows})
+    updated = 0
+    for version in (
+        session.query(ArtifactVersion)
+        .filter(ArtifactVersion.lineage_depth.is_(None))
+        .yield_per(batch_size)
+    ):
+        depth, skips = index[version.content_hash]
+        version.lineage_depth = depth
+        version.set_ancestor_skips(skips)
+        updated += 1
+        if updated % batch_size == 0:
+            session.flush()
+    session.flush()
+    return updated
+
+
+def is_ancestor(session: Session, ancestor_hash: str, descendant_hash: str) -> bool:
+    """Check whether one version is an ancestor of (or equal to) another.
+
+    Args:
+        session: Database session
+        ancestor_hash: Candidate ancestor content hash
+        descendant_hash: Candidate descendant content hash
+
+    Returns:
+        True if ``ancestor_hash`` is in the ancestry of ``descendant_hash``
+    """
+    loader = _NodeLoader(session)
+    descendant = loader.get(descendant_hash)
+    if descendant is None:
+        return ancestor_hash == descendant_hash
+    if not loader.is_indexed(descendant_hash):
+        lineage = loader.version(descendant_hash).get_lineage_list()
+        return ancestor_hash == descendant_hash or ancestor_hash in lineage
+    ancestor = loader.get_or_placeholder(ancestor_hash, 0)
+    lifted = _lift(loader, descendant, ancestor.depth)
+    return lifted is not None and lifted.content_hash == ancestor_hash
+
+
+# =============================================================================
+# Lineage queries
+# =============================================================================
+
 
 def build_version_lineage(
     session: Session,
@@ -36,6 +360,9 @@ def build_version_lineage(
     - If parent exists with lineage: lineage = parent_lineage + [current_hash]
     - If parent exists without lineage (legacy): lineage = [parent_hash, current_hash]
 
+    Only the most recent :data:`LINEAGE_WINDOW` hashes are kept; ancestry
+    queries use the ancestry index (see :func:`index_version`).
+
     Args:
         session: Database session
         parent_hash: Content hash of parent version (None for root)
@@ -63,7 +390,7 @@ def build_version_lineage(
     if parent and parent.version_lineage:
         # Extend parent's lineage
         parent_lineage = json.loads(parent.version_lineage)
-        return parent_lineage + [current_hash]
+        return (parent_lineage + [current_hash])[-LINEAGE_WINDOW:]
     elif parent:
         # Parent exists but doesn't have lineage (legacy) - create minimal chain
         return [parent_hash, current_hash]
@@ -80,14 +407,16 @@ def find_common_ancestor(
 ) -> Optional[str]:
     """Find most recent common ancestor between two versions.
 
-    Used for three-way merge to identify the base version. Compares version
-    lineages to find the most recent shared ancestor hash.
+    Used for three-way merge to identify the base version.
 
-    Algorithm:
-    1. Load both versions from database
-    2. Parse their lineages (lists of ancestor hashes)
-    3. Find intersection of lineages
-    4. Return most recent common hash (latest in both lineages)
+    Algorithm (binary lifting over the ancestry index):
+    1. Load both versions and lift the deeper one to the other's depth
+    2. If they meet, that version is the common ancestor
+    3. Otherwise jump both by the largest skip whose ancestors still differ,
+       until their parents coincide
+
+    Each step loads one row by content hash, so the lookup costs O(log n)
+    queries for lineages of depth n.
 
     Args:
         session: Database session
@@ -99,8 +428,8 @@ def find_common_ancestor(
 
     Example:
         >>> # Two versions with shared history
-        >>> # Version A: ["root", "v1", "v2-local"]
-        >>> # Version B: ["root", "v1", "v2-remote"]
+        >>> # Version A: root -> v1 -> v2-local
+        >>> # Version B: root -> v1 -> v2-remote
         >>> ancestor = find_common_ancestor(session, "v2-local", "v2-remote")
         >>> assert ancestor == "v1"  # Most recent common ancestor
 
@@ -108,13 +437,43 @@ def find_common_ancestor(
         >>> ancestor = find_common_ancestor(session, "orphan-a", "orphan-b")
         >>> assert ancestor is None
     """
-    version_a = session.query(ArtifactVersion).filter_by(content_hash=hash_a).first()
-    version_b = session.query(ArtifactVersion).filter_by(content_hash=hash_b).first()
+    loader = _NodeLoader(session)
+    node_a = loader.get(hash_a)
+    node_b = loader.get(hash_b)
 
-    if not version_a or not version_b:
+    if node_a is None or node_b is None:
+        return None
+    if not (loader.is_indexed(hash_a) and loader.is_indexed(hash_b)):
+        return _legacy_common_ancestor(loader.version(hash_a), loader.version(hash_b))
+
+    if node_a.depth > node_b.depth:
+        node_a = _lift(loader, node_a, node_b.depth)
+    elif node_b.depth > node_a.depth:
+        node_b = _lift(loader, node_b, node_a.depth)
+    if node_a is None or node_b is None:
         return None
 
-    # Parse lineages (handle missing lineage gracefully)
+    while node_a.content_hash != node_b.content_hash:
+        shared = min(len(node_a.skips), len(node_b.skips))
+        if shared == 0:
+            return None
+        for k in reversed(range(shared)):
+            if node_a.skips[k] != node_b.skips[k]:
+                depth = node_a.depth - (1 << k)
+                node_a = loader.get_or_placeholder(node_a.skips[k], depth)
+                node_b = loader.get_or_placeholder(node_b.skips[k], depth)
+                break
+        else:
+            # All skip ancestors agree, so the parents are the same version
+            return node_a.skips[0]
+
+    return node_a.content_hash
+
+
+def _legacy_common_ancestor(
+    version_a: ArtifactVersion, version_b: ArtifactVersion
+) -> Optional[str]:
+    """Common ancestor from JSON lineages, for rows without an ancestry index."""
     lineage_a = version_a.get_lineage_list() or []
     lineage_b = version_b.get_lineage_list() or []
 
@@ -122,18 +481,9 @@ def find_common_ancestor(
     if not lineage_a or not lineage_b:
         return None
 
-    # Convert to sets for efficient lookup
-    set_a = set(lineage_a)
-    set_b = set(lineage_b)
-
-    # Find common hashes
-    common = set_a & set_b
-
-    if not common:
-        return None
+    common = set(lineage_a) & set(lineage_b)
 
     # Return most recent common ancestor (last one in both lineages)
-    # Walk lineage_a backwards to find first common hash
     for hash_ in reversed(lineage_a):
         if hash_ in common:
             return hash_
@@ -270,16 +620,15 @@ def get_lineage_depth(
         >>> depth = get_lineage_depth(session, "abc123")
         >>> print(f"This version is {depth} generations from root")
     """
-    version = (
-        session.query(ArtifactVersion).filter_by(content_hash=content_hash).first()
-    )
-
-    if not version:
+    loader = _NodeLoader(session)
+    node = loader.get(content_hash)
+    if node is None:
         return 0
-
-    lineage = version.get_lineage_list()
-    # Lineage includes current hash, so depth = len - 1
-    return max(0, len(lineage) - 1) if lineage else 0
+    if not loader.is_indexed(content_hash):
+        # Legacy row: lineage includes current hash, so depth = len - 1
+        lineage = loader.version(content_hash).get_lineage_list()
+        return max(0, len(lineage) - 1) if lineage else 0
+    return node.depth
 
 
 def get_root_version(
@@ -336,15 +685,49 @@ def trace_lineage_path(
         ...     print(f"Path: {' -> '.join([h[:8] for h in path])}")
         Path: abc12345 -> def67890 -> ghi11111
     """
-    # Get both versions
-    from_version = (
-        session.query(ArtifactVersion).filter_by(content_hash=from_hash).first()
-    )
-    to_version = session.query(ArtifactVersion).filter_by(content_hash=to_hash).first()
+    loader = _NodeLoader(session)
+    from_node = loader.get(from_hash)
+    to_node = loader.get(to_hash)
 
-    if not from_version or not to_version:
+    if from_node is None or to_node is None:
+        return None
+    if not (loader.is_indexed(from_hash) and loader.is_indexed(to_hash)):
+        return _legacy_lineage_path(
+            loader.version(from_hash), loader.version(to_hash), from_hash, to_hash
+        )
+
+    if from_node.depth <= to_node.depth:
+        # Forward path: from_hash must be an ancestor of to_hash
+        lifted = _lift(loader, to_node, from_node.depth)
+        if lifted is None or lifted.content_hash != from_hash:
+            return None
+        return list(reversed(_walk_parents(loader, to_node, from_node.depth)))
+
+    # Backward path: to_hash must be an ancestor of from_hash
+    lifted = _lift(loader, from_node, to_node.depth)
+    if lifted is None or lifted.content_hash != to_hash:
         return None
+    return _walk_parents(loader, from_node, to_node.depth)
+
+
+def _walk_parents(
+    loader: _NodeLoader, node: _AncestryNode, stop_depth: int
+) -> List[str]:
+    """Return hashes from ``node`` up to the ancestor at ``stop_depth``."""
+    path = [node.content_hash]
+    while node.depth > stop_depth and node.skips:
+        node = loader.get_or_placeholder(node.skips[0], node.depth - 1)
+        path.append(node.content_hash)
+    return path
 
+
+def _legacy_lineage_path(
+    from_version: ArtifactVersion,
+    to_version: ArtifactVersion,
+    from_hash: str,
+    to_hash: str,
+) -> Optional[List[str]]:
+    """Lineage path from JSON lineages, for rows without an ancestry index."""
     from_lineage = from_version.get_lineage_list() or []
     to_lineage = to_version.get_lineage_list() or []
 
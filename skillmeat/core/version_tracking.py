@@ -12,6 +12,7 @@ from typing import Optional
 from sqlalchemy.orm import Session
 
 from skillmeat.cache.models import ArtifactVersion
+from skillmeat.core.version_lineage import LINEAGE_WINDOW, index_version
 
 
 def create_deployment_version(
@@ -53,6 +54,7 @@ def create_deployment_version(
         change_origin="deployment",
         version_lineage=json.dumps([content_hash]),
     )
+    index_version(session, version)
     session.add(version)
     session.flush()  # Ensure ID is generated
     return version
@@ -97,7 +99,7 @@ def create_sync_version(
 
     if parent_version and parent_version.version_lineage:
         parent_lineage = json.loads(parent_version.version_lineage)
-        lineage = [content_hash] + parent_lineage
+        lineage = ([content_hash] + parent_lineage)[:LINEAGE_WINDOW]
     else:
         # Fallback: just parent + current
         lineage = [content_hash, parent_hash]
@@ -110,6 +112,7 @@ def create_sync_version(
         change_origin="sync",
         version_lineage=json.dumps(lineage),
     )
+    index_version(session, version, parent=parent_version)
     session.add(version)
     session.flush()  # Ensure ID is generated
     return version
@@ -154,7 +157,7 @@ def create_local_modification_version(
 
     if parent_version and parent_version.version_lineage:
         parent_lineage = json.loads(parent_version.version_lineage)
-        lineage = [content_hash] + parent_lineage
+        lineage = ([content_hash] + parent_lineage)[:LINEAGE_WINDOW]
     else:
         # Fallback: just parent + current
         lineage = [content_hash, parent_hash]
@@ -167,6 +170,7 @@ def create_local_modification_version(
         change_origin="local_modification",
         version_lineage=json.dumps(lineage),
     )
+    index_version(session, version, parent=parent_version)
     session.add(version)
     session.flush()  # Ensure ID is generated
     return version
@@ -0,0 +1,250 @@
+"""Low-overhead latency histograms for SkillMeat hot paths.
+
+Complements :mod:`skillmeat.observability.timing` (structured perf logs) with
+Prometheus histograms for the expensive engine internals: content hashing,
+heuristic detection, similarity scoring, deployment status batches, drift
+checks, manifest parsing and GitHub calls.  Observations are exported on the
+existing ``/metrics`` endpoint.
+
+Each sampled call records:
+
+* ``skillmeat_hotpath_duration_seconds{operation}`` - wall-clock duration
+* ``skillmeat_hotpath_phase_duration_seconds{operation, phase}`` - per-phase
+  breakdown.  ``cpu`` is the calling thread's CPU time and is always recorded;
+  ``io`` and ``db`` are wall time spent inside :func:`hotpath_phase` blocks.
+  Wall time not covered by ``cpu`` is time spent waiting (I/O, locks, network).
+
+Cost control:
+
+* ``SKILLMEAT_HOTPATH_METRICS=0`` disables recording; decorated functions then
+  pay a single boolean check per call.
+* ``SKILLMEAT_HOTPATH_SAMPLE_RATE`` (0.0-1.0, default 1.0) records only a
+  random fraction of calls.
+* Histogram label children are resolved once and reused.
+
+Usage::
+
+    from skillmeat.observability.hotpath import hot_path, hotpath_phase
+
+    @hot_path("manifest.read")
+    def read(self, collection_path):
+        with hotpath_phase("io"):
+            content = manifest_file.read_bytes()
+        return parse(content)
+"""
+
+import functools
+import logging
+import os
+import random
+import threading
+import time
+from contextlib import nullcontext
+from contextvars import ContextVar
+from types import TracebackType
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Environment variables controlling hot-path instrumentation
+HOTPATH_ENABLED_ENV = "SKILLMEAT_HOTPATH_METRICS"
+HOTPATH_SAMPLE_RATE_ENV = "SKILLMEAT_HOTPATH_SAMPLE_RATE"
+
+# Phases recorded explicitly via hotpath_phase() (cpu is recorded implicitly)
+PHASES = ("io", "db")
+
+_DISABLED_VALUES = {"0", "false", "no", "off"}
+
+
+def _env_enabled() -> bool:
+    return os.environ.get(HOTPATH_ENABLED_ENV, "1").strip().lower() not in _DISABLED_VALUES
+
+
+def _env_sample_rate() -> float:
+    raw = os.environ.get(HOTPATH_SAMPLE_RATE_ENV)
+    if raw is None:
+        return 1.0
+    try:
+        return min(1.0, max(0.0, float(raw)))
+    except ValueError:
+        logger.warning("Invalid %s=%r, using 1.0", HOTPATH_SAMPLE_RATE_ENV, raw)
+        return 1.0
+
+
+_enabled: bool = _env_enabled()
+_sample_rate: float = _env_sample_rate()
+
+_current_timer: ContextVar[Optional["HotPathTimer"]] = ContextVar(
+    "skillmeat_hotpath_timer", default=None
+)
+
+# Cached histogram children keyed by label values
+_duration_children: Dict[str, Any] = {}
+_phase_children: Dict[Tuple[str, str], Any] = {}
+_children_lock = threading.Lock()
+
+_NULL_PHASE = nullcontext()
+
+
+def configure(
+    enabled: Optional[bool] = None, sample_rate: Optional[float] = None
+) -> None:
+    """Override hot-path instrumentation settings at runtime.
+
+    Args:
+        enabled: Enable or disable recording (None leaves it unchanged).
+        sample_rate: Fraction of calls to record, clamped to 0.0-1.0
+            (None leaves it unchanged).
+    """
+    global _enabled, _sample_rate
+    if enabled is not None:
+        _enabled = enabled
+    if sample_rate is not None:
+        _sample_rate = min(1.0, max(0.0, sample_rate))
+
+
+def is_enabled() -> bool:
+    """Return True when hot-path recording is enabled."""
+    return _enabled
+
+
+def _duration_child(operation: str) -> Any:
+    child = _duration_children.get(operation)
+    if child is None:
+        from skillmeat.observability.metrics import hotpath_duration
+
+        with _children_lock:
+            child = _duration_children.setdefault(
+                operation, hotpath_duration.labels(operation=operation)
+            )
+    return child
+
+
+def _phase_child(operation: str, phase: str) -> Any:
+    key = (operation, phase)
+    child = _phase_children.get(key)
+    if child is None:
+        from skillmeat.observability.metrics import hotpath_phase_duration
+
+        with _children_lock:
+            child = _phase_children.setdefault(
+                key, hotpath_phase_duration.labels(operation=operation, phase=phase)
+            )
+    return child
+
+
+class HotPathTimer:
+    """Context manager recording a hot-path histogram observation.
+
+    Sampling is decided on entry; unsampled blocks record nothing and make
+    nested :func:`hotpath_phase` calls no-ops.
+
+    Args:
+        operation: Dot-separated operation name (e.g. ``"sync.check_drift"``).
+
+    Example::
+
+        with HotPathTimer("deployment.compute_statuses_batch"):
+            statuses = compute()
+    """
+
+    __slots__ = ("operation", "phases", "_sampled", "_start", "_cpu_start", "_token")
+
+    def __init__(self, operation: str) -> None:
+        self.operation = operation
+        self.phases: Dict[str, float] = {}
+        self._sampled = False
+        self._start = 0.0
+        self._cpu_start = 0.0
+        self._token: Any = None
+
+    def __enter__(self) -> "HotPathTimer":
+        self._sampled = _enabled and (
+            _sample_rate >= 1.0 or random.random() < _sample_rate
+        )
+        if self._sampled:
+            self._token = _current_timer.set(self)
+            self._cpu_start = time.thread_time()
+            self._start = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> bool:
+        if not self._sampled:
+            return False
+        elapsed = time.perf_counter() - self._start
+        cpu = time.thread_time() - self._cpu_start
+        _current_timer.reset(self._token)
+        try:
+            _duration_child(self.operation).observe(elapsed)
+            _phase_child(self.operation, "cpu").observe(cpu)
+            for phase, seconds in self.phases.items():
+                _phase_child(self.operation, phase).observe(seconds)
+        except Exception as e:  # Metrics must never break the hot path
+            logger.debug("Failed to record hot-path metrics: %s", e)
+        return False
+
+
+class _PhaseTimer:
+    __slots__ = ("_timer", "_phase", "_start")
+
+    def __init__(self, timer: HotPathTimer, phase: str) -> None:
+        self._timer = timer
+        self._phase = phase
+        self._start = 0.0
+
+    def __enter__(self) -> "_PhaseTimer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> bool:
+        phases = self._timer.phases
+        phases[self._phase] = (
+            phases.get(self._phase, 0.0) + time.perf_counter() - self._start
+        )
+        return False
+
+
+def hotpath_phase(phase: str) -> Any:
+    """Attribute the enclosed block to a phase of the active hot-path timer.
+
+    Returns a shared no-op context manager when no sampled timer is active.
+
+    Args:
+        phase: Phase name, one of :data:`PHASES` (``"io"`` or ``"db"``).
+    """
+    timer = _current_timer.get()
+    if timer is None:
+        return _NULL_PHASE
+    return _PhaseTimer(timer, phase)
+
+
+def hot_path(operation: str) -> Callable[[F], F]:
+    """Decorator recording hot-path histograms for each (sampled) call.
+
+    Args:
+        operation: Dot-separated operation name used as the ``operation`` label.
+
+    Example:
+        >>> @hot_path("sync.check_drift")
+        ... def check_drift(self, project_path):
+        ...     ...
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _enabled:
+                return func(*args, **kwargs)
+            with HotPathTimer(operation):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -62,6 +62,21 @@ api_errors_total = Counter(
     ["method", "endpoint", "error_type"],
 )
 
+# Recorded via skillmeat.observability.query_stats
+api_db_queries = Histogram(
+    "skillmeat_api_db_queries",
+    "SQL statements executed per API request",
+    ["method", "endpoint"],
+    buckets=[0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000],
+)
+
+api_db_duration = Histogram(
+    "skillmeat_api_db_duration_seconds",
+    "Time spent executing SQL statements per API request in seconds",
+    ["method", "endpoint"],
+    buckets=[0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
+)
+
 # =============================================================================
 # Marketplace Metrics
 # =============================================================================
@@ -329,6 +344,43 @@ memory_inbox_size = Gauge(
     ["project_id"],
 )
 
+# =============================================================================
+# Hot Path Metrics
+# =============================================================================
+
+# Recorded via skillmeat.observability.hotpath (sampled, can be disabled)
+_HOTPATH_BUCKETS = [
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+]
+
+hotpath_duration = Histogram(
+    "skillmeat_hotpath_duration_seconds",
+    "Wall-clock duration of instrumented hot-path operations in seconds",
+    ["operation"],
+    buckets=_HOTPATH_BUCKETS,
+)
+
+hotpath_phase_duration = Histogram(
+    "skillmeat_hotpath_phase_duration_seconds",
+    "Per-phase time (cpu, io, db) within hot-path operations in seconds",
+    ["operation", "phase"],
+    buckets=_HOTPATH_BUCKETS,
+)
+
 # =============================================================================
 # Application Info
 # =============================================================================
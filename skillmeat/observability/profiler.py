@@ -0,0 +1,290 @@
+"""In-process sampling profiler for SkillMeat.
+
+Samples the Python stacks of every thread at a fixed interval using
+:func:`sys._current_frames` - no tracing hooks are installed, so the
+overhead on the profiled code is limited to the GIL hand-offs of the
+sampler thread.
+
+Samples are tagged with the ``LogContext`` request and trace IDs of the work
+a thread is running.  Context variables cannot be read across threads, so the
+tag is recovered from the ``contextvars.Context`` a thread is executing in:
+
+* asyncio event-loop threads run each task step through ``Handle._run``,
+  which holds the task's context
+* anyio/Starlette worker threads (sync endpoints) run each call through
+  ``context.run(...)`` in ``WorkerThread.run``
+
+Output formats:
+
+* ``collapsed`` - Brendan Gregg collapsed stacks (``frame;frame;frame count``)
+  for ``flamegraph.pl``, speedscope or inferno
+* ``speedscope`` - speedscope JSON (one sampled profile per thread)
+
+Example:
+    >>> profiler = SamplingProfiler(interval=0.005)
+    >>> profile = profiler.run(duration=2.0)
+    >>> print(render_collapsed(profile))
+"""
+
+import contextvars
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from types import FrameType
+from typing import Any, Dict, List, Optional, Tuple
+
+from skillmeat import __version__ as skillmeat_version
+from skillmeat.observability.context import request_id_var, trace_id_var
+
+# A frame is identified by (function name, file, first line of the function)
+FrameKey = Tuple[str, str, int]
+
+# Maximum stack depth recorded per sample
+_MAX_STACK_DEPTH = 256
+
+_ASYNCIO_EVENTS_FILE = os.path.join("asyncio", "events.py")
+_ANYIO_DIR = os.sep + "anyio" + os.sep
+
+
+@dataclass
+class ProfileResult:
+    """Aggregated samples from one profiling run.
+
+    Attributes:
+        interval: Requested sampling interval in seconds
+        duration: Actual wall-clock duration of the run in seconds
+        sample_count: Number of sampling passes taken
+        stacks: Sample counts keyed by (thread name, tag, root-first frames)
+    """
+
+    interval: float
+    duration: float
+    sample_count: int = 0
+    stacks: Counter = field(default_factory=Counter)
+
+
+class SamplingProfiler:
+    """Samples all thread stacks at a fixed interval.
+
+    Args:
+        interval: Seconds between sampling passes (default 5ms).
+        include_idle: Also record threads blocked in known idle waits
+            (e.g. ``threading.Condition.wait``).  Idle stacks dominate most
+            servers, so they are skipped by default.
+    """
+
+    _IDLE_FUNCTIONS = frozenset(
+        {
+            ("wait", "threading.py"),
+            ("_worker", os.path.join("concurrent", "futures", "thread.py")),
+            ("select", "selectors.py"),
+            ("get", "queue.py"),
+        }
+    )
+
+    def __init__(self, interval: float = 0.005, include_idle: bool = False):
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.interval = interval
+        self.include_idle = include_idle
+
+    def run(
+        self, duration: float, stop_event: Optional[threading.Event] = None
+    ) -> ProfileResult:
+        """Sample all threads for ``duration`` seconds on the calling thread.
+
+        Args:
+            duration: Seconds to sample for.
+            stop_event: Optional event that ends sampling early when set.
+
+        Returns:
+            ProfileResult with aggregated stack samples.
+        """
+        own_ident = threading.get_ident()
+        result = ProfileResult(interval=self.interval, duration=0.0)
+        start = time.perf_counter()
+        deadline = start + duration
+        next_sample = start
+
+        while True:
+            now = time.perf_counter()
+            if now >= deadline or (stop_event is not None and stop_event.is_set()):
+                break
+            if now < next_sample:
+                time.sleep(next_sample - now)
+                continue
+            next_sample += self.interval
+            self._sample(result, own_ident)
+
+        result.duration = time.perf_counter() - start
+        return result
+
+    def _sample(self, result: ProfileResult, own_ident: int) -> None:
+        names = {t.ident: t.name for t in threading.enumerate()}
+        frames = sys._current_frames()
+        for ident, frame in frames.items():
+            if ident == own_ident:
+                continue
+            stack, tag = _walk_stack(frame)
+            if not stack:
+                continue
+            if not self.include_idle and self._is_idle(stack[-1]):
+                continue
+            thread_name = names.get(ident, f"thread-{ident}")
+            result.stacks[(thread_name, tag, tuple(stack))] += 1
+        result.sample_count += 1
+
+    def _is_idle(self, leaf: FrameKey) -> bool:
+        name, filename, _ = leaf
+        return any(
+            name == idle_name and filename.endswith(idle_file)
+            for idle_name, idle_file in self._IDLE_FUNCTIONS
+        )
+
+
+def _frame_context(frame: FrameType) -> Optional[contextvars.Context]:
+    """Return the contextvars.Context a dispatcher frame is running, if any."""
+    code = frame.f_code
+    filename = code.co_filename
+    try:
+        if code.co_name == "_run" and filename.endswith(_ASYNCIO_EVENTS_FILE):
+            handle = frame.f_locals.get("self")
+            context = getattr(handle, "_context", None)
+        elif code.co_name == "run" and _ANYIO_DIR in filename:
+            context = frame.f_locals.get("context")
+        else:
+            return None
+    except Exception:
+        return None
+    return context if isinstance(context, contextvars.Context) else None
+
+
+def _context_tag(context: contextvars.Context) -> Optional[str]:
+    """Format the LogContext request/trace IDs carried by a context."""
+    request_id = context.get(request_id_var)
+    trace_id = context.get(trace_id_var)
+    if request_id is None and trace_id is None:
+        return None
+    return f"request={request_id or '-'} trace={trace_id or '-'}"
+
+
+def _walk_stack(frame: Optional[FrameType]) -> Tuple[List[FrameKey], Optional[str]]:
+    """Return the root-first stack of ``frame`` and its request tag."""
+    stack: List[FrameKey] = []
+    tag: Optional[str] = None
+    while frame is not None and len(stack) < _MAX_STACK_DEPTH:
+        code = frame.f_code
+        stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+        if tag is None:
+            context = _frame_context(frame)
+            if context is not None:
+                tag = _context_tag(context)
+        frame = frame.f_back
+    stack.reverse()
+    return stack, tag
+
+
+# =============================================================================
+# Renderers
+# =============================================================================
+
+
+def _short_filename(filename: str) -> str:
+    """Trim site-packages / repository prefixes from a filename."""
+    index = filename.rfind("site-packages" + os.sep)
+    if index != -1:
+        return filename[index + len("site-packages" + os.sep) :]
+    index = filename.rfind(os.sep + "skillmeat" + os.sep)
+    if index != -1:
+        return filename[index + 1 :]
+    return filename
+
+
+def _sorted_stacks(profile: ProfileResult) -> List[Tuple[Any, int]]:
+    """Return stack entries in a stable order (untagged stacks first)."""
+    return sorted(
+        profile.stacks.items(),
+        key=lambda item: (item[0][0], item[0][1] or "", item[0][2]),
+    )
+
+
+def _frame_label(frame: FrameKey) -> str:
+    name, filename, line = frame
+    return f"{name} ({_short_filename(filename)}:{line})"
+
+
+def _root_frames(thread_name: str, tag: Optional[str]) -> List[str]:
+    roots = [f"thread:{thread_name}"]
+    if tag:
+        roots.append(tag)
+    return roots
+
+
+def render_collapsed(profile: ProfileResult) -> str:
+    """Render a profile as collapsed stacks, one ``stack count`` per line.
+
+    The thread name and the request/trace tag (when known) are emitted as
+    the outermost frames so flame graphs group by thread and request.
+    """
+    lines = []
+    for (thread_name, tag, stack), count in _sorted_stacks(profile):
+        frames = _root_frames(thread_name, tag) + [_frame_label(f) for f in stack]
+        lines.append(";".join(f.replace(";", ":") for f in frames) + f" {count}")
+    return "\n".join(lines) + ("\n" if lines else "")
+
+
+def render_speedscope(profile: ProfileResult, name: str = "skillmeat") -> Dict[str, Any]:
+    """Render a profile as a speedscope JSON document.
+
+    Produces one ``sampled`` profile per thread; each sample's weight is the
+    sampling interval in seconds.
+    """
+    frames: List[Dict[str, Any]] = []
+    frame_index: Dict[Tuple[str, str, int], int] = {}
+
+    def index_of(label: str, filename: str = "", line: int = 0) -> int:
+        key = (label, filename, line)
+        idx = frame_index.get(key)
+        if idx is None:
+            idx = len(frames)
+            frame_index[key] = idx
+            entry: Dict[str, Any] = {"name": label}
+            if filename:
+                entry["file"] = filename
+                entry["line"] = line
+            frames.append(entry)
+        return idx
+
+    per_thread: Dict[str, Tuple[List[List[int]], List[float]]] = {}
+    for (thread_name, tag, stack), count in _sorted_stacks(profile):
+        sample = [index_of(root) for root in _root_frames(thread_name, tag)[1:]]
+        sample += [index_of(fn, _short_filename(fp), ln) for fn, fp, ln in stack]
+        samples, weights = per_thread.setdefault(thread_name, ([], []))
+        samples.append(sample)
+        weights.append(count * profile.interval)
+
+    profiles = []
+    for thread_name, (samples, weights) in sorted(per_thread.items()):
+        profiles.append(
+            {
+                "type": "sampled",
+                "name": thread_name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }
+        )
+
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": name,
+        "exporter": f"skillmeat@{skillmeat_version}",
+        "activeProfileIndex": 0,
+        "shared": {"frames": frames},
+        "profiles": profiles,
+    }
@@ -0,0 +1,156 @@
+"""Per-request SQL statement counts and database time.
+
+Listens to SQLAlchemy cursor events on every :class:`~sqlalchemy.engine.Engine`
+and attributes each statement to the :class:`QueryStats` active in the
+current context.  Repositories create their own engines, so the listeners are
+registered on the ``Engine`` class rather than on a particular instance.
+
+:class:`~skillmeat.api.middleware.observability.ObservabilityMiddleware`
+opens a :func:`track_queries` block around every request and exports the
+totals as the ``skillmeat_api_db_queries`` and
+``skillmeat_api_db_duration_seconds`` histograms; with query headers enabled
+it also returns them as ``X-DB-Query-Count`` and ``X-DB-Time-Ms``.
+
+Statements executed outside a :func:`track_queries` block pay one context
+variable lookup and are otherwise ignored.  Sync route handlers run in a
+worker thread with a copy of the request context, so their statements are
+still counted against the request.
+
+Usage::
+
+    from skillmeat.observability.query_stats import track_queries
+
+    with track_queries() as stats:
+        repo.list_all()
+    print(stats.count, stats.duration)
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Response headers carrying the per-request totals
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+QUERY_TIME_HEADER = "X-DB-Time-Ms"
+
+_CONN_START_KEY = "skillmeat_query_start"
+
+_current_stats: ContextVar[Optional["QueryStats"]] = ContextVar(
+    "skillmeat_query_stats", default=None
+)
+
+_install_lock = threading.Lock()
+_installed = False
+
+
+class QueryStats:
+    """Statement count and cumulative execution time for one unit of work.
+
+    Attributes:
+        count: Number of SQL statements executed
+        duration: Seconds spent executing them
+    """
+
+    __slots__ = ("count", "duration", "_lock")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        """Add one executed statement that took ``seconds``."""
+        with self._lock:
+            self.count += 1
+            self.duration += seconds
+
+    @property
+    def duration_ms(self) -> float:
+        """Cumulative execution time in milliseconds."""
+        return self.duration * 1000
+
+    def __repr__(self) -> str:
+        return f"<QueryStats(count={self.count}, duration_ms={self.duration_ms:.2f})>"
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """Return the stats collected by the innermost active :func:`track_queries`."""
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Count SQL statements executed in the enclosed block.
+
+    Installs the engine listeners on first use.  Blocks may nest; each
+    statement is attributed to the innermost block only.
+
+    Yields:
+        :class:`QueryStats` filled in as statements complete
+    """
+    install_query_instrumentation()
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _before_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    if _current_stats.get() is None:
+        return
+    conn.info.setdefault(_CONN_START_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    starts = conn.info.get(_CONN_START_KEY)
+    if starts:
+        stats.record(time.perf_counter() - starts.pop())
+
+
+def _handle_error(exception_context: Any) -> None:
+    # Failed statements never reach after_cursor_execute; count them here.
+    stats = _current_stats.get()
+    conn = exception_context.connection
+    if stats is None or conn is None:
+        return
+    starts = conn.info.get(_CONN_START_KEY)
+    if starts:
+        stats.record(time.perf_counter() - starts.pop())
+
+
+def install_query_instrumentation() -> None:
+    """Register the cursor event listeners on all engines (idempotent)."""
+    global _installed
+    if _installed:
+        return
+    with _install_lock:
+        if _installed:
+            return
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _handle_error)
+        _installed = True
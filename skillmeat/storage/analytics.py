@@ -26,6 +26,8 @@ class AnalyticsDB:
     - Automatic retention policy enforcement
     - Events table for raw event data
     - Usage summary table for aggregated statistics
+    - Daily and hourly rollup tables (usage_daily, usage_hourly) that reports
+      read instead of scanning raw events; see compact_rollups()
 
     Thread Safety:
         A threading.Lock serialises all connection access so that concurrent
@@ -48,11 +50,16 @@ class AnalyticsDB:
         >>> db.close()
     """
 
-    SCHEMA_VERSION = 1  # Increment on schema changes
+    SCHEMA_VERSION = 2  # Increment on schema changes
     DEFAULT_RETENTION_DAYS = 90
+    HOURLY_ROLLUP_RETENTION_DAYS = 100  # Covers the longest report window (90d)
     MAX_RETRY_ATTEMPTS = 3
     RETRY_DELAY_MS = 100  # Initial retry delay in milliseconds
 
+    # Bucket formats for the rollup tables (match SQLite strftime output)
+    _DAY_FORMAT = "%Y-%m-%d"
+    _HOUR_FORMAT = "%Y-%m-%d %H:00:00"
+
     def __init__(self, db_path: Optional[Path] = None):
         """Initialize analytics database connection.
 
@@ -213,7 +220,40 @@ class AnalyticsDB:
 
                 CREATE INDEX IF NOT EXISTS idx_usage_artifact_type
                     ON usage_summary(artifact_type);
-            """
+            """,
+            2: """
+                -- Daily rollup: event counts per artifact, event type and day
+                CREATE TABLE IF NOT EXISTS usage_daily (
+                    day TEXT NOT NULL,
+                    artifact_name TEXT NOT NULL,
+                    artifact_type TEXT NOT NULL,
+                    event_type TEXT NOT NULL,
+                    count INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (day, artifact_name, artifact_type, event_type)
+                );
+
+                CREATE INDEX IF NOT EXISTS idx_usage_daily_artifact
+                    ON usage_daily(artifact_name, day);
+
+                -- Hourly rollup: same counts at hour granularity
+                CREATE TABLE IF NOT EXISTS usage_hourly (
+                    hour TEXT NOT NULL,
+                    artifact_name TEXT NOT NULL,
+                    artifact_type TEXT NOT NULL,
+                    event_type TEXT NOT NULL,
+                    count INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (hour, artifact_name, artifact_type, event_type)
+                );
+
+                CREATE INDEX IF NOT EXISTS idx_usage_hourly_artifact
+                    ON usage_hourly(artifact_name, hour);
+
+                -- Compaction high-water mark (last event id folded into rollups)
+                CREATE TABLE IF NOT EXISTS rollup_state (
+                    name TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                );
+            """,
         }
 
     def record_event(
@@ -491,8 +531,10 @@ class AnalyticsDB:
     def cleanup_old_events(self, days: int = DEFAULT_RETENTION_DAYS) -> int:
         """Remove events older than specified days (retention policy).
 
-        This operation does NOT delete from usage_summary table, which retains
-        aggregated statistics even after detailed events are removed.
+        This operation does NOT delete from usage_summary or usage_daily, which
+        retain aggregated statistics even after detailed events are removed.
+        Pending events are compacted into the rollups first; hourly rollups
+        older than HOURLY_ROLLUP_RETENTION_DAYS are pruned.
 
         Args:
             days: Number of days to retain events (0 = keep forever)
@@ -514,7 +556,13 @@ class AnalyticsDB:
             # Keep forever
             return 0
 
+        # Fold pending events into the rollups before their raw rows go away
+        self.compact_rollups()
+
         cutoff = datetime.now() - timedelta(days=days)
+        hourly_cutoff = datetime.now() - timedelta(
+            days=max(days, self.HOURLY_ROLLUP_RETENTION_DAYS)
+        )
 
         cursor = self._execute_with_retry(
             """
@@ -523,13 +571,161 @@ class AnalyticsDB:
         """,
             (cutoff,),
         )
-
         deleted = cursor.rowcount
+
+        # Daily rollups are kept forever; hourly ones only as long as a
+        # report window can reach them.
+        self._execute_with_retry(
+            "DELETE FROM usage_hourly WHERE hour < ?",
+            (hourly_cutoff.strftime(self._HOUR_FORMAT),),
+        )
+
         with self._lock:
             self.connection.commit()
 
         return deleted
 
+    def compact_rollups(self) -> int:
+        """Fold events recorded since the last compaction into the rollups.
+
+        Events are aggregated into ``usage_daily`` and ``usage_hourly`` by
+        artifact and event type.  A high-water mark on the event id (stored in
+        ``rollup_state``) makes each run cost O(new events), and since rollup
+        rows are never derived from deleted events, retention can drop raw
+        events without changing report results.
+
+        Called automatically by cleanup_old_events() and the rollup readers;
+        safe to call at any time, including from several processes.
+
+        Returns:
+            Number of events folded into the rollups
+
+        Raises:
+            sqlite3.Error: If database operation fails
+        """
+        with self._lock:
+            conn = self.connection
+            conn.commit()
+            # IMMEDIATE takes the write lock up front so that concurrent
+            # compactions cannot both fold the same id range.
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT value FROM rollup_state WHERE name = 'last_event_id'"
+                ).fetchone()
+                last_id = row[0] if row else 0
+                row = conn.execute(
+                    "SELECT MAX(id), COUNT(*) FROM events WHERE id > ?", (last_id,)
+                ).fetchone()
+                max_id, pending = row[0], row[1]
+
+                if not pending:
+                    conn.rollback()
+                    return 0
+
+                for table, column, fmt in (
+                    ("usage_daily", "day", self._DAY_FORMAT),
+                    ("usage_hourly", "hour", self._HOUR_FORMAT),
+                ):
+                    conn.execute(
+                        f"""
+                        INSERT INTO {table}
+                            ({column}, artifact_name, artifact_type, event_type, count)
+                        SELECT bucket, artifact_name, artifact_type, event_type, COUNT(*)
+                        FROM (
+                            SELECT strftime(?, timestamp) AS bucket,
+                                   artifact_name, artifact_type, event_type
+                            FROM events
+                            WHERE id > ? AND id <= ?
+                        )
+                        WHERE bucket IS NOT NULL
+                        GROUP BY bucket, artifact_name, artifact_type, event_type
+                        ON CONFLICT ({column}, artifact_name, artifact_type, event_type)
+                        DO UPDATE SET count = count + excluded.count
+                    """,
+                        (fmt, last_id, max_id),
+                    )
+
+                conn.execute(
+                    """
+                    INSERT INTO rollup_state (name, value) VALUES ('last_event_id', ?)
+                    ON CONFLICT (name) DO UPDATE SET value = excluded.value
+                """,
+                    (max_id,),
+                )
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+
+        return pending
+
+    def get_daily_counts(
+        self,
+        since: Optional[datetime] = None,
+        artifact_name: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get per-day event counts from the rollup tables.
+
+        Compacts pending events first.  Whole days after ``since`` come from
+        ``usage_daily``; the partial day containing ``since`` is summed from
+        ``usage_hourly`` so the window boundary is accurate to the hour.
+
+        Args:
+            since: Only count events at or after this time (None = all time)
+            artifact_name: Filter by artifact name (optional)
+
+        Returns:
+            List of dicts with day, artifact_name, event_type and count keys,
+            ordered by day
+
+        Example:
+            >>> rows = db.get_daily_counts(since=datetime.now() - timedelta(days=7))
+            >>> rows[0]
+            {'day': '2025-01-10', 'artifact_name': 'canvas', 'event_type': 'deploy', 'count': 3}
+        """
+        self.compact_rollups()
+
+        artifact_filter = " AND artifact_name = ?" if artifact_name else ""
+        artifact_params = [artifact_name] if artifact_name else []
+
+        if since is None:
+            query = f"""
+                SELECT day, artifact_name, event_type, SUM(count) AS count
+                FROM usage_daily
+                WHERE 1=1{artifact_filter}
+                GROUP BY day, artifact_name, event_type
+                ORDER BY day ASC
+            """
+            params: List[Any] = artifact_params
+        else:
+            since_day = since.strftime(self._DAY_FORMAT)
+            query = f"""
+                SELECT day, artifact_name, event_type, SUM(count) AS count
+                FROM (
+                    SELECT day, artifact_name, event_type, count
+                    FROM usage_daily
+                    WHERE day > ?{artifact_filter}
+                    UNION ALL
+                    SELECT substr(hour, 1, 10), artifact_name, event_type, count
+                    FROM usage_hourly
+                    WHERE hour >= ? AND substr(hour, 1, 10) = ?{artifact_filter}
+                )
+                GROUP BY day, artifact_name, event_type
+                ORDER BY day ASC
+            """
+            params = [
+                since_day,
+                *artifact_params,
+                since.strftime(self._HOUR_FORMAT),
+                since_day,
+                *artifact_params,
+            ]
+
+        with self._lock:
+            cursor = self.connection.execute(query, params)
+            return [dict(row) for row in cursor.fetchall()]
+
     def vacuum(self) -> None:
         """Vacuum database to reclaim space after deletions.
 
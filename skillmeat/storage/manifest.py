@@ -5,6 +5,7 @@ from datetime import datetime
 from pathlib import Path
 
 from ..core.collection import Collection
+from ..observability.hotpath import hot_path, hotpath_phase
 from ..utils.filesystem import atomic_write
 
 # Handle tomli/tomllib import for different Python versions
@@ -27,6 +28,7 @@ class ManifestManager:
 
     MANIFEST_FILENAME = "collection.toml"
 
+    @hot_path("manifest.read")
     def read(self, collection_path: Path) -> Collection:
         """Read collection.toml and return Collection object.
 
@@ -49,9 +51,10 @@ class ManifestManager:
             )
 
         try:
-            with open(manifest_file, "rb") as f:
-                content = f.read()
-                data = TOML_LOADS(content.decode("utf-8"))
+            with hotpath_phase("io"):
+                with open(manifest_file, "rb") as f:
+                    content = f.read()
+            data = TOML_LOADS(content.decode("utf-8"))
         except Exception as e:
             raise ValueError(f"Failed to parse collection.toml: {e}")
 
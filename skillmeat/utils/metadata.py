@@ -5,10 +5,15 @@ artifact content files, including YAML frontmatter extraction and tool
 name normalization.
 """
 
+import copy
 import logging
+import os
 import re
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Tuple, Union
 
 import yaml
 
@@ -430,6 +435,19 @@ def extract_frontmatter(content: str) -> Dict[str, Any]:
         # Try to extract partial data from malformed YAML
         return _extract_partial_frontmatter(yaml_content)
 
+    return _normalize_frontmatter(data)
+
+
+def _normalize_frontmatter(data: Any) -> Dict[str, Any]:
+    """Build the normalized frontmatter dict from parsed YAML.
+
+    Args:
+        data: Result of ``yaml.safe_load`` on the frontmatter block.
+
+    Returns:
+        Normalized fields as documented on :func:`extract_frontmatter`, or an
+        empty dict if ``data`` is not a mapping.
+    """
     if not isinstance(data, dict):
         logger.warning(f"YAML frontmatter is not a dictionary: {type(data)}")
         return {}
@@ -601,6 +619,9 @@ def extract_yaml_frontmatter(file_path: Path) -> Optional[Dict[str, Any]]:
     description: Does something
     ---
 
+    Only the frontmatter block is read, and the parsed result is cached per
+    file (see :func:`clear_frontmatter_cache`).
+
     Args:
         file_path: Path to markdown file
 
@@ -611,27 +632,170 @@ def extract_yaml_frontmatter(file_path: Path) -> Optional[Dict[str, Any]]:
         FileNotFoundError: If file doesn't exist
         yaml.YAMLError: If YAML parsing fails
     """
-    if not file_path.exists():
-        raise FileNotFoundError(f"File does not exist: {file_path}")
+    try:
+        parsed = _load_frontmatter(file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File does not exist: {file_path}") from None
+
+    if parsed.block is None:
+        return None
+
+    if parsed.error is not None:
+        raise yaml.YAMLError(
+            f"Failed to parse YAML frontmatter in {file_path}: {parsed.error}"
+        )
+
+    return copy.deepcopy(parsed.data) if isinstance(parsed.data, dict) else None
+
+
+def extract_file_frontmatter(file_path: Path) -> Dict[str, Any]:
+    """Extract normalized frontmatter from a file, using the parse cache.
+
+    File-based equivalent of :func:`extract_frontmatter`: same result shape
+    and the same lenient handling of malformed YAML.
+
+    Args:
+        file_path: Path to markdown file
+
+    Returns:
+        Normalized frontmatter fields, or empty dict if none found
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+    """
+    return _frontmatter_fields(_load_frontmatter(file_path))
+
+
+# =============================================================================
+# Frontmatter Parse Cache
+# =============================================================================
+
+#: Maximum number of files whose parsed frontmatter is kept in memory.
+FRONTMATTER_CACHE_SIZE = 4096
+
+# Files modified more recently than this are not cached: filesystem mtime
+# granularity is coarse enough that a same-size rewrite could otherwise keep
+# the same (size, mtime_ns) stamp and be served stale.
+_RACY_WINDOW_NS = 1_000_000_000
+
+
+class _ParsedFrontmatter(NamedTuple):
+    """Cached parse result for one file.
+
+    Attributes:
+        block: Raw YAML between the ``---`` delimiters (None if absent)
+        data: ``yaml.safe_load`` result (None if the block failed to parse)
+        error: YAML error message if parsing failed
+    """
+
+    block: Optional[str]
+    data: Any
+    error: Optional[str]
+
+
+# Keyed by absolute path; value holds the (size, mtime_ns, inode) the entry
+# was parsed at so that edited or replaced files are re-read.
+_FrontmatterCacheEntry = Tuple[Tuple[int, int, int], _ParsedFrontmatter]
+_frontmatter_cache: "OrderedDict[str, _FrontmatterCacheEntry]" = OrderedDict()
+_frontmatter_cache_lock = threading.Lock()
+
 
+def clear_frontmatter_cache() -> None:
+    """Drop all cached frontmatter parse results."""
+    with _frontmatter_cache_lock:
+        _frontmatter_cache.clear()
+
+
+def _read_frontmatter_block(file_path: str) -> Optional[str]:
+    """Read only the leading ``---`` block of a file.
+
+    Accepts a BOM, blank lines before the opening delimiter, trailing
+    whitespace on delimiters and CRLF line endings.  Stops reading at the
+    closing delimiter, so the body of large files is never loaded.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        The YAML text between the delimiters, or None if the file does not
+        start with a complete frontmatter block
+    """
     with open(file_path, "r", encoding="utf-8") as f:
-        content = f.read()
+        line = f.readline()
+        if line.startswith("\ufeff"):
+            line = line[1:]
+        while line and not line.strip():
+            line = f.readline()
+        if line.strip() != "---":
+            return None
 
-    # Match YAML frontmatter: --- ... ---
-    # Must be at start of file
-    pattern = r"^---\s*\n(.*?)\n---\s*\n"
-    match = re.match(pattern, content, re.DOTALL)
+        lines = []
+        for line in f:
+            if line.rstrip(" \t\n") == "---":
+                block = "".join(lines)
+                return block[:-1] if block.endswith("\n") else block
+            lines.append(line)
 
-    if not match:
-        return None
+    # No closing delimiter
+    return None
 
-    yaml_content = match.group(1)
 
-    try:
-        data = yaml.safe_load(yaml_content)
-        return data if isinstance(data, dict) else None
-    except yaml.YAMLError as e:
-        raise yaml.YAMLError(f"Failed to parse YAML frontmatter in {file_path}: {e}")
+def _load_frontmatter(file_path: Path) -> _ParsedFrontmatter:
+    """Return the parsed frontmatter block of a file, using the cache.
+
+    Entries are keyed by absolute path and validated against the file's
+    size, ``st_mtime_ns`` and inode; the cache is bounded LRU.  Files
+    modified within the last second are parsed but not cached.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Parse result (shared; callers must copy ``data`` before mutating it)
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+    """
+    path = os.path.abspath(file_path)
+    stat = os.stat(path)
+    stamp = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+    with _frontmatter_cache_lock:
+        cached = _frontmatter_cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            _frontmatter_cache.move_to_end(path)
+            return cached[1]
+
+    block = _read_frontmatter_block(path)
+    data = None
+    error = None
+    if block is not None:
+        try:
+            data = yaml.safe_load(block)
+        except yaml.YAMLError as e:
+            error = str(e)
+    parsed = _ParsedFrontmatter(block, data, error)
+
+    if time.time_ns() - stat.st_mtime_ns < _RACY_WINDOW_NS:
+        return parsed
+
+    with _frontmatter_cache_lock:
+        _frontmatter_cache[path] = (stamp, parsed)
+        _frontmatter_cache.move_to_end(path)
+        while len(_frontmatter_cache) > FRONTMATTER_CACHE_SIZE:
+            _frontmatter_cache.popitem(last=False)
+
+    return parsed
+
+
+def _frontmatter_fields(parsed: _ParsedFrontmatter) -> Dict[str, Any]:
+    """Normalize a cached parse result like :func:`extract_frontmatter`."""
+    if parsed.block is None:
+        return {}
+    if parsed.error is not None:
+        logger.warning(f"Failed to parse YAML frontmatter: {parsed.error}")
+        return _extract_partial_frontmatter(parsed.block)
+    return _normalize_frontmatter(copy.deepcopy(parsed.data))
 
 
 def extract_description_from_content(content: str) -> Optional[str]:
@@ -746,9 +910,9 @@ def extract_artifact_metadata(
         # Return empty metadata if no metadata file found
         return ArtifactMetadata()
 
-    # Read file content for frontmatter extraction
+    # Read and parse the frontmatter block once (cached per file)
     try:
-        content = metadata_file.read_text(encoding="utf-8")
+        parsed = _load_frontmatter(metadata_file)
     except Exception as e:
         logger.warning(f"Failed to read metadata file {metadata_file}: {e}")
         return ArtifactMetadata()
@@ -758,7 +922,7 @@ def extract_artifact_metadata(
 
     # Use enhanced frontmatter extraction for tools and other fields
     try:
-        frontmatter = extract_frontmatter(content)
+        frontmatter = _frontmatter_fields(parsed)
         if frontmatter:
             # Populate metadata from frontmatter (handles tools normalization,
             # description, and caches full frontmatter in extra)
@@ -767,12 +931,13 @@ def extract_artifact_metadata(
         logger.warning(f"Frontmatter extraction failed for {metadata_file}: {e}")
         # Continue with basic metadata extraction below
 
-    # Fall back to basic YAML extraction if enhanced extraction didn't populate
+    # Fall back to the raw YAML mapping if enhanced extraction didn't populate
     # or for fields not handled by populate_metadata_from_frontmatter
-    try:
-        yaml_data = extract_yaml_frontmatter(metadata_file)
-    except Exception:
-        yaml_data = None
+    yaml_data = (
+        copy.deepcopy(parsed.data)
+        if parsed.error is None and isinstance(parsed.data, dict)
+        else None
+    )
 
     if yaml_data:
         # Only set fields if not already populated from frontmatter
@@ -815,6 +980,13 @@ def extract_artifact_metadata(
 
     # If no description from frontmatter or YAML, try to extract from content
     if not metadata.description:
+        # Only now is the body needed; read the whole file
+        try:
+            content = metadata_file.read_text(encoding="utf-8")
+        except Exception as e:
+            logger.warning(f"Failed to read metadata file {metadata_file}: {e}")
+            return metadata
+
         # Remove YAML frontmatter from content for description extraction
         body_content = content
         if content.startswith("---"):
@@ -2,6 +2,8 @@
 
 Covers:
     GET /api/v1/artifacts/{artifact_id}/download
+    GET /api/v1/artifacts/{artifact_id}/hash
+    POST /api/v1/artifacts/delta
 
 Authentication is performed via ``verify_enterprise_pat``; the test fixture
 injects the PAT secret through ``app.dependency_overrides[get_settings]`` (the
@@ -33,6 +35,7 @@ from skillmeat.core.services.enterprise_content import (
     ArtifactVersionNotFoundError,
     EnterpriseContentService,
 )
+from skillmeat.core.services.enterprise_payload_cache import CachedPayload
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -90,6 +93,8 @@ def mock_service():
     """Return a MagicMock that acts as EnterpriseContentService."""
     svc = MagicMock(spec=EnterpriseContentService)
     svc.build_payload.return_value = dict(_SAMPLE_PAYLOAD)
+    # No payload cache: compressed downloads fall back to build_payload().
+    svc.build_payload_file.return_value = None
     return svc
 
 
@@ -239,6 +244,58 @@ class TestDownloadCompressed:
         )
 
 
+# ---------------------------------------------------------------------------
+# 200 / 206 — Compressed payload served from the payload cache
+# ---------------------------------------------------------------------------
+
+
+class TestDownloadCachedPayload:
+    @pytest.fixture
+    def cached(self, tmp_path: Path, mock_service) -> bytes:
+        data = gzip.compress(json.dumps(_SAMPLE_PAYLOAD).encode("utf-8"))
+        path = tmp_path / "entry.json.gz"
+        path.write_bytes(data)
+        mock_service.build_payload_file.return_value = CachedPayload(
+            path, CONTENT_HASH, len(data)
+        )
+        return data
+
+    def test_serves_cached_file(self, client: TestClient, mock_service, cached):
+        resp = client.get(
+            download_url(),
+            params={"compress": "true"},
+            headers=VALID_AUTH_HEADER,
+        )
+
+        assert resp.status_code == 200
+        assert resp.content == cached
+        assert resp.headers["content-type"] == "application/gzip"
+        assert resp.headers["etag"] == f'"{CONTENT_HASH}"'
+        assert f"{ARTIFACT_UUID}.json.gz" in resp.headers["content-disposition"]
+        mock_service.build_payload.assert_not_called()
+
+    def test_range_request_returns_partial_content(
+        self, client: TestClient, mock_service, cached
+    ):
+        resp = client.get(
+            download_url(),
+            params={"compress": "true"},
+            headers={**VALID_AUTH_HEADER, "Range": "bytes=10-"},
+        )
+
+        assert resp.status_code == 206
+        assert resp.content == cached[10:]
+        assert resp.headers["content-range"] == f"bytes 10-{len(cached) - 1}/{len(cached)}"
+
+    def test_uncompressed_download_does_not_use_file(
+        self, client: TestClient, mock_service, cached
+    ):
+        resp = client.get(download_url(), headers=VALID_AUTH_HEADER)
+
+        assert resp.status_code == 200
+        mock_service.build_payload_file.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # 404 — Artifact not found
 # ---------------------------------------------------------------------------
@@ -359,3 +416,98 @@ class TestInvalidPAT:
             )
 
         assert resp.status_code == 403
+
+
+# ---------------------------------------------------------------------------
+# Conditional requests and deltas
+# ---------------------------------------------------------------------------
+
+
+class TestConditionalRequests:
+    def test_download_sends_etag(self, client: TestClient):
+        resp = client.get(download_url(), headers=VALID_AUTH_HEADER)
+
+        assert resp.headers["etag"] == f'"{CONTENT_HASH}"'
+
+    def test_download_304_when_if_none_match_current(
+        self, client: TestClient, mock_service
+    ):
+        mock_service.get_content_hash.return_value = {
+            "artifact_id": ARTIFACT_UUID,
+            "version": "v1.2.0",
+            "content_hash": CONTENT_HASH,
+        }
+
+        resp = client.get(
+            download_url(),
+            headers={**VALID_AUTH_HEADER, "If-None-Match": f'"{CONTENT_HASH}"'},
+        )
+
+        assert resp.status_code == 304
+        assert resp.content == b""
+        mock_service.build_payload.assert_not_called()
+
+    def test_hash_endpoint(self, client: TestClient, mock_service):
+        mock_service.get_content_hash.return_value = {
+            "artifact_id": ARTIFACT_UUID,
+            "version": "v1.2.0",
+            "content_hash": CONTENT_HASH,
+        }
+        url = f"/api/v1/artifacts/{ARTIFACT_UUID}/hash"
+
+        fresh = client.get(url, headers=VALID_AUTH_HEADER)
+        assert fresh.status_code == 200
+        assert fresh.json()["content_hash"] == CONTENT_HASH
+        assert fresh.headers["etag"] == f'"{CONTENT_HASH}"'
+
+        stale = client.get(
+            url, headers={**VALID_AUTH_HEADER, "If-None-Match": '"other", W/"b"'}
+        )
+        assert stale.status_code == 200
+
+        current = client.get(
+            url, headers={**VALID_AUTH_HEADER, "If-None-Match": fresh.headers["etag"]}
+        )
+        assert current.status_code == 304
+
+    def test_hash_endpoint_404(self, client: TestClient, mock_service):
+        mock_service.get_content_hash.side_effect = ArtifactNotFoundError("nope")
+
+        resp = client.get("/api/v1/artifacts/nope/hash", headers=VALID_AUTH_HEADER)
+
+        assert resp.status_code == 404
+
+
+class TestDelta:
+    def test_streams_service_archive(self, client: TestClient, mock_service):
+        mock_service.build_delta.return_value = iter([b"chunk-1", b"chunk-2"])
+        body = {
+            "artifacts": [
+                {"artifact_id": "canvas-design", "content_hash": "old", "files": {"a": "b"}},
+                {"artifact_id": "other"},
+            ]
+        }
+
+        resp = client.post("/api/v1/artifacts/delta", json=body, headers=VALID_AUTH_HEADER)
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/x-gtar"
+        assert resp.content == b"chunk-1chunk-2"
+        mock_service.build_delta.assert_called_once_with(
+            [
+                {"artifact_id": "canvas-design", "content_hash": "old", "files": {"a": "b"}},
+                {"artifact_id": "other", "content_hash": "", "files": {}},
+            ]
+        )
+
+    def test_empty_request_rejected(self, client: TestClient):
+        resp = client.post(
+            "/api/v1/artifacts/delta", json={"artifacts": []}, headers=VALID_AUTH_HEADER
+        )
+
+        assert resp.status_code == 422
+
+    def test_requires_pat(self, client: TestClient):
+        resp = client.post("/api/v1/artifacts/delta", json={"artifacts": [{"artifact_id": "x"}]})
+
+        assert resp.status_code == 401
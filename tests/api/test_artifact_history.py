@@ -486,7 +486,8 @@ class TestComputeStatistics:
         )
 
         stats = _compute_statistics([evt])
-        assert stats["lineage_depth_max"] == 3
+        # Unindexed lineage: depth counts generations, not entries
+        assert stats["lineage_depth_max"] == 2
 
     def test_compute_statistics_no_lineage(self):
         from skillmeat.api.routers.artifact_history import _compute_statistics
@@ -509,3 +510,65 @@ class TestComputeStatistics:
 
         stats = _compute_statistics([evt])
         assert stats["lineage_depth_max"] == 0
+
+
+# ---------------------------------------------------------------------------
+# Lineage depth statistics
+# ---------------------------------------------------------------------------
+
+
+class TestLineageDepthStatistics:
+    @pytest.fixture
+    def session_factory(self, tmp_path):
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+
+        from skillmeat.cache.models import Artifact, Base, Project
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'history.db'}")
+        Base.metadata.create_all(engine)
+        factory = sessionmaker(bind=engine)
+        session = factory()
+        session.add(Project(id="proj", name="proj", path="/tmp/proj", status="active"))
+        session.add(
+            Artifact(
+                id="skill:pdf-skill", project_id="proj", name="pdf-skill", type="skill"
+            )
+        )
+        session.commit()
+        session.close()
+        yield factory
+        engine.dispose()
+
+    def test_depth_beyond_lineage_window_comes_from_index(self, session_factory):
+        """A chain deeper than LINEAGE_WINDOW still reports its full depth."""
+        from skillmeat.api.routers.artifact_history import (
+            _build_version_events,
+            _compute_statistics,
+        )
+        from skillmeat.cache.repositories import DbArtifactHistoryRepository
+        from skillmeat.core.version_lineage import LINEAGE_WINDOW
+        from skillmeat.core.version_tracking import (
+            create_deployment_version,
+            create_sync_version,
+        )
+
+        chain_length = LINEAGE_WINDOW + 8
+        session = session_factory()
+        parent = create_deployment_version(session, "skill:pdf-skill", "hash-0")
+        for i in range(1, chain_length):
+            parent = create_sync_version(
+                session, "skill:pdf-skill", f"hash-{i}", parent.content_hash
+            )
+        session.commit()
+        session.close()
+
+        repo = DbArtifactHistoryRepository(get_session=session_factory)
+        versions = repo.list_versions_for_artifacts(["skill:pdf-skill"])
+        events = _build_version_events(
+            [_make_artifact_summary()], versions, include_versions=True
+        )
+
+        assert max(len(e.version_lineage) for e in events) == LINEAGE_WINDOW
+        stats = _compute_statistics(events, versions)
+        assert stats["lineage_depth_max"] == chain_length - 1
@@ -1189,6 +1189,52 @@ class TestGetSourceDetails:
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
+class TestGetSourceFacets:
+    """Test GET /marketplace/sources/facets returns precomputed counts."""
+
+    def test_returns_sorted_facets(self, client):
+        """Test facet values are returned sorted by descending source count."""
+        from skillmeat.cache.marketplace_facets import FacetCount
+
+        facets = {
+            "artifact_type": {
+                "command": FacetCount(source_count=1, artifact_count=2),
+                "skill": FacetCount(source_count=3, artifact_count=9),
+            },
+            "tag": {"python": FacetCount(source_count=2, artifact_count=5)},
+            "trust_level": {},
+        }
+        with patch.object(
+            SourceManager, "get_facet_counts", return_value=(facets, [])
+        ) as get_counts:
+            response = client.get("/api/v1/marketplace/sources/facets")
+
+        assert response.status_code == status.HTTP_200_OK
+        get_counts.assert_called_once_with(verify=False)
+        data = response.json()
+        assert [v["value"] for v in data["artifact_types"]] == ["skill", "command"]
+        assert data["tags"][0] == {
+            "value": "python",
+            "source_count": 2,
+            "artifact_count": 5,
+        }
+        assert data["trust_levels"] == []
+        assert data["verified"] is False
+
+    def test_verify_reports_mismatches(self, client):
+        """Test verify=true passes through and reports repaired mismatches."""
+        mismatch = "tag=python: live None, precomputed FacetCount(...)"
+        with patch.object(
+            SourceManager, "get_facet_counts", return_value=({}, [mismatch])
+        ) as get_counts:
+            response = client.get("/api/v1/marketplace/sources/facets?verify=true")
+
+        assert response.status_code == status.HTTP_200_OK
+        get_counts.assert_called_once_with(verify=True)
+        assert response.json()["verified"] is True
+        assert response.json()["mismatches"] == [mismatch]
+
+
 class TestTagPatternRegex:
     """Test the TAG_PATTERN regex directly."""
 
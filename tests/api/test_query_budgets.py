@@ -0,0 +1,261 @@
+"""SQL query budgets for the main API list endpoints.
+
+Seeds a cache database of realistic size (5k artifacts spread over 100
+collections, projects and marketplace sources) and a small one whose
+collections and sources hold fewer rows than a page, then reads each
+endpoint's statement count from the ``X-DB-Query-Count`` header set by
+``ObservabilityMiddleware``.
+
+Two checks run per endpoint:
+
+* the count must not grow from the small dataset to the large one, so a
+  per-row query fails even when it stays under the budget;
+* the count on the large dataset must stay within the endpoint's budget.
+
+Budgets are the current fixed cost of each endpoint.  When a change adds
+queries, fix the change; when a change removes queries, lower the budget.
+Every repository constructed during a request creates its own engine and
+checks the schema (roughly 55 PRAGMA statements), which is most of that cost.
+
+Run with::
+
+    pytest tests/api/test_query_budgets.py -v
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+from typing import Dict, NamedTuple, Tuple
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+
+from skillmeat.api.config import APISettings, Environment, get_settings
+from skillmeat.api.server import create_app
+from skillmeat.cache import models
+from skillmeat.cache.repositories import TagRepository
+from skillmeat.observability.query_stats import QUERY_COUNT_HEADER
+from tests.conftest import reset_cache_engine
+
+
+class Dataset(NamedTuple):
+    """Row counts for one seeded cache database."""
+
+    artifacts: int
+    collections: int
+    projects: int
+    sources: int
+    tags: int
+
+
+LARGE = Dataset(artifacts=5000, collections=100, projects=100, sources=100, tags=50)
+# Ten artifacts per collection and entries per source: under one page.
+SMALL = Dataset(artifacts=40, collections=4, projects=4, sources=4, tags=2)
+
+# (path, maximum SQL statements per request on the large dataset)
+QUERY_BUDGETS = {
+    "tags": ("/api/v1/tags", 60),
+    "artifacts": ("/api/v1/artifacts", 60),
+    "user_collections": ("/api/v1/user-collections?limit=100", 60),
+    "user_collection_artifacts": ("/api/v1/user-collections/col-1/artifacts", 70),
+    "marketplace_sources": ("/api/v1/marketplace/sources", 175),
+    "marketplace_source_artifacts": (
+        "/api/v1/marketplace/sources/src-1/artifacts",
+        120,
+    ),
+    "projects": ("/api/v1/projects", 5),
+}
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+def _seed(db_path, dataset: Dataset) -> None:
+    """Bulk-insert *dataset* into the cache database at *db_path*."""
+    now = datetime.utcnow()
+    repo = TagRepository(db_path=db_path)
+    session = repo._get_session()
+    try:
+        session.execute(
+            insert(models.Project),
+            [
+                dict(
+                    id=f"proj-{i}",
+                    name=f"project-{i}",
+                    path=f"/tmp/budget-project-{i}",
+                    status="active",
+                    last_fetched=now,
+                )
+                for i in range(dataset.projects)
+            ],
+        )
+        artifacts = [
+            dict(
+                id=f"skill:skill-{i}",
+                uuid=uuid.uuid4().hex,
+                project_id=f"proj-{i % dataset.projects}",
+                name=f"skill-{i}",
+                type="skill",
+            )
+            for i in range(dataset.artifacts)
+        ]
+        session.execute(insert(models.Artifact), artifacts)
+        session.execute(
+            insert(models.Tag),
+            [
+                dict(id=f"tag-{i}", name=f"tag-{i}", slug=f"tag-{i}")
+                for i in range(dataset.tags)
+            ],
+        )
+        session.execute(
+            insert(models.ArtifactTag),
+            [
+                dict(artifact_uuid=a["uuid"], tag_id=f"tag-{i % dataset.tags}")
+                for i, a in enumerate(artifacts)
+            ],
+        )
+        session.execute(
+            insert(models.Collection),
+            [
+                dict(id=f"col-{i}", name=f"collection-{i}")
+                for i in range(dataset.collections)
+            ],
+        )
+        session.execute(
+            insert(models.CollectionArtifact),
+            [
+                dict(
+                    collection_id=f"col-{i % dataset.collections}",
+                    artifact_uuid=a["uuid"],
+                )
+                for i, a in enumerate(artifacts)
+            ],
+        )
+        session.execute(
+            insert(models.MarketplaceSource),
+            [
+                dict(
+                    id=f"src-{i}",
+                    repo_url=f"https://github.com/budget/repo-{i}",
+                    owner="budget",
+                    repo_name=f"repo-{i}",
+                    ref="main",
+                    scan_status="success",
+                )
+                for i in range(dataset.sources)
+            ],
+        )
+        session.execute(
+            insert(models.MarketplaceCatalogEntry),
+            [
+                dict(
+                    id=f"entry-{i}",
+                    source_id=f"src-{i % dataset.sources}",
+                    artifact_type="skill",
+                    name=f"entry-{i}",
+                    path=f"skills/entry-{i}",
+                    upstream_url=f"https://github.com/budget/entry-{i}",
+                    detected_at=now,
+                    confidence_score=80,
+                    status="new",
+                )
+                for i in range(dataset.artifacts)
+            ],
+        )
+        session.commit()
+    finally:
+        session.close()
+
+
+@pytest.fixture(scope="module")
+def measurements(tmp_path_factory) -> Dict[Dataset, Dict[str, Tuple[int, dict]]]:
+    """Statement count and body of each budgeted endpoint, per dataset."""
+    from skillmeat.config import ConfigManager
+
+    settings = APISettings(
+        env=Environment.TESTING,
+        host="127.0.0.1",
+        port=8000,
+        log_level="WARNING",
+        api_key_enabled=False,
+        auth_enabled=False,
+        cors_enabled=False,
+        db_query_headers=True,
+    )
+    results = {}
+    for dataset in (SMALL, LARGE):
+        home = tmp_path_factory.mktemp("budget-home")
+        # Earlier tests may have left an engine bound to another database.
+        with pytest.MonkeyPatch.context() as mp, reset_cache_engine():
+            mp.setenv("HOME", str(home))
+            mp.setattr(ConfigManager, "DEFAULT_CONFIG_DIR", home / ".skillmeat")
+
+            _seed(home / ".skillmeat" / "cache" / "cache.db", dataset)
+
+            app = create_app(settings)
+            app.dependency_overrides[get_settings] = lambda: settings
+            counts = {}
+            with TestClient(app) as client:
+                for name, (path, _) in QUERY_BUDGETS.items():
+                    # The first request may create default rows; measure the
+                    # steady state.
+                    client.get(path)
+                    response = client.get(path)
+                    assert response.status_code == 200, response.text
+                    counts[name] = (
+                        int(response.headers[QUERY_COUNT_HEADER]),
+                        response.json(),
+                    )
+            results[dataset] = counts
+    return results
+
+
+# =============================================================================
+# Budgets
+# =============================================================================
+
+
+@pytest.mark.parametrize("name", sorted(QUERY_BUDGETS))
+def test_query_count_does_not_grow_with_rows(measurements, name):
+    path, _ = QUERY_BUDGETS[name]
+    small, _ = measurements[SMALL][name]
+    large, _ = measurements[LARGE][name]
+
+    assert large <= small, (
+        f"GET {path} issued {small} SQL statements on the small dataset and "
+        f"{large} on the large one. Look for a per-row query on this endpoint."
+    )
+
+
+@pytest.mark.parametrize("name", sorted(QUERY_BUDGETS))
+def test_endpoint_within_query_budget(measurements, name):
+    path, budget = QUERY_BUDGETS[name]
+    count, _ = measurements[LARGE][name]
+
+    assert count <= budget, (
+        f"GET {path} issued {count} SQL statements, budget is {budget}. "
+        f"Look for a query added to this endpoint."
+    )
+
+
+@pytest.mark.parametrize("dataset", [SMALL, LARGE], ids=["small", "large"])
+def test_seeded_rows_are_served(measurements, dataset):
+    """Guard against counts passing because the endpoints returned nothing."""
+    served = measurements[dataset]
+    _, collections = served["user_collections"]
+    _, collection_artifacts = served["user_collection_artifacts"]
+    _, source_artifacts = served["marketplace_source_artifacts"]
+    _, projects = served["projects"]
+
+    assert collections["page_info"]["total_count"] >= dataset.collections
+    assert collection_artifacts["page_info"]["total_count"] == (
+        dataset.artifacts // dataset.collections
+    )
+    assert source_artifacts["page_info"]["total_count"] == (
+        dataset.artifacts // dataset.sources
+    )
+    assert projects["page_info"]["total_count"] == dataset.projects
@@ -0,0 +1,90 @@
+"""Tests for the lazy-loading top-level command group."""
+
+import subprocess
+import sys
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from skillmeat.cli import LAZY_SUBCOMMANDS, main
+from skillmeat.cli.lazy_group import LazyCommand, LazyGroup
+
+
+def _imported_after(code: str) -> set:
+    """Run *code* in a fresh interpreter and return the modules it imported."""
+    result = subprocess.run(
+        [sys.executable, "-c", code + "\nimport sys; print('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyGroup:
+    """Test suite for LazyGroup command resolution."""
+
+    def test_lazy_command_imported_on_invoke(self):
+        @click.group(
+            cls=LazyGroup,
+            lazy_subcommands={
+                "dumps": LazyCommand("json:dumps", "Not a command."),
+                "echo": LazyCommand("click.testing:CliRunner", "Not a command."),
+            },
+        )
+        def cli():
+            pass
+
+        @cli.command()
+        def hello():
+            """Say hello."""
+            click.echo("hello")
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["--help"])
+        assert result.exit_code == 0
+        assert "hello" in result.output and "Not a command." in result.output
+        assert "dumps" not in cli.commands
+
+        result = runner.invoke(cli, ["dumps"])
+        assert isinstance(result.exception, TypeError)
+
+    def test_all_registered_commands_resolve(self):
+        ctx = click.Context(main)
+        for name, entry in LAZY_SUBCOMMANDS.items():
+            command = main.get_command(ctx, name)
+            assert isinstance(command, click.Command)
+            assert command.get_short_help_str(200) == entry.short_help
+
+
+class TestStartupImports:
+    """The lazy groups' modules stay unimported until their command runs."""
+
+    def test_import_does_not_load_lazy_modules(self):
+        modules = _imported_after("import skillmeat.cli")
+        for entry in LAZY_SUBCOMMANDS.values():
+            assert entry.import_path.partition(":")[0] not in modules
+        assert "skillmeat.cache.models" not in modules
+
+    def test_help_does_not_load_lazy_modules(self):
+        modules = _imported_after(
+            "from skillmeat.cli import main\n"
+            "try:\n"
+            "    main(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass"
+        )
+        assert "skillmeat.cli.commands.bom" not in modules
+        assert "skillmeat.cli.workflow" not in modules
+
+    @pytest.mark.parametrize("name", ["bom", "workflow"])
+    def test_invoking_group_loads_its_module(self, name):
+        modules = _imported_after(
+            "from skillmeat.cli import main\n"
+            "try:\n"
+            f"    main(['{name}', '--help'])\n"
+            "except SystemExit:\n"
+            "    pass"
+        )
+        assert LAZY_SUBCOMMANDS[name].import_path.partition(":")[0] in modules
@@ -10,12 +10,17 @@ This module provides common fixtures used across all test suites:
 import os
 import shutil
 import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterator
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+# Relationships a repository loading profile leaves unloaded raise on access
+# instead of lazy loading, so accidental N+1 queries fail the test.
+os.environ.setdefault("SKILLMEAT_ORM_STRICT_LOADING", "1")
+
 
 # =============================================================================
 # Temporary Directory Fixtures
@@ -308,6 +313,44 @@ def mock_config():
     return mock
 
 
+# =============================================================================
+# Cache Database Isolation
+# =============================================================================
+
+
+@contextmanager
+def reset_cache_engine() -> Iterator[None]:
+    """Clear the cache session factory and engine singletons for a block.
+
+    ``skillmeat.cache.models`` binds ``SessionLocal`` and ``_engine_singleton``
+    to the first database they see, so a test pointing at a new database must
+    start without them.  Any engine created inside the block is disposed on
+    exit and the previous values are restored.  Module-scoped fixtures use
+    this directly; per-test code uses :func:`fresh_cache_engine`.
+    """
+    from skillmeat.cache import models
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(models, "SessionLocal", None)
+        mp.setattr(models, "_engine_singleton", None)
+        try:
+            yield
+        finally:
+            if models._engine_singleton is not None:
+                models._engine_singleton.dispose()
+
+
+@pytest.fixture
+def fresh_cache_engine():
+    """Run the test without cached cache-DB sessions or engines.
+
+    Example:
+        pytestmark = pytest.mark.usefixtures("fresh_cache_engine")
+    """
+    with reset_cache_engine():
+        yield
+
+
 # =============================================================================
 # CLI Testing Utilities
 # =============================================================================
@@ -15,6 +15,7 @@ from skillmeat.api.schemas.marketplace import ScanResultDTO
 from skillmeat.core.marketplace.deduplication_engine import (
     EXCLUDED_DUPLICATE_CROSS_SOURCE,
     EXCLUDED_DUPLICATE_WITHIN_SOURCE,
+    EXCLUDED_NEAR_DUPLICATE,
     EXCLUDED_USER_MANUAL,
     DeduplicationEngine,
     mark_as_excluded,
@@ -1335,3 +1336,81 @@ class TestScanResultDTOValidation:
         assert result.total_unique == 0
         assert result.duplicates_within_source == 5
         assert result.duplicates_cross_source == 3
+
+
+# ============================================================================
+# Test: Near-duplicate detection
+# ============================================================================
+
+
+_SKILL_BODY = (
+    "Use this skill to format Python source files with black and isort, "
+    "then run flake8 and report any remaining lint errors to the user. "
+    "Always keep line length at 88 characters and never reorder imports "
+    "inside functions. Summarise the changes once formatting is complete. "
+) * 3
+
+
+class TestNearDuplicates:
+    """Test suite for MinHash/LSH near-duplicate detection."""
+
+    def test_near_duplicate_constant_is_unique(self):
+        """Test EXCLUDED_NEAR_DUPLICATE does not collide with other reasons."""
+        assert EXCLUDED_NEAR_DUPLICATE == "near_duplicate"
+        assert EXCLUDED_NEAR_DUPLICATE not in {
+            EXCLUDED_DUPLICATE_WITHIN_SOURCE,
+            EXCLUDED_DUPLICATE_CROSS_SOURCE,
+            EXCLUDED_USER_MANUAL,
+        }
+
+    def test_reformatted_fork_is_clustered(self, engine: DeduplicationEngine):
+        """Test a fork with tweaked frontmatter and one edited line clusters."""
+        original = make_artifact(
+            "skills/formatter",
+            {"SKILL.md": "---\nname: formatter\n---\n" + _SKILL_BODY},
+            confidence_score=0.9,
+        )
+        fork = make_artifact(
+            "forks/formatter",
+            {
+                "SKILL.md": "---\nname:   'formatter'\n---\n"
+                + _SKILL_BODY.replace("88 characters", "100 characters", 1)
+            },
+            confidence_score=0.7,
+        )
+        other = make_artifact(
+            "skills/deploy",
+            {"SKILL.md": "Deploy the service to Kubernetes with helm. " * 10},
+        )
+
+        assert engine.find_duplicates([original, fork, other]) == {}
+        clusters = engine.find_near_duplicates([original, fork, other])
+
+        assert [[a["path"] for a in c] for c in clusters] == [
+            ["skills/formatter", "forks/formatter"]
+        ]
+        assert "minhash_signature" in original["metadata"]
+
+    def test_deduplicate_marks_and_restores(self, engine: DeduplicationEngine):
+        """Test near duplicates use the standard exclusion and restore flow."""
+        best = make_artifact("skills/a", {"SKILL.md": _SKILL_BODY}, 0.9)
+        copy = make_artifact("skills/b", {"SKILL.md": _SKILL_BODY + " Thanks!"}, 0.5)
+
+        kept, excluded = engine.deduplicate_near_duplicates([best, copy])
+
+        assert kept == [best]
+        assert excluded == [copy]
+        assert copy["excluded_reason"] == EXCLUDED_NEAR_DUPLICATE
+        assert copy["duplicate_of"] == "skills/a"
+        assert 0.8 <= copy["metadata"]["near_duplicate_similarity"] <= 1.0
+
+        mark_for_restore(copy)
+        assert copy["status"] == "new"
+        assert "duplicate_of" not in copy
+        assert "near_duplicate_similarity" not in copy["metadata"]
+
+    def test_artifacts_without_text_are_ignored(self, engine: DeduplicationEngine):
+        """Test artifacts with no files never form near-duplicate clusters."""
+        artifacts = [make_artifact("a", {}), make_artifact("b", {})]
+
+        assert engine.find_near_duplicates(artifacts) == []
@@ -0,0 +1,195 @@
+"""Unit tests for MinHash signatures and LSH banding.
+
+Covers signature determinism and normalisation, similarity estimates,
+signature encoding, LSH candidate lookup and clustering, and the catalog
+repository's near-duplicate cluster query.
+"""
+
+import random
+import tempfile
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from skillmeat.cache.models import MarketplaceCatalogEntry, MarketplaceSource
+from skillmeat.cache.repositories import (
+    MarketplaceCatalogRepository,
+    MarketplaceSourceRepository,
+)
+from skillmeat.core.marketplace.minhash import (
+    LSHIndex,
+    MinHasher,
+    catalog_signature,
+    decode_signature,
+    encode_signature,
+    estimate_similarity,
+    shingles,
+)
+
+
+def _document(seed: int, words: int = 200) -> str:
+    rng = random.Random(seed)
+    vocabulary = [f"term{i}" for i in range(1000)]
+    return " ".join(rng.choice(vocabulary) for _ in range(words))
+
+
+def _mutate(text: str, changes: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    tokens = text.split()
+    for position in rng.sample(range(len(tokens)), changes):
+        tokens[position] = f"edited{position}"
+    return " ".join(tokens)
+
+
+def _jaccard(a: str, b: str) -> float:
+    left, right = shingles(a), shingles(b)
+    return len(left & right) / len(left | right)
+
+
+# ============================================================================
+# MinHasher
+# ============================================================================
+
+
+class TestMinHasher:
+    def test_signature_is_deterministic(self):
+        text = _document(1)
+        assert MinHasher().signature(text) == MinHasher().signature(text)
+        assert len(MinHasher().signature(text)) == 128
+
+    def test_case_whitespace_and_punctuation_are_ignored(self):
+        hasher = MinHasher()
+        a = hasher.signature('name: "formatter"\ndescription: Format files')
+        b = hasher.signature("Name:   formatter   DESCRIPTION: format files")
+        assert a == b
+
+    def test_empty_text_has_no_signature(self):
+        assert MinHasher().signature("  --- \n") is None
+
+    @pytest.mark.parametrize("words,changes", [(12, 1), (200, 5), (200, 40)])
+    def test_estimate_tracks_jaccard(self, words, changes):
+        hasher = MinHasher()
+        errors = []
+        for seed in range(20):
+            text = _document(seed, words)
+            edited = _mutate(text, changes, seed)
+            estimate = estimate_similarity(
+                hasher.signature(text), hasher.signature(edited)
+            )
+            errors.append(estimate - _jaccard(text, edited))
+        assert abs(sum(errors) / len(errors)) < 0.05
+
+    def test_encoding_round_trips(self):
+        signature = MinHasher().signature(_document(3))
+        encoded = encode_signature(signature)
+        assert decode_signature(encoded) == signature
+        assert len(encoded) < 700
+
+    def test_catalog_signature_prefers_deep_text(self):
+        deep = _document(4)
+        assert catalog_signature(
+            {"deep_search_text": deep, "title": "ignored"}
+        ) == encode_signature(MinHasher().signature(deep))
+        assert catalog_signature({"title": None, "description": None}) is None
+
+
+# ============================================================================
+# LSHIndex
+# ============================================================================
+
+
+class TestLSHIndex:
+    def test_clusters_near_duplicates_only(self):
+        hasher = MinHasher()
+        index = LSHIndex()
+        for seed in range(50):
+            index.add(f"doc-{seed:02d}", hasher.signature(_document(seed)))
+        index.add("doc-07-fork", hasher.signature(_mutate(_document(7), 2)))
+        index.add("doc-20-copy", hasher.signature(_document(20)))
+
+        assert index.clusters(threshold=0.8) == [
+            ["doc-07", "doc-07-fork"],
+            ["doc-20", "doc-20-copy"],
+        ]
+
+    def test_query_verifies_candidates(self):
+        hasher = MinHasher()
+        index = LSHIndex()
+        index.add("a", hasher.signature(_document(1)))
+        index.add("b", hasher.signature(_document(2)))
+
+        matches = index.query(hasher.signature(_mutate(_document(1), 3)))
+        assert [key for key, _ in matches] == ["a"]
+        assert matches[0][1] >= 0.8
+
+    def test_rejects_mismatched_configuration(self):
+        with pytest.raises(ValueError):
+            LSHIndex(num_perm=128, bands=10)
+        with pytest.raises(ValueError):
+            LSHIndex().add("short", (1, 2, 3))
+
+
+# ============================================================================
+# Catalog repository
+# ============================================================================
+
+
+@pytest.fixture
+def catalog_repo():
+    import skillmeat.cache.models as _models
+
+    _models.SessionLocal = None
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "cache.db")
+        MarketplaceSourceRepository(db_path=db_path).create(
+            MarketplaceSource(
+                id="src-1",
+                repo_url="https://github.com/test/repo",
+                owner="test",
+                repo_name="repo",
+                ref="main",
+                trust_level="basic",
+                visibility="public",
+                scan_status="success",
+            )
+        )
+        yield MarketplaceCatalogRepository(db_path=db_path)
+    _models.SessionLocal = None
+
+
+def _entry(name: str, text: str, **kwargs) -> MarketplaceCatalogEntry:
+    return MarketplaceCatalogEntry(
+        id=f"entry-{name}-{uuid.uuid4().hex[:6]}",
+        source_id="src-1",
+        artifact_type="skill",
+        name=name,
+        path=f"skills/{name}",
+        upstream_url=f"https://github.com/test/repo/tree/main/skills/{name}",
+        detected_at=datetime.utcnow(),
+        confidence_score=80,
+        status=kwargs.pop("status", "new"),
+        deep_search_text=text,
+        **kwargs,
+    )
+
+
+def test_repository_clusters_and_backfills_signatures(catalog_repo):
+    catalog_repo.bulk_create(
+        [
+            _entry("alpha", _document(1)),
+            _entry("alpha-fork", _mutate(_document(1), 2)),
+            _entry("beta", _document(2)),
+            _entry("alpha-excluded", _document(1), status="excluded"),
+        ]
+    )
+    assert catalog_repo.find_near_duplicate_clusters() == []
+
+    assert catalog_repo.compute_missing_signatures(batch_size=2) == 4
+    assert catalog_repo.compute_missing_signatures() == 0
+
+    clusters = catalog_repo.find_near_duplicate_clusters(source_id="src-1")
+    assert [sorted(e.name for e in cluster) for cluster in clusters] == [
+        ["alpha", "alpha-fork"]
+    ]
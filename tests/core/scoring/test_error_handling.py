@@ -188,7 +188,7 @@ class TestScoringServiceDegradation:
             return 90.0
 
         with patch(
-            "skillmeat.core.scoring.semantic_scorer.SemanticScorer.score_artifact",
+            "skillmeat.core.scoring.semantic_scorer.SemanticScorer.score_all",
             side_effect=slow_score,
         ):
             service = ScoringService(
@@ -223,11 +223,11 @@ class TestScoringServiceDegradation:
         mock_embedder.is_available.return_value = True
 
         # Mock semantic scorer to return scores
-        async def mock_score(query, artifact):
-            return 85.0
+        async def mock_score(query, artifacts):
+            return [(artifact, 85.0) for artifact in artifacts]
 
         with patch(
-            "skillmeat.core.scoring.semantic_scorer.SemanticScorer.score_artifact",
+            "skillmeat.core.scoring.semantic_scorer.SemanticScorer.score_all",
             side_effect=mock_score,
         ):
             service = ScoringService(
@@ -264,7 +264,7 @@ class TestScoringServiceDegradation:
             return 90.0
 
         with patch(
-            "skillmeat.core.scoring.semantic_scorer.SemanticScorer.score_artifact",
+            "skillmeat.core.scoring.semantic_scorer.SemanticScorer.score_all",
             side_effect=slow_score,
         ):
             service = ScoringService(
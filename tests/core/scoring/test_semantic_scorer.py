@@ -308,3 +308,61 @@ async def test_acceptance_criteria_pdf_skill():
     # Acceptance criteria: >90% match
     assert score is not None
     assert score > 90, f"Expected >90, got {score}"
+
+
+class BatchRecordingProvider(MockEmbeddingProvider):
+    """Mock provider that records get_embeddings batches."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    async def get_embeddings(self, texts):
+        self.batches.append(list(texts))
+        return [await self.get_embedding(text) for text in texts]
+
+
+@pytest.mark.asyncio
+async def test_score_all_embeds_artifacts_in_one_batch_and_reuses_them():
+    """score_all sends uncached texts in one batch and reuses stored vectors."""
+    from skillmeat.core.scoring.vector_store import VectorStore
+
+    provider = BatchRecordingProvider()
+    store = VectorStore("mock", 3)
+    scorer = SemanticScorer(provider, vector_store=store)
+    artifacts = [
+        ArtifactMetadata(title="PDF Tool", description="Process PDF files"),
+        ArtifactMetadata(title="DB Tool", description="Manage databases"),
+        ArtifactMetadata(title="PDF Tool", description="Process PDF files"),
+        ArtifactMetadata(),
+    ]
+
+    results = await scorer.score_all("pdf processing", artifacts)
+
+    assert [score for _, score in results] == [100.0, 0.0, 100.0, 0.0]
+    assert len(provider.batches) == 1
+    assert len(provider.batches[0]) == 2  # duplicates and empty text skipped
+    assert len(store) == 2
+
+    await scorer.score_all("database", artifacts)
+    assert len(provider.batches) == 1  # artifact vectors served from the store
+
+
+@pytest.mark.asyncio
+async def test_score_all_reports_failed_artifact_embeddings():
+    """Artifacts whose embedding fails score None; others are still scored."""
+
+    class FlakyProvider(MockEmbeddingProvider):
+        async def get_embeddings(self, texts):
+            return [None if "database" in t.lower() else [1.0, 0.0, 0.0] for t in texts]
+
+    scorer = SemanticScorer(FlakyProvider())
+    results = await scorer.score_all(
+        "pdf",
+        [
+            ArtifactMetadata(title="PDF Tool"),
+            ArtifactMetadata(title="Database Tool"),
+        ],
+    )
+
+    assert [score for _, score in results] == [100.0, None]
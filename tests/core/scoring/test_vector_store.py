@@ -0,0 +1,122 @@
+"""Tests for the float32 embedding VectorStore."""
+
+import threading
+
+import pytest
+
+from skillmeat.core.scoring.vector_store import VectorStore, content_key
+
+
+def test_lookup_add_and_similarities_in_memory():
+    store = VectorStore("model", 3)
+    assert store.lookup(["a", "b"]) == [None, None]
+
+    rows = store.add(["a", "b", "c"], [[2.0, 0.0, 0.0], [0.0, 1.0, 0.0], None])
+    assert rows == [0, 1, None]
+    assert store.add(["a"], [[0.0, 0.0, 9.0]]) == [0]  # existing row kept
+    assert len(store) == 2
+
+    scores = store.similarities([1.0, 1.0, 0.0], store.lookup(["a", "b", "c"]))
+    assert scores[0] == pytest.approx(0.7071, abs=1e-4)
+    assert scores[1] == pytest.approx(0.7071, abs=1e-4)
+    assert scores[2] is None
+
+
+def test_negative_similarity_is_clamped_to_zero():
+    store = VectorStore("model", 2)
+    rows = store.add(["a"], [[1.0, 0.0]])
+    assert store.similarities([-1.0, 0.0], rows) == [0.0]
+
+
+def test_dimension_mismatch_raises():
+    store = VectorStore("model", 3)
+    with pytest.raises(ValueError):
+        store.add(["a"], [[1.0, 0.0]])
+    with pytest.raises(ValueError):
+        store.similarities([1.0], [])
+
+
+def test_persistent_store_reloads_rows(tmp_path):
+    store = VectorStore("org/model:v1", 2, root=tmp_path)
+    store.add(["a", "b"], [[1.0, 0.0], [0.0, 1.0]])
+    store.add(["c"], [[1.0, 1.0]])
+
+    assert store.path == tmp_path / "org_model_v1-2"
+    assert (store.path / "vectors.f32").stat().st_size == 3 * 2 * 4
+
+    reopened = VectorStore("org/model:v1", 2, root=tmp_path)
+    rows = reopened.lookup(["a", "b", "c", "d"])
+    assert rows == [0, 1, 2, None]
+    scores = reopened.similarities([1.0, 0.0], rows)
+    assert scores[:3] == pytest.approx([1.0, 0.0, 0.7071], abs=1e-4)
+
+    # Vectors from another dimension live in a separate store.
+    assert VectorStore("org/model:v1", 3, root=tmp_path).lookup(["a"]) == [None]
+
+
+def test_partial_append_is_trimmed_on_load(tmp_path):
+    store = VectorStore("model", 2, root=tmp_path)
+    store.add(["a"], [[1.0, 0.0]])
+    with (store.path / "vectors.f32").open("ab") as fh:
+        fh.write(b"\x00" * 6)  # interrupted write of a second row
+
+    reopened = VectorStore("model", 2, root=tmp_path)
+    assert len(reopened) == 1
+    assert (store.path / "vectors.f32").stat().st_size == 8
+    assert reopened.add(["b"], [[0.0, 1.0]]) == [1]
+    assert reopened.similarities([0.0, 1.0], [1]) == [pytest.approx(1.0)]
+
+
+def test_two_instances_sharing_a_directory_do_not_collide(tmp_path):
+    first = VectorStore("model", 2, root=tmp_path)
+    second = VectorStore("model", 2, root=tmp_path)
+    assert first.lookup(["a"]) == [None]
+    assert second.lookup(["b"]) == [None]
+
+    assert first.add(["a"], [[1.0, 0.0]]) == [0]
+    # The second store loaded before the first appended; its row must come
+    # from the file, not from its own (empty) view.
+    assert second.add(["b"], [[0.0, 1.0]]) == [1]
+    assert second.add(["a"], [[0.0, 1.0]]) == [0]  # picked up, not re-added
+
+    assert first.lookup(["a", "b"]) == [0, 1]
+    assert first.similarities([0.0, 1.0], [0, 1]) == pytest.approx([0.0, 1.0])
+    assert (first.path / "keys.bin").stat().st_size == 2 * 32
+
+    reopened = VectorStore("model", 2, root=tmp_path)
+    assert reopened.lookup(["a", "b"]) == [0, 1]
+
+
+def test_concurrent_appends_from_separate_instances(tmp_path):
+    stores = [VectorStore("model", 2, root=tmp_path) for _ in range(4)]
+    barrier = threading.Barrier(len(stores))
+    returned = {}
+
+    def worker(index, store):
+        barrier.wait()
+        for n in range(25):
+            text = f"{index}-{n}"
+            (returned[text],) = store.add([text], [[float(index + 1), float(n)]])
+
+    threads = [
+        threading.Thread(target=worker, args=(i, s)) for i, s in enumerate(stores)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    reopened = VectorStore("model", 2, root=tmp_path)
+    texts = [f"{i}-{n}" for i in range(len(stores)) for n in range(25)]
+    rows = reopened.lookup(texts)
+    assert sorted(rows) == list(range(len(texts)))
+    assert rows == [returned[text] for text in texts]
+    for text, row in zip(texts, rows):
+        index, n = map(int, text.split("-"))
+        expected = [float(index + 1), float(n)]
+        assert reopened.similarities(expected, [row]) == [pytest.approx(1.0)]
+
+
+def test_content_key_is_sha256_digest():
+    assert len(content_key("text")) == 32
+    assert content_key("text") != content_key("text ")
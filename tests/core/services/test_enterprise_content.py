@@ -1,13 +1,15 @@
 """Unit tests for EnterpriseContentService.
 
 Tests build_payload() structure, version resolution strategies, compression,
-and tenant-isolation exception paths.  No real DB or filesystem I/O —
+delta archives, and tenant-isolation exception paths.  No real DB or filesystem I/O —
 everything is mocked.
 """
 
 from __future__ import annotations
 
 import gzip
+import hashlib
+import io
 import json
 import uuid
 from datetime import datetime, timezone
@@ -25,6 +27,8 @@ from skillmeat.core.services.enterprise_content import (
     _resolve_artifact_fs_path,
     _is_excluded,
 )
+from skillmeat.core.enterprise_delta import read_delta_archive
+from skillmeat.core.services.enterprise_payload_cache import PayloadCache
 
 
 # ---------------------------------------------------------------------------
@@ -82,6 +86,7 @@ def _make_service(
     artifact: Optional[Mock] = None,
     version: Optional[Mock] = None,
     collection_root: Optional[Path] = None,
+    payload_cache: Optional[PayloadCache] = None,
 ) -> tuple[EnterpriseContentService, Mock, Mock]:
     """Return (service, mock_repo, mock_session)."""
     mock_session = MagicMock()
@@ -99,6 +104,7 @@ def _make_service(
         session=mock_session,
         artifact_repo=mock_repo,
         collection_root=collection_root or Path("/fake/collection"),
+        payload_cache=payload_cache,
     )
     return svc, mock_repo, mock_session
 
@@ -437,6 +443,82 @@ class TestBuildPayloadCompression:
         assert isinstance(result, dict)
 
 
+# ---------------------------------------------------------------------------
+# build_payload — payload cache
+# ---------------------------------------------------------------------------
+
+
+class TestBuildPayloadCache:
+    def _setup(self, tmp_path: Path, artifact=None, version=None):
+        skill_dir = tmp_path / "collection" / "skills" / "canvas-design"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text("hello")
+        cache = PayloadCache(tmp_path / "cache")
+        svc, _, _ = _make_service(
+            artifact or _make_artifact(),
+            version or _make_version(),
+            collection_root=tmp_path / "collection",
+            payload_cache=cache,
+        )
+        return svc, skill_dir
+
+    def test_hit_does_not_read_files(self, tmp_path: Path):
+        svc, _ = self._setup(tmp_path)
+        first = svc.build_payload("canvas-design", compress=True)
+
+        with patch(
+            "skillmeat.core.services.enterprise_content._read_file_tree"
+        ) as read_tree:
+            second = svc.build_payload("canvas-design", compress=True)
+
+        read_tree.assert_not_called()
+        assert second == first
+
+    def test_uncompressed_payload_served_from_cache(self, tmp_path: Path):
+        svc, skill_dir = self._setup(tmp_path)
+        svc.build_payload("canvas-design", compress=True)
+        (skill_dir / "SKILL.md").unlink()
+
+        payload = svc.build_payload("canvas-design", compress=False)
+
+        assert payload["files"][0]["content"] == "hello"
+        assert payload["content_hash"] == CONTENT_HASH
+
+    def test_build_payload_file_matches_compressed_payload(self, tmp_path: Path):
+        svc, _ = self._setup(tmp_path)
+
+        entry = svc.build_payload_file("canvas-design")
+
+        assert entry is not None
+        assert entry.content_hash == CONTENT_HASH
+        assert entry.path.read_bytes() == svc.build_payload(
+            "canvas-design", compress=True
+        )
+
+    def test_metadata_change_misses_cache(self, tmp_path: Path):
+        artifact = _make_artifact()
+        svc, _ = self._setup(tmp_path, artifact=artifact)
+        first = svc.build_payload_file("canvas-design")
+
+        artifact.description = "Edited description"
+        second = svc.build_payload_file("canvas-design")
+
+        assert second.path != first.path
+        payload = json.loads(gzip.decompress(second.path.read_bytes()))
+        assert payload["metadata"]["description"] == "Edited description"
+
+    def test_version_without_hash_is_not_cached(self, tmp_path: Path):
+        svc, _ = self._setup(tmp_path, version=_make_version(content_hash=""))
+
+        assert svc.build_payload_file("canvas-design") is None
+        assert isinstance(svc.build_payload("canvas-design", compress=True), bytes)
+
+    def test_without_cache_build_payload_file_returns_none(self, tmp_path: Path):
+        svc, _, _ = _make_service(_make_artifact(), _make_version(), tmp_path)
+
+        assert svc.build_payload_file("canvas-design") is None
+
+
 # ---------------------------------------------------------------------------
 # build_payload — ArtifactNotFoundError
 # ---------------------------------------------------------------------------
@@ -557,3 +639,69 @@ class TestArtifactFilesystemError:
             mock_walk.side_effect = OSError("permission denied")
             with pytest.raises(ArtifactFilesystemError):
                 svc.build_payload("canvas-design")
+
+
+# ---------------------------------------------------------------------------
+# build_delta
+# ---------------------------------------------------------------------------
+
+
+def _read_delta(chunks) -> list:
+    return list(read_delta_archive(io.BytesIO(b"".join(chunks))))
+
+
+class TestBuildDelta:
+    def _service(self, tmp_path: Path):
+        skill_dir = tmp_path / "skills" / "canvas-design"
+        (skill_dir / "ref").mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text("# Canvas v2")
+        (skill_dir / "ref" / "a.md").write_text("a")
+        (skill_dir / ".DS_Store").write_text("x")
+        svc, _, _ = _make_service(_make_artifact(), _make_version(), tmp_path)
+        return svc
+
+    def test_only_changed_files_are_sent(self, tmp_path: Path):
+        svc = self._service(tmp_path)
+        manifest = {
+            "SKILL.md": hashlib.sha256(b"# Canvas v1").hexdigest(),
+            "ref/a.md": hashlib.sha256(b"a").hexdigest(),
+            "gone.md": "0" * 64,
+        }
+
+        members = _read_delta(
+            svc.build_delta(
+                [{"artifact_id": "canvas-design", "content_hash": "old", "files": manifest}]
+            )
+        )
+
+        header = members[0].header
+        assert header["status"] == "updated"
+        assert header["content_hash"] == CONTENT_HASH
+        assert header["files"] == ["SKILL.md"]
+        assert header["removed"] == ["gone.md"]
+        assert [(m.path, m.data) for m in members[1:]] == [("SKILL.md", b"# Canvas v2")]
+
+    def test_matching_hash_skips_file_reads(self, tmp_path: Path):
+        svc = self._service(tmp_path)
+
+        with patch(
+            "skillmeat.core.services.enterprise_content._list_files"
+        ) as list_files:
+            members = _read_delta(
+                svc.build_delta(
+                    [{"artifact_id": "canvas-design", "content_hash": CONTENT_HASH}]
+                )
+            )
+
+        list_files.assert_not_called()
+        assert [m.header["status"] for m in members] == ["unchanged"]
+
+    def test_unknown_artifact_reported_in_header(self, tmp_path: Path):
+        svc, repo, _ = _make_service(collection_root=tmp_path)
+        repo.get.return_value = None
+        repo.get_by_name.return_value = None
+
+        members = _read_delta(svc.build_delta([{"artifact_id": "nope"}]))
+
+        assert members[0].header["status"] == "not_found"
+        assert "nope" in members[0].header["error"]
@@ -0,0 +1,139 @@
+"""Unit tests for PayloadCache (on-disk compressed payload cache)."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from skillmeat.core.services.enterprise_payload_cache import CachedPayload, PayloadCache
+
+CONTENT_HASH = "a" * 64
+
+
+def _key(name: str = "canvas-design", content_hash: str = CONTENT_HASH) -> str:
+    return PayloadCache.build_key(name, content_hash, {"name": name})
+
+
+class TestBuildKey:
+    def test_key_changes_with_content_hash(self):
+        assert _key(content_hash="a" * 64) != _key(content_hash="b" * 64)
+
+    def test_key_changes_with_metadata(self):
+        first = PayloadCache.build_key("x", CONTENT_HASH, {"description": "old"})
+        second = PayloadCache.build_key("x", CONTENT_HASH, {"description": "new"})
+        assert first != second
+
+
+class TestGetOrBuild:
+    def test_miss_builds_and_stores(self, tmp_path: Path):
+        cache = PayloadCache(tmp_path)
+
+        entry = cache.get_or_build(_key(), CONTENT_HASH, lambda: b"payload")
+
+        assert isinstance(entry, CachedPayload)
+        assert entry.path.read_bytes() == b"payload"
+        assert entry.size == len(b"payload")
+        assert entry.content_hash == CONTENT_HASH
+
+    def test_hit_does_not_rebuild(self, tmp_path: Path):
+        cache = PayloadCache(tmp_path)
+        calls = []
+
+        def build() -> bytes:
+            calls.append(1)
+            return b"payload"
+
+        cache.get_or_build(_key(), CONTENT_HASH, build)
+        entry = cache.get_or_build(_key(), CONTENT_HASH, build)
+
+        assert len(calls) == 1
+        assert entry.path.read_bytes() == b"payload"
+
+    def test_entries_persist_across_instances(self, tmp_path: Path):
+        PayloadCache(tmp_path).get_or_build(_key(), CONTENT_HASH, lambda: b"payload")
+
+        assert PayloadCache(tmp_path).get(_key(), CONTENT_HASH) is not None
+
+    def test_build_error_is_not_cached(self, tmp_path: Path):
+        cache = PayloadCache(tmp_path)
+
+        def fail() -> bytes:
+            raise OSError("disk gone")
+
+        with pytest.raises(OSError):
+            cache.get_or_build(_key(), CONTENT_HASH, fail)
+
+        assert cache.get(_key(), CONTENT_HASH) is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_concurrent_misses_share_one_build(self, tmp_path: Path):
+        cache = PayloadCache(tmp_path)
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def build() -> bytes:
+            calls.append(1)
+            started.set()
+            release.wait(timeout=5)
+            return b"payload"
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    cache.get_or_build(_key(), CONTENT_HASH, build)
+                )
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        assert started.wait(timeout=5)
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert len(calls) == 1
+        assert len(results) == 8
+        assert {entry.path for entry in results} == {results[0].path}
+
+
+class TestEviction:
+    def test_least_recently_used_entries_are_evicted(self, tmp_path: Path):
+        cache = PayloadCache(tmp_path, max_bytes=250)
+        first = cache.get_or_build(_key("first"), CONTENT_HASH, lambda: b"1" * 100)
+        second = cache.get_or_build(_key("second"), CONTENT_HASH, lambda: b"2" * 100)
+        os.utime(first.path, (1, 1))
+        os.utime(second.path, (2, 2))
+
+        # A hit makes "first" the most recently used entry.
+        cache.get(_key("first"), CONTENT_HASH)
+        cache.get_or_build(_key("third"), CONTENT_HASH, lambda: b"3" * 100)
+
+        assert cache.get(_key("second"), CONTENT_HASH) is None
+        assert cache.get(_key("first"), CONTENT_HASH) is not None
+        assert cache.get(_key("third"), CONTENT_HASH) is not None
+
+    def test_oversized_entry_is_kept(self, tmp_path: Path):
+        cache = PayloadCache(tmp_path, max_bytes=10)
+
+        entry = cache.get_or_build(_key(), CONTENT_HASH, lambda: b"x" * 100)
+
+        assert entry.path.exists()
+
+    def test_clear_removes_entries(self, tmp_path: Path):
+        cache = PayloadCache(tmp_path)
+        cache.get_or_build(_key(), CONTENT_HASH, lambda: b"payload")
+
+        assert cache.clear() == 1
+        assert cache.get(_key(), CONTENT_HASH) is None
+
+    def test_rejects_non_positive_bound(self, tmp_path: Path):
+        with pytest.raises(ValueError):
+            PayloadCache(tmp_path, max_bytes=0)
@@ -250,3 +250,50 @@ def test_canonical_representation(signer):
     assert "created_at" not in str(sign_dict)
     assert "old_sig" not in str(sign_dict)
     assert "bundle_hash" in str(sign_dict)
+
+
+def test_verify_bundles_batch(signer, verifier, key_manager, signing_key_pair):
+    """Test batch verification reuses the trust-store lookup per signer."""
+    signing_key = key_manager.list_signing_keys()[0]
+    key_manager.import_public_key(
+        signing_key.public_key_pem,
+        "Test Signer",
+        "signer@example.com",
+        trusted=True,
+    )
+
+    bundles = []
+    for i in range(20):
+        bundle_hash = f"hash-{i}"
+        manifest_data = {
+            "bundle": {"name": f"bundle-{i}", "version": "1.0.0"},
+            "artifacts": [],
+        }
+        signature_data = signer.sign_bundle(
+            bundle_hash, manifest_data, signing_key_pair.key_id
+        )
+        manifest_data["signature"] = signature_data.to_dict()
+        bundles.append((bundle_hash, manifest_data))
+
+    bundles[5] = ("tampered", bundles[5][1])
+    bundles.append(("unsigned", {"bundle": {"name": "plain"}, "artifacts": []}))
+
+    calls = []
+    original = key_manager.load_public_key_by_fingerprint
+
+    def counting_lookup(fingerprint):
+        calls.append(fingerprint)
+        return original(fingerprint)
+
+    key_manager.load_public_key_by_fingerprint = counting_lookup
+
+    batch = verifier.verify_bundles(bundles, max_workers=4)
+
+    assert len(batch.results) == 21
+    assert batch.results[5].status == VerificationStatus.INVALID
+    assert batch.results[20].status == VerificationStatus.UNSIGNED
+    assert batch.valid_count == 20
+    assert batch.invalid_count == 1
+    assert batch.elapsed_ms >= 0
+    # One trust-store lookup per signer (plus first-use races between workers)
+    assert len(calls) <= 4
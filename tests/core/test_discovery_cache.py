@@ -0,0 +1,214 @@
+"""Tests for the persisted discovery cache and concurrent discovery scans."""
+
+import json
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from skillmeat.core.discovery import ArtifactDiscoveryService
+from skillmeat.core.discovery_cache import (
+    USED_PERSIST_INTERVAL,
+    CachedDiscovery,
+    DiscoveryCache,
+    fingerprint_artifact,
+)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+def _write_skill(skills_dir: Path, name: str, description: str = "A skill") -> Path:
+    skill_dir = skills_dir / name
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    (skill_dir / "SKILL.md").write_text(
+        f"---\nname: {name}\ndescription: {description}\n---\n\n# {name}\n"
+    )
+    return skill_dir
+
+
+def _age(path: Path, seconds: int) -> None:
+    """Push mtimes of a tree into the past so later edits are detectable."""
+    stamp = time.time() - seconds
+    for root, dirs, files in os.walk(path):
+        for name in dirs + files:
+            os.utime(os.path.join(root, name), (stamp, stamp))
+    os.utime(path, (stamp, stamp))
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Project with a .claude/skills directory holding several skills."""
+    skills_dir = tmp_path / "project" / ".claude" / "skills"
+    skills_dir.mkdir(parents=True)
+    for i in range(6):
+        _write_skill(skills_dir, f"skill-{i}")
+    _age(tmp_path / "project", 60)
+    return tmp_path / "project"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return DiscoveryCache(tmp_path / "cache" / "discovery.json")
+
+
+def _scan(service: ArtifactDiscoveryService):
+    return service.discover_artifacts(include_collection_status=False)
+
+
+# =============================================================================
+# Fingerprints and cache storage
+# =============================================================================
+
+
+class TestFingerprint:
+    def test_stable_for_unchanged_tree(self, project):
+        skill = project / ".claude" / "skills" / "skill-0"
+        assert fingerprint_artifact(skill) == fingerprint_artifact(skill)
+
+    def test_changes_when_file_added(self, project):
+        skill = project / ".claude" / "skills" / "skill-0"
+        before = fingerprint_artifact(skill)
+
+        (skill / "notes.txt").write_text("extra")
+
+        assert fingerprint_artifact(skill) != before
+
+    def test_changes_when_file_edited(self, project):
+        skill = project / ".claude" / "skills" / "skill-0"
+        before = fingerprint_artifact(skill)
+
+        (skill / "SKILL.md").write_text("---\nname: skill-0\n---\n")
+
+        assert fingerprint_artifact(skill) != before
+
+
+class TestDiscoveryCache:
+    def test_round_trip(self, cache):
+        cache.put("/a", CachedDiscovery("fp", "skill", True, {"name": "a"}, "h"))
+        cache.save()
+
+        reloaded = DiscoveryCache(cache.path)
+        entry = reloaded.get("/a", "fp")
+
+        assert entry is not None
+        assert entry.metadata == {"name": "a"}
+        assert reloaded.get("/a", "other") is None
+
+    def test_corrupt_file_is_ignored(self, cache):
+        cache.path.parent.mkdir(parents=True)
+        cache.path.write_text("{not json")
+
+        assert cache.get("/a", "fp") is None
+
+    def test_save_prunes_entries_not_seen_in_scan(self, cache):
+        cache.put("/root/gone", CachedDiscovery("fp", "skill", True))
+        cache.put("/elsewhere/kept", CachedDiscovery("fp", "skill", True))
+        scan_start = time.time() + 1
+
+        cache.save(prune_root="/root", prune_before=scan_start)
+
+        data = json.loads(cache.path.read_text())
+        assert set(data["entries"]) == {"/elsewhere/kept"}
+
+
+# =============================================================================
+# Discovery integration
+# =============================================================================
+
+
+class TestCachedDiscovery:
+    def test_repeat_scan_skips_detection(self, project, cache):
+        first = _scan(ArtifactDiscoveryService(project, scan_mode="project", cache=cache))
+
+        service = ArtifactDiscoveryService(project, scan_mode="project", cache=cache)
+        with patch.object(
+            service, "_detect_artifact_type", wraps=service._detect_artifact_type
+        ) as detect:
+            second = _scan(service)
+
+        assert detect.call_count == 0
+        assert [a.name for a in second.artifacts] == [a.name for a in first.artifacts]
+        assert [a.content_hash for a in second.artifacts] == [
+            a.content_hash for a in first.artifacts
+        ]
+
+    def test_modified_artifact_is_rescanned(self, project, cache):
+        _scan(ArtifactDiscoveryService(project, scan_mode="project", cache=cache))
+        _write_skill(project / ".claude" / "skills", "skill-3", "Updated")
+
+        service = ArtifactDiscoveryService(project, scan_mode="project", cache=cache)
+        with patch.object(
+            service, "_detect_artifact_type", wraps=service._detect_artifact_type
+        ) as detect:
+            result = _scan(service)
+
+        assert detect.call_count == 1
+        by_name = {a.name: a for a in result.artifacts}
+        assert by_name["skill-3"].description == "Updated"
+
+    def test_cache_persists_across_instances(self, project, cache):
+        _scan(ArtifactDiscoveryService(project, scan_mode="project", cache=cache))
+
+        reloaded = DiscoveryCache(cache.path)
+        service = ArtifactDiscoveryService(project, scan_mode="project", cache=reloaded)
+        with patch.object(service, "_detect_artifact_type") as detect:
+            result = _scan(service)
+
+        assert detect.call_count == 0
+        assert result.discovered_count == 6
+
+    def test_unchanged_repeat_scan_does_not_rewrite_file(self, project, cache):
+        _scan(ArtifactDiscoveryService(project, scan_mode="project", cache=cache))
+        reloaded = DiscoveryCache(cache.path)
+
+        with patch("skillmeat.core.discovery_cache.os.replace") as replace:
+            _scan(
+                ArtifactDiscoveryService(project, scan_mode="project", cache=reloaded)
+            )
+
+        assert replace.call_count == 0
+
+    def test_stale_used_times_are_persisted_on_read(self, cache):
+        cache.put("/a", CachedDiscovery("fp", "skill", True))
+        cache.save()
+        data = json.loads(cache.path.read_text())
+        data["entries"]["/a"]["used"] -= USED_PERSIST_INTERVAL + 1
+        cache.path.write_text(json.dumps(data))
+
+        reloaded = DiscoveryCache(cache.path)
+        assert reloaded.get("/a", "fp") is not None
+        reloaded.save()
+
+        used = json.loads(cache.path.read_text())["entries"]["/a"]["used"]
+        assert used > time.time() - 60
+
+
+class TestParallelDiscovery:
+    def test_parallel_matches_sequential(self, project):
+        sequential = _scan(
+            ArtifactDiscoveryService(project, scan_mode="project", max_workers=1)
+        )
+        parallel = _scan(
+            ArtifactDiscoveryService(project, scan_mode="project", max_workers=4)
+        )
+
+        assert [a.path for a in parallel.artifacts] == [
+            a.path for a in sequential.artifacts
+        ]
+        assert parallel.errors == sequential.errors
+
+    def test_errors_from_workers_are_collected(self, project):
+        broken = project / ".claude" / "skills" / "skill-2" / "SKILL.md"
+        broken.write_text("---\nname: [broken\n---\n")
+
+        result = _scan(
+            ArtifactDiscoveryService(project, scan_mode="project", max_workers=4)
+        )
+
+        assert result.discovered_count == 5
+        assert any("skill-2" in error for error in result.errors)
@@ -3,16 +3,19 @@
 Covers:
 - check() returns up_to_date=True when hash matches stored state
 - check() returns up_to_date=False when hash differs (or no prior state)
-- sync() skips file writes when up_to_date=True
-- sync() materialises files when hash differs
+- check() sends If-None-Match and treats 304 as up to date
+- sync() skips file writes when the server reports the artifact unchanged
+- sync() sends its file manifest and applies streamed deltas
+- sync_many() syncs several artifacts in one request
 - Sync state file is updated with new hash after successful sync
-- Base64-encoded files are decoded correctly
 - API errors are surfaced in result.error without raising
+- End-to-end delta sync against a local FastAPI server
 """
 
 from __future__ import annotations
 
-import base64
+import hashlib
+import io
 import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -20,6 +23,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 import requests
 
+from skillmeat.core.enterprise_delta import write_delta_archive
 from skillmeat.core.enterprise_sync import EnterpriseSyncer, EnterpriseSyncResult
 
 if sys.version_info >= (3, 11):
@@ -59,6 +63,43 @@ def _mock_response(payload: dict, status_code: int = 200) -> MagicMock:
     return resp
 
 
+def _header(
+    artifact_id: str,
+    content_hash: str,
+    status: str = "updated",
+    removed: list[str] | None = None,
+    error: str | None = None,
+) -> dict:
+    return {
+        "artifact_id": artifact_id,
+        "status": status,
+        "content_hash": content_hash,
+        "version": "v1",
+        "files": [],
+        "removed": removed or [],
+        "error": error,
+    }
+
+
+def _mock_delta_response(*entries, files: list | None = None) -> MagicMock:
+    """Build a streamed delta response.
+
+    Each entry is a header dict or a ``(header, files)`` tuple; ``files``
+    applies to a single header entry.
+    """
+    normalised = []
+    for entry in entries:
+        header, entry_files = entry if isinstance(entry, tuple) else (entry, files or [])
+        header = dict(header, files=[path for path, _ in entry_files])
+        normalised.append((header, entry_files))
+
+    resp = MagicMock(spec=requests.Response)
+    resp.status_code = 200
+    resp.raise_for_status.return_value = None
+    resp.raw = io.BytesIO(b"".join(write_delta_archive(normalised)))
+    return resp
+
+
 def _read_sync_state(target_dir: Path) -> dict:
     state_file = target_dir / _SYNC_STATE_FILE
     if not state_file.exists():
@@ -67,7 +108,12 @@ def _read_sync_state(target_dir: Path) -> dict:
         return tomllib.load(fh)
 
 
-def _write_initial_hash(target_dir: Path, artifact_name: str, content_hash: str) -> None:
+def _write_initial_hash(
+    target_dir: Path,
+    artifact_name: str,
+    content_hash: str,
+    files: list[str] | None = None,
+) -> None:
     """Pre-seed the sync state file so tests can simulate prior syncs."""
     import tomli_w
 
@@ -76,6 +122,7 @@ def _write_initial_hash(target_dir: Path, artifact_name: str, content_hash: str)
             artifact_name: {
                 "content_hash": content_hash,
                 "synced_at": "2026-01-01T00:00:00+00:00",
+                "files": files or [],
             }
         }
     }
@@ -162,6 +209,25 @@ class TestCheckUpToDate:
         # No artifact file should have been written
         assert not (tmp_path / "SKILL.md").exists()
 
+    def test_check_is_conditional_on_stored_hash(self, tmp_path: Path, monkeypatch):
+        """The stored hash is sent as If-None-Match; 304 means up to date."""
+        monkeypatch.setenv("SKILLMEAT_API_URL", "http://test")
+        _write_initial_hash(tmp_path, "art", "abc123")
+
+        not_modified = MagicMock(spec=requests.Response)
+        not_modified.status_code = 304
+        with patch(
+            "skillmeat.core.enterprise_sync.enterprise_request",
+            return_value=not_modified,
+        ) as mock_request:
+            result = EnterpriseSyncer().check("art", target_dir=tmp_path)
+
+        assert mock_request.call_args.args == ("GET", "/api/v1/artifacts/art/hash")
+        assert mock_request.call_args.kwargs["headers"] == {"If-None-Match": '"abc123"'}
+        not_modified.json.assert_not_called()
+        assert result.up_to_date is True
+        assert result.new_hash == "abc123"
+
     def test_check_does_not_update_sync_state(self, tmp_path: Path, monkeypatch):
         """check() never modifies .skillmeat-enterprise-sync.toml."""
         monkeypatch.setenv("SKILLMEAT_API_URL", "http://test")
@@ -185,39 +251,24 @@ class TestCheckUpToDate:
 
 
 class TestSyncSkipsWhenUpToDate:
-    """sync() returns early without file I/O when hashes match."""
+    """sync() returns early without file I/O when the server reports unchanged."""
 
     def test_sync_returns_up_to_date_result(self, tmp_path: Path, monkeypatch):
         monkeypatch.setenv("SKILLMEAT_API_URL", "http://test")
         _write_initial_hash(tmp_path, "cached-art", "same_hash")
 
-        payload = _mock_payload("cached-art", "same_hash", files=[
-            {"path": "SKILL.md", "content": "should not be written", "encoding": "utf-8"},
-        ])
         with patch(
             "skillmeat.core.enterprise_sync.enterprise_request",
-            return_value=_mock_response(payload),
-        ):
+            return_value=_mock_delta_response(_header("cached-art", "same_hash", "unchanged")),
+        ) as mock_request:
             result = EnterpriseSyncer().sync("cached-art", target_dir=tmp_path)
 
         assert result.up_to_date is True
         assert result.updated is False
         assert result.files_updated == 0
-
-    def test_sync_does_not_write_files_when_up_to_date(self, tmp_path: Path, monkeypatch):
-        monkeypatch.setenv("SKILLMEAT_API_URL", "http://test")
-        _write_initial_hash(tmp_path, "art", "match")
-
-        payload = _mock_payload("art", "match", files=[
-            {"path": "should_not_exist.md", "content": "x"},
-        ])
-        with patch(
-            "skillmeat.core.enterprise_sync.enterprise_request",
-            return_value=_mock_response(payload),
-        ):
-            EnterpriseSyncer().sync("art", target_dir=tmp_path)
-
-        assert not (tmp_path / "should_not_exist.md").exists()
+        sent = mock_request.call_args.kwargs["json"]["artifacts"][0]
+        assert sent["artifact_id"] == "cached-art"
+        assert sent["content_hash"] == "same_hash"
 
     def test_sync_does_not_update_hash_when_up_to_date(self, tmp_path: Path, monkeypatch):
         """synced_at timestamp should not change when already up-to-date."""
@@ -228,10 +279,9 @@ class TestSyncSkipsWhenUpToDate:
         state_before = _read_sync_state(tmp_path)
         synced_at_before = state_before["artifacts"]["art"]["synced_at"]
 
-        payload = _mock_payload("art", "same")
         with patch(
             "skillmeat.core.enterprise_sync.enterprise_request",
-            return_value=_mock_response(payload),
+            return_value=_mock_delta_response(_header("art", "same", "unchanged")),
         ):
             EnterpriseSyncer().sync("art", target_dir=tmp_path)
 
@@ -240,28 +290,27 @@ class TestSyncSkipsWhenUpToDate:
 
 
 # ---------------------------------------------------------------------------
-# Tests: sync() — materialise files when hash differs
+# Tests: sync() — apply deltas
 # ---------------------------------------------------------------------------
 
 
-class TestSyncMaterialisesFiles:
-    """sync() writes files when remote hash differs from stored hash."""
+class TestSyncAppliesDelta:
+    """sync() writes the files in the delta archive and removes dropped ones."""
 
     def test_sync_writes_files_when_hash_differs(self, tmp_path: Path, monkeypatch):
         monkeypatch.setenv("SKILLMEAT_API_URL", "http://test")
         _write_initial_hash(tmp_path, "art", "old_hash")
 
-        payload = _mock_payload(
-            "art",
-            "new_hash",
+        response = _mock_delta_response(
+            _header("art", "new_hash"),
             files=[
-                {"path": "SKILL.md", "content": "# Updated skill\n", "encoding": "utf-8"},
-                {"path": "src/helper.py", "content": "# helper\n", "encoding": "utf-8"},
+                ("SKILL.md", b"# Updated skill\n"),
+                ("src/helper.py", b"# helper\n"),
             ],
         )
         with patch(
             "skillmeat.core.enterprise_sync.enterprise_request",
-            return_value=_mock_response(payload),
+            return_value=response,
         ):
             result = EnterpriseSyncer().sync("art", target_dir=tmp_path)
 
@@ -270,53 +319,75 @@ class TestSyncMaterialisesFiles:
         assert (tmp_path / "SKILL.md").read_text() == "# Updated skill\n"
         assert (tmp_path / "src" / "helper.py").read_text() == "# helper\n"
 
-    def test_sync_writes_files_on_first_sync(self, tmp_path: Path, monkeypatch):
-        """No prior state → sync materialises files."""
+    def test_sync_writes_binary_files_verbatim(self, tmp_path: Path, monkeypatch):
         monkeypatch.setenv("SKILLMEAT_API_URL", "http://test")
 
-        payload = _mock_payload(
-            "new-art",
-            "first_hash",
-            files=[{"path": "SKILL.md", "content": "first content\n", "encoding": "utf-8"}],
+        raw_bytes = b"\x89PNG\r\n\x1a\n"  # PNG header
+        response = _mock_delta_response(
+            _header("binary-art", "bin_hash"), files=[("icon.png", raw_bytes)]
         )
         with patch(
             "skillmeat.core.enterprise_sync.enterprise_request",
-            return_value=_mock_response(payload),
+            return_value=response,
         ):
-            result = EnterpriseSyncer().sync("new-art", target_dir=tmp_path)
+            result = EnterpriseSyncer().sync("binary-art", target_dir=tmp_path)
 
         assert result.updated is True
-        assert result.files_updated == 1
-        assert (tmp_path / "SKILL.md").read_text() == "first content\n"
+        assert (tmp_path / "icon.png").read_bytes() == raw_bytes
 
-    def test_sync_handles_base64_encoded_files(self, tmp_path: Path, monkeypatch):
+    def test_sync_sends_manifest_and_removes_dropped_files(
+        self, tmp_path: Path, monkeypatch
+    ):
         monkeypatch.setenv("SKILLMEAT_API_URL", "http://test")
+        _write_initial_hash(tmp_path, "art", "old", files=["SKILL.md", "old.md"])
+        (tmp_path / "SKILL.md").write_text("keep")
+        (tmp_path / "old.md").write_text("drop")
 
-        raw_bytes = b"\x89PNG\r\n\x1a\n"  # PNG header
-        encoded = base64.b64encode(raw_bytes).decode("ascii")
+        response = _mock_delta_response(
+            _header("art", "new", removed=["old.md"])
+        )
+        with patch(
+            "skillmeat.core.enterprise_sync.enterprise_request",
+            return_value=response,
+        ) as mock_request:
+            result = EnterpriseSyncer().sync("art", target_dir=tmp_path)
 
-        payload = _mock_payload(
-            "binary-art",
-            "bin_hash",
-            files=[{"path": "icon.png", "content": encoded, "encoding": "base64"}],
+        sent = mock_request.call_args.kwargs["json"]["artifacts"][0]["files"]
+        assert sent == {
+            "SKILL.md": hashlib.sha256(b"keep").hexdigest(),
+            "old.md": hashlib.sha256(b"drop").hexdigest(),
+        }
+        assert result.updated is True
+        assert result.files_updated == 0
+        assert not (tmp_path / "old.md").exists()
+        assert (tmp_path / "SKILL.md").read_text() == "keep"
+        assert _read_sync_state(tmp_path)["artifacts"]["art"]["files"] == ["SKILL.md"]
+
+    def test_sync_rejects_paths_outside_target_dir(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setenv("SKILLMEAT_API_URL", "http://test")
+        target = tmp_path / "target"
+
+        response = _mock_delta_response(
+            _header("art", "h"), files=[("../escape.md", b"x")]
         )
         with patch(
             "skillmeat.core.enterprise_sync.enterprise_request",
-            return_value=_mock_response(payload),
+            return_value=response,
         ):
-            result = EnterpriseSyncer().sync("binary-art", target_dir=tmp_path)
+            result = EnterpriseSyncer().sync("art", target_dir=target)
 
-        assert result.updated is True
-        assert (tmp_path / "icon.png").read_bytes() == raw_bytes
+        assert not (tmp_path / "escape.md").exists()
+        assert result.error is not None
+        # Not persisted, so the next sync asks for the delta again.
+        assert _read_sync_state(target) == {}
 
     def test_sync_result_hashes(self, tmp_path: Path, monkeypatch):
         monkeypatch.setenv("SKILLMEAT_API_URL", "http://test")
         _write_initial_hash(tmp_path, "art", "hash_v1")
 
-        payload = _mock_payload("art", "hash_v2")
         with patch(
             "skillmeat.core.enterprise_sync.enterprise_request",
-            return_value=_mock_response(payload),
+            return_value=_mock_delta_response(_header("art", "hash_v2")),
         ):
             result = EnterpriseSyncer().sync("art", target_dir=tmp_path)
 
@@ -324,6 +395,32 @@ class TestSyncMaterialisesFiles:
         assert result.new_hash == "hash_v2"
         assert result.up_to_date is False
 
+    def test_sync_many_uses_one_request(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setenv("SKILLMEAT_API_URL", "http://test")
+        _write_initial_hash(tmp_path, "same", "h1")
+
+        response = _mock_delta_response(
+            _header("same", "h1", "unchanged"),
+            (_header("new", "h2"), [("new.md", b"new")]),
+            _header("gone", "", "not_found", error="Artifact not found: 'gone'"),
+        )
+        with patch(
+            "skillmeat.core.enterprise_sync.enterprise_request",
+            return_value=response,
+        ) as mock_request:
+            results = EnterpriseSyncer().sync_many(
+                ["same", "new", "gone"], target_dir=tmp_path
+            )
+
+        assert mock_request.call_count == 1
+        assert [r.artifact_name for r in results] == ["same", "new", "gone"]
+        assert results[0].up_to_date is True
+        assert results[1].updated is True and results[1].files_updated == 1
+        assert results[2].error == "Artifact not found: 'gone'"
+        state = _read_sync_state(tmp_path)["artifacts"]
+        assert state["new"]["content_hash"] == "h2"
+        assert "gone" not in state
+
 
 # ---------------------------------------------------------------------------
 # Tests: sync state persistence
@@ -337,10 +434,9 @@ class TestSyncStatePersistence:
         monkeypatch.setenv("SKILLMEAT_API_URL", "http://test")
         _write_initial_hash(tmp_path, "art", "old_hash")
 
-        payload = _mock_payload("art", "new_hash")
         with patch(
             "skillmeat.core.enterprise_sync.enterprise_request",
-            return_value=_mock_response(payload),
+            return_value=_mock_delta_response(_header("art", "new_hash")),
         ):
             EnterpriseSyncer().sync("art", target_dir=tmp_path)
 
@@ -350,16 +446,19 @@ class TestSyncStatePersistence:
     def test_sync_state_file_created_on_first_sync(self, tmp_path: Path, monkeypatch):
         monkeypatch.setenv("SKILLMEAT_API_URL", "http://test")
 
-        payload = _mock_payload("brand-new", "first_hash")
+        response = _mock_delta_response(
+            _header("brand-new", "first_hash"), files=[("SKILL.md", b"first\n")]
+        )
         with patch(
             "skillmeat.core.enterprise_sync.enterprise_request",
-            return_value=_mock_response(payload),
+            return_value=response,
         ):
             EnterpriseSyncer().sync("brand-new", target_dir=tmp_path)
 
         assert (tmp_path / _SYNC_STATE_FILE).exists()
         state = _read_sync_state(tmp_path)
         assert state["artifacts"]["brand-new"]["content_hash"] == "first_hash"
+        assert state["artifacts"]["brand-new"]["files"] == ["SKILL.md"]
 
     def test_sync_state_preserves_other_artifacts(self, tmp_path: Path, monkeypatch):
         """Syncing one artifact does not remove other artifacts from state."""
@@ -377,10 +476,9 @@ class TestSyncStatePersistence:
             tomli_w.dump(state, fh)
 
         # Sync only art-b
-        payload = _mock_payload("art-b", "new_b")
         with patch(
             "skillmeat.core.enterprise_sync.enterprise_request",
-            return_value=_mock_response(payload),
+            return_value=_mock_delta_response(_header("art-b", "new_b")),
         ):
             EnterpriseSyncer().sync("art-b", target_dir=tmp_path)
 
@@ -395,10 +493,9 @@ class TestSyncStatePersistence:
         old_state = _read_sync_state(tmp_path)
         old_ts = old_state["artifacts"]["art"]["synced_at"]
 
-        payload = _mock_payload("art", "new_hash")
         with patch(
             "skillmeat.core.enterprise_sync.enterprise_request",
-            return_value=_mock_response(payload),
+            return_value=_mock_delta_response(_header("art", "new_hash")),
         ):
             EnterpriseSyncer().sync("art", target_dir=tmp_path)
 
@@ -407,6 +504,23 @@ class TestSyncStatePersistence:
         # Timestamp must have advanced
         assert new_ts >= old_ts
 
+    def test_truncated_archive_does_not_persist_hash(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setenv("SKILLMEAT_API_URL", "http://test")
+        _write_initial_hash(tmp_path, "art", "old_hash")
+
+        response = _mock_delta_response(
+            _header("art", "new_hash"), files=[("SKILL.md", b"x" * 4096)]
+        )
+        response.raw = io.BytesIO(response.raw.getvalue()[:100])
+        with patch(
+            "skillmeat.core.enterprise_sync.enterprise_request",
+            return_value=response,
+        ):
+            result = EnterpriseSyncer().sync("art", target_dir=tmp_path)
+
+        assert result.error is not None
+        assert _read_sync_state(tmp_path)["artifacts"]["art"]["content_hash"] == "old_hash"
+
 
 # ---------------------------------------------------------------------------
 # Tests: atomic writes in sync
@@ -419,13 +533,8 @@ class TestSyncAtomicWrites:
     def test_replace_called_for_each_file(self, tmp_path: Path, monkeypatch):
         monkeypatch.setenv("SKILLMEAT_API_URL", "http://test")
 
-        payload = _mock_payload(
-            "art",
-            "h",
-            files=[
-                {"path": "a.md", "content": "a", "encoding": "utf-8"},
-                {"path": "b.md", "content": "b", "encoding": "utf-8"},
-            ],
+        response = _mock_delta_response(
+            _header("art", "h"), files=[("a.md", b"a"), ("b.md", b"b")]
         )
 
         replace_calls: list = []
@@ -437,7 +546,7 @@ class TestSyncAtomicWrites:
 
         with patch(
             "skillmeat.core.enterprise_sync.enterprise_request",
-            return_value=_mock_response(payload),
+            return_value=response,
         ), patch.object(Path, "replace", tracking_replace):
             EnterpriseSyncer().sync("art", target_dir=tmp_path)
 
@@ -509,3 +618,170 @@ class TestSyncAPIErrors:
             result = EnterpriseSyncer().sync("forbidden-art", target_dir=tmp_path)
 
         assert result.error is not None
+
+
+# ---------------------------------------------------------------------------
+# Tests: end-to-end against a local FastAPI server
+# ---------------------------------------------------------------------------
+
+
+_PAT = "test-secret"
+
+
+class _Versions:
+    """Mutable stand-in for the latest EnterpriseArtifactVersion rows."""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, str] = {}
+
+
+@pytest.fixture
+def enterprise_server(tmp_path: Path, monkeypatch):
+    """Run the enterprise content router on a local uvicorn server.
+
+    The content service is real; only its DB lookups are mocked, so
+    artifacts resolve by name to ``<collection>/skills/<name>`` and their
+    latest hash comes from ``server.versions.hashes``.
+    """
+    import threading
+    import time
+    import types
+    from unittest.mock import Mock
+
+    import uvicorn
+
+    from skillmeat.api.config import APISettings, Environment, get_settings
+    from skillmeat.api.routers.enterprise_content import _get_content_service
+    from skillmeat.api.server import create_app
+    from skillmeat.core.services.enterprise_content import EnterpriseContentService
+
+    collection = tmp_path / "collection"
+    versions = _Versions()
+
+    def get_by_name(name):
+        if name not in versions.hashes:
+            return None
+        artifact = Mock()
+        artifact.id = name
+        artifact.name = name
+        artifact.artifact_type = "skill"
+        artifact.custom_fields = {}
+        return artifact
+
+    def build_service():
+        repo = MagicMock()
+        repo.get_by_name.side_effect = get_by_name
+        session = MagicMock()
+
+        def execute(stmt):
+            name = stmt.whereclause.right.value
+            row = Mock(version_tag="v1", content_hash=versions.hashes[name])
+            result = MagicMock()
+            result.scalar_one_or_none.return_value = row
+            return result
+
+        session.execute.side_effect = execute
+        return EnterpriseContentService(
+            session=session, artifact_repo=repo, collection_root=collection
+        )
+
+    settings = APISettings(
+        env=Environment.TESTING,
+        api_key_enabled=False,
+        auth_enabled=False,
+        enterprise_pat_secret=_PAT,
+    )
+    app = create_app(settings)
+    app.dependency_overrides[get_settings] = lambda: settings
+    app.dependency_overrides[_get_content_service] = build_service
+
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=0, log_level="error")
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not server.started:
+        assert time.monotonic() < deadline, "uvicorn did not start"
+        time.sleep(0.02)
+    port = server.servers[0].sockets[0].getsockname()[1]
+
+    monkeypatch.setenv("SKILLMEAT_API_URL", f"http://127.0.0.1:{port}")
+    monkeypatch.setenv("SKILLMEAT_PAT", _PAT)
+
+    def publish(name: str, content_hash: str, files: dict[str, bytes]) -> None:
+        root = collection / "skills" / name
+        for existing in sorted(root.rglob("*"), reverse=True) if root.exists() else []:
+            existing.unlink() if existing.is_file() else existing.rmdir()
+        for rel_path, data in files.items():
+            (root / rel_path).parent.mkdir(parents=True, exist_ok=True)
+            (root / rel_path).write_bytes(data)
+        versions.hashes[name] = content_hash
+
+    yield types.SimpleNamespace(publish=publish, versions=versions)
+
+    server.should_exit = True
+    thread.join(timeout=10)
+
+
+class TestDeltaSyncAgainstServer:
+    """Conditional checks and delta syncs over real HTTP."""
+
+    def test_second_sync_transfers_only_changes(self, tmp_path: Path, enterprise_server):
+        target = tmp_path / "project" / ".claude"
+        enterprise_server.publish(
+            "canvas",
+            "h1",
+            {"SKILL.md": b"# Canvas\n", "ref/a.md": b"a", "ref/old.md": b"old"},
+        )
+
+        syncer = EnterpriseSyncer()
+        first = syncer.sync("canvas", target_dir=target)
+        assert first.error is None
+        assert first.files_updated == 3
+        assert (target / "ref" / "old.md").read_bytes() == b"old"
+
+        assert syncer.check("canvas", target_dir=target).up_to_date is True
+        assert syncer.sync("canvas", target_dir=target).up_to_date is True
+
+        enterprise_server.publish(
+            "canvas",
+            "h2",
+            {"SKILL.md": b"# Canvas v2\n", "ref/a.md": b"a", "icon.png": b"\x89PNG\x00"},
+        )
+        check = syncer.check("canvas", target_dir=target)
+        assert check.up_to_date is False and check.new_hash == "h2"
+
+        second = syncer.sync("canvas", target_dir=target)
+        assert second.error is None
+        assert second.files_updated == 2  # SKILL.md changed, icon.png added
+        assert (target / "SKILL.md").read_bytes() == b"# Canvas v2\n"
+        assert (target / "icon.png").read_bytes() == b"\x89PNG\x00"
+        assert not (target / "ref" / "old.md").exists()
+        assert _read_sync_state(target)["artifacts"]["canvas"]["files"] == [
+            "SKILL.md",
+            "icon.png",
+            "ref/a.md",
+        ]
+
+    def test_sync_many_in_one_round_trip(self, tmp_path: Path, enterprise_server):
+        target = tmp_path / ".claude"
+        enterprise_server.publish("one", "h1", {"one/SKILL.md": b"1"})
+        enterprise_server.publish("two", "h2", {"two/SKILL.md": b"2"})
+
+        from skillmeat.core import enterprise_sync
+
+        with patch.object(
+            enterprise_sync,
+            "enterprise_request",
+            wraps=enterprise_sync.enterprise_request,
+        ) as spy:
+            results = EnterpriseSyncer().sync_many(
+                ["one", "two", "missing"], target_dir=target
+            )
+
+        assert spy.call_count == 1
+        assert [r.files_updated for r in results] == [1, 1, 0]
+        assert results[2].error is not None
+        assert (target / "one" / "SKILL.md").read_bytes() == b"1"
+        assert (target / "two" / "SKILL.md").read_bytes() == b"2"
@@ -11,7 +11,13 @@ from sqlalchemy.orm import Session, sessionmaker
 
 from skillmeat.cache.models import Base, Artifact, ArtifactVersion, Project
 from skillmeat.core.version_lineage import (
+    LINEAGE_WINDOW,
+    backfill_ancestry_index,
+    build_ancestry_index,
     build_version_lineage,
+    compute_ancestry,
+    index_version,
+    is_ancestor,
     find_common_ancestor,
     get_version_chain,
     get_latest_version,
@@ -462,3 +468,113 @@ class TestTraceLineagePath:
 
         path = trace_lineage_path(session, "unrelated", "current")
         assert path is None
+
+
+def _add_chain(session, artifact_id, hashes, parent_hash=None, indexed=True):
+    """Add a linear chain of versions, each the parent of the next."""
+    for content_hash in hashes:
+        version = ArtifactVersion(
+            artifact_id=artifact_id,
+            content_hash=content_hash,
+            parent_hash=parent_hash,
+            change_origin="sync" if parent_hash else "deployment",
+            version_lineage=json.dumps(
+                build_version_lineage(session, parent_hash, content_hash)
+            ),
+        )
+        if indexed:
+            index_version(session, version)
+        session.add(version)
+        session.flush()
+        parent_hash = content_hash
+    session.commit()
+
+
+class TestAncestryIndex:
+    """Test the binary-lifting ancestry index."""
+
+    def test_compute_ancestry_root_and_missing_parent(self, session):
+        """Roots have depth 0; unrecorded parents are treated as roots."""
+        assert compute_ancestry(session, None) == (0, [])
+        assert compute_ancestry(session, "unknown") == (1, ["unknown"])
+
+    def test_skip_pointers_are_powers_of_two(self, session, sample_artifact):
+        """The k-th skip pointer is the 2**k-th ancestor."""
+        hashes = [f"v{i}" for i in range(20)]
+        _add_chain(session, sample_artifact.id, hashes)
+
+        leaf = session.query(ArtifactVersion).filter_by(content_hash="v19").one()
+        assert leaf.lineage_depth == 19
+        assert leaf.get_ancestor_skips() == ["v18", "v17", "v15", "v11", "v3"]
+
+    def test_long_chain_queries(self, session, sample_artifact):
+        """Depth, ancestry, common ancestor and paths on a forked long chain."""
+        trunk = [f"t{i}" for i in range(100)]
+        _add_chain(session, sample_artifact.id, trunk)
+        _add_chain(session, sample_artifact.id, ["a1", "a2"], parent_hash="t40")
+        _add_chain(session, sample_artifact.id, ["b1"], parent_hash="t70")
+
+        assert get_lineage_depth(session, "t99") == 99
+        assert is_ancestor(session, "t0", "t99")
+        assert is_ancestor(session, "t40", "a2")
+        assert not is_ancestor(session, "a1", "b1")
+        assert find_common_ancestor(session, "a2", "b1") == "t40"
+        assert find_common_ancestor(session, "t99", "b1") == "t70"
+        assert trace_lineage_path(session, "t95", "t99") == [
+            "t95",
+            "t96",
+            "t97",
+            "t98",
+            "t99",
+        ]
+        assert trace_lineage_path(session, "a1", "b1") is None
+
+    def test_stored_lineage_is_bounded(self, session, sample_artifact):
+        """The JSON lineage keeps only the most recent LINEAGE_WINDOW hashes."""
+        hashes = [f"w{i}" for i in range(LINEAGE_WINDOW + 10)]
+        _add_chain(session, sample_artifact.id, hashes)
+
+        leaf = session.query(ArtifactVersion).filter_by(content_hash=hashes[-1]).one()
+        lineage = json.loads(leaf.version_lineage)
+        assert len(lineage) == LINEAGE_WINDOW
+        assert lineage[-1] == hashes[-1]
+        # Depth still comes from the index, not the truncated list
+        assert get_lineage_depth(session, hashes[-1]) == len(hashes) - 1
+
+    def test_build_ancestry_index_matches_incremental(self, session, sample_artifact):
+        """The in-memory backfill produces the same entries as index_version."""
+        hashes = [f"c{i}" for i in range(12)]
+        _add_chain(session, sample_artifact.id, hashes)
+
+        parents = {h: (hashes[i - 1] if i else None) for i, h in enumerate(hashes)}
+        index = build_ancestry_index(parents)
+        for version in session.query(ArtifactVersion).all():
+            assert index[version.content_hash] == (
+                version.lineage_depth,
+                version.get_ancestor_skips(),
+            )
+
+    def test_backfill_indexes_legacy_rows(self, session, sample_artifact):
+        """Rows written before the index existed are indexed by the backfill."""
+        hashes = [f"l{i}" for i in range(6)]
+        _add_chain(session, sample_artifact.id, hashes, indexed=False)
+        assert get_lineage_depth(session, "l5") == 5
+
+        assert backfill_ancestry_index(session, batch_size=2) == 6
+        session.commit()
+
+        leaf = session.query(ArtifactVersion).filter_by(content_hash="l5").one()
+        assert leaf.lineage_depth == 5
+        assert leaf.get_ancestor_skips() == ["l4", "l3", "l1"]
+        assert backfill_ancestry_index(session) == 0
+
+    def test_long_unindexed_chain_does_not_recurse(self, session, sample_artifact):
+        """Legacy chains deeper than the recursion limit are walked iteratively."""
+        hashes = [f"deep{i}" for i in range(1500)]
+        _add_chain(session, sample_artifact.id, hashes, indexed=False)
+
+        depth, skips = compute_ancestry(session, hashes[-1])
+
+        assert depth == len(hashes)
+        # Unindexed ancestors only carry a parent pointer
+        assert skips == [hashes[-1], hashes[-2]]
@@ -1512,6 +1512,16 @@ class MockDbUserCollectionRepository(IDbUserCollectionRepository):
             return 0
         return collection.artifact_count
 
+    def get_group_and_artifact_counts(
+        self,
+        collection_ids: list[str],
+        ctx: RequestContext | None = None,
+    ) -> dict[str, tuple[int, int]]:
+        return {
+            cid: (len(self.get_groups(cid)), self.get_artifact_count(cid))
+            for cid in collection_ids
+        }
+
 
 # =============================================================================
 # MockDbCollectionArtifactRepository
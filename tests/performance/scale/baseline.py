@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""Save and compare JSON baselines for the large-scale benchmark suite.
+
+Baselines are compact summaries of a ``pytest --benchmark-json`` report:
+the median, mean, minimum and round count of every benchmark, keyed by its
+full test name, together with the dataset profile and machine the report
+came from.  They live in ``tests/performance/scale/baselines/<profile>.json``
+and are committed, so a change can be compared with the commit before it.
+
+A benchmark regresses when its median exceeds the baseline median by more
+than the tolerance (default 25%).  Benchmarks missing from either side are
+reported but never fail the comparison.
+
+Usage:
+    pytest tests/performance/scale --benchmark-only --benchmark-json=report.json
+    python tests/performance/scale/baseline.py save report.json
+    python tests/performance/scale/baseline.py compare report.json
+    python tests/performance/scale/baseline.py compare report.json --tolerance 0.1
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+#: Directory holding one baseline file per profile.
+BASELINE_DIR = Path(__file__).parent / "baselines"
+
+#: Allowed median slowdown before a benchmark counts as a regression.
+DEFAULT_TOLERANCE = 0.25
+
+_STATS = ("median", "mean", "min", "rounds")
+
+
+@dataclass
+class Comparison:
+    """One benchmark compared against its baseline.
+
+    Attributes:
+        name: Full benchmark test name
+        baseline: Baseline median in seconds, or None if new
+        current: Current median in seconds, or None if no longer run
+        regressed: Whether the slowdown exceeds the tolerance
+    """
+
+    name: str
+    baseline: Optional[float]
+    current: Optional[float]
+    regressed: bool = False
+
+    @property
+    def ratio(self) -> Optional[float]:
+        """Current median divided by baseline median."""
+        if not self.baseline or self.current is None:
+            return None
+        return self.current / self.baseline
+
+
+def summarize(report: dict) -> dict:
+    """Reduce a pytest-benchmark JSON report to a baseline document.
+
+    Args:
+        report: Parsed ``--benchmark-json`` output
+
+    Returns:
+        Baseline document with profile, machine, commit and per-benchmark
+        statistics
+    """
+    machine = report.get("machine_info") or {}
+    commit = report.get("commit_info") or {}
+    return {
+        "profile": report.get("scale_profile"),
+        "machine": {
+            key: machine.get(key)
+            for key in ("node", "processor", "machine", "python_version")
+            if key in machine
+        },
+        "commit": commit.get("id"),
+        "datetime": report.get("datetime"),
+        "benchmarks": {
+            bench["fullname"]: {
+                key: bench["stats"][key] for key in _STATS if key in bench["stats"]
+            }
+            for bench in sorted(
+                report.get("benchmarks", []), key=lambda b: b["fullname"]
+            )
+        },
+    }
+
+
+def compare(
+    current: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE
+) -> List[Comparison]:
+    """Compare two baseline documents benchmark by benchmark.
+
+    Args:
+        current: Summary of the report under test
+        baseline: Stored baseline
+        tolerance: Allowed fractional slowdown of the median
+
+    Returns:
+        Comparisons for every benchmark in either document, sorted by name
+    """
+    now: Dict[str, dict] = current.get("benchmarks", {})
+    before: Dict[str, dict] = baseline.get("benchmarks", {})
+    results = []
+    for name in sorted(set(now) | set(before)):
+        old = before.get(name, {}).get("median")
+        new = now.get(name, {}).get("median")
+        regressed = old is not None and new is not None and new > old * (1 + tolerance)
+        results.append(Comparison(name, old, new, regressed))
+    return results
+
+
+def baseline_path(summary: dict) -> Path:
+    """Default baseline file for the profile a summary was produced with."""
+    profile = (summary.get("profile") or {}).get("name") or "small"
+    return BASELINE_DIR / f"{profile}.json"
+
+
+def _load(path: Path) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _format(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value * 1000:.2f}ms"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point.
+
+    Returns:
+        Exit status: 1 when ``compare`` finds a regression, else 0
+    """
+    parser = argparse.ArgumentParser(
+        description="Save or compare scale benchmark baselines",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    save = sub.add_parser("save", help="Store a report as the baseline")
+    save.add_argument("report", type=Path, help="pytest --benchmark-json output")
+    save.add_argument("--baseline", type=Path, help="Baseline file to write")
+
+    check = sub.add_parser("compare", help="Compare a report with the baseline")
+    check.add_argument("report", type=Path, help="pytest --benchmark-json output")
+    check.add_argument("--baseline", type=Path, help="Baseline file to read")
+    check.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="Allowed fractional slowdown of each median",
+    )
+
+    args = parser.parse_args(argv)
+    summary = summarize(_load(args.report))
+    path = args.baseline or baseline_path(summary)
+
+    if args.command == "save":
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Saved {len(summary['benchmarks'])} benchmarks to {path}")
+        return 0
+
+    results = compare(summary, _load(path), args.tolerance)
+    width = max((len(r.name) for r in results), default=10)
+    for result in results:
+        ratio = f"{result.ratio:.2f}x" if result.ratio is not None else "n/a"
+        flag = "  REGRESSION" if result.regressed else ""
+        print(
+            f"{result.name:<{width}}  {_format(result.baseline):>12}  "
+            f"{_format(result.current):>12}  {ratio:>6}{flag}"
+        )
+    regressions = [r for r in results if r.regressed]
+    print(f"\n{len(regressions)} regression(s) against {path}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
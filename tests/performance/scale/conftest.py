@@ -0,0 +1,90 @@
+"""Fixtures for the large-scale benchmark suite.
+
+The benchmarks (tests marked ``performance``) only run when
+``SKILLMEAT_BENCH_SCALE`` names a profile; otherwise they are skipped, so the
+regular suite never generates a dataset.  The dataset is generated once per
+session from that profile.  Benchmark modules use ``scale_home``, which
+points ``HOME`` at the dataset's home directory so code that falls back to
+the default cache or analytics locations stays inside it.
+"""
+
+import os
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from skillmeat.config import ConfigManager
+
+from tests.performance.scale.datagen import (
+    SCALE_ENV,
+    ScaleDataset,
+    ScaleProfile,
+    describe,
+    generate_dataset,
+    get_profile,
+)
+
+
+def pytest_benchmark_update_json(config, benchmarks, output_json):
+    """Record the dataset profile in ``--benchmark-json`` reports."""
+    output_json["scale_profile"] = describe(get_profile())
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip scale benchmarks unless a profile is selected; apply its timeout."""
+    enabled = SCALE_ENV in os.environ
+    timeout = get_profile().timeout if enabled else None
+    skip = pytest.mark.skip(reason=f"set {SCALE_ENV} to run the scale benchmarks")
+    here = Path(__file__).parent
+    for item in items:
+        if here not in Path(str(item.fspath)).parents:
+            continue
+        if item.get_closest_marker("performance") is None:
+            continue
+        if not enabled:
+            item.add_marker(skip)
+        elif timeout is not None:
+            item.add_marker(pytest.mark.timeout(timeout))
+
+
+@pytest.fixture(scope="session")
+def scale_profile() -> ScaleProfile:
+    return get_profile()
+
+
+@pytest.fixture(scope="session")
+def scale_dataset(tmp_path_factory, scale_profile) -> ScaleDataset:
+    """Generated collection, projects, repo tree and seeded cache database."""
+    return generate_dataset(tmp_path_factory.mktemp("scale"), scale_profile)
+
+
+@pytest.fixture
+def scale_home(monkeypatch, fresh_cache_engine, scale_dataset):
+    """Run the test with ``HOME`` at the dataset and a fresh cache engine."""
+    monkeypatch.setenv("HOME", str(scale_dataset.home))
+    monkeypatch.setattr(
+        ConfigManager, "DEFAULT_CONFIG_DIR", scale_dataset.home / ".skillmeat"
+    )
+    return scale_dataset.home
+
+
+@pytest.fixture
+def measure(benchmark, scale_profile) -> Callable:
+    """Run a callable under ``benchmark.pedantic`` with the profile's rounds.
+
+    Returns the callable's result from the last round.
+    """
+
+    def run(fn: Callable, *args, **kwargs):
+        benchmark.extra_info["scale"] = scale_profile.name
+        return benchmark.pedantic(
+            fn,
+            args=args,
+            kwargs=kwargs,
+            rounds=scale_profile.rounds,
+            iterations=1,
+            warmup_rounds=0,
+        )
+
+    return run
@@ -0,0 +1,673 @@
+"""Synthetic data generator for the large-scale benchmark suite.
+
+Builds a reproducible SkillMeat installation from a :class:`ScaleProfile`:
+
+- a collection directory (``skills/<name>/SKILL.md`` plus supporting files)
+- project directories with ``.claude/skills`` copies and
+  ``.skillmeat-deployed.toml`` records, a share of them locally modified or
+  behind the collection so drift detection has work to do
+- a marketplace repository file tree for heuristic detection
+- a cache database holding projects, artifacts, collections, tags,
+  marketplace sources and catalog entries, written with Core bulk inserts
+
+Every generated value derives from the profile's ``seed``, so two runs with
+the same profile produce identical trees and rows (timestamps aside).
+
+Usage:
+    >>> profile = get_profile("small")
+    >>> dataset = generate_dataset(tmp_path, profile)
+    >>> dataset.db_path
+    PosixPath('.../home/.skillmeat/cache/cache.db')
+"""
+
+import json
+import os
+import random
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from sqlalchemy import insert
+
+from skillmeat.cache import models
+from skillmeat.cache.repositories import TagRepository
+from skillmeat.core.deployment import Deployment
+from skillmeat.core.sync import SyncManager
+from skillmeat.storage.deployment import DeploymentTracker
+
+#: Environment variable selecting the profile used by the benchmark suite.
+SCALE_ENV = "SKILLMEAT_BENCH_SCALE"
+
+#: Profile used when :data:`SCALE_ENV` is unset.
+DEFAULT_SCALE = "small"
+
+#: Project id the API and similarity service use for collection artifacts.
+COLLECTION_PROJECT_ID = "collection_artifacts_global"
+
+COLLECTION_NAME = "default"
+
+_TOPICS = [
+    "python",
+    "typescript",
+    "testing",
+    "documentation",
+    "database",
+    "security",
+    "deployment",
+    "kubernetes",
+    "observability",
+    "refactoring",
+    "review",
+    "migration",
+    "frontend",
+    "accessibility",
+    "performance",
+    "api",
+    "cli",
+    "data",
+    "release",
+    "git",
+]
+_VERBS = [
+    "analyze",
+    "generate",
+    "validate",
+    "format",
+    "review",
+    "summarize",
+    "migrate",
+    "profile",
+    "lint",
+    "scaffold",
+    "audit",
+    "document",
+]
+_NOUNS = [
+    "schemas",
+    "endpoints",
+    "pull requests",
+    "changelogs",
+    "queries",
+    "components",
+    "pipelines",
+    "fixtures",
+    "configs",
+    "dependencies",
+]
+
+
+@dataclass(frozen=True)
+class ScaleProfile:
+    """Size of a generated dataset.
+
+    Attributes:
+        name: Profile name, recorded in benchmark reports and baselines
+        collection_artifacts: Skills in the collection (and cache database)
+        projects: Projects deploying from the collection
+        deployments_per_project: Skills deployed into each project
+        marketplace_sources: Marketplace sources in the cache database
+        catalog_entries: Catalog entries spread across the sources
+        repo_tree_artifacts: Artifact directories in the marketplace repo tree
+        similarity_corpus: Catalog texts indexed by the MinHash benchmarks
+        tags: Tags applied round-robin to collection artifacts
+        drift_ratio: Share of deployments modified locally and, separately,
+            left behind the collection
+        rounds: Benchmark rounds for each measurement
+        timeout: Per-test timeout in seconds (dataset generation and app
+            startup count against the first test that needs them), or None
+            for the configured default
+        seed: Seed for every random choice
+    """
+
+    name: str
+    collection_artifacts: int
+    projects: int
+    deployments_per_project: int
+    marketplace_sources: int
+    catalog_entries: int
+    repo_tree_artifacts: int
+    similarity_corpus: int
+    tags: int = 50
+    drift_ratio: float = 0.05
+    rounds: int = 3
+    timeout: Optional[int] = None
+    seed: int = 20240601
+
+    @property
+    def deployed_artifacts(self) -> int:
+        """Total deployments across all projects."""
+        return self.projects * self.deployments_per_project
+
+
+PROFILES: Dict[str, ScaleProfile] = {
+    # Quick enough for local runs.
+    "small": ScaleProfile(
+        name="small",
+        collection_artifacts=300,
+        projects=10,
+        deployments_per_project=20,
+        marketplace_sources=10,
+        catalog_entries=2_000,
+        repo_tree_artifacts=300,
+        similarity_corpus=500,
+    ),
+    "medium": ScaleProfile(
+        name="medium",
+        collection_artifacts=5_000,
+        projects=100,
+        deployments_per_project=50,
+        marketplace_sources=50,
+        catalog_entries=20_000,
+        repo_tree_artifacts=2_000,
+        similarity_corpus=5_000,
+        timeout=900,
+    ),
+    # The scale SkillMeat runs at in production.
+    "large": ScaleProfile(
+        name="large",
+        collection_artifacts=20_000,
+        projects=300,
+        deployments_per_project=100,
+        marketplace_sources=200,
+        catalog_entries=100_000,
+        repo_tree_artifacts=10_000,
+        similarity_corpus=20_000,
+        rounds=1,
+        timeout=3600,
+    ),
+}
+
+
+def get_profile(name: Optional[str] = None) -> ScaleProfile:
+    """Return a profile by name, defaulting to :data:`SCALE_ENV`.
+
+    Args:
+        name: Profile name, or None to read the environment
+
+    Returns:
+        The matching profile
+
+    Raises:
+        KeyError: If the name is not a known profile
+    """
+    name = name or os.environ.get(SCALE_ENV) or DEFAULT_SCALE
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise KeyError(
+            f"Unknown benchmark scale {name!r}; expected one of {sorted(PROFILES)}"
+        ) from None
+
+
+@dataclass
+class ScaleDataset:
+    """Locations and identifiers of a generated dataset.
+
+    Attributes:
+        profile: Profile the dataset was generated from
+        home: Directory to use as ``HOME`` for code that reads the default
+            cache location
+        collection_path: Collection root (contains ``skills/``)
+        project_paths: Project roots keyed by project id
+        repo_tree: File paths of the synthetic marketplace repository
+        db_path: Seeded cache database (``home/.skillmeat/cache/cache.db``)
+        collection_uuids: Artifact uuids of the collection skills, in order
+        project_artifact_uuids: Artifact uuids deployed in each project
+        expected_drift: Deployments generated as drifted, by drift type
+    """
+
+    profile: ScaleProfile
+    home: Path
+    collection_path: Path
+    project_paths: Dict[str, Path]
+    repo_tree: List[str]
+    db_path: Path
+    collection_uuids: List[str] = field(default_factory=list)
+    project_artifact_uuids: Dict[str, List[str]] = field(default_factory=dict)
+    expected_drift: Dict[str, int] = field(default_factory=dict)
+
+
+class StaticCollectionManager:
+    """Collection manager stand-in for a generated collection directory.
+
+    Provides the two members :class:`~skillmeat.core.sync.SyncManager` and
+    the fleet drift scanner use, without reading ``~/.skillmeat/config.toml``.
+    """
+
+    def __init__(self, collection_path: Path):
+        self.collection_path = collection_path
+        self.config = self
+
+    def load_collection(self, name: Optional[str] = None) -> object:
+        return object()
+
+    def get_collection_path(self, name: Optional[str] = None) -> Path:
+        return self.collection_path
+
+    def get(self, key: str, default=None):
+        return default
+
+
+# =============================================================================
+# Content
+# =============================================================================
+
+
+def skill_name(index: int) -> str:
+    """Name of the collection skill at ``index``."""
+    return f"skill-{index:05d}"
+
+
+def _description(rng: random.Random) -> str:
+    topic = rng.choice(_TOPICS)
+    return f"{rng.choice(_VERBS).title()} {topic} {rng.choice(_NOUNS)} automatically"
+
+
+def _skill_markdown(
+    name: str, description: str, tags: List[str], body_lines: int
+) -> str:
+    body = "\n".join(
+        f"- Step {i}: {description.lower()} for {tags[i % len(tags)]} projects"
+        for i in range(body_lines)
+    )
+    return (
+        f"---\nname: {name}\ndescription: {description}\n"
+        f"tags: [{', '.join(tags)}]\nversion: 1.0.0\n---\n\n"
+        f"# {name}\n\n{description}.\n\n## Steps\n\n{body}\n"
+    )
+
+
+def _write_skill(
+    skill_dir: Path, name: str, description: str, tags: List[str], rng: random.Random
+) -> None:
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    (skill_dir / "SKILL.md").write_text(
+        _skill_markdown(name, description, tags, rng.randint(5, 60))
+    )
+    if rng.random() < 0.4:
+        (skill_dir / "README.md").write_text(f"# {name}\n\n{description}.\n")
+    if rng.random() < 0.2:
+        scripts = skill_dir / "scripts"
+        scripts.mkdir(exist_ok=True)
+        (scripts / "run.py").write_text(
+            f'"""Entry point for {name}."""\n\n\ndef main():\n    return {rng.randint(0, 999)}\n'
+        )
+
+
+# =============================================================================
+# Filesystem
+# =============================================================================
+
+
+def generate_collection(root: Path, profile: ScaleProfile) -> Dict[str, dict]:
+    """Write the collection skills under ``root/skills``.
+
+    Args:
+        root: Collection root
+        profile: Dataset size
+
+    Returns:
+        Skill name to ``{"description", "tags"}`` for every generated skill
+    """
+    rng = random.Random(profile.seed)
+    skills: Dict[str, dict] = {}
+    for index in range(profile.collection_artifacts):
+        name = skill_name(index)
+        description = _description(rng)
+        tags = rng.sample(_TOPICS, 2)
+        _write_skill(root / "skills" / name, name, description, tags, rng)
+        skills[name] = {"description": description, "tags": tags}
+    return skills
+
+
+def generate_projects(
+    root: Path,
+    collection_path: Path,
+    skills: Dict[str, dict],
+    profile: ScaleProfile,
+) -> tuple[Dict[str, Path], Dict[str, List[str]], Dict[str, int]]:
+    """Write project directories deploying skills from the collection.
+
+    A ``drift_ratio`` share of deployments is edited in the project after
+    deployment (``modified``) and another share was deployed from an older
+    version of the collection skill (``outdated``).
+
+    Args:
+        root: Directory that receives one directory per project
+        collection_path: Collection root written by :func:`generate_collection`
+        skills: Result of :func:`generate_collection`
+        profile: Dataset size
+
+    Returns:
+        Tuple of (project paths by id, deployed skill names by project id,
+        count of generated deployments by drift type)
+    """
+    rng = random.Random(profile.seed + 1)
+    sync = SyncManager(collection_manager=StaticCollectionManager(collection_path))
+    names = sorted(skills)
+    per_project = min(profile.deployments_per_project, len(names))
+    deployed_at = datetime.utcnow() - timedelta(days=7)
+
+    project_paths: Dict[str, Path] = {}
+    deployed: Dict[str, List[str]] = {}
+    drift = {"modified": 0, "outdated": 0}
+    for index in range(profile.projects):
+        project_id = f"proj-{index:04d}"
+        project_path = root / f"project-{index:04d}"
+        skills_dir = project_path / ".claude" / "skills"
+        records: List[Deployment] = []
+        chosen = sorted(rng.sample(names, per_project))
+        for name in chosen:
+            info = skills[name]
+            target = skills_dir / name
+            roll = rng.random()
+            if roll < profile.drift_ratio:
+                # Deployed from an older collection version
+                _write_skill(
+                    target, name, f"{info['description']} (v0)", info["tags"], rng
+                )
+                drift["outdated"] += 1
+            else:
+                _copy_tree(collection_path / "skills" / name, target)
+            content_hash = sync._compute_content_hash(target)
+            if profile.drift_ratio <= roll < 2 * profile.drift_ratio:
+                with open(target / "SKILL.md", "a") as f:
+                    f.write("\n## Local notes\n\nProject-specific tweak.\n")
+                drift["modified"] += 1
+            records.append(
+                Deployment(
+                    artifact_name=name,
+                    artifact_type="skill",
+                    from_collection=COLLECTION_NAME,
+                    deployed_at=deployed_at,
+                    artifact_path=Path(f"skills/{name}"),
+                    content_hash=content_hash,
+                    merge_base_snapshot=content_hash,
+                )
+            )
+        DeploymentTracker.write_deployments(project_path, records)
+        project_paths[project_id] = project_path
+        deployed[project_id] = chosen
+    return project_paths, deployed, drift
+
+
+def _copy_tree(source: Path, target: Path) -> None:
+    # Plain read/write so mtimes differ from the collection, like a deploy.
+    for path in sorted(source.rglob("*")):
+        destination = target / path.relative_to(source)
+        if path.is_dir():
+            destination.mkdir(parents=True, exist_ok=True)
+        else:
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            destination.write_bytes(path.read_bytes())
+
+
+def generate_repo_tree(profile: ScaleProfile) -> List[str]:
+    """Return file paths of a synthetic marketplace repository.
+
+    Mixes skill, command and agent directories with plugin bundles, nested
+    documentation and source files the detector has to reject.
+
+    Args:
+        profile: Dataset size
+
+    Returns:
+        Repository-relative file paths
+    """
+    rng = random.Random(profile.seed + 2)
+    files = ["README.md", "LICENSE", ".github/workflows/ci.yml", "package.json"]
+    for index in range(profile.repo_tree_artifacts):
+        kind = index % 5
+        if kind == 0:
+            base = f"skills/{rng.choice(_TOPICS)}/skill-{index:05d}"
+            files += [f"{base}/SKILL.md", f"{base}/README.md", f"{base}/scripts/run.py"]
+        elif kind == 1:
+            files.append(f"commands/{rng.choice(_TOPICS)}/cmd-{index:05d}.md")
+        elif kind == 2:
+            files.append(f"agents/agent-{index:05d}.md")
+        elif kind == 3:
+            base = f"plugins/plugin-{index // 50:03d}/skills/skill-{index:05d}"
+            files += [f"{base}/SKILL.md", f"{base}/reference.md"]
+        else:
+            base = f"src/{rng.choice(_TOPICS)}/module_{index:05d}"
+            files += [f"{base}/__init__.py", f"{base}/core.py", f"docs/{index:05d}.md"]
+    return files
+
+
+# =============================================================================
+# Cache database
+# =============================================================================
+
+
+def seed_cache_database(
+    db_path: Path,
+    profile: ScaleProfile,
+    skills: Dict[str, dict],
+    project_paths: Dict[str, Path],
+    deployed: Dict[str, List[str]],
+    collection_path: Path,
+) -> tuple[List[str], Dict[str, List[str]]]:
+    """Create the cache schema at ``db_path`` and bulk-insert the dataset.
+
+    Args:
+        db_path: Database file to create
+        profile: Dataset size
+        skills: Result of :func:`generate_collection`
+        project_paths: Project paths by id
+        deployed: Deployed skill names by project id
+        collection_path: Collection root, used as the source of collection
+            artifacts
+
+    Returns:
+        Tuple of (collection artifact uuids, deployed artifact uuids by
+        project id)
+    """
+    rng = random.Random(profile.seed + 3)
+    now = datetime.utcnow()
+    repo = TagRepository(db_path=db_path)
+    session = repo._get_session()
+    try:
+        session.execute(
+            insert(models.Project),
+            [
+                dict(
+                    id=COLLECTION_PROJECT_ID,
+                    name="Collection",
+                    path=str(collection_path),
+                    status="active",
+                    last_fetched=now,
+                )
+            ]
+            + [
+                dict(
+                    id=project_id,
+                    name=path.name,
+                    path=str(path),
+                    status="active",
+                    last_fetched=now,
+                )
+                for project_id, path in project_paths.items()
+            ],
+        )
+
+        artifacts = []
+        metadata = []
+        collection_uuids: List[str] = []
+        for name, info in skills.items():
+            artifact_uuid = uuid.uuid4().hex
+            collection_uuids.append(artifact_uuid)
+            artifacts.append(
+                dict(
+                    id=f"skill:{name}",
+                    uuid=artifact_uuid,
+                    project_id=COLLECTION_PROJECT_ID,
+                    name=name,
+                    type="skill",
+                    source=str(collection_path / "skills" / name),
+                    deployed_version="1.0.0",
+                    description=info["description"],
+                )
+            )
+            metadata.append(
+                dict(
+                    artifact_id=f"skill:{name}",
+                    description=info["description"],
+                    tags=",".join(info["tags"]),
+                    metadata_json=json.dumps({"title": name.replace("-", " ").title()}),
+                )
+            )
+
+        project_uuids: Dict[str, List[str]] = {}
+        for project_id, names in deployed.items():
+            project_uuids[project_id] = []
+            for name in names:
+                artifact_uuid = uuid.uuid4().hex
+                project_uuids[project_id].append(artifact_uuid)
+                artifacts.append(
+                    dict(
+                        id=f"skill:{name}@{project_id}",
+                        uuid=artifact_uuid,
+                        project_id=project_id,
+                        name=name,
+                        type="skill",
+                        deployed_version="1.0.0",
+                    )
+                )
+        session.execute(insert(models.Artifact), artifacts)
+        session.execute(insert(models.ArtifactMetadata), metadata)
+
+        session.execute(
+            insert(models.Tag),
+            [
+                dict(id=f"tag-{i:03d}", name=f"tag-{i:03d}", slug=f"tag-{i:03d}")
+                for i in range(profile.tags)
+            ],
+        )
+        session.execute(
+            insert(models.ArtifactTag),
+            [
+                dict(artifact_uuid=artifact_uuid, tag_id=f"tag-{i % profile.tags:03d}")
+                for i, artifact_uuid in enumerate(collection_uuids)
+            ],
+        )
+
+        collection_rows = [dict(id=COLLECTION_NAME, name=COLLECTION_NAME)]
+        collection_rows += [
+            dict(id=f"col-{i:03d}", name=f"collection-{i:03d}")
+            for i in range(max(1, profile.projects // 10))
+        ]
+        session.execute(insert(models.Collection), collection_rows)
+        session.execute(
+            insert(models.CollectionArtifact),
+            [
+                dict(
+                    collection_id=collection_rows[i % len(collection_rows)]["id"],
+                    artifact_uuid=artifact_uuid,
+                    description=skills[name]["description"],
+                    tags_json=json.dumps(skills[name]["tags"]),
+                    artifact_content_hash=f"{rng.getrandbits(256):064x}",
+                    artifact_structure_hash=f"{rng.getrandbits(64):016x}",
+                    artifact_file_count=rng.randint(1, 4),
+                    artifact_total_size=rng.randint(500, 20_000),
+                )
+                for i, (name, artifact_uuid) in enumerate(zip(skills, collection_uuids))
+            ],
+        )
+
+        session.execute(
+            insert(models.MarketplaceSource),
+            [
+                dict(
+                    id=f"src-{i:04d}",
+                    repo_url=f"https://github.com/bench/repo-{i:04d}",
+                    owner="bench",
+                    repo_name=f"repo-{i:04d}",
+                    ref="main",
+                    scan_status="success",
+                    last_sync_at=now,
+                )
+                for i in range(profile.marketplace_sources)
+            ],
+        )
+        for start in range(0, profile.catalog_entries, 10_000):
+            stop = min(start + 10_000, profile.catalog_entries)
+            session.execute(
+                insert(models.MarketplaceCatalogEntry),
+                [catalog_entry_row(i, profile, rng, now) for i in range(start, stop)],
+            )
+        session.commit()
+    finally:
+        session.close()
+    return collection_uuids, project_uuids
+
+
+def catalog_entry_row(
+    index: int, profile: ScaleProfile, rng: random.Random, now: datetime
+) -> dict:
+    """Column values for the catalog entry at ``index``."""
+    source = index % profile.marketplace_sources
+    topic = rng.choice(_TOPICS)
+    description = f"{rng.choice(_VERBS).title()} {topic} {rng.choice(_NOUNS)}"
+    return dict(
+        id=f"entry-{index:06d}",
+        source_id=f"src-{source:04d}",
+        artifact_type=("skill", "command", "agent")[index % 3],
+        name=f"{topic}-{index:06d}",
+        path=f"skills/{topic}/{topic}-{index:06d}",
+        upstream_url=f"https://github.com/bench/repo-{source:04d}/tree/main/{index}",
+        detected_sha=f"{index:040x}",
+        detected_at=now,
+        confidence_score=rng.randint(40, 99),
+        status="new",
+        title=f"{topic.title()} helper {index}",
+        description=description,
+        search_tags=json.dumps([topic]),
+        search_text=f"{topic} {description}".lower(),
+    )
+
+
+# =============================================================================
+# Entry point
+# =============================================================================
+
+
+def generate_dataset(base: Path, profile: ScaleProfile) -> ScaleDataset:
+    """Generate the complete dataset for ``profile`` under ``base``.
+
+    Args:
+        base: Empty directory to generate into
+        profile: Dataset size
+
+    Returns:
+        Locations and identifiers of the generated data
+    """
+    home = base / "home"
+    collection_path = home / ".skillmeat" / "collections" / COLLECTION_NAME
+    db_path = home / ".skillmeat" / "cache" / "cache.db"
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    skills = generate_collection(collection_path, profile)
+    project_paths, deployed, drift = generate_projects(
+        base / "projects", collection_path, skills, profile
+    )
+    collection_uuids, project_uuids = seed_cache_database(
+        db_path, profile, skills, project_paths, deployed, collection_path
+    )
+    return ScaleDataset(
+        profile=profile,
+        home=home,
+        collection_path=collection_path,
+        project_paths=project_paths,
+        repo_tree=generate_repo_tree(profile),
+        db_path=db_path,
+        collection_uuids=collection_uuids,
+        project_artifact_uuids=project_uuids,
+        expected_drift=drift,
+    )
+
+
+def describe(profile: ScaleProfile) -> dict:
+    """Profile fields as a JSON-serialisable dict."""
+    return asdict(profile)
@@ -0,0 +1,81 @@
+"""Tests for the scale benchmark baseline tool and data generator."""
+
+import json
+
+import pytest
+
+from tests.performance.scale.baseline import compare, main, summarize
+from tests.performance.scale.datagen import PROFILES, generate_repo_tree, get_profile
+
+
+def _report(medians, profile="small"):
+    return {
+        "scale_profile": {"name": profile},
+        "machine_info": {"node": "ci", "python_version": "3.11.7", "cpu": {}},
+        "commit_info": {"id": "abc123"},
+        "datetime": "2026-01-01T00:00:00",
+        "benchmarks": [
+            {
+                "fullname": name,
+                "stats": {"median": m, "mean": m, "min": m, "rounds": 3, "max": m},
+            }
+            for name, m in medians.items()
+        ],
+    }
+
+
+class TestBaseline:
+    def test_summarize_keeps_medians_and_profile(self):
+        summary = summarize(_report({"b": 0.2, "a": 0.1}))
+
+        assert summary["profile"] == {"name": "small"}
+        assert summary["commit"] == "abc123"
+        assert list(summary["benchmarks"]) == ["a", "b"]
+        assert summary["benchmarks"]["a"] == {
+            "median": 0.1,
+            "mean": 0.1,
+            "min": 0.1,
+            "rounds": 3,
+        }
+
+    def test_compare_flags_slowdowns_beyond_tolerance(self):
+        baseline = summarize(_report({"fast": 1.0, "slow": 1.0, "gone": 1.0}))
+        current = summarize(_report({"fast": 1.2, "slow": 1.3, "new": 1.0}))
+
+        results = {r.name: r for r in compare(current, baseline, tolerance=0.25)}
+
+        assert not results["fast"].regressed
+        assert results["slow"].regressed
+        assert results["slow"].ratio == pytest.approx(1.3)
+        assert results["gone"].current is None and not results["gone"].regressed
+        assert results["new"].baseline is None and not results["new"].regressed
+
+    def test_cli_round_trip(self, tmp_path, capsys):
+        report = tmp_path / "report.json"
+        baseline = tmp_path / "baseline.json"
+        report.write_text(json.dumps(_report({"a": 1.0})))
+
+        assert main(["save", str(report), "--baseline", str(baseline)]) == 0
+        assert main(["compare", str(report), "--baseline", str(baseline)]) == 0
+
+        report.write_text(json.dumps(_report({"a": 2.0})))
+        assert main(["compare", str(report), "--baseline", str(baseline)]) == 1
+        assert "REGRESSION" in capsys.readouterr().out
+
+
+class TestProfiles:
+    def test_large_profile_matches_production_scale(self):
+        large = PROFILES["large"]
+
+        assert large.collection_artifacts + large.deployed_artifacts >= 10_000
+        assert large.projects >= 100
+        assert large.catalog_entries >= 100_000
+
+    def test_unknown_profile(self):
+        with pytest.raises(KeyError):
+            get_profile("huge")
+
+    def test_repo_tree_is_reproducible(self):
+        profile = PROFILES["small"]
+
+        assert generate_repo_tree(profile) == generate_repo_tree(profile)
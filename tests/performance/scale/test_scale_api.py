@@ -0,0 +1,73 @@
+"""Scale benchmarks for the API list endpoints.
+
+Serves the generated cache database through the FastAPI app and times one
+request per round.  The statement count from ``X-DB-Query-Count`` is stored
+in each benchmark's ``extra_info`` so reports show whether a slowdown came
+from extra queries or slower ones.
+
+Run:
+    SKILLMEAT_BENCH_SCALE=small pytest tests/performance/scale/test_scale_api.py \\
+        --benchmark-only -n 0
+"""
+
+from typing import Generator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from skillmeat.api.config import APISettings, Environment, get_settings
+from skillmeat.api.server import create_app
+from skillmeat.config import ConfigManager
+from skillmeat.observability.query_stats import QUERY_COUNT_HEADER
+from tests.conftest import reset_cache_engine
+
+pytestmark = [pytest.mark.performance, pytest.mark.usefixtures("scale_home")]
+
+LIST_ENDPOINTS = {
+    "artifacts": "/api/v1/artifacts?limit=100",
+    "tags": "/api/v1/tags",
+    "user_collections": "/api/v1/user-collections?limit=100",
+    "collection_artifacts": "/api/v1/user-collections/default/artifacts?limit=100",
+    "projects": "/api/v1/projects",
+    "marketplace_sources": "/api/v1/marketplace/sources?limit=100",
+    "source_catalog": "/api/v1/marketplace/sources/src-0001/artifacts?limit=100",
+    "catalog_search": "/api/v1/marketplace/catalog/search?q=kubernetes&limit=50",
+}
+
+
+@pytest.fixture(scope="module")
+def client(scale_dataset) -> Generator[TestClient, None, None]:
+    """App client reading the generated cache database."""
+    with pytest.MonkeyPatch.context() as mp, reset_cache_engine():
+        mp.setenv("HOME", str(scale_dataset.home))
+        mp.setattr(
+            ConfigManager, "DEFAULT_CONFIG_DIR", scale_dataset.home / ".skillmeat"
+        )
+
+        settings = APISettings(
+            env=Environment.TESTING,
+            host="127.0.0.1",
+            port=8000,
+            log_level="WARNING",
+            api_key_enabled=False,
+            auth_enabled=False,
+            cors_enabled=False,
+            db_query_headers=True,
+        )
+        app = create_app(settings)
+        app.dependency_overrides[get_settings] = lambda: settings
+        with TestClient(app) as test_client:
+            yield test_client
+
+
+@pytest.mark.benchmark(group="list_endpoints")
+@pytest.mark.parametrize("name", sorted(LIST_ENDPOINTS))
+def test_list_endpoint(benchmark, measure, client, name):
+    path = LIST_ENDPOINTS[name]
+    # The first request may create default rows; time the steady state.
+    client.get(path)
+
+    response = measure(client.get, path)
+
+    assert response.status_code == 200, response.text
+    benchmark.extra_info["db_queries"] = int(response.headers[QUERY_COUNT_HEADER])
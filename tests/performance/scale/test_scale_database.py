@@ -0,0 +1,165 @@
+"""Scale benchmarks for cache-database hot paths.
+
+Covers similarity scoring, BOM generation, marketplace catalog search and the
+offline half of a marketplace scan (heuristic detection over a repository
+tree, then merging the detected entries into a source's catalog).
+
+Run:
+    SKILLMEAT_BENCH_SCALE=small pytest tests/performance/scale/test_scale_database.py \\
+        --benchmark-only -n 0
+"""
+
+import uuid
+from datetime import datetime
+
+import pytest
+
+from skillmeat.cache.models import MarketplaceCatalogEntry, get_session
+from skillmeat.cache.repositories import (
+    MarketplaceCatalogRepository,
+    MarketplaceTransactionHandler,
+)
+from skillmeat.core.bom.generator import BomGenerator
+from skillmeat.core.marketplace.heuristic_detector import detect_artifacts_in_tree
+from skillmeat.core.marketplace.minhash import (
+    LSHIndex,
+    MinHasher,
+    catalog_signature_text,
+)
+from skillmeat.core.similarity import SimilarityService
+
+pytestmark = [pytest.mark.performance, pytest.mark.usefixtures("scale_home")]
+
+REPO_URL = "https://github.com/bench/monorepo"
+
+
+@pytest.fixture
+def session(scale_dataset):
+    session = get_session(scale_dataset.db_path)
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+class TestSimilarityAtScale:
+    @pytest.mark.benchmark(group="similarity")
+    def test_find_similar_in_collection(self, measure, scale_dataset, session):
+        service = SimilarityService(session=session)
+        target = scale_dataset.collection_uuids[0]
+
+        results = measure(service.find_similar, target, limit=20, min_score=0.0)
+
+        assert 0 < len(results) <= 20
+
+    @pytest.mark.benchmark(group="similarity")
+    def test_catalog_near_duplicate_clusters(self, measure, scale_dataset, session):
+        rows = (
+            session.query(MarketplaceCatalogEntry)
+            .order_by(MarketplaceCatalogEntry.id)
+            .limit(scale_dataset.profile.similarity_corpus)
+            .all()
+        )
+        hasher = MinHasher()
+        signatures = {}
+        for row in rows:
+            signature = hasher.signature(
+                catalog_signature_text(
+                    {"title": row.title, "description": row.description}
+                )
+            )
+            if signature is not None:
+                signatures[row.id] = signature
+
+        def cluster():
+            index = LSHIndex()
+            for key, signature in signatures.items():
+                index.add(key, signature)
+            return index, index.clusters()
+
+        index, clusters = measure(cluster)
+
+        assert len(index) == len(signatures) > 0
+        assert all(len(members) >= 2 for members in clusters)
+
+
+class TestBomAtScale:
+    @pytest.mark.benchmark(group="bom")
+    def test_generate_bom_for_whole_cache(self, measure, scale_dataset, session):
+        generator = BomGenerator(session=session)
+
+        bom = measure(generator.generate)
+
+        profile = scale_dataset.profile
+        assert bom["artifact_count"] == (
+            profile.collection_artifacts + profile.deployed_artifacts
+        )
+
+    @pytest.mark.benchmark(group="bom")
+    def test_generate_bom_for_one_project(self, measure, scale_dataset, session):
+        project_id, project_path = next(iter(scale_dataset.project_paths.items()))
+        generator = BomGenerator(session=session, project_path=project_path)
+
+        bom = measure(generator.generate, project_id=project_id)
+
+        assert bom["artifact_count"] == scale_dataset.profile.deployments_per_project
+
+
+class TestCatalogSearchAtScale:
+    @pytest.mark.benchmark(group="search")
+    @pytest.mark.parametrize("query", ["kubernetes", "audit security schemas"])
+    def test_search_catalog(self, measure, scale_dataset, query):
+        repo = MarketplaceCatalogRepository(db_path=scale_dataset.db_path)
+
+        page = measure(repo.search, query=query, limit=50)
+
+        assert page.items
+
+
+class TestMarketplaceScanAtScale:
+    @pytest.mark.benchmark(group="marketplace_scan")
+    def test_detect_artifacts_in_repo_tree(self, measure, scale_dataset):
+        detected = measure(
+            detect_artifacts_in_tree,
+            scale_dataset.repo_tree,
+            REPO_URL,
+            detected_sha="0" * 40,
+        )
+
+        assert len(detected) >= scale_dataset.profile.repo_tree_artifacts // 2
+
+    @pytest.mark.benchmark(group="marketplace_scan")
+    def test_merge_rescan_into_catalog(self, measure, scale_dataset):
+        detected = detect_artifacts_in_tree(
+            scale_dataset.repo_tree, REPO_URL, detected_sha="0" * 40
+        )
+        handler = MarketplaceTransactionHandler(db_path=scale_dataset.db_path)
+
+        def rescan():
+            entries = [
+                MarketplaceCatalogEntry(
+                    id=str(uuid.uuid4()),
+                    source_id="src-0000",
+                    artifact_type=artifact.artifact_type,
+                    name=artifact.name,
+                    path=artifact.path,
+                    upstream_url=artifact.upstream_url,
+                    confidence_score=artifact.confidence_score,
+                    raw_score=artifact.raw_score,
+                    detected_sha=artifact.detected_sha,
+                    detected_at=datetime.utcnow(),
+                    status="new",
+                )
+                for artifact in detected
+            ]
+            with handler.scan_update_transaction("src-0000") as ctx:
+                ctx.update_source_status("success", artifact_count=len(entries))
+                return ctx.merge_catalog_entries(entries)
+
+        result = measure(rescan)
+
+        # Later rounds match the entries the first round inserted
+        assert result.inserted_count + result.updated_count == len(detected)
+        repo = MarketplaceCatalogRepository(db_path=scale_dataset.db_path)
+        live = [e for e in repo.list_by_source("src-0000") if e.status != "removed"]
+        assert len(live) == len(detected)
@@ -0,0 +1,127 @@
+"""Scale benchmarks for filesystem hot paths: discovery, hashing, search, drift.
+
+Each benchmark covers the whole generated fleet (every project, or every
+collection skill), so its time grows with the profile.
+
+Run:
+    SKILLMEAT_BENCH_SCALE=small pytest tests/performance/scale/test_scale_filesystem.py \\
+        --benchmark-only -n 0
+"""
+
+from pathlib import Path
+
+import pytest
+
+from skillmeat.cache.repository import CacheRepository
+from skillmeat.core.deployment import DeploymentManager
+from skillmeat.core.discovery import ArtifactDiscoveryService
+from skillmeat.core.discovery_cache import DiscoveryCache
+from skillmeat.core.fleet_drift import FleetDriftScanner
+from skillmeat.core.hashing import compute_artifact_hash
+from skillmeat.core.search import SearchManager
+from skillmeat.core.sync import SyncManager
+
+from tests.performance.scale.datagen import StaticCollectionManager
+
+pytestmark = [pytest.mark.performance, pytest.mark.usefixtures("scale_home")]
+
+
+def _discover_fleet(project_paths, cache=None) -> int:
+    found = 0
+    for path in project_paths:
+        service = ArtifactDiscoveryService(path, scan_mode="project", cache=cache)
+        found += service.discover_artifacts(
+            include_collection_status=False
+        ).discovered_count
+    return found
+
+
+class TestDiscoveryAtScale:
+    @pytest.mark.benchmark(group="discovery")
+    def test_discover_every_project_cold(self, measure, scale_dataset):
+        projects = list(scale_dataset.project_paths.values())
+
+        found = measure(_discover_fleet, projects)
+
+        assert found == scale_dataset.profile.deployed_artifacts
+
+    @pytest.mark.benchmark(group="discovery")
+    def test_discover_every_project_warm_cache(self, measure, scale_dataset, tmp_path):
+        projects = list(scale_dataset.project_paths.values())
+        cache = DiscoveryCache(tmp_path / "discovery.json")
+        _discover_fleet(projects, cache)
+
+        found = measure(_discover_fleet, projects, cache)
+
+        assert found == scale_dataset.profile.deployed_artifacts
+
+
+class TestHashingAtScale:
+    @pytest.mark.benchmark(group="hashing")
+    def test_hash_every_collection_skill(self, measure, scale_dataset):
+        skills = sorted((scale_dataset.collection_path / "skills").iterdir())
+
+        hashes = measure(lambda: {compute_artifact_hash(str(p)) for p in skills})
+
+        assert len(hashes) == len(skills)
+
+
+class TestSearchAtScale:
+    @pytest.mark.benchmark(group="search")
+    @pytest.mark.parametrize("search_type", ["metadata", "content"])
+    def test_search_every_project(self, measure, scale_dataset, search_type):
+        manager = SearchManager(
+            collection_mgr=StaticCollectionManager(scale_dataset.collection_path)
+        )
+        # search_projects takes the profile directories, not project roots
+        claude_dirs = [p / ".claude" for p in scale_dataset.project_paths.values()]
+
+        result = measure(
+            manager.search_projects,
+            "kubernetes",
+            project_paths=claude_dirs,
+            search_type=search_type,
+            limit=100,
+            use_cache=False,
+        )
+
+        assert result.total_count > 0
+
+
+class TestDriftAtScale:
+    @pytest.fixture
+    def sync_manager(self, scale_dataset) -> SyncManager:
+        return SyncManager(
+            collection_manager=StaticCollectionManager(scale_dataset.collection_path)
+        )
+
+    @pytest.mark.benchmark(group="drift")
+    def test_check_drift_every_project(self, measure, scale_dataset, sync_manager):
+        projects = list(scale_dataset.project_paths.values())
+
+        results = measure(
+            lambda: [r for p in projects for r in sync_manager.check_drift(Path(p))]
+        )
+
+        counts = {}
+        for result in results:
+            counts[result.drift_type] = counts.get(result.drift_type, 0) + 1
+        assert counts.get("modified", 0) == scale_dataset.expected_drift["modified"]
+        assert counts.get("outdated", 0) == scale_dataset.expected_drift["outdated"]
+
+    @pytest.mark.benchmark(group="drift")
+    def test_fleet_drift_scan(self, measure, scale_dataset, sync_manager):
+        scanner = FleetDriftScanner(
+            sync_manager,
+            CacheRepository(db_path=str(scale_dataset.db_path)),
+            deployment_manager=DeploymentManager(
+                collection_mgr=sync_manager.collection_mgr
+            ),
+        )
+
+        summary = measure(scanner.scan, "default")
+
+        assert summary.status == "completed"
+        assert summary.failed_projects == 0
+        # The collection's own project row has no deployments to scan
+        assert summary.scanned_projects == scale_dataset.profile.projects + 1
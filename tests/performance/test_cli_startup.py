@@ -0,0 +1,85 @@
+"""CLI startup import checks.
+
+Only the command groups that live in their own modules are registered
+lazily (see ``skillmeat.cli.LAZY_SUBCOMMANDS``), and ``import skillmeat.cli``
+must not import any of them.  The ~150 commands defined in
+``skillmeat/cli/__init__.py`` and their top-level imports (the core managers,
+``sources.github``, ``requests``) still load at startup and make up most of
+the remaining import time.
+
+The lazy-import check always runs.  The wall-clock budget times the whole
+``import skillmeat.cli`` with ``python -X importtime`` in a fresh interpreter
+and guards that eager layout against regressions.  Timings depend on the
+host and on concurrent load, so it only runs when a budget is given::
+
+    SKILLMEAT_CLI_IMPORT_BUDGET_MS=1000 pytest -m performance -n 0 \\
+        tests/performance/test_cli_startup.py
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+BUDGET_ENV = "SKILLMEAT_CLI_IMPORT_BUDGET_MS"
+RUNS = 3
+
+_IMPORTTIME_RE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+# Runs in a fresh interpreter so the test process's imports don't count.
+_LAZY_STATE_SCRIPT = """
+import json, sys
+import skillmeat.cli as cli
+modules = [c.import_path.partition(":")[0] for c in cli.LAZY_SUBCOMMANDS.values()]
+json.dump({m: m in sys.modules for m in modules}, sys.stdout)
+"""
+
+
+def _importtime(module: str) -> dict:
+    """Return ``{module: cumulative_us}`` for a fresh import of *module*."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if match:
+            timings[match.group(4)] = int(match.group(2))
+    return timings
+
+
+def test_cli_import_skips_lazy_subcommands():
+    result = subprocess.run(
+        [sys.executable, "-c", _LAZY_STATE_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    loaded = json.loads(result.stdout)
+
+    assert loaded, "LAZY_SUBCOMMANDS is empty"
+    assert [module for module, imported in loaded.items() if imported] == []
+
+
+@pytest.mark.performance
+@pytest.mark.skipif(
+    BUDGET_ENV not in os.environ,
+    reason=f"set {BUDGET_ENV} to enforce the CLI import-time budget",
+)
+def test_cli_import_within_budget():
+    budget_ms = int(os.environ[BUDGET_ENV])
+    runs = [_importtime("skillmeat.cli") for _ in range(RUNS)]
+
+    elapsed_ms = sorted(t["skillmeat.cli"] for t in runs)[RUNS // 2] / 1000
+    print(f"\nimport skillmeat.cli: {elapsed_ms:.0f}ms (budget {budget_ms}ms)")
+    assert elapsed_ms <= budget_ms, (
+        f"CLI import took {elapsed_ms:.0f}ms, over the {budget_ms}ms budget; "
+        "check `python -X importtime -c 'import skillmeat.cli'` for new "
+        "top-level imports"
+    )
@@ -0,0 +1,263 @@
+"""Tests for relationship-loading profiles in cache repositories.
+
+Each list and lookup method applies a named profile from
+``skillmeat.cache.loading``; these tests pin the number of SQL statements
+the top list queries issue against a populated database and check that
+relationships outside a profile raise under strict loading.
+"""
+
+from __future__ import annotations
+
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+
+from skillmeat.cache.loading import (
+    TAG_SUMMARY,
+    enable_strict_loading,
+    load_profile,
+    strict_loading_enabled,
+)
+from skillmeat.cache.models import (
+    Artifact,
+    ArtifactMetadata,
+    ArtifactTag,
+    Collection,
+    CollectionArtifact,
+    MarketplaceCatalogEntry,
+    MarketplaceSource,
+    Project,
+    Tag,
+)
+from skillmeat.cache.repositories import (
+    DbArtifactHistoryRepository,
+    DbUserCollectionRepository,
+    MarketplaceSourceRepository,
+    TagRepository,
+)
+
+ARTIFACTS = 40
+TAGS = 5
+COLLECTIONS = 6
+SOURCES = 4
+ENTRIES_PER_SOURCE = 15
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@contextmanager
+def count_queries(engine):
+    """Collect the SQL statements executed on ``engine`` inside the block."""
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "cache.db")
+
+
+@pytest.fixture
+def seeded(db_path):
+    """Database where every tag is on every artifact and every collection
+    holds every artifact, so eager relationship loading is expensive."""
+    repo = TagRepository(db_path=db_path)
+    session = repo._get_session()
+    try:
+        session.add(
+            Project(id="proj-1", name="Project", path="/tmp/proj-1", status="active")
+        )
+        artifacts = []
+        for i in range(ARTIFACTS):
+            artifact = Artifact(
+                id=f"skill:skill-{i}",
+                project_id="proj-1",
+                name=f"skill-{i}",
+                type="skill",
+            )
+            artifact.artifact_metadata = ArtifactMetadata(description=f"Skill {i}")
+            artifacts.append(artifact)
+        session.add_all(artifacts)
+        tags = [
+            Tag(id=f"tag-{i}", name=f"Tag {i}", slug=f"tag-{i}") for i in range(TAGS)
+        ]
+        session.add_all(tags)
+        session.flush()
+
+        session.add_all(
+            ArtifactTag(artifact_uuid=artifact.uuid, tag_id=tag.id)
+            for artifact in artifacts
+            for tag in tags
+        )
+        for i in range(COLLECTIONS):
+            session.add(Collection(id=f"col-{i}", name=f"Collection {i}"))
+            session.add_all(
+                CollectionArtifact(collection_id=f"col-{i}", artifact_uuid=a.uuid)
+                for a in artifacts
+            )
+        for i in range(SOURCES):
+            source_id = f"src-{i}"
+            session.add(
+                MarketplaceSource(
+                    id=source_id,
+                    repo_url=f"https://github.com/test/{source_id}",
+                    owner="test",
+                    repo_name=source_id,
+                    ref="main",
+                    scan_status="success",
+                )
+            )
+            session.add_all(
+                MarketplaceCatalogEntry(
+                    id=f"entry_{uuid.uuid4().hex[:8]}",
+                    source_id=source_id,
+                    artifact_type="skill",
+                    name=f"entry-{j}",
+                    path=f"artifacts/entry-{j}",
+                    upstream_url=f"https://github.com/test/entry-{j}",
+                    detected_sha="abc123",
+                    detected_at=datetime.utcnow(),
+                    confidence_score=80,
+                    status="new",
+                )
+                for j in range(ENTRIES_PER_SOURCE)
+            )
+        session.commit()
+    finally:
+        session.close()
+    return db_path
+
+
+# =============================================================================
+# Query counts for list endpoints
+# =============================================================================
+
+
+class TestListQueryCounts:
+    def test_tag_list_is_one_query(self, seeded):
+        repo = TagRepository(db_path=seeded)
+
+        with count_queries(repo.engine) as statements:
+            tags, _, _ = repo.list_all(limit=100)
+            payload = [tag.to_dict() for tag in tags]
+
+        assert len(payload) == TAGS
+        assert len(statements) == 1
+
+    def test_tag_counts_do_not_load_artifacts(self, seeded):
+        repo = TagRepository(db_path=seeded)
+
+        with count_queries(repo.engine) as statements:
+            counts = repo.get_all_tag_counts()
+
+        assert {count for _, count in counts} == {ARTIFACTS}
+        assert len(statements) == 1
+
+    def test_collection_lists_are_one_query(self, seeded):
+        repo = DbUserCollectionRepository(db_path=seeded)
+
+        with count_queries(repo.engine) as statements:
+            plain = repo.list(limit=100)
+        assert len(plain) == COLLECTIONS
+        assert len(statements) == 1
+
+        with count_queries(repo.engine) as statements:
+            with_stats = repo.list_with_artifact_stats(limit=100)
+        assert {c.artifact_count for c in with_stats} == {ARTIFACTS}
+        assert len(statements) == 1
+
+    def test_marketplace_source_list_skips_entries(self, seeded):
+        repo = MarketplaceSourceRepository(db_path=seeded)
+
+        with count_queries(repo.engine) as statements:
+            page = repo.list_paginated(limit=50)
+            sources = repo.list_all()
+
+        assert len(page.items) == len(sources) == SOURCES
+        assert len(statements) == 2
+        assert not any("marketplace_catalog_entries" in s for s in statements)
+
+    def test_marketplace_source_detail_keeps_entries(self, seeded):
+        repo = MarketplaceSourceRepository(db_path=seeded)
+
+        with count_queries(repo.engine) as statements:
+            source = repo.get_by_id("src-0")
+
+        assert len(source.entries) == ENTRIES_PER_SOURCE
+        assert len(statements) == 2
+
+    def test_artifacts_by_tag_query_count_is_constant(self, seeded):
+        repo = TagRepository(db_path=seeded)
+
+        with count_queries(repo.engine) as statements:
+            artifacts, _, _ = repo.get_artifacts_by_tag("tag-0", limit=100)
+            payload = [artifact.to_dict() for artifact in artifacts]
+
+        assert len(payload) == ARTIFACTS
+        assert payload[0]["metadata"]["description"].startswith("Skill")
+        # Artifacts, then one batch each for metadata and categories.
+        assert len(statements) == 3
+
+    def test_artifact_history_lookup_joins_project(self, seeded):
+        tags = TagRepository(db_path=seeded)
+        repo = DbArtifactHistoryRepository(get_session=tags._get_session)
+
+        with count_queries(tags.engine) as statements:
+            summaries = repo.list_cache_artifacts_by_name_type("skill-1", "skill")
+
+        assert [s.project_path for s in summaries] == ["/tmp/proj-1"]
+        assert len(statements) == 1
+
+
+# =============================================================================
+# Strict loading
+# =============================================================================
+
+
+class TestStrictLoading:
+    @pytest.fixture(autouse=True)
+    def _restore(self):
+        yield
+        enable_strict_loading(None)
+
+    def test_test_suite_runs_strict(self):
+        assert strict_loading_enabled()
+
+    def test_unprofiled_relationship_raises(self, seeded):
+        repo = TagRepository(db_path=seeded)
+        session = repo._get_session()
+        try:
+            tag = session.query(Tag).options(*load_profile(TAG_SUMMARY)).first()
+            with pytest.raises(InvalidRequestError):
+                tag.artifacts
+        finally:
+            session.close()
+
+    def test_relaxed_mode_lazy_loads(self, seeded):
+        enable_strict_loading(False)
+        repo = TagRepository(db_path=seeded)
+        session = repo._get_session()
+        try:
+            tag = session.query(Tag).options(*load_profile(TAG_SUMMARY)).first()
+            assert len(tag.artifacts) == ARTIFACTS
+        finally:
+            session.close()
+
+    def test_unknown_profile(self):
+        with pytest.raises(KeyError):
+            load_profile("everything")
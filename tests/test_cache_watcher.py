@@ -628,3 +628,259 @@ def test_integration_multiple_rapid_changes_debounced(
 
     finally:
         watcher.stop()
+
+
+# =============================================================================
+# Coalescing and Targeted Update Tests
+# =============================================================================
+
+
+def _deploy_skill(project_path: Path, name: str = "my-skill") -> Path:
+    """Create a deployed skill and its deployment record; return SKILL.md."""
+    from datetime import datetime
+
+    from skillmeat.core.deployment import Deployment
+    from skillmeat.storage.deployment import DeploymentTracker
+    from skillmeat.utils.filesystem import compute_content_hash
+
+    skill_dir = project_path / ".claude" / "skills" / name
+    skill_dir.mkdir(parents=True)
+    skill_file = skill_dir / "SKILL.md"
+    skill_file.write_text("# My Skill\n")
+
+    deployment = Deployment(
+        artifact_name=name,
+        artifact_type="skill",
+        from_collection="default",
+        deployed_at=datetime(2025, 1, 1),
+        artifact_path=Path("skills") / name,
+        content_hash=compute_content_hash(skill_dir),
+    )
+    DeploymentTracker.write_deployments(
+        project_path, [deployment], profile_root_dir=".claude"
+    )
+    return skill_file
+
+
+@pytest.fixture
+def deployed_project(cache_repo: CacheRepository, temp_dir: Path) -> Path:
+    """Cached project with one deployed skill and its artifact row."""
+    from skillmeat.cache.models import Artifact
+    from skillmeat.utils.filesystem import compute_content_hash
+
+    project_path = temp_dir / "project"
+    project_path.mkdir()
+    cache_repo.create_project(
+        Project(id="proj-123", name="Test", path=str(project_path), status="active")
+    )
+    skill_file = _deploy_skill(project_path)
+    cache_repo.create_artifact(
+        Artifact(
+            id="art-1",
+            project_id="proj-123",
+            name="my-skill",
+            type="skill",
+            local_modified=False,
+            content_hash=compute_content_hash(skill_file.parent),
+        )
+    )
+    return project_path
+
+
+def test_queue_invalidation_uses_single_coalescer_thread(
+    mock_repo: MagicMock, temp_dir: Path
+):
+    """Rapid requests reuse one coalescer thread and flush once per key."""
+    watcher = FileWatcher(
+        cache_repository=mock_repo, watch_paths=[str(temp_dir)], debounce_ms=50
+    )
+    mock_repo.get_project.return_value = Project(
+        id="proj-1", name="Test", path=str(temp_dir), status="active"
+    )
+
+    watcher._queue_invalidation("proj-1")
+    thread = watcher._coalescer_thread
+    for _ in range(20):
+        watcher._queue_invalidation("proj-1")
+
+    assert watcher._coalescer_thread is thread
+    time.sleep(0.2)
+
+    mock_repo.update_project.assert_called_once_with(
+        "proj-1", status="stale", error_message=None
+    )
+    assert thread.is_alive()
+
+
+def test_artifact_change_updates_row_in_place(
+    cache_repo: CacheRepository, deployed_project: Path, temp_dir: Path
+):
+    """Editing a deployed artifact flags only its row, project stays active."""
+    watcher = FileWatcher(
+        cache_repository=cache_repo, watch_paths=[str(temp_dir)], debounce_ms=50
+    )
+    skill_file = deployed_project / ".claude" / "skills" / "my-skill" / "SKILL.md"
+    skill_file.write_text("# My Skill\nlocal edit\n")
+
+    watcher.on_deployment_modified(str(skill_file), profile_root=".claude")
+    watcher._process_invalidation_queue()
+
+    assert cache_repo.get_artifact("art-1").local_modified is True
+    assert cache_repo.get_project("proj-123").status == "active"
+
+
+def test_artifact_change_without_row_falls_back_to_invalidation(
+    cache_repo: CacheRepository, deployed_project: Path, temp_dir: Path
+):
+    """Changes to artifacts with no cached row mark the project stale."""
+    watcher = FileWatcher(
+        cache_repository=cache_repo, watch_paths=[str(temp_dir)], debounce_ms=50
+    )
+    other = deployed_project / ".claude" / "commands" / "untracked.md"
+    other.parent.mkdir(parents=True)
+    other.write_text("# Untracked\n")
+
+    watcher.on_deployment_modified(str(other), profile_root=".claude")
+    watcher._process_invalidation_queue()
+
+    assert cache_repo.get_project("proj-123").status == "stale"
+
+
+def test_deployment_record_change_with_new_artifact_invalidates(
+    cache_repo: CacheRepository, deployed_project: Path, temp_dir: Path
+):
+    """A newly deployed artifact has no row, so the project is refreshed."""
+    from skillmeat.storage.deployment import DeploymentTracker
+
+    watcher = FileWatcher(
+        cache_repository=cache_repo, watch_paths=[str(temp_dir)], debounce_ms=50
+    )
+    record = deployed_project / ".claude" / DeploymentTracker.DEPLOYMENT_FILE
+
+    watcher.on_deployment_record_modified(str(record), profile_root=".claude")
+    watcher._process_invalidation_queue()
+    assert cache_repo.get_project("proj-123").status == "active"
+
+    # Rewrites the record with an artifact that has no cached row
+    _deploy_skill(deployed_project, name="second-skill")
+    watcher.on_deployment_record_modified(str(record), profile_root=".claude")
+    watcher._process_invalidation_queue()
+
+    assert cache_repo.get_project("proj-123").status == "stale"
+
+
+def _rewrite_record(project_path: Path, **changes) -> None:
+    """Rewrite the .claude deployment record with ``changes`` applied."""
+    from dataclasses import replace
+
+    from skillmeat.storage.deployment import DeploymentTracker
+
+    deployments = [
+        replace(dep, **changes)
+        for dep in DeploymentTracker.read_deployments(
+            project_path, profile_root_dir=".claude"
+        )
+    ]
+    DeploymentTracker.write_deployments(
+        project_path, deployments, profile_root_dir=".claude"
+    )
+
+
+def test_deployment_record_local_modification_updates_row_in_place(
+    cache_repo: CacheRepository, deployed_project: Path, temp_dir: Path
+):
+    """A record that only flips local_modifications is applied in place."""
+    from skillmeat.storage.deployment import DeploymentTracker
+
+    watcher = FileWatcher(
+        cache_repository=cache_repo, watch_paths=[str(temp_dir)], debounce_ms=50
+    )
+    _rewrite_record(deployed_project, local_modifications=True)
+    record = deployed_project / ".claude" / DeploymentTracker.DEPLOYMENT_FILE
+
+    watcher.on_deployment_record_modified(str(record), profile_root=".claude")
+    watcher._process_invalidation_queue()
+
+    assert cache_repo.get_artifact("art-1").local_modified is True
+    assert cache_repo.get_project("proj-123").status == "active"
+
+
+def test_deployment_record_first_deploy_invalidates(
+    cache_repo: CacheRepository, temp_dir: Path
+):
+    """The first deployment into a cached project with no rows is refreshed."""
+    from skillmeat.storage.deployment import DeploymentTracker
+
+    project_path = temp_dir / "project"
+    project_path.mkdir()
+    cache_repo.create_project(
+        Project(id="proj-123", name="Test", path=str(project_path), status="active")
+    )
+    watcher = FileWatcher(
+        cache_repository=cache_repo, watch_paths=[str(temp_dir)], debounce_ms=50
+    )
+    _deploy_skill(project_path)
+    record = project_path / ".claude" / DeploymentTracker.DEPLOYMENT_FILE
+
+    watcher.on_deployment_record_modified(str(record), profile_root=".claude")
+    watcher._process_invalidation_queue()
+
+    assert cache_repo.get_project("proj-123").status == "stale"
+
+
+def test_deployment_record_undeploy_invalidates(
+    cache_repo: CacheRepository, deployed_project: Path, temp_dir: Path
+):
+    """Removing a deployment leaves a cached row behind, so refresh."""
+    from skillmeat.storage.deployment import DeploymentTracker
+
+    watcher = FileWatcher(
+        cache_repository=cache_repo, watch_paths=[str(temp_dir)], debounce_ms=50
+    )
+    DeploymentTracker.write_deployments(
+        deployed_project, [], profile_root_dir=".claude"
+    )
+    record = deployed_project / ".claude" / DeploymentTracker.DEPLOYMENT_FILE
+
+    watcher.on_deployment_record_modified(str(record), profile_root=".claude")
+    watcher._process_invalidation_queue()
+
+    assert cache_repo.get_project("proj-123").status == "stale"
+
+
+def test_deployment_record_version_change_invalidates(
+    cache_repo: CacheRepository, deployed_project: Path, temp_dir: Path
+):
+    """A redeploy records the new hash and refreshes the version fields."""
+    from skillmeat.storage.deployment import DeploymentTracker
+
+    watcher = FileWatcher(
+        cache_repository=cache_repo, watch_paths=[str(temp_dir)], debounce_ms=50
+    )
+    _rewrite_record(deployed_project, content_hash="b" * 64)
+    record = deployed_project / ".claude" / DeploymentTracker.DEPLOYMENT_FILE
+
+    watcher.on_deployment_record_modified(str(record), profile_root=".claude")
+    watcher._process_invalidation_queue()
+
+    assert cache_repo.get_artifact("art-1").content_hash == "b" * 64
+    assert cache_repo.get_project("proj-123").status == "stale"
+
+
+def test_full_invalidation_wins_over_targeted_changes(
+    mock_repo: MagicMock, temp_dir: Path
+):
+    """A plain request for the same key discards queued targeted changes."""
+    watcher = FileWatcher(
+        cache_repository=mock_repo, watch_paths=[str(temp_dir)], debounce_ms=50
+    )
+    with patch.object(watcher, "_ensure_coalescer"):
+        watcher._queue_invalidation(
+            "proj-1",
+            profile_root=".claude",
+            change=MagicMock(path="a"),
+        )
+        assert watcher.pending_changes["proj-1::.claude"]
+        watcher._queue_invalidation("proj-1", profile_root=".claude")
+
+    assert watcher.pending_changes["proj-1::.claude"] is None
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from skillmeat.api.project_registry import ProjectRegistry
+from skillmeat.core.project_registry import ProjectRegistry
 from skillmeat.api.routers.projects import discover_projects
 from skillmeat.storage.deployment import DeploymentTracker
 
@@ -179,6 +179,27 @@ class TestSentenceTransformerEmbedderGetEmbedding:
         assert len(result) == 384
         assert all(isinstance(v, float) for v in result)
 
+    def test_get_embeddings_encodes_one_batch(self):
+        """get_embeddings() runs a single batched encode and keeps positions."""
+        import skillmeat.core.scoring.embedder as _emb_mod
+
+        _emb_mod._sentence_transformers_available = True
+
+        fake_model = MagicMock()
+        fake_model.encode.return_value = [[1.0, 0.0], [0.0, 1.0]]
+
+        from skillmeat.core.scoring.embedder import SentenceTransformerEmbedder
+
+        embedder = SentenceTransformerEmbedder()
+        embedder._model = fake_model
+
+        result = asyncio.run(embedder.get_embeddings(["pdf tool", "  ", "lint code"]))
+
+        assert result == [[1.0, 0.0], None, [0.0, 1.0]]
+        fake_model.encode.assert_called_once()
+        assert fake_model.encode.call_args.args[0] == ["pdf tool", "lint code"]
+        assert fake_model.encode.call_args.kwargs["batch_size"] == embedder.BATCH_SIZE
+
     def test_get_embedding_dimension(self):
         """get_embedding_dimension() returns 384."""
         from skillmeat.core.scoring.embedder import SentenceTransformerEmbedder
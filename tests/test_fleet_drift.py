@@ -0,0 +1,311 @@
+"""Tests for fleet-wide drift scanning (skillmeat.core.fleet_drift)."""
+
+import threading
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from skillmeat.cache.models import Project
+from skillmeat.cache.repository import CacheNotFoundError, CacheRepository
+from skillmeat.core.deployment import DeploymentManager
+from skillmeat.core.fleet_drift import FleetDriftScanner
+from skillmeat.core.sync import SyncManager
+
+
+class MockCollectionManager:
+    def __init__(self, collection_path: Path):
+        self.collection_path = collection_path
+
+    def load_collection(self, name):
+        return object()
+
+    @property
+    def config(self):
+        collection_path = self.collection_path
+
+        class Config:
+            def get_collection_path(self, name):
+                return collection_path
+
+        return Config()
+
+
+@pytest.fixture
+def fleet(tmp_path):
+    """Collection with two skills and three projects deploying them."""
+    collection_path = tmp_path / "collection"
+    for name in ("alpha", "beta"):
+        skill = collection_path / "skills" / name
+        skill.mkdir(parents=True)
+        (skill / "SKILL.md").write_text(f"# {name}\n")
+
+    collection_mgr = MockCollectionManager(collection_path)
+    sync_mgr = SyncManager(collection_manager=collection_mgr)
+    repo = CacheRepository(db_path=str(tmp_path / "cache.db"))
+
+    projects: Dict[str, Path] = {}
+    for index in range(3):
+        project_path = tmp_path / f"project-{index}"
+        for name in ("alpha", "beta"):
+            sync_mgr.update_deployment_metadata(
+                project_path=project_path,
+                artifact_name=name,
+                artifact_type="skill",
+                collection_path=collection_path,
+            )
+            deployed = project_path / ".claude" / "skills" / name
+            deployed.mkdir(parents=True, exist_ok=True)
+            (deployed / "SKILL.md").write_text(f"# {name}\n")
+        repo.create_project(
+            Project(id=f"proj-{index}", name=f"p{index}", path=str(project_path))
+        )
+        projects[f"proj-{index}"] = project_path
+
+    scanner = FleetDriftScanner(
+        sync_mgr,
+        repo,
+        deployment_manager=DeploymentManager(collection_mgr=collection_mgr),
+        max_workers=2,
+    )
+    return scanner, collection_path, projects
+
+
+def _matrix(scanner: FleetDriftScanner, scan_id: str) -> Dict[tuple, str]:
+    entries, _ = scanner.store.list_entries(scan_id, limit=1000)
+    return {(e["project_id"], e["artifact_name"]): e["drift_type"] for e in entries}
+
+
+def test_scan_builds_drift_matrix(fleet):
+    scanner, collection_path, projects = fleet
+
+    # alpha changed upstream everywhere; beta modified locally in project-1
+    (collection_path / "skills" / "alpha" / "SKILL.md").write_text("# alpha v2\n")
+    (projects["proj-1"] / ".claude" / "skills" / "beta" / "SKILL.md").write_text(
+        "# local edit\n"
+    )
+
+    summary = scanner.scan()
+
+    assert summary.status == "completed"
+    assert summary.total_projects == 3
+    assert summary.scanned_projects == 3
+    assert summary.failed_projects == 0
+    assert summary.drifted_artifacts == 4
+
+    matrix = _matrix(scanner, summary.scan_id)
+    assert matrix[("proj-0", "alpha")] == "outdated"
+    assert matrix[("proj-0", "beta")] == "synced"
+    assert matrix[("proj-1", "beta")] == "modified"
+    assert matrix[("proj-2", "alpha")] == "outdated"
+
+
+def test_conflict_and_removed(fleet):
+    scanner, collection_path, projects = fleet
+
+    (collection_path / "skills" / "alpha" / "SKILL.md").write_text("# alpha v2\n")
+    (projects["proj-0"] / ".claude" / "skills" / "alpha" / "SKILL.md").write_text(
+        "# local edit\n"
+    )
+    for child in (collection_path / "skills" / "beta").iterdir():
+        child.unlink()
+    (collection_path / "skills" / "beta").rmdir()
+
+    summary = scanner.scan()
+    matrix = _matrix(scanner, summary.scan_id)
+
+    assert matrix[("proj-0", "alpha")] == "conflict"
+    assert matrix[("proj-0", "beta")] == "removed"
+    entries, _ = scanner.store.list_entries(
+        summary.scan_id, drift_types=["removed"], project_id="proj-0"
+    )
+    assert entries[0]["recommendation"] == "remove_from_project"
+    assert entries[0]["collection_sha"] is None
+
+
+def test_collection_artifacts_hashed_once_per_run(fleet, monkeypatch):
+    scanner, _, _ = fleet
+    hashed: List[Path] = []
+    original = scanner.sync_mgr._compute_content_hash
+
+    def counting_hash(path):
+        hashed.append(path)
+        return original(path)
+
+    monkeypatch.setattr(scanner.sync_mgr, "_compute_content_hash", counting_hash)
+
+    summary = scanner.scan()
+
+    # Two collection artifacts shared by three projects
+    assert len(hashed) == 2
+    assert summary.collection_hashes == 2
+
+
+def test_cancelled_scan_resumes(fleet):
+    scanner, _, _ = fleet
+    cancel = threading.Event()
+    cancel.set()
+
+    summary = scanner.scan(cancel_event=cancel)
+    assert summary.status == "cancelled"
+    assert summary.scanned_projects == 0
+
+    resumed = scanner.run(summary.scan_id)
+    assert resumed.status == "completed"
+    assert resumed.scanned_projects == 3
+
+
+def test_resume_skips_completed_projects(fleet, monkeypatch):
+    scanner, _, projects = fleet
+    scan_id = scanner.store.create_scan()
+    scanner.store.record_project(
+        scan_id,
+        "proj-0",
+        str(projects["proj-0"]),
+        [
+            {
+                "artifact_name": "alpha",
+                "artifact_type": "skill",
+                "profile_id": "claude_code",
+                "drift_type": "synced",
+            }
+        ],
+    )
+
+    scanned: List[Path] = []
+    original = scanner._scan_project
+
+    def tracking_scan(project_path, collection_name, index):
+        scanned.append(project_path)
+        return original(project_path, collection_name, index)
+
+    monkeypatch.setattr(scanner, "_scan_project", tracking_scan)
+
+    summary = scanner.run(scan_id)
+
+    assert summary.scanned_projects == 3
+    assert sorted(scanned) == sorted([projects["proj-1"], projects["proj-2"]])
+
+
+def test_failed_project_is_counted_and_retried(fleet):
+    scanner, _, projects = fleet
+    missing = projects["proj-2"].rename(projects["proj-2"].with_name("moved"))
+
+    summary = scanner.scan()
+    assert summary.status == "completed"
+    assert summary.failed_projects == 1
+    assert summary.scanned_projects == 2
+
+    missing.rename(projects["proj-2"])
+    resumed = scanner.run(summary.scan_id)
+    assert resumed.status == "completed"
+    assert resumed.failed_projects == 0
+    assert resumed.scanned_projects == 3
+
+
+def test_cancel_request_and_paging(fleet):
+    scanner, _, _ = fleet
+    scan_id = scanner.store.create_scan()
+    assert scanner.cancel(scan_id) is True
+    assert scanner.cancel(scan_id) is False
+
+    summary = scanner.run(scan_id)
+    page, total = scanner.store.list_entries(summary.scan_id, offset=2, limit=2)
+    assert total == 6
+    assert len(page) == 2
+
+    with pytest.raises(CacheNotFoundError):
+        scanner.run("does-not-exist")
+
+
+# =============================================================================
+# API and CLI
+# =============================================================================
+
+
+@pytest.fixture
+def api_client(fleet):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from skillmeat.api.routers import drift_scans
+
+    app = FastAPI()
+    app.include_router(drift_scans.router, prefix="/api/v1")
+    app.dependency_overrides[drift_scans.get_fleet_drift_scanner] = lambda: fleet[0]
+    return TestClient(app)
+
+
+def test_api_start_poll_and_page_scan(fleet, api_client):
+    _, collection_path, _ = fleet
+    (collection_path / "skills" / "alpha" / "SKILL.md").write_text("# alpha v2\n")
+
+    response = api_client.post("/api/v1/drift-scans", json={})
+    assert response.status_code == 202
+    scan_id = response.json()["id"]
+
+    # TestClient runs background tasks before returning the response
+    scan = api_client.get(f"/api/v1/drift-scans/{scan_id}").json()
+    assert scan["status"] == "completed"
+    assert scan["scanned_projects"] == 3
+    assert scan["drifted_artifacts"] == 3
+
+    page = api_client.get(
+        f"/api/v1/drift-scans/{scan_id}/entries",
+        params={"drift_type": "outdated", "limit": 2},
+    ).json()
+    assert page["total"] == 3
+    assert len(page["items"]) == 2
+    assert {e["artifact_name"] for e in page["items"]} == {"alpha"}
+
+    listed = api_client.get("/api/v1/drift-scans").json()["items"]
+    assert [s["id"] for s in listed] == [scan_id]
+
+
+def test_api_cancel_and_resume(fleet, api_client):
+    scanner = fleet[0]
+    scan_id = scanner.store.create_scan()
+
+    cancelled = api_client.post(f"/api/v1/drift-scans/{scan_id}/cancel")
+    assert cancelled.status_code == 200
+    assert cancelled.json()["status"] == "cancelled"
+    assert api_client.post(f"/api/v1/drift-scans/{scan_id}/cancel").status_code == 409
+
+    resumed = api_client.post(f"/api/v1/drift-scans/{scan_id}/resume")
+    assert resumed.status_code == 202
+    assert scanner.store.get_scan(scan_id)["status"] == "completed"
+    assert api_client.post(f"/api/v1/drift-scans/{scan_id}/resume").status_code == 409
+
+    assert api_client.get("/api/v1/drift-scans/missing").status_code == 404
+
+
+def test_cli_start_and_show(fleet, monkeypatch):
+    import json
+
+    from click.testing import CliRunner
+
+    from skillmeat.cli.commands import drift_scan
+
+    scanner, collection_path, _ = fleet
+    (collection_path / "skills" / "beta" / "SKILL.md").write_text("# beta v2\n")
+    monkeypatch.setattr(drift_scan, "_get_scanner", lambda max_workers=None: scanner)
+    runner = CliRunner()
+
+    started = runner.invoke(drift_scan.drift_scan_group, ["start"])
+    assert started.exit_code == 0, started.output
+    scan_id = scanner.store.list_scans(1)[0]["id"]
+
+    shown = runner.invoke(
+        drift_scan.drift_scan_group,
+        ["show", scan_id, "--drift-type", "outdated", "--format", "json"],
+    )
+    assert shown.exit_code == 0, shown.output
+    page = json.loads(shown.output)
+    assert page["total"] == 3
+    assert {e["artifact_name"] for e in page["items"]} == {"beta"}
+
+    status = runner.invoke(
+        drift_scan.drift_scan_group, ["status", scan_id, "--format", "json"]
+    )
+    assert status.exit_code == 0, status.output
+    assert json.loads(status.output)["status"] == "completed"
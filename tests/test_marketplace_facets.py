@@ -0,0 +1,194 @@
+"""Tests for precomputed marketplace facet counts.
+
+Covers incremental maintenance of ``marketplace_facet_counts`` through the
+repository write paths (source create/update/delete, bulk entry creation,
+scan transactions, exclusion) and the self-healing / verification reads.
+"""
+
+from __future__ import annotations
+
+import tempfile
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from skillmeat.cache.marketplace_facets import FacetCount, live_facets
+from skillmeat.cache.models import (
+    MarketplaceCatalogEntry,
+    MarketplaceFacetCount,
+    MarketplaceSource,
+    MarketplaceSourceFacets,
+)
+from skillmeat.cache.repositories import (
+    MarketplaceCatalogRepository,
+    MarketplaceSourceRepository,
+    MarketplaceTransactionHandler,
+)
+
+pytestmark = pytest.mark.usefixtures("fresh_cache_engine")
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def temp_db():
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        db_path = f.name
+    yield db_path
+    Path(db_path).unlink(missing_ok=True)
+
+
+@pytest.fixture
+def source_repo(temp_db):
+    return MarketplaceSourceRepository(db_path=temp_db)
+
+
+@pytest.fixture
+def catalog_repo(temp_db):
+    return MarketplaceCatalogRepository(db_path=temp_db)
+
+
+def _source(source_id: str, trust_level: str = "basic") -> MarketplaceSource:
+    return MarketplaceSource(
+        id=source_id,
+        repo_url=f"https://github.com/test/{source_id}",
+        owner="test",
+        repo_name=source_id,
+        ref="main",
+        trust_level=trust_level,
+        visibility="public",
+        scan_status="success",
+    )
+
+
+def _entry(source_id: str, name: str, artifact_type: str = "skill", **kwargs):
+    return MarketplaceCatalogEntry(
+        id=f"entry_{uuid.uuid4().hex[:8]}",
+        source_id=source_id,
+        artifact_type=artifact_type,
+        name=name,
+        path=f"artifacts/{name}",
+        upstream_url=f"https://github.com/test/{name}",
+        detected_sha="abc123",
+        detected_at=datetime.utcnow(),
+        confidence_score=80,
+        status=kwargs.pop("status", "new"),
+        **kwargs,
+    )
+
+
+def _assert_consistent(repo: MarketplaceSourceRepository) -> None:
+    session = repo._get_session()
+    try:
+        assert live_facets(session) == repo.get_facet_counts()
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def populated(source_repo, catalog_repo):
+    source_repo.create(_source("src-a", "verified"), tags=["python", "UI"])
+    source_repo.create(_source("src-b"), tags=["python"])
+    catalog_repo.bulk_create(
+        [
+            _entry("src-a", "one"),
+            _entry("src-a", "two"),
+            _entry("src-a", "cmd", artifact_type="command"),
+            _entry("src-b", "three"),
+        ]
+    )
+    return source_repo
+
+
+# =============================================================================
+# Incremental maintenance
+# =============================================================================
+
+
+def test_counts_follow_sources_and_entries(populated):
+    facets = populated.get_facet_counts()
+
+    assert facets["artifact_type"]["skill"] == FacetCount(2, 3)
+    assert facets["artifact_type"]["command"] == FacetCount(1, 1)
+    assert facets["tag"]["python"] == FacetCount(2, 4)
+    assert facets["tag"]["ui"] == FacetCount(1, 3)
+    assert facets["trust_level"]["verified"] == FacetCount(1, 3)
+    assert facets["trust_level"]["basic"] == FacetCount(1, 1)
+    assert populated.verify_facet_counts() == []
+
+
+def test_exclusion_and_tag_changes_update_counts(populated, catalog_repo):
+    command = next(
+        e for e in catalog_repo.list_by_source("src-a") if e.artifact_type == "command"
+    )
+    catalog_repo.set_exclusion(command.id, "src-a", excluded=True)
+    populated.update_fields("src-b", tags=["go"])
+
+    facets = populated.get_facet_counts()
+    assert "command" not in facets["artifact_type"]
+    assert facets["tag"]["python"] == FacetCount(1, 2)
+    assert facets["tag"]["go"] == FacetCount(1, 1)
+    _assert_consistent(populated)
+
+    catalog_repo.set_exclusion(command.id, "src-a", excluded=False)
+    assert populated.get_facet_counts()["artifact_type"]["command"] == FacetCount(1, 1)
+
+
+def test_scan_transaction_and_delete_update_counts(populated, temp_db):
+    handler = MarketplaceTransactionHandler(db_path=temp_db)
+    with handler.scan_update_transaction("src-b") as ctx:
+        ctx.replace_catalog_entries(
+            [
+                _entry("src-b", "agent-1", artifact_type="agent"),
+                _entry("src-b", "dupe", excluded_at=datetime.utcnow()),
+            ]
+        )
+
+    facets = populated.get_facet_counts()
+    assert facets["artifact_type"]["skill"] == FacetCount(1, 2)
+    assert facets["artifact_type"]["agent"] == FacetCount(1, 1)
+    _assert_consistent(populated)
+
+    populated.delete("src-a")
+    facets = populated.get_facet_counts()
+    assert "verified" not in facets["trust_level"]
+    assert facets["tag"] == {"python": FacetCount(1, 1)}
+    _assert_consistent(populated)
+
+
+# =============================================================================
+# Self-healing and verification
+# =============================================================================
+
+
+def test_missing_facet_rows_are_rebuilt_on_read(populated):
+    session = populated._get_session()
+    try:
+        session.query(MarketplaceFacetCount).delete()
+        session.query(MarketplaceSourceFacets).delete()
+        session.commit()
+    finally:
+        session.close()
+
+    assert populated.get_facet_counts()["tag"]["python"] == FacetCount(2, 4)
+
+
+def test_verify_reports_and_repairs_drift(populated):
+    session = populated._get_session()
+    try:
+        row = session.get(MarketplaceFacetCount, ("artifact_type", "skill"))
+        row.artifact_count = 99
+        session.commit()
+    finally:
+        session.close()
+
+    mismatches = populated.verify_facet_counts()
+    assert len(mismatches) == 1
+    assert mismatches[0].startswith("artifact_type=skill")
+    assert populated.verify_facet_counts() == []
+    assert populated.get_facet_counts()["artifact_type"]["skill"] == FacetCount(2, 3)
@@ -351,3 +351,55 @@ class TestMatchAnalyzerCompare:
         breakdown_unrelated = self.analyzer.compare(fp_similar_a, fp_unrelated)
 
         assert breakdown_similar.metadata_score > breakdown_unrelated.metadata_score
+
+
+# ---------------------------------------------------------------------------
+# Corpus-level description scoring
+# ---------------------------------------------------------------------------
+
+
+class TestDescriptionCorpus:
+    """MatchAnalyzer.with_description_corpus() uses a shared BM25Index."""
+
+    def test_scoped_analyzer_leaves_original_untouched(self) -> None:
+        analyzer = MatchAnalyzer()
+        scoped = analyzer.with_description_corpus(["Render charts from CSV data"])
+        assert analyzer.description_index is None
+        assert scoped.description_index is not None
+        assert len(scoped.description_index) == 1
+
+    def test_corpus_scores_rank_like_pairwise_scores(self) -> None:
+        target = _make_fingerprint(
+            name="py-lint",
+            description="Analyse Python code and report linting errors and type violations",
+        )
+        candidates = [
+            _make_fingerprint(
+                name="lint",
+                description="Inspect Python source files for lint and type checking issues",
+            ),
+            _make_fingerprint(
+                name="maps",
+                description="Download satellite imagery and render geographic map tiles",
+            ),
+            _make_fingerprint(name="copy", description=target.description),
+        ]
+        scoped = MatchAnalyzer().with_description_corpus(
+            fp.description or "" for fp in candidates
+        )
+        scores = [scoped._compute_metadata_score(target, fp) for fp in candidates]
+        pairwise = [
+            MatchAnalyzer()._compute_metadata_score(target, fp) for fp in candidates
+        ]
+
+        assert scores[2] == pytest.approx(pairwise[2])
+        assert scores[0] > scores[1]
+        assert pairwise[0] > pairwise[1]
+
+    def test_descriptions_outside_corpus_fall_back_to_pairwise(self) -> None:
+        fp_a = _make_fingerprint(name="a", description="Convert PDF files to markdown")
+        fp_b = _make_fingerprint(name="b", description="Convert PDF files to HTML")
+        scoped = MatchAnalyzer().with_description_corpus(["Unrelated text"])
+        assert scoped._compute_metadata_score(fp_a, fp_b) == pytest.approx(
+            MatchAnalyzer()._compute_metadata_score(fp_a, fp_b)
+        )
@@ -0,0 +1,141 @@
+"""Tests for the match result cache (skillmeat.cache.match_cache).
+
+Covers cache hits through ScoringService, invalidation when artifact
+content changes, LRU eviction and the exclusion of transiently degraded
+results.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from skillmeat.cache.match_cache import (
+    MatchResultCache,
+    collection_fingerprint,
+    context_fingerprint,
+    normalize_query,
+)
+from skillmeat.cache.models import MatchResultCacheEntry
+from skillmeat.cache.repository import CacheRepository
+from skillmeat.core.artifact import ArtifactMetadata
+from skillmeat.core.scoring.context_booster import ProjectContext
+from skillmeat.core.scoring.service import ScoringService
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return MatchResultCache(CacheRepository(db_path=str(tmp_path / "cache.db")))
+
+
+def _artifacts(description: str = "Process PDF files"):
+    return [
+        ("pdf-tool", ArtifactMetadata(title="PDF Tool", description=description)),
+        ("db-tool", ArtifactMetadata(title="DB Tool", description="Manage databases")),
+    ]
+
+
+def _rows(cache: MatchResultCache):
+    with cache.repository.transaction() as session:
+        return session.query(MatchResultCacheEntry).count()
+
+
+@pytest.mark.asyncio
+async def test_repeated_query_is_served_from_cache(cache):
+    service = ScoringService(enable_semantic=False, result_cache=cache)
+    first = await service.score_artifacts("PDF  tool", _artifacts())
+
+    with patch.object(service, "_score_keyword") as score_keyword:
+        second = await service.score_artifacts("pdf tool", _artifacts())
+        score_keyword.assert_not_called()
+
+    assert [s.artifact_id for s in second.scores] == [
+        s.artifact_id for s in first.scores
+    ]
+    assert [s.confidence for s in second.scores] == [
+        s.confidence for s in first.scores
+    ]
+    assert second.query == "PDF  tool"
+
+    # A fresh cache instance (new process) is served from the DB table.
+    reopened = MatchResultCache(cache.repository)
+    service = ScoringService(enable_semantic=False, result_cache=reopened)
+    with patch.object(service, "_score_keyword") as score_keyword:
+        await service.score_artifacts("pdf tool", _artifacts())
+        score_keyword.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_changed_artifact_content_invalidates_results(cache):
+    service = ScoringService(enable_semantic=False, result_cache=cache)
+    await service.score_artifacts("pdf", _artifacts())
+    await service.score_artifacts("database", _artifacts())
+    assert _rows(cache) == 2
+
+    changed = _artifacts(description="Split and merge PDF documents")
+    with patch.object(
+        service, "_score_keyword", wraps=service._score_keyword
+    ) as score_keyword:
+        await service.score_artifacts("pdf", changed)
+        score_keyword.assert_called_once()
+
+    # Rows for the old content version of the collection are gone.
+    assert _rows(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_transient_degradation_is_not_cached(cache):
+    embedder = Mock()
+    embedder.is_available.return_value = True
+
+    async def failing(query, artifacts):
+        raise RuntimeError("model crashed")
+
+    with patch(
+        "skillmeat.core.scoring.semantic_scorer.SemanticScorer.score_all",
+        side_effect=failing,
+    ):
+        service = ScoringService(embedder=embedder, result_cache=cache)
+        result = await service.score_artifacts("pdf", _artifacts())
+
+    assert result.degraded is True
+    assert _rows(cache) == 0
+
+
+def test_lru_eviction_keeps_most_recently_used(tmp_path):
+    cache = MatchResultCache(
+        CacheRepository(db_path=str(tmp_path / "cache.db")),
+        max_entries=2,
+        memory_entries=0,
+    )
+    for name in ("a", "b"):
+        cache.put(name, name, (f"scope-{name}", "v1"), {"name": name})
+    assert cache.get("a") == {"name": "a"}  # "b" is now least recently used
+
+    cache.put("c", "c", ("scope-c", "v1"), {"name": "c"})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"name": "a"}
+    assert cache.get("c") == {"name": "c"}
+    assert cache.invalidate() == 2
+    assert cache.get("a") is None
+
+
+def test_key_components():
+    assert normalize_query("  PDF\tTool ") == "pdf tool"
+
+    scope, version = collection_fingerprint(_artifacts())
+    reordered = collection_fingerprint(list(reversed(_artifacts())))
+    changed = collection_fingerprint(_artifacts(description="other"))
+    assert (scope, version) == reordered
+    assert changed[0] == scope and changed[1] != version
+
+    python = ProjectContext(language="python", additional_tags={"b", "a"})
+    assert context_fingerprint(None) is None
+    assert context_fingerprint(python) == context_fingerprint(
+        ProjectContext(language="python", additional_tags={"a", "b"})
+    )
+    assert MatchResultCache.build_key("q", version, {}, None) != (
+        MatchResultCache.build_key("q", version, {}, context_fingerprint(python))
+    )
@@ -0,0 +1,194 @@
+"""Tests for the incremental MCP log monitor."""
+
+import os
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from skillmeat.core.mcp import log_monitor
+from skillmeat.core.mcp.log_monitor import (
+    ERROR_PATTERNS,
+    ERROR_RE,
+    SUCCESS_PATTERNS,
+    SUCCESS_RE,
+    WARNING_PATTERNS,
+    WARNING_RE,
+    MCPLogMonitor,
+    find_log_files,
+    match_server,
+)
+
+
+def _line(message: str, level: str = "INFO", second: int = 0) -> str:
+    return f"[2025-01-15 10:30:{second:02d}] {level}: {message}\n"
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    return log_dir
+
+
+@pytest.fixture
+def monitor(log_dir):
+    return MCPLogMonitor(lambda: find_log_files(log_dir))
+
+
+def _append(path: Path, *lines: str) -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("".join(lines))
+
+
+class TestPatterns:
+    @pytest.mark.parametrize(
+        "regex,patterns",
+        [
+            (SUCCESS_RE, SUCCESS_PATTERNS),
+            (ERROR_RE, ERROR_PATTERNS),
+            (WARNING_RE, WARNING_PATTERNS),
+        ],
+    )
+    def test_alternation_captures_same_server(self, regex, patterns):
+        """Each severity regex captures what its individual patterns capture."""
+        for pattern in patterns:
+            message = (
+                pattern.replace("['\\\"](.+?)['\\\"]", "'my-server'")
+                .replace("\\", "")
+            )
+            assert re.search(pattern, message).group(1) == "my-server"
+            assert match_server(regex.search(message)) == "my-server"
+
+
+class TestMCPLogMonitor:
+    def test_aggregates_by_server(self, log_dir, monitor):
+        _append(
+            log_dir / "mcp.log",
+            _line("MCP server 'fs' started", second=1),
+            _line("Failed to start MCP server 'db'", "ERROR", second=2),
+            _line("MCP server 'gh' timeout", "WARN", second=3),
+            _line("unrelated line"),
+        )
+
+        status = monitor.refresh()
+
+        assert status["fs"]["success_count"] == 1
+        assert status["fs"]["last_seen"] == datetime(2025, 1, 15, 10, 30, 1)
+        assert status["db"]["errors"] == ["Failed to start MCP server 'db'"]
+        assert status["gh"]["warnings"] == ["MCP server 'gh' timeout"]
+
+    def test_reads_only_appended_lines(self, log_dir, monitor):
+        log_file = log_dir / "mcp.log"
+        _append(log_file, *[_line("MCP server 'fs' started") for _ in range(50)])
+        monitor.refresh()
+
+        with patch.object(
+            log_monitor, "_apply_line", wraps=log_monitor._apply_line
+        ) as apply_line:
+            _append(log_file, _line("MCP server 'fs' crashed", "ERROR"))
+            status = monitor.refresh()
+            assert apply_line.call_count == 1
+
+            apply_line.reset_mock()
+            monitor.refresh()
+            apply_line.assert_not_called()
+
+        assert status["fs"]["success_count"] == 50
+        assert status["fs"]["errors"] == ["MCP server 'fs' crashed"]
+
+    def test_recent_errors_newest_first_and_capped(self, log_dir):
+        monitor = MCPLogMonitor(lambda: find_log_files(log_dir), max_messages=3)
+        _append(
+            log_dir / "mcp.log",
+            *[_line(f"Error in MCP server 'db' #{i}", "ERROR") for i in range(5)],
+        )
+
+        errors = monitor.refresh()["db"]["errors"]
+
+        assert errors == [f"Error in MCP server 'db' #{i}" for i in (4, 3, 2)]
+
+    def test_rotation_continues_from_offset(self, log_dir, monitor):
+        log_file = log_dir / "mcp.log"
+        _append(log_file, _line("MCP server 'fs' started"))
+        monitor.refresh()
+
+        # Rotate: the old file keeps its inode under the new name.
+        os.replace(log_file, log_dir / "mcp.log.1")
+        _append(log_dir / "mcp.log.1", _line("MCP server 'fs' started"))
+        _append(log_file, _line("MCP server 'fs' started"))
+
+        status = monitor.refresh()
+
+        assert status["fs"]["success_count"] == 3
+
+    def test_truncated_file_is_reread(self, log_dir, monitor):
+        log_file = log_dir / "mcp.log"
+        _append(log_file, *[_line("MCP server 'fs' started") for _ in range(3)])
+        monitor.refresh()
+
+        log_file.write_text(_line("MCP server 'fs' crashed", "ERROR"))
+        status = monitor.refresh()
+
+        assert status["fs"]["errors"] == ["MCP server 'fs' crashed"]
+        assert status["fs"]["success_count"] == 3
+
+    def test_partial_line_counted_once(self, log_dir, monitor):
+        log_file = log_dir / "mcp.log"
+        log_file.write_text(_line("MCP server 'fs' started").rstrip("\n"))
+
+        assert monitor.refresh()["fs"]["success_count"] == 1
+        assert monitor.refresh()["fs"]["success_count"] == 1
+
+        _append(log_file, "\n", _line("MCP server 'fs' started"))
+        assert monitor.refresh()["fs"]["success_count"] == 2
+
+    def test_state_persists_across_instances(self, log_dir, tmp_path):
+        state_path = tmp_path / "state.json"
+        log_file = log_dir / "mcp.log"
+        _append(log_file, _line("MCP server 'fs' started"))
+        MCPLogMonitor(lambda: find_log_files(log_dir), state_path=state_path).refresh()
+
+        _append(log_file, _line("MCP server 'fs' started"))
+        resumed = MCPLogMonitor(lambda: find_log_files(log_dir), state_path=state_path)
+        with patch.object(
+            log_monitor, "_apply_line", wraps=log_monitor._apply_line
+        ) as apply_line:
+            status = resumed.refresh()
+
+        assert apply_line.call_count == 1
+        assert status["fs"]["success_count"] == 2
+
+    def test_corrupt_state_is_ignored(self, log_dir, tmp_path):
+        state_path = tmp_path / "state.json"
+        state_path.write_text("{not json")
+        _append(log_dir / "mcp.log", _line("MCP server 'fs' started"))
+
+        monitor = MCPLogMonitor(lambda: find_log_files(log_dir), state_path=state_path)
+
+        assert monitor.refresh()["fs"]["success_count"] == 1
+
+    def test_reset_rereads_files(self, log_dir, monitor):
+        _append(log_dir / "mcp.log", _line("MCP server 'fs' started"))
+        monitor.refresh()
+
+        monitor.reset()
+
+        assert monitor.snapshot() == {}
+        assert monitor.refresh()["fs"]["success_count"] == 1
+
+    def test_background_refresh(self, log_dir, monitor):
+        monitor.start(interval=0.01)
+        try:
+            assert monitor.running
+            _append(log_dir / "mcp.log", _line("MCP server 'fs' started"))
+            deadline = time.monotonic() + 5
+            while "fs" not in monitor.snapshot() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert monitor.snapshot()["fs"]["success_count"] == 1
+        finally:
+            monitor.stop()
+        assert not monitor.running
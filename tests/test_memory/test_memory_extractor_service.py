@@ -1364,3 +1364,182 @@ def test_preview_tool_sessions_meet_anchor_coverage_target(seeded_db_path):
     for candidate in candidates:
         assert candidate["source_type"] == "extraction"
         assert candidate["provenance"]["source_type"] == "extraction"
+
+
+# ---------------------------------------------------------------------------
+# Streaming extraction (extract_stream / preview_stream)
+# ---------------------------------------------------------------------------
+
+
+def _streaming_session_jsonl(message_count: int = 40) -> str:
+    """Build a session whose tool calls and text alternate across messages."""
+    messages = []
+    for index in range(message_count):
+        if index % 3 == 0:
+            messages.append(
+                {
+                    "type": "assistant",
+                    "content": [
+                        {
+                            "type": "tool_use",
+                            "name": "Edit" if index % 2 else "Read",
+                            "input": {"file_path": f"skillmeat/module_{index}.py"},
+                        }
+                    ],
+                }
+            )
+        elif index % 3 == 1:
+            messages.append(
+                {
+                    "type": "assistant",
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": (
+                                f"Decision: Use bounded worker pool number {index} "
+                                "for extraction chunks."
+                            ),
+                        }
+                    ],
+                    "sessionId": "sess-stream",
+                    "gitBranch": "feat/streaming",
+                }
+            )
+        else:
+            messages.append({"type": "progress", "content": f"step {index}"})
+    messages.append(
+        {
+            "type": "assistant",
+            "content": "Gotcha: beware sqlite lock timeout under parallel writers.",
+        }
+    )
+    return "\n".join(json.dumps(message) for message in messages) + "\n"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1000])
+def test_preview_stream_matches_preview_for_file_path(
+    seeded_db_path, tmp_path, chunk_size
+):
+    """Streaming from a path should match preview() regardless of chunking."""
+    corpus = _streaming_session_jsonl()
+    transcript = tmp_path / "session.jsonl"
+    transcript.write_text(corpus, encoding="utf-8")
+    service = MemoryExtractorService(db_path=seeded_db_path)
+
+    expected = service.preview(
+        PROJECT_ID, corpus, min_confidence=0.0, commit_sha="abc1234"
+    )
+    streamed = service.preview_stream(
+        PROJECT_ID,
+        transcript,
+        min_confidence=0.0,
+        commit_sha="abc1234",
+        chunk_size=chunk_size,
+    )
+
+    assert streamed == expected
+    assert any(candidate["anchors"] for candidate in streamed)
+
+
+def test_extract_stream_accepts_non_seekable_byte_stream(seeded_db_path):
+    """Byte streams without seek support should be spooled and extracted."""
+    import io
+
+    class _PipeLike(io.RawIOBase):
+        def __init__(self, payload: bytes):
+            self._buffer = io.BytesIO(payload)
+
+        def readable(self):
+            return True
+
+        def readinto(self, target):
+            data = self._buffer.read(len(target))
+            target[: len(data)] = data
+            return len(data)
+
+    corpus = _streaming_session_jsonl(12)
+    service = MemoryExtractorService(db_path=seeded_db_path)
+
+    streamed = list(
+        service.extract_stream(
+            PROJECT_ID,
+            io.BufferedReader(_PipeLike(corpus.encode("utf-8"))),
+            min_confidence=0.0,
+            commit_sha="abc1234",
+            chunk_size=2,
+        )
+    )
+
+    expected = service.preview(
+        PROJECT_ID, corpus, min_confidence=0.0, commit_sha="abc1234"
+    )
+    assert sorted(c["content"] for c in streamed) == sorted(
+        c["content"] for c in expected
+    )
+
+
+def test_preview_stream_falls_back_to_plain_text(seeded_db_path):
+    """Streams without any JSONL messages should use plain-text extraction."""
+    import io
+
+    corpus = (
+        "Decision: Use SQLAlchemy for persistence.\n"
+        "Constraint: We must keep p95 latency under 200ms.\n"
+        "Decision: Use SQLAlchemy for persistence.\n"
+    )
+    service = MemoryExtractorService(db_path=seeded_db_path)
+
+    streamed = service.preview_stream(
+        PROJECT_ID, io.BytesIO(corpus.encode("utf-8")), commit_sha="abc1234"
+    )
+
+    assert streamed == service.preview(PROJECT_ID, corpus, commit_sha="abc1234")
+    assert all(c["provenance"]["format"] == "plain_text" for c in streamed)
+
+
+def test_preview_stream_handles_json_string_wrapped_corpus(seeded_db_path):
+    """JSON-string-wrapped JSONL should be unwrapped like preview()."""
+    import io
+
+    corpus = json.dumps(_streaming_session_jsonl(6))
+    service = MemoryExtractorService(db_path=seeded_db_path)
+
+    streamed = service.preview_stream(
+        PROJECT_ID, io.StringIO(corpus), min_confidence=0.0, commit_sha="abc1234"
+    )
+
+    assert streamed
+    assert streamed == service.preview(
+        PROJECT_ID, corpus, min_confidence=0.0, commit_sha="abc1234"
+    )
+
+
+def test_preview_stream_with_worker_processes_matches_serial(seeded_db_path, tmp_path):
+    """Multiprocess chunk scoring should produce the same candidates."""
+    transcript = tmp_path / "session.jsonl"
+    transcript.write_text(_streaming_session_jsonl(60), encoding="utf-8")
+    service = MemoryExtractorService(db_path=seeded_db_path)
+
+    serial = service.preview_stream(
+        PROJECT_ID, transcript, min_confidence=0.0, commit_sha="abc1234", chunk_size=5
+    )
+    parallel = service.preview_stream(
+        PROJECT_ID,
+        transcript,
+        min_confidence=0.0,
+        commit_sha="abc1234",
+        chunk_size=5,
+        workers=2,
+    )
+
+    assert parallel == serial
+
+
+def test_extract_stream_validates_arguments_eagerly(seeded_db_path, tmp_path):
+    """Invalid arguments should raise before the generator is consumed."""
+    service = MemoryExtractorService(db_path=seeded_db_path)
+
+    with pytest.raises(ValueError, match="Invalid extraction profile"):
+        service.extract_stream(PROJECT_ID, tmp_path / "missing.jsonl", profile="bogus")
+    with pytest.raises(ValueError, match="chunk_size"):
+        service.extract_stream(PROJECT_ID, tmp_path / "missing.jsonl", chunk_size=0)
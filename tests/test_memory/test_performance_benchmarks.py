@@ -338,6 +338,98 @@ class TestExtractionPerformanceBenchmarks:
         print(f"Ratio (500KB / 100KB): {ratio:.2f}x")
 
 
+# ============================================================================
+# Streaming Extraction Benchmarks
+# ============================================================================
+
+# Large-transcript streaming target: < 30 seconds for ~10MB (traced)
+STREAMING_TIME_LIMIT = 30.0
+
+# Streaming peak memory is bounded by chunk size, not transcript size
+STREAMING_PEAK_MEMORY_LIMIT = 16 * 1024 * 1024
+
+
+def _write_session_file(path, target_size_kb: int) -> int:
+    """Write a large JSONL session to disk in 1MB slices; return its size."""
+    with open(path, "w", encoding="utf-8") as handle:
+        for _ in range(max(1, target_size_kb // 1024)):
+            handle.write(_generate_session_jsonl(1024))
+    return path.stat().st_size
+
+
+class TestStreamingExtractionBenchmarks:
+    """Benchmark streaming extraction against whole-corpus preview()."""
+
+    def test_stream_output_identical_to_preview(self, seeded_db_path, tmp_path):
+        """Streaming a file must yield exactly the preview() candidates."""
+        session = _generate_session_jsonl(2500)
+        transcript = tmp_path / "session.jsonl"
+        transcript.write_text(session, encoding="utf-8")
+        service = MemoryExtractorService(db_path=seeded_db_path)
+
+        expected = service.preview(
+            project_id=PROJECT_ID,
+            text_corpus=session,
+            profile="balanced",
+            min_confidence=0.0,
+            commit_sha="bench",
+        )
+        streamed = service.preview_stream(
+            project_id=PROJECT_ID,
+            source=transcript,
+            profile="balanced",
+            min_confidence=0.0,
+            commit_sha="bench",
+            chunk_size=500,
+        )
+
+        assert streamed == expected
+
+    def test_large_transcript_streaming_memory(self, seeded_db_path, tmp_path, capsys):
+        """Peak memory while streaming ~10MB should stay under a fixed bound."""
+        import tracemalloc
+
+        transcript = tmp_path / "large-session.jsonl"
+        size_bytes = _write_session_file(transcript, 10 * 1024)
+        service = MemoryExtractorService(db_path=seeded_db_path)
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            count = sum(
+                1
+                for _ in service.extract_stream(
+                    project_id=PROJECT_ID,
+                    source=transcript,
+                    profile="balanced",
+                    min_confidence=0.0,
+                    commit_sha="bench",
+                )
+            )
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert count > 0
+        assert elapsed < STREAMING_TIME_LIMIT, (
+            f"Streaming {size_bytes / 1024 / 1024:.1f}MB took {elapsed:.2f}s "
+            f"(limit: {STREAMING_TIME_LIMIT}s)"
+        )
+        assert peak < STREAMING_PEAK_MEMORY_LIMIT, (
+            f"Streaming peak memory {peak / 1024 / 1024:.1f}MB exceeded "
+            f"{STREAMING_PEAK_MEMORY_LIMIT / 1024 / 1024:.0f}MB for a "
+            f"{size_bytes / 1024 / 1024:.1f}MB transcript"
+        )
+
+        print(
+            f"\n[Streaming {size_bytes / 1024 / 1024:5.1f}MB] "
+            f"Time: {elapsed:5.2f}s | "
+            f"Peak: {peak / 1024 / 1024:5.1f}MB | "
+            f"Candidates: {count:4d}"
+        )
+
+
 # ============================================================================
 # LLM Mode Benchmarks (Mocked)
 # ============================================================================
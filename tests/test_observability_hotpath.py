@@ -0,0 +1,124 @@
+"""Tests for hot-path latency histograms (skillmeat.observability.hotpath)."""
+
+from __future__ import annotations
+
+from typing import Generator
+
+import pytest
+from prometheus_client import REGISTRY
+
+from skillmeat.observability import hotpath
+from skillmeat.observability.hotpath import (
+    HotPathTimer,
+    configure,
+    hot_path,
+    hotpath_phase,
+)
+
+
+def _count(operation: str, phase: str | None = None) -> float:
+    """Return the histogram observation count for an operation/phase."""
+    if phase is None:
+        value = REGISTRY.get_sample_value(
+            "skillmeat_hotpath_duration_seconds_count", {"operation": operation}
+        )
+    else:
+        value = REGISTRY.get_sample_value(
+            "skillmeat_hotpath_phase_duration_seconds_count",
+            {"operation": operation, "phase": phase},
+        )
+    return value or 0.0
+
+
+@pytest.fixture(autouse=True)
+def restore_config() -> Generator[None, None, None]:
+    """Restore module-level settings after each test."""
+    enabled, sample_rate = hotpath._enabled, hotpath._sample_rate
+    yield
+    configure(enabled=enabled, sample_rate=sample_rate)
+
+
+def test_decorator_records_duration_and_cpu_phase():
+    configure(enabled=True, sample_rate=1.0)
+
+    @hot_path("test.decorated")
+    def work(x: int) -> int:
+        return x * 2
+
+    before = _count("test.decorated")
+    assert work(21) == 42
+    assert _count("test.decorated") == before + 1
+    assert _count("test.decorated", "cpu") >= 1
+
+
+def test_phases_are_recorded_for_active_timer():
+    configure(enabled=True, sample_rate=1.0)
+    before_io = _count("test.phases", "io")
+    before_db = _count("test.phases", "db")
+
+    with HotPathTimer("test.phases") as timer:
+        with hotpath_phase("io"):
+            pass
+        with hotpath_phase("io"):
+            pass
+        with hotpath_phase("db"):
+            pass
+
+    assert set(timer.phases) == {"io", "db"}
+    # Repeated phases are summed into one observation per call
+    assert _count("test.phases", "io") == before_io + 1
+    assert _count("test.phases", "db") == before_db + 1
+
+
+def test_phase_outside_timer_is_noop():
+    phase = hotpath_phase("io")
+    with phase:
+        pass
+    assert phase is hotpath_phase("db")
+
+
+def test_disabled_records_nothing():
+    configure(enabled=False)
+
+    @hot_path("test.disabled")
+    def work() -> str:
+        return "ok"
+
+    assert work() == "ok"
+    assert _count("test.disabled") == 0
+
+
+def test_sample_rate_zero_records_nothing():
+    configure(enabled=True, sample_rate=0.0)
+
+    with HotPathTimer("test.unsampled") as timer:
+        with hotpath_phase("io"):
+            pass
+
+    assert timer.phases == {}
+    assert _count("test.unsampled") == 0
+
+
+def test_exceptions_propagate_and_are_recorded():
+    configure(enabled=True, sample_rate=1.0)
+
+    @hot_path("test.raises")
+    def boom() -> None:
+        raise RuntimeError("boom")
+
+    before = _count("test.raises")
+    with pytest.raises(RuntimeError):
+        boom()
+    assert _count("test.raises") == before + 1
+
+
+def test_instrumented_hash_records_operation(tmp_path):
+    from skillmeat.core.hashing import compute_artifact_hash
+
+    configure(enabled=True, sample_rate=1.0)
+    artifact = tmp_path / "SKILL.md"
+    artifact.write_text("# Skill\n")
+
+    before = _count("hashing.compute_artifact_hash")
+    compute_artifact_hash(str(artifact))
+    assert _count("hashing.compute_artifact_hash") == before + 1
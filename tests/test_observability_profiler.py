@@ -0,0 +1,114 @@
+"""Tests for the in-process sampling profiler (skillmeat.observability.profiler)."""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+
+import pytest
+
+from skillmeat.observability.context import LogContext
+from skillmeat.observability.profiler import (
+    ProfileResult,
+    SamplingProfiler,
+    render_collapsed,
+    render_speedscope,
+)
+
+
+def _busy_marker_function(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(200))
+
+
+def _profile_busy_thread(target, *args) -> ProfileResult:
+    stop = threading.Event()
+    worker = threading.Thread(target=target, args=(stop, *args), name="busy-worker")
+    worker.start()
+    try:
+        return SamplingProfiler(interval=0.001).run(duration=0.2)
+    finally:
+        stop.set()
+        worker.join()
+
+
+def test_invalid_interval_rejected():
+    with pytest.raises(ValueError):
+        SamplingProfiler(interval=0)
+
+
+def test_samples_busy_thread():
+    profile = _profile_busy_thread(_busy_marker_function)
+
+    assert profile.sample_count > 0
+    assert profile.duration >= 0.2
+    busy = [
+        stack
+        for (thread_name, _tag, stack) in profile.stacks
+        if thread_name == "busy-worker"
+    ]
+    assert busy
+    assert any(frame[0] == "_busy_marker_function" for frame in busy[0])
+
+
+def test_stop_event_ends_run_early():
+    stop = threading.Event()
+    stop.set()
+    profile = SamplingProfiler(interval=0.001).run(duration=10.0, stop_event=stop)
+    assert profile.duration < 1.0
+    assert profile.sample_count == 0
+
+
+def test_collapsed_output_includes_thread_and_counts():
+    profile = _profile_busy_thread(_busy_marker_function)
+    output = render_collapsed(profile)
+
+    lines = [line for line in output.splitlines() if "_busy_marker_function" in line]
+    assert lines
+    stack, count = lines[0].rsplit(" ", 1)
+    assert stack.startswith("thread:busy-worker;")
+    assert int(count) > 0
+
+
+def test_speedscope_output_structure():
+    profile = _profile_busy_thread(_busy_marker_function)
+    document = render_speedscope(profile, name="test")
+
+    assert document["name"] == "test"
+    frames = document["shared"]["frames"]
+    thread_profiles = {p["name"]: p for p in document["profiles"]}
+    busy = thread_profiles["busy-worker"]
+    assert busy["type"] == "sampled"
+    assert len(busy["samples"]) == len(busy["weights"])
+    assert busy["endValue"] == pytest.approx(sum(busy["weights"]))
+    for sample in busy["samples"]:
+        assert all(0 <= index < len(frames) for index in sample)
+
+
+def test_empty_profile_renders():
+    profile = ProfileResult(interval=0.005, duration=0.0)
+    assert render_collapsed(profile) == ""
+    assert render_speedscope(profile)["profiles"] == []
+
+
+def test_samples_tagged_with_request_context():
+    """Work dispatched via an anyio worker carries its LogContext IDs."""
+    anyio = pytest.importorskip("anyio")
+    import anyio.to_thread
+
+    async def main(stop: threading.Event) -> None:
+        LogContext.set_request_id("req-123")
+        LogContext.set_trace_id("trace-abc")
+        await anyio.to_thread.run_sync(_busy_marker_function, stop)
+
+    def run_loop(stop: threading.Event) -> None:
+        contextvars.Context().run(anyio.run, main, stop)
+
+    profile = _profile_busy_thread(run_loop)
+
+    tags = {
+        tag
+        for (_thread, tag, stack), _count in profile.stacks.items()
+        if any(frame[0] == "_busy_marker_function" for frame in stack)
+    }
+    assert "request=req-123 trace=trace-abc" in tags
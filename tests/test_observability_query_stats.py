@@ -0,0 +1,136 @@
+"""Tests for per-request SQL statement counting (skillmeat.observability.query_stats)."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from skillmeat.api.middleware.observability import ObservabilityMiddleware
+from skillmeat.observability.query_stats import (
+    QUERY_COUNT_HEADER,
+    QUERY_TIME_HEADER,
+    current_query_stats,
+    track_queries,
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    yield engine
+    engine.dispose()
+
+
+def _run(engine, *statements: str) -> None:
+    with engine.connect() as conn:
+        for statement in statements:
+            conn.execute(text(statement))
+
+
+def _app(engine, expose_query_headers: bool) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(
+        ObservabilityMiddleware, expose_query_headers=expose_query_headers
+    )
+
+    @app.get("/sync")
+    def sync_route():
+        _run(engine, "SELECT 1", "SELECT 2", "SELECT 3")
+        return {"ok": True}
+
+    @app.get("/async")
+    async def async_route():
+        _run(engine, "SELECT 1")
+        return {"ok": True}
+
+    return app
+
+
+def _observations(endpoint: str) -> float:
+    value = REGISTRY.get_sample_value(
+        "skillmeat_api_db_queries_count", {"method": "GET", "endpoint": endpoint}
+    )
+    return value or 0.0
+
+
+# =============================================================================
+# track_queries
+# =============================================================================
+
+
+def test_counts_statements_in_block(engine):
+    with track_queries() as stats:
+        _run(engine, "SELECT 1", "SELECT 2")
+
+    assert stats.count == 2
+    assert stats.duration > 0
+
+
+def test_statements_outside_block_are_ignored(engine):
+    with track_queries() as stats:
+        pass
+    _run(engine, "SELECT 1")
+
+    assert stats.count == 0
+    assert current_query_stats() is None
+
+
+def test_nested_blocks_attribute_to_innermost(engine):
+    with track_queries() as outer:
+        _run(engine, "SELECT 1")
+        with track_queries() as inner:
+            _run(engine, "SELECT 2", "SELECT 3")
+        assert current_query_stats() is outer
+
+    assert outer.count == 1
+    assert inner.count == 2
+
+
+def test_failed_statements_are_counted(engine):
+    with track_queries() as stats:
+        with pytest.raises(OperationalError):
+            _run(engine, "SELECT * FROM missing_table")
+        _run(engine, "SELECT 1")
+
+    assert stats.count == 2
+
+
+# =============================================================================
+# Middleware
+# =============================================================================
+
+
+def test_headers_report_sync_route_statements(engine):
+    with TestClient(_app(engine, expose_query_headers=True)) as client:
+        response = client.get("/sync")
+
+    assert response.headers[QUERY_COUNT_HEADER] == "3"
+    assert float(response.headers[QUERY_TIME_HEADER]) >= 0
+
+
+def test_headers_report_async_route_statements(engine):
+    with TestClient(_app(engine, expose_query_headers=True)) as client:
+        response = client.get("/async")
+
+    assert response.headers[QUERY_COUNT_HEADER] == "1"
+
+
+def test_headers_hidden_by_default(engine):
+    with TestClient(_app(engine, expose_query_headers=False)) as client:
+        response = client.get("/sync")
+
+    assert QUERY_COUNT_HEADER not in response.headers
+    assert QUERY_TIME_HEADER not in response.headers
+
+
+def test_metrics_recorded_without_headers(engine):
+    before = _observations("/sync")
+
+    with TestClient(_app(engine, expose_query_headers=False)) as client:
+        client.get("/sync")
+
+    assert _observations("/sync") == before + 1
@@ -0,0 +1,63 @@
+"""Tests for ProjectRegistry scan serialization."""
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+from typing import List
+
+from skillmeat.core.project_registry import ProjectRegistry
+
+
+def _slow_registry(tmp_path: Path, active: List[int], peak: List[int]):
+    registry = ProjectRegistry()
+    registry.configure(search_paths=[tmp_path])
+    lock = threading.Lock()
+
+    def discover() -> List[Path]:
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        return [tmp_path]
+
+    registry._discover_projects_sync = discover
+    return registry
+
+
+def test_sync_and_async_scans_do_not_overlap(tmp_path):
+    active, peak = [0], [0]
+    registry = _slow_registry(tmp_path, active, peak)
+
+    async def run_both():
+        sync_scan = asyncio.get_running_loop().run_in_executor(
+            None, registry.get_project_paths_sync, True
+        )
+        await asyncio.gather(registry.get_projects(force_refresh=True), sync_scan)
+
+    asyncio.run(run_both())
+
+    assert peak[0] == 1
+    assert registry.get_project_paths_sync() == [tmp_path]
+
+
+def test_sync_scan_reuses_fresh_cache(tmp_path):
+    active, peak = [0], [0]
+    registry = _slow_registry(tmp_path, active, peak)
+    calls = []
+    original = registry._discover_projects_sync
+    registry._discover_projects_sync = lambda: calls.append(1) or original()
+
+    threads = [
+        threading.Thread(target=registry.get_project_paths_sync) for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Threads that waited on the mutex see the refreshed cache
+    assert len(calls) == 1
+    assert peak[0] == 1
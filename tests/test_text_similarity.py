@@ -5,6 +5,8 @@ Tests cover:
   variants, completely different strings, single-character inputs (no bigrams).
 - bm25_description_similarity: identical descriptions, empty inputs, related vs
   unrelated descriptions, all-stop-word descriptions, shared domain terms.
+- BM25Index: corpus IDF, symmetric scoring in one pass, text lookups and the
+  agreement of its rankings with the pairwise function.
 """
 
 from __future__ import annotations
@@ -29,6 +31,7 @@ for _mod in (
 import pytest
 
 from skillmeat.core.scoring.text_similarity import (
+    BM25Index,
     bigram_similarity,
     bm25_description_similarity,
 )
@@ -188,3 +191,71 @@ class TestBm25DescriptionSimilarity:
         desc_b = "Inspect Python dependencies"
         score = bm25_description_similarity(desc_a, desc_b)
         assert score > 0.0
+
+
+# ---------------------------------------------------------------------------
+# BM25Index
+# ---------------------------------------------------------------------------
+
+_CORPUS = [
+    "Analyse Python code and report linting errors and type violations",
+    "Inspect Python source files for lint and type checking issues",
+    "Download satellite imagery and render geographic map tiles",
+    "Convert PDF documents to structured markdown output for editing",
+    "Python Python Python packaging helpers",
+]
+
+
+class TestBm25Index:
+    """Tests for BM25Index corpus scoring."""
+
+    def test_scores_align_with_documents(self) -> None:
+        index = BM25Index(_CORPUS)
+        scores = index.similarities(_CORPUS[0])
+        assert len(index) == len(scores) == len(_CORPUS)
+        assert scores[0] == 1.0
+        assert all(0.0 <= s <= 1.0 for s in scores)
+
+    def test_ranking_matches_pairwise_function(self) -> None:
+        index = BM25Index(_CORPUS)
+        query = _CORPUS[0]
+        indexed = index.similarities(query)
+        pairwise = [
+            (bm25_description_similarity(query, doc) + bm25_description_similarity(doc, query)) / 2
+            for doc in _CORPUS
+        ]
+        assert indexed[1] > indexed[3] and pairwise[1] > pairwise[3]
+        assert indexed[2] == pairwise[2] == 0.0
+
+    def test_common_terms_are_weighted_down_by_corpus_idf(self) -> None:
+        # "python" appears in most documents, "markdown" only in one.
+        index = BM25Index(_CORPUS)
+        assert index.scores("python")[4] > 0.0
+        assert index.scores("markdown")[3] > 0.0
+        assert index._term_idf("python") < index._term_idf("markdown")
+
+    def test_empty_query_and_corpus_score_zero(self) -> None:
+        assert BM25Index(_CORPUS).similarities("the a is") == [0.0] * len(_CORPUS)
+        assert BM25Index([]).similarities("python") == []
+
+    def test_similarity_looks_up_indexed_text(self) -> None:
+        index = BM25Index(_CORPUS)
+        query = "Lint Python type errors"
+        assert index.similarity(query, _CORPUS[1]) == index.similarities(query)[1]
+        assert index.similarity(query, "not in the corpus") is None
+
+    def test_scoring_thousands_of_documents_is_fast(self) -> None:
+        import random
+        import time
+
+        rng = random.Random(0)
+        vocabulary = [f"term{i}" for i in range(5000)]
+        corpus = [" ".join(rng.choices(vocabulary, k=40)) for _ in range(5000)]
+        index = BM25Index(corpus)
+
+        start = time.perf_counter()
+        scores = index.similarities(corpus[42])
+        elapsed = time.perf_counter() - start
+
+        assert scores[42] == 1.0
+        assert elapsed < 0.5
@@ -44,6 +44,8 @@ class TestAnalyticsDBInitialization:
         assert "events" in tables
         assert "usage_summary" in tables
         assert "migrations" in tables
+        assert "usage_daily" in tables
+        assert "usage_hourly" in tables
 
     def test_initialization_creates_indexes(self, analytics_db):
         """Test that initialization creates required indexes."""
@@ -591,6 +593,101 @@ class TestCleanupOldEvents:
         assert deleted == 3
 
 
+class TestRollups:
+    """Test daily/hourly rollup compaction."""
+
+    def _age_events(self, db, days):
+        ts = (datetime.now() - timedelta(days=days)).isoformat(sep=" ")
+        db.connection.execute("UPDATE events SET timestamp = ?", (ts,))
+        db.connection.commit()
+
+    def test_compact_folds_new_events_once(self, analytics_db):
+        """Test that each event is counted exactly once across compactions."""
+        for _ in range(3):
+            analytics_db.record_event("deploy", "canvas", "skill")
+
+        assert analytics_db.compact_rollups() == 3
+        assert analytics_db.compact_rollups() == 0
+
+        analytics_db.record_event("deploy", "canvas", "skill")
+        assert analytics_db.compact_rollups() == 1
+
+        daily = analytics_db.connection.execute(
+            "SELECT SUM(count) FROM usage_daily WHERE artifact_name = 'canvas'"
+        ).fetchone()[0]
+        hourly = analytics_db.connection.execute(
+            "SELECT SUM(count) FROM usage_hourly WHERE artifact_name = 'canvas'"
+        ).fetchone()[0]
+        assert daily == 4
+        assert hourly == 4
+
+    def test_daily_counts_group_by_event_type(self, analytics_db):
+        """Test get_daily_counts returns per-day counts by event type."""
+        analytics_db.record_event("deploy", "canvas", "skill")
+        analytics_db.record_event("deploy", "canvas", "skill")
+        analytics_db.record_event("sync", "canvas", "skill")
+        analytics_db.record_event("deploy", "other", "skill")
+
+        rows = analytics_db.get_daily_counts(artifact_name="canvas")
+
+        counts = {row["event_type"]: row["count"] for row in rows}
+        assert counts == {"deploy": 2, "sync": 1}
+
+    def test_daily_counts_respect_since(self, analytics_db):
+        """Test that events before the window are excluded."""
+        analytics_db.record_event("deploy", "canvas", "skill")
+        self._age_events(analytics_db, 20)
+        analytics_db.record_event("deploy", "canvas", "skill")
+
+        recent = analytics_db.get_daily_counts(
+            since=datetime.now() - timedelta(days=7)
+        )
+        everything = analytics_db.get_daily_counts()
+
+        assert sum(row["count"] for row in recent) == 1
+        assert sum(row["count"] for row in everything) == 2
+
+    def test_rollups_survive_cleanup(self, analytics_db):
+        """Test that retention drops raw events but keeps daily rollups."""
+        analytics_db.record_event("deploy", "canvas", "skill")
+        self._age_events(analytics_db, 100)
+
+        deleted = analytics_db.cleanup_old_events(days=90)
+
+        assert deleted == 1
+        rows = analytics_db.get_daily_counts(artifact_name="canvas")
+        assert sum(row["count"] for row in rows) == 1
+
+    def test_cleanup_prunes_old_hourly_rollups(self, analytics_db):
+        """Test that hourly rollups beyond their horizon are pruned."""
+        analytics_db.record_event("deploy", "canvas", "skill")
+        self._age_events(analytics_db, AnalyticsDB.HOURLY_ROLLUP_RETENTION_DAYS + 5)
+
+        analytics_db.cleanup_old_events(days=90)
+
+        hourly = analytics_db.connection.execute(
+            "SELECT COUNT(*) FROM usage_hourly"
+        ).fetchone()[0]
+        daily = analytics_db.connection.execute(
+            "SELECT COUNT(*) FROM usage_daily"
+        ).fetchone()[0]
+        assert hourly == 0
+        assert daily == 1
+
+    def test_existing_events_backfilled_after_reopen(self, temp_db_path):
+        """Test that events recorded before compaction are picked up later."""
+        db = AnalyticsDB(db_path=temp_db_path)
+        db.record_event("deploy", "canvas", "skill")
+        db.close()
+
+        db = AnalyticsDB(db_path=temp_db_path)
+        try:
+            rows = db.get_daily_counts()
+            assert sum(row["count"] for row in rows) == 1
+        finally:
+            db.close()
+
+
 class TestVacuum:
     """Test vacuum functionality."""
 
@@ -0,0 +1,99 @@
+"""Tests for the cache-DB deployment index (skillmeat.cache.deployment_index)."""
+
+import os
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from skillmeat.cache.deployment_index import DeploymentIndex
+from skillmeat.cache.repository import CacheRepository
+from skillmeat.core.artifact import ArtifactType
+from skillmeat.core.deployment import Deployment
+from skillmeat.core.version_graph import VersionGraphBuilder
+from skillmeat.storage.deployment import DeploymentTracker
+
+
+def _deployment(name: str, content_hash: str = "a" * 64) -> Deployment:
+    return Deployment(
+        artifact_name=name,
+        artifact_type="skill",
+        from_collection="default",
+        deployed_at=datetime(2026, 1, 1),
+        artifact_path=Path("skills") / name,
+        content_hash=content_hash,
+    )
+
+
+def _write(project: Path, *deployments: Deployment) -> None:
+    (project / ".claude").mkdir(parents=True, exist_ok=True)
+    DeploymentTracker.write_deployments(project, list(deployments))
+
+
+@pytest.fixture
+def index(tmp_path):
+    return DeploymentIndex(CacheRepository(db_path=str(tmp_path / "cache.db")))
+
+
+@pytest.fixture
+def projects(tmp_path):
+    paths = [tmp_path / f"project-{i}" for i in range(3)]
+    for path in paths:
+        _write(path, _deployment("alpha"), _deployment(f"only-{path.name}"))
+    return paths
+
+
+def test_find_returns_deployments_with_project_path(index, projects):
+    result = index.refresh(projects)
+    assert result.checked == 3
+    assert result.refreshed == 3
+
+    found = index.find("alpha", "skill")
+    assert [d.project_path for d in found] == sorted(p.resolve() for p in projects)
+    assert found[0].content_hash == "a" * 64
+    assert index.find("alpha", "command") == []
+
+
+def test_unchanged_projects_are_not_reread(index, projects):
+    index.refresh(projects)
+
+    with patch.object(
+        DeploymentTracker, "read_deployments", wraps=DeploymentTracker.read_deployments
+    ) as reader:
+        assert index.refresh(projects).refreshed == 0
+        assert reader.call_count == 0
+
+        _write(projects[1], _deployment("alpha", "b" * 64))
+        tracker = projects[1] / ".claude" / DeploymentTracker.DEPLOYMENT_FILE
+        stat = tracker.stat()
+        os.utime(tracker, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        result = index.refresh(projects)
+        assert result.refreshed == 1
+        assert reader.call_count == 1
+
+    hashes = {d.project_path.name: d.content_hash for d in index.find("alpha", "skill")}
+    assert hashes["project-1"] == "b" * 64
+    assert index.find("only-project-1", "skill") == []
+
+
+def test_projects_missing_from_registry_are_pruned(index, projects):
+    index.refresh(projects)
+
+    result = index.refresh(projects[:1])
+    assert result.removed == 2
+    assert len(index.find("alpha", "skill")) == 1
+
+    index.clear()
+    assert index.find("alpha", "skill") == []
+
+
+def test_builder_uses_index_for_registry_projects(index, projects):
+    builder = VersionGraphBuilder(collection_mgr=object(), deployment_index=index)
+
+    with patch.object(builder, "_discover_projects", return_value=projects):
+        deployments = builder._find_all_deployments("alpha", ArtifactType.SKILL)
+
+    assert len(deployments) == 3
+    assert all(d.artifact_name == "alpha" for d in deployments)
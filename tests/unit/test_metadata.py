@@ -1,10 +1,18 @@
 """Unit tests for metadata extraction utilities."""
 
+import os
+import time
+
 import pytest
 import yaml
 from pathlib import Path
 
-from skillmeat.utils.metadata import extract_yaml_frontmatter
+import skillmeat.utils.metadata as metadata_module
+from skillmeat.utils.metadata import (
+    clear_frontmatter_cache,
+    extract_file_frontmatter,
+    extract_yaml_frontmatter,
+)
 
 
 class TestExtractYamlFrontmatter:
@@ -241,3 +249,75 @@ description: Testing Unicode 🎉
         assert "世界" in metadata["title"]
         assert metadata["author"] == "François"
         assert "🎉" in metadata["description"]
+
+
+class TestFrontmatterCache:
+    """Test the per-file frontmatter parse cache."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        clear_frontmatter_cache()
+        yield
+        clear_frontmatter_cache()
+
+    def _write(self, path, content, age_seconds=60):
+        path.write_text(content)
+        stamp = time.time() - age_seconds
+        os.utime(path, (stamp, stamp))
+
+    def test_unchanged_file_is_parsed_once(self, tmp_path, monkeypatch):
+        """Test that repeated lookups reuse the cached parse."""
+        test_file = tmp_path / "SKILL.md"
+        self._write(test_file, "---\ntitle: Test\n---\n# Body\n")
+        calls = []
+        real_load = yaml.safe_load
+        monkeypatch.setattr(
+            metadata_module.yaml,
+            "safe_load",
+            lambda text: calls.append(text) or real_load(text),
+        )
+
+        first = extract_yaml_frontmatter(test_file)
+        second = extract_yaml_frontmatter(test_file)
+        fields = extract_file_frontmatter(test_file)
+
+        assert first == second == {"title": "Test"}
+        assert fields["title"] == "Test"
+        assert len(calls) == 1
+
+    def test_modified_file_is_reparsed(self, tmp_path):
+        """Test that a changed mtime invalidates the cached entry."""
+        test_file = tmp_path / "SKILL.md"
+        self._write(test_file, "---\ntitle: Old\n---\n", age_seconds=120)
+        assert extract_yaml_frontmatter(test_file) == {"title": "Old"}
+
+        self._write(test_file, "---\ntitle: New\n---\n", age_seconds=60)
+
+        assert extract_yaml_frontmatter(test_file) == {"title": "New"}
+
+    def test_returned_dict_is_a_copy(self, tmp_path):
+        """Test that mutating a result does not corrupt the cache."""
+        test_file = tmp_path / "SKILL.md"
+        self._write(test_file, "---\ntags:\n  - a\n---\n")
+
+        extract_yaml_frontmatter(test_file)["tags"].append("b")
+
+        assert extract_yaml_frontmatter(test_file) == {"tags": ["a"]}
+
+    def test_reads_only_frontmatter_block(self, tmp_path):
+        """Test that BOM, CRLF and trailing body are handled by the fast path."""
+        test_file = tmp_path / "SKILL.md"
+        test_file.write_bytes(
+            b"\xef\xbb\xbf---\r\nname: bom-skill\r\n---\r\n" + b"x" * 100_000
+        )
+
+        assert extract_file_frontmatter(test_file)["name"] == "bom-skill"
+
+    def test_invalid_yaml_falls_back_to_partial(self, tmp_path):
+        """Test that malformed YAML yields partial fields, like the string API."""
+        test_file = tmp_path / "SKILL.md"
+        self._write(test_file, "---\nname: broken\ninvalid: [oops\n---\n")
+
+        assert extract_file_frontmatter(test_file)["name"] == "broken"
+        with pytest.raises(yaml.YAMLError):
+            extract_yaml_frontmatter(test_file)
@@ -503,6 +503,16 @@ class TestUsageTrends:
         with pytest.raises(ValueError, match="Invalid time_period"):
             usage_manager.get_usage_trends(time_period="invalid")
 
+    def test_trends_survive_event_retention(self, usage_manager):
+        """Test that all-time trends still count events dropped by retention."""
+        before = usage_manager.get_usage_trends(time_period="all")
+
+        deleted = usage_manager.db.cleanup_old_events(days=30)
+        after = usage_manager.get_usage_trends(time_period="all")
+
+        assert deleted > 0
+        assert after["total_events_by_day"] == before["total_events_by_day"]
+
 
 class TestExportReport:
     """Tests for export_usage_report method."""
@@ -635,6 +645,13 @@ class TestHelperMethods:
 
         assert trend in ["increasing", "decreasing", "stable"]
 
+    def test_classify_trend(self, usage_manager):
+        """Test weekly counts are classified by first vs second half."""
+        assert usage_manager._classify_trend([1, 1, 5, 5]) == "increasing"
+        assert usage_manager._classify_trend([5, 5, 1, 1]) == "decreasing"
+        assert usage_manager._classify_trend([3, 3, 3]) == "stable"
+        assert usage_manager._classify_trend([7]) == "stable"
+
     def test_estimate_artifact_size_nonexistent(self, usage_manager):
         """Test estimating size of nonexistent artifact returns 0."""
         size = usage_manager._estimate_artifact_size("nonexistent")